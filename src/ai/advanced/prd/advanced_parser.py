@@ -5,6 +5,7 @@ Transform natural language requirements into actionable tasks with
 deep understanding, intelligent task breakdown, and risk assessment.
 """
 
+import asyncio
 import json
 import logging
 from dataclasses import dataclass, field
@@ -18,6 +19,7 @@ from src.ai.advanced.prd.outcome_extractor import (
 from src.ai.providers.llm_abstraction import LLMAbstraction
 from src.config.hybrid_inference_config import HybridInferenceConfig
 from src.config.outcome_coverage_config import is_outcome_coverage_enabled
+from src.core.adaptive_concurrency import LLM_LIMITER, get_concurrency_limiter
 from src.core.models import Priority, Task, TaskStatus
 from src.integrations.ai_analysis_engine import AIAnalysisEngine
 from src.intelligence.dependency_inferer_hybrid import HybridDependencyInferer
@@ -389,6 +391,10 @@ class AdvancedPRDParser:
         self.llm_client = LLMAbstraction()
         self.memory = memory  # Store memory system for learning durations
 
+        # Shared AIMD limiter bounding every LLM fan-out in the parser so
+        # large PRDs back off on 429s instead of bursting the provider
+        self.llm_limiter = get_concurrency_limiter(LLM_LIMITER)
+
         # Set up hybrid dependency inference with configurable thresholds
         ai_engine = (
             AIAnalysisEngine()
@@ -575,22 +581,21 @@ class AdvancedPRDParser:
         # Step 4: AI-powered dependency inference
         dependencies = await self._infer_smart_dependencies(tasks, prd_analysis)
 
-        # Step 5: Risk assessment and timeline prediction
-        risk_assessment = await self._assess_implementation_risks(
-            tasks, prd_analysis, constraints
-        )
-        timeline_prediction = await self._predict_timeline(
-            tasks, dependencies, constraints
-        )
-
-        # Step 6: Resource requirement analysis
-        resource_requirements = await self._analyze_resource_requirements(
-            tasks, prd_analysis, constraints
+        # Steps 5-7: Risk assessment, timeline prediction, resource
+        # analysis and success criteria only read the finished task list,
+        # so they run concurrently rather than one after another.
+        (
+            risk_assessment,
+            timeline_prediction,
+            resource_requirements,
+            success_criteria,
+        ) = await asyncio.gather(
+            self._assess_implementation_risks(tasks, prd_analysis, constraints),
+            self._predict_timeline(tasks, dependencies, constraints),
+            self._analyze_resource_requirements(tasks, prd_analysis, constraints),
+            self._generate_success_criteria(prd_analysis, tasks),
         )
 
-        # Step 7: Generate success criteria
-        success_criteria = await self._generate_success_criteria(prd_analysis, tasks)
-
         return TaskGenerationResult(
             tasks=tasks,
             task_hierarchy=task_hierarchy,
@@ -868,7 +873,8 @@ class AdvancedPRDParser:
         # only exposes ``analyze`` which returns unstructured text.
         ai_engine = AIAnalysisEngine()
         try:
-            response = await ai_engine.generate_structured_response(
+            response = await self.llm_limiter.run(
+                ai_engine.generate_structured_response,
                 prompt=prompt,
                 system_prompt=system_prompt,
                 response_format=response_format,
@@ -2171,10 +2177,10 @@ Create design artifacts such as:
         Create detailed Task objects with rich metadata.
 
         Uses parallel AI calls for performance - all task descriptions are
-        generated concurrently instead of sequentially.
+        generated concurrently instead of sequentially. The number of LLM
+        calls actually in flight is bounded by the shared adaptive limiter
+        (``self.llm_limiter``), which shrinks on provider rate limits.
         """
-        import asyncio
-
         # Collect all task generation jobs for parallel execution
         task_generation_jobs = []
         task_sequence = 1
@@ -2893,8 +2899,13 @@ explanation."""
             context = SimpleContext(max_tokens=200)
 
             # Use LLM to generate task-specific description
-            result = await self.llm_client.analyze(
-                prompt, context, operation="generate_task_detail"
+            # Bounded by the shared AIMD limiter; rate-limited attempts
+            # are retried behind the reduced concurrency window
+            result = await self.llm_limiter.run(
+                self.llm_client.analyze,
+                prompt,
+                context,
+                operation="generate_task_detail",
             )
             description: str = str(result) if result else ""
             description = description.strip()
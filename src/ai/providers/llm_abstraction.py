@@ -33,7 +33,17 @@ import os
 from datetime import datetime, timezone
 from typing import Any, Awaitable, Callable, Dict, List, Optional, TypeVar
 
+from src.core.adaptive_concurrency import (
+    AdaptiveConcurrencyConfig,
+    is_rate_limit_error,
+)
 from src.core.models import Priority, Task, TaskStatus
+from src.core.resilience import (
+    BulkheadConfig,
+    CircuitBreakerConfig,
+    with_bulkhead,
+    with_circuit_breaker,
+)
 
 from .base_provider import (
     BaseLLMProvider,
@@ -44,6 +54,18 @@ from .base_provider import (
 
 logger = logging.getLogger(__name__)
 
+# Rate limits are left to the AIMD limiter, which backs off on them; only
+# other provider failures count towards opening the circuit.
+AI_PROVIDER_CIRCUIT = CircuitBreakerConfig(
+    failure_threshold=3, recovery_timeout=30.0, ignore_exception=is_rate_limit_error
+)
+# Sized to the largest window the shared LLM limiter can grow to, so the
+# bulkhead never refuses calls the limiter has already admitted.
+AI_PROVIDER_BULKHEAD = BulkheadConfig(
+    max_concurrent=AdaptiveConcurrencyConfig.max_limit,
+    max_queued=4 * AdaptiveConcurrencyConfig.max_limit,
+    max_queue_wait=120.0,
+)
 
 _T = TypeVar("_T")
 
@@ -556,10 +578,26 @@ class LLMAbstraction:
         -----
         Updates provider statistics for intelligent future selection.
         Marks results with fallback_used=True when not using primary.
+        Calls share the ``ai_provider`` bulkhead and circuit breaker, which
+        counts a failure only when every provider failed for a reason other
+        than a rate limit.
         """
         # Ensure providers are initialized
         self._initialize_providers()
 
+        # Provide a more helpful error message
+        if not self.providers:
+            raise Exception(
+                "No AI providers are configured. "
+                "Please check your API keys in config_marcus.json. "
+                "Make sure keys start with 'sk-ant-' for Anthropic or 'sk-' for OpenAI."
+            )
+        return await self._call_providers(method_name, **kwargs)
+
+    @with_bulkhead("ai_provider", AI_PROVIDER_BULKHEAD)
+    @with_circuit_breaker("ai_provider", AI_PROVIDER_CIRCUIT)
+    async def _call_providers(self, method_name: str, **kwargs: Any) -> Any:
+        """Call ``method_name`` on the primary provider, then each fallback."""
         providers_to_try = [self.current_provider] + [
             p for p in self.fallback_providers if p != self.current_provider
         ]
@@ -605,14 +643,7 @@ class LLMAbstraction:
             f"All available providers {available_providers} failed for {method_name}"
         )
 
-        # Provide a more helpful error message
-        if not available_providers:
-            raise Exception(
-                "No AI providers are configured. "
-                "Please check your API keys in config_marcus.json. "
-                "Make sure keys start with 'sk-ant-' for Anthropic or 'sk-' for OpenAI."
-            )
-        elif len(available_providers) == 1:
+        if len(available_providers) == 1:
             provider_name = available_providers[0]
             error_msg = f"{provider_name.capitalize()} API error: {last_exception}"
             if "401" in str(last_exception):
@@ -629,7 +660,7 @@ class LLMAbstraction:
         else:
             error_msg = f"All LLM providers failed. Last error: {last_exception}"
 
-        raise Exception(error_msg)
+        raise Exception(error_msg) from last_exception
 
     async def analyze(
         self, prompt: str, context: Any, *, operation: Optional[str] = None
@@ -1025,7 +1025,9 @@ class WorkAnalyzer:
 
         return issues
 
-    @with_retry(RetryConfig(max_attempts=3, base_delay=1.0))
+    @with_retry(
+        RetryConfig(max_attempts=3, base_delay=1.0), dependency="ai_provider"
+    )
     async def _validate_with_ai(self, task: Any, evidence: WorkEvidence) -> str:
         """Validate implementation using AI analysis with retry logic.
 
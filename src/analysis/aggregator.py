@@ -23,6 +23,7 @@ from src.core.project_history import (
     ProjectHistoryPersistence,
     ProjectSnapshot,
 )
+from src.core.worker_pool import run_cpu_bound
 
 logger = logging.getLogger(__name__)
 
@@ -374,21 +375,18 @@ class ProjectHistoryAggregator:
             if profile.agent_id in agent_ids_in_project
         ]
 
-        # Build unified history
-        tasks = self._build_task_histories(
+        # Build unified history off the event loop: it walks every
+        # message, event and decision of the project
+        tasks, agents, timeline = await run_cpu_bound(
+            self._build_views,
             filtered_outcomes,
+            filtered_profiles,
+            filtered_events,
             decisions,
             artifacts,
             conversations,
-            filtered_events,
             task_metadata,
         )
-        agents = self._build_agent_histories(
-            filtered_profiles, filtered_outcomes, decisions, artifacts
-        )
-        timeline = self._build_timeline(
-            conversations, filtered_events, decisions, artifacts
-        )
 
         history = ProjectHistory(
             project_id=project_id,
@@ -407,12 +405,36 @@ class ProjectHistoryAggregator:
 
         return history
 
+    def _build_views(
+        self,
+        outcomes: list[TaskOutcome],
+        profiles: list[AgentProfile],
+        events: list[dict[str, Any]],
+        decisions: list[Decision],
+        artifacts: list[ArtifactMetadata],
+        conversations: list[Message],
+        task_metadata: dict[str, dict[str, Any]],
+    ) -> tuple[list[TaskHistory], list[AgentHistory], list[TimelineEvent]]:
+        """Build the task, agent and timeline views of a project's history."""
+        tasks = self._build_task_histories(
+            outcomes, decisions, artifacts, conversations, events, task_metadata
+        )
+        agents = self._build_agent_histories(profiles, outcomes, decisions, artifacts)
+        timeline = self._build_timeline(conversations, events, decisions, artifacts)
+        return tasks, agents, timeline
+
     async def _load_conversations(self, project_id: str) -> list[Message]:
         """
         Load conversation logs for project.
 
-        Extracts messages from conversation_logger JSON files.
+        Extracts messages from conversation_logger JSON files. Every log
+        file is read and parsed, so the scan runs on the analytics worker
+        pool instead of blocking the event loop.
         """
+        return await run_cpu_bound(self._read_conversations, project_id)
+
+    def _read_conversations(self, project_id: str) -> list[Message]:
+        """Scan conversation logs for messages of ``project_id``."""
         messages: list[Message] = []
 
         try:
@@ -4,7 +4,7 @@ AI Engine Integration for Phase 2 analysis.
 Provides structured LLM interaction for post-project analysis with:
 - Analysis-specific prompt templates
 - Response parsing and validation
-- Caching integration
+- Persistent, deduplicating caching
 - Progress reporting
 - Citation enforcement
 
@@ -35,17 +35,29 @@ print(f"Fidelity score: {response.parsed_result['fidelity_score']}")
 import hashlib
 import json
 import logging
+import os
 import re
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from enum import Enum
+from pathlib import Path
 from typing import Any, Optional
 
 from src.ai.providers.llm_abstraction import LLMAbstraction
 from src.analysis.helpers.progress import ProgressCallback, ProgressReporter
+from src.analysis.storage.analysis_cache import AnalysisCache
 
 logger = logging.getLogger(__name__)
 
+# Part of every cache key: bump when the system prompt or response parsing
+# changes so analyses produced the old way are not served from the cache
+ANALYSIS_PROMPT_VERSION = "1"
+
+# Cached analyses persist here unless MARCUS_ANALYSIS_CACHE_DIR overrides it
+DEFAULT_ANALYSIS_CACHE_DIR = (
+    Path(__file__).parent.parent.parent / "data" / "analysis_cache"
+)
+
 
 class AnalysisType(Enum):
     """
@@ -125,6 +137,32 @@ class AnalysisResponse:
     model_used: str
     cached: bool = False
 
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-serializable dictionary for caching."""
+        return {
+            "analysis_type": self.analysis_type.value,
+            "raw_response": self.raw_response,
+            "parsed_result": self.parsed_result,
+            "confidence": self.confidence,
+            "timestamp": self.timestamp.isoformat(),
+            "model_used": self.model_used,
+        }
+
+    @classmethod
+    def from_dict(
+        cls, data: dict[str, Any], cached: bool = False
+    ) -> "AnalysisResponse":
+        """Create from a dictionary produced by ``to_dict``."""
+        return cls(
+            analysis_type=AnalysisType(data["analysis_type"]),
+            raw_response=data["raw_response"],
+            parsed_result=data["parsed_result"],
+            confidence=float(data["confidence"]),
+            timestamp=datetime.fromisoformat(data["timestamp"]),
+            model_used=data["model_used"],
+            cached=cached,
+        )
+
 
 class AnalysisAIEngine:
     """
@@ -133,13 +171,17 @@ class AnalysisAIEngine:
     Wraps Marcus's existing LLMAbstraction with analysis-specific functionality:
     - Structured prompts that enforce citations
     - JSON response parsing
-    - Request caching via hashmap
+    - Request caching that survives restarts, with identical concurrent
+      requests sharing one LLM call
     - Progress reporting integration
 
     Parameters
     ----------
     llm_client : Optional[LLMAbstraction]
         LLM client to use (creates new one if None)
+    cache : Optional[AnalysisCache]
+        Response cache. Defaults to one persisted under
+        ``data/analysis_cache`` (or ``MARCUS_ANALYSIS_CACHE_DIR``).
 
     Examples
     --------
@@ -164,7 +206,11 @@ class AnalysisAIEngine:
     ```
     """
 
-    def __init__(self, llm_client: Optional[LLMAbstraction] = None):
+    def __init__(
+        self,
+        llm_client: Optional[LLMAbstraction] = None,
+        cache: Optional[AnalysisCache] = None,
+    ):
         """
         Initialize AI engine.
 
@@ -172,9 +218,17 @@ class AnalysisAIEngine:
         ----------
         llm_client : Optional[LLMAbstraction]
             LLM client to use (creates default if None)
+        cache : Optional[AnalysisCache]
+            Response cache (defaults to one under ``data/analysis_cache``)
         """
         self.llm_client = llm_client or LLMAbstraction()
-        self._cache: dict[str, AnalysisResponse] = {}
+        if cache is None:
+            cache = AnalysisCache(
+                cache_dir=os.getenv("MARCUS_ANALYSIS_CACHE_DIR")
+                or DEFAULT_ANALYSIS_CACHE_DIR
+            )
+        self.cache = cache
+        self.model_identity = self._model_identity()
         logger.info("Analysis AI Engine initialized")
 
     async def analyze(
@@ -215,13 +269,33 @@ class AnalysisAIEngine:
         print(f"Fidelity: {response.parsed_result['fidelity_score']}")
         ```
         """
-        # Check cache first
-        if use_cache:
-            cache_key = self.get_cache_key(request)
-            if cache_key in self._cache:
-                logger.debug(f"Using cached analysis for {cache_key[:16]}...")
-                return self._cache[cache_key]
+        if not use_cache:
+            return await self._run_analysis(request, progress_callback)
+
+        async def compute() -> dict[str, Any]:
+            response = await self._run_analysis(request, progress_callback)
+            return response.to_dict()
+
+        cache_key = self.get_cache_key(request)
+        data, cached = await self.cache.get_or_compute(
+            cache_key,
+            compute,
+            namespace=request.analysis_type.value,
+            prompt_chars=len(request.prompt_template)
+            + len(json.dumps(request.context_data, default=str)),
+            # A response that failed to parse is worth retrying
+            cacheable=lambda data: "parse_error" not in data["parsed_result"],
+        )
+        if cached:
+            logger.debug(f"Using cached analysis for {cache_key[:16]}...")
+        return AnalysisResponse.from_dict(data, cached=cached)
 
+    async def _run_analysis(
+        self,
+        request: AnalysisRequest,
+        progress_callback: Optional[ProgressCallback] = None,
+    ) -> AnalysisResponse:
+        """Call the LLM for ``request`` and parse its response."""
         # Set up progress reporting
         reporter = ProgressReporter(callback=progress_callback)
 
@@ -257,7 +331,7 @@ class AnalysisAIEngine:
 
             # Create response
             await progress.update(100, "Complete")
-            response = AnalysisResponse(
+            return AnalysisResponse(
                 analysis_type=request.analysis_type,
                 raw_response=raw_response,
                 parsed_result=parsed_result,
@@ -267,13 +341,6 @@ class AnalysisAIEngine:
                 cached=False,
             )
 
-        # Cache the response
-        if use_cache:
-            cache_key = self.get_cache_key(request)
-            self._cache[cache_key] = response
-
-        return response
-
     def _build_prompt(self, request: AnalysisRequest) -> str:
         """
         Build complete prompt from request.
@@ -469,12 +536,25 @@ Remember: Every claim needs a citation. Every interpretation needs raw data."""
                 logger.debug(f"Response was: {response[:500]}...")
                 raise ValueError(f"Invalid JSON response from LLM: {e}")
 
+    def _model_identity(self) -> str:
+        """Provider and model that answer this engine's prompts."""
+        provider = getattr(self.llm_client, "current_provider", None)
+        if not isinstance(provider, str):
+            # Injected clients that do not say which model they use
+            return ""
+
+        from src.config.marcus_config import get_config
+
+        ai_config = get_config().ai
+        model = ai_config.local_model if provider == "local" else ai_config.model
+        return f"{provider}:{model or ''}"
+
     def get_cache_key(self, request: AnalysisRequest) -> str:
         """
         Generate cache key for a request.
 
-        Uses hash of analysis type, project, task, and context data
-        to create a unique key for caching.
+        Uses hash of the prompt version, model, analysis type, project,
+        task, and context data to create a unique key for caching.
 
         Parameters
         ----------
@@ -495,6 +575,8 @@ Remember: Every claim needs a citation. Every interpretation needs raw data."""
         """
         # Create deterministic string from request
         key_components = [
+            ANALYSIS_PROMPT_VERSION,
+            self.model_identity,
             request.analysis_type.value,
             request.project_id,
             request.task_id or "project-level",
@@ -507,15 +589,14 @@ Remember: Every claim needs a citation. Every interpretation needs raw data."""
 
     def clear_cache(self) -> int:
         """
-        Clear the analysis cache.
+        Clear the analysis cache, including persisted entries.
 
         Returns
         -------
         int
             Number of cached entries cleared
         """
-        count = len(self._cache)
-        self._cache.clear()
+        count = self.cache.clear()
         logger.info(f"Cleared {count} cached analysis results")
         return count
 
@@ -526,14 +607,13 @@ Remember: Every claim needs a citation. Every interpretation needs raw data."""
         Returns
         -------
         dict
-            Cache stats including size, types cached, etc.
+            ``total_cached`` and ``by_type`` plus the hit, miss,
+            deduplication and savings counters of
+            :meth:`AnalysisCache.stats`.
         """
-        type_counts: dict[str, int] = {}
-        for response in self._cache.values():
-            type_name = response.analysis_type.value
-            type_counts[type_name] = type_counts.get(type_name, 0) + 1
-
+        stats = self.cache.stats()
         return {
-            "total_cached": len(self._cache),
-            "by_type": type_counts,
+            "total_cached": stats["entries"],
+            "by_type": stats["by_namespace"],
+            **stats,
         }
@@ -7,6 +7,11 @@ Detects redundant and duplicate work between tasks, including:
 - Over-decomposition from Enterprise mode
 - Quick completions (< 30 seconds - likely already done)
 
+Projects with more than ``max_prompt_tasks`` tasks are not sent to the
+LLM in one prompt. A local MinHash pre-pass finds clusters of similar
+tasks, and only those clusters are analyzed, in concurrent chunks whose
+results are merged into one ``TaskRedundancyAnalysis``.
+
 Usage
 -----
 ```python
@@ -24,6 +29,7 @@ for pair in analysis.redundant_pairs:
 ```
 """
 
+import asyncio
 import logging
 from dataclasses import dataclass, field
 from typing import Any, Optional
@@ -34,7 +40,11 @@ from src.analysis.ai_engine import (
     AnalysisRequest,
     AnalysisType,
 )
-from src.analysis.helpers.progress import ProgressCallback
+from src.analysis.helpers.progress import ProgressCallback, ProgressReporter
+from src.analysis.helpers.task_similarity import (
+    CandidateCluster,
+    find_candidate_clusters,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -125,6 +135,16 @@ class TaskRedundancyAnalyzer:
         AI engine for LLM calls (creates default if None)
     quick_completion_threshold : float
         Threshold in seconds for "quick" completion (default: 30.0)
+    max_prompt_tasks : int
+        Largest project analyzed in a single prompt; larger projects use
+        the similarity pre-pass (default: 150)
+    similarity_threshold : float
+        Minimum Jaccard similarity for two tasks to be candidate
+        duplicates in the pre-pass (default: 0.4)
+    chunk_size : int
+        Maximum tasks per LLM call in the pre-pass mode (default: 40)
+    max_concurrent_chunks : int
+        Maximum concurrent LLM calls in the pre-pass mode (default: 4)
 
     Examples
     --------
@@ -148,6 +168,10 @@ class TaskRedundancyAnalyzer:
         self,
         ai_engine: Optional[AnalysisAIEngine] = None,
         quick_completion_threshold: float = 30.0,
+        max_prompt_tasks: int = 150,
+        similarity_threshold: float = 0.4,
+        chunk_size: int = 40,
+        max_concurrent_chunks: int = 4,
     ):
         """
         Initialize analyzer.
@@ -158,9 +182,21 @@ class TaskRedundancyAnalyzer:
             AI engine to use (creates default if None)
         quick_completion_threshold : float
             Threshold in seconds for "quick" completion (default: 30.0)
+        max_prompt_tasks : int
+            Largest project analyzed in a single prompt (default: 150)
+        similarity_threshold : float
+            Minimum similarity for candidate duplicates (default: 0.4)
+        chunk_size : int
+            Maximum tasks per LLM call for larger projects (default: 40)
+        max_concurrent_chunks : int
+            Maximum concurrent LLM calls for larger projects (default: 4)
         """
         self.ai_engine = ai_engine or AnalysisAIEngine()
         self.quick_completion_threshold = quick_completion_threshold
+        self.max_prompt_tasks = max_prompt_tasks
+        self.similarity_threshold = similarity_threshold
+        self.chunk_size = max(2, chunk_size)
+        self.max_concurrent_chunks = max(1, max_concurrent_chunks)
         logger.info("Task Redundancy Analyzer initialized")
 
     async def analyze_project(
@@ -206,37 +242,47 @@ class TaskRedundancyAnalyzer:
         # Find quick completions
         quick_completions = self._find_quick_completions(tasks)
 
-        # Build context data for LLM
-        context_data = {
-            "total_tasks": len(tasks),
-            "quick_completions": len(quick_completions),
-            "quick_completion_details": self._format_quick_completions(
-                quick_completions
-            ),
-            "task_summaries": self._format_task_summaries(tasks),
-            "conversation_excerpts": self._format_conversations(conversations),
-        }
-
-        # Create analysis request
-        request = AnalysisRequest(
-            analysis_type=AnalysisType.TASK_REDUNDANCY,
-            project_id="",  # Will be set by orchestrator
-            task_id=None,  # Project-level analysis
-            context_data=context_data,
-            prompt_template=self.build_prompt_template(),
-        )
-
-        # Execute analysis
-        response = await self.ai_engine.analyze(
-            request,
-            progress_callback=progress_callback,
-            use_cache=True,
-        )
+        if len(tasks) > self.max_prompt_tasks:
+            parsed_result, llm_interpretation, candidate_data = (
+                await self._analyze_candidates(
+                    tasks, conversations, quick_completions, progress_callback
+                )
+            )
+        else:
+            # Build context data for LLM
+            context_data = {
+                "total_tasks": len(tasks),
+                "quick_completions": len(quick_completions),
+                "quick_completion_details": self._format_quick_completions(
+                    quick_completions
+                ),
+                "task_summaries": self._format_task_summaries(tasks),
+                "conversation_excerpts": self._format_conversations(conversations),
+            }
+
+            # Create analysis request
+            request = AnalysisRequest(
+                analysis_type=AnalysisType.TASK_REDUNDANCY,
+                project_id="",  # Will be set by orchestrator
+                task_id=None,  # Project-level analysis
+                context_data=context_data,
+                prompt_template=self.build_prompt_template(),
+            )
+
+            # Execute analysis
+            response = await self.ai_engine.analyze(
+                request,
+                progress_callback=progress_callback,
+                use_cache=True,
+            )
+            parsed_result = response.parsed_result
+            llm_interpretation = response.raw_response
+            candidate_data = {"analysis_mode": "single_prompt"}
 
         # Parse redundant pairs
         redundant_pairs = [
             RedundantTaskPair(**pair)
-            for pair in response.parsed_result.get("redundant_pairs", [])
+            for pair in parsed_result.get("redundant_pairs", [])
         ]
 
         # Calculate total time wasted
@@ -249,7 +295,7 @@ class TaskRedundancyAnalyzer:
         )
 
         # Recommend complexity level
-        redundancy_score = float(response.parsed_result.get("redundancy_score", 0.0))
+        redundancy_score = float(parsed_result.get("redundancy_score", 0.0))
         recommended_complexity = self._recommend_complexity(
             tasks, redundancy_score, quick_completions
         )
@@ -278,19 +324,20 @@ class TaskRedundancyAnalyzer:
                 }
                 for t in tasks
             ],
+            **candidate_data,
         }
 
         # Create analysis result
         analysis = TaskRedundancyAnalysis(
-            project_id=response.parsed_result.get("project_id", ""),
+            project_id=parsed_result.get("project_id", ""),
             redundant_pairs=redundant_pairs,
             redundancy_score=redundancy_score,
             total_time_wasted=total_time_wasted,
             over_decomposition_detected=over_decomposition,
             recommended_complexity=recommended_complexity,
             raw_data=raw_data,
-            llm_interpretation=response.raw_response,
-            recommendations=response.parsed_result.get("recommendations", []),
+            llm_interpretation=llm_interpretation,
+            recommendations=parsed_result.get("recommendations", []),
         )
 
         logger.info(
@@ -302,6 +349,241 @@ class TaskRedundancyAnalyzer:
 
         return analysis
 
+    async def _analyze_candidates(
+        self,
+        tasks: list[TaskHistory],
+        conversations: list[Message],
+        quick_completions: list[TaskHistory],
+        progress_callback: Optional[ProgressCallback] = None,
+    ) -> tuple[dict[str, Any], str, dict[str, Any]]:
+        """
+        Analyze only candidate duplicate clusters, in concurrent chunks.
+
+        Tasks outside every candidate cluster are treated as non-redundant,
+        so each chunk's redundancy score is weighted by its task count over
+        the whole project. A failed chunk is logged and skipped unless
+        every chunk fails.
+
+        Parameters
+        ----------
+        tasks : list[TaskHistory]
+            All tasks in the project
+        conversations : list[Message]
+            Conversation history
+        quick_completions : list[TaskHistory]
+            Tasks that completed quickly
+        progress_callback : Optional[ProgressCallback]
+            Callback for per-chunk progress updates
+
+        Returns
+        -------
+        tuple[dict[str, Any], str, dict[str, Any]]
+            Merged parsed result (same keys as a single-prompt response),
+            combined LLM output, and pre-pass details for ``raw_data``
+        """
+        clusters = find_candidate_clusters(
+            {task.task_id: self._similarity_text(task) for task in tasks},
+            threshold=self.similarity_threshold,
+        )
+        chunks = self._pack_clusters(clusters)
+        candidate_data: dict[str, Any] = {
+            "analysis_mode": "candidate_clusters",
+            "candidate_clusters": [
+                {"task_ids": c.task_ids, "similarity": round(c.similarity, 3)}
+                for c in clusters
+            ],
+            "candidate_pairs": sum(len(c.pairs) for c in clusters),
+            "llm_chunks": len(chunks),
+            "failed_chunks": 0,
+        }
+        logger.info(
+            f"Redundancy pre-pass: {len(tasks)} tasks -> {len(clusters)} "
+            f"candidate clusters in {len(chunks)} LLM chunks"
+        )
+        if not chunks:
+            return (
+                {"redundancy_score": 0.0, "redundant_pairs": [], "recommendations": []},
+                "No candidate duplicate tasks found by similarity pre-pass",
+                candidate_data,
+            )
+
+        tasks_by_id = {task.task_id: task for task in tasks}
+        quick_ids = {task.task_id for task in quick_completions}
+        conversation_excerpts = self._format_conversations(conversations)
+        semaphore = asyncio.Semaphore(self.max_concurrent_chunks)
+        reporter = ProgressReporter(callback=progress_callback)
+
+        async with reporter.operation(
+            "analyze_redundancy_chunks", total=len(chunks)
+        ) as progress:
+
+            async def analyze_chunk(chunk: list[CandidateCluster]) -> Any:
+                chunk_tasks = [
+                    tasks_by_id[task_id] for c in chunk for task_id in c.task_ids
+                ]
+                chunk_quick = [t for t in chunk_tasks if t.task_id in quick_ids]
+                request = AnalysisRequest(
+                    analysis_type=AnalysisType.TASK_REDUNDANCY,
+                    project_id="",
+                    task_id=None,
+                    context_data={
+                        "total_tasks": len(chunk_tasks),
+                        "quick_completions": len(chunk_quick),
+                        "quick_completion_details": self._format_quick_completions(
+                            chunk_quick
+                        ),
+                        "task_summaries": self._format_candidate_clusters(
+                            chunk, tasks_by_id
+                        ),
+                        "conversation_excerpts": conversation_excerpts,
+                    },
+                    prompt_template=self.build_prompt_template(),
+                )
+                async with semaphore:
+                    response = await self.ai_engine.analyze(request, use_cache=True)
+                await progress.increment(f"Analyzed {len(chunk_tasks)} tasks")
+                return response
+
+            results = await asyncio.gather(
+                *(analyze_chunk(chunk) for chunk in chunks), return_exceptions=True
+            )
+
+        responses = []
+        errors = []
+        for chunk, result in zip(chunks, results):
+            if isinstance(result, BaseException):
+                errors.append(result)
+            else:
+                responses.append((sum(len(c.task_ids) for c in chunk), result))
+        if errors:
+            candidate_data["failed_chunks"] = len(errors)
+            logger.warning(
+                f"{len(errors)} of {len(chunks)} redundancy chunks failed: "
+                f"{errors[0]}"
+            )
+            if not responses:
+                raise errors[0]
+
+        # Merge, keeping the strongest report of each pair
+        pairs: dict[frozenset[str], dict[str, Any]] = {}
+        recommendations: list[str] = []
+        weighted_score = 0.0
+        project_id = ""
+        for task_count, response in responses:
+            parsed = response.parsed_result
+            project_id = project_id or parsed.get("project_id", "")
+            weighted_score += float(parsed.get("redundancy_score", 0.0)) * task_count
+            for pair in parsed.get("redundant_pairs", []):
+                key = frozenset((pair.get("task_1_id"), pair.get("task_2_id")))
+                current = pairs.get(key)
+                if current is None or pair.get("overlap_score", 0) > current.get(
+                    "overlap_score", 0
+                ):
+                    pairs[key] = pair
+            for recommendation in parsed.get("recommendations", []):
+                if recommendation not in recommendations:
+                    recommendations.append(recommendation)
+
+        merged = {
+            "project_id": project_id,
+            "redundancy_score": min(1.0, weighted_score / len(tasks)),
+            "redundant_pairs": list(pairs.values()),
+            "recommendations": recommendations,
+        }
+        llm_interpretation = "\n\n".join(r.raw_response for _, r in responses)
+        return merged, llm_interpretation, candidate_data
+
+    def _similarity_text(self, task: TaskHistory) -> str:
+        """
+        Build the text compared by the similarity pre-pass.
+
+        Parameters
+        ----------
+        task : TaskHistory
+            Task to describe
+
+        Returns
+        -------
+        str
+            Name, description, decisions, artifacts and reported blockers
+        """
+        parts = [task.name, task.description or ""]
+        parts.extend(decision.what for decision in task.decisions_made)
+        parts.extend(
+            f"{artifact.filename} {artifact.description}"
+            for artifact in task.artifacts_produced
+        )
+        if task.outcome is not None:
+            parts.extend(task.outcome.blockers)
+        return "\n".join(parts)
+
+    def _pack_clusters(
+        self, clusters: list[CandidateCluster]
+    ) -> list[list[CandidateCluster]]:
+        """
+        Pack ranked clusters into chunks of at most ``chunk_size`` tasks.
+
+        Clusters larger than a chunk are split into chunk-sized slices.
+
+        Parameters
+        ----------
+        clusters : list[CandidateCluster]
+            Candidate clusters, strongest first
+
+        Returns
+        -------
+        list[list[CandidateCluster]]
+            Chunks, each sent to the LLM in one call
+        """
+        chunks: list[list[CandidateCluster]] = []
+        current: list[CandidateCluster] = []
+        size = 0
+        for cluster in clusters:
+            for start in range(0, len(cluster.task_ids), self.chunk_size):
+                task_ids = cluster.task_ids[start : start + self.chunk_size]
+                if len(task_ids) < 2:
+                    continue
+                part = CandidateCluster(task_ids, similarity=cluster.similarity)
+                if size + len(task_ids) > self.chunk_size:
+                    chunks.append(current)
+                    current, size = [], 0
+                current.append(part)
+                size += len(task_ids)
+        if current:
+            chunks.append(current)
+        return chunks
+
+    def _format_candidate_clusters(
+        self,
+        clusters: list[CandidateCluster],
+        tasks_by_id: dict[str, TaskHistory],
+    ) -> str:
+        """
+        Format candidate clusters for LLM prompt.
+
+        Parameters
+        ----------
+        clusters : list[CandidateCluster]
+            Clusters in one chunk
+        tasks_by_id : dict[str, TaskHistory]
+            All tasks keyed by ID
+
+        Returns
+        -------
+        str
+            Task summaries grouped by cluster
+        """
+        formatted = []
+        for number, cluster in enumerate(clusters, 1):
+            summaries = self._format_task_summaries(
+                [tasks_by_id[task_id] for task_id in cluster.task_ids]
+            )
+            formatted.append(
+                f"Candidate group {number} "
+                f"(text similarity {cluster.similarity:.2f}):\n\n{summaries}"
+            )
+        return "\n\n".join(formatted)
+
     def _find_quick_completions(self, tasks: list[TaskHistory]) -> list[TaskHistory]:
         """
         Find tasks that completed in less than threshold.
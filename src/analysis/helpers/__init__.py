@@ -13,6 +13,11 @@ from src.analysis.helpers.progress import (
     ProgressEvent,
     ProgressReporter,
 )
+from src.analysis.helpers.task_similarity import (
+    CandidateCluster,
+    CandidatePair,
+    find_candidate_clusters,
+)
 
 __all__ = [
     "iter_all_decisions",
@@ -24,4 +29,7 @@ __all__ = [
     "ProgressEvent",
     "ProgressCallback",
     "ProgressContext",
+    "CandidateCluster",
+    "CandidatePair",
+    "find_candidate_clusters",
 ]
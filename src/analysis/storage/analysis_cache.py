@@ -0,0 +1,401 @@
+"""
+Persistent, deduplicating cache for post-project AI analysis.
+
+``AnalysisAIEngine`` used to cache responses in a per-process dict, so
+every restart of the analysis tooling paid again for identical LLM
+analyses, and concurrent requests for the same key each called the LLM.
+:class:`AnalysisCache` keeps entries in memory and, when given a
+directory, on disk as one JSON file per content-addressed key. Entries
+expire after a TTL, the cache is bounded by entry count and total bytes
+(least recently used entries are evicted first), and identical requests
+that arrive while one is being computed wait for that single computation.
+
+Usage
+-----
+```python
+cache = AnalysisCache(cache_dir=Path("data/analysis_cache"))
+payload, cached = await cache.get_or_compute(
+    key, compute=run_llm_analysis, namespace="requirement_divergence"
+)
+print(cache.stats()["hit_rate"])
+```
+"""
+
+import asyncio
+import json
+import logging
+import os
+import re
+import tempfile
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600.0
+DEFAULT_MAX_ENTRIES = 5000
+DEFAULT_MAX_BYTES = 100 * 1024 * 1024
+
+# Rough prompt-characters-per-token ratio used for savings estimates
+CHARS_PER_TOKEN = 4
+
+_FILE_PATTERN = re.compile(r"^(?P<namespace>[\w-]+)\.(?P<key>[0-9a-f]{16,})\.json$")
+
+
+@dataclass
+class _Entry:
+    """Index record of one cached payload."""
+
+    namespace: str
+    size: int
+    created: float
+    accessed: float
+    # Stored document (payload plus cost metadata); None until loaded
+    document: Optional[Dict[str, Any]] = None
+
+
+class AnalysisCache:
+    """
+    Content-addressed analysis cache with TTL, size limits and single-flight.
+
+    Parameters
+    ----------
+    cache_dir : Optional[Union[str, Path]]
+        Directory for persistent entries; memory-only when None.
+    ttl_seconds : Optional[float]
+        Entry lifetime; entries never expire when None.
+    max_entries : int
+        Maximum number of cached entries.
+    max_bytes : int
+        Maximum total serialized size of cached entries.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Union[str, Path]] = None,
+        ttl_seconds: Optional[float] = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ) -> None:
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        # Least recently used first
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._bytes = 0
+        self._inflight: Dict[str, "asyncio.Future[Dict[str, Any]]"] = {}
+        self._counters: Dict[str, float] = {
+            "hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "deduplicated": 0,
+            "evictions": 0,
+            "expired": 0,
+            "seconds_saved": 0.0,
+            "estimated_tokens_saved": 0,
+        }
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self._load_index()
+
+    # ------------------------------------------------------------
+    # Disk index
+    # ------------------------------------------------------------
+
+    def _path(self, key: str, namespace: str) -> Path:
+        assert self.cache_dir is not None  # nosec B101 - callers check
+        return self.cache_dir / f"{namespace}.{key}.json"
+
+    def _load_index(self) -> None:
+        """Index existing entry files by last access (oldest first)."""
+        assert self.cache_dir is not None  # nosec B101 - checked by caller
+        found = []
+        for item in os.scandir(self.cache_dir):
+            match = _FILE_PATTERN.match(item.name)
+            if not match or not item.is_file():
+                continue
+            stat = item.stat()
+            # mtime records creation, atime the last cache hit
+            found.append(
+                (
+                    stat.st_atime,
+                    match["key"],
+                    _Entry(match["namespace"], stat.st_size, stat.st_mtime, 0.0),
+                )
+            )
+        for accessed, key, entry in sorted(found, key=lambda item: item[0]):
+            entry.accessed = accessed
+            self._entries[key] = entry
+            self._bytes += entry.size
+        self._enforce_limits()
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        self._bytes -= entry.size
+        if self.cache_dir is not None:
+            try:
+                self._path(key, entry.namespace).unlink()
+            except FileNotFoundError:
+                pass
+
+    def _enforce_limits(self) -> None:
+        while self._entries and (
+            len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+        ):
+            key = next(iter(self._entries))
+            self._remove(key)
+            self._counters["evictions"] += 1
+
+    def _expired(self, entry: _Entry) -> bool:
+        return (
+            self.ttl_seconds is not None
+            and time.time() - entry.created > self.ttl_seconds
+        )
+
+    # ------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the cached payload for ``key``, or None.
+
+        Expired entries are removed. Hits refresh the entry's LRU position
+        and add its recorded cost to the savings statistics.
+
+        Parameters
+        ----------
+        key : str
+            Content-addressed key (hex digest).
+
+        Returns
+        -------
+        Optional[Dict[str, Any]]
+            The payload stored by :meth:`put`.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if self._expired(entry):
+            self._remove(key)
+            self._counters["expired"] += 1
+            return None
+
+        if entry.document is None:
+            try:
+                document = json.loads(
+                    self._path(key, entry.namespace).read_text(encoding="utf-8")
+                )
+            except (OSError, ValueError) as e:
+                logger.warning(f"Dropping unreadable analysis cache entry {key}: {e}")
+                self._remove(key)
+                return None
+            entry.document = document
+            self._counters["disk_hits"] += 1
+
+        entry.accessed = time.time()
+        self._entries.move_to_end(key)
+        if self.cache_dir is not None:
+            try:
+                os.utime(
+                    self._path(key, entry.namespace), (entry.accessed, entry.created)
+                )
+            except OSError:
+                pass
+
+        self._counters["hits"] += 1
+        self._record_savings(entry.document)
+        return entry.document["payload"]
+
+    def put(
+        self,
+        key: str,
+        payload: Dict[str, Any],
+        namespace: str = "default",
+        compute_seconds: float = 0.0,
+        prompt_chars: int = 0,
+    ) -> None:
+        """
+        Store ``payload`` under ``key``.
+
+        Parameters
+        ----------
+        key : str
+            Content-addressed key (hex digest).
+        payload : Dict[str, Any]
+            JSON-serializable value.
+        namespace : str
+            Grouping label (e.g. the analysis type) used in statistics.
+        compute_seconds : float
+            How long producing the payload took; credited on each hit.
+        prompt_chars : int
+            Prompt size, used to estimate tokens saved on each hit.
+        """
+        namespace = re.sub(r"[^\w-]", "_", namespace) or "default"
+        document = {
+            "key": key,
+            "namespace": namespace,
+            "compute_seconds": compute_seconds,
+            "prompt_chars": prompt_chars,
+            "payload": payload,
+        }
+        serialized = json.dumps(document, default=str)
+        now = time.time()
+        self._remove(key)
+        entry = _Entry(namespace, len(serialized.encode("utf-8")), now, now, document)
+        if self.cache_dir is not None:
+            path = self._path(key, namespace)
+            fd, tmp_path = tempfile.mkstemp(prefix=f".{path.name}.", dir=self.cache_dir)
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    f.write(serialized)
+                os.replace(tmp_path, path)
+            except OSError as e:
+                logger.warning(f"Could not persist analysis cache entry {key}: {e}")
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+        self._entries[key] = entry
+        self._bytes += entry.size
+        self._enforce_limits()
+
+    async def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Dict[str, Any]]],
+        namespace: str = "default",
+        prompt_chars: int = 0,
+        cacheable: Optional[Callable[[Dict[str, Any]], bool]] = None,
+    ) -> Tuple[Dict[str, Any], bool]:
+        """
+        Return the cached payload, computing it at most once per key.
+
+        Concurrent callers with the same key while a computation is in
+        flight wait for it instead of computing again. A failed
+        computation is not cached; its error is raised to every waiter.
+        Payloads ``cacheable`` rejects are shared with those waiters but
+        not stored, so the next request computes again.
+
+        Parameters
+        ----------
+        key : str
+            Content-addressed key (hex digest).
+        compute : Callable[[], Awaitable[Dict[str, Any]]]
+            Produces the payload on a miss.
+        namespace : str
+            Grouping label stored with the entry.
+        prompt_chars : int
+            Prompt size, used to estimate tokens saved on later hits.
+        cacheable : Optional[Callable[[Dict[str, Any]], bool]]
+            Decides whether a computed payload is stored (default: all).
+
+        Returns
+        -------
+        Tuple[Dict[str, Any], bool]
+            The payload, and whether it came from the cache (or another
+            caller's in-flight computation) rather than ``compute``.
+        """
+        cached = self.get(key)
+        if cached is not None:
+            return cached, True
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self._counters["deduplicated"] += 1
+            payload = await asyncio.shield(inflight)
+            self._record_savings(getattr(self._entries.get(key), "document", None))
+            return payload, True
+
+        self._counters["misses"] += 1
+        future: "asyncio.Future[Dict[str, Any]]" = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._inflight[key] = future
+        try:
+            start = time.perf_counter()
+            payload = await compute()
+            if cacheable is None or cacheable(payload):
+                self.put(
+                    key,
+                    payload,
+                    namespace=namespace,
+                    compute_seconds=time.perf_counter() - start,
+                    prompt_chars=prompt_chars,
+                )
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark retrieved so an error nobody else awaited is not logged
+            future.exception()
+            raise
+        finally:
+            del self._inflight[key]
+        future.set_result(payload)
+        return payload, False
+
+    def _record_savings(self, document: Optional[Dict[str, Any]]) -> None:
+        if not document:
+            return
+        self._counters["seconds_saved"] += float(document.get("compute_seconds", 0))
+        self._counters["estimated_tokens_saved"] += (
+            int(document.get("prompt_chars", 0)) // CHARS_PER_TOKEN
+        )
+
+    def clear(self) -> int:
+        """
+        Remove every entry, including persisted ones.
+
+        Returns
+        -------
+        int
+            Number of entries removed.
+        """
+        count = len(self._entries)
+        for key in list(self._entries):
+            self._remove(key)
+        return count
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return cache size, hit/miss and savings statistics.
+
+        Returns
+        -------
+        Dict[str, Any]
+            ``entries``, ``bytes``, ``by_namespace``, ``hits`` (of which
+            ``disk_hits`` were loaded from disk), ``misses``,
+            ``deduplicated`` (callers that joined an in-flight request),
+            ``hit_rate``, ``evictions``, ``expired``, ``llm_calls_saved``,
+            ``seconds_saved``, ``estimated_tokens_saved``, ``persistent``
+            and ``cache_dir``.
+        """
+        by_namespace: Dict[str, int] = {}
+        for entry in self._entries.values():
+            by_namespace[entry.namespace] = by_namespace.get(entry.namespace, 0) + 1
+        hits = int(self._counters["hits"])
+        deduplicated = int(self._counters["deduplicated"])
+        misses = int(self._counters["misses"])
+        lookups = hits + deduplicated + misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "by_namespace": by_namespace,
+            "hits": hits,
+            "disk_hits": int(self._counters["disk_hits"]),
+            "misses": misses,
+            "deduplicated": deduplicated,
+            "hit_rate": (hits + deduplicated) / lookups if lookups else 0.0,
+            "evictions": int(self._counters["evictions"]),
+            "expired": int(self._counters["expired"]),
+            "llm_calls_saved": hits + deduplicated,
+            "seconds_saved": round(self._counters["seconds_saved"], 3),
+            "estimated_tokens_saved": int(self._counters["estimated_tokens_saved"]),
+            "persistent": self.cache_dir is not None,
+            "cache_dir": str(self.cache_dir) if self.cache_dir is not None else None,
+        }
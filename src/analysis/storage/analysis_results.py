@@ -28,16 +28,50 @@ if latest:
 ```
 """
 
+import asyncio
+import json
 import logging
+import sqlite3
+from contextlib import closing
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Optional
-
-from src.core.persistence import SQLitePersistence
+from typing import Any, Callable, Optional, TypeVar
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Dedicated table; timestamps are stored as UTC epoch microseconds so
+# "latest" and range queries order correctly in SQL.
+SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS analysis_results (
+  analysis_id   TEXT PRIMARY KEY,
+  project_id    TEXT NOT NULL,
+  task_id       TEXT,
+  analysis_type TEXT NOT NULL,
+  timestamp_us  INTEGER NOT NULL,
+  version       TEXT NOT NULL,
+  result        TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_analysis_project_time
+  ON analysis_results(project_id, timestamp_us);
+CREATE INDEX IF NOT EXISTS idx_analysis_project_type_time
+  ON analysis_results(project_id, analysis_type, timestamp_us);
+CREATE INDEX IF NOT EXISTS idx_analysis_task_type_time
+  ON analysis_results(project_id, task_id, analysis_type, timestamp_us);
+"""
+
+# Collection name of the rows previously kept in SQLitePersistence's
+# generic key/value ``persistence`` table
+LEGACY_COLLECTION = "analysis_results"
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+_COLUMNS = (
+    "analysis_id, project_id, task_id, analysis_type, timestamp_us, version, result"
+)
+
 
 @dataclass
 class AnalysisResult:
@@ -109,6 +143,12 @@ class AnalysisResultStore:
     Stores LLM analysis outputs in SQLite for caching and retrieval.
     Supports versioning to handle algorithm changes over time.
 
+    Results live in a dedicated ``analysis_results`` table with indexed
+    project, task, type and timestamp columns, so lookups, latest-per-type
+    queries and pagination run in SQL instead of scanning and decoding
+    every stored row. Rows written by earlier versions to the generic
+    key/value ``persistence`` table are migrated on first open.
+
     Benefits
     --------
     - Avoid re-analyzing same data (expensive LLM calls)
@@ -138,9 +178,87 @@ class AnalysisResultStore:
 
         self.marcus_root = Path(marcus_root)
         self.db_path = self.marcus_root / "data" / "marcus.db"
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._init_db()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path)
+
+    def _init_db(self) -> None:
+        """Create the schema and migrate legacy key/value rows."""
+        with closing(self._connect()) as conn, conn:
+            conn.executescript(SCHEMA_SQL)
+            migrated = self._migrate_legacy_rows(conn)
+        if migrated:
+            logger.info(f"Migrated {migrated} analysis results to indexed storage")
+
+    @staticmethod
+    def _migrate_legacy_rows(conn: sqlite3.Connection) -> int:
+        """
+        Move rows from SQLitePersistence's generic table into the schema.
+
+        Parameters
+        ----------
+        conn : sqlite3.Connection
+            Open connection; the caller commits.
+
+        Returns
+        -------
+        int
+            Number of rows migrated.
+        """
+        has_legacy_table = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'persistence'"
+        ).fetchone()
+        if not has_legacy_table:
+            return 0
+
+        rows = []
+        cursor = conn.execute(
+            "SELECT key, data FROM persistence WHERE collection = ?",
+            (LEGACY_COLLECTION,),
+        )
+        for key, data in cursor:
+            try:
+                rows.append(_to_row(AnalysisResult.from_dict(json.loads(data))))
+            except (ValueError, KeyError, TypeError) as e:
+                logger.warning(f"Skipping unreadable legacy analysis result {key}: {e}")
+        if rows:
+            conn.executemany(
+                f"INSERT OR IGNORE INTO analysis_results ({_COLUMNS}) "  # nosec B608
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+        conn.execute(
+            "DELETE FROM persistence WHERE collection = ?", (LEGACY_COLLECTION,)
+        )
+        return len(rows)
+
+    async def _run(self, func: Callable[[sqlite3.Connection], T]) -> T:
+        """Run ``func`` with a connection in the default executor."""
+
+        def _call() -> T:
+            with closing(self._connect()) as conn, conn:
+                return func(conn)
 
-        # Initialize persistence backend
-        self.persistence = SQLitePersistence(db_path=self.db_path)
+        return await asyncio.get_event_loop().run_in_executor(None, _call)
+
+    async def _select(
+        self, where: str, params: tuple, limit: Optional[int] = None, offset: int = 0
+    ) -> list[AnalysisResult]:
+        """Return results matching ``where``, newest first."""
+        sql = (
+            f"SELECT {_COLUMNS} FROM analysis_results "  # nosec B608
+            f"WHERE {where} ORDER BY timestamp_us DESC, analysis_id"
+        )
+        if limit is not None:
+            sql += " LIMIT ? OFFSET ?"
+            params = (*params, limit, offset)
+        elif offset:
+            sql += " LIMIT -1 OFFSET ?"
+            params = (*params, offset)
+        rows = await self._run(lambda conn: conn.execute(sql, params).fetchall())
+        return [_from_row(row) for row in rows]
 
     async def store_result(self, result: AnalysisResult) -> None:
         """
@@ -169,14 +287,32 @@ class AnalysisResultStore:
         await store.store_result(result)
         ```
         """
-        await self.persistence.store(
-            "analysis_results", result.analysis_id, result.to_dict()
-        )
+        await self.store_results([result])
         logger.debug(
             f"Stored analysis result {result.analysis_id} "
             f"({result.analysis_type} for {result.task_id or 'project'})"
         )
 
+    async def store_results(self, results: list[AnalysisResult]) -> None:
+        """
+        Store several analysis results in one transaction.
+
+        Parameters
+        ----------
+        results : list[AnalysisResult]
+            Results to insert or replace (matched by analysis_id).
+        """
+        if not results:
+            return
+        rows = [_to_row(result) for result in results]
+        await self._run(
+            lambda conn: conn.executemany(
+                f"INSERT OR REPLACE INTO analysis_results ({_COLUMNS}) "  # nosec B608
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+        )
+
     async def get_result(self, analysis_id: str) -> Optional[AnalysisResult]:
         """
         Retrieve a specific analysis result by ID.
@@ -199,54 +335,62 @@ class AnalysisResultStore:
             print(f"Fidelity score: {result.result['fidelity_score']}")
         ```
         """
-        data = await self.persistence.retrieve("analysis_results", analysis_id)
-        if data is None:
-            return None
-
-        # Remove internal persistence fields
-        data.pop("_key", None)
-        data.pop("_stored_at", None)
-
-        return AnalysisResult.from_dict(data)
-
-    async def get_results_for_project(self, project_id: str) -> list[AnalysisResult]:
+        results = await self._select("analysis_id = ?", (analysis_id,))
+        return results[0] if results else None
+
+    async def get_results_for_project(
+        self,
+        project_id: str,
+        analysis_type: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> list[AnalysisResult]:
         """
-        Get all analysis results for a project.
+        Get analysis results for a project, newest first.
 
         Parameters
         ----------
         project_id : str
             Project identifier
+        analysis_type : Optional[str]
+            Only results of this type
+        limit : Optional[int]
+            Page size; all results when None
+        offset : int
+            Number of results to skip (for pagination)
 
         Returns
         -------
         list[AnalysisResult]
-            All analysis results for this project
+            Analysis results for this project
 
         Examples
         --------
         ```python
         results = await store.get_results_for_project("proj-123")
         print(f"Found {len(results)} cached analyses")
+
+        page_2 = await store.get_results_for_project("proj-123", limit=50, offset=50)
         ```
         """
-        all_results = await self.persistence.query("analysis_results", limit=100000)
-
-        project_results = []
-        for data in all_results:
-            if data.get("project_id") == project_id:
-                # Remove internal fields
-                data.pop("_key", None)
-                data.pop("_stored_at", None)
-                project_results.append(AnalysisResult.from_dict(data))
-
-        return project_results
+        if analysis_type is None:
+            return await self._select("project_id = ?", (project_id,), limit, offset)
+        return await self._select(
+            "project_id = ? AND analysis_type = ?",
+            (project_id, analysis_type),
+            limit,
+            offset,
+        )
 
     async def get_results_for_task(
-        self, project_id: str, task_id: str
+        self,
+        project_id: str,
+        task_id: str,
+        limit: Optional[int] = None,
+        offset: int = 0,
     ) -> list[AnalysisResult]:
         """
-        Get all analysis results for a specific task.
+        Get analysis results for a specific task, newest first.
 
         Parameters
         ----------
@@ -254,11 +398,15 @@ class AnalysisResultStore:
             Project identifier
         task_id : str
             Task identifier
+        limit : Optional[int]
+            Page size; all results when None
+        offset : int
+            Number of results to skip (for pagination)
 
         Returns
         -------
         list[AnalysisResult]
-            All analysis results for this task
+            Analysis results for this task
 
         Examples
         --------
@@ -268,17 +416,41 @@ class AnalysisResultStore:
             print(f"{result.analysis_type}: {result.version}")
         ```
         """
-        all_results = await self.persistence.query("analysis_results", limit=100000)
+        return await self._select(
+            "project_id = ? AND task_id = ?", (project_id, task_id), limit, offset
+        )
 
-        task_results = []
-        for data in all_results:
-            if data.get("project_id") == project_id and data.get("task_id") == task_id:
-                # Remove internal fields
-                data.pop("_key", None)
-                data.pop("_stored_at", None)
-                task_results.append(AnalysisResult.from_dict(data))
+    async def count_results(
+        self, project_id: str, task_id: Optional[str] = None
+    ) -> int:
+        """
+        Count stored results for a project, or for one of its tasks.
+
+        Parameters
+        ----------
+        project_id : str
+            Project identifier
+        task_id : Optional[str]
+            Count only this task's results when given
 
-        return task_results
+        Returns
+        -------
+        int
+            Number of stored results
+        """
+        if task_id is None:
+            sql, params = (
+                "SELECT COUNT(*) FROM analysis_results WHERE project_id = ?",
+                (project_id,),
+            )
+        else:
+            sql, params = (
+                "SELECT COUNT(*) FROM analysis_results "
+                "WHERE project_id = ? AND task_id = ?",
+                (project_id, task_id),
+            )
+        row = await self._run(lambda conn: conn.execute(sql, params).fetchone())
+        return int(row[0])
 
     async def get_latest_result(
         self, project_id: str, task_id: Optional[str], analysis_type: str
@@ -316,19 +488,51 @@ class AnalysisResultStore:
             print("No cached result, running fresh analysis")
         ```
         """
-        if task_id is not None:
-            results = await self.get_results_for_task(project_id, task_id)
-        else:
-            results = await self.get_results_for_project(project_id)
+        results = await self._select(
+            "project_id = ? AND task_id IS ? AND analysis_type = ?",
+            (project_id, task_id, analysis_type),
+            limit=1,
+        )
+        return results[0] if results else None
+
+    async def get_latest_results_by_type(
+        self, project_id: str, task_id: Optional[str] = None
+    ) -> dict[str, AnalysisResult]:
+        """
+        Get the most recent result of every analysis type in one query.
 
-        # Filter by analysis type
-        matching = [r for r in results if r.analysis_type == analysis_type]
+        Parameters
+        ----------
+        project_id : str
+            Project identifier
+        task_id : Optional[str]
+            Task identifier (None for project-level analysis)
 
-        if not matching:
-            return None
+        Returns
+        -------
+        dict[str, AnalysisResult]
+            Latest result keyed by analysis type
 
-        # Return most recent
-        return max(matching, key=lambda r: r.timestamp)
+        Examples
+        --------
+        ```python
+        latest = await store.get_latest_results_by_type("proj-123", "task-456")
+        divergence = latest.get("requirement_divergence")
+        ```
+        """
+        sql = (
+            f"SELECT {_COLUMNS} FROM ("  # nosec B608
+            f"  SELECT {_COLUMNS}, ROW_NUMBER() OVER ("
+            "    PARTITION BY analysis_type"
+            "    ORDER BY timestamp_us DESC, analysis_id"
+            "  ) AS position"
+            "  FROM analysis_results WHERE project_id = ? AND task_id IS ?"
+            ") WHERE position = 1"
+        )
+        rows = await self._run(
+            lambda conn: conn.execute(sql, (project_id, task_id)).fetchall()
+        )
+        return {result.analysis_type: result for result in map(_from_row, rows)}
 
     async def delete_result(self, analysis_id: str) -> bool:
         """
@@ -352,18 +556,14 @@ class AnalysisResultStore:
             print("Result deleted")
         ```
         """
-        # Check if it exists first
-        existing = await self.get_result(analysis_id)
-        if existing is None:
-            return False
-
-        try:
-            await self.persistence.delete("analysis_results", analysis_id)
+        deleted = await self._run(
+            lambda conn: conn.execute(
+                "DELETE FROM analysis_results WHERE analysis_id = ?", (analysis_id,)
+            ).rowcount
+        )
+        if deleted:
             logger.debug(f"Deleted analysis result {analysis_id}")
-            return True
-        except Exception as e:
-            logger.debug(f"Failed to delete {analysis_id}: {e}")
-            return False
+        return bool(deleted)
 
     async def clear_project_results(self, project_id: str) -> int:
         """
@@ -388,12 +588,41 @@ class AnalysisResultStore:
         print(f"Cleared {count} cached results")
         ```
         """
-        results = await self.get_results_for_project(project_id)
-
-        deleted_count = 0
-        for result in results:
-            if await self.delete_result(result.analysis_id):
-                deleted_count += 1
-
+        deleted_count: int = await self._run(
+            lambda conn: conn.execute(
+                "DELETE FROM analysis_results WHERE project_id = ?", (project_id,)
+            ).rowcount
+        )
         logger.info(f"Cleared {deleted_count} results for project {project_id}")
         return deleted_count
+
+
+def _to_row(result: AnalysisResult) -> tuple:
+    """Convert a result to an ``analysis_results`` row."""
+    timestamp = result.timestamp
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    delta = timestamp - _EPOCH
+    return (
+        result.analysis_id,
+        result.project_id,
+        result.task_id,
+        result.analysis_type,
+        (delta.days * 86_400 + delta.seconds) * 1_000_000 + delta.microseconds,
+        result.version,
+        json.dumps(result.result, default=str),
+    )
+
+
+def _from_row(row: tuple) -> AnalysisResult:
+    """Convert an ``analysis_results`` row to a result."""
+    analysis_id, project_id, task_id, analysis_type, timestamp_us, version, data = row
+    return AnalysisResult(
+        analysis_id=analysis_id,
+        project_id=project_id,
+        task_id=task_id,
+        analysis_type=analysis_type,
+        timestamp=_EPOCH + timedelta(microseconds=timestamp_us),
+        version=version,
+        result=json.loads(data),
+    )
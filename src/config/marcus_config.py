@@ -287,6 +287,29 @@ class BoardHealthSettings:
     max_tasks_per_agent: int = 3
 
 
+@dataclass
+class WarmRestartSettings:
+    """Graceful shutdown and warm restart configuration.
+
+    Parameters
+    ----------
+    enabled : bool
+        Write a hot-state checkpoint on shutdown and restore it on startup
+    drain_timeout : float
+        Seconds to let in-flight tool calls finish after a shutdown signal
+    checkpoint_max_age : float
+        Seconds after which a checkpoint is too old to restore
+    retry_after : float
+        ``retry_after`` hint, in seconds, given to calls refused while
+        draining
+    """
+
+    enabled: bool = True
+    drain_timeout: float = 30.0
+    checkpoint_max_age: float = 600.0
+    retry_after: float = 5.0
+
+
 @dataclass
 class EndpointSettings:
     """Configuration for a single MCP endpoint.
@@ -301,12 +324,22 @@ class EndpointSettings:
         URL path for the endpoint
     enabled : bool
         Whether this endpoint is enabled
+    max_concurrent : Optional[int]
+        Tool calls from this endpoint that may run at once; ``None`` keeps
+        the admission controller's default for the endpoint
+    max_queued : Optional[int]
+        Tool calls that may wait for a slot before new ones are shed
+    max_queue_wait : Optional[float]
+        Seconds a tool call may wait for a slot before it is shed
     """
 
     port: int
     host: str = "127.0.0.1"
     path: str = "/mcp"
     enabled: bool = True
+    max_concurrent: Optional[int] = None
+    max_queued: Optional[int] = None
+    max_queue_wait: Optional[float] = None
 
 
 @dataclass
@@ -418,6 +451,8 @@ class MarcusConfig:
         Task lease management settings
     board_health : BoardHealthSettings
         Board health monitoring settings
+    warm_restart : WarmRestartSettings
+        Graceful drain and warm restart settings
     multi_endpoint : MultiEndpointSettings
         Multi-endpoint configuration
     hybrid_inference : HybridInferenceSettings
@@ -444,6 +479,7 @@ class MarcusConfig:
     transport: TransportSettings = field(default_factory=TransportSettings)
     task_lease: TaskLeaseSettings = field(default_factory=TaskLeaseSettings)
     board_health: BoardHealthSettings = field(default_factory=BoardHealthSettings)
+    warm_restart: WarmRestartSettings = field(default_factory=WarmRestartSettings)
     multi_endpoint: MultiEndpointSettings = field(default_factory=MultiEndpointSettings)
     hybrid_inference: HybridInferenceSettings = field(
         default_factory=HybridInferenceSettings
@@ -610,6 +646,9 @@ class MarcusConfig:
         if "board_health" in data:
             nested_configs["board_health"] = BoardHealthSettings(**data["board_health"])
 
+        if "warm_restart" in data:
+            nested_configs["warm_restart"] = WarmRestartSettings(**data["warm_restart"])
+
         if "multi_endpoint" in data:
             multi_ep_data = data["multi_endpoint"]
             nested_configs["multi_endpoint"] = MultiEndpointSettings(
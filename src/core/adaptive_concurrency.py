@@ -0,0 +1,356 @@
+"""
+Adaptive concurrency limiting for LLM fan-outs.
+
+Provides an AIMD (additive-increase / multiplicative-decrease) limiter that
+bounds how many calls to a rate-limited dependency are in flight at once.
+The limit grows slowly while calls succeed and is cut in half when the
+provider answers with a rate-limit error (HTTP 429) or when latency exceeds
+a configured threshold, so large PRD parses converge on whatever concurrency
+the provider actually tolerates instead of bursting hundreds of requests.
+
+Limiters are shared by name through :func:`get_concurrency_limiter`, so the
+PRD parser, task decomposition and design-phase generation all draw from the
+same budget for the ``"llm"`` dependency.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Name of the limiter shared by every LLM fan-out in Marcus.
+LLM_LIMITER = "llm"
+
+_RATE_LIMIT_MARKERS = ("429", "rate limit", "rate_limit", "too many requests")
+
+
+def is_rate_limit_error(exc: BaseException) -> bool:
+    """
+    Return True if an exception (or its cause chain) signals a rate limit.
+
+    Providers in :mod:`src.ai.providers` wrap HTTP failures in plain
+    ``Exception`` messages such as ``"Claude API error: 429 - ..."``, and the
+    PRD parser re-wraps those in ``AIProviderError``. Detection therefore
+    checks status-code attributes, exception class names and message text,
+    walking ``__cause__``/``__context__`` so wrapped errors are recognised.
+
+    Parameters
+    ----------
+    exc : BaseException
+        Exception raised by a provider call.
+
+    Returns
+    -------
+    bool
+        True when any exception in the chain looks like a rate limit.
+    """
+    seen = set()
+    current: Optional[BaseException] = exc
+    while current is not None and id(current) not in seen:
+        seen.add(id(current))
+        status = getattr(current, "status_code", None)
+        response = getattr(current, "response", None)
+        if status is None and response is not None:
+            status = getattr(response, "status_code", None)
+        if status == 429:
+            return True
+        if "ratelimit" in type(current).__name__.lower():
+            return True
+        message = str(current).lower()
+        if any(marker in message for marker in _RATE_LIMIT_MARKERS):
+            return True
+        current = current.__cause__ or current.__context__
+    return False
+
+
+def _retry_after_seconds(exc: BaseException) -> Optional[float]:
+    """Extract a provider-supplied ``retry_after`` hint if one is present."""
+    retry_after = getattr(exc, "retry_after", None)
+    if retry_after is None:
+        response = getattr(exc, "response", None)
+        headers = getattr(response, "headers", None)
+        if headers is not None:
+            try:
+                retry_after = headers.get("retry-after")
+            except Exception:  # nosec B110 - headers of unknown shape
+                retry_after = None
+    try:
+        return float(retry_after) if retry_after is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass
+class AdaptiveConcurrencyConfig:
+    """Configuration for an adaptive concurrency limiter."""
+
+    initial_limit: int = 16
+    min_limit: int = 1
+    max_limit: int = 64
+    backoff_factor: float = 0.5
+    latency_threshold: Optional[float] = None
+    decrease_cooldown: float = 1.0
+    rate_limit_retries: int = 2
+    retry_base_delay: float = 1.0
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    AIMD concurrency limiter for calls to a rate-limited dependency.
+
+    The limiter is not bound to an event loop: waiters are futures created
+    on the loop of the caller, so a single shared instance is safe across
+    the per-test loops pytest-asyncio creates.
+
+    Parameters
+    ----------
+    name : str
+        Dependency name used in logs and statistics.
+    config : AdaptiveConcurrencyConfig, optional
+        Limits and backoff tuning. Defaults are safe for paid-tier
+        Anthropic rate limits.
+    clock : Callable[[], float], optional
+        Monotonic clock, injectable for deterministic tests.
+
+    Examples
+    --------
+    >>> limiter = get_concurrency_limiter("llm")
+    >>> async with limiter.slot():
+    ...     await llm.analyze(prompt, context)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        config: Optional[AdaptiveConcurrencyConfig] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.name = name
+        self.config = config or AdaptiveConcurrencyConfig()
+        self._clock = clock
+        self._limit = float(
+            min(
+                max(self.config.initial_limit, self.config.min_limit),
+                self.config.max_limit,
+            )
+        )
+        self._in_flight = 0
+        self._waiters: Deque["asyncio.Future[None]"] = deque()
+        self._last_decrease: Optional[float] = None
+        self._stats: Dict[str, int] = {
+            "acquired": 0,
+            "succeeded": 0,
+            "failed": 0,
+            "rate_limited": 0,
+            "slow": 0,
+            "retried": 0,
+            "decreases": 0,
+            "peak_in_flight": 0,
+        }
+
+    @property
+    def limit(self) -> int:
+        """Current concurrency limit (whole slots)."""
+        return max(self.config.min_limit, int(self._limit))
+
+    @property
+    def in_flight(self) -> int:
+        """Number of calls currently holding a slot."""
+        return self._in_flight
+
+    @property
+    def waiting(self) -> int:
+        """Number of callers queued for a slot."""
+        return sum(1 for fut in self._waiters if not fut.done())
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return a snapshot of limiter state and counters."""
+        return {
+            "name": self.name,
+            "limit": self.limit,
+            "in_flight": self._in_flight,
+            "waiting": self.waiting,
+            **self._stats,
+        }
+
+    async def acquire(self) -> None:
+        """Wait until a slot is available and take it."""
+        if self._in_flight < self.limit and not self._waiters:
+            self._take_slot()
+            return
+
+        future: "asyncio.Future[None]" = asyncio.get_running_loop().create_future()
+        self._waiters.append(future)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Slot was granted just before cancellation; hand it on.
+                self._in_flight -= 1
+                self._wake_waiters()
+            else:
+                try:
+                    self._waiters.remove(future)
+                except ValueError:
+                    pass
+            raise
+
+    def release(
+        self, *, outcome: str = "success", latency: Optional[float] = None
+    ) -> None:
+        """
+        Give back a slot and adapt the limit to the call's outcome.
+
+        Parameters
+        ----------
+        outcome : str
+            ``"success"``, ``"rate_limited"`` or ``"error"``. Errors other
+            than rate limits leave the limit unchanged.
+        latency : float, optional
+            Seconds the call held its slot, compared against
+            ``config.latency_threshold`` when one is set.
+        """
+        self._in_flight = max(0, self._in_flight - 1)
+
+        if outcome == "rate_limited":
+            self._stats["rate_limited"] += 1
+            self._decrease("rate limited")
+        elif outcome == "success":
+            self._stats["succeeded"] += 1
+            threshold = self.config.latency_threshold
+            if threshold is not None and latency is not None and latency > threshold:
+                self._stats["slow"] += 1
+                self._decrease(f"latency {latency:.2f}s > {threshold:.2f}s")
+            else:
+                # Additive increase: one extra slot per window of successes.
+                self._limit = min(
+                    float(self.config.max_limit), self._limit + 1.0 / self._limit
+                )
+        else:
+            self._stats["failed"] += 1
+
+        self._wake_waiters()
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold a slot for the duration of the ``async with`` body."""
+        await self.acquire()
+        started = self._clock()
+        outcome = "success"
+        try:
+            yield
+        except BaseException as exc:
+            outcome = "rate_limited" if is_rate_limit_error(exc) else "error"
+            raise
+        finally:
+            self.release(outcome=outcome, latency=self._clock() - started)
+
+    async def run(
+        self, func: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any
+    ) -> Any:
+        """
+        Run ``func`` under a slot, retrying calls that were rate limited.
+
+        A rate-limited attempt has already cut the limit, so the retry waits
+        for the provider's ``retry_after`` hint (or exponential backoff) and
+        queues again behind the smaller window. Other exceptions propagate
+        immediately.
+
+        Parameters
+        ----------
+        func : Callable[..., Awaitable[Any]]
+            Coroutine function to call.
+        *args, **kwargs
+            Forwarded to ``func``.
+
+        Returns
+        -------
+        Any
+            Whatever ``func`` returns.
+        """
+        attempt = 0
+        while True:
+            try:
+                async with self.slot():
+                    return await func(*args, **kwargs)
+            except Exception as exc:
+                if (
+                    not is_rate_limit_error(exc)
+                    or attempt >= self.config.rate_limit_retries
+                ):
+                    raise
+                delay = _retry_after_seconds(exc)
+                if delay is None:
+                    delay = self.config.retry_base_delay * (2**attempt)
+                attempt += 1
+                self._stats["retried"] += 1
+                logger.debug(
+                    f"Limiter '{self.name}' retrying rate-limited call "
+                    f"(attempt {attempt}) in {delay:.2f}s, limit={self.limit}"
+                )
+                await asyncio.sleep(delay)
+
+    def _take_slot(self) -> None:
+        self._in_flight += 1
+        self._stats["acquired"] += 1
+        if self._in_flight > self._stats["peak_in_flight"]:
+            self._stats["peak_in_flight"] = self._in_flight
+
+    def _decrease(self, reason: str) -> None:
+        now = self._clock()
+        # One multiplicative decrease per cooldown: a burst of 429s from
+        # the same window reflects one overload, not several.
+        if (
+            self._last_decrease is not None
+            and now - self._last_decrease < self.config.decrease_cooldown
+        ):
+            return
+        self._last_decrease = now
+        previous = self.limit
+        self._limit = max(
+            float(self.config.min_limit), self._limit * self.config.backoff_factor
+        )
+        self._stats["decreases"] += 1
+        logger.info(
+            f"Limiter '{self.name}' reduced concurrency {previous} -> "
+            f"{self.limit} ({reason})"
+        )
+
+    def _wake_waiters(self) -> None:
+        while self._waiters and self._in_flight < self.limit:
+            future = self._waiters.popleft()
+            if future.done():
+                continue
+            self._take_slot()
+            try:
+                future.set_result(None)
+            except RuntimeError:
+                # Waiter's loop is gone (closed test loop); drop its slot.
+                self._in_flight -= 1
+
+
+# Shared limiters, one per dependency
+_concurrency_limiters: Dict[str, AdaptiveConcurrencyLimiter] = {}
+
+
+def get_concurrency_limiter(
+    name: str = LLM_LIMITER, config: Optional[AdaptiveConcurrencyConfig] = None
+) -> AdaptiveConcurrencyLimiter:
+    """
+    Get or create the shared limiter for a dependency.
+
+    ``config`` is only used when the limiter is first created.
+    """
+    if name not in _concurrency_limiters:
+        _concurrency_limiters[name] = AdaptiveConcurrencyLimiter(name, config)
+    return _concurrency_limiters[name]
+
+
+def reset_concurrency_limiters() -> None:
+    """Drop all shared limiters (used by tests and benchmarks)."""
+    _concurrency_limiters.clear()
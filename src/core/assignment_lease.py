@@ -10,17 +10,22 @@ Key features:
 - Configurable lease durations based on task complexity
 - Escalation for tasks with excessive renewals
 - Integration with assignment persistence
+- Deadline-ordered expiry schedule so the monitor wakes when the next
+  lease runs out instead of polling every lease on a fixed interval
 """
 
 import asyncio
+import heapq
+import itertools
 import logging
 import statistics
+import time
 from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from enum import Enum
 from pathlib import Path
-from typing import Any, Callable, Deque, Dict, List, Optional
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Tuple
 
 from src.core.assignment_persistence import AssignmentPersistence
 from src.core.event_loop_utils import EventLoopLockManager
@@ -53,6 +58,15 @@ MERGE_CONFLICT_GIT_TIMEOUT_SECONDS = 10.0  # cap git status to bound the lease l
 # See ``man git-status`` "Output → Short Format" for the full grammar.
 _GIT_UNMERGED_PREFIXES = ("UU", "AA", "DD", "DU", "UD", "AU", "UA")
 
+# Bound on concurrent expiry probes (git status, kanban lookups) and
+# recoveries when many leases fall due in the same tick.
+DEFAULT_MAX_CONCURRENT_EXPIRY_CHECKS = 8
+
+# Period of the monitor's O(n) reconciliation scan. Every lease is put on
+# the expiry schedule when it is created, renewed or loaded, so this only
+# catches leases changed behind the manager's back and logs statistics.
+DEFAULT_FULL_SCAN_INTERVAL_SECONDS = 3600
+
 
 class LeaseStatus(Enum):
     """Status of an assignment lease."""
@@ -286,6 +300,17 @@ class AssignmentLeaseManager:
         # Active leases tracked in memory
         self.active_leases: Dict[str, AssignmentLease] = {}
 
+        # Recovery deadlines (expiry + grace) as a min-heap of
+        # (deadline_ts, seq, task_id). Rescheduling pushes a new entry;
+        # _expiry_seq holds each task's live seq so superseded entries
+        # are dropped lazily when they reach the top.
+        self._expiry_heap: List[Tuple[float, int, str]] = []
+        self._expiry_seq: Dict[str, int] = {}
+        self._expiry_counter = itertools.count()
+        # Set by LeaseMonitor; signalled when a deadline earlier than
+        # the one it is sleeping towards gets scheduled.
+        self.expiry_wakeup: Optional[asyncio.Event] = None
+
         # Observability counters — every increment indicates a latent
         # coordination bug. Surfaced via logs at WARNING level and
         # available for MLflow/metrics export.
@@ -394,6 +419,7 @@ class AssignmentLeaseManager:
 
             # Store lease
             self.active_leases[task_id] = lease
+            self.schedule_expiry(lease)
 
             # Update assignment persistence with lease info
             await self._persist_lease(lease)
@@ -512,6 +538,7 @@ class AssignmentLeaseManager:
             lease.last_renewed = datetime.now(timezone.utc)
             lease.lease_expires = lease.last_renewed + renewal_duration
             lease.renewal_count += 1
+            self.schedule_expiry(lease)
 
             # Check for excessive renewals
             if lease.renewal_count >= self.max_renewals:
@@ -581,6 +608,7 @@ class AssignmentLeaseManager:
             now = datetime.now(timezone.utc)
             lease.last_renewed = now
             lease.lease_expires = now + timedelta(seconds=lease_seconds)
+            self.schedule_expiry(lease)
 
             # Update timestamp for cadence tracking
             lease.update_timestamps.append(now)
@@ -682,6 +710,147 @@ class AssignmentLeaseManager:
 
         return expired_leases
 
+    def recovery_deadline(self, lease: AssignmentLease) -> datetime:
+        """
+        When a lease becomes eligible for recovery (expiry plus grace).
+
+        Parameters
+        ----------
+        lease : AssignmentLease
+            Lease to evaluate.
+
+        Returns
+        -------
+        datetime
+            ``lease_expires`` plus the lease's adaptive grace period, or
+            the manager's default grace when none is set.
+        """
+        if lease.grace_period_seconds is not None:
+            grace = timedelta(seconds=lease.grace_period_seconds)
+        else:
+            grace = timedelta(minutes=self.grace_period_minutes)
+        return lease.lease_expires + grace
+
+    def schedule_expiry(
+        self, lease: AssignmentLease, at: Optional[datetime] = None
+    ) -> None:
+        """
+        (Re)schedule the recovery check for a lease.
+
+        Called wherever the manager moves ``lease_expires``. Replaces any
+        earlier schedule for the same task.
+
+        Parameters
+        ----------
+        lease : AssignmentLease
+            Lease to schedule.
+        at : Optional[datetime]
+            Check time; defaults to :meth:`recovery_deadline`.
+        """
+        deadline = (at or self.recovery_deadline(lease)).timestamp()
+        seq = next(self._expiry_counter)
+        self._expiry_seq[lease.task_id] = seq
+        heap = self._expiry_heap
+        earliest = not heap or deadline < heap[0][0]
+        heapq.heappush(heap, (deadline, seq, lease.task_id))
+
+        # Renewals leave superseded entries behind; compact once they
+        # outnumber live ones so the heap stays O(active leases).
+        if len(heap) > 2 * len(self._expiry_seq) + 64:
+            self._expiry_heap = [
+                entry for entry in heap if self._expiry_seq.get(entry[2]) == entry[1]
+            ]
+            heapq.heapify(self._expiry_heap)
+
+        if earliest and self.expiry_wakeup is not None:
+            self.expiry_wakeup.set()
+
+    def next_expiry_deadline(self) -> Optional[datetime]:
+        """
+        Earliest scheduled recovery check, or None if nothing is scheduled.
+
+        Returns
+        -------
+        Optional[datetime]
+            Time the lease monitor should next wake up.
+        """
+        heap = self._expiry_heap
+        while heap and self._expiry_seq.get(heap[0][2]) != heap[0][1]:
+            heapq.heappop(heap)
+        if not heap:
+            return None
+        return datetime.fromtimestamp(heap[0][0], timezone.utc)
+
+    def _pop_due_leases(self, now: datetime) -> List[AssignmentLease]:
+        """Pop every lease whose recovery deadline has passed."""
+        heap = self._expiry_heap
+        now_ts = now.timestamp()
+        due: List[AssignmentLease] = []
+        while heap and heap[0][0] <= now_ts:
+            _, seq, task_id = heapq.heappop(heap)
+            if self._expiry_seq.get(task_id) != seq:
+                continue  # superseded by a later schedule
+            del self._expiry_seq[task_id]
+            lease = self.active_leases.get(task_id)
+            if lease is None:
+                continue  # released since it was scheduled
+            if self.recovery_deadline(lease) > now:
+                # Extended by a path that doesn't reschedule
+                self.schedule_expiry(lease)
+                continue
+            due.append(lease)
+        return due
+
+    async def check_due_leases(
+        self, max_concurrency: int = DEFAULT_MAX_CONCURRENT_EXPIRY_CHECKS
+    ) -> List[AssignmentLease]:
+        """
+        Return leases whose recovery deadline has passed since the last call.
+
+        Deadline-ordered counterpart of :meth:`check_expired_leases`: pops
+        due entries off the expiry schedule, so the cost is proportional
+        to the number of leases falling due rather than to every active
+        lease. The merge-conflict extension probes for the batch run
+        concurrently, at most ``max_concurrency`` at a time, outside the
+        lease lock.
+
+        A returned lease is not rescheduled; callers that decide not to
+        recover it should call :meth:`schedule_expiry` with a re-check
+        time.
+
+        Parameters
+        ----------
+        max_concurrency : int
+            Maximum git probes in flight.
+
+        Returns
+        -------
+        List[AssignmentLease]
+            Expired leases past their grace period, in deadline order.
+        """
+        async with self.lease_lock:
+            candidates = self._pop_due_leases(datetime.now(timezone.utc))
+        if not candidates:
+            return []
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def still_expired(lease: AssignmentLease) -> bool:
+            async with semaphore:
+                if await self._try_extend_for_merge_conflict(lease):
+                    return False
+            # A concurrent renew_lease rescheduled it while we probed
+            return lease.is_expired and lease.task_id in self.active_leases
+
+        results = await asyncio.gather(*(still_expired(lease) for lease in candidates))
+        expired = [lease for lease, due in zip(candidates, results) if due]
+        if expired:
+            logger.info(
+                f"{len(expired)} lease(s) due for recovery: "
+                f"{[lease.task_id for lease in expired]}"
+            )
+        return expired
+
     def _resolve_worktree_path(self, lease: AssignmentLease) -> Optional[Path]:
         """
         Resolve the worktree path for an agent's lease.
@@ -873,6 +1042,7 @@ class AssignmentLeaseManager:
             lease.lease_expires = grant_time + extension
             lease.last_renewed = grant_time
             lease.merge_conflict_extensions += 1
+            self.schedule_expiry(lease)
 
             self.lease_history.append(
                 {
@@ -1064,6 +1234,7 @@ class AssignmentLeaseManager:
             async with self.lease_lock:
                 if lease.task_id in self.active_leases:
                     del self.active_leases[lease.task_id]
+                self._expiry_seq.pop(lease.task_id, None)
 
             # Remove assignment from persistence
             await self.assignment_persistence.remove_assignment(lease.agent_id)
@@ -1140,27 +1311,54 @@ class AssignmentLeaseManager:
         return expiring
 
     async def _persist_lease(self, lease: AssignmentLease) -> None:
-        """Persist lease information to assignment persistence."""
+        """
+        Persist lease information to assignment persistence.
+
+        Writes only the lease fields of the agent's assignment (a single
+        row update in the SQLite store); ``assigned_at`` and the task data
+        saved at assignment time are left untouched.
+        """
         assignment = await self.assignment_persistence.get_assignment(lease.agent_id)
         if assignment:
-            assignment["lease_expires"] = lease.lease_expires.isoformat()
-            assignment["lease_renewed_at"] = lease.last_renewed.isoformat()
-            assignment["renewal_count"] = lease.renewal_count
-            assignment["progress_percentage"] = lease.progress_percentage
-            assignment["last_progress_update"] = datetime.now(timezone.utc).isoformat()
-            assignment["update_timestamps"] = [
-                ts.isoformat() for ts in lease.update_timestamps
-            ]
-            # Persist merge-conflict extension counter so the cap
-            # survives a service restart during the extension window
-            # (Codex P1 on PR #350).
-            assignment["merge_conflict_extensions"] = lease.merge_conflict_extensions
+            lease_data = {
+                "lease_expires": lease.lease_expires.isoformat(),
+                "lease_renewed_at": lease.last_renewed.isoformat(),
+                "renewal_count": lease.renewal_count,
+                "progress_percentage": lease.progress_percentage,
+                "last_progress_update": datetime.now(timezone.utc).isoformat(),
+                "update_timestamps": [ts.isoformat() for ts in lease.update_timestamps],
+                # Persist merge-conflict extension counter so the cap
+                # survives a service restart during the extension window
+                # (Codex P1 on PR #350).
+                "merge_conflict_extensions": lease.merge_conflict_extensions,
+            }
+            assignment.update(lease_data)
             await self.assignment_persistence.save_assignment(
                 lease.agent_id,
                 lease.task_id,
-                assignment.get("assigned_at", datetime.now(timezone.utc).isoformat()),
+                assignment.get("task_data", {}),
+                lease=lease_data,
             )
 
+    async def flush_leases(self) -> int:
+        """
+        Persist every active lease.
+
+        :meth:`touch_lease` extends leases in memory only, so without a
+        flush on shutdown a restart would load expiry times that are
+        already in the past and recover tasks from live agents.
+
+        Returns
+        -------
+        int
+            Number of leases written.
+        """
+        async with self.lease_lock:
+            leases = list(self.active_leases.values())
+        for lease in leases:
+            await self._persist_lease(lease)
+        return len(leases)
+
     async def load_active_leases(self) -> None:
         """Load active leases from persistence on startup."""
         assignments = await self.assignment_persistence.load_assignments()
@@ -1212,6 +1410,7 @@ class AssignmentLeaseManager:
             )
 
             self.active_leases[task_id] = lease
+            self.schedule_expiry(lease)
 
         logger.info(f"Loaded {len(self.active_leases)} active leases from persistence")
 
@@ -1475,10 +1674,25 @@ class AssignmentLeaseManager:
 
 
 class LeaseMonitor:
-    """Background monitor for lease expiration and recovery."""
+    """
+    Background monitor for lease expiration and recovery.
+
+    Sleeps until the lease manager's next recovery deadline (or until an
+    earlier one is scheduled) and then handles only the leases that fell
+    due, so the cost of a wakeup does not grow with the number of active
+    leases. A full :meth:`AssignmentLeaseManager.check_expired_leases`
+    scan only runs every ``full_scan_interval_seconds`` to reconcile
+    leases modified outside the manager and to log lease statistics.
+    """
 
     def __init__(
-        self, lease_manager: AssignmentLeaseManager, check_interval_seconds: int = 60
+        self,
+        lease_manager: AssignmentLeaseManager,
+        check_interval_seconds: int = 60,
+        max_concurrent_recoveries: int = DEFAULT_MAX_CONCURRENT_EXPIRY_CHECKS,
+        full_scan_interval_seconds: Optional[
+            float
+        ] = DEFAULT_FULL_SCAN_INTERVAL_SECONDS,
     ):
         """
         Initialize the lease monitor.
@@ -1488,12 +1702,21 @@ class LeaseMonitor:
             lease_manager
                 The lease manager instance.
             check_interval_seconds
-                How often to check for expired leases.
+                How long to wait before re-checking a lease the smart
+                checks declined to recover, and the backoff after an error.
+            max_concurrent_recoveries
+                Maximum expiry probes and recoveries in flight per batch.
+            full_scan_interval_seconds
+                How often to run the full expired-lease scan, or None to
+                rely on the expiry schedule alone.
         """
         self.lease_manager = lease_manager
         self.check_interval = check_interval_seconds
+        self.max_concurrent_recoveries = max_concurrent_recoveries
+        self.full_scan_interval = full_scan_interval_seconds
         self._running = False
         self._monitor_task: Optional[asyncio.Task[None]] = None
+        self._wakeup: Optional[asyncio.Event] = None
 
     async def start(self) -> None:
         """Start monitoring for expired leases."""
@@ -1501,12 +1724,18 @@ class LeaseMonitor:
             logger.warning("Lease monitor already running")
             return
 
+        self._wakeup = asyncio.Event()
+        self.lease_manager.expiry_wakeup = self._wakeup
+
         # Load existing leases first
         await self.lease_manager.load_active_leases()
 
         self._running = True
         self._monitor_task = asyncio.create_task(self._monitor_loop())
-        logger.info(f"Lease monitor started (interval: {self.check_interval}s)")
+        logger.info(
+            f"Lease monitor started (full scan interval: "
+            f"{self.full_scan_interval}s)"
+        )
 
     async def stop(self) -> None:
         """Stop the lease monitor."""
@@ -1517,57 +1746,35 @@ class LeaseMonitor:
                 await self._monitor_task
             except asyncio.CancelledError:
                 pass
+        if self.lease_manager.expiry_wakeup is self._wakeup:
+            self.lease_manager.expiry_wakeup = None
         logger.info("Lease monitor stopped")
 
     async def _monitor_loop(self) -> None:
         """Monitor lease expiration and recover dead agents."""
+        # Leases loaded at startup are already scheduled, so the first
+        # reconciliation scan waits a full period.
+        next_scan = self._next_full_scan()
         while self._running:
             try:
-                # Check for expired leases
-                expired_leases = await self.lease_manager.check_expired_leases()
-
-                # Recover expired leases (with smart checks)
-                for lease in expired_leases:
-                    should_recover = (
-                        await self.lease_manager.should_recover_expired_lease(lease)
-                    )
-
-                    if not should_recover:
-                        logger.info(
-                            f"Skipping recovery for {lease.task_id} "
-                            f"(smart checks indicate agent still working)"
-                        )
-                        continue
-
-                    success = await self.lease_manager.recover_expired_lease(lease)
-                    if success:
-                        logger.info(
-                            f"Successfully recovered expired lease for "
-                            f"task {lease.task_id}"
-                        )
-                    else:
-                        logger.error(
-                            f"Failed to recover expired lease for task {lease.task_id}"
-                        )
-
-                # Log statistics periodically
-                stats = self.lease_manager.get_lease_statistics()
-                if stats["total_active"] > 0:
-                    logger.info(
-                        f"Lease stats: {stats['total_active']} active, "
-                        f"{stats['expiring_soon']} expiring soon, "
-                        f"{stats['expired']} expired"
-                    )
-
-                # Check for expiring leases and log warnings
-                expiring = await self.lease_manager.get_expiring_leases()
-                for lease in expiring:
-                    logger.warning(
-                        f"Lease expiring soon: task {lease.task_id} "
-                        f"(expires in {lease.time_remaining})"
-                    )
+                scanned: Set[str] = set()
+                if next_scan is not None and time.monotonic() >= next_scan:
+                    next_scan = self._next_full_scan()
+                    # Full scan for expired leases
+                    expired_leases = await self.lease_manager.check_expired_leases()
+                    await self._recover_leases(expired_leases)
+                    scanned = {lease.task_id for lease in expired_leases}
+                    await self._log_lease_health()
+
+                # Leases that fell due since the last wakeup
+                due_leases = await self.lease_manager.check_due_leases(
+                    self.max_concurrent_recoveries
+                )
+                await self._recover_leases(
+                    [lease for lease in due_leases if lease.task_id not in scanned]
+                )
 
-                await asyncio.sleep(self.check_interval)
+                await self._sleep_until_next_deadline(next_scan)
 
             except asyncio.CancelledError:
                 logger.warning("Lease monitor cancelled")
@@ -1580,3 +1787,97 @@ class LeaseMonitor:
                 await asyncio.sleep(self.check_interval)
 
         logger.warning("Lease monitor loop exited")
+
+    def _next_full_scan(self) -> Optional[float]:
+        """Monotonic time of the next full scan, or None if disabled."""
+        if self.full_scan_interval is None:
+            return None
+        return time.monotonic() + self.full_scan_interval
+
+    async def _recover_leases(self, leases: List[AssignmentLease]) -> None:
+        """Recover a batch of expired leases (with smart checks) concurrently."""
+        if not leases:
+            return
+        semaphore = asyncio.Semaphore(self.max_concurrent_recoveries)
+
+        async def recover(lease: AssignmentLease) -> None:
+            async with semaphore:
+                should_recover = (
+                    await self.lease_manager.should_recover_expired_lease(lease)
+                )
+
+                if not should_recover:
+                    logger.info(
+                        f"Skipping recovery for {lease.task_id} "
+                        f"(smart checks indicate agent still working)"
+                    )
+                    self._recheck_later(lease)
+                    return
+
+                success = await self.lease_manager.recover_expired_lease(lease)
+                if success:
+                    logger.info(
+                        f"Successfully recovered expired lease for "
+                        f"task {lease.task_id}"
+                    )
+                else:
+                    logger.error(
+                        f"Failed to recover expired lease for task {lease.task_id}"
+                    )
+                    self._recheck_later(lease)
+
+        results = await asyncio.gather(
+            *(recover(lease) for lease in leases), return_exceptions=True
+        )
+        for lease, result in zip(leases, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error recovering lease for {lease.task_id}: {result}")
+
+    def _recheck_later(self, lease: AssignmentLease) -> None:
+        """Look at a lease we chose not to recover again next interval."""
+        self.lease_manager.schedule_expiry(
+            lease,
+            at=datetime.now(timezone.utc) + timedelta(seconds=self.check_interval),
+        )
+
+    async def _log_lease_health(self) -> None:
+        """Log lease statistics and warn about leases expiring soon."""
+        stats = self.lease_manager.get_lease_statistics()
+        if stats["total_active"] > 0:
+            logger.info(
+                f"Lease stats: {stats['total_active']} active, "
+                f"{stats['expiring_soon']} expiring soon, "
+                f"{stats['expired']} expired"
+            )
+
+        expiring = await self.lease_manager.get_expiring_leases()
+        for lease in expiring:
+            logger.warning(
+                f"Lease expiring soon: task {lease.task_id} "
+                f"(expires in {lease.time_remaining})"
+            )
+
+    async def _sleep_until_next_deadline(self, next_scan: Optional[float]) -> None:
+        """Sleep until the next lease deadline, full scan, or wakeup."""
+        if self._wakeup is not None:
+            self._wakeup.clear()
+        timeout: Optional[float] = None
+        if next_scan is not None:
+            timeout = next_scan - time.monotonic()
+        deadline = self.lease_manager.next_expiry_deadline()
+        if deadline is not None:
+            until_deadline = (deadline - datetime.now(timezone.utc)).total_seconds()
+            if timeout is None or until_deadline < timeout:
+                timeout = until_deadline
+        if timeout is not None and timeout <= 0:
+            return
+        if self._wakeup is None:
+            if timeout is None:
+                # Nothing scheduled and no scans: poll at the check interval
+                timeout = self.check_interval
+            await asyncio.sleep(timeout)
+            return
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
@@ -3,11 +3,22 @@ Assignment persistence layer for Marcus.
 
 This module provides persistent storage for task assignments to prevent
 duplicate assignments across Marcus restarts and multiple instances.
+
+Assignments (and the lease fields the lease manager attaches to them) are
+stored one row per worker in a SQLite database in WAL mode, so a lease
+renewal is a single-row ``UPDATE`` rather than a rewrite of every
+assignment. The original ``assignments.json`` document format remains
+available as ``backend="json"``; an existing ``assignments.json`` is
+imported into an empty database the first time it is opened. The
+database is opened lazily, so constructing the persistence layer does
+not create any files.
 """
 
 import asyncio
 import json
 import logging
+import sqlite3
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, Optional
@@ -18,11 +29,223 @@ from src.core.event_loop_utils import EventLoopLockManager
 
 logger = logging.getLogger(__name__)
 
+_ASSIGNMENT_KEYS = ("task_id", "assigned_at", "task_data")
+
+
+class _JSONAssignmentStore:
+    """Whole-document JSON store (one file holding every assignment)."""
+
+    def __init__(self, assignments_file: Path):
+        self.assignments_file = assignments_file
+
+    async def load(self) -> Optional[Dict[str, Dict[str, Any]]]:
+        if not self.assignments_file.exists():
+            return None
+        async with aiofiles.open(self.assignments_file, "r") as f:
+            content = await f.read()
+        loaded: Dict[str, Dict[str, Any]] = json.loads(content) if content else {}
+        return loaded
+
+    async def save(self, worker_id: str, cache: Dict[str, Dict[str, Any]]) -> None:
+        await self._write(cache)
+
+    async def save_lease(
+        self,
+        worker_id: str,
+        task_id: str,
+        lease: Dict[str, Any],
+        cache: Dict[str, Dict[str, Any]],
+    ) -> None:
+        await self._write(cache)
+
+    async def remove(self, worker_id: str, cache: Dict[str, Dict[str, Any]]) -> None:
+        await self._write(cache)
+
+    async def flush(self, cache: Dict[str, Dict[str, Any]]) -> None:
+        if cache:
+            await self._write(cache)
+
+    async def _write(self, cache: Dict[str, Dict[str, Any]]) -> None:
+        """Write assignments to disk atomically."""
+        temp_file = self.assignments_file.with_suffix(".tmp")
+
+        try:
+            async with aiofiles.open(temp_file, "w") as f:
+                await f.write(json.dumps(cache, indent=2))
+
+            # Atomic rename
+            temp_file.replace(self.assignments_file)
+
+        except Exception as e:
+            logger.error(f"Error writing assignments: {e}")
+            if temp_file.exists():
+                temp_file.unlink()
+            raise
+
+
+class _SQLiteAssignmentStore:
+    """
+    Row-per-assignment SQLite store.
+
+    Lease fields live in a JSON column on the assignment row, so renewing
+    a lease touches exactly one row. The database is opened on first use
+    (and only created by the first write); one connection is shared and
+    guarded by a thread lock, and statements run in a worker thread.
+    """
+
+    def __init__(self, db_path: Path, legacy_json: Path):
+        self.db_path = db_path
+        self.legacy_json = legacy_json
+        self._conn: Optional[sqlite3.Connection] = None
+        self._conn_lock = threading.Lock()
+
+    def _connection(self, create: bool = True) -> Optional[sqlite3.Connection]:
+        """
+        Open the database on first use; the caller holds ``_conn_lock``.
+
+        With ``create=False`` nothing is opened (and None is returned)
+        while there is neither a database nor a legacy file to read.
+        """
+        if self._conn is None:
+            if not (create or self.db_path.exists() or self.legacy_json.exists()):
+                return None
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._init_db(self._conn)
+            self._migrate_json(self._conn)
+        return self._conn
+
+    @staticmethod
+    def _init_db(conn: sqlite3.Connection) -> None:
+        with conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS assignments (
+                    worker_id TEXT PRIMARY KEY,
+                    task_id TEXT NOT NULL,
+                    assigned_at TEXT NOT NULL,
+                    task_data TEXT NOT NULL DEFAULT '{}',
+                    lease TEXT
+                )
+            """)
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_assignments_task_id
+                ON assignments(task_id)
+            """)
+
+    def _migrate_json(self, conn: sqlite3.Connection) -> None:
+        """Import ``assignments.json`` into an empty database, then set it aside."""
+        legacy_json = self.legacy_json
+        if not legacy_json.exists():
+            return
+        try:
+            content = legacy_json.read_text()
+            legacy = json.loads(content) if content else {}
+        except (json.JSONDecodeError, IOError) as e:
+            logger.error(f"Not migrating unreadable {legacy_json}: {e}")
+            return
+
+        with conn:
+            if conn.execute("SELECT 1 FROM assignments LIMIT 1").fetchone():
+                logger.warning(
+                    f"Not migrating {legacy_json}: {self.db_path} already "
+                    f"holds assignments"
+                )
+                return
+            conn.executemany(
+                """
+                INSERT INTO assignments
+                    (worker_id, task_id, assigned_at, task_data, lease)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                [self._row(worker_id, record) for worker_id, record in legacy.items()],
+            )
+        legacy_json.replace(legacy_json.with_name(legacy_json.name + ".migrated"))
+        logger.info(
+            f"Migrated {len(legacy)} assignments from {legacy_json} to {self.db_path}"
+        )
+
+    @staticmethod
+    def _row(worker_id: str, record: Dict[str, Any]) -> tuple:
+        lease = {k: v for k, v in record.items() if k not in _ASSIGNMENT_KEYS}
+        return (
+            worker_id,
+            record["task_id"],
+            record.get("assigned_at") or datetime.now(timezone.utc).isoformat(),
+            json.dumps(record.get("task_data", {}), default=str),
+            json.dumps(lease, default=str) if lease else None,
+        )
+
+    async def _run(self, sql: str, params: tuple, create: bool = True) -> None:
+        def execute() -> None:
+            with self._conn_lock:
+                conn = self._connection(create)
+                if conn is None:
+                    return
+                with conn:
+                    conn.execute(sql, params)
+
+        await asyncio.to_thread(execute)
+
+    async def load(self) -> Optional[Dict[str, Dict[str, Any]]]:
+        def read() -> Optional[Dict[str, Dict[str, Any]]]:
+            with self._conn_lock:
+                conn = self._connection(create=False)
+                if conn is None:
+                    return None
+                rows = conn.execute(
+                    "SELECT worker_id, task_id, assigned_at, task_data, lease "
+                    "FROM assignments"
+                ).fetchall()
+            assignments = {}
+            for worker_id, task_id, assigned_at, task_data, lease in rows:
+                assignments[worker_id] = {
+                    "task_id": task_id,
+                    "assigned_at": assigned_at,
+                    "task_data": json.loads(task_data),
+                    **(json.loads(lease) if lease else {}),
+                }
+            return assignments
+
+        return await asyncio.to_thread(read)
+
+    async def save(self, worker_id: str, cache: Dict[str, Dict[str, Any]]) -> None:
+        await self._run(
+            """
+            INSERT OR REPLACE INTO assignments
+                (worker_id, task_id, assigned_at, task_data, lease)
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            self._row(worker_id, cache[worker_id]),
+        )
+
+    async def save_lease(
+        self,
+        worker_id: str,
+        task_id: str,
+        lease: Dict[str, Any],
+        cache: Dict[str, Dict[str, Any]],
+    ) -> None:
+        await self._run(
+            "UPDATE assignments SET lease = ? WHERE worker_id = ? AND task_id = ?",
+            (json.dumps(lease, default=str), worker_id, task_id),
+            create=False,
+        )
+
+    async def remove(self, worker_id: str, cache: Dict[str, Dict[str, Any]]) -> None:
+        await self._run(
+            "DELETE FROM assignments WHERE worker_id = ?", (worker_id,), create=False
+        )
+
+    async def flush(self, cache: Dict[str, Dict[str, Any]]) -> None:
+        # Every change is committed as it happens
+        return None
+
 
 class AssignmentPersistence:
     """Handles persistent storage of task assignments."""
 
-    def __init__(self, storage_dir: Optional[Path] = None):
+    def __init__(self, storage_dir: Optional[Path] = None, backend: str = "sqlite"):
         """
         Initialize the assignment persistence layer.
 
@@ -31,6 +254,10 @@ class AssignmentPersistence:
             storage_dir
                 Directory for storing assignment data.
                         Defaults to ./data/assignments/
+            backend
+                ``"sqlite"`` (default) for the row-per-assignment database
+                ``assignments.db``, or ``"json"`` for the single
+                ``assignments.json`` document.
         """
         if storage_dir is None:
             # Use absolute path to ensure it works regardless of working directory
@@ -40,8 +267,18 @@ class AssignmentPersistence:
         self.storage_dir.mkdir(parents=True, exist_ok=True)
 
         self.assignments_file = self.storage_dir / "assignments.json"
+        self.db_path = self.storage_dir / "assignments.db"
         self.lock_file = self.storage_dir / ".assignments.lock"
 
+        self.backend = backend
+        self._store: Any
+        if backend == "sqlite":
+            self._store = _SQLiteAssignmentStore(self.db_path, self.assignments_file)
+        elif backend == "json":
+            self._store = _JSONAssignmentStore(self.assignments_file)
+        else:
+            raise ValueError(f"Unknown assignment persistence backend: {backend}")
+
         # In-memory cache
         self._assignments_cache: Dict[str, Dict[str, Any]] = {}
         self._lock_manager = EventLoopLockManager()
@@ -52,7 +289,11 @@ class AssignmentPersistence:
         return self._lock_manager.get_lock()
 
     async def save_assignment(
-        self, worker_id: str, task_id: str, task_data: Dict[str, Any]
+        self,
+        worker_id: str,
+        task_id: str,
+        task_data: Dict[str, Any],
+        lease: Optional[Dict[str, Any]] = None,
     ) -> None:
         """
         Save a task assignment persistently.
@@ -65,8 +306,23 @@ class AssignmentPersistence:
                 ID of the task being assigned.
             task_data
                 Additional task information to store.
+            lease
+                Lease fields (expiry, renewal count, progress, ...) for an
+                existing assignment. When given, only the lease is updated:
+                the assignment's ``assigned_at`` and ``task_data`` are kept,
+                and nothing is written unless the worker still holds
+                ``task_id``.
         """
         async with self.lock:
+            if lease is not None:
+                record = self._assignments_cache.get(worker_id)
+                if record is not None and record.get("task_id") == task_id:
+                    record.update(lease)
+                await self._store.save_lease(
+                    worker_id, task_id, lease, self._assignments_cache
+                )
+                return
+
             # Update cache
             self._assignments_cache[worker_id] = {
                 "task_id": task_id,
@@ -75,7 +331,7 @@ class AssignmentPersistence:
             }
 
             # Persist to disk
-            await self._write_assignments()
+            await self._store.save(worker_id, self._assignments_cache)
 
     async def remove_assignment(self, worker_id: str) -> None:
         """
@@ -89,7 +345,7 @@ class AssignmentPersistence:
         async with self.lock:
             if worker_id in self._assignments_cache:
                 del self._assignments_cache[worker_id]
-                await self._write_assignments()
+                await self._store.remove(worker_id, self._assignments_cache)
 
     async def get_assignment(self, worker_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -129,35 +385,16 @@ class AssignmentPersistence:
             Dictionary of worker_id -> assignment data
         """
         async with self.lock:
-            if not self.assignments_file.exists():
-                return {}
-
             try:
-                async with aiofiles.open(self.assignments_file, "r") as f:
-                    content = await f.read()
-                    self._assignments_cache = json.loads(content) if content else {}
-                    return self._assignments_cache
-            except (json.JSONDecodeError, IOError) as e:
+                loaded = await self._store.load()
+            except (json.JSONDecodeError, IOError, sqlite3.Error) as e:
                 logger.error(f"Error loading assignments: {e}")
                 # Return empty dict on error to allow recovery
                 return {}
-
-    async def _write_assignments(self) -> None:
-        """Write assignments to disk atomically."""
-        temp_file = self.assignments_file.with_suffix(".tmp")
-
-        try:
-            async with aiofiles.open(temp_file, "w") as f:
-                await f.write(json.dumps(self._assignments_cache, indent=2))
-
-            # Atomic rename
-            temp_file.replace(self.assignments_file)
-
-        except Exception as e:
-            logger.error(f"Error writing assignments: {e}")
-            if temp_file.exists():
-                temp_file.unlink()
-            raise
+            if loaded is None:
+                return {}
+            self._assignments_cache = loaded
+            return self._assignments_cache
 
     async def is_task_assigned(self, task_id: str) -> bool:
         """
@@ -201,8 +438,7 @@ class AssignmentPersistence:
         """Clean up any resources and persist final state."""
         try:
             # Persist any cached data one final time
-            if self._assignments_cache:
-                await self._write_assignments()
+            await self._store.flush(self._assignments_cache)
 
             logger.info("Assignment persistence cleanup completed")
         except Exception as e:
@@ -7,10 +7,11 @@ kanban board state on startup or after connectivity issues.
 
 import logging
 from datetime import datetime, timezone
-from typing import Any, Dict, List, TypedDict
+from typing import Any, Dict, List, Optional, TypedDict
 
 from src.core.assignment_persistence import AssignmentPersistence
-from src.core.models import TaskStatus
+from src.core.board_snapshot import BoardSnapshotService
+from src.core.models import Task, TaskStatus
 from src.integrations.kanban_interface import KanbanInterface
 
 logger = logging.getLogger(__name__)
@@ -40,7 +41,10 @@ class AssignmentReconciler:
     """Reconciles persisted assignments with kanban board state."""
 
     def __init__(
-        self, persistence: AssignmentPersistence, kanban_client: KanbanInterface
+        self,
+        persistence: AssignmentPersistence,
+        kanban_client: KanbanInterface,
+        board_snapshot: Optional[BoardSnapshotService] = None,
     ):
         """
         Initialize the reconciler.
@@ -51,9 +55,19 @@ class AssignmentReconciler:
                 Assignment persistence layer.
             kanban_client
                 Kanban board interface.
+            board_snapshot
+                Shared board snapshot to read tasks from instead of
+                fetching the whole board on every reconciliation.
         """
         self.persistence = persistence
         self.kanban_client = kanban_client
+        self.board_snapshot = board_snapshot
+
+    async def _get_all_tasks(self) -> List[Task]:
+        """Return all board tasks, from the shared snapshot when available."""
+        if self.board_snapshot is not None:
+            return (await self.board_snapshot.get_snapshot()).tasks
+        return await self.kanban_client.get_all_tasks()
 
     async def reconcile_assignments(self) -> ReconciliationResults:
         """
@@ -76,7 +90,7 @@ class AssignmentReconciler:
             persisted = await self.persistence.load_assignments()
 
             # Get all tasks from kanban
-            all_tasks = await self.kanban_client.get_all_tasks()
+            all_tasks = await self._get_all_tasks()
             task_map = {task.id: task for task in all_tasks}
 
             # Check each persisted assignment
@@ -185,7 +199,7 @@ class AssignmentReconciler:
             health["persisted_count"] = len(persisted)
 
             # Get kanban assignments
-            all_tasks = await self.kanban_client.get_all_tasks()
+            all_tasks = await self._get_all_tasks()
             kanban_assigned = [
                 t
                 for t in all_tasks
@@ -0,0 +1,180 @@
+"""
+Cached, concurrent kanban attachment fetching for task context.
+
+Assembling a task's context asks the kanban provider for the attachments of
+the task, each direct dependency, every transitive ancestor and every
+foundation task. Done one await at a time, a 50-deep dependency chain costs
+50 sequential provider round-trips on every ``request_next_task`` and
+``get_task_context`` call.
+
+:class:`AttachmentCache` fetches a batch of attachment lists concurrently
+(bounded by a semaphore), shares a single in-flight request when several
+callers ask for the same card at once, and remembers successful results per
+card. A cached entry is reused only while the task's *signature* (status
+and last update) is unchanged and its TTL has not run out; ``log_artifact``
+invalidates a task's entry explicitly. Failed fetches are never cached.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Provider requests in flight at once for one batch
+DEFAULT_MAX_CONCURRENT_FETCHES = 8
+
+# Safety net for attachments added on the board directly, which do not
+# change the task's status or Marcus-side artifacts
+DEFAULT_ATTACHMENT_TTL_SECONDS = 300.0
+
+Fetch = Callable[[], Awaitable[Dict[str, Any]]]
+
+
+@dataclass
+class AttachmentRequest:
+    """
+    One attachment lookup in a batch.
+
+    Attributes
+    ----------
+    task_id : str
+        Marcus task the attachments belong to (the invalidation key).
+    key : Hashable
+        Cache key; requests with equal keys are fetched once.
+    signature : Hashable
+        Task state the cached result is valid for, e.g. ``(status,
+        updated_at)``. A different signature forces a refetch.
+    fetch : Fetch
+        Coroutine factory performing the provider call.
+    """
+
+    task_id: str
+    key: Hashable
+    signature: Hashable
+    fetch: Fetch
+
+
+@dataclass
+class _Entry:
+    task_id: str
+    signature: Hashable
+    result: Dict[str, Any]
+    fetched_at: float
+
+
+class AttachmentCache:
+    """
+    Per-card cache of kanban ``get_attachments`` results.
+
+    Parameters
+    ----------
+    ttl_seconds : float
+        How long a result may be reused. ``0`` disables reuse across batches
+        while still deduplicating requests within one batch.
+    max_concurrency : int
+        Maximum provider requests in flight per batch.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = DEFAULT_ATTACHMENT_TTL_SECONDS,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENT_FETCHES,
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_concurrency = max(1, max_concurrency)
+        self._entries: Dict[Hashable, _Entry] = {}
+        self._in_flight: Dict[Tuple[Hashable, Hashable], "asyncio.Future[Any]"] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """Return the number of cached entries."""
+        return len(self._entries)
+
+    def invalidate(self, task_id: str) -> None:
+        """Drop every cached entry belonging to ``task_id``."""
+        stale = [k for k, e in self._entries.items() if e.task_id == task_id]
+        for key in stale:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        self._entries.clear()
+
+    def _cached(self, request: AttachmentRequest) -> Optional[Dict[str, Any]]:
+        entry = self._entries.get(request.key)
+        if entry is None or entry.signature != request.signature:
+            return None
+        if time.monotonic() - entry.fetched_at > self.ttl_seconds:
+            return None
+        return entry.result
+
+    async def _fetch(self, request: AttachmentRequest, limit: asyncio.Semaphore) -> Any:
+        """Fetch one request, joining an identical request already in flight."""
+        flight_key = (request.key, request.signature)
+        pending = self._in_flight.get(flight_key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        future: "asyncio.Future[Any]" = asyncio.get_running_loop().create_future()
+        self._in_flight[flight_key] = future
+        try:
+            async with limit:
+                result = await request.fetch()
+        except Exception as exc:  # noqa: BLE001
+            future.set_result(exc)
+        else:
+            future.set_result(result)
+            if isinstance(result, dict) and result.get("success", False):
+                self._entries[request.key] = _Entry(
+                    request.task_id, request.signature, result, time.monotonic()
+                )
+        finally:
+            self._in_flight.pop(flight_key, None)
+            if not future.done():
+                # Cancelled mid-fetch: joined callers see a failed fetch
+                future.set_result(RuntimeError("attachment fetch cancelled"))
+        return future.result()
+
+    async def fetch_all(self, requests: List[AttachmentRequest]) -> List[Any]:
+        """
+        Resolve a batch of attachment requests.
+
+        Parameters
+        ----------
+        requests : List[AttachmentRequest]
+            Lookups to resolve; duplicates are fetched once.
+
+        Returns
+        -------
+        List[Any]
+            One item per request, in order: the provider's result dict, or
+            the exception the provider call raised.
+        """
+        results: List[Any] = [None] * len(requests)
+        missing: Dict[Tuple[Hashable, Hashable], List[int]] = {}
+        first: Dict[Tuple[Hashable, Hashable], AttachmentRequest] = {}
+        for index, request in enumerate(requests):
+            cached = self._cached(request)
+            if cached is not None:
+                self.hits += 1
+                results[index] = cached
+                continue
+            flight_key = (request.key, request.signature)
+            if flight_key not in missing:
+                self.misses += 1
+                first[flight_key] = request
+            missing.setdefault(flight_key, []).append(index)
+
+        if missing:
+            limit = asyncio.Semaphore(self.max_concurrency)
+            fetched = await asyncio.gather(
+                *(self._fetch(first[k], limit) for k in missing)
+            )
+            for flight_key, value in zip(missing, fetched):
+                for index in missing[flight_key]:
+                    results[index] = value
+        return results
@@ -6,15 +6,22 @@ This module analyzes the overall health of the project board by detecting:
 - Circular dependencies that create deadlocks
 - Bottleneck tasks that block many others
 - Chain blocks where sequential dependencies create long waits
+
+The thresholds, severity rules and issue builders are module-level so
+that :class:`BoardHealthAnalyzer`, which recomputes every check from a
+full task list, and :class:`src.core.board_health_model.BoardHealthModel`,
+which keeps the checks up to date from board change events, report the
+same issues.
 """
 
 import logging
-from collections import defaultdict
+from collections import Counter, defaultdict
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from enum import Enum
-from typing import Any, Dict, List, Set
+from typing import Any, Dict, Iterable, List, Mapping
 
+from src.core.dependency_graph import DependencyGraph
 from src.core.models import Task, TaskStatus, WorkerStatus
 from src.integrations.kanban_interface import KanbanInterface
 
@@ -66,6 +73,392 @@ class BoardHealth:
     timestamp: datetime
 
 
+# A task blocking at least this many others is a bottleneck
+BOTTLENECK_THRESHOLD = 3
+# TODO tasks on dependency chains longer than this are reported
+CHAIN_LENGTH_THRESHOLD = 3
+# Only the longest few chains are reported
+MAX_CHAIN_ISSUES = 3
+# Idle agents are reported once they exceed this share of all agents
+IDLE_AGENT_RATIO = 0.3
+
+SEVERITY_PENALTIES = {
+    IssueSeverity.CRITICAL: 20,
+    IssueSeverity.HIGH: 10,
+    IssueSeverity.MEDIUM: 5,
+    IssueSeverity.LOW: 2,
+}
+
+# Common skill keywords looked for in task labels and descriptions
+SKILL_KEYWORDS = (
+    "python",
+    "javascript",
+    "java",
+    "golang",
+    "rust",
+    "react",
+    "vue",
+    "angular",
+    "frontend",
+    "backend",
+    "database",
+    "api",
+    "devops",
+    "testing",
+    "design",
+    "documentation",
+    "security",
+    "performance",
+)
+
+
+def extract_required_skills(task: Task) -> List[str]:
+    """Extract required skills from task labels and description."""
+    skills = []
+
+    # Check labels
+    for label in task.labels:
+        label_lower = label.lower()
+        for skill in SKILL_KEYWORDS:
+            if skill in label_lower:
+                skills.append(skill)
+
+    # Check description (simple keyword matching)
+    desc_lower = task.description.lower()
+    for skill in SKILL_KEYWORDS:
+        if skill in desc_lower and skill not in skills:
+            skills.append(skill)
+
+    return skills
+
+
+def skill_mismatch_severity(unmatchable_count: int) -> IssueSeverity:
+    """Severity of a skill mismatch affecting ``unmatchable_count`` tasks."""
+    return IssueSeverity.HIGH if unmatchable_count > 3 else IssueSeverity.MEDIUM
+
+
+def bottleneck_severity(blocking_count: int) -> IssueSeverity:
+    """Severity of a bottleneck blocking ``blocking_count`` tasks."""
+    return IssueSeverity.CRITICAL if blocking_count > 5 else IssueSeverity.HIGH
+
+
+def stale_tasks_severity(stale_count: int) -> IssueSeverity:
+    """Severity of ``stale_count`` stale tasks."""
+    return IssueSeverity.HIGH if stale_count > 5 else IssueSeverity.MEDIUM
+
+
+def skill_mismatch_issue(
+    unmatchable_tasks: List[str],
+    skill_gaps: Dict[str, List[str]],
+    available_skills: Iterable[str],
+) -> HealthIssue:
+    """Build the issue for TODO tasks no agent has the skills for."""
+    return HealthIssue(
+        type=HealthIssueType.SKILL_MISMATCH,
+        severity=skill_mismatch_severity(len(unmatchable_tasks)),
+        description=(
+            f"{len(unmatchable_tasks)} tasks cannot be assigned "
+            f"due to skill mismatches"
+        ),
+        affected_tasks=list(unmatchable_tasks),
+        affected_agents=[],
+        recommendations=[
+            f"Add agent with skills: {', '.join(skill_gaps.keys())}",
+            "Consider reassigning tasks to match available skills",
+            "Update task requirements to be more flexible",
+        ],
+        details={
+            "missing_skills": dict(skill_gaps),
+            "available_skills": list(available_skills),
+        },
+    )
+
+
+def find_dependency_cycles(tasks: List[Task]) -> List[List[str]]:
+    """Find circular dependencies using DFS."""
+    # Build dependency graph
+    task_map = {t.id: t for t in tasks}
+    graph = defaultdict(list)
+
+    for task in tasks:
+        if task.dependencies:
+            for dep_id in task.dependencies:
+                graph[dep_id].append(task.id)
+
+    # Find cycles using DFS
+    visited = set()
+    rec_stack = set()
+    cycles = []
+
+    def dfs(node: str, path: List[str]) -> None:
+        visited.add(node)
+        rec_stack.add(node)
+        path.append(node)
+
+        for neighbor in graph[node]:
+            if neighbor in rec_stack:
+                # Found cycle
+                cycle_start = path.index(neighbor)
+                cycle = path[cycle_start:]
+                cycles.append(cycle)
+            elif neighbor not in visited:
+                dfs(neighbor, path.copy())
+
+        rec_stack.remove(node)
+
+    # Check each task
+    for task_id in task_map:
+        if task_id not in visited:
+            dfs(task_id, [])
+
+    return cycles
+
+
+def circular_dependency_issue(cycle: List[str]) -> HealthIssue:
+    """Build the issue for one dependency cycle."""
+    return HealthIssue(
+        type=HealthIssueType.CIRCULAR_DEPENDENCY,
+        severity=IssueSeverity.CRITICAL,
+        description=(
+            f"Circular dependency detected: "
+            f"{' -> '.join(cycle)} -> {cycle[0]}"
+        ),
+        affected_tasks=cycle,
+        affected_agents=[],
+        recommendations=[
+            "Break the circular dependency by removing one of the links",
+            "Restructure tasks to avoid mutual dependencies",
+            "Consider merging related tasks",
+        ],
+        details={"cycle": cycle, "cycle_length": len(cycle)},
+    )
+
+
+def bottleneck_issue(bottleneck: Dict[str, Any]) -> HealthIssue:
+    """
+    Build the issue for a task that blocks many others.
+
+    ``bottleneck`` holds ``task_id``, ``task_name``, ``blocking_count``,
+    ``blocked_tasks`` and ``status``.
+    """
+    return HealthIssue(
+        type=HealthIssueType.BOTTLENECK,
+        severity=bottleneck_severity(int(bottleneck["blocking_count"])),
+        description=(
+            f"Task '{bottleneck['task_name']}' blocks "
+            f"{bottleneck['blocking_count']} other tasks"
+        ),
+        affected_tasks=[str(bottleneck["task_id"])]
+        + [str(task_id) for task_id in bottleneck["blocked_tasks"]],
+        affected_agents=[],
+        recommendations=[
+            f"Prioritize completion of task {bottleneck['task_id']}",
+            "Consider breaking down the bottleneck task",
+            "Assign your best agent to this task",
+            "Review if all dependencies are necessary",
+        ],
+        details=bottleneck,
+    )
+
+
+def chain_block_issue(chain: Dict[str, Any]) -> HealthIssue:
+    """
+    Build the issue for a TODO task at the end of a long dependency chain.
+
+    ``chain`` holds ``task_id``, ``task_name`` and ``chain_length``.
+    """
+    return HealthIssue(
+        type=HealthIssueType.CHAIN_BLOCK,
+        severity=IssueSeverity.MEDIUM,
+        description=(
+            f"Task '{chain['task_name']}' has a dependency chain "
+            f"of length {chain['chain_length']}"
+        ),
+        affected_tasks=[str(chain["task_id"])],
+        affected_agents=[],
+        recommendations=[
+            "Consider parallelizing some dependencies",
+            "Review if all dependencies are truly sequential",
+            "Break down tasks to reduce chain length",
+        ],
+        details=chain,
+    )
+
+
+def stale_tasks_issue(
+    stale_tasks: List[Dict[str, Any]], stale_task_days: int
+) -> HealthIssue:
+    """
+    Build the issue for in-progress tasks that stopped moving.
+
+    Each entry of ``stale_tasks`` holds ``task_id``, ``task_name``,
+    ``assigned_to`` and ``days_stale``, most stale first.
+    """
+    return HealthIssue(
+        type=HealthIssueType.STALE_TASKS,
+        severity=stale_tasks_severity(len(stale_tasks)),
+        description=(
+            f"{len(stale_tasks)} tasks haven't progressed in over "
+            f"{stale_task_days} days"
+        ),
+        affected_tasks=[str(t["task_id"]) for t in stale_tasks],
+        affected_agents=list(
+            set(str(t["assigned_to"]) for t in stale_tasks if t["assigned_to"])
+        ),
+        recommendations=[
+            "Check in with agents on stale tasks",
+            "Consider reassigning stuck tasks",
+            "Review if tasks are blocked by external factors",
+        ],
+        details={"stale_tasks": stale_tasks},
+    )
+
+
+def overloaded_agents_issue(overloaded: List[Dict[str, Any]]) -> HealthIssue:
+    """Build the issue for agents holding more tasks than recommended."""
+    return HealthIssue(
+        type=HealthIssueType.OVERLOADED_AGENTS,
+        severity=IssueSeverity.MEDIUM,
+        description=f"{len(overloaded)} agents are overloaded with tasks",
+        affected_tasks=[],
+        affected_agents=[str(a["agent_id"]) for a in overloaded],
+        recommendations=[
+            "Redistribute tasks from overloaded agents",
+            "Add more agents to handle workload",
+            "Prioritize critical tasks for overloaded agents",
+        ],
+        details={"overloaded_agents": overloaded},
+    )
+
+
+def idle_agents_issue(idle: List[Dict[str, Any]]) -> HealthIssue:
+    """Build the issue for agents without assignments."""
+    return HealthIssue(
+        type=HealthIssueType.IDLE_AGENTS,
+        severity=IssueSeverity.LOW,
+        description=f"{len(idle)} agents are idle",
+        affected_tasks=[],
+        affected_agents=[str(a["agent_id"]) for a in idle],
+        recommendations=[
+            "Review if idle agents have skills for available tasks",
+            "Consider cross-training agents",
+            "Check for skill mismatch issues",
+        ],
+        details={"idle_agents": idle},
+    )
+
+
+def calculate_health_metrics(
+    status_counts: Mapping[str, int],
+    total_agents: int,
+    severity_counts: Mapping[IssueSeverity, int],
+) -> Dict[str, Any]:
+    """
+    Calculate the board health metrics.
+
+    Parameters
+    ----------
+    status_counts : Mapping[str, int]
+        Number of tasks per ``TaskStatus`` value.
+    total_agents : int
+        Number of registered agents.
+    severity_counts : Mapping[IssueSeverity, int]
+        Number of detected issues per severity.
+
+    Returns
+    -------
+    Dict[str, Any]
+        Task, agent and issue metrics.
+    """
+    total_tasks = sum(status_counts.values())
+    return {
+        "total_tasks": total_tasks,
+        "tasks_by_status": {k: v for k, v in status_counts.items() if v},
+        "completion_rate": (
+            status_counts.get(TaskStatus.DONE.value, 0) / total_tasks * 100
+            if total_tasks > 0
+            else 0
+        ),
+        "blocked_rate": (
+            status_counts.get(TaskStatus.BLOCKED.value, 0) / total_tasks * 100
+            if total_tasks > 0
+            else 0
+        ),
+        "total_agents": total_agents,
+        "total_issues": sum(severity_counts.values()),
+        "critical_issues": severity_counts.get(IssueSeverity.CRITICAL, 0),
+        "high_issues": severity_counts.get(IssueSeverity.HIGH, 0),
+    }
+
+
+def generate_overall_recommendations(
+    issues: List[HealthIssue], metrics: Dict[str, Any]
+) -> List[str]:
+    """Generate high-level recommendations based on analysis."""
+    recommendations = []
+
+    # Check for critical issues
+    critical_issues = [i for i in issues if i.severity == IssueSeverity.CRITICAL]
+    if critical_issues:
+        recommendations.append(
+            "🚨 Address critical issues immediately to unblock progress"
+        )
+
+    # Check completion rate
+    if metrics.get("completion_rate", 0) < 20:
+        recommendations.append(
+            "📈 Focus on completing in-progress tasks before starting new ones"
+        )
+
+    # Check blocked rate
+    if metrics.get("blocked_rate", 0) > 20:
+        recommendations.append(
+            "🚧 High number of blocked tasks - review and resolve blockers"
+        )
+
+    # Check for specific issue types
+    issue_types = {i.type for i in issues}
+
+    if HealthIssueType.SKILL_MISMATCH in issue_types:
+        recommendations.append("🎯 Consider hiring or training for missing skills")
+
+    if HealthIssueType.BOTTLENECK in issue_types:
+        recommendations.append("🔧 Prioritize bottleneck tasks to unblock dependencies")
+
+    if HealthIssueType.OVERLOADED_AGENTS in issue_types:
+        recommendations.append("⚖️ Rebalance workload across agents")
+
+    return recommendations
+
+
+def calculate_health_score(
+    severity_counts: Mapping[IssueSeverity, int], metrics: Dict[str, Any]
+) -> float:
+    """Calculate overall health score (0-100)."""
+    score = 100.0
+
+    # Deduct points for issues based on severity
+    for severity, count in severity_counts.items():
+        score -= SEVERITY_PENALTIES[severity] * count
+
+    # Factor in completion rate
+    completion_rate = metrics.get("completion_rate", 0)
+    if completion_rate < 10:
+        score -= 10
+    elif completion_rate < 30:
+        score -= 5
+
+    # Factor in blocked rate
+    blocked_rate = metrics.get("blocked_rate", 0)
+    if blocked_rate > 30:
+        score -= 10
+    elif blocked_rate > 15:
+        score -= 5
+
+    # Ensure score stays in bounds
+    return max(0, min(100, score))
+
+
 class BoardHealthAnalyzer:
     """Analyzes board-level health and detects various types of deadlocks."""
 
@@ -195,32 +588,11 @@ class BoardHealthAnalyzer:
                         skill_gaps[skill].append(task.id)
 
         if unmatchable_tasks:
-            severity = (
-                IssueSeverity.HIGH
-                if len(unmatchable_tasks) > 3
-                else IssueSeverity.MEDIUM
-            )
-
-            issue = HealthIssue(
-                type=HealthIssueType.SKILL_MISMATCH,
-                severity=severity,
-                description=(
-                    f"{len(unmatchable_tasks)} tasks cannot be assigned "
-                    f"due to skill mismatches"
-                ),
-                affected_tasks=[t.id for t in unmatchable_tasks],
-                affected_agents=[],
-                recommendations=[
-                    f"Add agent with skills: {', '.join(skill_gaps.keys())}",
-                    "Consider reassigning tasks to match available skills",
-                    "Update task requirements to be more flexible",
-                ],
-                details={
-                    "missing_skills": dict(skill_gaps),
-                    "available_skills": list(available_skills),
-                },
+            issues.append(
+                skill_mismatch_issue(
+                    [t.id for t in unmatchable_tasks], skill_gaps, available_skills
+                )
             )
-            issues.append(issue)
 
         return issues
 
@@ -228,64 +600,7 @@ class BoardHealthAnalyzer:
         self, tasks: List[Task]
     ) -> List[HealthIssue]:
         """Detect circular dependencies using DFS."""
-        issues = []
-
-        # Build dependency graph
-        task_map = {t.id: t for t in tasks}
-        graph = defaultdict(list)
-
-        for task in tasks:
-            if task.dependencies:
-                for dep_id in task.dependencies:
-                    graph[dep_id].append(task.id)
-
-        # Find cycles using DFS
-        visited = set()
-        rec_stack = set()
-        cycles = []
-
-        def dfs(node: str, path: List[str]) -> None:
-            visited.add(node)
-            rec_stack.add(node)
-            path.append(node)
-
-            for neighbor in graph[node]:
-                if neighbor in rec_stack:
-                    # Found cycle
-                    cycle_start = path.index(neighbor)
-                    cycle = path[cycle_start:]
-                    cycles.append(cycle)
-                elif neighbor not in visited:
-                    dfs(neighbor, path.copy())
-
-            rec_stack.remove(node)
-
-        # Check each task
-        for task_id in task_map:
-            if task_id not in visited:
-                dfs(task_id, [])
-
-        # Create issues for cycles
-        for cycle in cycles:
-            issue = HealthIssue(
-                type=HealthIssueType.CIRCULAR_DEPENDENCY,
-                severity=IssueSeverity.CRITICAL,
-                description=(
-                    f"Circular dependency detected: "
-                    f"{' -> '.join(cycle)} -> {cycle[0]}"
-                ),
-                affected_tasks=cycle,
-                affected_agents=[],
-                recommendations=[
-                    "Break the circular dependency by removing one of the links",
-                    "Restructure tasks to avoid mutual dependencies",
-                    "Consider merging related tasks",
-                ],
-                details={"cycle": cycle, "cycle_length": len(cycle)},
-            )
-            issues.append(issue)
-
-        return issues
+        return [circular_dependency_issue(c) for c in find_dependency_cycles(tasks)]
 
     async def _detect_bottlenecks(self, tasks: List[Task]) -> List[HealthIssue]:
         """Detect tasks that block many others."""
@@ -302,11 +617,10 @@ class BoardHealthAnalyzer:
                     blocked_by[dep_id].append(task.id)
 
         # Find tasks blocking more than threshold
-        bottleneck_threshold = 3
         bottlenecks: List[Dict[str, Any]] = []
 
         for task_id, count in blocking_count.items():
-            if count >= bottleneck_threshold:
+            if count >= BOTTLENECK_THRESHOLD:
                 task = next((t for t in tasks if t.id == task_id), None)  # type: ignore
                 if task and task.status != TaskStatus.DONE:
                     bottlenecks.append(
@@ -322,33 +636,7 @@ class BoardHealthAnalyzer:
         if bottlenecks:
             # Sort by blocking count
             bottlenecks.sort(key=lambda x: int(x["blocking_count"]), reverse=True)
-
-            for bottleneck in bottlenecks:
-                severity = (
-                    IssueSeverity.CRITICAL
-                    if int(bottleneck["blocking_count"]) > 5
-                    else IssueSeverity.HIGH
-                )
-
-                issue = HealthIssue(
-                    type=HealthIssueType.BOTTLENECK,
-                    severity=severity,
-                    description=(
-                        f"Task '{bottleneck['task_name']}' blocks "
-                        f"{bottleneck['blocking_count']} other tasks"
-                    ),
-                    affected_tasks=[str(bottleneck["task_id"])]
-                    + [str(task_id) for task_id in bottleneck["blocked_tasks"]],
-                    affected_agents=[],
-                    recommendations=[
-                        f"Prioritize completion of task {bottleneck['task_id']}",
-                        "Consider breaking down the bottleneck task",
-                        "Assign your best agent to this task",
-                        "Review if all dependencies are necessary",
-                    ],
-                    details=bottleneck,
-                )
-                issues.append(issue)
+            issues.extend(bottleneck_issue(b) for b in bottlenecks)
 
         return issues
 
@@ -357,31 +645,14 @@ class BoardHealthAnalyzer:
     ) -> List[HealthIssue]:
         """Detect long dependency chains that might cause delays."""
         issues = []
-        task_map = {t.id: t for t in tasks}
-
-        # Find longest chains
-        def find_chain_length(task_id: str, visited: Set[str]) -> int:
-            if task_id in visited:
-                return 0
-            visited.add(task_id)
-
-            task = task_map.get(task_id)
-            if not task or not task.dependencies:
-                return 1
-
-            max_length = 0
-            for dep_id in task.dependencies:
-                length = find_chain_length(dep_id, visited.copy())
-                max_length = max(max_length, length)
-
-            return max_length + 1
+        graph = DependencyGraph(tasks)
 
         # Check each task
         long_chains: List[Dict[str, Any]] = []
         for task in tasks:
             if task.status == TaskStatus.TODO:
-                chain_length = find_chain_length(task.id, set())
-                if chain_length > 3:  # Chains longer than 3 are concerning
+                chain_length = graph.chain_length(task.id)
+                if chain_length > CHAIN_LENGTH_THRESHOLD:
                     long_chains.append(
                         {
                             "task_id": task.id,
@@ -393,24 +664,9 @@ class BoardHealthAnalyzer:
         if long_chains:
             long_chains.sort(key=lambda x: x["chain_length"], reverse=True)
 
-            for chain in long_chains[:3]:  # Report top 3 longest chains
-                issue = HealthIssue(
-                    type=HealthIssueType.CHAIN_BLOCK,
-                    severity=IssueSeverity.MEDIUM,
-                    description=(
-                        f"Task '{chain['task_name']}' has a dependency chain "
-                        f"of length {chain['chain_length']}"
-                    ),
-                    affected_tasks=[str(chain["task_id"])],
-                    affected_agents=[],
-                    recommendations=[
-                        "Consider parallelizing some dependencies",
-                        "Review if all dependencies are truly sequential",
-                        "Break down tasks to reduce chain length",
-                    ],
-                    details=chain,
-                )
-                issues.append(issue)
+            issues.extend(
+                chain_block_issue(chain) for chain in long_chains[:MAX_CHAIN_ISSUES]
+            )
 
         return issues
 
@@ -446,27 +702,7 @@ class BoardHealthAnalyzer:
                 reverse=True,
             )
 
-            issue = HealthIssue(
-                type=HealthIssueType.STALE_TASKS,
-                severity=(
-                    IssueSeverity.HIGH if len(stale_tasks) > 5 else IssueSeverity.MEDIUM
-                ),
-                description=(
-                    f"{len(stale_tasks)} tasks haven't progressed in over "
-                    f"{self.stale_task_days} days"
-                ),
-                affected_tasks=[str(t["task_id"]) for t in stale_tasks],
-                affected_agents=list(
-                    set(str(t["assigned_to"]) for t in stale_tasks if t["assigned_to"])
-                ),
-                recommendations=[
-                    "Check in with agents on stale tasks",
-                    "Consider reassigning stuck tasks",
-                    "Review if tasks are blocked by external factors",
-                ],
-                details={"stale_tasks": stale_tasks},
-            )
-            issues.append(issue)
+            issues.append(stale_tasks_issue(stale_tasks, self.stale_task_days))
 
         return issues
 
@@ -506,79 +742,16 @@ class BoardHealthAnalyzer:
                 )
 
         if overloaded:
-            issue = HealthIssue(
-                type=HealthIssueType.OVERLOADED_AGENTS,
-                severity=IssueSeverity.MEDIUM,
-                description=f"{len(overloaded)} agents are overloaded with tasks",
-                affected_tasks=[],
-                affected_agents=[str(a["agent_id"]) for a in overloaded],
-                recommendations=[
-                    "Redistribute tasks from overloaded agents",
-                    "Add more agents to handle workload",
-                    "Prioritize critical tasks for overloaded agents",
-                ],
-                details={"overloaded_agents": overloaded},
-            )
-            issues.append(issue)
-
-        if idle and len(idle) > len(agents) * 0.3:  # More than 30% idle
-            issue = HealthIssue(
-                type=HealthIssueType.IDLE_AGENTS,
-                severity=IssueSeverity.LOW,
-                description=f"{len(idle)} agents are idle",
-                affected_tasks=[],
-                affected_agents=[str(a["agent_id"]) for a in idle],
-                recommendations=[
-                    "Review if idle agents have skills for available tasks",
-                    "Consider cross-training agents",
-                    "Check for skill mismatch issues",
-                ],
-                details={"idle_agents": idle},
-            )
-            issues.append(issue)
+            issues.append(overloaded_agents_issue(overloaded))
+
+        if idle and len(idle) > len(agents) * IDLE_AGENT_RATIO:
+            issues.append(idle_agents_issue(idle))
 
         return issues
 
     def _extract_required_skills(self, task: Task) -> List[str]:
         """Extract required skills from task labels and description."""
-        skills = []
-
-        # Common skill keywords
-        skill_keywords = {
-            "python",
-            "javascript",
-            "java",
-            "golang",
-            "rust",
-            "react",
-            "vue",
-            "angular",
-            "frontend",
-            "backend",
-            "database",
-            "api",
-            "devops",
-            "testing",
-            "design",
-            "documentation",
-            "security",
-            "performance",
-        }
-
-        # Check labels
-        for label in task.labels:
-            label_lower = label.lower()
-            for skill in skill_keywords:
-                if skill in label_lower:
-                    skills.append(skill)
-
-        # Check description (simple keyword matching)
-        desc_lower = task.description.lower()
-        for skill in skill_keywords:
-            if skill in desc_lower and skill not in skills:
-                skills.append(skill)
-
-        return skills
+        return extract_required_skills(task)
 
     def _calculate_health_metrics(
         self,
@@ -587,104 +760,19 @@ class BoardHealthAnalyzer:
         issues: List[HealthIssue],
     ) -> Dict[str, Any]:
         """Calculate various health metrics."""
-        total_tasks = len(tasks)
-
-        status_counts: defaultdict[str, int] = defaultdict(int)
-        for task in tasks:
-            status_counts[task.status.value] += 1
-
-        return {
-            "total_tasks": total_tasks,
-            "tasks_by_status": dict(status_counts),
-            "completion_rate": (
-                status_counts[TaskStatus.DONE.value] / total_tasks * 100
-                if total_tasks > 0
-                else 0
-            ),
-            "blocked_rate": (
-                status_counts[TaskStatus.BLOCKED.value] / total_tasks * 100
-                if total_tasks > 0
-                else 0
-            ),
-            "total_agents": len(agents),
-            "total_issues": len(issues),
-            "critical_issues": len(
-                [i for i in issues if i.severity == IssueSeverity.CRITICAL]
-            ),
-            "high_issues": len([i for i in issues if i.severity == IssueSeverity.HIGH]),
-        }
+        status_counts = Counter(task.status.value for task in tasks)
+        return calculate_health_metrics(
+            status_counts, len(agents), Counter(i.severity for i in issues)
+        )
 
     def _generate_overall_recommendations(
         self, issues: List[HealthIssue], metrics: Dict[str, Any]
     ) -> List[str]:
         """Generate high-level recommendations based on analysis."""
-        recommendations = []
-
-        # Check for critical issues
-        critical_issues = [i for i in issues if i.severity == IssueSeverity.CRITICAL]
-        if critical_issues:
-            recommendations.append(
-                "🚨 Address critical issues immediately to unblock progress"
-            )
-
-        # Check completion rate
-        if metrics.get("completion_rate", 0) < 20:
-            recommendations.append(
-                "📈 Focus on completing in-progress tasks before starting new ones"
-            )
-
-        # Check blocked rate
-        if metrics.get("blocked_rate", 0) > 20:
-            recommendations.append(
-                "🚧 High number of blocked tasks - review and resolve blockers"
-            )
-
-        # Check for specific issue types
-        issue_types = {i.type for i in issues}
-
-        if HealthIssueType.SKILL_MISMATCH in issue_types:
-            recommendations.append("🎯 Consider hiring or training for missing skills")
-
-        if HealthIssueType.BOTTLENECK in issue_types:
-            recommendations.append(
-                "🔧 Prioritize bottleneck tasks to unblock dependencies"
-            )
-
-        if HealthIssueType.OVERLOADED_AGENTS in issue_types:
-            recommendations.append("⚖️ Rebalance workload across agents")
-
-        return recommendations
+        return generate_overall_recommendations(issues, metrics)
 
     def _calculate_health_score(
         self, issues: List[HealthIssue], metrics: Dict[str, Any]
     ) -> float:
         """Calculate overall health score (0-100)."""
-        score = 100.0
-
-        # Deduct points for issues based on severity
-        severity_penalties = {
-            IssueSeverity.CRITICAL: 20,
-            IssueSeverity.HIGH: 10,
-            IssueSeverity.MEDIUM: 5,
-            IssueSeverity.LOW: 2,
-        }
-
-        for issue in issues:
-            score -= severity_penalties[issue.severity]
-
-        # Factor in completion rate
-        completion_rate = metrics.get("completion_rate", 0)
-        if completion_rate < 10:
-            score -= 10
-        elif completion_rate < 30:
-            score -= 5
-
-        # Factor in blocked rate
-        blocked_rate = metrics.get("blocked_rate", 0)
-        if blocked_rate > 30:
-            score -= 10
-        elif blocked_rate > 15:
-            score -= 5
-
-        # Ensure score stays in bounds
-        return max(0, min(100, score))
+        return calculate_health_score(Counter(i.severity for i in issues), metrics)
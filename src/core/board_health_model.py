@@ -0,0 +1,722 @@
+"""
+Incrementally maintained board health.
+
+:class:`~src.core.board_health_analyzer.BoardHealthAnalyzer` fetches the
+whole board and re-runs every check on each call, so a health poll costs
+O(board) even when nothing changed. :class:`BoardHealthModel` keeps the
+state each check depends on and updates it from task changes (the
+:class:`~src.core.board_snapshot.BoardSnapshotService` change feed) and
+agent/assignment syncs:
+
+- skill mismatches: TODO tasks per required skill, and how many agents
+  have each skill; a task is re-checked when it changes, or when the
+  last agent with one of its skills leaves or the first one arrives;
+- bottlenecks: a dependents index, re-evaluated only for the
+  dependencies a change touched;
+- stale tasks: a deadline heap of in-progress tasks, advanced on read;
+- agent workload: assignment counts per agent;
+- circular dependencies and chain blocks: recomputed with
+  :class:`~src.core.dependency_graph.DependencyGraph` only when the
+  dependency structure changes, which is rare once a project exists.
+
+Each check's issue severities are kept as counts, so
+:attr:`BoardHealthModel.health_score` is O(1) (amortized over the stale
+heap); the full :meth:`BoardHealthModel.report` builds issues only for
+checks whose state changed since the last report. Scores and issues
+match those of the analyzer for the same board.
+"""
+
+import heapq
+import itertools
+import logging
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from src.core.board_health_analyzer import (
+    BOTTLENECK_THRESHOLD,
+    CHAIN_LENGTH_THRESHOLD,
+    IDLE_AGENT_RATIO,
+    MAX_CHAIN_ISSUES,
+    BoardHealth,
+    HealthIssue,
+    HealthIssueType,
+    IssueSeverity,
+    bottleneck_issue,
+    bottleneck_severity,
+    calculate_health_metrics,
+    calculate_health_score,
+    chain_block_issue,
+    circular_dependency_issue,
+    extract_required_skills,
+    find_dependency_cycles,
+    generate_overall_recommendations,
+    idle_agents_issue,
+    overloaded_agents_issue,
+    skill_mismatch_issue,
+    skill_mismatch_severity,
+    stale_tasks_issue,
+    stale_tasks_severity,
+)
+from src.core.board_snapshot import (
+    TASK_DELETED,
+    BoardChange,
+    BoardSnapshot,
+    BoardSnapshotService,
+)
+from src.core.dependency_graph import DependencyGraph
+from src.core.metrics import get_metrics
+from src.core.models import Task, TaskStatus, WorkerStatus
+
+logger = logging.getLogger(__name__)
+
+# Checks in the order the analyzer reports their issues
+_CHECK_ORDER = (
+    HealthIssueType.SKILL_MISMATCH,
+    HealthIssueType.CIRCULAR_DEPENDENCY,
+    HealthIssueType.BOTTLENECK,
+    HealthIssueType.CHAIN_BLOCK,
+    HealthIssueType.STALE_TASKS,
+    HealthIssueType.OVERLOADED_AGENTS,
+    HealthIssueType.IDLE_AGENTS,
+)
+_WORKLOAD_CHECKS = (HealthIssueType.OVERLOADED_AGENTS, HealthIssueType.IDLE_AGENTS)
+
+
+def _aware(value: datetime) -> datetime:
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+@dataclass
+class _TaskEntry:
+    task: Task
+    position: int
+    dependencies: Tuple[str, ...]
+    text: Tuple[Tuple[str, ...], str]
+    required_skills: Tuple[str, ...]
+
+
+@dataclass
+class _AgentEntry:
+    name: str
+    skills: Tuple[str, ...]
+    assignments: int
+
+
+class BoardHealthModel:
+    """
+    Board health kept current from change events.
+
+    Parameters
+    ----------
+    stale_task_days : int
+        Days without an update before an in-progress task is stale.
+    max_tasks_per_agent : int
+        Assignments above which an agent is overloaded.
+    clock : Callable[[], datetime]
+        Current UTC time; injectable for tests.
+
+    Examples
+    --------
+    >>> model = BoardHealthModel()
+    >>> model.attach(get_board_snapshot(kanban_client))
+    >>> model.sync_agents(state.agent_status, assignments)
+    >>> model.health_score  # O(1)
+    """
+
+    def __init__(
+        self,
+        stale_task_days: int = 7,
+        max_tasks_per_agent: int = 3,
+        clock: Callable[[], datetime] = lambda: datetime.now(timezone.utc),
+    ) -> None:
+        self.stale_task_days = stale_task_days
+        self.max_tasks_per_agent = max_tasks_per_agent
+        self._clock = clock
+        self._positions = itertools.count()
+        self._tasks: Dict[str, _TaskEntry] = {}
+        self._status_counts: Counter[str] = Counter()
+
+        # Skill mismatches
+        self._skill_holders: Counter[str] = Counter()
+        self._todo_by_skill: Dict[str, Set[str]] = {}
+        self._unmatchable: Set[str] = set()
+
+        # Bottlenecks
+        self._dependents: Dict[str, Dict[str, None]] = {}
+        self._bottlenecks: Dict[str, IssueSeverity] = {}
+        self._bottleneck_severities: Counter[IssueSeverity] = Counter()
+
+        # Cycles and chains, rebuilt when the dependency structure changes
+        self._structure_dirty = False
+        self._cycles: List[List[str]] = []
+        self._chain_lengths: Dict[str, int] = {}
+        self._long_chain_todo: Set[str] = set()
+
+        # Staleness: (deadline, seq, task_id, updated_at) per in-progress task
+        self._stale_heap: List[Tuple[datetime, int, str, datetime]] = []
+        self._stale_seq = itertools.count()
+        self._stale: Set[str] = set()
+        self._in_progress = 0
+
+        # Agent workload
+        self._agents: Dict[str, _AgentEntry] = {}
+        self._overloaded: Set[str] = set()
+        self._idle: Set[str] = set()
+
+        self._issue_cache: Dict[HealthIssueType, List[HealthIssue]] = {}
+        self._unsubscribe: Optional[Callable[[], None]] = None
+        self._bootstrapped = False
+
+    # ------------------------------------------------------------------
+    # Feeding the model
+
+    def attach(self, service: BoardSnapshotService) -> None:
+        """
+        Follow a board snapshot service's change feed.
+
+        The current snapshot, if any, is loaded immediately. The first
+        delivery after subscribing is the whole board, which is synced
+        (only tasks that differ are reprocessed); later deliveries are
+        applied as changes.
+        """
+        self.detach()
+        if service.snapshot is not None:
+            self.sync_tasks(service.snapshot.tasks)
+        self._bootstrapped = False
+        self._unsubscribe = service.subscribe(self.on_board_changes)
+
+    def detach(self) -> None:
+        """Stop following the change feed set up by :meth:`attach`."""
+        if self._unsubscribe is not None:
+            self._unsubscribe()
+            self._unsubscribe = None
+
+    def on_board_changes(
+        self, changes: List[BoardChange], snapshot: BoardSnapshot
+    ) -> None:
+        """Board change subscriber; see :meth:`BoardSnapshotService.subscribe`."""
+        if not self._bootstrapped:
+            self._bootstrapped = True
+            self.sync_tasks(snapshot.tasks)
+        elif changes:
+            self.apply_changes(changes)
+        else:
+            return
+        get_metrics().set_gauge("marcus_board_health_score", self.health_score)
+
+    def apply_changes(self, changes: Iterable[BoardChange]) -> None:
+        """
+        Update the checks for changed, created and deleted tasks.
+
+        Parameters
+        ----------
+        changes : Iterable[BoardChange]
+            Changes from the board change feed. ``created`` changes for
+            tasks already known are treated as updates.
+        """
+        for change in changes:
+            if change.kind == TASK_DELETED or change.task is None:
+                self._remove_task(change.task_id)
+            else:
+                self._upsert_task(change.task)
+        self._rebuild_structure()
+
+    def sync_tasks(self, tasks: Iterable[Task]) -> None:
+        """
+        Make the model reflect exactly ``tasks``.
+
+        Only tasks that are new, gone or different are reprocessed.
+        """
+        seen = set()
+        for task in tasks:
+            seen.add(task.id)
+            self._upsert_task(task)
+        for task_id in [t for t in self._tasks if t not in seen]:
+            self._remove_task(task_id)
+        self._rebuild_structure()
+
+    def sync_agents(
+        self,
+        agents: Mapping[str, WorkerStatus],
+        active_assignments: Mapping[str, Any],
+    ) -> None:
+        """
+        Update agent skills and workload.
+
+        Parameters
+        ----------
+        agents : Mapping[str, WorkerStatus]
+            Registered agents by ID.
+        active_assignments : Mapping[str, Any]
+            Current assignment per agent ID (a task ID, or a list of them).
+            Only agents whose skills or assignment count changed are
+            reprocessed.
+        """
+        for agent_id in [a for a in self._agents if a not in agents]:
+            self._set_agent(agent_id, None)
+        for agent_id, agent in agents.items():
+            assigned = active_assignments.get(agent_id)
+            if assigned is None:
+                count = 0
+            elif isinstance(assigned, (list, tuple, set)):
+                count = len(assigned)
+            else:
+                count = 1
+            self._set_agent(
+                agent_id, _AgentEntry(agent.name, tuple(agent.skills), count)
+            )
+        if self._unsubscribe is not None:
+            get_metrics().set_gauge("marcus_board_health_score", self.health_score)
+
+    def configure(
+        self,
+        stale_task_days: Optional[int] = None,
+        max_tasks_per_agent: Optional[int] = None,
+    ) -> None:
+        """Change thresholds; checks depending on them are recomputed."""
+        if stale_task_days is not None and stale_task_days != self.stale_task_days:
+            self.stale_task_days = stale_task_days
+            self._stale.clear()
+            self._stale_heap = []
+            for entry in self._tasks.values():
+                if entry.task.status == TaskStatus.IN_PROGRESS:
+                    self._push_stale(entry.task)
+        if (
+            max_tasks_per_agent is not None
+            and max_tasks_per_agent != self.max_tasks_per_agent
+        ):
+            self.max_tasks_per_agent = max_tasks_per_agent
+            for agent_id, entry in list(self._agents.items()):
+                self._classify_agent(agent_id, entry)
+
+    # ------------------------------------------------------------------
+    # Reading
+
+    @property
+    def metrics(self) -> Dict[str, Any]:
+        """Task, agent and issue metrics, as the analyzer reports them."""
+        self._advance_stale()
+        return calculate_health_metrics(
+            self._status_counts, len(self._agents), self._severity_counts()
+        )
+
+    @property
+    def health_score(self) -> float:
+        """Current health score (0-100), without building any issues."""
+        metrics = self.metrics
+        return calculate_health_score(self._severity_counts(), metrics)
+
+    def report(self) -> BoardHealth:
+        """
+        Full health assessment with issues and recommendations.
+
+        Issues of checks whose state did not change since the previous
+        report are reused.
+        """
+        metrics = self.metrics
+        issues: List[HealthIssue] = []
+        for check in _CHECK_ORDER:
+            if check == HealthIssueType.STALE_TASKS:
+                # Stale ages move with the clock, so this one is not cached
+                issues.extend(self._build_issues(check))
+                continue
+            if check not in self._issue_cache:
+                self._issue_cache[check] = self._build_issues(check)
+            issues.extend(self._issue_cache[check])
+
+        return BoardHealth(
+            health_score=calculate_health_score(self._severity_counts(), metrics),
+            issues=issues,
+            metrics=metrics,
+            recommendations=generate_overall_recommendations(issues, metrics),
+            timestamp=self._clock(),
+        )
+
+    # ------------------------------------------------------------------
+    # Task updates
+
+    def _invalidate(self, *checks: HealthIssueType) -> None:
+        for check in checks:
+            self._issue_cache.pop(check, None)
+
+    def _upsert_task(self, task: Task) -> None:
+        old = self._tasks.get(task.id)
+        if old is not None and old.task == task:
+            old.task = task
+            return
+
+        text = (tuple(task.labels), task.description)
+        if old is not None and old.text == text:
+            skills = old.required_skills
+        else:
+            skills = tuple(extract_required_skills(task))
+        dependencies = tuple(dict.fromkeys(task.dependencies or ()))
+        entry = _TaskEntry(
+            task=task,
+            position=old.position if old is not None else next(self._positions),
+            dependencies=dependencies,
+            text=text,
+            required_skills=skills,
+        )
+        self._tasks[task.id] = entry
+        old_task = old.task if old is not None else None
+
+        if old_task is not None:
+            self._status_counts[old_task.status.value] -= 1
+        self._status_counts[task.status.value] += 1
+
+        self._update_dependencies(
+            task.id, old.dependencies if old is not None else (), dependencies
+        )
+        if old is None and task.id in self._dependents:
+            # Tasks already referred to this ID
+            self._structure_dirty = True
+        self._update_skills(task.id, old, entry)
+        self._evaluate_bottleneck(task.id)
+        self._update_chain_membership(task)
+        self._update_staleness(old_task, task)
+        if (
+            old_task is not None
+            and old_task.name != task.name
+            and task.id in self._long_chain_todo
+        ):
+            self._invalidate(HealthIssueType.CHAIN_BLOCK)
+
+    def _remove_task(self, task_id: str) -> None:
+        entry = self._tasks.pop(task_id, None)
+        if entry is None:
+            return
+        self._status_counts[entry.task.status.value] -= 1
+        self._update_dependencies(task_id, entry.dependencies, ())
+        if task_id in self._dependents:
+            self._structure_dirty = True
+        self._update_skills(task_id, entry, None)
+        self._evaluate_bottleneck(task_id)
+        if task_id in self._long_chain_todo:
+            self._long_chain_todo.discard(task_id)
+            self._invalidate(HealthIssueType.CHAIN_BLOCK)
+        self._update_staleness(entry.task, None)
+
+    def _update_dependencies(
+        self, task_id: str, old: Tuple[str, ...], new: Tuple[str, ...]
+    ) -> None:
+        if old == new:
+            return
+        self._structure_dirty = True
+        for dependency in set(old) - set(new):
+            dependents = self._dependents.get(dependency)
+            if dependents is not None:
+                dependents.pop(task_id, None)
+                if not dependents:
+                    del self._dependents[dependency]
+            self._evaluate_bottleneck(dependency)
+        for dependency in new:
+            if dependency not in old:
+                self._dependents.setdefault(dependency, {})[task_id] = None
+                self._evaluate_bottleneck(dependency)
+
+    def _evaluate_bottleneck(self, task_id: str) -> None:
+        entry = self._tasks.get(task_id)
+        count = len(self._dependents.get(task_id, ()))
+        severity = None
+        if (
+            entry is not None
+            and entry.task.status != TaskStatus.DONE
+            and count >= BOTTLENECK_THRESHOLD
+        ):
+            severity = bottleneck_severity(count)
+        previous = self._bottlenecks.pop(task_id, None)
+        if previous is not None:
+            self._bottleneck_severities[previous] -= 1
+        if severity is not None:
+            self._bottlenecks[task_id] = severity
+            self._bottleneck_severities[severity] += 1
+        if previous is not None or severity is not None:
+            self._invalidate(HealthIssueType.BOTTLENECK)
+
+    # Skill mismatches
+
+    def _update_skills(
+        self, task_id: str, old: Optional[_TaskEntry], new: Optional[_TaskEntry]
+    ) -> None:
+        was_todo = old is not None and old.task.status == TaskStatus.TODO
+        is_todo = new is not None and new.task.status == TaskStatus.TODO
+        old_skills = old.required_skills if was_todo and old is not None else ()
+        new_skills = new.required_skills if is_todo and new is not None else ()
+        if old_skills != new_skills:
+            for skill in old_skills:
+                holders = self._todo_by_skill.get(skill)
+                if holders is not None:
+                    holders.discard(task_id)
+                    if not holders:
+                        del self._todo_by_skill[skill]
+            for skill in new_skills:
+                self._todo_by_skill.setdefault(skill, set()).add(task_id)
+        self._match_task(task_id)
+
+    def _match_task(self, task_id: str) -> None:
+        entry = self._tasks.get(task_id)
+        unmatchable = (
+            entry is not None
+            and entry.task.status == TaskStatus.TODO
+            and bool(entry.required_skills)
+            and not any(self._skill_holders[s] for s in entry.required_skills)
+        )
+        if unmatchable and task_id not in self._unmatchable:
+            self._unmatchable.add(task_id)
+        elif not unmatchable and task_id in self._unmatchable:
+            self._unmatchable.discard(task_id)
+        elif not unmatchable:
+            return
+        self._invalidate(HealthIssueType.SKILL_MISMATCH)
+
+    # Chains and cycles
+
+    def _update_chain_membership(self, task: Task) -> None:
+        long_todo = (
+            task.status == TaskStatus.TODO
+            and self._chain_lengths.get(task.id, 0) > CHAIN_LENGTH_THRESHOLD
+        )
+        if long_todo != (task.id in self._long_chain_todo):
+            if long_todo:
+                self._long_chain_todo.add(task.id)
+            else:
+                self._long_chain_todo.discard(task.id)
+            self._invalidate(HealthIssueType.CHAIN_BLOCK)
+
+    def _rebuild_structure(self) -> None:
+        if not self._structure_dirty:
+            return
+        self._structure_dirty = False
+        tasks = [entry.task for entry in self._ordered(self._tasks)]
+        self._cycles = find_dependency_cycles(tasks)
+        graph = DependencyGraph(tasks)
+        self._chain_lengths = {}
+        self._long_chain_todo = set()
+        for task in tasks:
+            length = graph.chain_length(task.id)
+            if length > CHAIN_LENGTH_THRESHOLD:
+                self._chain_lengths[task.id] = length
+                if task.status == TaskStatus.TODO:
+                    self._long_chain_todo.add(task.id)
+        self._invalidate(
+            HealthIssueType.CIRCULAR_DEPENDENCY, HealthIssueType.CHAIN_BLOCK
+        )
+
+    # Staleness
+
+    def _update_staleness(self, old: Optional[Task], new: Optional[Task]) -> None:
+        if (
+            old is not None
+            and new is not None
+            and old.status == new.status
+            and old.updated_at == new.updated_at
+        ):
+            return
+        if old is not None and old.status == TaskStatus.IN_PROGRESS:
+            self._in_progress -= 1
+            self._stale.discard(old.id)
+        if new is not None and new.status == TaskStatus.IN_PROGRESS:
+            self._in_progress += 1
+            self._push_stale(new)
+        if len(self._stale_heap) > 2 * self._in_progress + 64:
+            # Drop entries for tasks that moved on
+            self._stale_heap = [e for e in self._stale_heap if self._live(e)]
+            heapq.heapify(self._stale_heap)
+
+    def _push_stale(self, task: Task) -> None:
+        updated_at = _aware(task.updated_at)
+        deadline = updated_at + timedelta(days=self.stale_task_days)
+        heapq.heappush(
+            self._stale_heap, (deadline, next(self._stale_seq), task.id, updated_at)
+        )
+
+    def _live(self, item: Tuple[datetime, int, str, datetime]) -> bool:
+        entry = self._tasks.get(item[2])
+        return (
+            entry is not None
+            and entry.task.status == TaskStatus.IN_PROGRESS
+            and _aware(entry.task.updated_at) == item[3]
+        )
+
+    def _advance_stale(self) -> None:
+        now = self._clock()
+        heap = self._stale_heap
+        while heap and heap[0][0] < now:
+            item = heapq.heappop(heap)
+            if self._live(item):
+                self._stale.add(item[2])
+
+    # Agents
+
+    def _set_agent(self, agent_id: str, entry: Optional[_AgentEntry]) -> None:
+        old = self._agents.get(agent_id)
+        if old == entry:
+            return
+        old_skills = set(old.skills) if old is not None else set()
+        new_skills = set(entry.skills) if entry is not None else set()
+        for skill in old_skills - new_skills:
+            self._skill_holders[skill] -= 1
+            if not self._skill_holders[skill]:
+                del self._skill_holders[skill]
+                self._rematch_skill(skill)
+        for skill in new_skills - old_skills:
+            self._skill_holders[skill] += 1
+            if self._skill_holders[skill] == 1:
+                self._rematch_skill(skill)
+        if old_skills != new_skills:
+            # The issue lists the skills available across agents
+            self._invalidate(HealthIssueType.SKILL_MISMATCH)
+
+        if entry is None:
+            del self._agents[agent_id]
+            self._overloaded.discard(agent_id)
+            self._idle.discard(agent_id)
+        else:
+            self._agents[agent_id] = entry
+            self._classify_agent(agent_id, entry)
+        self._invalidate(*_WORKLOAD_CHECKS)
+
+    def _rematch_skill(self, skill: str) -> None:
+        for task_id in list(self._todo_by_skill.get(skill, ())):
+            self._match_task(task_id)
+
+    def _classify_agent(self, agent_id: str, entry: _AgentEntry) -> None:
+        self._overloaded.discard(agent_id)
+        self._idle.discard(agent_id)
+        if entry.assignments > self.max_tasks_per_agent:
+            self._overloaded.add(agent_id)
+        elif entry.assignments == 0:
+            self._idle.add(agent_id)
+        self._invalidate(*_WORKLOAD_CHECKS)
+
+    # ------------------------------------------------------------------
+    # Issues
+
+    def _idle_reported(self) -> bool:
+        return bool(self._idle) and len(self._idle) > len(self._agents) * (
+            IDLE_AGENT_RATIO
+        )
+
+    def _severity_counts(self) -> Counter[IssueSeverity]:
+        counts: Counter[IssueSeverity] = Counter(self._bottleneck_severities)
+        if self._unmatchable:
+            counts[skill_mismatch_severity(len(self._unmatchable))] += 1
+        counts[IssueSeverity.CRITICAL] += len(self._cycles)
+        counts[IssueSeverity.MEDIUM] += min(
+            MAX_CHAIN_ISSUES, len(self._long_chain_todo)
+        )
+        if self._stale:
+            counts[stale_tasks_severity(len(self._stale))] += 1
+        if self._overloaded:
+            counts[IssueSeverity.MEDIUM] += 1
+        if self._idle_reported():
+            counts[IssueSeverity.LOW] += 1
+        return +counts
+
+    def _ordered(self, ids: Iterable[str]) -> List[_TaskEntry]:
+        entries = [self._tasks[i] for i in ids if i in self._tasks]
+        entries.sort(key=lambda e: e.position)
+        return entries
+
+    def _build_issues(self, check: HealthIssueType) -> List[HealthIssue]:
+        if check == HealthIssueType.SKILL_MISMATCH:
+            if not self._unmatchable:
+                return []
+            entries = self._ordered(self._unmatchable)
+            gaps: Dict[str, List[str]] = {}
+            for entry in entries:
+                for skill in entry.required_skills:
+                    gaps.setdefault(skill, []).append(entry.task.id)
+            return [
+                skill_mismatch_issue(
+                    [e.task.id for e in entries], gaps, set(self._skill_holders)
+                )
+            ]
+
+        if check == HealthIssueType.CIRCULAR_DEPENDENCY:
+            return [circular_dependency_issue(cycle) for cycle in self._cycles]
+
+        if check == HealthIssueType.BOTTLENECK:
+            bottlenecks = []
+            for entry in self._ordered(self._bottlenecks):
+                blocked = self._ordered(self._dependents[entry.task.id])
+                bottlenecks.append(
+                    {
+                        "task_id": entry.task.id,
+                        "task_name": entry.task.name,
+                        "blocking_count": len(self._dependents[entry.task.id]),
+                        "blocked_tasks": [e.task.id for e in blocked],
+                        "status": entry.task.status,
+                    }
+                )
+            bottlenecks.sort(key=lambda b: int(b["blocking_count"]), reverse=True)
+            return [bottleneck_issue(b) for b in bottlenecks]
+
+        if check == HealthIssueType.CHAIN_BLOCK:
+            chains = [
+                {
+                    "task_id": entry.task.id,
+                    "task_name": entry.task.name,
+                    "chain_length": self._chain_lengths[entry.task.id],
+                }
+                for entry in self._ordered(self._long_chain_todo)
+            ]
+            chains.sort(key=lambda c: c["chain_length"], reverse=True)
+            return [chain_block_issue(c) for c in chains[:MAX_CHAIN_ISSUES]]
+
+        if check == HealthIssueType.STALE_TASKS:
+            if not self._stale:
+                return []
+            now = self._clock()
+            stale = [
+                {
+                    "task_id": entry.task.id,
+                    "task_name": entry.task.name,
+                    "assigned_to": entry.task.assigned_to,
+                    "days_stale": (now - _aware(entry.task.updated_at)).days,
+                }
+                for entry in self._ordered(self._stale)
+            ]
+            stale.sort(key=lambda t: int(t["days_stale"]), reverse=True)
+            return [stale_tasks_issue(stale, self.stale_task_days)]
+
+        if check == HealthIssueType.OVERLOADED_AGENTS:
+            overloaded = [
+                {
+                    "agent_id": agent_id,
+                    "agent_name": entry.name,
+                    "task_count": entry.assignments,
+                }
+                for agent_id, entry in self._agents.items()
+                if agent_id in self._overloaded
+            ]
+            return [overloaded_agents_issue(overloaded)] if overloaded else []
+
+        if check == HealthIssueType.IDLE_AGENTS:
+            if not self._idle_reported():
+                return []
+            idle = [
+                {
+                    "agent_id": agent_id,
+                    "agent_name": entry.name,
+                    "skills": list(entry.skills),
+                }
+                for agent_id, entry in self._agents.items()
+                if agent_id in self._idle
+            ]
+            return [idle_agents_issue(idle)]
+
+        return []
@@ -0,0 +1,400 @@
+"""
+Shared, versioned board snapshot with a typed change feed.
+
+Background monitors (assignment reversion checks, reconciliation, project
+health) each used to call ``kanban_client.get_all_tasks()`` on their own
+timers, which on a large Planka board meant several full downloads per
+minute. :class:`BoardSnapshotService` fetches the board once per refresh
+interval, shares the result with every reader (concurrent readers join the
+one in-flight fetch), and diffs consecutive snapshots into
+:class:`BoardChange` events so subscribers process only what changed.
+"""
+
+import asyncio
+import inspect
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
+
+from src.core.models import Task
+
+logger = logging.getLogger(__name__)
+
+# Change kinds
+TASK_CREATED = "created"
+TASK_DELETED = "deleted"
+TASK_STATUS_CHANGED = "status_changed"
+TASK_REASSIGNED = "reassigned"
+TASK_UPDATED = "updated"
+
+DEFAULT_REFRESH_INTERVAL = 30.0
+
+
+@dataclass(frozen=True)
+class BoardChange:
+    """
+    One task-level difference between consecutive board snapshots.
+
+    Attributes
+    ----------
+    kind : str
+        ``created``, ``deleted``, ``status_changed``, ``reassigned`` or
+        ``updated`` (any other field changed).
+    task_id : str
+        ID of the affected task.
+    task : Optional[Task]
+        The task in the new snapshot (None when deleted).
+    previous : Optional[Task]
+        The task in the previous snapshot (None when created).
+    version : int
+        Version of the snapshot that introduced the change.
+    """
+
+    kind: str
+    task_id: str
+    task: Optional[Task]
+    previous: Optional[Task]
+    version: int
+
+
+@dataclass
+class BoardSnapshot:
+    """
+    The board as of one fetch.
+
+    Attributes
+    ----------
+    version : int
+        Increments with every fetch that changed something.
+    tasks : List[Task]
+        All tasks, in provider order.
+    fetched_at : float
+        ``time.monotonic()`` when the fetch started; the board may have
+        changed after that point.
+    tasks_by_id : Dict[str, Task]
+        Tasks keyed by ID.
+    """
+
+    version: int
+    tasks: List[Task]
+    fetched_at: float
+    tasks_by_id: Dict[str, Task] = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.tasks_by_id = {task.id: task for task in self.tasks}
+
+    @property
+    def age(self) -> float:
+        """Seconds since the snapshot was fetched."""
+        return time.monotonic() - self.fetched_at
+
+
+BoardSubscriber = Callable[
+    [List[BoardChange], BoardSnapshot], Union[None, Awaitable[None]]
+]
+
+
+@dataclass(eq=False)
+class _Subscription:
+    callback: BoardSubscriber
+    bootstrapped: bool = False
+
+
+def diff_tasks(
+    previous: Dict[str, Task], current: Dict[str, Task], version: int
+) -> List[BoardChange]:
+    """
+    Return the changes that turn ``previous`` into ``current``.
+
+    A task whose status and assignee both changed yields one
+    ``status_changed`` event; inspect ``task`` and ``previous`` for details.
+
+    Parameters
+    ----------
+    previous : Dict[str, Task]
+        Tasks by ID in the older snapshot.
+    current : Dict[str, Task]
+        Tasks by ID in the newer snapshot.
+    version : int
+        Version stamped on each change.
+
+    Returns
+    -------
+    List[BoardChange]
+        Changes in ``current`` order, followed by deletions.
+    """
+    changes: List[BoardChange] = []
+    for task_id, task in current.items():
+        old = previous.get(task_id)
+        if old is None:
+            kind: Optional[str] = TASK_CREATED
+        elif old.status != task.status:
+            kind = TASK_STATUS_CHANGED
+        elif old.assigned_to != task.assigned_to:
+            kind = TASK_REASSIGNED
+        elif old != task:
+            kind = TASK_UPDATED
+        else:
+            kind = None
+        if kind is not None:
+            changes.append(BoardChange(kind, task_id, task, old, version))
+    for task_id, old in previous.items():
+        if task_id not in current:
+            changes.append(BoardChange(TASK_DELETED, task_id, None, old, version))
+    return changes
+
+
+class BoardSnapshotService:
+    """
+    Single source of board state for background monitors.
+
+    Readers call :meth:`get_snapshot`, which returns the current snapshot
+    while it is younger than ``max_age`` and otherwise refreshes it; all
+    readers waiting on a refresh share the same provider fetch. Every
+    fetch is diffed against the previous snapshot and the changes are
+    delivered to subscribers. :meth:`start` runs a loop that refreshes
+    once per ``refresh_interval`` so subscribers keep receiving changes
+    even when nobody reads.
+
+    Parameters
+    ----------
+    kanban_client : Any
+        Client exposing ``get_all_tasks()``.
+    refresh_interval : float
+        Seconds a snapshot stays fresh, and the background refresh period.
+
+    Examples
+    --------
+    >>> snapshots = get_board_snapshot(kanban_client)
+    >>> unsubscribe = snapshots.subscribe(on_changes)
+    >>> await snapshots.start()
+    """
+
+    def __init__(
+        self,
+        kanban_client: Any,
+        refresh_interval: float = DEFAULT_REFRESH_INTERVAL,
+    ) -> None:
+        self.kanban_client = kanban_client
+        self.refresh_interval = refresh_interval
+        self.fetch_count = 0
+        self._snapshot: Optional[BoardSnapshot] = None
+        self._version = 0
+        self._subscriptions: List[_Subscription] = []
+        self._inflight: Optional["asyncio.Future[BoardSnapshot]"] = None
+        self._loop_task: Optional["asyncio.Task[None]"] = None
+
+    @property
+    def snapshot(self) -> Optional[BoardSnapshot]:
+        """The latest snapshot, or None before the first fetch."""
+        return self._snapshot
+
+    def subscribe(self, callback: BoardSubscriber) -> Callable[[], None]:
+        """
+        Deliver future changes to ``callback``.
+
+        ``callback(changes, snapshot)`` may be sync or async and is called
+        after every fetch, with an empty list when nothing changed. A new
+        subscriber first receives every task of the current snapshot as a
+        ``created`` change on the next refresh, so it can bootstrap.
+
+        Returns
+        -------
+        Callable[[], None]
+            Function that removes the subscription.
+        """
+        subscription = _Subscription(callback)
+        self._subscriptions.append(subscription)
+
+        def unsubscribe() -> None:
+            if subscription in self._subscriptions:
+                self._subscriptions.remove(subscription)
+
+        return unsubscribe
+
+    def restore(self, tasks: List[Task], version: int, age: float = 0.0) -> bool:
+        """
+        Seed the service with a board saved before a restart.
+
+        The restored snapshot is served to readers that accept its age,
+        and the next fetch is diffed against it, so a warm restart does
+        not start with a full board download.
+
+        Parameters
+        ----------
+        tasks : List[Task]
+            Tasks of the saved snapshot.
+        version : int
+            Version of the saved snapshot; later versions continue from it.
+        age : float
+            Seconds since the saved snapshot was fetched.
+
+        Returns
+        -------
+        bool
+            False if the service had already fetched a snapshot of its own.
+        """
+        if self._snapshot is not None:
+            return False
+        self._version = version
+        self._snapshot = BoardSnapshot(version, list(tasks), time.monotonic() - age)
+        return True
+
+    def invalidate(self) -> None:
+        """Make the next :meth:`get_snapshot` fetch from the provider."""
+        if self._snapshot is not None:
+            self._snapshot.fetched_at = float("-inf")
+
+    async def get_snapshot(self, max_age: Optional[float] = None) -> BoardSnapshot:
+        """
+        Return a snapshot no older than ``max_age`` seconds.
+
+        Parameters
+        ----------
+        max_age : Optional[float]
+            Maximum acceptable age; defaults to ``refresh_interval``.
+
+        Returns
+        -------
+        BoardSnapshot
+            The shared snapshot.
+        """
+        limit = self.refresh_interval if max_age is None else max_age
+        if self._snapshot is not None and self._snapshot.age <= limit:
+            return self._snapshot
+        return await self.refresh()
+
+    async def refresh(self) -> BoardSnapshot:
+        """
+        Fetch the board now (joining a fetch already in flight).
+
+        Returns
+        -------
+        BoardSnapshot
+            The new snapshot.
+        """
+        if self._inflight is not None:
+            return await asyncio.shield(self._inflight)
+        future: "asyncio.Future[BoardSnapshot]" = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._inflight = future
+        try:
+            snapshot = await self._fetch()
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark retrieved so a failure nobody else awaited is not logged
+            future.exception()
+            raise
+        finally:
+            self._inflight = None
+        future.set_result(snapshot)
+        return snapshot
+
+    async def _fetch(self) -> BoardSnapshot:
+        started = time.monotonic()
+        tasks = list(await self.kanban_client.get_all_tasks())
+        self.fetch_count += 1
+        previous = self._snapshot
+        version = self._version + 1
+        snapshot = BoardSnapshot(version, tasks, started)
+        changes = diff_tasks(
+            previous.tasks_by_id if previous is not None else {},
+            snapshot.tasks_by_id,
+            version,
+        )
+        if previous is not None and not changes:
+            # Nothing changed: keep the version, refresh the timestamp
+            snapshot.version = previous.version
+        else:
+            self._version = version
+        self._snapshot = snapshot
+        await self._dispatch(changes, snapshot)
+        return snapshot
+
+    async def _dispatch(
+        self, changes: List[BoardChange], snapshot: BoardSnapshot
+    ) -> None:
+        bootstrap: Optional[List[BoardChange]] = None
+        calls = []
+        for subscription in list(self._subscriptions):
+            delivered = changes
+            if not subscription.bootstrapped:
+                subscription.bootstrapped = True
+                if bootstrap is None:
+                    bootstrap = [
+                        BoardChange(
+                            TASK_CREATED, task.id, task, None, snapshot.version
+                        )
+                        for task in snapshot.tasks
+                    ]
+                delivered = bootstrap
+            calls.append((subscription.callback, delivered))
+
+        async def deliver(
+            callback: BoardSubscriber, delivered: List[BoardChange]
+        ) -> None:
+            result = callback(delivered, snapshot)
+            if inspect.isawaitable(result):
+                await result
+
+        results = await asyncio.gather(
+            *(deliver(callback, delivered) for callback, delivered in calls),
+            return_exceptions=True,
+        )
+        for (callback, _), result in zip(calls, results):
+            if isinstance(result, Exception):
+                logger.error(f"Board change subscriber {callback!r} failed: {result}")
+
+    async def start(self) -> None:
+        """Start the background refresh loop (no-op if running)."""
+        if self._loop_task is not None and not self._loop_task.done():
+            return
+        self._loop_task = asyncio.create_task(self._refresh_loop())
+        logger.info(
+            f"Board snapshot refresh started (every {self.refresh_interval}s)"
+        )
+
+    async def stop(self) -> None:
+        """Stop the background refresh loop."""
+        if self._loop_task is None:
+            return
+        self._loop_task.cancel()
+        try:
+            await self._loop_task
+        except asyncio.CancelledError:
+            pass
+        self._loop_task = None
+
+    async def _refresh_loop(self) -> None:
+        while True:
+            try:
+                snapshot = await self.get_snapshot()
+                delay = self.refresh_interval - snapshot.age
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Board snapshot refresh failed: {e}")
+                delay = self.refresh_interval
+            await asyncio.sleep(max(delay, 0.0))
+
+
+# Shared snapshot services, one per kanban client
+_board_snapshots: Dict[int, BoardSnapshotService] = {}
+
+
+def get_board_snapshot(
+    kanban_client: Any, refresh_interval: float = DEFAULT_REFRESH_INTERVAL
+) -> BoardSnapshotService:
+    """Get or create the shared snapshot service for a kanban client."""
+    service = _board_snapshots.get(id(kanban_client))
+    if service is None or service.kanban_client is not kanban_client:
+        service = BoardSnapshotService(kanban_client, refresh_interval)
+        _board_snapshots[id(kanban_client)] = service
+    return service
+
+
+def reset_board_snapshots() -> None:
+    """Drop all shared snapshot services (used by tests)."""
+    _board_snapshots.clear()
@@ -5,10 +5,12 @@ This module analyzes code changes, PRs, and repository state to provide
 context-aware information to workers about implemented features.
 """
 
+import asyncio
 import re
 import sys
 from typing import Any, Callable, Dict, List, Optional
 
+from src.core.code_index import SYMBOL_FUNCTION, SYMBOL_TEST, CodeIndex
 from src.core.models import Task, WorkerStatus
 
 
@@ -24,6 +26,9 @@ class CodeAnalyzer:
     ----------
     mcp_caller : Optional[callable]
         Function to call GitHub MCP tools for API interactions
+    code_index : Optional[CodeIndex]
+        Local index of the worktree; when set, implementation details are
+        answered from it instead of remote GitHub searches
     endpoint_patterns : List[str]
         Regular expression patterns for detecting API endpoints
 
@@ -35,7 +40,11 @@ class CodeAnalyzer:
     ... )
     """
 
-    def __init__(self, mcp_caller: Optional[Callable[..., Any]] = None) -> None:
+    def __init__(
+        self,
+        mcp_caller: Optional[Callable[..., Any]] = None,
+        code_index: Optional[CodeIndex] = None,
+    ) -> None:
         """
         Initialize the code analyzer.
 
@@ -44,8 +53,11 @@ class CodeAnalyzer:
         mcp_caller : Optional[callable], default=None
             Function to call GitHub MCP tools. Should accept tool name
             and parameters dict.
+        code_index : Optional[CodeIndex], default=None
+            Local code index to answer implementation queries from.
         """
         self.mcp_caller = mcp_caller
+        self.code_index = code_index
         self.endpoint_patterns = [
             # FastAPI/Flask style
             r'@app\.(get|post|put|delete|patch)\(["\']([^"\']+)["\']\)',
@@ -147,6 +159,8 @@ class CodeAnalyzer:
             - "endpoints": API endpoints
             - "models": Data models/schemas
             - "schemas": Database schemas
+            - "functions": Functions and methods (local index only)
+            - "tests": Tests (local index only)
 
         Returns
         -------
@@ -165,6 +179,11 @@ class CodeAnalyzer:
         """
         details: Dict[str, Any] = {"feature_type": feature_type, "implementations": []}
 
+        if self.code_index is not None:
+            await asyncio.to_thread(self.code_index.update)
+            details["implementations"] = self._local_implementations(feature_type)
+            return details
+
         if feature_type == "endpoints":
             details["implementations"] = await self._find_endpoints(owner, repo)
         elif feature_type == "models":
@@ -176,6 +195,61 @@ class CodeAnalyzer:
 
         return details
 
+    def _local_implementations(self, feature_type: str) -> List[Dict[str, Any]]:
+        """
+        Answer an implementation query from the local code index.
+
+        Results use the same keys as the remote lookups, plus the ``file``
+        and ``line`` of each definition.
+
+        Parameters
+        ----------
+        feature_type : str
+            Type of feature, as for ``get_implementation_details``.
+
+        Returns
+        -------
+        List[Dict[str, Any]]
+            Matching implementations.
+        """
+        assert self.code_index is not None  # nosec B101 - checked by caller
+        if feature_type == "endpoints":
+            return [
+                {
+                    "method": symbol.method,
+                    "path": symbol.route,
+                    "implementation": symbol.name,
+                    "file": symbol.path,
+                    "line": symbol.line,
+                }
+                for symbol in self.code_index.endpoints()
+            ]
+        if feature_type in ("models", "schemas"):
+            models = self.code_index.models()
+            if feature_type == "schemas":
+                models = [m for m in models if "schema" in m.path.lower()]
+            return [
+                {
+                    "name": symbol.name,
+                    "type": (
+                        "database_model"
+                        if symbol.language == "python"
+                        else "interface"
+                    ),
+                    "language": symbol.language,
+                    "file": symbol.path,
+                    "line": symbol.line,
+                }
+                for symbol in models
+            ]
+        if feature_type in ("functions", "tests"):
+            kind = SYMBOL_FUNCTION if feature_type == "functions" else SYMBOL_TEST
+            return [
+                {"name": s.name, "file": s.path, "line": s.line}
+                for s in self.code_index.symbols(kind)
+            ]
+        return []
+
     async def _get_recent_commits(
         self, owner: str, repo: str, author: str
     ) -> List[Dict[str, Any]]:
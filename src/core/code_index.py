@@ -0,0 +1,719 @@
+"""
+Local, incrementally updated index of code symbols in a git worktree.
+
+:class:`~src.core.code_analyzer.CodeAnalyzer` used to learn what agents had
+built (endpoints, models, tests) through remote GitHub MCP calls, which is
+slow and impossible offline. :class:`CodeIndex` answers the same questions
+from the worktree itself: source files are parsed once by a per-language
+:class:`SymbolExtractor` (Python via :mod:`ast`, JavaScript/TypeScript via
+patterns; more can be registered with :func:`register_extractor`), and
+:meth:`CodeIndex.update` re-parses only the files ``git diff`` reports as
+changed since the last indexed commit. Queries are dictionary lookups.
+:meth:`CodeIndex.commit_delta` reports what one commit range (such as an
+agent's merge) added, for attributing code to the task behind it.
+
+Indexes are shared per repository through :func:`get_code_index`.
+"""
+
+import ast
+import bisect
+import hashlib
+import logging
+import os
+import re
+import subprocess  # nosec B404 - fixed git invocations only
+import threading
+from abc import ABC, abstractmethod
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# Symbol kinds
+SYMBOL_ENDPOINT = "endpoint"
+SYMBOL_MODEL = "model"
+SYMBOL_CLASS = "class"
+SYMBOL_FUNCTION = "function"
+SYMBOL_TEST = "test"
+
+# Files larger than this are skipped (generated bundles, fixtures)
+MAX_FILE_BYTES = 1_000_000
+
+_SKIPPED_DIRS = {".git", "node_modules", "__pycache__", ".venv", "venv", "dist"}
+
+
+@dataclass(frozen=True)
+class CodeSymbol:
+    """
+    A named definition found in a source file.
+
+    Attributes
+    ----------
+    kind : str
+        One of ``endpoint``, ``model``, ``class``, ``function``, ``test``.
+    name : str
+        Symbol name; methods are qualified as ``Class.method``.
+    path : str
+        File path relative to the repository root.
+    line : int
+        1-based line of the definition.
+    language : str
+        Language of the extractor that found it.
+    method : Optional[str]
+        HTTP method, for endpoints.
+    route : Optional[str]
+        URL path, for endpoints.
+    """
+
+    kind: str
+    name: str
+    path: str
+    line: int
+    language: str
+    method: Optional[str] = None
+    route: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the symbol as a dictionary without empty fields."""
+        return {k: v for k, v in asdict(self).items() if v is not None}
+
+
+class SymbolExtractor(ABC):
+    """
+    Extracts symbols from the source of one language.
+
+    Attributes
+    ----------
+    language : str
+        Language name recorded on each symbol.
+    extensions : Tuple[str, ...]
+        File extensions (with the dot) this extractor handles.
+    """
+
+    language: str = ""
+    extensions: Tuple[str, ...] = ()
+
+    @abstractmethod
+    def extract(self, path: str, source: str) -> List[CodeSymbol]:
+        """
+        Return the symbols defined in ``source``.
+
+        Parameters
+        ----------
+        path : str
+            Repository-relative path, recorded on each symbol.
+        source : str
+            File contents.
+
+        Returns
+        -------
+        List[CodeSymbol]
+            Symbols in source order. Unparseable input yields an empty list.
+        """
+
+
+class PythonExtractor(SymbolExtractor):
+    """
+    AST-based extractor for Python.
+
+    Finds module-level functions, classes and their methods, models
+    (classes deriving from a ``Model``/``Base``-style base), tests
+    (``test_*`` functions) and route decorators such as ``@app.get("/x")``,
+    ``@router.post(...)`` and ``@bp.route("/x", methods=[...])``.
+    """
+
+    language = "python"
+    extensions = (".py",)
+
+    HTTP_METHODS = {"get", "post", "put", "delete", "patch", "head", "options"}
+    MODEL_BASES = {"Model", "Base", "BaseModel", "SQLModel", "DeclarativeBase"}
+
+    def extract(self, path: str, source: str) -> List[CodeSymbol]:
+        """Parse ``source`` and return its symbols."""
+        try:
+            tree = ast.parse(source)
+        except (SyntaxError, ValueError) as e:
+            logger.debug(f"Skipping unparseable Python file {path}: {e}")
+            return []
+
+        symbols: List[CodeSymbol] = []
+        for node in tree.body:
+            if isinstance(node, ast.ClassDef):
+                symbols.append(self._class_symbol(path, node))
+                for item in node.body:
+                    if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                        symbols.extend(
+                            self._function_symbols(path, item, f"{node.name}.")
+                        )
+            elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                symbols.extend(self._function_symbols(path, node, ""))
+        return symbols
+
+    def _class_symbol(self, path: str, node: ast.ClassDef) -> CodeSymbol:
+        bases = {self._tail_name(base) for base in node.bases}
+        is_model = bool(bases & self.MODEL_BASES) or any(
+            base.endswith("Model") for base in bases
+        )
+        return CodeSymbol(
+            SYMBOL_MODEL if is_model else SYMBOL_CLASS,
+            node.name,
+            path,
+            node.lineno,
+            self.language,
+        )
+
+    def _function_symbols(
+        self,
+        path: str,
+        node: Union[ast.FunctionDef, ast.AsyncFunctionDef],
+        prefix: str,
+    ) -> List[CodeSymbol]:
+        name = f"{prefix}{node.name}"
+        kind = SYMBOL_TEST if node.name.startswith("test_") else SYMBOL_FUNCTION
+        symbols = [CodeSymbol(kind, name, path, node.lineno, self.language)]
+        for decorator in node.decorator_list:
+            route = self._route(decorator)
+            if route is not None:
+                for method in route[0]:
+                    symbols.append(
+                        CodeSymbol(
+                            SYMBOL_ENDPOINT,
+                            name,
+                            path,
+                            node.lineno,
+                            self.language,
+                            method=method,
+                            route=route[1],
+                        )
+                    )
+        return symbols
+
+    def _route(self, decorator: ast.expr) -> Optional[Tuple[List[str], str]]:
+        """Return ``(methods, path)`` for a route decorator, else None."""
+        if not (
+            isinstance(decorator, ast.Call)
+            and isinstance(decorator.func, ast.Attribute)
+            and decorator.args
+            and isinstance(decorator.args[0], ast.Constant)
+            and isinstance(decorator.args[0].value, str)
+        ):
+            return None
+        attr = decorator.func.attr.lower()
+        route = decorator.args[0].value
+        if attr in self.HTTP_METHODS:
+            return [attr.upper()], route
+        if attr in ("route", "api_route"):
+            methods = ["GET"]
+            for keyword in decorator.keywords:
+                if keyword.arg == "methods" and isinstance(
+                    keyword.value, (ast.List, ast.Tuple)
+                ):
+                    methods = [
+                        str(element.value).upper()
+                        for element in keyword.value.elts
+                        if isinstance(element, ast.Constant)
+                    ] or methods
+            return methods, route
+        return None
+
+    @staticmethod
+    def _tail_name(node: ast.expr) -> str:
+        if isinstance(node, ast.Name):
+            return node.id
+        if isinstance(node, ast.Attribute):
+            return node.attr
+        return ""
+
+
+class JavaScriptExtractor(SymbolExtractor):
+    """
+    Pattern-based extractor for JavaScript and TypeScript.
+
+    Finds Express-style routes, functions, classes, TypeScript interfaces
+    (as models) and ``it``/``test`` cases.
+    """
+
+    language = "javascript"
+    extensions = (".js", ".jsx", ".mjs", ".ts", ".tsx")
+
+    PATTERNS: Tuple[Tuple[str, "re.Pattern[str]"], ...] = (
+        (
+            SYMBOL_ENDPOINT,
+            re.compile(
+                r"\b(?:app|router)\.(get|post|put|delete|patch)\(\s*[\"'`]([^\"'`]+)"
+            ),
+        ),
+        (SYMBOL_FUNCTION, re.compile(r"\bfunction\s+(\w+)")),
+        (
+            SYMBOL_FUNCTION,
+            re.compile(r"\b(?:const|let)\s+(\w+)\s*=\s*(?:async\s*)?\([^)]*\)\s*=>"),
+        ),
+        (SYMBOL_CLASS, re.compile(r"\bclass\s+(\w+)")),
+        (SYMBOL_MODEL, re.compile(r"\binterface\s+(\w+)")),
+        (SYMBOL_TEST, re.compile(r"\b(?:it|test)\(\s*[\"'`]([^\"'`]+)")),
+    )
+
+    def extract(self, path: str, source: str) -> List[CodeSymbol]:
+        """Scan ``source`` and return its symbols."""
+        newlines = [i for i, char in enumerate(source) if char == "\n"]
+        found: List[Tuple[int, CodeSymbol]] = []
+        for kind, pattern in self.PATTERNS:
+            for match in pattern.finditer(source):
+                line = bisect.bisect_left(newlines, match.start()) + 1
+                if kind == SYMBOL_ENDPOINT:
+                    symbol = CodeSymbol(
+                        kind,
+                        f"{match.group(1).upper()} {match.group(2)}",
+                        path,
+                        line,
+                        self.language,
+                        method=match.group(1).upper(),
+                        route=match.group(2),
+                    )
+                else:
+                    symbol = CodeSymbol(kind, match.group(1), path, line, self.language)
+                found.append((match.start(), symbol))
+        return [symbol for _, symbol in sorted(found, key=lambda item: item[0])]
+
+
+# Registered extractors by file extension
+_extractors: Dict[str, SymbolExtractor] = {}
+
+
+def register_extractor(extractor: SymbolExtractor) -> None:
+    """
+    Register ``extractor`` for each of its file extensions.
+
+    Later registrations replace earlier ones for the same extension.
+    """
+    for extension in extractor.extensions:
+        _extractors[extension.lower()] = extractor
+
+
+register_extractor(PythonExtractor())
+register_extractor(JavaScriptExtractor())
+
+
+@dataclass
+class IndexDelta:
+    """
+    What an index build or update changed.
+
+    Attributes
+    ----------
+    from_commit : Optional[str]
+        Commit the index reflected before the update.
+    to_commit : Optional[str]
+        Commit the index reflects now (HEAD; uncommitted changes included).
+    changed_files : List[str]
+        Files re-parsed because their contents changed.
+    removed_files : List[str]
+        Files dropped from the index.
+    added : List[CodeSymbol]
+        Symbols that appeared.
+    removed : List[CodeSymbol]
+        Symbols that disappeared.
+    """
+
+    from_commit: Optional[str]
+    to_commit: Optional[str]
+    changed_files: List[str] = field(default_factory=list)
+    removed_files: List[str] = field(default_factory=list)
+    added: List[CodeSymbol] = field(default_factory=list)
+    removed: List[CodeSymbol] = field(default_factory=list)
+
+    def as_implementation(self) -> Dict[str, Any]:
+        """
+        Summarize the added symbols for the context system.
+
+        Returns
+        -------
+        Dict[str, Any]
+            ``files`` plus ``endpoints``, ``models``, ``functions`` and
+            ``tests`` lists in the shape ``Context.add_implementation``
+            stores.
+        """
+        return {
+            "files": self.changed_files,
+            "endpoints": [
+                s.to_dict() for s in self.added if s.kind == SYMBOL_ENDPOINT
+            ],
+            "models": [s.to_dict() for s in self.added if s.kind == SYMBOL_MODEL],
+            "functions": [
+                s.to_dict()
+                for s in self.added
+                if s.kind in (SYMBOL_FUNCTION, SYMBOL_CLASS)
+            ],
+            "tests": [s.to_dict() for s in self.added if s.kind == SYMBOL_TEST],
+        }
+
+
+class CodeIndex:
+    """
+    Symbol index of one repository worktree.
+
+    The first :meth:`update` (or :meth:`build`) parses every tracked and
+    untracked, non-ignored source file. Later updates ask git which files
+    differ from the last indexed commit (committed, staged, unstaged or
+    untracked) and re-parse only those whose contents actually changed.
+    Directories that are not git repositories fall back to a filesystem
+    walk, still skipping unchanged files by content digest.
+
+    Parameters
+    ----------
+    root : Union[str, Path]
+        Repository (or worktree) root.
+    extractors : Optional[Dict[str, SymbolExtractor]]
+        Extractors by extension; defaults to the registered ones.
+
+    Examples
+    --------
+    >>> index = get_code_index("/path/to/implementation")
+    >>> index.update()
+    >>> [f"{e.method} {e.route}" for e in index.endpoints()]
+    """
+
+    def __init__(
+        self,
+        root: Union[str, Path],
+        extractors: Optional[Dict[str, SymbolExtractor]] = None,
+    ) -> None:
+        self.root = Path(root).resolve()
+        self._extractors = extractors if extractors is not None else _extractors
+        self.commit: Optional[str] = None
+        self._built = False
+        self._digests: Dict[str, str] = {}
+        self._symbols: Dict[str, List[CodeSymbol]] = {}
+        # kind -> path -> symbols, and lower-cased name -> path -> symbols
+        self._by_kind: Dict[str, Dict[str, List[CodeSymbol]]] = {}
+        self._by_name: Dict[str, Dict[str, List[CodeSymbol]]] = {}
+        # Files that differed from the indexed commit at the last update
+        self._dirty: Set[str] = set()
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------
+    # Building and updating
+    # ------------------------------------------------------------
+
+    def build(self) -> IndexDelta:
+        """
+        Index every source file in the worktree from scratch.
+
+        Returns
+        -------
+        IndexDelta
+            Every indexed file and symbol, as added.
+        """
+        with self._lock:
+            previous = self.commit
+            commit = self._head()
+            paths = self._all_files(commit is not None)
+            delta = IndexDelta(previous, commit)
+            for path in [p for p in self._symbols if p not in paths]:
+                self._reindex(path, delta)
+            for path in sorted(paths):
+                self._reindex(path, delta)
+            self.commit = commit
+            self._dirty = self._dirty_files() if commit is not None else set()
+            self._built = True
+            return delta
+
+    @property
+    def built(self) -> bool:
+        """Whether the index has been built."""
+        return self._built
+
+    def update(self) -> IndexDelta:
+        """
+        Bring the index up to date with the worktree.
+
+        Builds the index on first use. Afterwards only files reported by
+        ``git diff <indexed commit>`` (plus untracked files and files that
+        were dirty at the previous update) are read, and only those whose
+        contents changed are re-parsed.
+
+        Returns
+        -------
+        IndexDelta
+            Files and symbols that changed.
+        """
+        if not self._built:
+            return self.build()
+        with self._lock:
+            previous = self.commit
+            commit = self._head()
+            delta = IndexDelta(previous, commit)
+            if commit is None or previous is None:
+                candidates = self._all_files(commit is not None) | set(self._symbols)
+            else:
+                dirty = self._dirty_files()
+                candidates = (
+                    self._diff_files(previous, commit) | dirty | self._dirty
+                )
+                self._dirty = dirty
+            for path in sorted(candidates):
+                self._reindex(path, delta)
+            self.commit = commit
+            return delta
+
+    def commit_delta(self, from_commit: str, to_commit: str) -> IndexDelta:
+        """
+        Return the symbols a commit range added and removed.
+
+        Each file ``git diff`` reports between the two commits is read at
+        both commits with ``git show``, independently of what the index
+        currently reflects, so the result belongs to exactly that range
+        (for example, one merge). The index itself is not changed.
+
+        Parameters
+        ----------
+        from_commit : str
+            Commit before the range (e.g. the first parent of a merge).
+        to_commit : str
+            Commit after the range.
+
+        Returns
+        -------
+        IndexDelta
+            Files and symbols the range changed.
+        """
+        delta = IndexDelta(from_commit, to_commit)
+        output = self._git(
+            "diff", "--name-only", "--no-renames", "-z", from_commit, to_commit
+        )
+        for path in sorted(self._split(output)):
+            extractor = self._extractors.get(os.path.splitext(path)[1].lower())
+            if extractor is None:
+                continue
+            old = self._symbols_at(from_commit, path, extractor) or []
+            new = self._symbols_at(to_commit, path, extractor)
+            if new is None:
+                if old:
+                    delta.removed_files.append(path)
+                    delta.removed.extend(old)
+                continue
+            delta.changed_files.append(path)
+            old_set = set(old)
+            new_set = set(new)
+            delta.added.extend(s for s in new if s not in old_set)
+            delta.removed.extend(s for s in old if s not in new_set)
+        return delta
+
+    def _symbols_at(
+        self, commit: str, path: str, extractor: SymbolExtractor
+    ) -> Optional[List[CodeSymbol]]:
+        """Symbols of ``path`` as of ``commit``; None if absent or too large."""
+        source = self._git("show", f"{commit}:{path}")
+        if source is None or len(source) > MAX_FILE_BYTES:
+            return None
+        return extractor.extract(path, source)
+
+    def _reindex(self, path: str, delta: IndexDelta) -> None:
+        extractor = self._extractors.get(os.path.splitext(path)[1].lower())
+        full_path = self.root / path
+        content: Optional[bytes] = None
+        if extractor is not None:
+            try:
+                if full_path.stat().st_size <= MAX_FILE_BYTES:
+                    content = full_path.read_bytes()
+            except OSError:
+                content = None
+
+        if content is None:
+            if path in self._symbols:
+                delta.removed.extend(self._drop(path))
+                delta.removed_files.append(path)
+            return
+
+        digest = hashlib.sha1(content, usedforsecurity=False).hexdigest()
+        if self._digests.get(path) == digest:
+            return
+        old = self._drop(path) if path in self._symbols else []
+        assert extractor is not None  # nosec B101 - content implies extractor
+        symbols = extractor.extract(path, content.decode("utf-8", errors="replace"))
+        self._add(path, digest, symbols)
+        delta.changed_files.append(path)
+        old_set = set(old)
+        new_set = set(symbols)
+        delta.added.extend(s for s in symbols if s not in old_set)
+        delta.removed.extend(s for s in old if s not in new_set)
+
+    def _add(self, path: str, digest: str, symbols: List[CodeSymbol]) -> None:
+        self._digests[path] = digest
+        self._symbols[path] = symbols
+        for symbol in symbols:
+            self._by_kind.setdefault(symbol.kind, {}).setdefault(path, []).append(
+                symbol
+            )
+            self._by_name.setdefault(symbol.name.lower(), {}).setdefault(
+                path, []
+            ).append(symbol)
+
+    def _drop(self, path: str) -> List[CodeSymbol]:
+        self._digests.pop(path, None)
+        symbols = self._symbols.pop(path, [])
+        for symbol in symbols:
+            for table, key in (
+                (self._by_kind, symbol.kind),
+                (self._by_name, symbol.name.lower()),
+            ):
+                by_path = table.get(key)
+                if by_path is not None and by_path.pop(path, None) is not None:
+                    if not by_path:
+                        del table[key]
+        return symbols
+
+    # ------------------------------------------------------------
+    # Git plumbing
+    # ------------------------------------------------------------
+
+    def _git(self, *args: str) -> Optional[str]:
+        """Run a git command in the worktree; None if it fails."""
+        try:
+            result = subprocess.run(  # nosec B603 B607
+                ["git", *args],
+                cwd=self.root,
+                capture_output=True,
+                text=True,
+            )
+        except OSError as e:
+            logger.debug(f"git unavailable for code index of {self.root}: {e}")
+            return None
+        if result.returncode != 0:
+            return None
+        return result.stdout
+
+    def _head(self) -> Optional[str]:
+        output = self._git("rev-parse", "--verify", "--quiet", "HEAD")
+        return output.strip() if output else None
+
+    @staticmethod
+    def _split(output: Optional[str]) -> Set[str]:
+        return {path for path in (output or "").split("\0") if path}
+
+    def _all_files(self, is_git: bool) -> Set[str]:
+        if is_git or self._git("rev-parse", "--git-dir") is not None:
+            listed = self._git(
+                "ls-files", "-z", "--cached", "--others", "--exclude-standard"
+            )
+            if listed is not None:
+                return self._split(listed)
+        paths: Set[str] = set()
+        for directory, dirnames, filenames in os.walk(self.root):
+            dirnames[:] = [
+                d for d in dirnames if d not in _SKIPPED_DIRS and not d.startswith(".")
+            ]
+            for filename in filenames:
+                full = Path(directory) / filename
+                paths.add(full.relative_to(self.root).as_posix())
+        return paths
+
+    def _diff_files(self, from_commit: str, to_commit: str) -> Set[str]:
+        if from_commit == to_commit:
+            return set()
+        output = self._git(
+            "diff", "--name-only", "--no-renames", "-z", from_commit, to_commit
+        )
+        if output is None:
+            # Unknown commit (history rewritten): rescan everything
+            return self._all_files(True) | set(self._symbols)
+        return self._split(output)
+
+    def _dirty_files(self) -> Set[str]:
+        """Files differing from HEAD in the worktree, including untracked."""
+        changed = self._git("diff", "HEAD", "--name-only", "--no-renames", "-z")
+        untracked = self._git("ls-files", "-z", "--others", "--exclude-standard")
+        return self._split(changed) | self._split(untracked)
+
+    # ------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------
+
+    def symbols(
+        self, kind: Optional[str] = None, path_prefix: Optional[str] = None
+    ) -> List[CodeSymbol]:
+        """
+        Return indexed symbols, optionally filtered by kind and path.
+
+        Parameters
+        ----------
+        kind : Optional[str]
+            Symbol kind to return; all kinds when None.
+        path_prefix : Optional[str]
+            Only symbols in files under this repository-relative prefix.
+
+        Returns
+        -------
+        List[CodeSymbol]
+            Matching symbols ordered by path, then position.
+        """
+        if kind is None:
+            by_path: Dict[str, List[CodeSymbol]] = self._symbols
+        else:
+            by_path = self._by_kind.get(kind, {})
+        return [
+            symbol
+            for path in sorted(by_path)
+            if path_prefix is None or path.startswith(path_prefix)
+            for symbol in by_path[path]
+        ]
+
+    def endpoints(self) -> List[CodeSymbol]:
+        """Return every indexed HTTP endpoint."""
+        return self.symbols(SYMBOL_ENDPOINT)
+
+    def models(self) -> List[CodeSymbol]:
+        """Return every indexed data model."""
+        return self.symbols(SYMBOL_MODEL)
+
+    def functions(self) -> List[CodeSymbol]:
+        """Return every indexed function and method."""
+        return self.symbols(SYMBOL_FUNCTION)
+
+    def tests(self) -> List[CodeSymbol]:
+        """Return every indexed test."""
+        return self.symbols(SYMBOL_TEST)
+
+    def find(self, name: str) -> List[CodeSymbol]:
+        """Return symbols named ``name`` (case-insensitive)."""
+        by_path = self._by_name.get(name.lower(), {})
+        return [symbol for path in sorted(by_path) for symbol in by_path[path]]
+
+    def files(self) -> List[str]:
+        """Return the indexed file paths."""
+        return sorted(self._symbols)
+
+    def summary(self) -> Dict[str, Any]:
+        """Return symbol counts per kind and the indexed commit."""
+        return {
+            "root": str(self.root),
+            "commit": self.commit,
+            "files": len(self._symbols),
+            "symbols": {
+                kind: sum(len(symbols) for symbols in by_path.values())
+                for kind, by_path in sorted(self._by_kind.items())
+            },
+        }
+
+
+def symbols_to_dicts(symbols: Iterable[CodeSymbol]) -> List[Dict[str, Any]]:
+    """Convert symbols to dictionaries for JSON responses."""
+    return [symbol.to_dict() for symbol in symbols]
+
+
+# Shared indexes, one per repository root
+_code_indexes: Dict[str, CodeIndex] = {}
+
+
+def get_code_index(root: Union[str, Path]) -> CodeIndex:
+    """Get or create the shared code index for a repository root."""
+    key = str(Path(root).resolve())
+    if key not in _code_indexes:
+        _code_indexes[key] = CodeIndex(key)
+    return _code_indexes[key]
+
+
+def reset_code_indexes() -> None:
+    """Drop all shared code indexes (used by tests and benchmarks)."""
+    _code_indexes.clear()
@@ -0,0 +1,338 @@
+"""
+Shared dependency graph engine for task diagnostics.
+
+Builds a compact integer-indexed adjacency representation of a board's
+task dependencies once and answers the questions every diagnostic tool
+asks of it — topological order, longest dependency chains and redundant
+(transitive) dependencies — in linear time, or linear in edges times a
+machine-word bitset for reachability.
+
+Used by :class:`src.core.task_diagnostics.DependencyChainAnalyzer`, the
+project stall analyzer and :class:`src.core.board_health_analyzer.
+BoardHealthAnalyzer`, which previously each re-walked the graph from every
+task (exponential on diamond-heavy graphs).
+"""
+
+import logging
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from src.core.models import Task
+
+logger = logging.getLogger(__name__)
+
+
+class DependencyGraph:
+    """
+    Integer-indexed dependency graph over a list of tasks.
+
+    Node ``i`` is ``ids[i]``. Task IDs come first, in input order, followed
+    by dependency IDs that reference no task in the list (missing
+    dependencies); those have no outgoing edges. Edges point from a task to
+    the tasks it depends on, in declaration order with duplicates removed.
+
+    Analyses are computed lazily and cached, so one instance can be shared
+    by every check run against the same snapshot of the board.
+
+    Parameters
+    ----------
+    tasks : Iterable[Task]
+        Tasks on the board. When an ID appears twice the last task wins,
+        matching ``{t.id: t for t in tasks}``.
+
+    Examples
+    --------
+    >>> graph = DependencyGraph(project_tasks)
+    >>> graph.longest_chain("deploy")
+    ['deploy', 'test', 'implement', 'design']
+    """
+
+    def __init__(self, tasks: Iterable[Task]):
+        task_list = list(tasks)
+        self.ids: List[str] = []
+        self.index: Dict[str, int] = {}
+        for task in task_list:
+            if task.id not in self.index:
+                self.index[task.id] = len(self.ids)
+                self.ids.append(task.id)
+        self.task_count = len(self.ids)
+
+        declared: Dict[int, List[str]] = {}
+        for task in task_list:
+            declared[self.index[task.id]] = list(task.dependencies or [])
+
+        self.deps: List[List[int]] = [[] for _ in range(self.task_count)]
+        for node, dep_ids in declared.items():
+            seen = set()
+            for dep_id in dep_ids:
+                dep = self._intern(dep_id)
+                if dep not in seen:
+                    seen.add(dep)
+                    self.deps[node].append(dep)
+
+        self.dependents: List[List[int]] = [[] for _ in self.ids]
+        for node, node_deps in enumerate(self.deps):
+            for dep in node_deps:
+                self.dependents[dep].append(node)
+
+        self._topological_order: Optional[List[int]] = None
+        self._chain_length: Optional[List[int]] = None
+        self._chain_next: Optional[List[int]] = None
+        self._reach: Optional[List[int]] = None
+
+    def _intern(self, node_id: str) -> int:
+        node = self.index.get(node_id)
+        if node is None:
+            node = len(self.ids)
+            self.index[node_id] = node
+            self.ids.append(node_id)
+            self.deps.append([])
+        return node
+
+    @property
+    def node_count(self) -> int:
+        """Number of nodes, including missing dependency IDs."""
+        return len(self.ids)
+
+    @property
+    def has_cycle(self) -> bool:
+        """True if any dependency cycle exists."""
+        return len(self.topological_order()) < self.node_count
+
+    def topological_order(self) -> List[int]:
+        """
+        Return node indices with every dependency before its dependents.
+
+        Uses Kahn's algorithm. Nodes on or downstream of a cycle cannot be
+        ordered and are left out.
+
+        Returns
+        -------
+        List[int]
+            Node indices in dependency-first order.
+        """
+        if self._topological_order is None:
+            remaining = [len(node_deps) for node_deps in self.deps]
+            ready = deque(node for node, count in enumerate(remaining) if not count)
+            order: List[int] = []
+            while ready:
+                node = ready.popleft()
+                order.append(node)
+                for dependent in self.dependents[node]:
+                    remaining[dependent] -= 1
+                    if not remaining[dependent]:
+                        ready.append(dependent)
+            self._topological_order = order
+        return self._topological_order
+
+    def chain_length(self, task_id: str) -> int:
+        """
+        Number of tasks on the longest dependency chain ending at a task.
+
+        Parameters
+        ----------
+        task_id : str
+            Task (or dependency) ID.
+
+        Returns
+        -------
+        int
+            Chain length counting the task itself; 0 for unknown IDs.
+        """
+        node = self.index.get(task_id)
+        if node is None:
+            return 0
+        self._compute_longest_paths()
+        assert self._chain_length is not None  # nosec B101
+        return self._chain_length[node]
+
+    def longest_chain(self, task_id: str) -> List[str]:
+        """
+        Longest dependency chain from a task down to a task with no deps.
+
+        Parameters
+        ----------
+        task_id : str
+            Task (or dependency) ID.
+
+        Returns
+        -------
+        List[str]
+            ``[task_id, dependency, dependency's dependency, ...]``; empty
+            for unknown IDs.
+        """
+        node = self.index.get(task_id)
+        if node is None:
+            return []
+        self._compute_longest_paths()
+        assert self._chain_next is not None  # nosec B101
+        chain = [self.ids[node]]
+        node = self._chain_next[node]
+        while node >= 0:
+            chain.append(self.ids[node])
+            node = self._chain_next[node]
+        return chain
+
+    def redundant_dependencies(self) -> List[Tuple[str, str]]:
+        """
+        Find dependencies already implied by another path.
+
+        A task's dependency on ``d`` is redundant when ``d`` is reachable
+        through at least one dependency edge from one of the task's direct
+        dependencies (``A -> B -> C`` makes ``A -> C`` redundant). Tasks
+        declaring fewer than two dependencies are skipped.
+
+        Returns
+        -------
+        List[Tuple[str, str]]
+            ``(task_id, redundant_dependency_id)`` pairs in task order.
+        """
+        reach = self._reachability()
+        redundant: List[Tuple[str, str]] = []
+        for node in range(self.task_count):
+            node_deps = self.deps[node]
+            if len(node_deps) < 2:
+                continue
+            through = 0
+            for dep in node_deps:
+                through |= reach[dep]
+            for dep in node_deps:
+                if through >> dep & 1:
+                    redundant.append((self.ids[node], self.ids[dep]))
+        return redundant
+
+    def transitive_reduction(self) -> Dict[str, List[str]]:
+        """
+        Return each task's dependencies with redundant ones removed.
+
+        Returns
+        -------
+        Dict[str, List[str]]
+            Task ID -> minimal list of dependency IDs, in declared order.
+        """
+        redundant: Dict[str, set] = {}
+        for task_id, dep_id in self.redundant_dependencies():
+            redundant.setdefault(task_id, set()).add(dep_id)
+        return {
+            self.ids[node]: [
+                self.ids[dep]
+                for dep in self.deps[node]
+                if self.ids[dep] not in redundant.get(self.ids[node], ())
+            ]
+            for node in range(self.task_count)
+        }
+
+    def _compute_longest_paths(self) -> None:
+        """
+        Longest chain per node via one memoised depth-first pass.
+
+        Exact on acyclic graphs, where ties go to the first declared
+        dependency. Inside a cycle the edge closing the cycle is ignored,
+        so chains stay finite; the cycle itself is reported separately.
+        """
+        if self._chain_length is not None:
+            return
+        count = self.node_count
+        length = [0] * count
+        nxt = [-1] * count
+        state = [0] * count  # 0 = new, 1 = on stack, 2 = done
+
+        for root in range(count):
+            if state[root]:
+                continue
+            state[root] = 1
+            stack = [(root, 0)]
+            while stack:
+                node, edge = stack[-1]
+                node_deps = self.deps[node]
+                if edge < len(node_deps):
+                    stack[-1] = (node, edge + 1)
+                    dep = node_deps[edge]
+                    if not state[dep]:
+                        state[dep] = 1
+                        stack.append((dep, 0))
+                    continue
+                stack.pop()
+                best = -1
+                best_length = 0
+                for dep in node_deps:
+                    if state[dep] == 2 and length[dep] > best_length:
+                        best, best_length = dep, length[dep]
+                length[node] = best_length + 1
+                nxt[node] = best
+                state[node] = 2
+
+        self._chain_length = length
+        self._chain_next = nxt
+
+    def _reachability(self) -> List[int]:
+        """
+        Bitset of nodes reachable through one or more edges, per node.
+
+        Collapses strongly connected components (iterative Tarjan), then
+        ORs successor bitsets in reverse topological order of the
+        condensation, so each edge costs one bitset union.
+        """
+        if self._reach is not None:
+            return self._reach
+
+        count = self.node_count
+        order = [-1] * count
+        low = [0] * count
+        on_stack = [False] * count
+        comp_stack: List[int] = []
+        components: List[List[int]] = []
+        counter = 0
+
+        for root in range(count):
+            if order[root] >= 0:
+                continue
+            order[root] = low[root] = counter
+            counter += 1
+            comp_stack.append(root)
+            on_stack[root] = True
+            work = [(root, 0)]
+            while work:
+                node, edge = work[-1]
+                node_deps = self.deps[node]
+                if edge < len(node_deps):
+                    work[-1] = (node, edge + 1)
+                    dep = node_deps[edge]
+                    if order[dep] < 0:
+                        order[dep] = low[dep] = counter
+                        counter += 1
+                        comp_stack.append(dep)
+                        on_stack[dep] = True
+                        work.append((dep, 0))
+                    elif on_stack[dep]:
+                        low[node] = min(low[node], order[dep])
+                    continue
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[node])
+                if low[node] == order[node]:
+                    component = []
+                    while True:
+                        member = comp_stack.pop()
+                        on_stack[member] = False
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
+
+        # Tarjan emits a component only after every component it reaches
+        reach = [0] * count
+        for component in components:
+            bits = 0
+            if len(component) > 1:
+                for member in component:
+                    bits |= 1 << member
+            for member in component:
+                for dep in self.deps[member]:
+                    bits |= (1 << dep) | reach[dep]
+            for member in component:
+                reach[member] = bits
+
+        self._reach = reach
+        return reach
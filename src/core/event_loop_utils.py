@@ -8,6 +8,7 @@ transport where each request might have its own event loop.
 
 import asyncio
 import threading
+from typing import Callable
 from weakref import WeakKeyDictionary
 
 
@@ -17,15 +18,21 @@ class EventLoopLockManager:
 
     This class ensures that locks are created in the correct event loop
     context, preventing "bound to a different event loop" errors.
+
+    Parameters
+    ----------
+    lock_factory : Callable[[], asyncio.Lock]
+        Creates each per-loop lock, e.g. an instrumented subclass.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, lock_factory: Callable[[], asyncio.Lock] = asyncio.Lock) -> None:
         """Initialize the lock manager."""
         # Use weak references to avoid keeping event loops alive
         self._locks: WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock] = (
             WeakKeyDictionary()
         )
         self._thread_lock = threading.Lock()
+        self._lock_factory = lock_factory
 
     def get_lock(self) -> asyncio.Lock:
         """
@@ -40,11 +47,11 @@ class EventLoopLockManager:
             loop = asyncio.get_running_loop()
         except RuntimeError:
             # No running loop, create a new lock that will bind when used
-            return asyncio.Lock()
+            return self._lock_factory()
 
         with self._thread_lock:
             if loop not in self._locks:
-                self._locks[loop] = asyncio.Lock()
+                self._locks[loop] = self._lock_factory()
             return self._locks[loop]
 
     def clear(self) -> None:
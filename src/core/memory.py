@@ -7,13 +7,14 @@ episodic, semantic, and procedural memory layers.
 """
 
 import asyncio
+import heapq
 import logging
 import os
 import statistics
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, FrozenSet, Iterator, List, Optional, Set, Tuple
 
 from src.core.events import Events, EventTypes
 from src.core.models import Task
@@ -125,6 +126,134 @@ class TaskPattern:
         return sum(self.recent_durations) / len(self.recent_durations)
 
 
+class OutcomeIndex:
+    """
+    Inverted token index over episodic task outcomes.
+
+    Outcomes are grouped by the word set of their task name, and each word
+    points at the groups containing it, so a similarity query only scores
+    name groups that share a word with the query instead of every outcome.
+    Per-agent insertion-ordered indexes serve agent history lookups.
+
+    Outcomes must be added oldest first and are evicted oldest first.
+    """
+
+    def __init__(self) -> None:
+        self._next_seq = 0
+        self._order: "OrderedDict[int, TaskOutcome]" = OrderedDict()
+        self._seq_tokens: Dict[int, FrozenSet[str]] = {}
+        self._groups: Dict[FrozenSet[str], "OrderedDict[int, TaskOutcome]"] = {}
+        self._postings: Dict[str, Set[FrozenSet[str]]] = defaultdict(set)
+        self._by_agent: Dict[str, "OrderedDict[int, TaskOutcome]"] = {}
+
+    def __len__(self) -> int:
+        """Return the number of indexed outcomes."""
+        return len(self._order)
+
+    @staticmethod
+    def tokenize(name: str) -> FrozenSet[str]:
+        """Word set used for name similarity."""
+        return frozenset(name.lower().split())
+
+    def add(self, outcome: TaskOutcome) -> None:
+        """Index a newly recorded outcome."""
+        seq = self._next_seq
+        self._next_seq += 1
+        tokens = self.tokenize(outcome.task_name)
+        self._order[seq] = outcome
+        self._seq_tokens[seq] = tokens
+        group = self._groups.get(tokens)
+        if group is None:
+            group = self._groups[tokens] = OrderedDict()
+            for token in tokens:
+                self._postings[token].add(tokens)
+        group[seq] = outcome
+        self._by_agent.setdefault(outcome.agent_id, OrderedDict())[seq] = outcome
+
+    def evict_oldest(self, count: int = 1) -> None:
+        """Drop the ``count`` oldest outcomes from every index."""
+        for _ in range(min(count, len(self._order))):
+            seq, outcome = self._order.popitem(last=False)
+            tokens = self._seq_tokens.pop(seq)
+            group = self._groups[tokens]
+            del group[seq]
+            if not group:
+                del self._groups[tokens]
+                for token in tokens:
+                    self._postings[token].discard(tokens)
+                    if not self._postings[token]:
+                        del self._postings[token]
+            agent_outcomes = self._by_agent[outcome.agent_id]
+            del agent_outcomes[seq]
+            if not agent_outcomes:
+                del self._by_agent[outcome.agent_id]
+
+    def for_agent(self, agent_id: str) -> List[TaskOutcome]:
+        """Outcomes recorded by an agent, oldest first."""
+        return list(self._by_agent.get(agent_id, {}).values())
+
+    def most_similar(self, task_name: str, limit: int) -> List[TaskOutcome]:
+        """
+        Top ``limit`` outcomes by Jaccard word overlap with ``task_name``.
+
+        Ties, including outcomes with no overlap that pad a short result,
+        go to the most recent outcome.
+
+        Parameters
+        ----------
+        task_name : str
+            Name of the task to compare against.
+        limit : int
+            Maximum number of outcomes to return.
+
+        Returns
+        -------
+        List[TaskOutcome]
+            Most similar outcomes, best first.
+        """
+        if limit <= 0:
+            return []
+        query = self.tokenize(task_name)
+        candidates: Set[FrozenSet[str]] = set()
+        for token in query:
+            candidates.update(self._postings.get(token, ()))
+
+        # Every top-k outcome lives in one of the top-k groups ranked by
+        # (similarity, newest outcome), so only those groups are expanded
+        ranked_groups = heapq.nlargest(
+            limit,
+            (
+                (
+                    len(query & tokens) / len(query | tokens),
+                    next(reversed(self._groups[tokens])),
+                    tokens,
+                )
+                for tokens in candidates
+            ),
+            key=lambda item: item[:2],
+        )
+
+        def _scored() -> Iterator[Tuple[float, int, TaskOutcome]]:
+            for similarity, _, tokens in ranked_groups:
+                group = self._groups[tokens]
+                for taken, seq in enumerate(reversed(group)):
+                    if taken >= limit:
+                        break
+                    yield similarity, seq, group[seq]
+
+        best = heapq.nlargest(limit, _scored(), key=lambda item: item[:2])
+        result = [outcome for _, _, outcome in best]
+
+        # Pad with the most recent non-matching outcomes
+        if len(result) < limit:
+            for seq in reversed(self._order):
+                if self._seq_tokens[seq] not in candidates:
+                    result.append(self._order[seq])
+                    if len(result) >= limit:
+                        break
+        return result
+
+
 class Memory:
     """
     Multi-tier memory system for Marcus.
@@ -137,7 +266,10 @@ class Memory:
     """
 
     def __init__(
-        self, events: Optional[Events] = None, persistence: Optional[Persistence] = None
+        self,
+        events: Optional[Events] = None,
+        persistence: Optional[Persistence] = None,
+        max_outcomes: Optional[int] = 10000,
     ):
         """
         Initialize the Memory system.
@@ -148,9 +280,13 @@ class Memory:
                 Optional Events system for integration.
             persistence
                 Optional Persistence for long-term storage.
+            max_outcomes
+                Number of most recent outcomes kept in episodic memory
+                (outcomes and timeline); ``None`` keeps everything.
         """
         self.events = events
         self.persistence = persistence
+        self.max_outcomes = max_outcomes
 
         # Working Memory (volatile, current state)
         self.working: Dict[str, Any] = {
@@ -179,6 +315,12 @@ class Memory:
             "optimizations": {},  # pattern -> optimization
         }
 
+        # Similarity / per-agent index over episodic["outcomes"], kept in
+        # sync lazily so outcomes appended directly are picked up too
+        self._outcome_index = OutcomeIndex()
+        self._indexed_outcomes: Optional[List[TaskOutcome]] = None
+        self._indexed_count = 0
+
         # Learning parameters
         self.learning_rate = 0.1
         self.memory_decay = 0.95  # How much to weight recent vs old experiences
@@ -231,6 +373,7 @@ class Memory:
                     ),
                 )
                 self.episodic["outcomes"].append(outcome)
+            self._apply_outcome_retention()
 
             # Load agent profiles
             if self.persistence:
@@ -312,6 +455,7 @@ class Memory:
         # Store in episodic memory
         self.episodic["outcomes"].append(outcome)
         self.episodic["timeline"][datetime.now(timezone.utc).date()].append(outcome)
+        self._apply_outcome_retention()
 
         # Update semantic memory (agent profile)
         await self._update_agent_profile(agent_id, outcome, task)
@@ -832,23 +976,19 @@ class Memory:
         # Analyze recent performance trends
         recent_outcomes = [
             o
-            for o in self.episodic["outcomes"]
-            if o.agent_id == agent_id
-            and o.completed_at
+            for o in self.get_agent_outcomes(agent_id)
+            if o.completed_at
             and (datetime.now(timezone.utc) - o.completed_at).days <= 30
         ]
 
         # Group by skill/label
         skill_performance = defaultdict(list)
+        tasks_by_id: Dict[str, Task] = {}
+        for t in self.working.get("all_tasks", []):
+            # First match wins, as with a linear search
+            tasks_by_id.setdefault(t.id, t)
         for outcome in recent_outcomes:
-            task = next(
-                (
-                    t
-                    for t in self.working.get("all_tasks", [])
-                    if t.id == outcome.task_id
-                ),
-                None,
-            )
+            task = tasks_by_id.get(outcome.task_id)
             if task and task.labels:
                 for label in task.labels:
                     skill_performance[label].append(
@@ -940,25 +1080,60 @@ class Memory:
         self, task: Task, limit: int = 5
     ) -> List[TaskOutcome]:
         """Find similar past task executions."""
-        similar = []
-
-        for outcome in reversed(self.episodic["outcomes"]):  # Recent first
-            # Simple similarity based on task name and labels
-            similarity = 0.0
-
-            # Name similarity (simple word overlap)
-            task_words = set(task.name.lower().split())
-            outcome_words = set(outcome.task_name.lower().split())
-            if task_words and outcome_words:
-                similarity += len(task_words & outcome_words) / len(
-                    task_words | outcome_words
-                )
-
-            similar.append((similarity, outcome))
-
-        # Sort by similarity and return top N
-        similar.sort(key=lambda x: x[0], reverse=True)
-        return [outcome for _, outcome in similar[:limit]]
+        # Similarity is Jaccard word overlap of task names, most recent
+        # first on ties; the inverted index only scores overlapping names.
+        self._sync_outcome_index()
+        return self._outcome_index.most_similar(task.name, limit)
+
+    def get_agent_outcomes(self, agent_id: str) -> List[TaskOutcome]:
+        """Outcomes recorded by an agent, oldest first."""
+        self._sync_outcome_index()
+        return self._outcome_index.for_agent(agent_id)
+
+    def _sync_outcome_index(self) -> None:
+        """Index outcomes appended to episodic memory since the last sync."""
+        outcomes = self.episodic["outcomes"]
+        if outcomes is not self._indexed_outcomes or len(outcomes) < (
+            self._indexed_count
+        ):
+            # Replaced or truncated outside Memory: rebuild from scratch
+            self._outcome_index = OutcomeIndex()
+            self._indexed_outcomes = outcomes
+            self._indexed_count = 0
+        for outcome in outcomes[self._indexed_count :]:
+            self._outcome_index.add(outcome)
+        self._indexed_count = len(outcomes)
+
+    def _apply_outcome_retention(self) -> None:
+        """Drop the oldest outcomes beyond ``max_outcomes`` and their timeline."""
+        self._sync_outcome_index()
+        outcomes = self.episodic["outcomes"]
+        if self.max_outcomes is None or len(outcomes) <= self.max_outcomes:
+            return
+        excess = len(outcomes) - self.max_outcomes
+        evicted = outcomes[:excess]
+        del outcomes[:excess]
+        self._outcome_index.evict_oldest(excess)
+        self._indexed_count = len(outcomes)
+        self._trim_timeline(evicted)
+
+    def _trim_timeline(self, evicted: List[TaskOutcome]) -> None:
+        """Drop evicted outcomes from the per-day timeline, oldest day first."""
+        pending = {id(outcome) for outcome in evicted}
+        timeline = self.episodic["timeline"]
+        for day in sorted(timeline):
+            if not pending:
+                break
+            kept = []
+            for event in timeline[day]:
+                if id(event) in pending:
+                    pending.discard(id(event))
+                else:
+                    kept.append(event)
+            if kept:
+                timeline[day] = kept
+            else:
+                del timeline[day]
 
     async def get_global_median_duration(self) -> float:
         """
@@ -112,11 +112,7 @@ class MemoryAdvanced(Memory):
 
     def _get_agent_task_history(self, agent_id: str) -> List[TaskOutcome]:
         """Get all task outcomes for an agent."""
-        return [
-            outcome
-            for outcome in self.episodic["outcomes"]
-            if outcome.agent_id == agent_id
-        ]
+        return self.get_agent_outcomes(agent_id)
 
     def _calculate_confidence(self, sample_size: int) -> float:
         """
@@ -0,0 +1,353 @@
+"""
+Serialized merge queue for agent worktree branches.
+
+When an agent completes a task, its ``marcus/{agent_id}`` branch is merged
+into ``main`` so dependent tasks can see the code (GH-250). Every merge
+checks out ``main`` in the same working tree, so two merges into one
+repository must never overlap, and the git subprocesses must not run on
+the event loop that serves every other agent's MCP calls.
+
+:class:`MergeQueue` runs one worker per repository that drains merge
+requests in FIFO order and executes git in a worker thread. Callers get a
+:class:`MergeTicket` back immediately and may wait for its result. A caller
+that stops waiting detaches the ticket: the merge keeps its place in the
+queue, and if it conflicts the result is held until the agent's next call
+collects it with :meth:`MergeQueue.take_unreported`. Conflicts are reported
+as structured data (conflicted file list) rather than raw git output.
+
+Queues are shared per repository through :func:`get_merge_queue`.
+"""
+
+import asyncio
+import logging
+import subprocess  # nosec B404
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+MERGE_QUEUED = "queued"
+MERGE_MERGED = "merged"
+MERGE_CONFLICTED = "conflicted"
+MERGE_SKIPPED = "skipped"
+MERGE_FAILED = "failed"
+
+
+@dataclass
+class MergeResult:
+    """
+    Outcome of merging one agent branch into the main branch.
+
+    Attributes
+    ----------
+    status : str
+        ``"merged"``, ``"conflicted"``, ``"skipped"`` (no agent branch or
+        not a git repository) or ``"failed"`` (git error).
+    agent_id : str
+        Agent whose branch was merged.
+    task_id : str
+        Task whose completion triggered the merge.
+    branch : str
+        Source branch, ``marcus/{agent_id}``.
+    target : str
+        Branch merged into.
+    conflicted_files : List[str]
+        Paths git reported as unmerged; empty unless ``status`` is
+        ``"conflicted"``.
+    detail : str
+        git's output for conflicts and failures.
+    duration_seconds : float
+        Time spent running git for this merge.
+    base_commit : Optional[str]
+        Tip of ``target`` before the merge, when it merged.
+    merge_commit : Optional[str]
+        Commit the merge created on ``target``; None when it did not
+        create one (nothing to merge).
+    branch_commit : Optional[str]
+        Tip of ``branch`` that was merged (or conflicted).
+    """
+
+    status: str
+    agent_id: str
+    task_id: str
+    branch: str
+    target: str
+    conflicted_files: List[str] = field(default_factory=list)
+    detail: str = ""
+    duration_seconds: float = 0.0
+    base_commit: Optional[str] = None
+    merge_commit: Optional[str] = None
+    branch_commit: Optional[str] = None
+
+    def conflict_details(self) -> Dict[str, Any]:
+        """Structured conflict description for tool responses."""
+        return {
+            "branch": self.branch,
+            "target": self.target,
+            "files": list(self.conflicted_files),
+            "detail": self.detail,
+        }
+
+
+@dataclass
+class MergeTicket:
+    """
+    Handle for a submitted merge.
+
+    Attributes
+    ----------
+    agent_id : str
+        Agent whose branch is queued.
+    task_id : str
+        Task whose completion triggered the merge.
+    position : int
+        Merges ahead of this one at submission time, including one in
+        progress (0 means it starts immediately).
+    future : asyncio.Future
+        Resolves to the :class:`MergeResult`.
+    detached : bool
+        True once the submitter stopped waiting; a conflict is then kept
+        for :meth:`MergeQueue.take_unreported`.
+    """
+
+    agent_id: str
+    task_id: str
+    position: int
+    future: "asyncio.Future[MergeResult]"
+    detached: bool = False
+
+
+class MergeQueue:
+    """
+    FIFO merge queue for one git repository.
+
+    Parameters
+    ----------
+    repo_path : Union[str, Path]
+        Working tree that holds the main branch.
+    main_branch : str
+        Branch agent branches are merged into.
+    """
+
+    def __init__(self, repo_path: Union[str, Path], main_branch: str = "main"):
+        self.repo_path = Path(repo_path)
+        self.main_branch = main_branch
+        self.results: Dict[str, MergeResult] = {}
+        self._pending: Deque[MergeTicket] = deque()
+        self._worker: Optional["asyncio.Task[None]"] = None
+        self._current: Optional[MergeTicket] = None
+        self._unreported: Dict[str, List[MergeResult]] = {}
+
+    @property
+    def depth(self) -> int:
+        """Merges waiting or running."""
+        return len(self._pending) + (1 if self._current is not None else 0)
+
+    def is_pending(self, agent_id: str) -> bool:
+        """Whether a merge of the agent's branch is waiting or running."""
+        tickets = [*self._pending, self._current]
+        return any(t is not None and t.agent_id == agent_id for t in tickets)
+
+    def submit(self, agent_id: str, task_id: str) -> MergeTicket:
+        """
+        Queue a merge of ``marcus/{agent_id}`` and return without waiting.
+
+        Must be called from a running event loop.
+
+        Parameters
+        ----------
+        agent_id : str
+            Agent whose branch should be merged.
+        task_id : str
+            Task whose completion triggered the merge.
+
+        Returns
+        -------
+        MergeTicket
+            Ticket whose ``future`` resolves when the merge has run.
+        """
+        loop = asyncio.get_running_loop()
+        ticket = MergeTicket(
+            agent_id=agent_id,
+            task_id=task_id,
+            position=self.depth,
+            future=loop.create_future(),
+        )
+        self._pending.append(ticket)
+        if (
+            self._worker is None
+            or self._worker.done()
+            or self._worker.get_loop() is not loop
+        ):
+            self._worker = loop.create_task(self._drain())
+        return ticket
+
+    async def merge(self, agent_id: str, task_id: str) -> MergeResult:
+        """Queue a merge and wait for its result."""
+        return await self.submit(agent_id, task_id).future
+
+    def last_result(self, agent_id: str) -> Optional[MergeResult]:
+        """Most recent merge outcome for an agent's branch, if any."""
+        return self.results.get(f"marcus/{agent_id}")
+
+    def detach(self, ticket: MergeTicket) -> None:
+        """
+        Stop waiting for ``ticket``.
+
+        If the merge conflicts (or already has), the result is kept until
+        :meth:`take_unreported` collects it for the agent.
+        """
+        ticket.detached = True
+        if ticket.future.done():
+            self._keep_unreported(ticket.future.result())
+
+    def take_unreported(self, agent_id: str) -> List[MergeResult]:
+        """Collect conflicts from detached merges of an agent's branch."""
+        return self._unreported.pop(agent_id, [])
+
+    def branch_tip(self, agent_id: str) -> Optional[str]:
+        """
+        Current commit of ``marcus/{agent_id}``, or None if it does not exist.
+
+        Runs git synchronously; call it from a worker thread.
+        """
+        tip = self._git(
+            "rev-parse", "--verify", "--quiet", f"refs/heads/marcus/{agent_id}"
+        )
+        return (tip.stdout.strip() or None) if tip.returncode == 0 else None
+
+    async def join(self) -> None:
+        """Wait until every merge submitted so far has run."""
+        while self._worker is not None and not self._worker.done():
+            await asyncio.shield(self._worker)
+
+    async def _drain(self) -> None:
+        while self._pending:
+            ticket = self._pending.popleft()
+            self._current = ticket
+            try:
+                result = await asyncio.to_thread(
+                    self._merge_branch, ticket.agent_id, ticket.task_id
+                )
+            except Exception as e:
+                result = self._result(
+                    MERGE_FAILED, ticket.agent_id, ticket.task_id, detail=str(e)
+                )
+            finally:
+                self._current = None
+            self.results[result.branch] = result
+            if ticket.detached:
+                self._keep_unreported(result)
+            if not ticket.future.done():
+                ticket.future.set_result(result)
+
+    def _keep_unreported(self, result: MergeResult) -> None:
+        if result.status == MERGE_CONFLICTED:
+            self._unreported.setdefault(result.agent_id, []).append(result)
+
+    def _result(
+        self, status: str, agent_id: str, task_id: str, **kwargs: Any
+    ) -> MergeResult:
+        return MergeResult(
+            status=status,
+            agent_id=agent_id,
+            task_id=task_id,
+            branch=f"marcus/{agent_id}",
+            target=self.main_branch,
+            **kwargs,
+        )
+
+    def _git(self, *args: str) -> "subprocess.CompletedProcess[str]":
+        return subprocess.run(  # nosec B603 B607
+            ["git", *args],
+            cwd=self.repo_path,
+            capture_output=True,
+            text=True,
+        )
+
+    def _merge_branch(self, agent_id: str, task_id: str) -> MergeResult:
+        """Run the merge synchronously; called in a worker thread."""
+        start = time.perf_counter()
+        branch = f"marcus/{agent_id}"
+
+        if self._git("rev-parse", "--git-dir").returncode != 0:
+            return self._result(MERGE_SKIPPED, agent_id, task_id)
+        if not self._git("branch", "--list", branch).stdout.strip():
+            # No worktree branch — agent worked on main directly
+            return self._result(MERGE_SKIPPED, agent_id, task_id)
+
+        logger.info(f"[worktree] Merging {branch} to main after task {task_id}")
+
+        checkout = self._git("checkout", self.main_branch)
+        if checkout.returncode != 0:
+            return self._result(
+                MERGE_FAILED,
+                agent_id,
+                task_id,
+                detail=checkout.stderr,
+                duration_seconds=time.perf_counter() - start,
+            )
+
+        base_commit = self._git("rev-parse", "HEAD").stdout.strip() or None
+        branch_commit = self._git("rev-parse", branch).stdout.strip() or None
+        merge = self._git(
+            "merge",
+            branch,
+            "--no-ff",
+            "-m",
+            f"Merge {branch} (task {task_id} by {agent_id})",
+        )
+        if merge.returncode == 0:
+            logger.info(f"[worktree] Successfully merged {branch} to main")
+            head = self._git("rev-parse", "HEAD").stdout.strip() or None
+            return self._result(
+                MERGE_MERGED,
+                agent_id,
+                task_id,
+                duration_seconds=time.perf_counter() - start,
+                base_commit=base_commit,
+                merge_commit=head if head != base_commit else None,
+                branch_commit=branch_commit,
+            )
+
+        unmerged = self._git("diff", "--name-only", "--diff-filter=U")
+        conflicted_files = [line for line in unmerged.stdout.splitlines() if line]
+        self._git("merge", "--abort")
+        logger.warning(
+            f"[worktree] Merge conflict for {branch}: {conflicted_files}"
+        )
+        return self._result(
+            MERGE_CONFLICTED,
+            agent_id,
+            task_id,
+            conflicted_files=conflicted_files,
+            detail=(merge.stdout + merge.stderr).strip(),
+            duration_seconds=time.perf_counter() - start,
+            branch_commit=branch_commit,
+        )
+
+
+# Global queue registry, one per repository
+_merge_queues: Dict[str, MergeQueue] = {}
+
+
+def get_merge_queue(
+    repo_path: Union[str, Path], main_branch: str = "main"
+) -> MergeQueue:
+    """
+    Get or create the shared merge queue for a repository.
+
+    ``main_branch`` is only used when the queue is first created.
+    """
+    key = str(Path(repo_path).resolve())
+    if key not in _merge_queues:
+        _merge_queues[key] = MergeQueue(key, main_branch)
+    return _merge_queues[key]
+
+
+def reset_merge_queues() -> None:
+    """Drop all shared merge queues (used by tests and benchmarks)."""
+    _merge_queues.clear()
@@ -0,0 +1,499 @@
+"""
+In-process latency histograms and counters with Prometheus text exposition.
+
+Marcus records tool-call latency, ``request_next_task`` phase timings,
+``assignment_lock`` contention and kanban provider latency here, and serves
+them from ``GET /metrics`` on the HTTP transports. Recording an observation
+is a dictionary lookup, a bisect over a dozen bucket bounds and a few
+additions under a lock, so the registry is always on.
+
+Usage
+-----
+>>> from src.core.metrics import get_metrics
+>>> metrics = get_metrics()
+>>> metrics.observe("marcus_tool_duration_seconds", 0.012, tool="ping")
+>>> metrics.inc("marcus_tool_calls_total", tool="ping", outcome="ok")
+>>> print(metrics.render())  # Prometheus text format
+"""
+
+import asyncio
+import inspect
+import logging
+import threading
+import time
+from bisect import bisect_left
+from functools import wraps
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, TypeVar
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds in seconds; wide enough for sub-millisecond lock waits and
+# multi-second LLM-backed tool calls
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+ClientT = TypeVar("ClientT")
+
+# name -> (type, help) for the metrics Marcus records
+METRIC_DESCRIPTIONS: Dict[str, Tuple[str, str]] = {
+    "marcus_tool_duration_seconds": (
+        "histogram",
+        "MCP tool call latency, including project scoping.",
+    ),
+    "marcus_tool_calls_total": (
+        "counter",
+        "MCP tool calls by outcome (ok, error, denied).",
+    ),
+    "marcus_tool_calls_in_flight": (
+        "gauge",
+        "MCP tool calls currently being handled.",
+    ),
+    "marcus_phase_duration_seconds": (
+        "histogram",
+        "Time spent in each internal phase of an operation.",
+    ),
+    "marcus_lock_wait_seconds": (
+        "histogram",
+        "Time spent waiting to acquire a lock.",
+    ),
+    "marcus_lock_hold_seconds": (
+        "histogram",
+        "Time a lock was held once acquired.",
+    ),
+    "marcus_lock_contended_total": (
+        "counter",
+        "Lock acquisitions that had to wait for another holder.",
+    ),
+    "marcus_lock_waiters": (
+        "gauge",
+        "Coroutines currently waiting for a lock.",
+    ),
+    "marcus_kanban_call_duration_seconds": (
+        "histogram",
+        "Kanban provider call latency.",
+    ),
+    "marcus_kanban_call_errors_total": (
+        "counter",
+        "Kanban provider calls that raised.",
+    ),
+    "marcus_admission_wait_seconds": (
+        "histogram",
+        "Time a tool call waited for an admission slot.",
+    ),
+    "marcus_admission_in_flight": (
+        "gauge",
+        "Tool calls holding an admission slot, by endpoint.",
+    ),
+    "marcus_admission_queued": (
+        "gauge",
+        "Tool calls waiting for an admission slot, by endpoint.",
+    ),
+    "marcus_board_health_score": (
+        "gauge",
+        "Board health score (0-100), updated as board changes arrive.",
+    ),
+    "marcus_admission_rejected_total": (
+        "counter",
+        "Tool calls shed with a retry_after response (queue_full, queue_timeout).",
+    ),
+    "marcus_circuit_state": (
+        "gauge",
+        "Circuit breaker state by dependency (0 closed, 1 half-open, 2 open).",
+    ),
+    "marcus_circuit_transitions_total": (
+        "counter",
+        "Circuit breaker state changes by dependency and new state.",
+    ),
+    "marcus_circuit_rejected_total": (
+        "counter",
+        "Calls refused by an open or probing circuit breaker.",
+    ),
+    "marcus_bulkhead_in_flight": (
+        "gauge",
+        "Calls holding a bulkhead slot, by dependency.",
+    ),
+    "marcus_bulkhead_queued": (
+        "gauge",
+        "Calls waiting for a bulkhead slot, by dependency.",
+    ),
+    "marcus_bulkhead_rejected_total": (
+        "counter",
+        "Calls rejected by a bulkhead (queue_full, queue_timeout).",
+    ),
+    "marcus_retries_total": (
+        "counter",
+        "Retries granted by a dependency's retry budget.",
+    ),
+    "marcus_retry_budget_exhausted_total": (
+        "counter",
+        "Retries skipped because a dependency's retry budget was spent.",
+    ),
+    "marcus_retry_budget_tokens": (
+        "gauge",
+        "Retries left in a dependency's budget after the last retry.",
+    ),
+}
+
+
+def _label_key(labels: Dict[str, Any]) -> LabelKey:
+    if not labels:
+        return ()
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(key: LabelKey, extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = list(key) + ([extra] if extra else [])
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in pairs) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class Histogram:
+    """
+    Fixed-bucket histogram.
+
+    Parameters
+    ----------
+    buckets : Sequence[float]
+        Sorted upper bounds; an implicit ``+Inf`` bucket is added.
+    """
+
+    __slots__ = ("bounds", "counts", "sum", "count")
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.bounds: Tuple[float, ...] = tuple(buckets)
+        self.counts: List[int] = [0] * (len(self.bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        """Record one value."""
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> List[Tuple[float, int]]:
+        """Return ``(upper bound, cumulative count)`` pairs ending with +Inf."""
+        total = 0
+        result = []
+        for bound, count in zip(self.bounds + (float("inf"),), self.counts):
+            total += count
+            result.append((bound, total))
+        return result
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate a quantile as the upper bound of the bucket containing it.
+
+        Returns ``0.0`` when empty and the largest finite bound when the
+        quantile falls in the ``+Inf`` bucket.
+        """
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        for bound, cumulative in self.cumulative():
+            if cumulative >= rank:
+                return bound if bound != float("inf") else self.bounds[-1]
+        return self.bounds[-1]
+
+
+class MetricsRegistry:
+    """
+    Thread-safe store of histograms, counters and gauges keyed by labels.
+
+    Parameters
+    ----------
+    buckets : Sequence[float]
+        Bucket bounds used for every histogram.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self._histograms: Dict[str, Dict[LabelKey, Histogram]] = {}
+        self._counters: Dict[str, Dict[LabelKey, float]] = {}
+        self._gauges: Dict[str, Dict[LabelKey, float]] = {}
+
+    def observe(self, name: str, value: float, /, **labels: Any) -> None:
+        """Record ``value`` in the histogram ``name`` for ``labels``."""
+        key = _label_key(labels)
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = Histogram(self.buckets)
+            histogram.observe(value)
+
+    def inc(self, name: str, amount: float = 1.0, /, **labels: Any) -> None:
+        """Add ``amount`` to the counter ``name`` for ``labels``."""
+        key = _label_key(labels)
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0.0) + amount
+
+    def add_gauge(self, name: str, amount: float, /, **labels: Any) -> None:
+        """Move the gauge ``name`` for ``labels`` up or down by ``amount``."""
+        key = _label_key(labels)
+        with self._lock:
+            series = self._gauges.setdefault(name, {})
+            series[key] = series.get(key, 0.0) + amount
+
+    def set_gauge(self, name: str, value: float, /, **labels: Any) -> None:
+        """Set the gauge ``name`` for ``labels``."""
+        key = _label_key(labels)
+        with self._lock:
+            self._gauges.setdefault(name, {})[key] = value
+
+    def histogram(self, name: str, /, **labels: Any) -> Optional[Histogram]:
+        """Return the histogram for ``name`` and ``labels``, if recorded."""
+        return self._histograms.get(name, {}).get(_label_key(labels))
+
+    def counter(self, name: str, /, **labels: Any) -> float:
+        """Return the counter value for ``name`` and ``labels`` (0 if unset)."""
+        return self._counters.get(name, {}).get(_label_key(labels), 0.0)
+
+    def gauge(self, name: str, /, **labels: Any) -> float:
+        """Return the gauge value for ``name`` and ``labels`` (0 if unset)."""
+        return self._gauges.get(name, {}).get(_label_key(labels), 0.0)
+
+    def reset(self) -> None:
+        """Drop every recorded series."""
+        with self._lock:
+            self._histograms.clear()
+            self._counters.clear()
+            self._gauges.clear()
+
+    def render(self) -> str:
+        """
+        Render all series in the Prometheus text exposition format.
+
+        Returns
+        -------
+        str
+            Exposition text ending with a newline.
+        """
+        with self._lock:
+            histograms = {
+                name: {
+                    key: (h.cumulative(), h.sum, h.count) for key, h in series.items()
+                }
+                for name, series in self._histograms.items()
+            }
+            counters = {n: dict(s) for n, s in self._counters.items()}
+            gauges = {n: dict(s) for n, s in self._gauges.items()}
+
+        lines: List[str] = []
+
+        def header(name: str, default_type: str) -> None:
+            metric_type, help_text = METRIC_DESCRIPTIONS.get(
+                name, (default_type, name.replace("_", " "))
+            )
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {metric_type}")
+
+        for name in sorted(histograms):
+            header(name, "histogram")
+            for key, (buckets, total, count) in sorted(histograms[name].items()):
+                for bound, cumulative in buckets:
+                    labels = _format_labels(key, ("le", _format_value(bound)))
+                    lines.append(f"{name}_bucket{labels} {cumulative}")
+                labels = _format_labels(key)
+                lines.append(f"{name}_sum{labels} {_format_value(total)}")
+                lines.append(f"{name}_count{labels} {count}")
+        for kind, table in (("counter", counters), ("gauge", gauges)):
+            for name in sorted(table):
+                header(name, kind)
+                for key, value in sorted(table[name].items()):
+                    lines.append(f"{name}{_format_labels(key)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+_registry = MetricsRegistry()
+
+
+def get_metrics() -> MetricsRegistry:
+    """Return the process-wide metrics registry."""
+    return _registry
+
+
+class PhaseTimer:
+    """
+    Record the time between successive named marks of one operation.
+
+    Each :meth:`mark` observes the time since the previous mark (or since
+    construction) in ``marcus_phase_duration_seconds`` with the operation
+    and phase as labels.
+
+    Parameters
+    ----------
+    operation : str
+        Operation label, e.g. ``"request_next_task"``.
+    registry : Optional[MetricsRegistry]
+        Registry to record into; the process-wide one by default.
+    """
+
+    __slots__ = ("operation", "registry", "_last")
+
+    def __init__(
+        self, operation: str, registry: Optional[MetricsRegistry] = None
+    ) -> None:
+        self.operation = operation
+        self.registry = registry or _registry
+        self._last = time.perf_counter()
+
+    def mark(self, phase: str) -> None:
+        """Close the current phase under the name ``phase``."""
+        now = time.perf_counter()
+        self.registry.observe(
+            "marcus_phase_duration_seconds",
+            now - self._last,
+            operation=self.operation,
+            phase=phase,
+        )
+        self._last = now
+
+
+class InstrumentedLock(asyncio.Lock):
+    """
+    ``asyncio.Lock`` that records wait time, hold time and contention.
+
+    Parameters
+    ----------
+    name : str
+        Value of the ``lock`` label.
+    registry : Optional[MetricsRegistry]
+        Registry to record into; the process-wide one by default.
+    """
+
+    def __init__(self, name: str, registry: Optional[MetricsRegistry] = None) -> None:
+        super().__init__()
+        self.name = name
+        self._registry = registry or _registry
+        self._acquired_at = 0.0
+
+    async def acquire(self) -> bool:
+        """Acquire the lock, recording how long the caller waited."""
+        registry = self._registry
+        if not self._has_holder_or_waiters():
+            acquired = await super().acquire()
+            self._acquired_at = time.perf_counter()
+            registry.observe("marcus_lock_wait_seconds", 0.0, lock=self.name)
+            return acquired
+
+        registry.inc("marcus_lock_contended_total", lock=self.name)
+        registry.add_gauge("marcus_lock_waiters", 1, lock=self.name)
+        start = time.perf_counter()
+        try:
+            acquired = await super().acquire()
+        finally:
+            registry.add_gauge("marcus_lock_waiters", -1, lock=self.name)
+        self._acquired_at = time.perf_counter()
+        registry.observe(
+            "marcus_lock_wait_seconds", self._acquired_at - start, lock=self.name
+        )
+        return acquired
+
+    def _has_holder_or_waiters(self) -> bool:
+        """Whether ``acquire`` would have to wait (mirrors ``asyncio.Lock``)."""
+        if self.locked():
+            return True
+        # Released but not yet handed to a waiter that is still pending
+        waiters = getattr(self, "_waiters", None)
+        return bool(waiters) and any(not w.cancelled() for w in waiters)
+
+    def release(self) -> None:
+        """Release the lock, recording how long it was held."""
+        held = time.perf_counter() - self._acquired_at
+        super().release()
+        self._registry.observe("marcus_lock_hold_seconds", held, lock=self.name)
+
+
+def instrument_kanban_client(
+    client: ClientT, registry: Optional[MetricsRegistry] = None
+) -> ClientT:
+    """
+    Time every public coroutine method of a kanban provider instance.
+
+    Methods are wrapped on the instance, so ``isinstance`` checks and the
+    provider class are unaffected. Calling this twice on the same instance
+    is a no-op.
+
+    Parameters
+    ----------
+    client : Any
+        Kanban provider instance.
+    registry : Optional[MetricsRegistry]
+        Registry to record into; the process-wide one by default.
+
+    Returns
+    -------
+    ClientT
+        The same ``client``.
+    """
+    if getattr(client, "_marcus_metrics_instrumented", False):
+        return client
+    registry = registry or _registry
+    provider = type(client).__name__
+
+    def wrap(method_name: str, method: Callable[..., Any]) -> Callable[..., Any]:
+        @wraps(method)
+        async def timed(*args: Any, **kwargs: Any) -> Any:
+            start = time.perf_counter()
+            try:
+                return await method(*args, **kwargs)
+            except Exception:
+                registry.inc(
+                    "marcus_kanban_call_errors_total",
+                    provider=provider,
+                    method=method_name,
+                )
+                raise
+            finally:
+                registry.observe(
+                    "marcus_kanban_call_duration_seconds",
+                    time.perf_counter() - start,
+                    provider=provider,
+                    method=method_name,
+                )
+
+        return timed
+
+    coroutine_methods = inspect.getmembers(type(client), inspect.iscoroutinefunction)
+    for method_name, _ in coroutine_methods:
+        if not method_name.startswith("_"):
+            method = getattr(client, method_name)
+            setattr(client, method_name, wrap(method_name, method))
+    setattr(client, "_marcus_metrics_instrumented", True)
+    return client
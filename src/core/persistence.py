@@ -34,6 +34,24 @@ class PersistenceBackend:
         """Retrieve data from a collection."""
         raise NotImplementedError
 
+    async def store_many(
+        self, collection: str, items: Dict[str, Dict[str, Any]]
+    ) -> None:
+        """Store several keys in a collection in one write where possible."""
+        for key, data in items.items():
+            await self.store(collection, key, data)
+
+    async def retrieve_many(
+        self, collection: str, keys: List[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Retrieve several keys from a collection, skipping missing ones."""
+        results: Dict[str, Dict[str, Any]] = {}
+        for key in keys:
+            data = await self.retrieve(collection, key)
+            if data is not None:
+                results[key] = data
+        return results
+
     async def query(
         self, collection: str, filter_func: Optional[Any] = None, limit: int = 100
     ) -> List[Dict[str, Any]]:
@@ -78,6 +96,14 @@ class FilePersistence(PersistenceBackend):
 
     async def store(self, collection: str, key: str, data: Dict[str, Any]) -> None:
         """Store data in a collection."""
+        await self.store_many(collection, {key: data})
+
+    async def store_many(
+        self, collection: str, items: Dict[str, Dict[str, Any]]
+    ) -> None:
+        """Store several keys with a single read-modify-write of the file."""
+        if not items:
+            return
         lock = self._get_lock(collection)
         async with lock:
             # Load existing data
@@ -93,10 +119,9 @@ class FilePersistence(PersistenceBackend):
                     logger.error(f"Error loading {collection}: {e}")
 
             # Update with new data
-            existing_data[key] = {
-                **data,
-                "_stored_at": datetime.now(timezone.utc).isoformat(),
-            }
+            stored_at = datetime.now(timezone.utc).isoformat()
+            for key, data in items.items():
+                existing_data[key] = {**data, "_stored_at": stored_at}
 
             # Write back atomically
             temp_file = file_path.with_suffix(".tmp")
@@ -128,6 +153,26 @@ class FilePersistence(PersistenceBackend):
                 logger.error(f"Error reading {collection}: {e}")
                 return None
 
+    async def retrieve_many(
+        self, collection: str, keys: List[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Retrieve several keys with a single read of the collection file."""
+        lock = self._get_lock(collection)
+        async with lock:
+            file_path = self._get_collection_file(collection)
+
+            if not file_path.exists():
+                return {}
+
+            try:
+                async with aiofiles.open(file_path, "r") as f:
+                    content = await f.read()
+                    data = json.loads(content) if content else {}
+                return {key: data[key] for key in keys if key in data}
+            except Exception as e:
+                logger.error(f"Error reading {collection}: {e}")
+                return {}
+
     async def query(
         self, collection: str, filter_func: Optional[Any] = None, limit: int = 100
     ) -> List[Dict[str, Any]]:
@@ -311,6 +356,54 @@ class SQLitePersistence(PersistenceBackend):
 
         await asyncio.get_event_loop().run_in_executor(None, _store)
 
+    async def store_many(
+        self, collection: str, items: Dict[str, Dict[str, Any]]
+    ) -> None:
+        """Store several keys in SQLite in one transaction."""
+        if not items:
+            return
+
+        def _store_many() -> None:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.executemany(
+                    """
+                    INSERT OR REPLACE INTO persistence (collection, key, data)
+                    VALUES (?, ?, ?)
+                """,
+                    [
+                        (collection, key, json.dumps(data, default=str))
+                        for key, data in items.items()
+                    ],
+                )
+                conn.commit()
+
+        await asyncio.get_event_loop().run_in_executor(None, _store_many)
+
+    async def retrieve_many(
+        self, collection: str, keys: List[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Retrieve several keys from SQLite in one query per chunk."""
+        if not keys:
+            return {}
+
+        def _retrieve_many() -> Dict[str, Dict[str, Any]]:
+            results: Dict[str, Dict[str, Any]] = {}
+            with sqlite3.connect(self.db_path) as conn:
+                # Stay well under SQLITE_MAX_VARIABLE_NUMBER
+                for i in range(0, len(keys), 500):
+                    chunk = keys[i : i + 500]
+                    marks = ",".join("?" * len(chunk))
+                    cursor = conn.execute(
+                        f"SELECT key, data FROM persistence "  # nosec B608
+                        f"WHERE collection = ? AND key IN ({marks})",
+                        (collection, *chunk),
+                    )
+                    for row in cursor:
+                        results[row[0]] = json.loads(row[1])
+            return results
+
+        return await asyncio.get_event_loop().run_in_executor(None, _retrieve_many)
+
     async def retrieve(self, collection: str, key: str) -> Optional[Dict[str, Any]]:
         """Retrieve data from SQLite."""
 
@@ -585,6 +678,18 @@ class Persistence:
         """Retrieve arbitrary data from a collection."""
         return await self.backend.retrieve(collection, key)
 
+    async def store_many(
+        self, collection: str, items: Dict[str, Dict[str, Any]]
+    ) -> None:
+        """Store several keys in a collection in one backend write."""
+        await self.backend.store_many(collection, items)
+
+    async def retrieve_many(
+        self, collection: str, keys: List[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Retrieve several keys from a collection."""
+        return await self.backend.retrieve_many(collection, keys)
+
     async def query(
         self, collection: str, filter_func: Optional[Any] = None, limit: int = 100
     ) -> List[Dict[str, Any]]:
@@ -6,16 +6,20 @@ for multiple concurrent projects.
 
 import asyncio
 import logging
+import sys
 from collections import OrderedDict
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta, timezone
+from functools import partial
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Set, Tuple
 
 from src.config.marcus_config import get_config
 from src.core.assignment_persistence import AssignmentPersistence
 from src.core.context import Context
 from src.core.event_loop_utils import EventLoopLockManager
 from src.core.events import Events
+from src.core.metrics import InstrumentedLock
 from src.core.models import ProjectState
 from src.core.persistence import Persistence
 from src.core.project_registry import ProjectConfig, ProjectRegistry
@@ -26,11 +30,36 @@ from src.logging.conversation_logger import conversation_logger
 logger = logging.getLogger(__name__)
 
 
+# Tasks sampled when estimating a project's in-memory footprint
+MEMORY_SAMPLE_SIZE = 20
+
+
+def _approximate_size(value: Any) -> int:
+    """Shallow size of ``value`` plus one level of its attributes/items."""
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        items = value.values()
+    elif isinstance(value, (list, tuple, set)):
+        items = value
+    else:
+        items = getattr(value, "__dict__", {}).values()
+    for item in items:
+        size += sys.getsizeof(item)
+    return size
+
+
 class ProjectContext:
-    """Container for project-specific state and services."""
+    """Container for project-specific state and services.
+
+    Besides the services created by ``ProjectContextManager``, a context
+    holds the runtime state the server needs to serve a project's agents
+    (task list, in-flight assignments, assignment lock and lease manager),
+    so several projects can be served at once without switching.
+    """
 
     def __init__(self, project_id: str):
         self.project_id = project_id
+        self.project_name: Optional[str] = None
         self.kanban_client: Optional[KanbanInterface] = None
         self.context: Optional[Context] = None
         self.events: Optional[Events] = None
@@ -39,6 +68,75 @@ class ProjectContext:
         self.last_accessed = datetime.now(timezone.utc)
         self.is_connected = False
 
+        # Runtime state for serving this project's agents
+        self.project_tasks: List[Any] = []
+        self.tasks_being_assigned: Set[str] = set()
+        self.lease_manager: Optional[Any] = None
+        self.lease_monitor: Optional[Any] = None
+        self.assignment_monitor: Optional[Any] = None
+        self.board_snapshot: Optional[Any] = None
+        self.board_health: Optional[Any] = None
+        self.code_analyzer: Optional[Any] = None
+        self._subtasks_migrated = False
+        self._lock_manager = EventLoopLockManager(
+            partial(InstrumentedLock, "assignment")
+        )
+
+        # Tool calls currently using this context; pinned contexts are
+        # never evicted
+        self.active_calls = 0
+        self._size_estimate: Optional[Tuple[int, int, int]] = None
+
+    @property
+    def assignment_lock(self) -> asyncio.Lock:
+        """Get this project's assignment lock for the current event loop."""
+        return self._lock_manager.get_lock()
+
+    def touch(self) -> None:
+        """Mark the context as recently used."""
+        self.last_accessed = datetime.now(timezone.utc)
+
+    def estimated_memory_bytes(self) -> int:
+        """Estimate the memory held by this project's task list.
+
+        Sizes a sample of tasks and scales by the task count. The estimate
+        is cached until the task list is replaced or changes length.
+
+        Returns
+        -------
+        int
+            Approximate size in bytes.
+        """
+        tasks = self.project_tasks
+        key = (id(tasks), len(tasks))
+        if self._size_estimate and self._size_estimate[:2] == key:
+            return self._size_estimate[2]
+
+        estimate = sys.getsizeof(tasks)
+        if tasks:
+            step = max(1, len(tasks) // MEMORY_SAMPLE_SIZE)
+            sample = tasks[::step][:MEMORY_SAMPLE_SIZE]
+            per_task = sum(_approximate_size(t) for t in sample) / len(sample)
+            estimate += int(per_task * len(tasks))
+        self._size_estimate = (key[0], key[1], estimate)
+        return estimate
+
+    async def stop_monitors(self) -> None:
+        """Stop the monitors and board snapshot owned by this context."""
+        if self.board_health is not None:
+            self.board_health.detach()
+        for monitor in (
+            self.lease_monitor,
+            self.assignment_monitor,
+            self.board_snapshot,
+        ):
+            if monitor is None:
+                continue
+            try:
+                await monitor.stop()
+            except Exception as e:
+                logger.error(f"Error stopping monitor for {self.project_id}: {e}")
+
 
 class ProjectContextManager:
     """Manages multiple project contexts with state isolation.
@@ -51,12 +149,15 @@ class ProjectContextManager:
     """
 
     MAX_CACHED_PROJECTS = 10
+    MAX_MEMORY_MB = 512.0
     IDLE_TIMEOUT_MINUTES = 30
 
     def __init__(
         self,
         registry: Optional[ProjectRegistry] = None,
         global_context: Optional[Context] = None,
+        max_cached_projects: Optional[int] = None,
+        max_memory_mb: Optional[float] = None,
     ):
         """Initialize the project context manager.
 
@@ -66,8 +167,18 @@ class ProjectContextManager:
             Optional project registry instance.
         global_context : Optional[Context]
             Optional global context instance to update with project_id changes.
+        max_cached_projects : Optional[int]
+            Most project contexts kept loaded; least recently used idle
+            projects are evicted beyond this. Defaults to MAX_CACHED_PROJECTS.
+        max_memory_mb : Optional[float]
+            Estimated task-list memory allowed across cached projects before
+            idle projects are evicted. Defaults to MAX_MEMORY_MB.
         """
         self.registry = registry or ProjectRegistry()
+        self.max_cached_projects = max_cached_projects or self.MAX_CACHED_PROJECTS
+        self.max_memory_mb = (
+            max_memory_mb if max_memory_mb is not None else self.MAX_MEMORY_MB
+        )
         self.persistence = Persistence()
         self.config = get_config()
 
@@ -132,8 +243,9 @@ class ProjectContextManager:
             except asyncio.CancelledError:
                 pass
 
-        # Disconnect all clients
+        # Stop per-project monitors and disconnect all clients
         for context in self.contexts.values():
+            await context.stop_monitors()
             if context.kanban_client and context.is_connected:
                 try:
                     await context.kanban_client.disconnect()
@@ -289,6 +401,79 @@ class ProjectContextManager:
         context = self.contexts.get(self.active_project_id)
         return context.assignment_persistence if context else None
 
+    async def get_context(self, project_id: str) -> Optional[ProjectContext]:
+        """Get a project's context, loading it if needed, without switching.
+
+        The active project is left unchanged, so agents of several projects
+        can be served side by side. Loading a context may evict least
+        recently used idle contexts to stay within the cache limits.
+
+        Parameters
+        ----------
+        project_id : str
+            Project ID to load.
+
+        Returns
+        -------
+        Optional[ProjectContext]
+            The project's context, or None if the project is not registered.
+        """
+        context = self.contexts.get(project_id)
+        if context is not None:
+            context.touch()
+            self.contexts.move_to_end(project_id)
+            return context
+
+        async with self.lock:
+            context = self.contexts.get(project_id)
+            if context is None:
+                project = await self.registry.get_project(project_id)
+                if not project:
+                    logger.warning(f"Project {project_id} not found")
+                    return None
+                context = await self._get_or_create_context(project)
+            context.touch()
+            self.contexts.move_to_end(project_id)
+            await self._cleanup_old_contexts(keep=project_id)
+            return context
+
+    @asynccontextmanager
+    async def use_project(
+        self, project_id: str
+    ) -> AsyncIterator[Optional[ProjectContext]]:
+        """Pin a project's context for the duration of a tool call.
+
+        Parameters
+        ----------
+        project_id : str
+            Project ID to load and pin.
+
+        Yields
+        ------
+        Optional[ProjectContext]
+            The pinned context, which cannot be evicted until the block
+            exits, or None if the project is not registered.
+        """
+        context = await self.get_context(project_id)
+        if context is None:
+            yield None
+            return
+        context.active_calls += 1
+        try:
+            yield context
+        finally:
+            context.active_calls -= 1
+            context.touch()
+
+    def memory_usage_bytes(self) -> int:
+        """Estimated task-list memory held by all cached contexts."""
+        return sum(c.estimated_memory_bytes() for c in self.contexts.values())
+
+    async def enforce_limits(self) -> None:
+        """Evict idle contexts until the count and memory caps are met."""
+        async with self.lock:
+            await self._cleanup_old_contexts()
+
     async def _get_or_create_context(self, project: ProjectConfig) -> ProjectContext:
         """Get existing context or create new one."""
         if project.id in self.contexts:
@@ -314,6 +499,7 @@ class ProjectContextManager:
 
         # Create new context
         context = ProjectContext(project.id)
+        context.project_name = project.name
 
         # Create kanban client
         provider_config = self._build_provider_config(project)
@@ -446,21 +632,47 @@ class ProjectContextManager:
             return None  # TODO: Implement state reconstruction
         return None
 
-    async def _cleanup_old_contexts(self) -> None:
-        """Cleanup old contexts if exceeding cache limit."""
-        if len(self.contexts) <= self.MAX_CACHED_PROJECTS:
+    def _is_evictable(self, project_id: str, context: ProjectContext) -> bool:
+        """Whether a context may be evicted (not active and not in use)."""
+        return project_id != self.active_project_id and context.active_calls == 0
+
+    async def _cleanup_old_contexts(self, keep: Optional[str] = None) -> None:
+        """Evict least recently used idle contexts beyond the cache limits.
+
+        Contexts are evicted oldest first while more than
+        ``max_cached_projects`` are loaded or their estimated task memory
+        exceeds ``max_memory_mb``. The active project, ``keep`` and contexts
+        pinned by in-flight tool calls are never evicted.
+
+        Parameters
+        ----------
+        keep : Optional[str]
+            A project ID that was just requested and must stay loaded.
+        """
+        memory_cap = int(self.max_memory_mb * 1024 * 1024)
+        sizes = {pid: c.estimated_memory_bytes() for pid, c in self.contexts.items()}
+        count = len(sizes)
+        total = sum(sizes.values())
+        if count <= self.max_cached_projects and total <= memory_cap:
             return
 
-        # Remove oldest contexts (excluding active)
         to_remove = []
-        for project_id in self.contexts:
-            if project_id != self.active_project_id:
-                to_remove.append(project_id)
-                if len(self.contexts) - len(to_remove) <= self.MAX_CACHED_PROJECTS:
-                    break
+        for project_id, context in self.contexts.items():
+            if count <= self.max_cached_projects and total <= memory_cap:
+                break
+            if project_id == keep or not self._is_evictable(project_id, context):
+                continue
+            to_remove.append(project_id)
+            count -= 1
+            total -= sizes[project_id]
 
         for project_id in to_remove:
             await self._remove_context(project_id)
+        if total > memory_cap:
+            logger.warning(
+                f"Project contexts use ~{total / 1024 / 1024:.1f}MB, above the "
+                f"{self.max_memory_mb:.0f}MB cap, but none are idle"
+            )
 
     async def _remove_context(self, project_id: str) -> None:
         """Remove and cleanup a project context."""
@@ -471,6 +683,9 @@ class ProjectContextManager:
         # Save state
         await self._save_project_state(project_id)
 
+        # Stop the project's lease/assignment monitors
+        await context.stop_monitors()
+
         # Disconnect client
         if context.kanban_client and context.is_connected:
             try:
@@ -495,7 +710,7 @@ class ProjectContextManager:
                     to_remove = []
                     for project_id, context in self.contexts.items():
                         if (
-                            project_id != self.active_project_id
+                            self._is_evictable(project_id, context)
                             and context.last_accessed < idle_threshold
                         ):
                             to_remove.append(project_id)
@@ -3,19 +3,47 @@ Resilience patterns for Marcus enhanced features.
 
 Provides decorators and utilities for graceful degradation, circuit breakers,
 and retry logic to ensure Marcus continues working even when components fail.
+
+Protection is kept per dependency (``"ai_provider"``, ``"kanban"``...) in
+process-wide registries, so every caller of a dependency shares it:
+
+- :class:`CircuitBreaker` stops calls to a failing dependency and, once
+  ``recovery_timeout`` has passed, lets only ``half_open_max_calls`` probes
+  through at a time;
+- :class:`Bulkhead` caps concurrent calls and sheds callers once its
+  queue is full;
+- :class:`RetryBudget` is a token bucket every retry draws from, so when a
+  dependency degrades the whole process retries at a bounded rate instead
+  of each caller retrying on its own schedule.
+
+:func:`get_resilience_stats` reports their state for monitoring; the same
+figures are published as ``marcus_circuit_*``, ``marcus_bulkhead_*`` and
+``marcus_retry_*`` metrics.
 """
 
 import asyncio
 import logging
 import secrets
+import threading
 import time
+from collections import deque
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from functools import wraps
-from typing import Any, Callable, Dict, Optional
+from typing import Any, AsyncIterator, Callable, Deque, Dict, Optional
+
+from src.core.metrics import get_metrics
 
 logger = logging.getLogger(__name__)
 
+CIRCUIT_CLOSED = "closed"
+CIRCUIT_OPEN = "open"
+CIRCUIT_HALF_OPEN = "half-open"
+
+# Value of the marcus_circuit_state gauge for each state
+_CIRCUIT_STATE_VALUES = {CIRCUIT_CLOSED: 0, CIRCUIT_HALF_OPEN: 1, CIRCUIT_OPEN: 2}
+
 
 @dataclass
 class RetryConfig:
@@ -30,57 +58,491 @@ class RetryConfig:
 
 @dataclass
 class CircuitBreakerConfig:
-    """Configuration for circuit breaker behavior."""
+    """Configuration for circuit breaker behavior.
+
+    ``half_open_max_calls`` is how many probe calls may be in flight once
+    the recovery timeout has passed; everyone else is still refused until
+    a probe succeeds (closing the circuit) or fails (reopening it).
+    ``ignore_exception`` marks errors that are not counted as failures
+    even though they match ``expected_exception``, such as rate limits
+    that a caller already backs off from on its own.
+    """
 
     failure_threshold: int = 5
     recovery_timeout: float = 60.0
     expected_exception: type = Exception
+    half_open_max_calls: int = 1
+    ignore_exception: Optional[Callable[[BaseException], bool]] = None
+
+
+@dataclass
+class BulkheadConfig:
+    """Configuration for bulkhead behavior.
+
+    Parameters
+    ----------
+    max_concurrent : int
+        Calls to the dependency that may run at once.
+    max_queued : int
+        Calls that may wait for a slot before new ones are rejected.
+    max_queue_wait : float
+        Seconds a call may wait for a slot before it is rejected.
+    """
+
+    max_concurrent: int = 10
+    max_queued: int = 50
+    max_queue_wait: float = 30.0
+
+
+@dataclass
+class RetryBudgetConfig:
+    """Configuration for a shared retry budget.
+
+    Parameters
+    ----------
+    capacity : float
+        Retries that may happen in a burst.
+    refill_per_second : float
+        Sustained retry rate across every caller of the dependency.
+    """
+
+    capacity: float = 20.0
+    refill_per_second: float = 2.0
+
+
+class CircuitOpenError(Exception):
+    """A call was refused because the dependency's circuit is open.
+
+    Attributes
+    ----------
+    name : str
+        Dependency the circuit protects.
+    retry_after : float
+        Seconds until the circuit lets a probe through.
+    """
+
+    def __init__(self, name: str, retry_after: float = 0.0):
+        self.name = name
+        self.retry_after = retry_after
+        super().__init__(f"Circuit breaker '{name}' is open")
+
+
+class BulkheadFull(Exception):
+    """A call was rejected because the dependency's bulkhead is saturated.
+
+    Attributes
+    ----------
+    name : str
+        Dependency the bulkhead protects.
+    reason : str
+        ``"queue_full"`` or ``"queue_timeout"``.
+    """
+
+    def __init__(self, name: str, reason: str):
+        self.name = name
+        self.reason = reason
+        super().__init__(f"Bulkhead '{name}' rejected call ({reason})")
 
 
 class CircuitBreaker:
-    """Circuit breaker pattern implementation."""
+    """Circuit breaker pattern implementation.
+
+    State changes are made under a lock, so concurrent callers (coroutines
+    or threads) observe one transition: when the recovery timeout passes,
+    only ``half_open_max_calls`` of them become probes.
+
+    Parameters
+    ----------
+    name : str
+        Dependency the breaker protects; used as the metrics label.
+    config : CircuitBreakerConfig, optional
+        Thresholds and timeouts.
+    clock : Callable[[], float], optional
+        Monotonic clock, injectable for deterministic tests.
+    """
 
-    def __init__(self, name: str, config: CircuitBreakerConfig):
+    def __init__(
+        self,
+        name: str,
+        config: Optional[CircuitBreakerConfig] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
         self.name = name
-        self.config = config
+        self.config = config or CircuitBreakerConfig()
         self.failure_count = 0
         self.last_failure_time: Optional[datetime] = None
-        self.state = "closed"  # closed, open, half-open
+        self.state = CIRCUIT_CLOSED
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._opened_at = 0.0
+        self._probes = 0
+        self._rejected = 0
+        self._times_opened = 0
+        get_metrics().set_gauge("marcus_circuit_state", 0, dependency=name)
+
+    def allow_request(self) -> bool:
+        """Return whether a call may proceed, taking a probe slot if half-open.
+
+        A caller that is allowed through must report back with
+        :meth:`record_success`, :meth:`record_failure` or :meth:`release`.
+        """
+        with self._lock:
+            if self.state == CIRCUIT_OPEN:
+                if self._clock() - self._opened_at <= self.config.recovery_timeout:
+                    return self._refuse()
+                self._transition(CIRCUIT_HALF_OPEN)
+            if self.state == CIRCUIT_HALF_OPEN:
+                if self._probes >= self.config.half_open_max_calls:
+                    return self._refuse()
+                self._probes += 1
+            return True
 
     def is_open(self) -> bool:
-        """Check if circuit is open (failing)."""
-        if self.state == "open":
-            # Check if we should try half-open
-            if self.last_failure_time:
-                elapsed = (
-                    datetime.now(timezone.utc) - self.last_failure_time
-                ).total_seconds()
-                if elapsed > self.config.recovery_timeout:
-                    self.state = "half-open"
-                    return False
-            return True
-        return False
+        """Check if circuit is open (failing) without taking a probe slot."""
+        with self._lock:
+            if (
+                self.state == CIRCUIT_OPEN
+                and self._clock() - self._opened_at > self.config.recovery_timeout
+            ):
+                self._transition(CIRCUIT_HALF_OPEN)
+            if self.state == CIRCUIT_HALF_OPEN:
+                return self._probes >= self.config.half_open_max_calls
+            return self.state == CIRCUIT_OPEN
 
     def record_success(self) -> None:
         """Record successful call."""
-        self.failure_count = 0
-        self.state = "closed"
+        with self._lock:
+            self.failure_count = 0
+            if self.state != CIRCUIT_CLOSED:
+                logger.info(f"Circuit breaker '{self.name}' closed")
+                self._transition(CIRCUIT_CLOSED)
 
     def record_failure(self) -> None:
         """Record failed call."""
-        self.failure_count += 1
-        self.last_failure_time = datetime.now(timezone.utc)
+        with self._lock:
+            self.failure_count += 1
+            self.last_failure_time = datetime.now(timezone.utc)
+            if self.state == CIRCUIT_OPEN:
+                return
+            if (
+                self.state == CIRCUIT_HALF_OPEN
+                or self.failure_count >= self.config.failure_threshold
+            ):
+                self._opened_at = self._clock()
+                self._times_opened += 1
+                self._transition(CIRCUIT_OPEN)
+                logger.warning(
+                    f"Circuit breaker '{self.name}' opened after "
+                    f"{self.failure_count} failures"
+                )
+
+    def release(self) -> None:
+        """Give back a probe slot for a call that neither succeeded nor failed.
+
+        Used when a call ends with an exception the breaker does not count,
+        such as cancellation.
+        """
+        with self._lock:
+            if self.state == CIRCUIT_HALF_OPEN and self._probes:
+                self._probes -= 1
+
+    def retry_after(self) -> float:
+        """Return seconds until the circuit lets a probe through (0 if it would)."""
+        with self._lock:
+            if self.state != CIRCUIT_OPEN:
+                return 0.0
+            remaining = self._opened_at + self.config.recovery_timeout - self._clock()
+            return max(0.0, remaining)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return the breaker's state and counters."""
+        retry_after = self.retry_after()
+        with self._lock:
+            return {
+                "state": self.state,
+                "failure_count": self.failure_count,
+                "probes_in_flight": self._probes,
+                "rejected": self._rejected,
+                "times_opened": self._times_opened,
+                "retry_after": round(retry_after, 3),
+            }
+
+    def _refuse(self) -> bool:
+        self._rejected += 1
+        get_metrics().inc("marcus_circuit_rejected_total", dependency=self.name)
+        return False
 
-        if self.failure_count >= self.config.failure_threshold:
-            self.state = "open"
-            logger.warning(
-                f"Circuit breaker '{self.name}' opened after "
-                f"{self.failure_count} failures"
-            )
+    def _transition(self, state: str) -> None:
+        self.state = state
+        self._probes = 0
+        metrics = get_metrics()
+        metrics.set_gauge(
+            "marcus_circuit_state", _CIRCUIT_STATE_VALUES[state], dependency=self.name
+        )
+        metrics.inc(
+            "marcus_circuit_transitions_total", dependency=self.name, state=state
+        )
+
+
+class Bulkhead:
+    """Concurrency cap with a bounded FIFO queue for one dependency.
+
+    Waiters are futures created on the caller's running loop, so the
+    bulkhead is for coroutines only.
+
+    Parameters
+    ----------
+    name : str
+        Dependency the bulkhead protects; used as the metrics label.
+    config : BulkheadConfig, optional
+        Concurrency and queue limits.
+
+    Examples
+    --------
+    >>> async with get_bulkhead("kanban").slot():
+    ...     await kanban_client.get_all_tasks()
+    """
 
+    def __init__(self, name: str, config: Optional[BulkheadConfig] = None):
+        self.name = name
+        self.config = config or BulkheadConfig()
+        self._in_flight = 0
+        self._waiters: Deque["asyncio.Future[None]"] = deque()
+        self._admitted = 0
+        self._rejected = 0
+        self._peak_in_flight = 0
+
+    @property
+    def in_flight(self) -> int:
+        """Calls currently holding a slot."""
+        return self._in_flight
+
+    @property
+    def queued(self) -> int:
+        """Calls currently waiting for a slot."""
+        return len(self._waiters)
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold a slot for the duration of the ``async with`` body.
+
+        Raises
+        ------
+        BulkheadFull
+            If the queue is full or the call waited longer than
+            ``max_queue_wait`` for a slot.
+        """
+        await self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
+
+    async def acquire(self) -> None:
+        """Wait for a slot; pair with :meth:`release`."""
+        if self._in_flight < self.config.max_concurrent and not self._waiters:
+            self._take()
+            return
+        if len(self._waiters) >= self.config.max_queued:
+            raise self._reject("queue_full")
+
+        waiter: "asyncio.Future[None]" = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        get_metrics().add_gauge("marcus_bulkhead_queued", 1, dependency=self.name)
+        try:
+            await asyncio.wait_for(waiter, self.config.max_queue_wait)
+        except asyncio.TimeoutError:
+            self._forget(waiter)
+            raise self._reject("queue_timeout") from None
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Slot was handed over just before cancellation; pass it on.
+                self.release()
+            else:
+                self._forget(waiter)
+            raise
+
+    def release(self) -> None:
+        """Free a slot, handing it to the longest-waiting caller if any."""
+        metrics = get_metrics()
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            metrics.add_gauge("marcus_bulkhead_queued", -1, dependency=self.name)
+            if not waiter.done():
+                self._admitted += 1
+                waiter.set_result(None)
+                return
+        self._in_flight = max(0, self._in_flight - 1)
+        metrics.add_gauge("marcus_bulkhead_in_flight", -1, dependency=self.name)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return slot usage and counters."""
+        return {
+            "max_concurrent": self.config.max_concurrent,
+            "in_flight": self._in_flight,
+            "queued": self.queued,
+            "admitted": self._admitted,
+            "rejected": self._rejected,
+            "peak_in_flight": self._peak_in_flight,
+        }
+
+    def _take(self) -> None:
+        self._in_flight += 1
+        self._admitted += 1
+        self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+        get_metrics().add_gauge("marcus_bulkhead_in_flight", 1, dependency=self.name)
+
+    def _forget(self, waiter: "asyncio.Future[None]") -> None:
+        try:
+            self._waiters.remove(waiter)
+        except ValueError:
+            return
+        get_metrics().add_gauge("marcus_bulkhead_queued", -1, dependency=self.name)
+
+    def _reject(self, reason: str) -> BulkheadFull:
+        self._rejected += 1
+        get_metrics().inc(
+            "marcus_bulkhead_rejected_total", dependency=self.name, reason=reason
+        )
+        return BulkheadFull(self.name, reason)
+
+
+class RetryBudget:
+    """Token bucket shared by every caller retrying one dependency.
+
+    Each retry takes a token; first attempts are never charged. When the
+    bucket is empty, callers give up with their last error instead of
+    adding to the load on a dependency that is already struggling.
+
+    Parameters
+    ----------
+    name : str
+        Dependency the budget covers; used as the metrics label.
+    config : RetryBudgetConfig, optional
+        Burst size and refill rate.
+    clock : Callable[[], float], optional
+        Monotonic clock, injectable for deterministic tests.
+    """
 
-# Global circuit breakers
+    def __init__(
+        self,
+        name: str,
+        config: Optional[RetryBudgetConfig] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.name = name
+        self.config = config or RetryBudgetConfig()
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._tokens = self.config.capacity
+        self._refilled_at = clock()
+        self._granted = 0
+        self._denied = 0
+
+    @property
+    def tokens(self) -> float:
+        """Retries currently available."""
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+    def try_acquire(self) -> bool:
+        """Take a token for one retry; return False if the budget is spent."""
+        with self._lock:
+            self._refill()
+            metrics = get_metrics()
+            if self._tokens < 1.0:
+                self._denied += 1
+                metrics.inc("marcus_retry_budget_exhausted_total", dependency=self.name)
+                return False
+            self._tokens -= 1.0
+            self._granted += 1
+            metrics.inc("marcus_retries_total", dependency=self.name)
+            metrics.set_gauge(
+                "marcus_retry_budget_tokens", self._tokens, dependency=self.name
+            )
+            return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return remaining tokens and counters."""
+        with self._lock:
+            self._refill()
+            return {
+                "tokens": round(self._tokens, 3),
+                "capacity": self.config.capacity,
+                "granted": self._granted,
+                "denied": self._denied,
+            }
+
+    def _refill(self) -> None:
+        now = self._clock()
+        elapsed = max(0.0, now - self._refilled_at)
+        self._refilled_at = now
+        self._tokens = min(
+            self.config.capacity,
+            self._tokens + elapsed * self.config.refill_per_second,
+        )
+
+
+# Global per-dependency registries
 _circuit_breakers: Dict[str, CircuitBreaker] = {}
+_bulkheads: Dict[str, Bulkhead] = {}
+_retry_budgets: Dict[str, RetryBudget] = {}
+_registry_lock = threading.Lock()
+
+
+def get_circuit_breaker(
+    name: str, config: Optional[CircuitBreakerConfig] = None
+) -> CircuitBreaker:
+    """Return the circuit breaker for ``name``, creating it with ``config``."""
+    with _registry_lock:
+        breaker = _circuit_breakers.get(name)
+        if breaker is None:
+            breaker = _circuit_breakers[name] = CircuitBreaker(name, config)
+        return breaker
+
+
+def get_bulkhead(name: str, config: Optional[BulkheadConfig] = None) -> Bulkhead:
+    """Return the bulkhead for ``name``, creating it with ``config``."""
+    with _registry_lock:
+        bulkhead = _bulkheads.get(name)
+        if bulkhead is None:
+            bulkhead = _bulkheads[name] = Bulkhead(name, config)
+        return bulkhead
+
+
+def get_retry_budget(
+    name: str, config: Optional[RetryBudgetConfig] = None
+) -> RetryBudget:
+    """Return the retry budget for ``name``, creating it with ``config``."""
+    with _registry_lock:
+        budget = _retry_budgets.get(name)
+        if budget is None:
+            budget = _retry_budgets[name] = RetryBudget(name, config)
+        return budget
+
+
+def get_resilience_stats() -> Dict[str, Dict[str, Any]]:
+    """Return breaker, bulkhead and retry budget stats keyed by dependency."""
+    with _registry_lock:
+        sections = (
+            ("circuit_breaker", dict(_circuit_breakers)),
+            ("bulkhead", dict(_bulkheads)),
+            ("retry_budget", dict(_retry_budgets)),
+        )
+    stats: Dict[str, Dict[str, Any]] = {}
+    for section, registry in sections:
+        for name, item in registry.items():
+            stats.setdefault(name, {})[section] = item.get_stats()
+    return stats
+
+
+def reset_resilience() -> None:
+    """Forget every circuit breaker, bulkhead and retry budget (for tests)."""
+    with _registry_lock:
+        _circuit_breakers.clear()
+        _bulkheads.clear()
+        _retry_budgets.clear()
 
 
 def with_fallback(
@@ -124,90 +586,100 @@ def with_fallback(
 
 
 def with_retry(
-    config: Optional[RetryConfig] = None,
+    config: Optional[RetryConfig] = None, dependency: Optional[str] = None
 ) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
     """Add retry logic with exponential backoff.
 
+    When ``dependency`` is given, every retry draws from that dependency's
+    shared :class:`RetryBudget`; once it is spent the call fails with its
+    last error instead of retrying. Calls refused by a circuit breaker or
+    bulkhead are never retried.
+
     Example
     -------
-    @with_retry(RetryConfig(max_attempts=5))
+    @with_retry(RetryConfig(max_attempts=5), dependency="ai_provider")
     async def call_external_api():
         return await api.call()
     """
     if config is None:
         config = RetryConfig()
 
+    def next_delay(attempt: int) -> float:
+        # Calculate delay with exponential backoff
+        delay = min(
+            config.base_delay * (config.exponential_base**attempt),
+            config.max_delay,
+        )
+        if config.jitter:
+            # Use cryptographically secure random for jitter
+            secure_random = secrets.SystemRandom()
+            delay *= 0.5 + secure_random.random()
+        return delay
+
+    def may_retry(name: str, attempt: int, error: Exception) -> bool:
+        if attempt == config.max_attempts - 1:
+            # Last attempt, don't retry
+            return False
+        if isinstance(error, (CircuitOpenError, BulkheadFull)):
+            return False
+        if dependency is not None and not get_retry_budget(dependency).try_acquire():
+            logger.warning(
+                f"{name} attempt {attempt + 1} failed and the '{dependency}' "
+                "retry budget is spent; not retrying"
+            )
+            return False
+        return True
+
+    def give_up(name: str, attempts: int, error: Optional[Exception]) -> Exception:
+        logger.error(f"{name} failed after {attempts} attempts")
+        if error is not None:
+            return error
+        return RuntimeError("No exception captured")
+
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
         @wraps(func)
         async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
             last_exception = None
+            attempt = 0
 
             for attempt in range(config.max_attempts):
                 try:
                     return await func(*args, **kwargs)
                 except Exception as e:
                     last_exception = e
-
-                    if attempt == config.max_attempts - 1:
-                        # Last attempt, don't retry
+                    if not may_retry(func.__name__, attempt, e):
                         break
 
-                    # Calculate delay with exponential backoff
-                    delay = min(
-                        config.base_delay * (config.exponential_base**attempt),
-                        config.max_delay,
-                    )
-
-                    # Add jitter if enabled
-                    if config.jitter:
-                        # Use cryptographically secure random for jitter
-                        secure_random = secrets.SystemRandom()
-                        delay *= 0.5 + secure_random.random()
-
+                    delay = next_delay(attempt)
                     logger.debug(
                         f"{func.__name__} attempt {attempt + 1} failed, "
                         f"retrying in {delay:.2f}s"
                     )
                     await asyncio.sleep(delay)
 
-            logger.error(f"{func.__name__} failed after {config.max_attempts} attempts")
-            if last_exception is not None:
-                raise last_exception
-            raise RuntimeError("No exception captured")
+            raise give_up(func.__name__, attempt + 1, last_exception)
 
         @wraps(func)
         def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
             last_exception = None
+            attempt = 0
 
             for attempt in range(config.max_attempts):
                 try:
                     return func(*args, **kwargs)
                 except Exception as e:
                     last_exception = e
-
-                    if attempt == config.max_attempts - 1:
+                    if not may_retry(func.__name__, attempt, e):
                         break
 
-                    delay = min(
-                        config.base_delay * (config.exponential_base**attempt),
-                        config.max_delay,
-                    )
-
-                    if config.jitter:
-                        # Use cryptographically secure random for jitter
-                        secure_random = secrets.SystemRandom()
-                        delay *= 0.5 + secure_random.random()
-
+                    delay = next_delay(attempt)
                     logger.debug(
                         f"{func.__name__} attempt {attempt + 1} failed, "
                         f"retrying in {delay:.2f}s"
                     )
                     time.sleep(delay)
 
-            logger.error(f"{func.__name__} failed after {config.max_attempts} attempts")
-            if last_exception is not None:
-                raise last_exception
-            raise RuntimeError("No exception captured")
+            raise give_up(func.__name__, attempt + 1, last_exception)
 
         if asyncio.iscoroutinefunction(func):
             return async_wrapper
@@ -221,6 +693,9 @@ def with_circuit_breaker(
 ) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
     """Add circuit breaker pattern.
 
+    The breaker is shared by every function decorated with the same
+    ``name``. Refused calls raise :class:`CircuitOpenError`.
+
     Example
     -------
     @with_circuit_breaker("external_api")
@@ -229,40 +704,46 @@ def with_circuit_breaker(
     """
     if config is None:
         config = CircuitBreakerConfig()
-
-    # Get or create circuit breaker
-    if name not in _circuit_breakers:
-        _circuit_breakers[name] = CircuitBreaker(name, config)
-    breaker = _circuit_breakers[name]
+    # Register now so the breaker carries this config from the start
+    get_circuit_breaker(name, config)
+
+    def admit() -> CircuitBreaker:
+        breaker = get_circuit_breaker(name, config)
+        if not breaker.allow_request():
+            raise CircuitOpenError(name, breaker.retry_after())
+        return breaker
+
+    def record(breaker: CircuitBreaker, error: BaseException) -> None:
+        ignore = breaker.config.ignore_exception
+        if isinstance(error, breaker.config.expected_exception) and not (
+            ignore is not None and ignore(error)
+        ):
+            breaker.record_failure()
+        else:
+            breaker.release()
 
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
         @wraps(func)
         async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
-            if breaker.is_open():
-                raise Exception(f"Circuit breaker '{name}' is open")
-
+            breaker = admit()
             try:
                 result = await func(*args, **kwargs)
-                breaker.record_success()
-                return result
-            except Exception as e:
-                if isinstance(e, config.expected_exception):
-                    breaker.record_failure()
+            except BaseException as e:
+                record(breaker, e)
                 raise
+            breaker.record_success()
+            return result
 
         @wraps(func)
         def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
-            if breaker.is_open():
-                raise Exception(f"Circuit breaker '{name}' is open")
-
+            breaker = admit()
             try:
                 result = func(*args, **kwargs)
-                breaker.record_success()
-                return result
-            except Exception as e:
-                if isinstance(e, config.expected_exception):
-                    breaker.record_failure()
+            except BaseException as e:
+                record(breaker, e)
                 raise
+            breaker.record_success()
+            return result
 
         if asyncio.iscoroutinefunction(func):
             return async_wrapper
@@ -271,6 +752,37 @@ def with_circuit_breaker(
     return decorator
 
 
+def with_bulkhead(
+    name: str, config: Optional[BulkheadConfig] = None
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Cap concurrent calls to a dependency.
+
+    The bulkhead is shared by every coroutine decorated with the same
+    ``name``. Calls beyond its queue raise :class:`BulkheadFull`.
+
+    Example
+    -------
+    @with_bulkhead("kanban", BulkheadConfig(max_concurrent=8))
+    async def fetch_board():
+        return await kanban.get_all_tasks()
+    """
+
+    get_bulkhead(name, config)
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        if not asyncio.iscoroutinefunction(func):
+            raise TypeError(f"with_bulkhead requires a coroutine function: {func}")
+
+        @wraps(func)
+        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+            async with get_bulkhead(name, config).slot():
+                return await func(*args, **kwargs)
+
+        return async_wrapper
+
+    return decorator
+
+
 class GracefulDegradation:
     """Context manager for graceful degradation.
 
@@ -340,7 +852,3 @@ resilient_persistence = with_fallback(
 )
 
 resilient_external_call = with_retry(RetryConfig(max_attempts=3, base_delay=1.0))
-
-resilient_ai_call = with_circuit_breaker(
-    "ai_provider", CircuitBreakerConfig(failure_threshold=3, recovery_timeout=30.0)
-)
@@ -10,6 +10,7 @@ from collections import defaultdict
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Set
 
+from src.core.dependency_graph import DependencyGraph
 from src.core.models import Task, TaskStatus
 
 logger = logging.getLogger(__name__)
@@ -313,6 +314,14 @@ class DependencyChainAnalyzer:
         self.project_tasks = project_tasks
         self.task_map = {t.id: t for t in project_tasks}
         self.dependency_graph = self._build_dependency_graph()
+        self._graph: Optional[DependencyGraph] = None
+
+    @property
+    def graph(self) -> DependencyGraph:
+        """Shared integer-indexed graph engine, built on first use."""
+        if self._graph is None:
+            self._graph = DependencyGraph(self.project_tasks)
+        return self._graph
 
     def _build_dependency_graph(self) -> Dict[str, List[str]]:
         """
@@ -450,26 +459,9 @@ class DependencyChainAnalyzer:
             List of dependency chains (task ID sequences)
         """
         chains = []
-
-        def find_longest_path(task_id: str, visited: Set[str]) -> List[str]:
-            """Find longest path from this task."""
-            task = self.task_map.get(task_id)
-            if not task or not task.dependencies:
-                return [task_id]
-
-            longest = [task_id]
-            for dep_id in task.dependencies:
-                if dep_id not in visited:
-                    path = find_longest_path(dep_id, visited | {task_id})
-                    if len(path) + 1 > len(longest):
-                        longest = [task_id] + path
-
-            return longest
-
         for task in self.project_tasks:
-            chain = find_longest_path(task.id, set())
-            if len(chain) >= min_length:
-                chains.append(chain)
+            if self.graph.chain_length(task.id) >= min_length:
+                chains.append(self.graph.longest_chain(task.id))
 
         return chains
 
@@ -520,47 +512,20 @@ class DependencyChainAnalyzer:
         """
         redundant = []
 
-        for task in self.project_tasks:
-            if not task.dependencies or len(task.dependencies) < 2:
-                continue
-
-            # Find all tasks reachable through dependencies (transitive closure)
-            reachable_through_deps = set()
-
-            def find_reachable(dep_id: str, visited: Set[str]) -> None:
-                """Find all tasks reachable from dep_id."""
-                if dep_id in visited or dep_id not in self.task_map:
-                    return
-                visited.add(dep_id)
-                dep_task = self.task_map[dep_id]
-                if dep_task.dependencies:
-                    for next_dep in dep_task.dependencies:
-                        reachable_through_deps.add(next_dep)
-                        find_reachable(next_dep, visited)
-
-            # For each direct dependency, find what's reachable through it
-            for dep_id in task.dependencies:
-                find_reachable(dep_id, set())
-
-            # Check if any direct dependency is also reachable transitively
-            direct_deps = set(task.dependencies)
-            transitive_redundant = direct_deps & reachable_through_deps
-
-            if transitive_redundant:
-                for redundant_dep in transitive_redundant:
-                    redundant.append(
-                        {
-                            "task_id": task.id,
-                            "task_name": task.name,
-                            "redundant_dependency_id": redundant_dep,
-                            "redundant_dependency_name": (
-                                self.task_map[redundant_dep].name
-                                if redundant_dep in self.task_map
-                                else "Unknown"
-                            ),
-                            "reason": "Already reachable through other dependencies",
-                        }
-                    )
+        for task_id, redundant_dep in self.graph.redundant_dependencies():
+            redundant.append(
+                {
+                    "task_id": task_id,
+                    "task_name": self.task_map[task_id].name,
+                    "redundant_dependency_id": redundant_dep,
+                    "redundant_dependency_name": (
+                        self.task_map[redundant_dep].name
+                        if redundant_dep in self.task_map
+                        else "Unknown"
+                    ),
+                    "reason": "Already reachable through other dependencies",
+                }
+            )
 
         return redundant
 
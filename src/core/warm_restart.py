@@ -0,0 +1,387 @@
+"""
+Hot-state checkpoints for graceful shutdown and warm restart.
+
+Much of what the server needs to coordinate agents lives only in memory:
+the agent registry (skills, current tasks), the per-agent assignments,
+``recovery_info`` attached to recovered tasks, and the shared board
+snapshot. A restart used to lose all of it, so every agent had to
+re-register and the first calls paid for a full board download.
+
+On a graceful shutdown the server captures that state into a
+:class:`ServerCheckpoint` and writes it with :class:`WarmStateStore`.
+The next start restores it before serving, so connected agents resume
+where they left off. Assignments and leases are durable on their own
+(:mod:`src.core.assignment_persistence`); the checkpoint only covers what
+is not.
+
+A checkpoint is consumed when it is loaded and ignored once older than
+``max_age``, so a later crash never resurrects stale state.
+"""
+
+import json
+import logging
+import os
+import tempfile
+from dataclasses import dataclass, field, fields, is_dataclass
+from datetime import datetime, timezone
+from enum import Enum
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from src.core.models import (
+    Priority,
+    RecoveryInfo,
+    Task,
+    TaskAssignment,
+    TaskStatus,
+    WorkerStatus,
+)
+
+logger = logging.getLogger(__name__)
+
+# Bumped whenever the checkpoint layout changes; other versions are ignored.
+CHECKPOINT_VERSION = 1
+
+
+def _encode(value: Any) -> Any:
+    """Convert model dataclasses to JSON-compatible values."""
+    if isinstance(value, RecoveryInfo):
+        return value.to_dict()
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if is_dataclass(value) and not isinstance(value, type):
+        return {f.name: _encode(getattr(value, f.name)) for f in fields(value)}
+    if isinstance(value, dict):
+        return {str(k): _encode(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple, set)):
+        return [_encode(v) for v in value]
+    return value
+
+
+def _parse_datetime(value: Optional[str]) -> Optional[datetime]:
+    return datetime.fromisoformat(value) if value else None
+
+
+def _known_fields(cls: Any, data: Dict[str, Any]) -> Dict[str, Any]:
+    names = {f.name for f in fields(cls)}
+    return {k: v for k, v in data.items() if k in names}
+
+
+def task_from_dict(data: Dict[str, Any]) -> Task:
+    """Rebuild a :class:`Task` encoded in a checkpoint."""
+    values = _known_fields(Task, data)
+    values["status"] = TaskStatus(values["status"])
+    values["priority"] = Priority(values["priority"])
+    for key in ("created_at", "updated_at", "due_date"):
+        values[key] = _parse_datetime(values.get(key))
+    if values.get("recovery_info"):
+        values["recovery_info"] = RecoveryInfo.from_dict(values["recovery_info"])
+    return Task(**values)
+
+
+def worker_from_dict(data: Dict[str, Any]) -> WorkerStatus:
+    """Rebuild a :class:`WorkerStatus` encoded in a checkpoint."""
+    values = _known_fields(WorkerStatus, data)
+    values["current_tasks"] = [task_from_dict(t) for t in values["current_tasks"]]
+    return WorkerStatus(**values)
+
+
+def assignment_from_dict(data: Dict[str, Any]) -> TaskAssignment:
+    """Rebuild a :class:`TaskAssignment` encoded in a checkpoint."""
+    values = _known_fields(TaskAssignment, data)
+    values["priority"] = Priority(values["priority"])
+    values["assigned_at"] = _parse_datetime(values["assigned_at"])
+    values["due_date"] = _parse_datetime(values.get("due_date"))
+    return TaskAssignment(**values)
+
+
+@dataclass
+class ServerCheckpoint:
+    """
+    In-memory server state saved by a graceful shutdown.
+
+    Attributes
+    ----------
+    created_at : datetime
+        When the checkpoint was taken (UTC).
+    project_id : Optional[str]
+        Active project; a checkpoint is only restored into the same one.
+    agent_status : Dict[str, WorkerStatus]
+        Registered agents by ID.
+    agent_tasks : Dict[str, TaskAssignment]
+        Current assignment of each agent.
+    agent_project_map : Dict[str, str]
+        Project each agent is scoped to.
+    project_tasks : List[Task]
+        Cached project tasks, including in-memory ``recovery_info``.
+    board_version : Optional[int]
+        Version of the shared board snapshot, if one had been fetched.
+    board_tasks : Optional[List[Task]]
+        Tasks of that snapshot.
+    board_age : float
+        Age of the snapshot, in seconds, when the checkpoint was taken.
+    in_flight : int
+        Tool calls still running when the checkpoint was taken (0 after a
+        complete drain).
+    """
+
+    created_at: datetime
+    project_id: Optional[str]
+    agent_status: Dict[str, WorkerStatus] = field(default_factory=dict)
+    agent_tasks: Dict[str, TaskAssignment] = field(default_factory=dict)
+    agent_project_map: Dict[str, str] = field(default_factory=dict)
+    project_tasks: List[Task] = field(default_factory=list)
+    board_version: Optional[int] = None
+    board_tasks: Optional[List[Task]] = None
+    board_age: float = 0.0
+    in_flight: int = 0
+
+    @property
+    def age(self) -> float:
+        """Seconds since the checkpoint was taken."""
+        return (datetime.now(timezone.utc) - self.created_at).total_seconds()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-compatible dictionary."""
+        data: Dict[str, Any] = _encode(self)
+        data["version"] = CHECKPOINT_VERSION
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ServerCheckpoint":
+        """Rebuild a checkpoint written by :meth:`to_dict`."""
+        board_tasks = data.get("board_tasks")
+        return cls(
+            created_at=datetime.fromisoformat(data["created_at"]),
+            project_id=data.get("project_id"),
+            agent_status={
+                agent_id: worker_from_dict(worker)
+                for agent_id, worker in data.get("agent_status", {}).items()
+            },
+            agent_tasks={
+                agent_id: assignment_from_dict(assignment)
+                for agent_id, assignment in data.get("agent_tasks", {}).items()
+            },
+            agent_project_map=dict(data.get("agent_project_map", {})),
+            project_tasks=[task_from_dict(t) for t in data.get("project_tasks", [])],
+            board_version=data.get("board_version"),
+            board_tasks=(
+                [task_from_dict(t) for t in board_tasks]
+                if board_tasks is not None
+                else None
+            ),
+            board_age=data.get("board_age", 0.0),
+            in_flight=data.get("in_flight", 0),
+        )
+
+
+def capture_checkpoint(state: Any, in_flight: int = 0) -> ServerCheckpoint:
+    """
+    Capture the hot state of a running server.
+
+    Parameters
+    ----------
+    state : Any
+        Marcus server state.
+    in_flight : int
+        Tool calls still running (recorded for diagnostics).
+
+    Returns
+    -------
+    ServerCheckpoint
+        Checkpoint ready for :meth:`WarmStateStore.save`.
+    """
+    checkpoint = ServerCheckpoint(
+        created_at=datetime.now(timezone.utc),
+        project_id=getattr(state, "current_project_id", None),
+        agent_status=dict(state.agent_status),
+        agent_tasks=dict(state.agent_tasks),
+        agent_project_map=dict(getattr(state, "agent_project_map", {})),
+        project_tasks=list(state.project_tasks or []),
+        in_flight=in_flight,
+    )
+    board = getattr(state, "board_snapshot", None)
+    snapshot = board.snapshot if board is not None else None
+    if snapshot is not None:
+        checkpoint.board_version = snapshot.version
+        checkpoint.board_tasks = list(snapshot.tasks)
+        checkpoint.board_age = max(0.0, snapshot.age)
+    return checkpoint
+
+
+def restore_checkpoint(state: Any, checkpoint: ServerCheckpoint) -> Dict[str, int]:
+    """
+    Restore a checkpoint into a freshly initialized server.
+
+    Entries the new process already has (an agent that registered again
+    before the restore, tasks already fetched) win over the checkpoint.
+
+    Parameters
+    ----------
+    state : Any
+        Marcus server state.
+    checkpoint : ServerCheckpoint
+        Checkpoint loaded from :class:`WarmStateStore`.
+
+    Returns
+    -------
+    Dict[str, int]
+        Counts of restored agents, assignments, tasks and board tasks;
+        empty if the checkpoint belongs to a different project.
+    """
+    current_project = getattr(state, "current_project_id", None)
+    if checkpoint.project_id and current_project not in (None, checkpoint.project_id):
+        logger.info(
+            f"Ignoring warm-restart checkpoint for project {checkpoint.project_id}; "
+            f"active project is {current_project}"
+        )
+        return {}
+
+    restored = {"agents": 0, "assignments": 0, "tasks": 0, "board_tasks": 0}
+    for agent_id, worker in checkpoint.agent_status.items():
+        if agent_id not in state.agent_status:
+            state.agent_status[agent_id] = worker
+            restored["agents"] += 1
+    for agent_id, assignment in checkpoint.agent_tasks.items():
+        if agent_id not in state.agent_tasks:
+            state.agent_tasks[agent_id] = assignment
+            restored["assignments"] += 1
+    agent_project_map = getattr(state, "agent_project_map", None)
+    if agent_project_map is not None:
+        for agent_id, project_id in checkpoint.agent_project_map.items():
+            agent_project_map.setdefault(agent_id, project_id)
+
+    if not state.project_tasks:
+        state.project_tasks = list(checkpoint.project_tasks)
+        restored["tasks"] = len(checkpoint.project_tasks)
+    else:
+        # Keep the fresher tasks but carry over in-memory recovery info
+        saved = {t.id: t for t in checkpoint.project_tasks if t.recovery_info}
+        for task in state.project_tasks:
+            if task.id in saved and not getattr(task, "recovery_info", None):
+                task.recovery_info = saved[task.id].recovery_info
+                restored["tasks"] += 1
+
+    board = getattr(state, "board_snapshot", None)
+    if board is not None:
+        restored["board_tasks"] = restore_board_snapshot(board, checkpoint)
+
+    lease_manager = getattr(state, "lease_manager", None)
+    if lease_manager is not None and restored["tasks"]:
+        lease_manager.update_task_list(state.project_tasks)
+    return restored
+
+
+def restore_board_snapshot(board: Any, checkpoint: ServerCheckpoint) -> int:
+    """
+    Seed a board snapshot service with the board saved in ``checkpoint``.
+
+    Parameters
+    ----------
+    board : BoardSnapshotService
+        Service to seed; it must not have fetched the board yet.
+    checkpoint : ServerCheckpoint
+        Checkpoint loaded from :class:`WarmStateStore`.
+
+    Returns
+    -------
+    int
+        Number of board tasks restored (0 if there was nothing to restore
+        or the service already had a snapshot).
+    """
+    if checkpoint.board_tasks is None or checkpoint.board_version is None:
+        return 0
+    if not board.restore(
+        checkpoint.board_tasks,
+        checkpoint.board_version,
+        age=checkpoint.board_age + checkpoint.age,
+    ):
+        return 0
+    return len(checkpoint.board_tasks)
+
+
+class WarmStateStore:
+    """
+    File holding at most one :class:`ServerCheckpoint`.
+
+    Parameters
+    ----------
+    path : Optional[Path]
+        Checkpoint file. Defaults to
+        ``data/marcus_state/warm_restart.json`` under the Marcus root.
+    max_age : float
+        Seconds after which a checkpoint is discarded instead of restored.
+    """
+
+    def __init__(self, path: Optional[Path] = None, max_age: float = 600.0) -> None:
+        if path is None:
+            marcus_root = Path(__file__).parent.parent.parent
+            path = marcus_root / "data" / "marcus_state" / "warm_restart.json"
+        self.path = path
+        self.max_age = max_age
+
+    def save(self, checkpoint: ServerCheckpoint) -> Path:
+        """
+        Write ``checkpoint`` atomically, replacing any previous one.
+
+        Returns
+        -------
+        Path
+            The checkpoint file.
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(checkpoint.to_dict(), f, default=str)
+            os.replace(tmp, self.path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        return self.path
+
+    def load(self, consume: bool = True) -> Optional[ServerCheckpoint]:
+        """
+        Read the checkpoint if there is a usable one.
+
+        Parameters
+        ----------
+        consume : bool
+            Delete the file after reading, so it is restored at most once.
+
+        Returns
+        -------
+        Optional[ServerCheckpoint]
+            None when there is no checkpoint, or it is unreadable, from
+            another layout version, or older than ``max_age``.
+        """
+        if not self.path.exists():
+            return None
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            if data.get("version") != CHECKPOINT_VERSION:
+                logger.info(
+                    f"Ignoring checkpoint with layout version {data.get('version')}"
+                )
+                return None
+            checkpoint = ServerCheckpoint.from_dict(data)
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable checkpoint {self.path}: {e}")
+            return None
+        finally:
+            if consume:
+                self.discard()
+
+        if checkpoint.age > self.max_age:
+            logger.info(
+                f"Ignoring checkpoint taken {checkpoint.age:.0f}s ago "
+                f"(max age {self.max_age:.0f}s)"
+            )
+            return None
+        return checkpoint
+
+    def discard(self) -> None:
+        """Delete the checkpoint file if present."""
+        self.path.unlink(missing_ok=True)
@@ -0,0 +1,93 @@
+"""
+Shared worker pools for blocking work started from async code.
+
+Marcus serves every MCP endpoint from one asyncio event loop, so a
+history aggregation that parses thousands of conversation log lines in a
+coroutine stalls every other request, including an agent's
+``request_next_task``. Analytics code hands that work to a bounded pool
+with :func:`run_cpu_bound` instead. The pool is deliberately small: it
+keeps the event loop responsive (worker threads give up the GIL every
+switch interval, and file reads release it entirely) without letting an
+analytics burst occupy every core.
+
+Pools are shared by name through :func:`get_worker_pool`, mirroring the
+limiters in :mod:`src.core.adaptive_concurrency`.
+
+Usage
+-----
+>>> from src.core.worker_pool import run_cpu_bound
+>>> messages = await run_cpu_bound(parse_conversation_logs, log_dir)
+"""
+
+import asyncio
+import functools
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+# Name of the pool used by history aggregation and other analytics work.
+ANALYTICS_POOL = "analytics"
+
+T = TypeVar("T")
+
+
+def _default_workers() -> int:
+    return max(1, min(4, (os.cpu_count() or 2) // 2))
+
+
+# Shared pools, one per workload
+_worker_pools: Dict[str, ThreadPoolExecutor] = {}
+
+
+def get_worker_pool(
+    name: str = ANALYTICS_POOL, max_workers: Optional[int] = None
+) -> ThreadPoolExecutor:
+    """
+    Get or create the shared pool for a workload.
+
+    ``max_workers`` is only used when the pool is first created; by
+    default a pool gets half the available cores, capped at four.
+    """
+    if name not in _worker_pools:
+        workers = max_workers or _default_workers()
+        _worker_pools[name] = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix=f"marcus-{name}"
+        )
+        logger.debug(f"Created worker pool '{name}' with {workers} workers")
+    return _worker_pools[name]
+
+
+async def run_cpu_bound(
+    func: Callable[..., T], *args: Any, pool: str = ANALYTICS_POOL, **kwargs: Any
+) -> T:
+    """
+    Run a blocking function on a shared worker pool.
+
+    Parameters
+    ----------
+    func : Callable[..., T]
+        Synchronous function to run. It must not touch event-loop state.
+    *args, **kwargs
+        Forwarded to ``func``.
+    pool : str
+        Name of the pool to run on.
+
+    Returns
+    -------
+    T
+        Whatever ``func`` returns; exceptions propagate to the caller.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        get_worker_pool(pool), functools.partial(func, *args, **kwargs)
+    )
+
+
+def shutdown_worker_pools(wait: bool = False) -> None:
+    """Shut down and drop all shared pools (used on exit and by tests)."""
+    for pool in _worker_pools.values():
+        pool.shutdown(wait=wait, cancel_futures=True)
+    _worker_pools.clear()
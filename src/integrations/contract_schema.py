@@ -0,0 +1,1026 @@
+"""
+Normalized schema model for contract-first interface contracts.
+
+Interface-contract artifacts are LLM-written markdown. The same entity
+shows up as bullet lists (``- positionX (number) — ...``), dotted
+bullets (``- `todo.id` (string)``), nested bullets, tables, TypeScript
+interfaces and Python dataclasses, in whichever type vocabulary the
+domain's architect favoured. This module parses all of those into one
+JSON-Schema-like model so contracts can be compared structurally:
+
+- :func:`parse_type` maps a type annotation from either vocabulary
+  (``List[str]``, ``string[]``, ``array of strings``, ``Optional[int]``,
+  ``number | null``, ``Record<string, Widget>``, ``{ x: number }``) to a
+  :class:`SchemaNode`;
+- :func:`parse_contract_schema` turns one artifact into a
+  :class:`ContractSchema` of named definitions plus unscoped fields;
+- :class:`SchemaComparator` walks two nodes together and reports each
+  incompatibility with its full path, e.g.
+  ``Widget.position.x: number vs string``;
+- :class:`ContractSchemaCache` keeps parsed schemas by content hash, so
+  re-validating after one artifact changed only re-parses that artifact.
+
+Optionality, nullability, format hints and ``integer`` vs ``number`` are
+deliberately not conflicts: they don't change what crosses the wire.
+"""
+
+import hashlib
+import re
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
+from typing import Dict, Iterator, List, Mapping, Optional, Set, Tuple
+
+# name -> (type, format) for primitive words in either vocabulary
+_PRIMITIVES: Dict[str, Tuple[str, Optional[str]]] = {
+    **{
+        word: ("string", None)
+        for word in ("string", "str", "text", "uuid", "email", "url", "uri", "char")
+    },
+    **{word: ("string", "date-time") for word in ("date", "datetime")},
+    **{
+        word: ("number", None)
+        for word in (
+            "number",
+            "int",
+            "integer",
+            "float",
+            "double",
+            "decimal",
+            "bigint",
+            "long",
+            "numeric",
+        )
+    },
+    **{word: ("boolean", None) for word in ("boolean", "bool")},
+    **{word: ("null", None) for word in ("null", "none", "nil", "undefined", "void")},
+    **{word: ("object", None) for word in ("object", "dict", "json", "map", "record")},
+    **{word: ("array", None) for word in ("array", "list", "tuple", "set")},
+    **{
+        word: ("any", None)
+        for word in ("any", "unknown", "mixed", "callable", "function")
+    },
+}
+
+_ARRAY_GENERICS = frozenset(
+    {
+        "list",
+        "array",
+        "readonlyarray",
+        "sequence",
+        "set",
+        "frozenset",
+        "iterable",
+        "tuple",
+        "collection",
+    }
+)
+_MAP_GENERICS = frozenset(
+    {"dict", "mapping", "record", "map", "defaultdict", "ordereddict"}
+)
+# Wrappers that don't change the shape on the wire
+_TRANSPARENT_GENERICS = frozenset(
+    {"annotated", "required", "notrequired", "readonly", "partial", "final"}
+)
+# Words that may follow a type name without changing it ("Widget objects")
+_TYPE_NOUNS = frozenset(
+    {"object", "objects", "item", "items", "instance", "instances", "entity", "type"}
+)
+# Heading keywords that mark a heading as naming an entity
+_HEADING_KEYWORDS = frozenset(
+    {"interface", "type", "entity", "model", "schema", "class", "object", "shape"}
+)
+
+_QUALIFIER_PATTERN = re.compile(
+    r"\b(optional|required|nullable)\b(?!\s*[\[<])", re.IGNORECASE
+)
+_LITERAL_PATTERN = re.compile(r"""^(?:'[^']*'|"[^"]*"|-?\d+(?:\.\d+)?|true|false)$""")
+_GENERIC_PATTERN = re.compile(r"^([A-Za-z_$][\w$.]*)\s*[\[<](.*)[\]>]$", re.DOTALL)
+_ARRAY_OF_PATTERN = re.compile(
+    r"^(?:an?\s+)?(?:array|list|set|collection)\s+of\s+(.+)$", re.IGNORECASE
+)
+_MAP_OF_PATTERN = re.compile(
+    r"^(?:an?\s+)?(?:map|dict|dictionary|record|object)\s+of\s+(.+)$", re.IGNORECASE
+)
+_BULLET_PATTERN = re.compile(r"^(\s*)(?:[-*+]|\d+[.)])\s+(.*)$")
+_BULLET_NAME_PATTERN = re.compile(
+    r"^(?:\*\*)?`?([A-Za-z_$][\w$.]*(?:\[\])?)(\?)?`?(?:\*\*)?\s*"
+)
+_DESCRIPTION_SEPARATOR = re.compile(r"\s+[—–-]\s+")
+_HEADING_PATTERN = re.compile(r"^#{1,6}\s+(.*)$")
+_TABLE_SEPARATOR = re.compile(r"^\|?\s*:?-{2,}")
+_TS_DECLARATION = re.compile(
+    r"(?:export\s+)?(?:declare\s+)?(interface|type|class)\s+([A-Za-z_$][\w$]*)"
+    r"(?:<[^>{=]*>)?[^{=;\n]*"
+)
+_TS_MEMBER = re.compile(
+    r"^(?:readonly\s+)?[\"']?([A-Za-z_$][\w$]*)[\"']?\s*(\?)?\s*:\s*(.+)$", re.DOTALL
+)
+_TS_INDEX_SIGNATURE = re.compile(r"^\[\s*\w+\s*:\s*[^\]]+\]\s*:\s*(.+)$", re.DOTALL)
+_PY_CLASS = re.compile(r"^(\s*)class\s+([A-Za-z_]\w*)\s*(?:\((.*)\))?\s*:")
+_PY_FIELD = re.compile(r"^\s+([A-Za-z_]\w*)\s*:\s*(.+?)\s*(?:=.*)?$")
+
+
+def canonical_name(name: str) -> str:
+    """
+    Return the comparison key for an entity or field name.
+
+    ``positionX``, ``position_x`` and ``PositionX`` all map to
+    ``positionx``, so Python and TypeScript spellings of the same field
+    line up.
+    """
+    return re.sub(r"[^a-z0-9]", "", name.lower())
+
+
+@dataclass
+class SchemaNode:
+    """
+    One type in a contract, in a JSON-Schema-like shape.
+
+    Attributes
+    ----------
+    type : str
+        ``string``, ``number``, ``boolean``, ``null``, ``object``,
+        ``array``, ``union``, ``ref`` (a named type) or ``any``.
+    format : str, optional
+        Refinement of a primitive, e.g. ``date-time``.
+    ref : str, optional
+        Name of the referenced type when ``type`` is ``ref``.
+    items : SchemaNode, optional
+        Element type of an array.
+    properties : Dict[str, SchemaNode]
+        Declared fields of an object.
+    additional : SchemaNode, optional
+        Value type of a map-like object (``Dict[str, X]``).
+    any_of : List[SchemaNode]
+        Members of a union, never including ``null``.
+    nullable : bool
+        Whether ``null`` is also allowed.
+    required : bool
+        False when the field was marked optional.
+    title : str, optional
+        Name of the entity this node defines.
+    source : str
+        The annotation the node was parsed from, for reports.
+    """
+
+    type: str
+    format: Optional[str] = None
+    ref: Optional[str] = None
+    items: Optional["SchemaNode"] = None
+    properties: Dict[str, "SchemaNode"] = field(default_factory=dict)
+    additional: Optional["SchemaNode"] = None
+    any_of: List["SchemaNode"] = field(default_factory=list)
+    nullable: bool = False
+    required: bool = True
+    title: Optional[str] = None
+    source: str = ""
+
+    def describe(self) -> str:
+        """Return a short type expression, e.g. ``Widget[] | null``."""
+        if self.type == "ref":
+            text = self.ref or "ref"
+        elif self.type == "array":
+            inner = self.items.describe() if self.items else "any"
+            text = f"({inner})[]" if " " in inner else f"{inner}[]"
+        elif self.type == "union":
+            text = " | ".join(member.describe() for member in self.any_of)
+        elif self.type == "object" and self.title:
+            text = self.title
+        else:
+            text = self.type
+        return f"{text} | null" if self.nullable else text
+
+    def to_json_schema(self) -> Dict[str, object]:
+        """Return the node as a JSON Schema dict."""
+        schema: Dict[str, object]
+        if self.type == "any":
+            schema = {}
+        elif self.type == "ref":
+            schema = {"$ref": f"#/definitions/{self.ref}"}
+        elif self.type == "union":
+            schema = {"anyOf": [member.to_json_schema() for member in self.any_of]}
+        else:
+            schema = {"type": self.type}
+            if self.format:
+                schema["format"] = self.format
+            if self.type == "array" and self.items is not None:
+                schema["items"] = self.items.to_json_schema()
+            if self.type == "object" and self.properties:
+                schema["properties"] = {
+                    name: node.to_json_schema()
+                    for name, node in self.properties.items()
+                }
+                required = [n for n, node in self.properties.items() if node.required]
+                if required:
+                    schema["required"] = required
+            if self.additional is not None:
+                schema["additionalProperties"] = self.additional.to_json_schema()
+        if self.title:
+            schema["title"] = self.title
+        if self.nullable:
+            schema = {"anyOf": [schema, {"type": "null"}]}
+        return schema
+
+
+@dataclass
+class ContractSchema:
+    """
+    Parsed form of one interface-contract artifact.
+
+    Attributes
+    ----------
+    digest : str
+        SHA-256 of the artifact content the schema was parsed from.
+    definitions : Dict[str, SchemaNode]
+        Named entities and type aliases, keyed by :func:`canonical_name`.
+    fields : SchemaNode
+        Object holding fields declared outside any entity.
+    field_count : int
+        Field declarations parsed, at any depth.
+    field_names : Set[str]
+        Canonical names of every declared field.
+    """
+
+    digest: str
+    definitions: Dict[str, SchemaNode] = field(default_factory=dict)
+    fields: SchemaNode = field(default_factory=lambda: SchemaNode("object"))
+    field_count: int = 0
+    field_names: Set[str] = field(default_factory=set)
+
+    def definition(self, name: str) -> Optional[SchemaNode]:
+        """Return the definition named ``name`` in any spelling, if any."""
+        return self.definitions.get(canonical_name(name))
+
+    def entity(self, name: str) -> Optional[SchemaNode]:
+        """
+        Return the object defining ``name``, creating it if needed.
+
+        None when ``name`` is already defined as something that cannot
+        hold fields, such as an alias for ``string``.
+        """
+        key = canonical_name(name)
+        node = self.definitions.get(key)
+        if node is None:
+            node = self.definitions[key] = SchemaNode("object", title=name)
+        return _as_container(node)
+
+    def to_json_schema(self) -> Dict[str, object]:
+        """Return the whole contract as a JSON Schema dict."""
+        schema = self.fields.to_json_schema()
+        schema["definitions"] = {
+            node.title or key: node.to_json_schema()
+            for key, node in self.definitions.items()
+        }
+        return schema
+
+
+@dataclass(frozen=True)
+class SchemaConflict:
+    """One structural incompatibility between two contracts."""
+
+    path: str
+    left_file: str
+    left_type: str
+    left_source: str
+    right_file: str
+    right_type: str
+    right_source: str
+
+    def __str__(self) -> str:
+        return f"{self.path}: {self.left_type} vs {self.right_type}"
+
+
+# --------------------------------------------------------------------------
+# Type expressions
+# --------------------------------------------------------------------------
+
+
+def _split_top_level(text: str, separators: str) -> List[str]:
+    """Split ``text`` on ``separators`` that are outside any brackets."""
+    parts: List[str] = []
+    stack: List[str] = []
+    start = 0
+    for index, char in enumerate(text):
+        if char in "([{":
+            stack.append(char)
+        elif char == "<" and index and re.match(r"[\w$]", text[index - 1]):
+            stack.append(char)
+        elif char in ")]}" and stack and stack[-1] != "<":
+            stack.pop()
+        elif char == ">" and stack and stack[-1] == "<":
+            stack.pop()
+        elif char in separators and not stack:
+            parts.append(text[start:index])
+            start = index + 1
+    parts.append(text[start:])
+    return parts
+
+
+def _balanced(text: str) -> Optional[str]:
+    """Return the contents of the bracket group ``text`` starts with."""
+    closing = {"(": ")", "{": "}", "[": "]"}[text[0]]
+    depth = 0
+    for index, char in enumerate(text):
+        if char == text[0]:
+            depth += 1
+        elif char == closing:
+            depth -= 1
+            if depth == 0:
+                return text[1:index]
+    return None
+
+
+def _union(members: List[SchemaNode], source: str) -> SchemaNode:
+    flat: List[SchemaNode] = []
+    nullable = False
+    for member in members:
+        nullable = nullable or member.nullable
+        if member.type == "null":
+            nullable = True
+        elif member.type == "union":
+            flat.extend(member.any_of)
+        else:
+            flat.append(member)
+    unique: Dict[str, SchemaNode] = {}
+    for member in flat:
+        unique.setdefault(member.describe(), member)
+    if not unique:
+        return SchemaNode("null", source=source)
+    if len(unique) == 1:
+        node = next(iter(unique.values()))
+        node.nullable = node.nullable or nullable
+        node.source = source
+        return node
+    return SchemaNode(
+        "union", any_of=list(unique.values()), nullable=nullable, source=source
+    )
+
+
+def _singular(word: str) -> str:
+    lower = word.lower()
+    if lower not in _PRIMITIVES and lower.endswith("s") and lower[:-1] in _PRIMITIVES:
+        return lower[:-1]
+    return lower
+
+
+def _primitive(word: str, source: str) -> Optional[SchemaNode]:
+    entry = _PRIMITIVES.get(_singular(word))
+    if entry is None:
+        return None
+    return SchemaNode(entry[0], format=entry[1], source=source)
+
+
+def _parse_phrase(text: str, source: str) -> Optional[SchemaNode]:
+    """Parse a short prose type such as ``ISO 8601 string`` or ``Widget objects``."""
+    words = re.findall(r"[A-Za-z_$][\w$.]*|\d+", text)
+    if not words or len(words) > 3:
+        return None
+    node = _primitive(words[0], source)
+    if node is not None:
+        return node
+    if (
+        words[0][0].isupper() or "." in words[0]
+    ) and all(word.lower() in _TYPE_NOUNS for word in words[1:]):
+        return SchemaNode("ref", ref=words[0].split(".")[-1], source=source)
+    if len(words) > 1:
+        return _primitive(words[-1], source)
+    return None
+
+
+def _parse_generic(name: str, args_text: str, source: str) -> SchemaNode:
+    args = [arg.strip() for arg in _split_top_level(args_text, ",") if arg.strip()]
+    lower = name.split(".")[-1].lower()
+
+    def arg(index: int) -> SchemaNode:
+        if not args:
+            return SchemaNode("any")
+        return _parse_member(args[index], source) or SchemaNode("any")
+
+    if lower in _ARRAY_GENERICS:
+        items = arg(0) if len(args) == 1 or lower != "tuple" else SchemaNode("any")
+        return SchemaNode("array", items=items, source=source)
+    if lower in _MAP_GENERICS:
+        return SchemaNode("object", additional=arg(-1), source=source)
+    if lower == "optional":
+        node = arg(0)
+        node.nullable = True
+        return node
+    if lower in ("union", "literal"):
+        members = [_parse_member(a, source) or SchemaNode("any") for a in args]
+        return _union(members, source)
+    if lower in _TRANSPARENT_GENERICS:
+        return arg(0)
+    if lower == "callable":
+        return SchemaNode("any", source=source)
+    return SchemaNode("ref", ref=name.split(".")[-1], source=source)
+
+
+def _parse_object_literal(body: str, source: str) -> SchemaNode:
+    node = SchemaNode("object", source=source)
+    body = re.sub(r"//[^\n]*|/\*.*?\*/", "", body, flags=re.DOTALL)
+    for member in _split_top_level(body, ";,\n"):
+        member = member.strip()
+        if not member:
+            continue
+        index = _TS_INDEX_SIGNATURE.match(member)
+        if index:
+            node.additional = _parse_member(index.group(1), source) or SchemaNode("any")
+            continue
+        match = _TS_MEMBER.match(member)
+        if not match:
+            continue
+        child = _parse_member(match.group(3), match.group(3).strip())
+        child = child or SchemaNode("any", source=match.group(3).strip())
+        if match.group(2):
+            child.required = False
+        node.properties.setdefault(match.group(1), child)
+    return node
+
+
+def _parse_member(
+    text: str, source: str, literals: bool = True
+) -> Optional[SchemaNode]:
+    """Parse one type expression with no trailing qualifiers."""
+    text = text.strip().strip("`").strip()
+    if not text:
+        return None
+    if text.startswith("{") and text.endswith("}"):
+        return _parse_object_literal(text[1:-1], source)
+    if "=>" in _split_top_level(text, "|")[0]:
+        # Callables carry no data shape worth comparing
+        return SchemaNode("any", source=source)
+    members = _split_top_level(text, "|")
+    if len(members) > 1:
+        parsed = [_parse_member(m, source, literals) for m in members]
+        if any(p is None for p in parsed):
+            return None
+        return _union([p for p in parsed if p is not None], source)
+    if text.startswith("(") and _balanced(text) == text[1:-1]:
+        return _parse_member(text[1:-1], source, literals)
+    if text.endswith("[]"):
+        items = _parse_member(text[:-2], source, literals)
+        return SchemaNode("array", items=items, source=source) if items else None
+    if _LITERAL_PATTERN.match(text):
+        if not literals:
+            return None
+        if text[0] in "'\"":
+            return SchemaNode("string", source=source)
+        if text in ("true", "false"):
+            return SchemaNode("boolean", source=source)
+        return SchemaNode("number", source=source)
+    generic = _GENERIC_PATTERN.match(text)
+    if generic:
+        return _parse_generic(generic.group(1), generic.group(2), source)
+    array_of = _ARRAY_OF_PATTERN.match(text)
+    if array_of:
+        items = _parse_member(array_of.group(1), source, literals)
+        return SchemaNode("array", items=items or SchemaNode("any"), source=source)
+    map_of = _MAP_OF_PATTERN.match(text)
+    if map_of:
+        value = _parse_member(map_of.group(1), source, literals)
+        value = value or SchemaNode("any")
+        return SchemaNode("object", additional=value, source=source)
+    return _parse_phrase(text, source)
+
+
+def parse_type(annotation: str, literals: bool = True) -> Optional[SchemaNode]:
+    """
+    Parse a type annotation written in Python, TypeScript or prose style.
+
+    Trailing comma-separated constraints (``string, UUID v4``,
+    ``number, max 100``) are dropped; ``optional``/``nullable``
+    qualifiers set the node's flags instead of changing its type.
+
+    Parameters
+    ----------
+    annotation : str
+        The annotation, e.g. ``List[Widget]``, ``number | null, optional``
+        or ``array of IngredientItem objects``.
+    literals : bool
+        Whether a bare literal (``3001``, ``'active'``) counts as a type.
+        Off for ``name: value`` bullets, where it is a value.
+
+    Returns
+    -------
+    Optional[SchemaNode]
+        None when the annotation is prose rather than a type.
+    """
+    source = annotation.strip()
+    text = source.replace("`", "")
+    text = re.sub(r"\s+or\s+", " | ", text)
+    head, *constraints = _split_top_level(text, ",")
+    qualifiers = {q.lower() for q in _QUALIFIER_PATTERN.findall(text)}
+    head = _QUALIFIER_PATTERN.sub(" ", head).strip()
+    node = _parse_member(head, source, literals)
+    if node is None:
+        return None
+    if "optional" in qualifiers:
+        node.required = False
+    if "nullable" in qualifiers:
+        node.nullable = True
+    return node
+
+
+# --------------------------------------------------------------------------
+# Artifact parsing
+# --------------------------------------------------------------------------
+
+
+def _as_container(node: SchemaNode) -> Optional[SchemaNode]:
+    """Return the object nested declarations under ``node`` belong to."""
+    if node.type == "array":
+        if node.items is None or node.items.type in ("any", "ref"):
+            node.items = _as_object(node.items)
+        return node.items if node.items.type == "object" else None
+    if node.type in ("object", "ref", "any"):
+        return _as_object(node)
+    return None
+
+
+def _as_object(node: Optional[SchemaNode]) -> SchemaNode:
+    if node is None:
+        return SchemaNode("object")
+    if node.type in ("ref", "any"):
+        node.title = node.title or node.ref
+        node.type, node.ref = "object", None
+    return node
+
+
+def _heading_entity(heading: str) -> Optional[str]:
+    """Return the entity a heading names (``## WidgetPosition``), if any."""
+    quoted = "`" in heading
+    words = re.findall(r"[A-Za-z_$][\w$]*", heading.replace(":", " "))
+    keyword = False
+    while words and words[0].lower() in _HEADING_KEYWORDS:
+        words, keyword = words[1:], True
+    if len(words) == 2 and words[1].lower() in _HEADING_KEYWORDS:
+        words, keyword = words[:1], True
+    if len(words) != 1:
+        return None
+    name = words[0]
+    camel = (
+        name[0].isupper()
+        and any(c.isupper() for c in name[1:])
+        and any(c.islower() for c in name)
+    )
+    return name if keyword or quoted or camel else None
+
+
+class _ArtifactParser:
+    """Line-oriented walk over one markdown artifact."""
+
+    def __init__(self, schema: ContractSchema) -> None:
+        self.schema = schema
+        self.entity: Optional[str] = None
+        # (indent, container) for nested bullets
+        self.stack: List[Tuple[int, SchemaNode]] = []
+
+    def parse(self, content: str) -> None:
+        lines = content.splitlines()
+        index = 0
+        table: Optional[Tuple[int, int]] = None
+        while index < len(lines):
+            line = lines[index]
+            stripped = line.strip()
+            if stripped.startswith("```"):
+                end = index + 1
+                while end < len(lines) and not lines[end].strip().startswith("```"):
+                    end += 1
+                self._code_block("\n".join(lines[index + 1 : end]))
+                index = end + 1
+                continue
+            heading = _HEADING_PATTERN.match(stripped)
+            if heading:
+                self.entity = _heading_entity(heading.group(1))
+                self.stack, table = [], None
+            elif stripped.startswith("|"):
+                table = self._table_row(lines, index, table)
+            elif _BULLET_PATTERN.match(line):
+                self._bullet(line)
+            elif stripped:
+                self.stack, table = [], None
+            index += 1
+
+    def _declare(
+        self, name: str, node: SchemaNode, container: Optional[SchemaNode]
+    ) -> Optional[SchemaNode]:
+        segments = [s for s in name.split(".") if s]
+        if not segments:
+            return None
+        if container is None:
+            if self.entity:
+                container = self.schema.entity(self.entity)
+                if len(segments) > 1 and canonical_name(segments[0]) == canonical_name(
+                    self.entity
+                ):
+                    segments = segments[1:]
+            elif len(segments) > 1:
+                container = self.schema.entity(segments[0])
+                segments = segments[1:]
+            else:
+                container = self.schema.fields
+            if container is None:
+                return None
+        for segment in segments[:-1]:
+            key = segment.removesuffix("[]")
+            child = container.properties.get(key)
+            if child is None:
+                child = container.properties[key] = SchemaNode(
+                    "array" if segment.endswith("[]") else "object"
+                )
+            next_container = _as_container(child)
+            if next_container is None:
+                return None
+            container = next_container
+        leaf = segments[-1]
+        if leaf.endswith("[]"):
+            node = SchemaNode("array", items=node, source=node.source)
+            leaf = leaf[:-2]
+        existing = container.properties.get(leaf)
+        if existing is not None and existing.type != "any":
+            return existing
+        container.properties[leaf] = node
+        self.schema.field_count += 1
+        self.schema.field_names.add(canonical_name(leaf))
+        return node
+
+    def _bullet(self, line: str) -> None:
+        match = _BULLET_PATTERN.match(line)
+        if match is None:
+            return
+        indent, rest = len(match.group(1).expandtabs(4)), match.group(2)
+        name_match = _BULLET_NAME_PATTERN.match(rest)
+        if name_match is None:
+            return
+        after = rest[name_match.end() :]
+        if after.startswith("("):
+            annotation = _balanced(after)
+            node = parse_type(annotation) if annotation else None
+        elif after.startswith(":"):
+            annotation = _DESCRIPTION_SEPARATOR.split(after[1:].strip(), 1)[0]
+            node = parse_type(annotation.rstrip("."), literals=False)
+        else:
+            node = None
+        if node is None:
+            return
+        if name_match.group(2):
+            node.required = False
+
+        while self.stack and self.stack[-1][0] >= indent:
+            self.stack.pop()
+        parent = self.stack[-1][1] if self.stack else None
+        declared = self._declare(name_match.group(1), node, parent)
+        if declared is not None and declared.type in ("object", "array", "ref", "any"):
+            container = _as_container(declared)
+            if container is not None:
+                self.stack.append((indent, container))
+
+    def _table_row(
+        self, lines: List[str], index: int, columns: Optional[Tuple[int, int]]
+    ) -> Optional[Tuple[int, int]]:
+        row = lines[index].strip().strip("|")
+        cells = [cell.strip().strip("`").strip() for cell in row.split("|")]
+        if _TABLE_SEPARATOR.match(lines[index].strip()):
+            return columns
+        following = lines[index + 1].strip() if index + 1 < len(lines) else ""
+        if _TABLE_SEPARATOR.match(following):
+            header = [c.lower() for c in cells]
+            name_col = next(
+                (
+                    i
+                    for i, c in enumerate(header)
+                    if c in ("field", "name", "key", "property", "attribute")
+                ),
+                None,
+            )
+            type_col = next((i for i, c in enumerate(header) if c == "type"), None)
+            if name_col is None or type_col is None:
+                return None
+            return (name_col, type_col)
+        if columns is None or max(columns) >= len(cells):
+            return columns
+        node = parse_type(cells[columns[1]])
+        name = cells[columns[0]].rstrip("?")
+        if node is not None and re.fullmatch(r"[A-Za-z_$][\w$.]*(?:\[\])?", name):
+            self._declare(name, node, None)
+        return columns
+
+    def _code_block(self, code: str) -> None:
+        for match in _TS_DECLARATION.finditer(code):
+            kind, name = match.group(1), match.group(2)
+            rest = code[match.end() :].lstrip(" \t")
+            alias = kind == "type" and rest.startswith("=")
+            if alias:
+                rest = rest[1:].lstrip()
+            if rest.startswith("{") and (kind != "type" or alias):
+                body = _balanced(rest)
+                if body is None:
+                    continue
+                node = _parse_object_literal(body, f"{kind} {name}")
+            elif alias:
+                expression = re.split(r";|\n\s*\n", rest, maxsplit=1)[0]
+                parsed = parse_type(expression)
+                if parsed is None:
+                    continue
+                node = parsed
+            else:
+                continue
+            self._define(name, node)
+        self._python_classes(code)
+
+    def _python_classes(self, code: str) -> None:
+        lines = code.splitlines()
+        for index, line in enumerate(lines):
+            match = _PY_CLASS.match(line)
+            if match is None or "enum" in (match.group(3) or "").lower():
+                continue
+            indent = len(match.group(1))
+            node = SchemaNode("object", source=f"class {match.group(2)}")
+            in_docstring = False
+            for body_line in lines[index + 1 :]:
+                stripped = body_line.strip()
+                if not stripped:
+                    continue
+                if len(body_line) - len(body_line.lstrip()) <= indent:
+                    break
+                if stripped.count('"""') % 2 or stripped.count("'''") % 2:
+                    in_docstring = not in_docstring
+                    continue
+                if in_docstring or stripped.startswith(("def ", "@", "#", "class ")):
+                    continue
+                field_match = _PY_FIELD.match(body_line)
+                if field_match:
+                    parsed = parse_type(field_match.group(2))
+                    child = parsed or SchemaNode("any", source=field_match.group(2))
+                    node.properties.setdefault(field_match.group(1), child)
+            if node.properties:
+                self._define(match.group(2), node)
+
+    def _define(self, name: str, node: SchemaNode) -> None:
+        node.title = name
+        key = canonical_name(name)
+        existing = self.schema.definitions.get(key)
+        if existing is not None and existing.type == "object" and node.type == "object":
+            for prop, child in node.properties.items():
+                existing.properties.setdefault(prop, child)
+        else:
+            self.schema.definitions[key] = node
+        for prop in node.properties:
+            self.schema.field_count += 1
+            self.schema.field_names.add(canonical_name(prop))
+
+
+def content_digest(content: str) -> str:
+    """Return the SHA-256 hex digest used to cache ``content``."""
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def parse_contract_schema(content: str) -> ContractSchema:
+    """
+    Parse an interface-contract artifact into a :class:`ContractSchema`.
+
+    Entities come from headings that name a type (``## WidgetPosition``,
+    ``### Todo Entity``), dotted bullet names (``todo.id``) and
+    TypeScript/Python declarations in code blocks. Indented bullets nest
+    under the bullet above them; other bullets are unscoped fields.
+
+    Parameters
+    ----------
+    content : str
+        Markdown content of the artifact.
+
+    Returns
+    -------
+    ContractSchema
+        The parsed schema.
+    """
+    schema = ContractSchema(digest=content_digest(content))
+    _ArtifactParser(schema).parse(content)
+    return schema
+
+
+class ContractSchemaCache:
+    """
+    Parsed schemas keyed by artifact content hash, least recently used first out.
+
+    Parameters
+    ----------
+    max_entries : int
+        Schemas kept before the least recently used is dropped.
+    """
+
+    def __init__(self, max_entries: int = 512) -> None:
+        self.max_entries = max_entries
+        self._schemas: "OrderedDict[str, ContractSchema]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, content: str) -> ContractSchema:
+        """Return the schema for ``content``, parsing it only if unseen."""
+        digest = content_digest(content)
+        schema = self._schemas.get(digest)
+        if schema is not None:
+            self.hits += 1
+            self._schemas.move_to_end(digest)
+            return schema
+        self.misses += 1
+        schema = self._schemas[digest] = parse_contract_schema(content)
+        if len(self._schemas) > self.max_entries:
+            self._schemas.popitem(last=False)
+        return schema
+
+    def clear(self) -> None:
+        """Drop every cached schema and reset the counters."""
+        self._schemas.clear()
+        self.hits = self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._schemas)
+
+
+_schema_cache = ContractSchemaCache()
+
+
+def get_contract_schema_cache() -> ContractSchemaCache:
+    """Return the process-wide schema cache."""
+    return _schema_cache
+
+
+# --------------------------------------------------------------------------
+# Structural comparison
+# --------------------------------------------------------------------------
+
+
+class SchemaComparator:
+    """
+    Structural compatibility checks across a set of parsed contracts.
+
+    Named types are resolved in their own contract first and then in any
+    other contract that defines them, so ``position (Position)`` in one
+    file is compared field by field against ``position (WidgetPosition)``
+    in another when both names are defined somewhere.
+
+    Parameters
+    ----------
+    schemas : Mapping[str, ContractSchema]
+        Parsed contracts keyed by filename.
+    """
+
+    def __init__(self, schemas: Mapping[str, ContractSchema]) -> None:
+        self.schemas = schemas
+        self._definitions: Dict[str, List[Tuple[str, SchemaNode]]] = {}
+        for filename, schema in schemas.items():
+            for key, node in schema.definitions.items():
+                self._definitions.setdefault(key, []).append((filename, node))
+
+    def shared_definitions(
+        self,
+    ) -> Iterator[Tuple[str, List[Tuple[str, SchemaNode]]]]:
+        """Yield ``(name, [(filename, node), ...])`` for entities in 2+ files."""
+        for key, entries in self._definitions.items():
+            if len({filename for filename, _ in entries}) > 1:
+                yield entries[0][1].title or key, entries
+
+    def compare(
+        self,
+        path: str,
+        left_file: str,
+        left: SchemaNode,
+        right_file: str,
+        right: SchemaNode,
+    ) -> List[SchemaConflict]:
+        """Return every incompatibility between ``left`` and ``right``."""
+        conflicts: List[SchemaConflict] = []
+        self._diff(path, left_file, left, right_file, right, set(), conflicts)
+        return conflicts
+
+    def _resolve(self, node: SchemaNode, filename: str) -> SchemaNode:
+        for _ in range(8):
+            if node.type != "ref" or node.ref is None:
+                return node
+            key = canonical_name(node.ref)
+            target = self.schemas[filename].definitions.get(key)
+            if target is None:
+                entries = self._definitions.get(key)
+                if not entries:
+                    return node
+                filename, target = entries[0]
+            if target is node:
+                return node
+            node = target
+        return node
+
+    def _diff(
+        self,
+        path: str,
+        left_file: str,
+        left: SchemaNode,
+        right_file: str,
+        right: SchemaNode,
+        seen: Set[Tuple[int, int]],
+        conflicts: List[SchemaConflict],
+    ) -> None:
+        a = self._resolve(left, left_file)
+        b = self._resolve(right, right_file)
+        if (id(a), id(b)) in seen or "any" in (a.type, b.type):
+            return
+        seen = seen | {(id(a), id(b))}
+
+        def conflict() -> None:
+            conflicts.append(
+                SchemaConflict(
+                    path=path,
+                    left_file=left_file,
+                    left_type=_bare(left).describe(),
+                    left_source=left.source or left.describe(),
+                    right_file=right_file,
+                    right_type=_bare(right).describe(),
+                    right_source=right.source or right.describe(),
+                )
+            )
+
+        if "union" in (a.type, b.type):
+            left_members = a.any_of if a.type == "union" else [a]
+            right_members = b.any_of if b.type == "union" else [b]
+            left_covered = self._covers(
+                left_members, left_file, right_members, right_file, seen
+            )
+            if not left_covered and not self._covers(
+                right_members, right_file, left_members, left_file, seen
+            ):
+                conflict()
+            return
+        if "null" in (a.type, b.type):
+            return
+        if a.type == "ref" or b.type == "ref":
+            # Only unresolved names reach here
+            if a.type == b.type == "ref":
+                if canonical_name(a.ref or "") != canonical_name(b.ref or ""):
+                    conflict()
+            elif "object" not in (a.type, b.type):
+                conflict()
+            return
+        if a.type != b.type:
+            conflict()
+        elif a.type == "array" and a.items is not None and b.items is not None:
+            self._diff(
+                f"{path}[]", left_file, a.items, right_file, b.items, seen, conflicts
+            )
+        elif a.type == "object":
+            right_props = {canonical_name(k): v for k, v in b.properties.items()}
+            for name, child in a.properties.items():
+                other = right_props.get(canonical_name(name))
+                if other is not None:
+                    self._diff(
+                        f"{path}.{name}" if path else name,
+                        left_file,
+                        child,
+                        right_file,
+                        other,
+                        seen,
+                        conflicts,
+                    )
+            if a.additional is not None and b.additional is not None:
+                self._diff(
+                    f"{path}[key]",
+                    left_file,
+                    a.additional,
+                    right_file,
+                    b.additional,
+                    seen,
+                    conflicts,
+                )
+
+    def _covers(
+        self,
+        members: List[SchemaNode],
+        filename: str,
+        others: List[SchemaNode],
+        other_file: str,
+        seen: Set[Tuple[int, int]],
+    ) -> bool:
+        """Whether every member has a compatible counterpart in ``others``."""
+        for member in members:
+            if not any(
+                self._compatible(member, filename, other, other_file, seen)
+                for other in others
+            ):
+                return False
+        return True
+
+    def _compatible(
+        self,
+        left: SchemaNode,
+        left_file: str,
+        right: SchemaNode,
+        right_file: str,
+        seen: Set[Tuple[int, int]],
+    ) -> bool:
+        found: List[SchemaConflict] = []
+        self._diff("", left_file, left, right_file, right, seen, found)
+        return not found
+
+
+def _bare(node: SchemaNode) -> SchemaNode:
+    """Return ``node`` without nullability, for conflict messages."""
+    return replace(node, nullable=False) if node.nullable else node
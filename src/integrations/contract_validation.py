@@ -17,7 +17,12 @@ tasks to the kanban board:
    completes; this version operates on the in-memory
    ``contract_artifacts`` dict produced by
    ``_generate_contracts_by_domain`` so it can run in the live
-   decomposition path before agents are spawned.
+   decomposition path before agents are spawned. Where the smoke
+   test matches ``- field (type)`` lines with a regex, this version
+   parses each contract into a schema model
+   (:mod:`src.integrations.contract_schema`) and compares nested
+   objects, arrays, optional fields and named types, reporting
+   conflicts by path (``Widget.position.x: number vs string``).
 
 2. **Functional requirement coverage** — every PRD functional
    requirement that uses a user-facing verb (display, render, show,
@@ -40,33 +45,24 @@ References
   rigorous, globally amnesiac") and the verb-coverage rule
 """
 
-import re
-from typing import Any, Dict, List, Mapping, Optional
+from itertools import combinations
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from src.integrations.contract_schema import (
+    ContractSchema,
+    ContractSchemaCache,
+    SchemaComparator,
+    SchemaConflict,
+    SchemaNode,
+    canonical_name,
+    get_contract_schema_cache,
+)
 
 # --------------------------------------------------------------------------
 # Cross-contract type consistency
 # --------------------------------------------------------------------------
 
 
-# Strict type-annotation pattern. Matches ``- field (type)`` or
-# ``* field (type)`` where ``type`` starts with a primitive type
-# keyword. This eliminates false positives where prose in
-# parentheses (e.g. ``(for rendering)``) would otherwise be
-# captured as a type annotation.
-#
-# Mirrors the pattern in dev-tools/examples/gh320_experiment_4_smoke.py
-# (per PR #329 review). The two implementations should stay in sync;
-# if you tighten one, tighten the other.
-_TYPE_ANNOTATION_PATTERN = re.compile(
-    r"[-*]\s+`?(\w[\w.]*)`?\s*\(\s*("
-    r"(?:string|number|boolean|integer|float|object|array|"
-    r"date|datetime|json|null|void|bigint)"
-    r"(?:\s*\|\s*(?:string|number|boolean|null))*"
-    r"(?:[^)]{0,200})"
-    r")\s*\)",
-    re.IGNORECASE,
-)
-
 # Field names whose collision is benign (universal identifiers,
 # enum-like literals). They appear in many domains and aliasing
 # them as the same name doesn't constitute a contradiction.
@@ -86,100 +82,58 @@ _BENIGN_CANONICAL_FIELDS = frozenset(
 )
 
 
-def _normalize_type(type_str: str) -> str:
-    """
-    Normalize a type string for cross-file comparison.
-
-    The goal is to catch real type disagreements (``string`` vs
-    ``number``, ``array of strings`` vs ``array of Foo``) while
-    ignoring stylistic noise that doesn't change the underlying
-    type contract (length constraints, format hints, optionality,
-    JSON Schema synonyms).
-
-    Strategy:
-
-    1. Lowercase, strip markdown, collapse whitespace and union
-       syntax (``or`` → ``|``).
-    2. Drop common qualifier suffixes (required / optional / nullable).
-    3. **Drop everything after the first comma.** Trailing
-       ``, UUID v4``, ``, 0-500 characters``, ``, max 100, default 20``
-       describe constraints on the base type, not the type itself.
-    4. For composite types (``array of X``, ``map of X``), preserve
-       the element type so genuine element-type disagreement is
-       still caught.
-    5. Canonicalize JSON Schema synonyms: ``integer`` → ``number``
-       (integer is a subset of number per JSON Schema; treating them
-       as a contradiction floods recipe-platform-shaped projects
-       with false positives on pagination params like ``limit``).
-
-    Catches: ``string`` vs ``number``, ``array of strings`` vs
-    ``array of Recipe``, ``Date object`` vs ``ISO 8601 string``.
-
-    Ignores: ``string, UUID v4`` vs ``string``, ``number, optional,
-    default 20`` vs ``integer, max 100``, ``string, 0-500 chars`` vs
-    ``string``.
-
-    Parameters
-    ----------
-    type_str : str
-        Raw type annotation as captured from the markdown contract.
-
-    Returns
-    -------
-    str
-        Normalized form suitable for set comparison.
-    """
-    t = type_str.lower().strip().strip("`")
-    t = re.sub(r"\s+", " ", t)
-
-    # Normalize union syntax: "X or Y" -> "X | Y"
-    t = re.sub(r"\bor\b", "|", t)
-    # Collapse spaces around union pipes
-    t = re.sub(r"\s*\|\s*", "|", t)
-
-    qualifiers = [
-        ", required",
-        ", optional",
-        ", nullable",
-        " required",
-        " optional",
-        " nullable",
+def _comparable_field(name: str) -> bool:
+    """Whether a field declared outside a shared entity should be cross-checked."""
+    canonical = name.lower()
+    return not (
+        len(canonical) < 3
+        or canonical in _BENIGN_CANONICAL_FIELDS
+        # CamelCase identifiers are usually class/interface
+        # references, not fields.
+        or (name[0].isupper() and any(c.isupper() for c in name[1:]))
+    )
+
+
+def _top_level_fields(
+    schema: ContractSchema,
+) -> List[Tuple[str, str, SchemaNode, bool]]:
+    """Return ``(canonical, path, node, scoped)`` for each top-level field."""
+    entries = [
+        (canonical_name(name), name, node, False)
+        for name, node in schema.fields.properties.items()
+        if _comparable_field(name)
     ]
-    for qual in qualifiers:
-        t = t.replace(qual, "")
-
-    # Drop trailing constraints separated by comma (format hints,
-    # length bounds, default values, etc).  ``string, UUID v4`` →
-    # ``string``; ``number, max 100, default 20`` → ``number``.
-    # Composite types like ``array of X`` don't use commas inside
-    # the ``X`` payload in any of the contract corpora we've seen,
-    # so this is safe.  If that changes, the LLM should emit
-    # ``Array<X>`` style instead.
-    t = t.split(",")[0].strip()
-
-    # JSON Schema synonym: integer is a number subtype.  Treating
-    # them as a contradiction false-positives on pagination params
-    # like ``limit (number)`` vs ``limit (integer)``.  Apply per
-    # union member so ``integer | null`` and ``number | null`` also
-    # canonicalize equally (Codex P2 on PR #505).
-    if "|" in t:
-        t = "|".join("number" if part == "integer" else part for part in t.split("|"))
-    elif t == "integer":
-        t = "number"
-
-    return t
+    for key, definition in schema.definitions.items():
+        for name, node in definition.properties.items():
+            if _comparable_field(name):
+                path = f"{definition.title or key}.{name}"
+                entries.append((canonical_name(name), path, node, True))
+    return entries
 
 
 def check_contract_cross_file_consistency(
     contract_artifacts: Mapping[str, Optional[Dict[str, Any]]],
+    cache: Optional[ContractSchemaCache] = None,
 ) -> Dict[str, Any]:
     """
     Check that no field has contradictory types across contract files.
 
     Walks the ``contract_artifacts`` dict produced by
-    ``_generate_contracts_by_domain``, extracts ``- field (type)``
-    annotations from every ``interface_contracts`` artifact, and
-    flags any field name appearing in ≥2 contracts with ≠ types.
+    ``_generate_contracts_by_domain``, parses every
+    ``interface_contracts`` artifact into a normalized schema (see
+    :mod:`src.integrations.contract_schema`) and compares them
+    structurally:
+
+    - an entity defined in two or more contracts (``## WidgetPosition``,
+      ``interface Widget {...}``, ``class Widget:``, ``widget.x``
+      bullets) is compared field by field, through nested objects,
+      arrays, maps and named types;
+    - a field declared outside any entity is compared with every
+      same-named top-level field in the other contracts.
+
+    Python and TypeScript vocabularies are normalized first, so
+    ``List[str]`` matches ``string[]`` and ``Optional[int]`` matches
+    ``number | null``; optionality and format hints are not conflicts.
 
     Only ``interface_contracts`` artifacts are scanned. The other
     artifact types (architecture, api_contracts, data_models) are
@@ -192,6 +146,10 @@ def check_contract_cross_file_consistency(
         Mapping of ``domain_name -> {"artifacts": [...], "decisions":
         [...]}``. Domains where contract generation produced no
         output map to ``None`` and are skipped.
+    cache : ContractSchemaCache, optional
+        Parsed schemas by content hash; defaults to the process-wide
+        cache, so re-checking after an edit only re-parses the edited
+        artifacts.
 
     Returns
     -------
@@ -199,26 +157,28 @@ def check_contract_cross_file_consistency(
         Dict with keys:
 
         - ``pass`` (bool): True if no contradictions found
-        - ``contradictions`` (list): one entry per contradictory field
-          with ``field`` (canonical name) and ``types_by_file`` (map
-          of filename -> raw type string)
-        - ``total_fields`` (int): total field annotations scanned
+        - ``contradictions`` (list): one entry per conflicting path
+          with ``field`` (canonical leaf name), ``path`` (e.g.
+          ``Widget.position.x``), ``types_by_file`` (map of filename ->
+          raw type string) and ``conflicts`` (messages such as
+          ``Widget.position.x: number vs string``)
+        - ``total_fields`` (int): total field declarations parsed
         - ``unique_fields`` (int): distinct canonical field names
           observed across all files
         - ``files_scanned`` (int): number of interface_contracts
           artifacts processed
+        - ``shared_entities`` (int): entities defined in 2+ files
 
     Notes
     -----
     Heuristic, not perfect. Will miss contradictions described in
-    prose form and may flag benign duplicates where two files use
-    slightly different type vocabulary for the same concept. The
-    goal is to catch obvious scope bugs before agents burn credits,
-    not to be an exhaustive type checker.
+    prose form, and a named type that no contract defines can only be
+    compared by name. The goal is to catch obvious scope bugs before
+    agents burn credits, not to be an exhaustive type checker.
     """
-    # field_name -> {filename: type_str}
-    field_types: Dict[str, Dict[str, str]] = {}
-    total_fields = 0
+    if cache is None:
+        cache = get_contract_schema_cache()
+    schemas: Dict[str, ContractSchema] = {}
     files_scanned = 0
 
     for _domain_name, payload in contract_artifacts.items():
@@ -239,51 +199,63 @@ def check_contract_cross_file_consistency(
             if "interface-contracts" not in filename:
                 continue
             files_scanned += 1
-            content = artifact.get("content", "")
-
-            for match in _TYPE_ANNOTATION_PATTERN.finditer(content):
-                field_name = match.group(1).strip()
-                type_str = match.group(2).strip()
-                total_fields += 1
-
-                # Normalize compound field names: ``weather.temperature``
-                # collides with ``temperature`` when they refer to the
-                # same concept. Use the last dotted segment as the
-                # canonical key.
-                canonical = field_name.split(".")[-1].lower()
-
-                # Skip benign aliases and obvious type/interface refs.
-                if (
-                    len(canonical) < 3
-                    or canonical in _BENIGN_CANONICAL_FIELDS
-                    # CamelCase identifiers are usually class/interface
-                    # references, not fields.
-                    or (
-                        field_name[0].isupper()
-                        and any(c.isupper() for c in field_name[1:])
-                    )
-                ):
-                    continue
-
-                field_types.setdefault(canonical, {})[filename] = type_str
-
-    contradictions: List[Dict[str, Any]] = []
-    for canonical, file_type_map in field_types.items():
-        if len(file_type_map) < 2:
-            continue
-        type_set = {_normalize_type(t) for t in file_type_map.values()}
-        if len(type_set) > 1:
-            contradictions.append(
-                {
-                    "field": canonical,
-                    "types_by_file": dict(file_type_map),
-                }
+            schemas[filename] = cache.get(artifact.get("content", ""))
+
+    comparator = SchemaComparator(schemas)
+    conflicts: List[SchemaConflict] = []
+
+    shared_entities = 0
+    for name, definitions in comparator.shared_definitions():
+        shared_entities += 1
+        for (left_file, left), (right_file, right) in combinations(definitions, 2):
+            if left_file != right_file:
+                conflicts.extend(
+                    comparator.compare(name, left_file, left, right_file, right)
+                )
+
+    # Fields outside a shared entity: compare by name, as long as at
+    # least one side is unscoped (``temperature`` vs
+    # ``weather.temperature``). Two different entities' fields are
+    # different concepts and are not compared.
+    fields_by_name: Dict[str, List[Tuple[str, str, SchemaNode, bool]]] = {}
+    for filename, schema in schemas.items():
+        for canonical, path, node, scoped in _top_level_fields(schema):
+            fields_by_name.setdefault(canonical, []).append(
+                (filename, path, node, scoped)
+            )
+    for entries in fields_by_name.values():
+        for left, right in combinations(entries, 2):
+            if left[0] == right[0] or (left[3] and right[3]):
+                continue
+            path = right[1] if left[3] else left[1]
+            conflicts.extend(
+                comparator.compare(path, left[0], left[2], right[0], right[2])
             )
 
+    contradictions: Dict[str, Dict[str, Any]] = {}
+    for conflict in conflicts:
+        entry = contradictions.setdefault(
+            conflict.path,
+            {
+                "field": conflict.path.split(".")[-1].split("[")[0].lower(),
+                "path": conflict.path,
+                "types_by_file": {},
+                "conflicts": [],
+            },
+        )
+        entry["types_by_file"].setdefault(conflict.left_file, conflict.left_source)
+        entry["types_by_file"].setdefault(conflict.right_file, conflict.right_source)
+        if str(conflict) not in entry["conflicts"]:
+            entry["conflicts"].append(str(conflict))
+
+    field_names = set()
+    for schema in schemas.values():
+        field_names |= schema.field_names
     return {
-        "pass": len(contradictions) == 0,
-        "contradictions": contradictions,
-        "total_fields": total_fields,
-        "unique_fields": len(field_types),
+        "pass": not contradictions,
+        "contradictions": list(contradictions.values()),
+        "total_fields": sum(schema.field_count for schema in schemas.values()),
+        "unique_fields": len(field_names),
         "files_scanned": files_scanned,
+        "shared_entities": shared_entities,
     }
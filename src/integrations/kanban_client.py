@@ -27,6 +27,7 @@ from mcp.client.stdio import stdio_client
 from mcp.types import TextContent
 
 from src.core.models import Priority, Task, TaskStatus
+from src.core.resilience import with_bulkhead, with_circuit_breaker
 
 logger = logging.getLogger(__name__)
 
@@ -56,6 +57,8 @@ class KanbanClient:
     -----
     Planka credentials are loaded from environment variables or set to defaults.
     Board and project IDs are loaded from config_marcus.json if available.
+    Calls that reach Planka share the ``kanban`` bulkhead and circuit breaker
+    (see :mod:`src.core.resilience`).
     """
 
     def __init__(self) -> None:
@@ -349,6 +352,8 @@ class KanbanClient:
             for path in config_paths:
                 print(f"   - {path.absolute()}", file=sys.stderr)
 
+    @with_bulkhead("kanban")
+    @with_circuit_breaker("kanban")
     async def get_available_tasks(self) -> List[Task]:
         """
         Get all unassigned tasks from the kanban board.
@@ -533,6 +538,8 @@ class KanbanClient:
 
                 return tasks
 
+    @with_bulkhead("kanban")
+    @with_circuit_breaker("kanban")
     async def get_all_tasks(self) -> List[Task]:
         """
         Get all tasks from the kanban board regardless of status or assignment.
@@ -711,6 +718,8 @@ class KanbanClient:
 
         # If no lists were found or lists_result was empty, return empty list
 
+    @with_bulkhead("kanban")
+    @with_circuit_breaker("kanban")
     async def assign_task(self, task_id: str, agent_id: str) -> None:
         """
         Assign a task to an agent.
@@ -792,6 +801,8 @@ class KanbanClient:
                             },
                         )
 
+    @with_bulkhead("kanban")
+    @with_circuit_breaker("kanban")
     async def get_board_summary(self) -> Dict[str, Any]:
         """
         Get summary statistics for the kanban board.
@@ -1076,6 +1087,8 @@ class KanbanClient:
 
         return 0.0
 
+    @with_bulkhead("kanban")
+    @with_circuit_breaker("kanban")
     async def add_comment(self, task_id: str, comment_text: str) -> None:
         """
         Add a comment to a task.
@@ -1160,6 +1173,8 @@ class KanbanClient:
         keywords = status_to_keywords.get(status.lower(), [status.lower()])
         await self._move_task_to_list(task_id, keywords)
 
+    @with_bulkhead("kanban")
+    @with_circuit_breaker("kanban")
     async def _move_task_to_list(self, task_id: str, list_keywords: List[str]) -> None:
         """
         Move a task to a list matching one of the keywords.
@@ -1232,6 +1247,8 @@ class KanbanClient:
                             f"No list found matching keywords: {list_keywords}"
                         )
 
+    @with_bulkhead("kanban")
+    @with_circuit_breaker("kanban")
     async def auto_setup_project(
         self,
         project_name: str,
@@ -1330,6 +1347,8 @@ class KanbanClient:
 
                 return {"project_id": project_id, "board_id": board_id}
 
+    @with_bulkhead("kanban")
+    @with_circuit_breaker("kanban")
     async def get_projects(self) -> List[Dict[str, Any]]:
         """
         Get all projects from Planka.
@@ -1384,6 +1403,8 @@ class KanbanClient:
 
                 return []
 
+    @with_bulkhead("kanban")
+    @with_circuit_breaker("kanban")
     async def get_boards_for_project(self, project_id: str) -> List[Dict[str, Any]]:
         """
         Get all boards for a specific Planka project.
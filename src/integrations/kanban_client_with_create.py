@@ -14,6 +14,7 @@ from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
 
 from src.core.models import Priority, Task
+from src.core.resilience import with_bulkhead, with_circuit_breaker
 from src.integrations.kanban_client import KanbanClient
 from src.integrations.label_helper import LabelManagerHelper
 
@@ -86,6 +87,8 @@ class KanbanClientWithCreate(KanbanClient):
 
         return None
 
+    @with_bulkhead("kanban")
+    @with_circuit_breaker("kanban")
     async def create_task(self, task_data: Dict[str, Any]) -> Task:
         """
         Create a new task on the kanban board.
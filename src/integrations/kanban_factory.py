@@ -8,6 +8,7 @@ import os
 from typing import Any, Dict, Optional
 
 from src.config.marcus_config import get_config
+from src.core.metrics import instrument_kanban_client
 from src.integrations.kanban_interface import KanbanInterface, KanbanProvider
 from src.integrations.providers import (
     GitHubKanban,
@@ -43,7 +44,20 @@ class KanbanFactory:
         ------
         ValueError
             If provider is not supported
+
+        Notes
+        -----
+        Every public coroutine method of the returned provider is timed into
+        the ``marcus_kanban_call_duration_seconds`` metric.
         """
+        client = KanbanFactory._create_provider(provider, config)
+        return instrument_kanban_client(client)
+
+    @staticmethod
+    def _create_provider(
+        provider: str, config: Optional[Dict[str, Any]] = None
+    ) -> KanbanInterface:
+        """Instantiate the provider named ``provider``; see :meth:`create`."""
         # Get centralized configuration
         marcus_config = get_config()
 
@@ -4,9 +4,10 @@ This abstract base class defines the standard interface that all kanban
 integrations (Planka, Linear, GitHub Projects) must implement.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
 
 from src.core.models import Priority, Task, TaskStatus
 
@@ -20,6 +21,86 @@ class KanbanProvider(Enum):
     SQLITE = "sqlite"
 
 
+async def fan_out_create_tasks(
+    create_task: Callable[[Dict[str, Any]], Awaitable[Task]],
+    tasks_data: List[Dict[str, Any]],
+    max_concurrency: int = 8,
+) -> List[Union[Task, BaseException]]:
+    """
+    Create tasks concurrently with at most ``max_concurrency`` in flight.
+
+    Used by :meth:`KanbanInterface.create_tasks_bulk` for providers without
+    a native batch API, and by callers holding a client that only exposes
+    ``create_task``.
+
+    Parameters
+    ----------
+    create_task : Callable[[Dict[str, Any]], Awaitable[Task]]
+        Single-task creation coroutine function.
+    tasks_data : List[Dict[str, Any]]
+        Task data for each task to create.
+    max_concurrency : int
+        Maximum number of concurrent ``create_task`` calls.
+
+    Returns
+    -------
+    List[Union[Task, BaseException]]
+        Created task or the exception raised for it, in input order.
+    """
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def _create(task_data: Dict[str, Any]) -> Task:
+        async with semaphore:
+            return await create_task(task_data)
+
+    return list(
+        await asyncio.gather(
+            *(_create(task_data) for task_data in tasks_data),
+            return_exceptions=True,
+        )
+    )
+
+
+async def fan_out_update_tasks(
+    update_task: Callable[[str, Dict[str, Any]], Awaitable[Optional[Task]]],
+    updates: List[Tuple[str, Dict[str, Any]]],
+    max_concurrency: int = 8,
+) -> List[Union[Optional[Task], BaseException]]:
+    """
+    Apply task updates concurrently with at most ``max_concurrency`` in flight.
+
+    Used by :meth:`KanbanInterface.update_tasks_bulk` and by callers holding
+    a client that only exposes ``update_task``.
+
+    Parameters
+    ----------
+    update_task : Callable[[str, Dict[str, Any]], Awaitable[Optional[Task]]]
+        Single-task update coroutine function.
+    updates : List[Tuple[str, Dict[str, Any]]]
+        ``(task_id, fields)`` pairs to apply.
+    max_concurrency : int
+        Maximum number of concurrent ``update_task`` calls.
+
+    Returns
+    -------
+    List[Union[Optional[Task], BaseException]]
+        Updated task (None if not found) or the exception raised for it,
+        in input order.
+    """
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def _update(task_id: str, fields: Dict[str, Any]) -> Optional[Task]:
+        async with semaphore:
+            return await update_task(task_id, fields)
+
+    return list(
+        await asyncio.gather(
+            *(_update(task_id, fields) for task_id, fields in updates),
+            return_exceptions=True,
+        )
+    )
+
+
 class KanbanInterface(ABC):
     """
     Abstract base class for kanban board integrations.
@@ -28,6 +109,16 @@ class KanbanInterface(ABC):
     consistent behavior across different platforms.
     """
 
+    # Maximum concurrent create_task calls for the default
+    # create_tasks_bulk fan-out. Providers with tighter API limits
+    # override this.
+    bulk_create_concurrency: int = 8
+
+    # True when create_tasks_bulk rewrites in-batch ``original_id``
+    # dependencies to the new task IDs itself, so callers must not
+    # remap and re-write them afterwards.
+    bulk_remaps_dependencies: bool = False
+
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize kanban provider with configuration.
@@ -123,6 +214,71 @@ class KanbanInterface(ABC):
         """
         pass
 
+    async def create_tasks_bulk(
+        self,
+        tasks_data: List[Dict[str, Any]],
+        max_concurrency: Optional[int] = None,
+    ) -> List[Union[Task, BaseException]]:
+        """
+        Create many tasks on the board.
+
+        The default implementation fans ``create_task`` out with bounded
+        concurrency. Providers with a cheaper batch path (e.g. a single
+        database transaction) override it.
+
+        Parameters
+        ----------
+        tasks_data : List[Dict[str, Any]]
+            Task data for each task, in the format accepted by
+            ``create_task``.
+        max_concurrency : Optional[int]
+            Cap on concurrent provider calls. Defaults to
+            ``bulk_create_concurrency``.
+
+        Returns
+        -------
+        List[Union[Task, BaseException]]
+            Created task or the exception raised for it, in the same
+            order as ``tasks_data``. One failure never aborts the batch.
+        """
+        return await fan_out_create_tasks(
+            self.create_task,
+            tasks_data,
+            max_concurrency or self.bulk_create_concurrency,
+        )
+
+    async def update_tasks_bulk(
+        self,
+        updates: List[Tuple[str, Dict[str, Any]]],
+        max_concurrency: Optional[int] = None,
+    ) -> List[Union[Optional[Task], BaseException]]:
+        """
+        Apply many task updates.
+
+        The default implementation fans ``update_task`` out with bounded
+        concurrency; providers with a batch write path override it.
+
+        Parameters
+        ----------
+        updates : List[Tuple[str, Dict[str, Any]]]
+            ``(task_id, fields)`` pairs, in the format accepted by
+            ``update_task``.
+        max_concurrency : Optional[int]
+            Cap on concurrent provider calls. Defaults to
+            ``bulk_create_concurrency``.
+
+        Returns
+        -------
+        List[Union[Optional[Task], BaseException]]
+            Updated task or the exception raised for it, in the same order
+            as ``updates``. One failure never aborts the batch.
+        """
+        return await fan_out_update_tasks(
+            self.update_task,
+            updates,
+            max_concurrency or self.bulk_create_concurrency,
+        )
+
     @abstractmethod
     async def update_task(
         self, task_id: str, updates: Dict[str, Any]
@@ -6,11 +6,12 @@ Provides shared functionality for create_project and add_feature tools.
 import logging
 from abc import ABC, abstractmethod
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 from src.core.models import Task
 from src.core.task_graph_validator import TaskGraphValidator
 from src.integrations.enhanced_task_classifier import EnhancedTaskClassifier
+from src.integrations.kanban_interface import KanbanInterface, fan_out_create_tasks
 from src.integrations.nlp_task_utils import (
     SafetyChecker,
     TaskBuilder,
@@ -138,51 +139,52 @@ class NaturalLanguageTaskCreator(ABC):
 
         created_tasks = []
         failed_tasks = []
+        # task_metadata rows keyed by kanban task ID, written in one batch
+        # after dependency remapping instead of one file/DB write per task
+        metadata_by_id: Dict[str, Dict[str, Any]] = {}
 
+        # Build task data up front so the whole batch reaches the board in
+        # one create_tasks_bulk call; build failures are reported per task
+        prepared: List[Union[Dict[str, Any], Exception]] = []
         for task in tasks:
             try:
-                # Build task data using utility
-                task_data = self.task_builder.build_task_data(task)
+                prepared.append(self.task_builder.build_task_data(task))
+            except Exception as build_error:
+                prepared.append(build_error)
+
+        logger.info(f"Creating {len(tasks)} tasks on board")
+        bulk_results = iter(
+            await self._create_tasks_bulk(
+                [data for data in prepared if isinstance(data, dict)]
+            )
+        )
+        creation_results = [
+            next(bulk_results) if isinstance(data, dict) else data
+            for data in prepared
+        ]
 
-                # Create task on board
-                logger.info(f"Creating task: {task.name}")
-                kanban_task = await self.kanban_client.create_task(task_data)
+        for task, task_data, result in zip(tasks, prepared, creation_results):
+            try:
+                if isinstance(result, BaseException):
+                    raise result
+                kanban_task = result
                 created_tasks.append(kanban_task)
 
-                # Store task metadata for Phase 1 analysis
-                try:
-                    from pathlib import Path
-
-                    from src.core.persistence import SQLitePersistence
-
-                    # Use absolute path to database (relative to marcus root)
-                    marcus_root = Path(__file__).parent.parent.parent
-                    db_path = marcus_root / "data" / "marcus.db"
-                    persistence = SQLitePersistence(db_path=db_path)
-
-                    # kanban_task is a Task object, not a dict
-                    task_id = kanban_task.id
-                    if task_id:
-                        await persistence.store(
-                            "task_metadata",
-                            str(task_id),
-                            {
-                                "task_id": str(task_id),
-                                "name": task.name,
-                                "description": task.description,
-                                "priority": task_data.get("priority"),
-                                "estimated_hours": task.estimated_hours,
-                                "labels": task.labels,
-                                "dependencies": task.dependencies,
-                                "project_id": self.active_project_id,
-                                "source_type": getattr(task, "source_type", None),
-                                "created_at": datetime.now(timezone.utc).isoformat(),
-                            },
-                        )
-                except Exception as log_error:
-                    logger.warning(
-                        f"Failed to log task metadata for '{task.name}': {log_error}"
-                    )
+                # Collect task metadata for Phase 1 analysis
+                task_id = kanban_task.id
+                if task_id and isinstance(task_data, dict):
+                    metadata_by_id[str(task_id)] = {
+                        "task_id": str(task_id),
+                        "name": task.name,
+                        "description": task.description,
+                        "priority": task_data.get("priority"),
+                        "estimated_hours": task.estimated_hours,
+                        "labels": task.labels,
+                        "dependencies": task.dependencies,
+                        "project_id": self.active_project_id,
+                        "source_type": getattr(task, "source_type", None),
+                        "created_at": datetime.now(timezone.utc).isoformat(),
+                    }
 
                 # Snapshot the kanban task's human name into costs.db so the
                 # Cato dashboard can render real names in "Tokens by task"
@@ -278,15 +280,30 @@ class NaturalLanguageTaskCreator(ABC):
                 ),
             )
 
-        # Remap dependencies from slug IDs to real UUIDs
+        # Remap dependencies from slug IDs to real UUIDs. Providers whose
+        # bulk insert already rewrote them (SQLite) return created tasks
+        # with real dependency IDs, so there is nothing left to remap.
+        provider_remapped = (
+            isinstance(self.kanban_client, KanbanInterface)
+            and self.kanban_client.bulk_remaps_dependencies
+        )
+        remapped = False
         if update_dependencies and created_tasks:
-            await self._remap_dependencies(tasks, created_tasks)
-            # After remap, update the task_metadata rows in marcus.db
-            # so Cato sees the real UUIDs (not the synthetic slug IDs
-            # that were written during the per-task creation loop
-            # above). Without this, Cato's dependency graph contains
-            # unresolvable slug references and no edges render.
-            await self._update_task_metadata_dependencies(created_tasks)
+            if not provider_remapped:
+                remapped = self._remap_dependencies(tasks, created_tasks)
+            # Record the real dependency UUIDs in task_metadata so Cato
+            # sees them rather than the synthetic slug IDs. Without this,
+            # Cato's dependency graph contains unresolvable slug
+            # references and no edges render.
+            for created in created_tasks:
+                row = metadata_by_id.get(str(created.id))
+                if row is not None:
+                    row["dependencies"] = list(created.dependencies or [])
+
+        # Metadata goes first so a failed dependency write can't drop it
+        await self._store_task_metadata(metadata_by_id)
+        if remapped:
+            await self._persist_remapped_dependencies(created_tasks)
 
         # Decompose tasks that meet criteria and add as checklist items
         await self._decompose_and_add_subtasks(created_tasks, tasks)
@@ -296,103 +313,73 @@ class NaturalLanguageTaskCreator(ABC):
 
         return created_tasks
 
-    async def _update_task_metadata_dependencies(
-        self,
-        created_tasks: List[Task],
+    async def _create_tasks_bulk(
+        self, tasks_data: List[Dict[str, Any]]
+    ) -> List[Union[Task, BaseException]]:
+        """Create a batch of tasks through the kanban client's bulk API.
+
+        ``KanbanInterface`` providers implement ``create_tasks_bulk``
+        (a single transaction for SQLite, bounded fan-out for Planka,
+        GitHub and Linear). Other clients that only expose
+        ``create_task`` get the same bounded fan-out.
+
+        Parameters
+        ----------
+        tasks_data : List[Dict[str, Any]]
+            Task data built by ``TaskBuilder.build_task_data``.
+
+        Returns
+        -------
+        List[Union[Task, BaseException]]
+            Created task or the exception raised for it, in input order.
+        """
+        if isinstance(self.kanban_client, KanbanInterface):
+            return await self.kanban_client.create_tasks_bulk(tasks_data)
+        return await fan_out_create_tasks(self.kanban_client.create_task, tasks_data)
+
+    async def _store_task_metadata(
+        self, metadata_by_id: Dict[str, Dict[str, Any]]
     ) -> None:
-        """Update task_metadata rows after dependency remap.
-
-        The per-task creation loop at ``create_tasks_on_board``
-        persists ``task_metadata`` with the pre-remap slug-based
-        dependency IDs. After ``_remap_dependencies`` converts those
-        to real kanban UUIDs, the in-memory ``created_tasks`` have
-        correct dependencies but the ``task_metadata`` rows in
-        marcus.db still contain the slugs. Cato reads
-        ``task_metadata.dependencies`` for its graph so the slugs
-        produce unresolvable edges.
-
-        This helper re-reads each task_metadata row, patches the
-        ``dependencies`` field with the remapped values, and writes
-        it back. Best-effort — persistence errors are logged but
-        don't fail task creation.
+        """Persist task_metadata rows for Phase 1 analysis in one write.
+
+        Best-effort — persistence errors are logged but don't fail task
+        creation.
 
         Parameters
         ----------
-        created_tasks : List[Task]
-            Tasks after dependency remap (post-``_remap_dependencies``).
+        metadata_by_id : Dict[str, Dict[str, Any]]
+            task_metadata rows keyed by kanban task ID.
         """
-        # Setup persistence once. A failure here (can't import, can't
-        # open db) skips the whole pass — no per-task recovery is
-        # possible without the persistence client. Any successful
-        # setup proceeds to the per-task loop where errors are
-        # isolated so one bad row doesn't block the rest.
+        if not metadata_by_id:
+            return
         try:
             from pathlib import Path
 
             from src.core.persistence import SQLitePersistence
 
+            # Use absolute path to database (relative to marcus root)
             marcus_root = Path(__file__).parent.parent.parent
             db_path = marcus_root / "data" / "marcus.db"
             persistence = SQLitePersistence(db_path=db_path)
+            await persistence.store_many("task_metadata", metadata_by_id)
         except Exception as e:
             logger.warning(
-                f"Failed to initialize persistence for task_metadata "
-                f"dependency update (Cato edges may not render): {e}"
-            )
-            return
-
-        def _get(obj: Any, attr: str, default: Any = None) -> Any:
-            if hasattr(obj, attr):
-                return getattr(obj, attr)
-            if isinstance(obj, dict):
-                return obj.get(attr, default)
-            return default
-
-        updated = 0
-        failed = 0
-        for task in created_tasks:
-            # Isolate per-task errors so one malformed row or
-            # transient SQLite error doesn't abort updates for the
-            # rest of the batch (Codex P2 on PR #340).
-            try:
-                task_id = _get(task, "id", "")
-                if not task_id:
-                    continue
-                new_deps = list(_get(task, "dependencies", []) or [])
-
-                # Read existing metadata, patch deps, write back.
-                existing = await persistence.retrieve("task_metadata", str(task_id))
-                if existing is None:
-                    # No metadata row for this task — nothing to update.
-                    continue
-                existing["dependencies"] = new_deps
-                await persistence.store("task_metadata", str(task_id), existing)
-                updated += 1
-            except Exception as e:
-                failed += 1
-                logger.warning(
-                    f"Failed to update task_metadata dependencies "
-                    f"for task {_get(task, 'id', '?')} "
-                    f"({_get(task, 'name', '?')}): {e}"
-                )
-
-        if updated or failed:
-            logger.info(
-                f"task_metadata dependency update: "
-                f"{updated} succeeded, {failed} failed"
+                f"Failed to log task metadata for {len(metadata_by_id)} "
+                f"task(s): {e}"
             )
 
-    async def _remap_dependencies(
+    def _remap_dependencies(
         self,
         original_tasks: List[Task],
         created_tasks: List[Task],
-    ) -> None:
+    ) -> bool:
         """Remap dependencies from slug IDs to real kanban UUIDs.
 
         After task creation, dependencies still reference the original
         slug-style IDs (e.g. ``design_project_domain``). This method
-        builds a slug-to-UUID mapping and updates both the in-memory
-        Task objects and the kanban board storage.
+        builds a slug-to-UUID mapping and updates the in-memory Task
+        objects; :meth:`_persist_remapped_dependencies` writes them to
+        the board.
 
         Parameters
         ----------
@@ -400,6 +387,11 @@ class NaturalLanguageTaskCreator(ABC):
             Tasks as generated by NLP (with original slug IDs).
         created_tasks : List[Task]
             Tasks as created on the kanban board (with real UUIDs).
+
+        Returns
+        -------
+        bool
+            True if there was a slug-to-UUID mapping to apply.
         """
 
         # Build mapping: original_id / slug → real UUID
@@ -434,7 +426,7 @@ class NaturalLanguageTaskCreator(ABC):
                 slug_to_uuid[str(orig_id)] = str(c_id)
 
         if not slug_to_uuid:
-            return
+            return False
 
         logger.info(
             f"Remapping dependencies: {len(slug_to_uuid)} " f"slug-to-UUID entries"
@@ -460,17 +452,28 @@ class NaturalLanguageTaskCreator(ABC):
                         f" — skipping"
                     )
             _set(task, "dependencies", remapped)
+        return True
+
+    async def _persist_remapped_dependencies(self, created_tasks: List[Task]) -> None:
+        """Write remapped dependencies back to the kanban board.
 
-        # Persist remapped dependencies to kanban board
-        # SQLiteKanban stores deps in task_dependencies table
+        Only SQLite-backed clients store dependencies in a table this
+        layer can rewrite (``task_dependencies``); other providers keep
+        them on the card and are left as created.
+
+        Parameters
+        ----------
+        created_tasks : List[Task]
+            Created tasks whose ``dependencies`` were remapped.
+        """
         if hasattr(self.kanban_client, "_with_connection"):
             # SQLite provider — update junction table directly
             import sqlite3
 
             def _update_deps(conn: sqlite3.Connection) -> None:
                 for task in created_tasks:
-                    tid = _get(task, "id", "")
-                    deps = _get(task, "dependencies", [])
+                    tid = task.id
+                    deps = task.dependencies or []
                     conn.execute(
                         "DELETE FROM task_dependencies " "WHERE task_id = ?",
                         (tid,),
@@ -586,9 +589,14 @@ class NaturalLanguageTaskCreator(ABC):
             )
             # Pass complexity through project_context for time budgets and validation
             project_context = {"complexity": self.complexity}
+            # decompose_task holds a slot of the shared adaptive LLM limiter
+            # around its provider call, so large projects don't burst the
+            # provider and 429s back off there
             decomposition_jobs.append(
                 decompose_task(
-                    task_with_real_id, self.ai_engine, project_context=project_context
+                    task_with_real_id,
+                    self.ai_engine,
+                    project_context=project_context,
                 )
             )
             task_metadata.append((created_task, original_task))
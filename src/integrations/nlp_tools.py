@@ -24,6 +24,10 @@ from src.ai.advanced.prd.advanced_parser import (  # noqa: E402
     ProjectConstraints,
 )
 from src.config.decomposer_config import is_contract_first  # noqa: E402
+from src.core.adaptive_concurrency import (  # noqa: E402
+    LLM_LIMITER,
+    get_concurrency_limiter,
+)
 from src.core.events import EventTypes  # noqa: E402
 from src.core.models import Priority, Task, TaskStatus  # noqa: E402
 from src.core.resilience import RetryConfig, with_retry  # noqa: E402
@@ -217,12 +221,16 @@ def _build_decomposer_warning(
 # artifacts + 1 decisions), uncapped parallelism would burst up to 50 calls
 # simultaneously and risk tripping Anthropic's per-minute rate limit. 10 is a
 # safe ceiling for Claude Sonnet at paid-tier rate limits while preserving
-# most of the wall-clock speedup.
+# most of the wall-clock speedup. Within that ceiling, calls also draw from
+# the shared adaptive ``"llm"`` limiter, which halves its window when the
+# provider answers 429 so the PRD parser and design phase back off together.
 # ---------------------------------------------------------------------------
 _DESIGN_LLM_CONCURRENCY = 10
 
 
-@with_retry(RetryConfig(max_attempts=3, base_delay=2.0, jitter=True))
+@with_retry(
+    RetryConfig(max_attempts=3, base_delay=2.0, jitter=True), dependency="ai_provider"
+)
 async def _bounded_llm_analyze(
     llm: Any,
     prompt: str,
@@ -236,6 +244,8 @@ async def _bounded_llm_analyze(
     Wraps a single LLM call so that:
 
     - at most ``semaphore._value`` calls run concurrently (rate-limit guard),
+    - the call also holds a slot of the shared adaptive ``"llm"`` limiter,
+      so a 429 here shrinks concurrency for every LLM fan-out,
     - transient failures retry up to 3 times with jittered exponential
       backoff (``RetryConfig(max_attempts=3, base_delay=2.0, jitter=True)``).
 
@@ -272,7 +282,7 @@ async def _bounded_llm_analyze(
         Re-raises the last exception from ``llm.analyze`` after retries are
         exhausted.
     """
-    async with semaphore:
+    async with semaphore, get_concurrency_limiter(LLM_LIMITER).slot():
         response: str = await llm.analyze(
             prompt=prompt, context=context, operation=operation
         )
@@ -820,8 +830,9 @@ class NaturalLanguageProjectCreator(NaturalLanguageTaskCreator):
         consistency = check_contract_cross_file_consistency(usable_contracts)
         if not consistency["pass"]:
             contradiction_summary = ", ".join(
-                f"{c['field']} ({'/'.join(c['types_by_file'].values())})"
+                message
                 for c in consistency["contradictions"]
+                for message in c["conflicts"]
             )
             logger.warning(
                 f"[decomposer] contract_first: cross-contract type "
@@ -14,6 +14,9 @@ from src.integrations.kanban_interface import KanbanInterface, KanbanProvider
 class GitHubKanban(KanbanInterface):
     """GitHub Projects kanban board implementation using MCP Server."""
 
+    # GitHub's secondary rate limits penalize bursts of content creation
+    bulk_create_concurrency = 4
+
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize GitHub MCP connection.
@@ -46,6 +46,9 @@ def _extract_text_content(result: Any) -> Optional[str]:
 class PlankaKanban(KanbanInterface):
     """Planka kanban board implementation."""
 
+    # Each create_task spawns its own MCP stdio session
+    bulk_create_concurrency = 4
+
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize Planka connection.
@@ -248,6 +248,9 @@ class SQLiteKanban(KanbanInterface):
             Default: ``./data/attachments``
     """
 
+    # create_tasks_bulk rewrites slug dependencies inside its transaction
+    bulk_remaps_dependencies = True
+
     def __init__(self, config: Dict[str, Any]) -> None:
         super().__init__(config)
         self.provider = KanbanProvider.SQLITE
@@ -389,9 +392,165 @@ class SQLiteKanban(KanbanInterface):
             await self.connect()
 
         task_id = uuid.uuid4().hex
-        now = datetime.now(timezone.utc)
-        now_iso = now.isoformat()
+        now_iso = datetime.now(timezone.utc).isoformat()
+
+        def _insert(conn: sqlite3.Connection) -> None:
+            conn.execute("BEGIN")
+            try:
+                self._insert_task_row(
+                    conn,
+                    task_id,
+                    task_data,
+                    now_iso,
+                    task_data.get("dependencies", []),
+                )
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+
+        await self._run_in_executor(lambda: self._with_connection(_insert))
+
+        task = await self.get_task_by_id(task_id)
+        if task is None:
+            raise RuntimeError(f"Failed to retrieve created task {task_id}")
+        return task
+
+    async def create_tasks_bulk(
+        self,
+        tasks_data: List[Dict[str, Any]],
+        max_concurrency: Optional[int] = None,
+    ) -> List[Union[Task, BaseException]]:
+        """Create many tasks, labels and dependencies in one transaction.
+
+        Dependencies that reference another task in the same batch by its
+        ``original_id`` (the NLP slug) are rewritten to the new task ID
+        inside the transaction, so no follow-up remap writes are needed.
+        Dependencies that match neither a slug in the batch nor a task on
+        the board are dropped with a warning. Each task is inserted under
+        its own savepoint: a bad row is reported in the result list without
+        rolling back the others.
+
+        Parameters
+        ----------
+        tasks_data : List[Dict[str, Any]]
+            Task fields for each task, as passed to ``create_task``.
+        max_concurrency : Optional[int]
+            Ignored — inserts are serialized inside one transaction.
+
+        Returns
+        -------
+        List[Union[Task, BaseException]]
+            Created task or the exception that prevented its creation,
+            in the same order as ``tasks_data``.
+        """
+        if not self.connected:
+            await self.connect()
+        if not tasks_data:
+            return []
 
+        now_iso = datetime.now(timezone.utc).isoformat()
+        task_ids = [uuid.uuid4().hex for _ in tasks_data]
+        slug_to_id: Dict[str, str] = {}
+        for task_id, task_data in zip(task_ids, tasks_data):
+            original_id = task_data.get("original_id")
+            if original_id:
+                slug_to_id[str(original_id)] = task_id
+
+        def _resolve_dependencies(
+            conn: sqlite3.Connection, task_data: Dict[str, Any]
+        ) -> List[str]:
+            resolved: List[str] = []
+            for dep_id in task_data.get("dependencies", []) or []:
+                if str(dep_id) in slug_to_id:
+                    resolved.append(slug_to_id[str(dep_id)])
+                elif conn.execute(
+                    "SELECT 1 FROM tasks WHERE id = ?", (str(dep_id),)
+                ).fetchone():
+                    resolved.append(str(dep_id))
+                else:
+                    logger.warning(
+                        f"Orphaned dependency '{dep_id}' "
+                        f"on task '{task_data.get('name', '?')}' — skipping"
+                    )
+            return resolved
+
+        def _insert_all(
+            conn: sqlite3.Connection,
+        ) -> List[Optional[BaseException]]:
+            errors: List[Optional[BaseException]] = []
+            conn.execute("BEGIN")
+            try:
+                for task_id, task_data in zip(task_ids, tasks_data):
+                    dependencies = _resolve_dependencies(conn, task_data)
+                    conn.execute("SAVEPOINT bulk_task")
+                    try:
+                        self._insert_task_row(
+                            conn, task_id, task_data, now_iso, dependencies
+                        )
+                        conn.execute("RELEASE SAVEPOINT bulk_task")
+                        errors.append(None)
+                    except Exception as e:
+                        conn.execute("ROLLBACK TO SAVEPOINT bulk_task")
+                        conn.execute("RELEASE SAVEPOINT bulk_task")
+                        errors.append(e)
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            return errors
+
+        errors = await self._run_in_executor(
+            lambda: self._with_connection(_insert_all)
+        )
+        created_ids = [tid for tid, err in zip(task_ids, errors) if err is None]
+        tasks_by_id = {
+            task.id: task for task in await self._get_tasks_by_ids(created_ids)
+        }
+
+        results: List[Union[Task, BaseException]] = []
+        for task_id, err in zip(task_ids, errors):
+            if err is not None:
+                results.append(err)
+            elif task_id in tasks_by_id:
+                results.append(tasks_by_id[task_id])
+            else:
+                results.append(
+                    RuntimeError(f"Failed to retrieve created task {task_id}")
+                )
+
+        logger.info(
+            f"[SQLiteKanban] Bulk-created {len(created_ids)}/{len(tasks_data)} "
+            f"tasks in one transaction"
+        )
+        return results
+
+    def _insert_task_row(
+        self,
+        conn: sqlite3.Connection,
+        task_id: str,
+        task_data: Dict[str, Any],
+        now_iso: str,
+        dependencies: List[str],
+    ) -> None:
+        """Insert one task with its labels and dependencies.
+
+        Runs inside the caller's transaction so single and bulk creation
+        share the same row mapping.
+
+        Parameters
+        ----------
+        conn : sqlite3.Connection
+            Connection with an open transaction.
+        task_id : str
+            Generated ID for the new task.
+        task_data : Dict[str, Any]
+            Task fields as passed to ``create_task``.
+        now_iso : str
+            Creation timestamp (ISO format).
+        dependencies : List[str]
+            Dependency IDs to store for the task.
+        """
         # Parse status
         raw_status = task_data.get("status", "todo")
         if isinstance(raw_status, TaskStatus):
@@ -410,109 +569,93 @@ class SQLiteKanban(KanbanInterface):
                 priority = Priority.MEDIUM
 
         labels: List[str] = task_data.get("labels", [])
-        dependencies: List[str] = task_data.get("dependencies", [])
 
-        def _insert(conn: sqlite3.Connection) -> None:
-            conn.execute("BEGIN")
-            try:
-                conn.execute(
-                    """
-                    INSERT INTO tasks (
-                        id, name, description, status, priority,
-                        assigned_to, created_at, updated_at,
-                        due_date, estimated_hours, actual_hours,
-                        project_id, project_name, is_subtask,
-                        parent_task_id, subtask_index, source_type,
-                        source_context, completion_criteria,
-                        acceptance_criteria,
-                        validation_spec, provides, requires,
-                        original_id
-                    ) VALUES (
-                        ?, ?, ?, ?, ?,
-                        ?, ?, ?,
-                        ?, ?, ?,
-                        ?, ?, ?,
-                        ?,
-                        ?, ?, ?,
-                        ?, ?,
-                        ?, ?, ?,
-                        ?
+        conn.execute(
+            """
+            INSERT INTO tasks (
+                id, name, description, status, priority,
+                assigned_to, created_at, updated_at,
+                due_date, estimated_hours, actual_hours,
+                project_id, project_name, is_subtask,
+                parent_task_id, subtask_index, source_type,
+                source_context, completion_criteria,
+                acceptance_criteria,
+                validation_spec, provides, requires,
+                original_id
+            ) VALUES (
+                ?, ?, ?, ?, ?,
+                ?, ?, ?,
+                ?, ?, ?,
+                ?, ?, ?,
+                ?,
+                ?, ?, ?,
+                ?, ?,
+                ?, ?, ?,
+                ?
+            )
+            """,
+            (
+                task_id,
+                task_data.get("name", ""),
+                task_data.get("description", ""),
+                status.value,
+                priority.value,
+                task_data.get("assigned_to"),
+                now_iso,
+                now_iso,
+                task_data.get("due_date"),
+                task_data.get("estimated_hours", 0.0),
+                task_data.get("actual_hours", 0.0),
+                task_data.get("project_id", self.project_id),
+                task_data.get("project_name", self.project_name),
+                1 if task_data.get("is_subtask") else 0,
+                task_data.get("parent_task_id"),
+                task_data.get("subtask_index"),
+                task_data.get("source_type"),
+                (
+                    json.dumps(
+                        task_data["source_context"],
+                        default=_json_default,
                     )
-                    """,
-                    (
-                        task_id,
-                        task_data.get("name", ""),
-                        task_data.get("description", ""),
-                        status.value,
-                        priority.value,
-                        task_data.get("assigned_to"),
-                        now_iso,
-                        now_iso,
-                        task_data.get("due_date"),
-                        task_data.get("estimated_hours", 0.0),
-                        task_data.get("actual_hours", 0.0),
-                        task_data.get("project_id", self.project_id),
-                        task_data.get("project_name", self.project_name),
-                        1 if task_data.get("is_subtask") else 0,
-                        task_data.get("parent_task_id"),
-                        task_data.get("subtask_index"),
-                        task_data.get("source_type"),
-                        (
-                            json.dumps(
-                                task_data["source_context"],
-                                default=_json_default,
-                            )
-                            if task_data.get("source_context")
-                            else None
-                        ),
-                        (
-                            json.dumps(
-                                task_data["completion_criteria"],
-                                default=_json_default,
-                            )
-                            if task_data.get("completion_criteria")
-                            else None
-                        ),
-                        (
-                            json.dumps(
-                                task_data["acceptance_criteria"],
-                                default=_json_default,
-                            )
-                            if task_data.get("acceptance_criteria")
-                            else None
-                        ),
-                        task_data.get("validation_spec"),
-                        task_data.get("provides"),
-                        task_data.get("requires"),
-                        task_data.get("original_id"),
-                    ),
-                )
-
-                for label in labels:
-                    conn.execute(
-                        "INSERT OR IGNORE INTO task_labels "
-                        "(task_id, label) VALUES (?, ?)",
-                        (task_id, label),
+                    if task_data.get("source_context")
+                    else None
+                ),
+                (
+                    json.dumps(
+                        task_data["completion_criteria"],
+                        default=_json_default,
                     )
-
-                for dep_id in dependencies:
-                    conn.execute(
-                        "INSERT OR IGNORE INTO task_dependencies "
-                        "(task_id, depends_on_id) VALUES (?, ?)",
-                        (task_id, dep_id),
+                    if task_data.get("completion_criteria")
+                    else None
+                ),
+                (
+                    json.dumps(
+                        task_data["acceptance_criteria"],
+                        default=_json_default,
                     )
+                    if task_data.get("acceptance_criteria")
+                    else None
+                ),
+                task_data.get("validation_spec"),
+                task_data.get("provides"),
+                task_data.get("requires"),
+                task_data.get("original_id"),
+            ),
+        )
 
-                conn.commit()
-            except Exception:
-                conn.rollback()
-                raise
-
-        await self._run_in_executor(lambda: self._with_connection(_insert))
+        for label in labels:
+            conn.execute(
+                "INSERT OR IGNORE INTO task_labels "
+                "(task_id, label) VALUES (?, ?)",
+                (task_id, label),
+            )
 
-        task = await self.get_task_by_id(task_id)
-        if task is None:
-            raise RuntimeError(f"Failed to retrieve created task {task_id}")
-        return task
+        for dep_id in dependencies:
+            conn.execute(
+                "INSERT OR IGNORE INTO task_dependencies "
+                "(task_id, depends_on_id) VALUES (?, ?)",
+                (task_id, dep_id),
+            )
 
     # ----------------------------------------------------------
     # Task Retrieval
@@ -1620,7 +1763,79 @@ class SQLiteKanban(KanbanInterface):
         labels, deps = await self._run_in_executor(
             lambda: self._with_connection(_get_relations)
         )
+        return self._row_to_task(row, labels, deps)
+
+    async def _get_tasks_by_ids(self, task_ids: List[str]) -> List[Task]:
+        """Load several tasks with their relations in one connection.
+
+        Parameters
+        ----------
+        task_ids : List[str]
+            IDs of the tasks to load.
+
+        Returns
+        -------
+        List[Task]
+            Hydrated tasks that exist, in no particular order.
+        """
+        if not task_ids:
+            return []
+
+        def _query(
+            conn: sqlite3.Connection,
+        ) -> List[tuple[sqlite3.Row, List[str], List[str]]]:
+            labels: Dict[str, List[str]] = {}
+            deps: Dict[str, List[str]] = {}
+            rows: List[sqlite3.Row] = []
+            # Stay well under SQLITE_MAX_VARIABLE_NUMBER
+            for i in range(0, len(task_ids), 500):
+                chunk = task_ids[i : i + 500]
+                marks = ",".join("?" * len(chunk))
+                rows.extend(
+                    conn.execute(
+                        f"SELECT * FROM tasks WHERE id IN ({marks})",  # nosec B608
+                        chunk,
+                    ).fetchall()
+                )
+                for r in conn.execute(
+                    f"SELECT task_id, label FROM task_labels "  # nosec B608
+                    f"WHERE task_id IN ({marks})",
+                    chunk,
+                ):
+                    labels.setdefault(r[0], []).append(r[1])
+                for r in conn.execute(
+                    f"SELECT task_id, depends_on_id FROM "  # nosec B608
+                    f"task_dependencies WHERE task_id IN ({marks})",
+                    chunk,
+                ):
+                    deps.setdefault(r[0], []).append(r[1])
+            return [
+                (row, labels.get(row["id"], []), deps.get(row["id"], []))
+                for row in rows
+            ]
+
+        hydrated = await self._run_in_executor(lambda: self._with_connection(_query))
+        return [self._row_to_task(row, lbls, dps) for row, lbls, dps in hydrated]
+
+    def _row_to_task(
+        self, row: sqlite3.Row, labels: List[str], deps: List[str]
+    ) -> Task:
+        """Build a Task from a tasks row and its junction-table relations.
+
+        Parameters
+        ----------
+        row : sqlite3.Row
+            Raw database row from the tasks table.
+        labels : List[str]
+            Labels from ``task_labels``.
+        deps : List[str]
+            Dependency IDs from ``task_dependencies``.
 
+        Returns
+        -------
+        Task
+            Fully populated Task dataclass.
+        """
         # Parse source_context and completion_criteria JSON
         source_context = None
         if row["source_context"]:
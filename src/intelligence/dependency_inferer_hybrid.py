@@ -377,7 +377,9 @@ class HybridDependencyInferer(DependencyInferer):
 
         return groups
 
-    @with_retry(RetryConfig(max_attempts=2, base_delay=1.0))
+    @with_retry(
+        RetryConfig(max_attempts=2, base_delay=1.0), dependency="ai_provider"
+    )
     async def _get_ai_dependencies(
         self, tasks: List[Task], ambiguous_pairs: List[Tuple[Task, Task]]
     ) -> Dict[Tuple[str, str], HybridDependency]:
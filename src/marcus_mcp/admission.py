@@ -0,0 +1,646 @@
+"""
+Admission control for the multi-endpoint MCP server.
+
+``run_multi_endpoint_server`` serves the human, agent and analytics
+endpoints from one event loop. Without a gate, a burst of analytics
+queries or a human ``create_project`` competes on equal terms with
+agents calling ``request_next_task``, and under overload every caller's
+latency grows without bound.
+
+:class:`AdmissionController` puts every tool call through one priority
+queue:
+
+- each endpoint has its own concurrency cap, queue depth and maximum
+  queueing time, so one endpoint cannot take every slot;
+- waiting calls are admitted by priority — agent coordination tools
+  first, then interactive calls, then analytics and other heavy work —
+  and the last few slots are reserved for coordination calls;
+- a call that finds its endpoint's queue full, or that waits longer than
+  the endpoint allows, is shed with a structured ``retry_after`` response
+  (:class:`AdmissionRejected`) rather than left to time out;
+- during a graceful shutdown, :meth:`AdmissionController.drain` refuses
+  new calls the same way and waits for the running ones to finish.
+
+Endpoint apps pick this up by being :class:`AdmissionControlledFastMCP`
+instances, whose ``call_tool`` is the single entry point FastMCP uses for
+every tool invocation.
+"""
+
+import asyncio
+import bisect
+import itertools
+import json
+import logging
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field, replace
+from enum import IntEnum
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Sequence
+
+from mcp.server.fastmcp import FastMCP
+from mcp.types import CallToolResult, ContentBlock, TextContent
+
+from src.core.metrics import get_metrics
+
+logger = logging.getLogger(__name__)
+
+
+class Priority(IntEnum):
+    """Scheduling class of a tool call; lower values are admitted first."""
+
+    COORDINATION = 0
+    INTERACTIVE = 1
+    BACKGROUND = 2
+
+
+# Calls agents make in their work loop; these are never queued behind
+# interactive or background work and may use the reserved slots.
+COORDINATION_TOOLS = frozenset(
+    {
+        "ping",
+        "register_agent",
+        "request_next_task",
+        "report_task_progress",
+        "report_blocker",
+        "get_task_context",
+        "log_decision",
+        "log_artifact",
+        "get_agent_status",
+        "check_task_dependencies",
+    }
+)
+
+# Long-running or CPU-heavy tools, scheduled as background work whichever
+# endpoint they arrive on.
+BACKGROUND_TOOLS = frozenset(
+    {
+        "create_project",
+        "create_tasks",
+        "add_feature",
+        "query_project_history",
+        "diagnose_project",
+        "capture_stall_snapshot",
+        "replay_snapshot_conversations",
+    }
+)
+
+ENDPOINT_PRIORITY: Dict[str, Priority] = {
+    "agent": Priority.INTERACTIVE,
+    "human": Priority.INTERACTIVE,
+    "analytics": Priority.BACKGROUND,
+}
+
+
+def classify_call(endpoint: str, tool: str) -> Priority:
+    """
+    Return the scheduling priority of a tool call.
+
+    Parameters
+    ----------
+    endpoint : str
+        Endpoint the call arrived on (``"human"``, ``"agent"`` or
+        ``"analytics"``).
+    tool : str
+        Name of the tool being called.
+
+    Returns
+    -------
+    Priority
+        Coordination tools rank first on every endpoint and heavy tools
+        last; everything else takes its endpoint's default.
+    """
+    if tool in COORDINATION_TOOLS:
+        return Priority.COORDINATION
+    if tool in BACKGROUND_TOOLS:
+        return Priority.BACKGROUND
+    return ENDPOINT_PRIORITY.get(endpoint, Priority.INTERACTIVE)
+
+
+@dataclass
+class EndpointLimits:
+    """
+    Admission limits for one endpoint.
+
+    Parameters
+    ----------
+    max_concurrent : int
+        Calls from this endpoint that may run at once.
+    max_queued : int
+        Calls that may wait for a slot before new ones are shed.
+    max_queue_wait : float
+        Seconds a call may wait for a slot before it is shed.
+    """
+
+    max_concurrent: int
+    max_queued: int
+    max_queue_wait: float
+
+
+def _default_endpoint_limits() -> Dict[str, EndpointLimits]:
+    return {
+        "agent": EndpointLimits(max_concurrent=32, max_queued=256, max_queue_wait=30.0),
+        "human": EndpointLimits(max_concurrent=8, max_queued=32, max_queue_wait=30.0),
+        "analytics": EndpointLimits(
+            max_concurrent=4, max_queued=16, max_queue_wait=10.0
+        ),
+    }
+
+
+@dataclass
+class AdmissionConfig:
+    """
+    Configuration for an :class:`AdmissionController`.
+
+    Parameters
+    ----------
+    total_slots : int
+        Tool calls that may run at once across all endpoints.
+    reserved_coordination_slots : int
+        Of ``total_slots``, how many only coordination calls may take, so
+        agents can always get work even when other endpoints are busy.
+    endpoints : Dict[str, EndpointLimits]
+        Per-endpoint limits.
+    default_limits : EndpointLimits
+        Limits for endpoints without an entry in ``endpoints``.
+    min_retry_after, max_retry_after : float
+        Bounds, in seconds, on the ``retry_after`` hint given to shed calls.
+    """
+
+    total_slots: int = 40
+    reserved_coordination_slots: int = 4
+    endpoints: Dict[str, EndpointLimits] = field(
+        default_factory=_default_endpoint_limits
+    )
+    default_limits: EndpointLimits = field(
+        default_factory=lambda: EndpointLimits(
+            max_concurrent=8, max_queued=32, max_queue_wait=30.0
+        )
+    )
+    min_retry_after: float = 1.0
+    max_retry_after: float = 30.0
+
+
+class AdmissionRejected(Exception):
+    """
+    A tool call was shed instead of being queued.
+
+    Attributes
+    ----------
+    endpoint : str
+        Endpoint the call arrived on.
+    tool : str
+        Tool that was called.
+    reason : str
+        ``"queue_full"``, ``"queue_timeout"`` or ``"draining"``.
+    retry_after : float
+        Suggested seconds to wait before retrying.
+    """
+
+    def __init__(self, endpoint: str, tool: str, reason: str, retry_after: float):
+        self.endpoint = endpoint
+        self.tool = tool
+        self.reason = reason
+        self.retry_after = retry_after
+        super().__init__(
+            f"Marcus {endpoint} endpoint is overloaded ({reason}); "
+            f"retry {tool} in {retry_after:.1f}s"
+        )
+
+    def to_response(self) -> Dict[str, Any]:
+        """Return the structured tool response sent to the caller."""
+        return {
+            "success": False,
+            "error": "overloaded",
+            "message": str(self),
+            "retry_after": self.retry_after,
+            "endpoint": self.endpoint,
+            "tool": self.tool,
+            "reason": self.reason,
+        }
+
+
+@dataclass
+class _Waiter:
+    priority: Priority
+    seq: int
+    endpoint: str
+    tool: str
+    future: "asyncio.Future[None]"
+
+    @property
+    def sort_key(self) -> tuple[int, int]:
+        return (int(self.priority), self.seq)
+
+
+@dataclass
+class _EndpointState:
+    in_flight: int = 0
+    queued: int = 0
+    admitted: int = 0
+    rejected: int = 0
+    peak_in_flight: int = 0
+    # Smoothed seconds a call holds its slot, used for retry_after hints
+    service_time: float = 1.0
+
+
+class AdmissionController:
+    """
+    Priority admission queue shared by every MCP endpoint.
+
+    Like :class:`src.core.adaptive_concurrency.AdaptiveConcurrencyLimiter`,
+    waiters are futures created on the caller's loop, so one shared
+    instance is safe across the per-test loops pytest-asyncio creates.
+
+    Parameters
+    ----------
+    config : AdmissionConfig, optional
+        Slot counts and per-endpoint limits.
+    clock : Callable[[], float], optional
+        Monotonic clock, injectable for deterministic tests.
+
+    Examples
+    --------
+    >>> controller = get_admission_controller()
+    >>> async with controller.admit("agent", "request_next_task"):
+    ...     result = await handler(arguments)
+    """
+
+    def __init__(
+        self,
+        config: Optional[AdmissionConfig] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.config = config or AdmissionConfig()
+        self._clock = clock
+        self._in_flight = 0
+        self._waiters: List[_Waiter] = []
+        self._seq = itertools.count()
+        self._endpoints: Dict[str, _EndpointState] = {}
+        self._draining = False
+        self._drain_retry_after = self.config.min_retry_after
+        self._idle_waiters: List["asyncio.Future[None]"] = []
+
+    @property
+    def in_flight(self) -> int:
+        """Calls currently holding a slot."""
+        return self._in_flight
+
+    @property
+    def queued(self) -> int:
+        """Calls currently waiting for a slot."""
+        return len(self._waiters)
+
+    @property
+    def draining(self) -> bool:
+        """Whether new calls are being refused for a shutdown."""
+        return self._draining
+
+    def start_draining(self, retry_after: Optional[float] = None) -> None:
+        """
+        Refuse new calls and shed every queued one.
+
+        Parameters
+        ----------
+        retry_after : float, optional
+            Hint given to refused callers, typically the expected restart
+            time. Defaults to ``config.min_retry_after``.
+        """
+        self._draining = True
+        if retry_after is not None:
+            self._drain_retry_after = retry_after
+        for waiter in list(self._waiters):
+            self._forget(waiter)
+            if not waiter.future.done():
+                waiter.future.set_exception(
+                    self._reject(waiter.endpoint, waiter.tool, "draining")
+                )
+
+    async def drain(
+        self, timeout: float, retry_after: Optional[float] = None
+    ) -> int:
+        """
+        Stop admitting calls and wait for running ones to finish.
+
+        Parameters
+        ----------
+        timeout : float
+            Seconds to wait for in-flight calls.
+        retry_after : float, optional
+            Hint given to callers refused while draining.
+
+        Returns
+        -------
+        int
+            Calls still running when the wait ended (0 when fully drained).
+        """
+        self.start_draining(retry_after)
+        if self._in_flight:
+            idle: "asyncio.Future[None]" = asyncio.get_running_loop().create_future()
+            self._idle_waiters.append(idle)
+            try:
+                await asyncio.wait_for(idle, timeout)
+            except asyncio.TimeoutError:
+                logger.warning(
+                    f"Drain timed out after {timeout:.1f}s with "
+                    f"{self._in_flight} tool calls still running"
+                )
+        return self._in_flight
+
+    def resume(self) -> None:
+        """Accept calls again after :meth:`drain`."""
+        self._draining = False
+
+    def limits_for(self, endpoint: str) -> EndpointLimits:
+        """Return the limits that apply to ``endpoint``."""
+        return self.config.endpoints.get(endpoint, self.config.default_limits)
+
+    def configure_endpoint(self, endpoint: str, **overrides: Any) -> EndpointLimits:
+        """
+        Override some of an endpoint's limits.
+
+        Keyword arguments are :class:`EndpointLimits` fields; ``None``
+        values are ignored so unset configuration keeps the defaults.
+
+        Returns
+        -------
+        EndpointLimits
+            The limits now in effect for the endpoint.
+        """
+        changes = {k: v for k, v in overrides.items() if v is not None}
+        limits = replace(self.limits_for(endpoint), **changes)
+        self.config.endpoints[endpoint] = limits
+        self._dispatch()
+        return limits
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return a snapshot of slot usage and per-endpoint counters."""
+        return {
+            "total_slots": self.config.total_slots,
+            "in_flight": self._in_flight,
+            "queued": self.queued,
+            "endpoints": {
+                name: {
+                    "in_flight": state.in_flight,
+                    "queued": state.queued,
+                    "admitted": state.admitted,
+                    "rejected": state.rejected,
+                    "peak_in_flight": state.peak_in_flight,
+                    "service_time": round(state.service_time, 3),
+                }
+                for name, state in self._endpoints.items()
+            },
+        }
+
+    @asynccontextmanager
+    async def admit(self, endpoint: str, tool: str) -> AsyncIterator[Priority]:
+        """
+        Hold a slot for the duration of the ``async with`` body.
+
+        Parameters
+        ----------
+        endpoint : str
+            Endpoint the call arrived on.
+        tool : str
+            Tool being called; decides the call's priority.
+
+        Yields
+        ------
+        Priority
+            The priority the call was admitted at.
+
+        Raises
+        ------
+        AdmissionRejected
+            If the endpoint's queue is full or the call waited longer than
+            ``max_queue_wait`` for a slot.
+        """
+        priority = classify_call(endpoint, tool)
+        if self._draining:
+            raise self._reject(endpoint, tool, "draining")
+        await self._acquire(endpoint, tool, priority)
+        started = self._clock()
+        try:
+            yield priority
+        finally:
+            self._release(endpoint, self._clock() - started)
+
+    async def _acquire(self, endpoint: str, tool: str, priority: Priority) -> None:
+        state = self._state(endpoint)
+        metrics = get_metrics()
+        if self._can_admit(endpoint, priority):
+            self._take_slot(endpoint)
+            metrics.observe(
+                "marcus_admission_wait_seconds",
+                0.0,
+                endpoint=endpoint,
+                priority=priority.name.lower(),
+            )
+            return
+
+        limits = self.limits_for(endpoint)
+        if state.queued >= limits.max_queued:
+            raise self._reject(endpoint, tool, "queue_full")
+
+        waiter = _Waiter(
+            priority=priority,
+            seq=next(self._seq),
+            endpoint=endpoint,
+            tool=tool,
+            future=asyncio.get_running_loop().create_future(),
+        )
+        bisect.insort(self._waiters, waiter, key=lambda w: w.sort_key)
+        state.queued += 1
+        metrics.add_gauge("marcus_admission_queued", 1, endpoint=endpoint)
+        start = self._clock()
+        try:
+            await asyncio.wait_for(waiter.future, limits.max_queue_wait)
+        except asyncio.TimeoutError:
+            self._forget(waiter)
+            raise self._reject(endpoint, tool, "queue_timeout") from None
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # Slot was granted just before cancellation; hand it on.
+                self._release(endpoint, None)
+            else:
+                self._forget(waiter)
+            raise
+        metrics.observe(
+            "marcus_admission_wait_seconds",
+            self._clock() - start,
+            endpoint=endpoint,
+            priority=priority.name.lower(),
+        )
+
+    def _release(self, endpoint: str, held: Optional[float]) -> None:
+        state = self._state(endpoint)
+        self._in_flight = max(0, self._in_flight - 1)
+        state.in_flight = max(0, state.in_flight - 1)
+        get_metrics().add_gauge("marcus_admission_in_flight", -1, endpoint=endpoint)
+        if held is not None:
+            state.service_time = 0.8 * state.service_time + 0.2 * held
+        self._dispatch()
+        if self._in_flight == 0:
+            for idle in self._idle_waiters:
+                if not idle.done():
+                    idle.set_result(None)
+            self._idle_waiters.clear()
+
+    def _can_admit(self, endpoint: str, priority: Priority) -> bool:
+        state = self._state(endpoint)
+        if state.in_flight >= self.limits_for(endpoint).max_concurrent:
+            return False
+        available = self.config.total_slots
+        if priority is not Priority.COORDINATION:
+            available -= self.config.reserved_coordination_slots
+        return self._in_flight < available
+
+    def _take_slot(self, endpoint: str) -> None:
+        state = self._state(endpoint)
+        self._in_flight += 1
+        state.in_flight += 1
+        state.admitted += 1
+        state.peak_in_flight = max(state.peak_in_flight, state.in_flight)
+        get_metrics().add_gauge("marcus_admission_in_flight", 1, endpoint=endpoint)
+
+    def _dispatch(self) -> None:
+        """Grant freed slots to the highest-priority waiters that fit."""
+        index = 0
+        while index < len(self._waiters) and self._in_flight < self.config.total_slots:
+            waiter = self._waiters[index]
+            if waiter.future.done():
+                self._forget(waiter)
+                continue
+            if not self._can_admit(waiter.endpoint, waiter.priority):
+                # Its endpoint is at its cap (or only reserved slots are
+                # left); later waiters from other endpoints may still fit.
+                index += 1
+                continue
+            self._forget(waiter)
+            self._take_slot(waiter.endpoint)
+            try:
+                waiter.future.set_result(None)
+            except RuntimeError:
+                # Waiter's loop is gone (closed test loop); drop its slot.
+                self._release(waiter.endpoint, None)
+                return
+
+    def _forget(self, waiter: _Waiter) -> None:
+        try:
+            self._waiters.remove(waiter)
+        except ValueError:
+            return
+        self._state(waiter.endpoint).queued -= 1
+        get_metrics().add_gauge("marcus_admission_queued", -1, endpoint=waiter.endpoint)
+
+    def _reject(self, endpoint: str, tool: str, reason: str) -> AdmissionRejected:
+        state = self._state(endpoint)
+        state.rejected += 1
+        limits = self.limits_for(endpoint)
+        if reason == "draining":
+            estimate = self._drain_retry_after
+        else:
+            # Time for the work ahead of a retry to drain at this
+            # endpoint's concurrency, from its smoothed service time.
+            backlog = state.queued + state.in_flight
+            estimate = state.service_time * backlog / max(1, limits.max_concurrent)
+        retry_after = round(
+            min(
+                self.config.max_retry_after,
+                max(self.config.min_retry_after, estimate),
+            ),
+            1,
+        )
+        get_metrics().inc(
+            "marcus_admission_rejected_total", endpoint=endpoint, reason=reason
+        )
+        logger.warning(
+            f"Shedding {tool} on {endpoint} endpoint ({reason}): "
+            f"{state.in_flight} running, {state.queued} queued, "
+            f"retry_after={retry_after}s"
+        )
+        return AdmissionRejected(endpoint, tool, reason, retry_after)
+
+    def _state(self, endpoint: str) -> _EndpointState:
+        if endpoint not in self._endpoints:
+            self._endpoints[endpoint] = _EndpointState()
+        return self._endpoints[endpoint]
+
+
+class AdmissionControlledFastMCP(FastMCP):  # type: ignore[misc]
+    """
+    FastMCP app whose tool calls pass through an :class:`AdmissionController`.
+
+    FastMCP registers its bound ``call_tool`` as the low-level tool
+    handler when it is constructed, so overriding it gates every tool on
+    the endpoint without touching the individual tool registrations.
+
+    Parameters
+    ----------
+    name : str
+        App name.
+    endpoint : str
+        Endpoint type used for limits and priority.
+    admission : AdmissionController, optional
+        Controller to use; the shared one by default.
+    **settings
+        Forwarded to :class:`FastMCP`.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        endpoint: str,
+        admission: Optional[AdmissionController] = None,
+        **settings: Any,
+    ) -> None:
+        self.endpoint_type = endpoint
+        self._admission = admission
+        super().__init__(name, **settings)
+
+    @property
+    def admission(self) -> AdmissionController:
+        """The controller gating this app's tool calls."""
+        return self._admission or get_admission_controller()
+
+    async def call_tool(
+        self, name: str, arguments: Dict[str, Any]
+    ) -> Sequence[ContentBlock] | Dict[str, Any] | CallToolResult:
+        """Call a tool once the admission controller grants a slot."""
+        try:
+            async with self.admission.admit(self.endpoint_type, name):
+                result = await super().call_tool(name, arguments)
+            return result  # type: ignore[no-any-return]
+        except AdmissionRejected as exc:
+            response = exc.to_response()
+            # Returned as a finished result so the tool's output schema is
+            # not applied to the overload payload.
+            return CallToolResult(
+                content=[TextContent(type="text", text=json.dumps(response, indent=2))],
+                structuredContent=response,
+                isError=True,
+            )
+
+
+# Controller shared by every endpoint of the server
+_admission_controller: Optional[AdmissionController] = None
+
+
+def get_admission_controller(
+    config: Optional[AdmissionConfig] = None,
+) -> AdmissionController:
+    """
+    Get or create the shared admission controller.
+
+    ``config`` is only used when the controller is first created.
+    """
+    global _admission_controller
+    if _admission_controller is None:
+        _admission_controller = AdmissionController(config)
+    return _admission_controller
+
+
+def reset_admission_controller() -> None:
+    """Drop the shared controller (used by tests and benchmarks)."""
+    global _admission_controller
+    _admission_controller = None
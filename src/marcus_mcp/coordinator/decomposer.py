@@ -10,6 +10,7 @@ import logging
 import re
 from typing import Any, Dict, List, Optional
 
+from src.core.adaptive_concurrency import LLM_LIMITER, get_concurrency_limiter
 from src.core.models import Task
 
 logger = logging.getLogger(__name__)
@@ -236,8 +237,11 @@ async def decompose_task(
         # Extract task type for system prompt
         task_type = task.name.split()[0].lower() if task.name else "implement"
 
-        # Call AI to generate decomposition
-        response = await ai_engine.generate_structured_response(
+        # Call AI to generate decomposition. The call holds a slot of the
+        # shared adaptive LLM limiter so a 429 shrinks the window and is
+        # retried there, before the catch-all below turns it into a result.
+        response = await get_concurrency_limiter(LLM_LIMITER).run(
+            ai_engine.generate_structured_response,
             prompt=prompt,
             system_prompt=_get_decomposition_system_prompt(task_type),
             response_format={
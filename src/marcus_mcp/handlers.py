@@ -6,6 +6,7 @@ for the Marcus MCP server, organizing all tool definitions and handlers
 in a centralized location.
 """
 
+import functools
 import json
 import logging
 import time
@@ -14,6 +15,7 @@ from typing import Any, Dict, List, Optional
 
 import mcp.types as types
 
+from src.core.metrics import get_metrics
 from src.cost_tracking.cost_recorder import PlannerContext, get_recorder
 from src.logging.mcp_tool_logger import log_mcp_tool_response
 
@@ -127,6 +129,21 @@ def get_all_tool_names() -> List[str]:
     return list(get_all_tool_definitions().keys())
 
 
+@functools.lru_cache(maxsize=1)
+def _registered_tool_names() -> frozenset[str]:
+    return frozenset(get_all_tool_definitions())
+
+
+def _tool_metric_label(name: str) -> str:
+    """
+    Return the ``tool`` metric label for a requested tool name.
+
+    Tool names come from the client, so names outside the registered tool
+    set are recorded as ``"unknown"`` to keep label cardinality bounded.
+    """
+    return name if name in _registered_tool_names() else "unknown"
+
+
 def get_tool_definitions(role: str = "agent") -> List[types.Tool]:
     """
     Return list of available tool definitions for MCP based on role.
@@ -1086,8 +1103,82 @@ def _resolve_project_for_cost(
     return None
 
 
+# Tools that act on one project's tasks and are routed by project id, so
+# agents of different projects are served from isolated per-project state
+# without switching the active project.
+_PROJECT_SCOPED_TOOLS = frozenset(
+    {
+        "request_next_task",
+        "report_task_progress",
+        "report_blocker",
+        "get_project_status",
+        "check_board_health",
+        "check_task_dependencies",
+        "log_decision",
+        "log_artifact",
+        "get_task_context",
+    }
+)
+
+
+def _resolve_tool_project_id(
+    name: str, arguments: Dict[str, Any], state: Any
+) -> Optional[str]:
+    """Project a scoped tool call belongs to (argument, then agent's project)."""
+    if name not in _PROJECT_SCOPED_TOOLS:
+        return None
+    if getattr(state, "is_multi_project_mode", False) is not True:
+        return None
+    pid = arguments.get("project_id")
+    if pid:
+        return str(pid)
+    agent_id = arguments.get("agent_id")
+    if agent_id:
+        mapped = getattr(state, "agent_project_map", {}).get(agent_id)
+        if isinstance(mapped, str) and mapped:
+            return mapped
+    return None
+
+
 async def handle_tool_call(
     name: str, arguments: Optional[Dict[str, Any]], state: Any
+) -> List[types.TextContent | types.ImageContent | types.EmbeddedResource]:
+    """
+    Handle tool calls, routing project-scoped tools to their project's state.
+
+    Args:
+        name: Name of the tool to call
+        arguments: Tool arguments
+        state: Marcus server state instance
+
+    Returns
+    -------
+        List of MCP content objects with tool results
+    """
+    if arguments is None:
+        arguments = {}
+
+    metrics = get_metrics()
+    tool_label = _tool_metric_label(name)
+    metrics.add_gauge("marcus_tool_calls_in_flight", 1, tool=tool_label)
+    start = time.perf_counter()
+    try:
+        project_id = _resolve_tool_project_id(name, arguments, state)
+        if project_id:
+            async with state.project_scope(project_id) as scoped_state:
+                return await _dispatch_tool_call(name, arguments, scoped_state)
+        return await _dispatch_tool_call(name, arguments, state)
+    finally:
+        metrics.add_gauge("marcus_tool_calls_in_flight", -1, tool=tool_label)
+        metrics.observe(
+            "marcus_tool_duration_seconds",
+            time.perf_counter() - start,
+            tool=tool_label,
+        )
+
+
+async def _dispatch_tool_call(
+    name: str, arguments: Optional[Dict[str, Any]], state: Any
 ) -> List[types.TextContent | types.ImageContent | types.EmbeddedResource]:
     """
     Handle tool calls by routing to appropriate tool functions.
@@ -1123,6 +1214,9 @@ async def handle_tool_call(
     allowed_tools = get_client_tools(client_id, state)
     if name not in allowed_tools and "*" not in allowed_tools:
         # Audit access denied
+        get_metrics().inc(
+            "marcus_tool_calls_total", tool=_tool_metric_label(name), outcome="denied"
+        )
         duration_ms = (time.time() - start_time) * 1000
         await audit_logger.log_access_denied(
             client_id=client_id,
@@ -1643,6 +1737,9 @@ async def handle_tool_call(
         )
 
         # Audit successful tool call
+        get_metrics().inc(
+            "marcus_tool_calls_total", tool=_tool_metric_label(name), outcome="ok"
+        )
         duration_ms = (time.time() - start_time) * 1000
         await audit_logger.log_tool_call(
             client_id=client_id,
@@ -1658,6 +1755,9 @@ async def handle_tool_call(
 
     except Exception as e:
         # Audit failed tool call
+        get_metrics().inc(
+            "marcus_tool_calls_total", tool=_tool_metric_label(name), outcome="error"
+        )
         duration_ms = (time.time() - start_time) * 1000
         await audit_logger.log_tool_call(
             client_id=client_id,
@@ -0,0 +1,102 @@
+"""
+Project-scoped view of the Marcus server state.
+
+Tool functions receive the server as ``state`` and read per-project state
+(``project_tasks``, ``kanban_client``, ``assignment_lock``, the lease
+manager, ...) straight off it. ``ProjectScopedState`` wraps the server so
+those attributes resolve to one project's ``ProjectContext`` while
+everything else (agent registry, AI engine, subtask manager, ...) is shared.
+Server methods called through the view run against the view, so e.g.
+``refresh_project_state`` reloads the scoped project's board rather than the
+active one.
+"""
+
+import inspect
+import types
+from typing import Any, Optional
+
+from src.core.project_context_manager import ProjectContext
+
+# Server attributes that live on the project context when scoped
+SCOPED_ATTRIBUTES = frozenset(
+    {
+        "kanban_client",
+        "project_state",
+        "project_tasks",
+        "tasks_being_assigned",
+        "assignment_persistence",
+        "assignment_monitor",
+        "lease_manager",
+        "lease_monitor",
+        "board_snapshot",
+        "board_health",
+        "code_analyzer",
+        "_subtasks_migrated",
+    }
+)
+
+
+class ProjectScopedState:
+    """Server state with per-project attributes bound to one project.
+
+    Parameters
+    ----------
+    server : Any
+        The MarcusServer instance whose shared state is exposed.
+    project : ProjectContext
+        The project context that holds the scoped attributes.
+    """
+
+    is_project_scope = True
+
+    def __init__(self, server: Any, project: ProjectContext) -> None:
+        object.__setattr__(self, "_server", server)
+        object.__setattr__(self, "_project", project)
+
+    @property
+    def server(self) -> Any:
+        """The wrapped MarcusServer."""
+        return self._server
+
+    @property
+    def project_context(self) -> ProjectContext:
+        """The project context this view is bound to."""
+        return self._project
+
+    @property
+    def assignment_lock(self) -> Any:
+        """The scoped project's assignment lock."""
+        return self._project.assignment_lock
+
+    @property
+    def current_project_id(self) -> Optional[str]:
+        """The scoped project's ID."""
+        return self._project.project_id
+
+    @property
+    def current_project_name(self) -> Optional[str]:
+        """The scoped project's name."""
+        return self._project.project_name
+
+    def __getattr__(self, name: str) -> Any:
+        """Resolve scoped attributes on the project, the rest on the server."""
+        if name in SCOPED_ATTRIBUTES:
+            return getattr(self._project, name)
+        # Re-bind plain server methods so their ``self`` is this view
+        attribute = inspect.getattr_static(type(self._server), name, None)
+        if isinstance(attribute, types.FunctionType) and name not in vars(
+            self._server
+        ):
+            return types.MethodType(attribute, self)
+        return getattr(self._server, name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Write scoped attributes to the project, the rest to the server."""
+        if name in SCOPED_ATTRIBUTES:
+            setattr(self._project, name, value)
+        else:
+            setattr(self._server, name, value)
+
+    def __repr__(self) -> str:
+        """Return a readable representation."""
+        return f"ProjectScopedState(project_id={self._project.project_id!r})"
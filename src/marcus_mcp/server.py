@@ -12,9 +12,20 @@ import logging
 import os
 import signal
 import sys
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
+from functools import partial
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Union
+from typing import (
+    Any,
+    AsyncContextManager,
+    AsyncIterator,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Union,
+)
 
 from src.telemetry import get_telemetry_client, print_first_run_notice_if_needed
 
@@ -25,6 +36,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 
 import mcp.types as types  # noqa: E402
+import uvicorn  # noqa: E402
 from mcp.server import Server  # noqa: E402
 from mcp.server.fastmcp import FastMCP  # noqa: E402
 from mcp.server.stdio import stdio_server  # noqa: E402
@@ -42,10 +54,22 @@ from src.core.assignment_lease import (  # noqa: E402
     LeaseMonitor,
 )
 from src.core.assignment_persistence import AssignmentPersistence  # noqa: E402
+from src.core.attachment_cache import AttachmentCache  # noqa: E402
+from src.core.board_health_model import BoardHealthModel  # noqa: E402
+from src.core.board_snapshot import (  # noqa: E402
+    BoardSnapshotService,
+    get_board_snapshot,
+)
 from src.core.code_analyzer import CodeAnalyzer  # noqa: E402
+from src.core.code_index import get_code_index  # noqa: E402
 from src.core.context import Context  # noqa: E402
 from src.core.event_loop_utils import EventLoopLockManager  # noqa: E402
 from src.core.events import Events  # noqa: E402
+from src.core.metrics import (  # noqa: E402
+    PROMETHEUS_CONTENT_TYPE,
+    InstrumentedLock,
+    get_metrics,
+)
 from src.core.models import (  # noqa: E402
     ProjectState,
     RiskLevel,
@@ -59,6 +83,14 @@ from src.core.service_registry import (  # noqa: E402
     register_marcus_service,
     unregister_marcus_service,
 )
+from src.core.warm_restart import (  # noqa: E402
+    ServerCheckpoint,
+    WarmStateStore,
+    capture_checkpoint,
+    restore_board_snapshot,
+    restore_checkpoint,
+)
+from src.core.worker_pool import shutdown_worker_pools  # noqa: E402
 from src.cost_tracking.ai_usage_middleware import ai_usage_middleware  # noqa: E402
 from src.cost_tracking.cost_recorder import (  # noqa: E402
     CostRecorder,
@@ -69,7 +101,12 @@ from src.cost_tracking.token_tracker import token_tracker  # noqa: E402
 from src.integrations.ai_analysis_engine import AIAnalysisEngine  # noqa: E402
 from src.integrations.kanban_factory import KanbanFactory  # noqa: E402
 from src.integrations.kanban_interface import KanbanInterface  # noqa: E402
+from src.marcus_mcp.admission import (  # noqa: E402
+    AdmissionControlledFastMCP,
+    get_admission_controller,
+)
 from src.marcus_mcp.handlers import handle_tool_call  # noqa: E402
+from src.marcus_mcp.project_scope import ProjectScopedState  # noqa: E402
 from src.marcus_mcp.tool_groups import get_tools_for_endpoint  # noqa: E402
 from src.monitoring.assignment_monitor import AssignmentMonitor  # noqa: E402
 from src.monitoring.project_monitor import ProjectMonitor  # noqa: E402
@@ -147,9 +184,14 @@ class MarcusServer:
         self.project_state: Optional[ProjectState] = None
         self.project_tasks: List[Any] = []
 
+        # Kanban attachments fetched for task context, cached per task
+        self.attachment_cache = AttachmentCache()
+
         # Assignment persistence and locking
         self.assignment_persistence = AssignmentPersistence()
-        self._lock_manager = EventLoopLockManager()
+        self._lock_manager = EventLoopLockManager(
+            partial(InstrumentedLock, "assignment")
+        )
         self.tasks_being_assigned: set[str] = set()
 
         # Subtask management for hierarchical task decomposition
@@ -160,6 +202,13 @@ class MarcusServer:
 
         # Assignment monitoring
         self.assignment_monitor: Optional[AssignmentMonitor] = None
+        self.board_snapshot: Optional[BoardSnapshotService] = None
+        self.board_health: Optional[BoardHealthModel] = None
+
+        # Warm restart: the checkpoint is restored once; a saved board
+        # waits here until the board snapshot service exists
+        self._warm_state_restored = False
+        self._pending_board_checkpoint: Optional[ServerCheckpoint] = None
 
         # Lease management
         self.lease_manager: Optional[AssignmentLeaseManager] = None
@@ -178,6 +227,7 @@ class MarcusServer:
         self._cleanup_done = False
         self._active_operations: Set[Any] = set()
         self._shutdown_event = asyncio.Event()
+        self._shutdown_task: Optional["asyncio.Future[Dict[str, Any]]"] = None
 
         # New enhancement systems (optional based on config)
         # Declare optional attributes
@@ -306,6 +356,61 @@ class MarcusServer:
         """
         return self.project_manager.active_project_name
 
+    @asynccontextmanager
+    async def project_scope(self, project_id: Optional[str]) -> AsyncIterator[Any]:
+        """
+        Serve a tool call against one project's state without switching.
+
+        In multi-project mode, calls for a project other than the active one
+        get a ``ProjectScopedState`` whose tasks, kanban client, assignment
+        lock and lease manager belong to that project. The project's context
+        stays pinned (not evictable) until the block exits.
+
+        Parameters
+        ----------
+        project_id : Optional[str]
+            Project the call belongs to.
+
+        Yields
+        ------
+        Any
+            A project-scoped view, or this server when the call targets the
+            active project, no project, or an unregistered project.
+        """
+        if (
+            not self.is_multi_project_mode
+            or not project_id
+            or project_id == self.current_project_id
+        ):
+            yield self
+            return
+
+        async with self.project_manager.use_project(project_id) as context:
+            if context is None:
+                yield self
+                return
+            scoped = ProjectScopedState(self, context)
+            if context.lease_manager is None and self.lease_manager is not None:
+                async with context.assignment_lock:
+                    await scoped._initialize_monitoring_systems()
+            yield scoped
+
+    def agent_scope(self, agent_id: str) -> AsyncContextManager[Any]:
+        """
+        Scope a tool call to the project the agent registered with.
+
+        Parameters
+        ----------
+        agent_id : str
+            The calling agent.
+
+        Returns
+        -------
+        AsyncContextManager[Any]
+            ``project_scope`` for the agent's project.
+        """
+        return self.project_scope(self.agent_project_map.get(agent_id))
+
     def _register_handlers(self) -> None:
         """Register MCP tool handlers."""
 
@@ -409,6 +514,13 @@ class MarcusServer:
                 )
                 self.tasks_being_assigned.clear()
 
+            # No loop to drain on, but the hot state can still be saved
+            settings = self.config.warm_restart
+            if settings.enabled:
+                WarmStateStore(max_age=settings.checkpoint_max_age).save(
+                    capture_checkpoint(self)
+                )
+
             # Close realtime log
             if hasattr(self, "realtime_log") and self.realtime_log:
                 self.realtime_log.close()
@@ -423,13 +535,59 @@ class MarcusServer:
 
     async def _cleanup_on_shutdown(self) -> None:
         """Clean up resources on shutdown."""
+        await self.shutdown()
+
+        # Force exit after cleanup
+        os._exit(0)
+
+    async def shutdown(self, drain_timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Drain tool calls, flush durable state and checkpoint hot state.
+
+        New tool calls are refused with a ``retry_after`` hint while
+        in-flight calls get ``drain_timeout`` seconds to finish. Leases,
+        assignments, the realtime log and cost events are then flushed,
+        and the in-memory state agents depend on is written to the
+        warm-restart checkpoint for the next start to restore. Safe to
+        call more than once; later calls wait for the first.
+
+        Parameters
+        ----------
+        drain_timeout : Optional[float]
+            Seconds to wait for in-flight calls; defaults to
+            ``warm_restart.drain_timeout``.
+
+        Returns
+        -------
+        Dict[str, Any]
+            What was drained, flushed and checkpointed.
+        """
+        if self._shutdown_task is None:
+            self._shutdown_task = asyncio.ensure_future(
+                self._drain_and_cleanup(drain_timeout)
+            )
+        return await asyncio.shield(self._shutdown_task)
+
+    async def _drain_and_cleanup(
+        self, drain_timeout: Optional[float]
+    ) -> Dict[str, Any]:
+        summary: Dict[str, Any] = {}
         if self._cleanup_done:
-            return
+            return summary
 
         self._cleanup_done = True
+        settings = self.config.warm_restart
+        timeout = settings.drain_timeout if drain_timeout is None else drain_timeout
 
         try:
-            print("🧹 Cleaning up active operations...")
+            # Stop taking new work and let running tool calls finish
+            print(f"🧹 Draining in-flight tool calls (up to {timeout:g}s)...")
+            in_flight = await get_admission_controller().drain(
+                timeout, retry_after=settings.retry_after
+            )
+            summary["in_flight"] = in_flight
+            if in_flight:
+                print(f"  {in_flight} tool calls still running; checkpointing anyway")
 
             # Clean up tasks being assigned
             if self.tasks_being_assigned:
@@ -459,25 +617,89 @@ class MarcusServer:
             if self.assignment_monitor and hasattr(self.assignment_monitor, "_running"):
                 self.assignment_monitor._running = False
 
+            # Stop the shared board snapshot refresh
+            if getattr(self, "board_snapshot", None):
+                await self.board_snapshot.stop()
+
             # Stop lease monitor if running
             if self.lease_monitor:
                 await self.lease_monitor.stop()
 
-            # Close realtime log
-            if hasattr(self, "realtime_log") and self.realtime_log:
-                self.realtime_log.close()
+            # Lease touches live in memory until flushed
+            if self.lease_manager:
+                summary["leases_flushed"] = await self.lease_manager.flush_leases()
+
+            # Drop queued analytics work; running jobs finish on their own
+            shutdown_worker_pools(wait=False)
 
             # Persist any pending state
             if self.assignment_persistence:
                 await self.assignment_persistence.cleanup()
 
+            if settings.enabled:
+                path = WarmStateStore(max_age=settings.checkpoint_max_age).save(
+                    capture_checkpoint(self, in_flight=in_flight)
+                )
+                summary["checkpoint"] = str(path)
+                print(f"  Saved warm-restart checkpoint to {path}")
+
+            # Close realtime log
+            if hasattr(self, "realtime_log") and self.realtime_log:
+                self.realtime_log.close()
+
+            # Commit outstanding cost events
+            if getattr(self, "cost_store", None):
+                self.cost_store.close()
+
             print("✅ Cleanup completed")
 
         except Exception as e:
             print(f"❌ Error during cleanup: {e}")
+            summary["error"] = str(e)
 
-        # Force exit after cleanup
-        os._exit(0)
+        return summary
+
+    async def _restore_warm_state(self) -> Dict[str, int]:
+        """
+        Restore the checkpoint left by a graceful shutdown, if any.
+
+        Runs as soon as the board snapshot service exists, so the saved
+        board seeds it before the first fetch, and again at the end of
+        :meth:`initialize` for servers that have no kanban client yet.
+        The checkpoint is only loaded once; a board it holds is kept until
+        a later call finds the snapshot service.
+        """
+        if self._pending_board_checkpoint is not None and self.board_snapshot:
+            checkpoint = self._pending_board_checkpoint
+            self._pending_board_checkpoint = None
+            return {
+                "board_tasks": restore_board_snapshot(self.board_snapshot, checkpoint)
+            }
+        if self._warm_state_restored:
+            return {}
+        self._warm_state_restored = True
+
+        settings = self.config.warm_restart
+        if not settings.enabled:
+            return {}
+        try:
+            checkpoint = WarmStateStore(max_age=settings.checkpoint_max_age).load()
+            if checkpoint is None:
+                return {}
+            restored = restore_checkpoint(self, checkpoint)
+        except Exception as e:
+            logger.warning(f"Failed to restore warm-restart checkpoint: {e}")
+            return {}
+        if restored:
+            if self.board_snapshot is None and checkpoint.board_tasks is not None:
+                self._pending_board_checkpoint = checkpoint
+            logger.info(
+                f"Warm restart from checkpoint taken {checkpoint.age:.1f}s ago: "
+                f"{restored['agents']} agents, {restored['assignments']} "
+                f"assignments, {restored['tasks']} tasks, "
+                f"{restored['board_tasks']} board tasks"
+            )
+        return restored
 
     async def initialize(self) -> None:
         """Initialize all Marcus server components."""
@@ -592,6 +814,9 @@ class MarcusServer:
         # Wrap AI engine for token tracking
         self.ai_engine = ai_usage_middleware.wrap_ai_provider(self.ai_engine)
 
+        # Resume from the checkpoint a graceful shutdown left behind
+        await self._restore_warm_state()
+
         # Pattern learning components removed (API infrastructure cleanup)
         # Don't print during initialization - it interferes with MCP stdio
 
@@ -626,10 +851,31 @@ class MarcusServer:
         if not self.kanban_client:
             return
 
+        # One shared board snapshot feeds all background monitors (the
+        # project monitor follows the active project only)
+        scoped = getattr(self, "is_project_scope", False)
+        self.board_snapshot = get_board_snapshot(self.kanban_client)
+        if not scoped and getattr(self, "monitor", None) is not None:
+            self.monitor.board_snapshot = self.board_snapshot
+        if not scoped:
+            # Seed the snapshot from a warm-restart checkpoint before the
+            # monitors below start fetching the board
+            await self._restore_warm_state()
+
+        # Board health is kept current from the same change feed
+        if self.board_health is None:
+            self.board_health = BoardHealthModel(
+                stale_task_days=self.config.board_health.stale_task_days,
+                max_tasks_per_agent=self.config.board_health.max_tasks_per_agent,
+            )
+        self.board_health.attach(self.board_snapshot)
+
         # Initialize assignment monitor
         if self.assignment_monitor is None:
             self.assignment_monitor = AssignmentMonitor(
-                self.assignment_persistence, self.kanban_client
+                self.assignment_persistence,
+                self.kanban_client,
+                board_snapshot=self.board_snapshot,
             )
             await self.assignment_monitor.start()
 
@@ -645,9 +891,14 @@ class MarcusServer:
 
             # Check for project-specific lease config
             if hasattr(self, "project_registry") and self.project_registry:
-                active_project = await self.project_registry.get_active_project()
-                if active_project and hasattr(active_project, "task_lease"):
-                    lease_config = active_project.task_lease
+                if scoped:
+                    project = await self.project_registry.get_project(
+                        self.project_context.project_id
+                    )
+                else:
+                    project = await self.project_registry.get_active_project()
+                if project and hasattr(project, "task_lease"):
+                    lease_config = project.task_lease
 
             # Fall back to global config
             if not lease_config:
@@ -730,6 +981,35 @@ class MarcusServer:
             # uvicorn's loop via ensure_lease_monitor_running().
             logger.info("Assignment lease system initialized (monitor pending)")
 
+        await self._initialize_code_analyzer()
+
+    async def _initialize_code_analyzer(self) -> None:
+        """Give the current project a code analyzer.
+
+        GitHub projects query the repository remotely. Local projects get
+        an analyzer over the workspace's code index, built here once so
+        merged tasks only ever re-parse the files they changed.
+        """
+        if self.code_analyzer is not None:
+            return
+        if self.provider == "github":
+            self.code_analyzer = CodeAnalyzer()
+            return
+
+        from src.marcus_mcp.tools.task import workspace_repo
+
+        repo = workspace_repo(self)
+        if repo is None:
+            return
+        index = get_code_index(repo)
+        if not index.built:
+            try:
+                await asyncio.to_thread(index.build)
+            except Exception as e:
+                logger.warning(f"[code_index] Could not index {repo}: {e}")
+                return
+        self.code_analyzer = CodeAnalyzer(code_index=index)
+
     def _handle_lease_recovery(self, agent_id: str, task_id: str) -> None:
         """Clean up all in-memory state when a lease is recovered.
 
@@ -1161,9 +1441,12 @@ class MarcusServer:
             # Check if we should use all tools or agent tools
             use_all_tools = "--all-tools" in sys.argv
 
+            # The single endpoint serves agents, so calls are scheduled and
+            # drained with the agent endpoint's admission limits
             if use_all_tools:
-                self._fastmcp = FastMCP(
+                self._fastmcp = AdmissionControlledFastMCP(
                     "marcus",
+                    endpoint="agent",
                     instructions=(
                         "Marcus - Multi-Agent Resource Coordination and "
                         "Understanding System (All Tools)"
@@ -1173,8 +1456,9 @@ class MarcusServer:
                 self._register_fastmcp_tools()
             else:
                 # Default to agent tools for new users
-                self._fastmcp = FastMCP(
+                self._fastmcp = AdmissionControlledFastMCP(
                     "marcus-agent",
+                    endpoint="agent",
                     instructions=(
                         "Marcus - Multi-Agent Resource Coordination and "
                         "Understanding System (Agent Mode)"
@@ -1183,6 +1467,8 @@ class MarcusServer:
                 # Register only agent tools
                 self._register_endpoint_tools(self._fastmcp, "agent")
 
+            self._register_metrics_route(self._fastmcp)
+
         return self._fastmcp
 
     def _create_endpoint_app(self, endpoint_type: str) -> FastMCP:
@@ -1196,16 +1482,32 @@ class MarcusServer:
                 "analytics": "Marcus MCP Server - Analytics & Monitoring Tools",
             }.get(endpoint_type, "Marcus MCP Server")
 
-            # Create FastMCP instance
-            app = FastMCP(app_name, instructions=instructions)
+            # Tool calls on every endpoint share one admission queue, so
+            # analytics load cannot starve agent coordination calls
+            app = AdmissionControlledFastMCP(
+                app_name, endpoint=endpoint_type, instructions=instructions
+            )
 
             # Register only tools allowed for this endpoint
             self._register_endpoint_tools(app, endpoint_type)
+            self._register_metrics_route(app)
 
             self._endpoint_apps[endpoint_type] = app
 
         return self._endpoint_apps[endpoint_type]
 
+    @staticmethod
+    def _register_metrics_route(app: FastMCP) -> None:
+        """Serve the metrics registry at ``GET /metrics`` in Prometheus format."""
+        from starlette.requests import Request
+        from starlette.responses import Response
+
+        @app.custom_route("/metrics", methods=["GET"])  # type: ignore[misc]
+        async def metrics_endpoint(request: Request) -> Response:
+            return Response(
+                get_metrics().render(), media_type=PROMETHEUS_CONTENT_TYPE
+            )
+
     def _register_fastmcp_tools(self) -> None:
         """Register all tools with FastMCP instance."""
         # Import only what we need for avoiding duplicates
@@ -1274,7 +1576,8 @@ class MarcusServer:
             """Request the next optimal task assignment for an agent."""
             from .tools.task import request_next_task as impl
 
-            result = await impl(agent_id=agent_id, state=server)
+            async with server.agent_scope(agent_id) as scoped:
+                result = await impl(agent_id=agent_id, state=scoped)
             return result  # type: ignore[no-any-return]
 
         @self._fastmcp.tool()  # type: ignore[misc]
@@ -1302,17 +1605,18 @@ class MarcusServer:
             """
             from .tools.task import report_task_progress as impl
 
-            return await impl(
-                agent_id=agent_id,
-                task_id=task_id,
-                status=status,
-                progress=progress,
-                message=message,
-                state=server,
-                start_command=start_command,
-                readiness_probe=readiness_probe,
-                verifications=verifications,
-            )
+            async with server.agent_scope(agent_id) as scoped:
+                return await impl(
+                    agent_id=agent_id,
+                    task_id=task_id,
+                    status=status,
+                    progress=progress,
+                    message=message,
+                    state=scoped,
+                    start_command=start_command,
+                    readiness_probe=readiness_probe,
+                    verifications=verifications,
+                )
 
         @self._fastmcp.tool()  # type: ignore[misc]
         async def report_blocker(
@@ -1324,13 +1628,14 @@ class MarcusServer:
             """Report a blocker on a task."""
             from .tools.task import report_blocker as impl
 
-            return await impl(
-                agent_id=agent_id,
-                task_id=task_id,
-                blocker_description=blocker_description,
-                severity=severity,
-                state=server,
-            )
+            async with server.agent_scope(agent_id) as scoped:
+                return await impl(
+                    agent_id=agent_id,
+                    task_id=task_id,
+                    blocker_description=blocker_description,
+                    severity=severity,
+                    state=scoped,
+                )
 
         @self._fastmcp.tool()  # type: ignore[misc]
         async def get_all_board_tasks(board_id: str, project_id: str) -> Dict[str, Any]:
@@ -1466,7 +1771,8 @@ class MarcusServer:
 
                 from .tools.task import request_next_task as impl
 
-                result = await impl(agent_id=agent_id, state=server)
+                async with server.agent_scope(agent_id) as scoped:
+                    result = await impl(agent_id=agent_id, state=scoped)
                 final_result = (
                     dict(result)
                     if isinstance(result, dict)
@@ -1511,17 +1817,18 @@ class MarcusServer:
 
                 from .tools.task import report_task_progress as impl
 
-                result = await impl(
-                    agent_id=agent_id,
-                    task_id=task_id,
-                    status=status,
-                    progress=progress,
-                    message=message,
-                    state=server,
-                    start_command=start_command,
-                    readiness_probe=readiness_probe,
-                    verifications=verifications,
-                )
+                async with server.agent_scope(agent_id) as scoped:
+                    result = await impl(
+                        agent_id=agent_id,
+                        task_id=task_id,
+                        status=status,
+                        progress=progress,
+                        message=message,
+                        state=scoped,
+                        start_command=start_command,
+                        readiness_probe=readiness_probe,
+                        verifications=verifications,
+                    )
 
                 # Log MCP tool response
                 log_mcp_tool_response(
@@ -1555,13 +1862,14 @@ class MarcusServer:
 
                 from .tools.task import report_blocker as impl
 
-                result = await impl(
-                    agent_id=agent_id,
-                    task_id=task_id,
-                    blocker_description=blocker_description,
-                    severity=severity,
-                    state=server,
-                )
+                async with server.agent_scope(agent_id) as scoped:
+                    result = await impl(
+                        agent_id=agent_id,
+                        task_id=task_id,
+                        blocker_description=blocker_description,
+                        severity=severity,
+                        state=scoped,
+                    )
 
                 # Log MCP tool response
                 log_mcp_tool_response(
@@ -2693,13 +3001,54 @@ class MarcusServer:
             raise
 
 
+class DrainingUvicornServer(uvicorn.Server):
+    """
+    uvicorn server that stops admitting tool calls as soon as it is signalled.
+
+    uvicorn handles SIGTERM/SIGINT itself and waits up to
+    ``timeout_graceful_shutdown`` for open requests before
+    ``MarcusServer.shutdown`` runs, so draining has to start from the
+    signal handler: calls arriving during that wait are refused with a
+    ``retry_after`` hint instead of being started. Only the HTTP apps are
+    admission controlled; the stdio transport serves one client and is
+    not drained.
+
+    Parameters
+    ----------
+    config : uvicorn.Config
+        Server configuration.
+    retry_after : float
+        Hint given to tool calls refused while draining.
+    group : Optional[List[uvicorn.Server]]
+        Servers that shut down together (the multi-endpoint servers);
+        this server is added to it.
+    """
+
+    def __init__(
+        self,
+        config: uvicorn.Config,
+        retry_after: float,
+        group: Optional[List[uvicorn.Server]] = None,
+    ) -> None:
+        super().__init__(config)
+        self.retry_after = retry_after
+        self.group = group if group is not None else []
+        self.group.append(self)
+
+    def handle_exit(self, sig: int, frame: Any) -> None:
+        """Start draining, then shut down this server and its group."""
+        get_admission_controller().start_draining(self.retry_after)
+        for other in self.group:
+            if other is not self:
+                other.should_exit = True
+        super().handle_exit(sig, frame)
+
+
 async def run_multi_endpoint_server(server: MarcusServer) -> None:
     """Run Marcus with multiple endpoints on different ports."""
     import argparse
     import asyncio
 
-    import uvicorn
-
     # Parse command line arguments for port overrides
     parser = argparse.ArgumentParser()
     parser.add_argument("--multi", action="store_true")
@@ -2710,6 +3059,7 @@ async def run_multi_endpoint_server(server: MarcusServer) -> None:
 
     # Get multi-endpoint config
     config = get_config()
+    drain_timeout = int(config.warm_restart.drain_timeout)
 
     # Override ports with command line arguments if provided
     multi_endpoint_config = {}
@@ -2727,6 +3077,16 @@ async def run_multi_endpoint_server(server: MarcusServer) -> None:
         if port_arg:
             multi_endpoint_config[endpoint_type]["port"] = port_arg
 
+        get_admission_controller().configure_endpoint(
+            endpoint_type,
+            max_concurrent=endpoint_cfg.max_concurrent,
+            max_queued=endpoint_cfg.max_queued,
+            max_queue_wait=endpoint_cfg.max_queue_wait,
+        )
+
+    # Endpoints stop together when any of them is signalled
+    endpoint_servers: List[uvicorn.Server] = []
+
     # Pretty output
     print("\n" + "=" * 70)
     print("    Marcus MCP Server (Multi-Endpoint Mode)")
@@ -2746,11 +3106,17 @@ async def run_multi_endpoint_server(server: MarcusServer) -> None:
         print(f"\n[I] {endpoint_type.capitalize()} endpoint:")
         print(f"    URL: http://{host}:{port}{path}")
         print(f"    Tools: {len(get_tools_for_endpoint(endpoint_type))} available")
+        limits = get_admission_controller().limits_for(endpoint_type)
+        print(
+            f"    Admission: {limits.max_concurrent} concurrent, "
+            f"{limits.max_queued} queued, {limits.max_queue_wait:g}s max wait"
+        )
 
         # Create Starlette app
         starlette_app = app.streamable_http_app()
 
-        # Configure uvicorn
+        # Configure uvicorn; on shutdown it stops accepting connections
+        # and gives running requests the drain timeout to finish
         config = uvicorn.Config(
             app=starlette_app,
             host=host,
@@ -2758,10 +3124,15 @@ async def run_multi_endpoint_server(server: MarcusServer) -> None:
             log_level="error",  # Reduce noise
             access_log=False,
             loop="asyncio",
+            timeout_graceful_shutdown=drain_timeout,
         )
 
         # Create and run server
-        server_instance = uvicorn.Server(config)
+        server_instance = DrainingUvicornServer(
+            config,
+            retry_after=get_config().warm_restart.retry_after,
+            group=endpoint_servers,
+        )
         await server_instance.serve()
 
     # Start all endpoints
@@ -3012,8 +3383,6 @@ async def main() -> None:
 
             # For HTTP transport, we need to run it differently
             # FastMCP uses "streamable-http" as the transport name
-            import uvicorn
-
             # Create the Starlette app from FastMCP
             app = fastmcp.streamable_http_app()
 
@@ -3021,12 +3390,23 @@ async def main() -> None:
             # RuntimeError here because asyncio.run(main()) already owns one.
             # Use the async Server.serve() path instead.
             uvicorn_config = uvicorn.Config(
-                app, host=host, port=port, log_level=log_level
+                app,
+                host=host,
+                port=port,
+                log_level=log_level,
+                timeout_graceful_shutdown=int(config.warm_restart.drain_timeout),
             )
-            await uvicorn.Server(uvicorn_config).serve()
+            await DrainingUvicornServer(
+                uvicorn_config, retry_after=config.warm_restart.retry_after
+            ).serve()
         else:
             # Use existing stdio transport
             await server.run()
+
+        if transport in ("multi", "http"):
+            # uvicorn has stopped accepting connections and let running
+            # requests finish; flush state and write the checkpoint
+            await server.shutdown()
     except Exception as e:
         # Log errors to stderr only in case of failure
         print(f"Failed to start Marcus MCP server: {e}", file=sys.stderr)
@@ -3145,8 +3525,6 @@ if __name__ == "__main__":
         signal.signal(signal.SIGTERM, http_signal_handler)
 
         # Run with uvicorn directly
-        import uvicorn
-
         app = fastmcp.streamable_http_app()
 
         # Configure uvicorn with graceful shutdown
@@ -3159,7 +3537,9 @@ if __name__ == "__main__":
             access_log=False,  # Reduce noise
         )
 
-        server_instance = uvicorn.Server(uvicorn_config)
+        server_instance = DrainingUvicornServer(
+            uvicorn_config, retry_after=config.warm_restart.retry_after
+        )
 
         # Run the server (this will handle shutdown gracefully)
         try:
@@ -13,6 +13,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
+from src.core.attachment_cache import AttachmentCache
 from src.core.project_history import ArtifactMetadata, ProjectHistoryPersistence
 
 logger = logging.getLogger(__name__)
@@ -292,6 +293,11 @@ async def log_artifact(
 
         state.task_artifacts[task_id].append(artifact_entry)
 
+        # The task's artifacts changed: drop its cached Kanban attachments
+        attachment_cache = getattr(state, "attachment_cache", None)
+        if isinstance(attachment_cache, AttachmentCache):
+            attachment_cache.invalidate(task_id)
+
         # Add a comment to the task if kanban is available
         if state.kanban_client and description:
             try:
@@ -43,7 +43,7 @@ async def check_board_health(state: Any) -> Dict[str, Any]:
         log_thinking("marcus", "Analyzing board health and checking for deadlocks")
 
         # Get board health configuration
-        health_config = {}
+        health_config: Any = {}
 
         # Check for project-specific config
         if hasattr(state, "project_registry") and state.project_registry:
@@ -53,24 +53,38 @@ async def check_board_health(state: Any) -> Dict[str, Any]:
 
         # Fall back to global config
         if not health_config:
-            health_config = state.config.get("board_health", {})
+            health_config = getattr(state.config, "board_health", {})
 
-        # Create health analyzer
-        analyzer = BoardHealthAnalyzer(
-            state.kanban_client,
-            stale_task_days=health_config.get("stale_task_days", 7),
-            max_tasks_per_agent=health_config.get("max_tasks_per_agent", 3),
-        )
+        def setting(name: str, default: int) -> int:
+            if isinstance(health_config, dict):
+                return int(health_config.get(name, default))
+            return int(getattr(health_config, name, default))
+
+        stale_task_days = setting("stale_task_days", 7)
+        max_tasks_per_agent = setting("max_tasks_per_agent", 3)
 
         # Get current assignments
         active_assignments = {}
         for agent_id, assignment in state.agent_tasks.items():
             active_assignments[agent_id] = assignment.task_id
 
-        # Perform health analysis
-        health = await analyzer.analyze_board_health(
-            state.agent_status, active_assignments
-        )
+        model = getattr(state, "board_health", None)
+        snapshots = getattr(state, "board_snapshot", None)
+        if model is not None and snapshots is not None:
+            # Kept current from board changes; only refresh a stale snapshot
+            model.configure(stale_task_days, max_tasks_per_agent)
+            await snapshots.get_snapshot()
+            model.sync_agents(state.agent_status, active_assignments)
+            health = model.report()
+        else:
+            analyzer = BoardHealthAnalyzer(
+                state.kanban_client,
+                stale_task_days=stale_task_days,
+                max_tasks_per_agent=max_tasks_per_agent,
+            )
+            health = await analyzer.analyze_board_health(
+                state.agent_status, active_assignments
+            )
 
         # Log critical issues
         critical_issues = [i for i in health.issues if i.severity.value == "critical"]
@@ -6,8 +6,10 @@ This module contains tools for context management:
 """
 
 import logging
-from typing import Any, Dict, List, Set
+from functools import partial
+from typing import Any, Dict, Hashable, Iterable, List, Set, Tuple
 
+from src.core.attachment_cache import AttachmentCache, AttachmentRequest
 from src.core.project_history import Decision as HistoryDecision
 from src.core.project_history import (
     ProjectHistoryPersistence,
@@ -364,6 +366,93 @@ def _inject_usage_guidance(
         artifact.setdefault("usage_guidance", _COORDINATION_REFERENCE_GUIDANCE)
 
 
+def _attachment_cache(state: Any) -> AttachmentCache:
+    """Return the server's attachment cache, or a per-call one."""
+    cache = getattr(state, "attachment_cache", None)
+    if isinstance(cache, AttachmentCache):
+        return cache
+    # No shared cache on this state: still fetch concurrently and
+    # deduplicate within the call, but keep nothing afterwards.
+    return AttachmentCache(ttl_seconds=0)
+
+
+def _task_signature(task: Any) -> Tuple[str, str]:
+    """State a task's cached attachments are valid for."""
+    status = getattr(task, "status", None)
+    return (
+        str(getattr(status, "value", status)),
+        str(getattr(task, "updated_at", None)),
+    )
+
+
+async def _fetch_attachments(
+    state: Any, tasks: Iterable[Any], by_task_id: bool = False
+) -> Dict[str, Any]:
+    """
+    Fetch Kanban attachments for several tasks concurrently, with caching.
+
+    Parameters
+    ----------
+    state : Any
+        Marcus server state; ``kanban_client`` and ``attachment_cache`` are
+        used when present.
+    tasks : Iterable[Any]
+        Tasks whose attachments are needed. Duplicates are fetched once.
+    by_task_id : bool
+        Call ``get_attachments(task_id=...)`` instead of
+        ``get_attachments(card_id=<kanban card id>)``.
+
+    Returns
+    -------
+    Dict[str, Any]
+        Task ID to the provider's result dict, or to the exception the
+        provider call raised. Empty when there is no Kanban client.
+    """
+    kanban_client = getattr(state, "kanban_client", None)
+    tasks = list(tasks)
+    if kanban_client is None or not tasks:
+        return {}
+
+    requests = []
+    for t in tasks:
+        if by_task_id:
+            key: Hashable = (id(kanban_client), "task_id", t.id)
+            fetch = partial(kanban_client.get_attachments, task_id=t.id)
+        else:
+            card_id = getattr(t, "kanban_card_id", None) or t.id
+            key = (id(kanban_client), "card_id", card_id)
+            fetch = partial(kanban_client.get_attachments, card_id=card_id)
+        requests.append(AttachmentRequest(t.id, key, _task_signature(t), fetch))
+
+    results = await _attachment_cache(state).fetch_all(requests)
+    return {t.id: result for t, result in zip(tasks, results)}
+
+
+def _dedupe_artifacts(artifacts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Drop repeated artifacts that several dependencies share.
+
+    Artifacts are the same when they have the same storage type and
+    location; the first occurrence is kept, upgraded to ``in_scope`` if any
+    duplicate was in scope. Artifacts without a location are kept as-is.
+    """
+    kept: Dict[Tuple[Any, Any], Dict[str, Any]] = {}
+    deduped: List[Dict[str, Any]] = []
+    for artifact in artifacts:
+        location = artifact.get("location")
+        if not location:
+            deduped.append(artifact)
+            continue
+        key = (artifact.get("storage_type"), location)
+        first = kept.get(key)
+        if first is None:
+            kept[key] = artifact
+            deduped.append(artifact)
+        elif artifact.get("scope_annotation") == "in_scope":
+            first["scope_annotation"] = "in_scope"
+    return deduped
+
+
 async def _collect_foundation_contract(
     state: Any,
 ) -> Dict[str, List[Dict[str, Any]]]:
@@ -462,17 +551,17 @@ async def _collect_foundation_contract(
     # fix is foundation-collector only.
     kanban_client = getattr(state, "kanban_client", None)
     if kanban_client is not None:
+        fetched = await _fetch_attachments(state, foundation_tasks, by_task_id=True)
         for t in foundation_tasks:
-            try:
-                result = await kanban_client.get_attachments(task_id=t.id)
-            except Exception as exc:  # noqa: BLE001
+            result = fetched[t.id]
+            if isinstance(result, Exception):
                 # Don't fail the whole context-delivery path if the
                 # kanban backend is unavailable or transient-errors.
                 logger.warning(
                     "Foundation contract: failed to fetch attachments "
                     "for task %s: %s",
                     t.id,
-                    exc,
+                    result,
                 )
                 continue
             if not result.get("success", False):
@@ -531,11 +620,26 @@ async def _collect_task_artifacts(
         if hasattr(state, "task_artifacts") and task_id in state.task_artifacts:
             artifacts.extend(state.task_artifacts[task_id].copy())
 
+        # Resolve dependencies once and fetch this task's and every
+        # dependency's Kanban attachments concurrently (cached per task).
+        tasks_by_id = {t.id: t for t in (state.project_tasks or [])}
+        dep_tasks = [
+            tasks_by_id[dep_id]
+            for dep_id in (task.dependencies or [])
+            if dep_id in tasks_by_id
+            and getattr(tasks_by_id[dep_id], "source_type", None)
+            != "pre_fork_synthesis"
+        ]
+        fetched: Dict[str, Any] = {}
+        if state.kanban_client:
+            fetched = await _fetch_attachments(state, [task, *dep_tasks])
+
         # 2. Get Kanban attachments for this task
         if state.kanban_client:
             try:
-                card_id = getattr(task, "kanban_card_id", None) or task.id
-                result = await state.kanban_client.get_attachments(card_id=card_id)
+                result = fetched[task.id]
+                if isinstance(result, Exception):
+                    raise result
                 if result.get("success", False):
                     attachments = result.get("data", [])
                     for attachment in attachments:
@@ -574,9 +678,7 @@ async def _collect_task_artifacts(
         }
         if task.dependencies:
             for dep_id in task.dependencies:
-                dep_task = next(
-                    (t for t in state.project_tasks if t.id == dep_id), None
-                )
+                dep_task = tasks_by_id.get(dep_id)
                 if dep_task:
                     # #595 Fix 2: foundation (pre-fork synthesis) output is
                     # delivered project-globally via `project_contract`.
@@ -645,12 +747,9 @@ async def _collect_task_artifacts(
                     # Kanban attachments from dependency
                     if state.kanban_client:
                         try:
-                            dep_card_id = (
-                                getattr(dep_task, "kanban_card_id", None) or dep_task.id
-                            )
-                            result = await state.kanban_client.get_attachments(
-                                card_id=dep_card_id
-                            )
+                            result = fetched[dep_id]
+                            if isinstance(result, Exception):
+                                raise result
                             if result.get("success", False):
                                 attachments = result.get("data", [])
                                 for attachment in attachments:
@@ -784,6 +883,13 @@ async def _collect_transitive_context(
     # Transitive-only = ancestors minus direct deps minus foundation.
     transitive_ids = ancestors - direct_deps - foundation_ids
 
+    # Fetch every ancestor's Kanban attachments concurrently (cached per
+    # task) instead of one round-trip per ancestor inside the loop.
+    kanban = getattr(state, "kanban_client", None)
+    fetched = await _fetch_attachments(
+        state, [tasks_by_id[a] for a in transitive_ids if a in tasks_by_id]
+    )
+
     artifacts: List[Dict[str, Any]] = []
     for anc_id in transitive_ids:
         anc_task = tasks_by_id.get(anc_id)
@@ -803,11 +909,11 @@ async def _collect_transitive_context(
         # the same or architectural docs that were attached (but not
         # logged via ``log_artifact``) silently disappear past the
         # first hop.
-        kanban = getattr(state, "kanban_client", None)
         if kanban is not None and anc_task is not None:
             try:
-                card_id = getattr(anc_task, "kanban_card_id", None) or anc_id
-                kanban_result = await kanban.get_attachments(card_id=card_id)
+                kanban_result = fetched[anc_id]
+                if isinstance(kanban_result, Exception):
+                    raise kanban_result
                 if kanban_result.get("success", False):
                     for attachment in kanban_result.get("data", []) or []:
                         attach_artifact: Dict[str, Any] = {
@@ -895,13 +1001,29 @@ async def assemble_task_context(task_id: str, task: Any, state: Any) -> Dict[str
     # entries so ``dependency_artifacts`` is what its name claims and
     # downstream consumers that rely on the scope/coordination shape
     # never see the task's own artifacts mis-tagged as deps.
-    dependency_artifacts = [
-        a
-        for a in direct_artifacts
-        if a.get("dependency_task_id") and _is_architectural_artifact(a)
-    ]
+    dependency_artifacts = _dedupe_artifacts(
+        [
+            a
+            for a in direct_artifacts
+            if a.get("dependency_task_id") and _is_architectural_artifact(a)
+        ]
+    )
 
     transitive_context = await _collect_transitive_context(task_id, task, state)
+    # An artifact shared by a direct dependency and an ancestor is
+    # delivered once, in the higher-priority dependency tier.
+    delivered = {
+        (a.get("storage_type"), a.get("location"))
+        for a in dependency_artifacts
+        if a.get("location")
+    }
+    transitive_context["artifacts"] = _dedupe_artifacts(
+        [
+            a
+            for a in transitive_context["artifacts"]
+            if (a.get("storage_type"), a.get("location")) not in delivered
+        ]
+    )
 
     return {
         "project_contract": project_contract,
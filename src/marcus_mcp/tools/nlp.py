@@ -1075,15 +1075,14 @@ async def _create_project_inner(
                                     )
                                     for t in created
                                 ]
-                            for tid in task_ids:
-                                existing = await persistence.retrieve(
-                                    "task_metadata", str(tid)
-                                )
-                                if existing:
-                                    existing["project_id"] = marcus_project_id
-                                    await persistence.store(
-                                        "task_metadata", str(tid), existing
-                                    )
+                            existing_rows = await persistence.retrieve_many(
+                                "task_metadata", [str(tid) for tid in task_ids]
+                            )
+                            for existing in existing_rows.values():
+                                existing["project_id"] = marcus_project_id
+                            await persistence.store_many(
+                                "task_metadata", existing_rows
+                            )
                             if task_ids:
                                 logger.info(
                                     f"Backfilled project_id on "
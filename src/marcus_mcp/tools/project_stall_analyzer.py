@@ -6,12 +6,15 @@ including snapshot capture, conversation replay, dependency lock visualization,
 and task completion pattern analysis.
 """
 
+import heapq
 import json
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
 from src.core.task_diagnostics import (
     DependencyChainAnalyzer,
@@ -31,6 +34,15 @@ class ConversationEvent:
     source: Optional[str] = None
 
 
+@dataclass
+class ConversationWindow:
+    """Single-pass summary of the conversation logs inside a lookback window."""
+
+    recent_events: List[ConversationEvent]  # Newest events, chronological
+    event_count: int
+    stall_patterns: List[Dict[str, Any]]
+
+
 @dataclass
 class TaskCompletionEvent:
     """Represents a task completion event."""
@@ -98,6 +110,84 @@ class ProjectStallSnapshot:
     bottlenecks: List[Dict[str, Any]]
 
 
+# Block size for reading realtime logs backwards
+_LOG_BLOCK_SIZE = 64 * 1024
+
+# Realtime logs are appended in time order by a single writer; allow this
+# much disorder before a backwards scan decides it has passed the cutoff.
+_LOG_REORDER_SLACK = timedelta(minutes=5)
+
+
+def _iter_lines_reversed(
+    path: Path, block_size: int = _LOG_BLOCK_SIZE
+) -> Iterator[bytes]:
+    """Yield the lines of a file last-to-first, reading fixed-size blocks."""
+    with open(path, "rb") as f:
+        position = f.seek(0, os.SEEK_END)
+        remainder = b""
+        while position > 0:
+            read_size = min(block_size, position)
+            position -= read_size
+            f.seek(position)
+            lines = (f.read(read_size) + remainder).split(b"\n")
+            # The first piece may be the tail of a line in an earlier block
+            remainder = lines.pop(0)
+            for line in reversed(lines):
+                yield line
+        yield remainder
+
+
+def _parse_event_time(timestamp: str) -> datetime:
+    event_time = datetime.fromisoformat(timestamp)
+    if event_time.tzinfo is None:
+        event_time = event_time.replace(tzinfo=timezone.utc)
+    return event_time
+
+
+def _iter_log_file_events(
+    log_file: Path, cutoff_time: datetime
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield events at or after ``cutoff_time`` from one log, newest first.
+
+    Stops reading once timestamps fall more than ``_LOG_REORDER_SLACK``
+    before the cutoff, so only the tail of a long-running log is parsed.
+    """
+    stop_time = cutoff_time - _LOG_REORDER_SLACK
+    for line in _iter_lines_reversed(log_file):
+        if not line.strip():
+            continue
+        try:
+            event_data = json.loads(line)
+            event_time = _parse_event_time(event_data.get("timestamp", ""))
+        except (json.JSONDecodeError, UnicodeDecodeError, ValueError, TypeError):
+            continue
+        if event_time >= cutoff_time:
+            yield event_data
+        elif event_time < stop_time:
+            return
+
+
+def _read_log_file_events(log_file: str, cutoff_iso: str) -> List[Dict[str, Any]]:
+    """Process-pool entry point: read one log's window into a list."""
+    try:
+        return list(
+            _iter_log_file_events(Path(log_file), datetime.fromisoformat(cutoff_iso))
+        )
+    except Exception as e:
+        logger.warning(f"Failed to read log file {log_file}: {e}")
+        return []
+
+
+def _to_conversation_event(event_data: Dict[str, Any]) -> ConversationEvent:
+    return ConversationEvent(
+        timestamp=event_data.get("timestamp", ""),
+        event_type=event_data.get("type", "unknown"),
+        data=event_data,
+        source=event_data.get("source"),
+    )
+
+
 class ConversationReplayAnalyzer:
     """Analyzes conversation logs to identify patterns leading to stalls."""
 
@@ -112,10 +202,73 @@ class ConversationReplayAnalyzer:
         """
         self.log_dir = log_dir
 
+    def _recent_log_files(self, cutoff_time: datetime) -> List[Path]:
+        """Realtime logs modified since the cutoff, newest first."""
+        cutoff_ts = cutoff_time.timestamp()
+        log_files = []
+        # Names embed the server start time, so this is newest-first
+        for log_file in sorted(self.log_dir.glob("realtime_*.jsonl"), reverse=True):
+            try:
+                # A log last written before the cutoff holds nothing recent
+                if log_file.stat().st_mtime < cutoff_ts:
+                    continue
+            except OSError:
+                continue
+            log_files.append(log_file)
+        return log_files
+
+    def iter_recent_events(
+        self, lookback_hours: int = 24, workers: Optional[int] = None
+    ) -> Iterator[ConversationEvent]:
+        """
+        Stream conversation events inside the lookback window.
+
+        Log files whose mtime predates the window are skipped without being
+        opened, and recent files are read backwards in blocks until their
+        timestamps pass the cutoff.
+
+        Parameters
+        ----------
+        lookback_hours : int
+            How many hours of history to scan
+        workers : Optional[int]
+            Parse files in a process pool of this size. Each file's window
+            is then materialized in its worker; ``None`` streams serially.
+
+        Yields
+        ------
+        ConversationEvent
+            Events newest first within each file, files newest first.
+        """
+        cutoff_time = datetime.now(timezone.utc) - timedelta(hours=lookback_hours)
+        log_files = self._recent_log_files(cutoff_time)
+
+        if workers and workers > 1 and len(log_files) > 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                for file_events in pool.map(
+                    _read_log_file_events,
+                    [str(log_file) for log_file in log_files],
+                    [cutoff_time.isoformat()] * len(log_files),
+                ):
+                    for event_data in file_events:
+                        yield _to_conversation_event(event_data)
+            return
+
+        for log_file in log_files:
+            try:
+                for event_data in _iter_log_file_events(log_file, cutoff_time):
+                    yield _to_conversation_event(event_data)
+            except Exception as e:
+                logger.warning(f"Failed to read log file {log_file}: {e}")
+                continue
+
     def load_recent_events(self, lookback_hours: int = 24) -> List[ConversationEvent]:
         """
         Load recent conversation events from logs.
 
+        Prefer :meth:`iter_recent_events` or :meth:`summarize_recent_events`
+        when the full list is not needed.
+
         Parameters
         ----------
         lookback_hours : int
@@ -124,52 +277,69 @@ class ConversationReplayAnalyzer:
         Returns
         -------
         List[ConversationEvent]
-            List of conversation events
+            List of conversation events, oldest first
         """
-        cutoff_time = datetime.now(timezone.utc) - timedelta(hours=lookback_hours)
-        events = []
+        return sorted(
+            self.iter_recent_events(lookback_hours), key=lambda e: e.timestamp
+        )
 
-        # Find realtime log files
-        realtime_logs = sorted(self.log_dir.glob("realtime_*.jsonl"), reverse=True)
+    def summarize_recent_events(
+        self,
+        lookback_hours: int = 24,
+        keep_last: int = 50,
+        workers: Optional[int] = None,
+    ) -> ConversationWindow:
+        """
+        Detect stall patterns and keep the newest events in one streaming pass.
 
-        for log_file in realtime_logs:
-            try:
-                with open(log_file, "r") as f:
-                    for line in f:
-                        if not line.strip():
-                            continue
-                        try:
-                            event_data = json.loads(line)
-                            event_time = datetime.fromisoformat(
-                                event_data.get("timestamp", "")
-                            )
-
-                            if event_time >= cutoff_time:
-                                events.append(
-                                    ConversationEvent(
-                                        timestamp=event_data.get("timestamp", ""),
-                                        event_type=event_data.get("type", "unknown"),
-                                        data=event_data,
-                                        source=event_data.get("source"),
-                                    )
-                                )
-                        except (json.JSONDecodeError, ValueError):
-                            continue
-            except Exception as e:
-                logger.warning(f"Failed to read log file {log_file}: {e}")
-                continue
+        Parameters
+        ----------
+        lookback_hours : int
+            How many hours of history to scan
+        keep_last : int
+            Number of newest events to keep for the snapshot
+        workers : Optional[int]
+            Process pool size, see :meth:`iter_recent_events`
 
-        return sorted(events, key=lambda e: e.timestamp)
+        Returns
+        -------
+        ConversationWindow
+            Newest events, total event count and detected patterns
+        """
+        newest: List[Any] = []  # min-heap of (timestamp, seq, event)
+        event_count = 0
+
+        def _track(events: Iterable[ConversationEvent]) -> Iterator[ConversationEvent]:
+            nonlocal event_count
+            for event in events:
+                event_count += 1
+                entry = (event.timestamp, event_count, event)
+                if len(newest) < keep_last:
+                    heapq.heappush(newest, entry)
+                elif keep_last > 0 and entry > newest[0]:
+                    heapq.heapreplace(newest, entry)
+                yield event
+
+        patterns = self.identify_stall_patterns(
+            _track(self.iter_recent_events(lookback_hours, workers=workers))
+        )
+        return ConversationWindow(
+            recent_events=[entry[2] for entry in sorted(newest)],
+            event_count=event_count,
+            stall_patterns=patterns,
+        )
 
     def identify_stall_patterns(
-        self, events: List[ConversationEvent]
+        self, events: Iterable[ConversationEvent]
     ) -> List[Dict[str, Any]]:
         """
         Identify patterns in conversation history that indicate stalls.
 
+        Makes a single pass, so ``events`` may be a stream in any order.
+
         Parameters
         ----------
-        events : List[ConversationEvent]
+        events : Iterable[ConversationEvent]
             Conversation events to analyze
 
         Returns
@@ -178,37 +348,53 @@ class ConversationReplayAnalyzer:
             List of identified patterns
         """
         patterns = []
+        no_task_count = 0
+        # task_id -> [failure count, first failure timestamp]
+        task_errors: Dict[str, List[Any]] = {}
+        event_count = 0
+        first_timestamp: Optional[str] = None
+        last_timestamp: Optional[str] = None
+
+        for e in events:
+            event_count += 1
+            if first_timestamp is None or e.timestamp < first_timestamp:
+                first_timestamp = e.timestamp
+            if last_timestamp is None or e.timestamp > last_timestamp:
+                last_timestamp = e.timestamp
+
+            event_type = e.event_type.lower()
+            if (
+                "no_task" in event_type
+                or "no task" in event_type
+                or "no_task" in str(e.data).lower()
+            ):
+                no_task_count += 1
+
+            if "error" in event_type or "failed" in event_type:
+                task_id = e.data.get("task_id")
+                if task_id:
+                    entry = task_errors.setdefault(task_id, [0, e.timestamp])
+                    entry[0] += 1
+                    entry[1] = min(entry[1], e.timestamp)
 
         # Pattern 1: Repeated "no tasks available" messages
-        no_task_events = [
-            e
-            for e in events
-            if "no_task" in e.event_type.lower()
-            or "no task" in e.event_type.lower()
-            or "no_task" in str(e.data).lower()
-        ]
-        if len(no_task_events) >= 3:
+        if no_task_count >= 3:
             patterns.append(
                 {
                     "pattern": "repeated_no_tasks",
-                    "count": len(no_task_events),
+                    "count": no_task_count,
                     "description": (
-                        f"Agent requested tasks {len(no_task_events)} times "
+                        f"Agent requested tasks {no_task_count} times "
                         "but none available"
                     ),
                     "severity": "high",
                 }
             )
 
-        # Pattern 2: Same task repeatedly failing
-        task_errors: Dict[str, int] = {}
-        for e in events:
-            if "error" in e.event_type.lower() or "failed" in e.event_type.lower():
-                task_id = e.data.get("task_id")
-                if task_id:
-                    task_errors[task_id] = task_errors.get(task_id, 0) + 1
-
-        for task_id, count in task_errors.items():
+        # Pattern 2: Same task repeatedly failing (in order of first failure)
+        for task_id, (count, _) in sorted(
+            task_errors.items(), key=lambda item: item[1][1]
+        ):
             if count >= 2:  # 2 or more failures is suspicious
                 patterns.append(
                     {
@@ -221,19 +407,19 @@ class ConversationReplayAnalyzer:
                 )
 
         # Pattern 3: Long gaps in activity
-        if len(events) > 1:
-            last_event_time = datetime.fromisoformat(events[-1].timestamp)
-            first_event_time = datetime.fromisoformat(events[0].timestamp)
+        if event_count > 1 and first_timestamp and last_timestamp:
+            last_event_time = datetime.fromisoformat(last_timestamp)
+            first_event_time = datetime.fromisoformat(first_timestamp)
             gap_hours = (last_event_time - first_event_time).total_seconds() / 3600
 
-            if gap_hours > 1 and len(events) < 10:
+            if gap_hours > 1 and event_count < 10:
                 patterns.append(
                     {
                         "pattern": "low_activity",
                         "gap_hours": round(gap_hours, 2),
-                        "event_count": len(events),
+                        "event_count": event_count,
                         "description": (
-                            f"Only {len(events)} events in {gap_hours:.1f} hours"
+                            f"Only {event_count} events in {gap_hours:.1f} hours"
                         ),
                         "severity": "medium",
                     }
@@ -538,12 +724,10 @@ async def capture_project_stall_snapshot(
         # Analyze conversations
         log_dir = Path("logs/conversations")
         conversation_analyzer = ConversationReplayAnalyzer(log_dir)
-        conversation_history = conversation_analyzer.load_recent_events(
-            include_conversation_hours
-        )
-        stall_patterns = conversation_analyzer.identify_stall_patterns(
-            conversation_history
+        conversation_window = conversation_analyzer.summarize_recent_events(
+            include_conversation_hours, keep_last=50
         )
+        stall_patterns = conversation_window.stall_patterns
 
         # Analyze task completions
         completion_analyzer = TaskCompletionAnalyzer(project_tasks)
@@ -620,7 +804,7 @@ async def capture_project_stall_snapshot(
                     "source": e.source,
                     "data": e.data,
                 }
-                for e in conversation_history[-50:]  # Last 50 events
+                for e in conversation_window.recent_events  # Last 50 events
             ],
             task_completion_timeline=[
                 {
@@ -663,7 +847,7 @@ async def capture_project_stall_snapshot(
                 "total_issues": len(diagnostic_report.issues),
                 "dependency_locks": dependency_locks["total_locks"],
                 "early_completions": len(early_completions),
-                "conversation_events": len(conversation_history),
+                "conversation_events": conversation_window.event_count,
                 "recommendations_count": len(recommendations),
                 "zombie_tasks": len(zombies),
                 "redundant_dependencies": len(redundant),
@@ -9,6 +9,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict
 
+from src.core.resilience import get_resilience_stats
 from src.logging.agent_events import log_agent_event
 from src.logging.conversation_logger import conversation_logger, log_thinking
 from src.monitoring.assignment_monitor import AssignmentHealthChecker
@@ -135,6 +136,9 @@ async def ping(echo: str, state: Any) -> Dict[str, Any]:
             except Exception as e:
                 response["health"]["lease_statistics"] = {"error": str(e)}
 
+            # Circuit breakers, bulkheads and retry budgets per dependency
+            response["health"]["dependencies"] = get_resilience_stats()
+
         elif echo_lower == "cleanup":
             # Force cleanup of stuck assignments
             cleanup_count = 0
@@ -8,15 +8,19 @@ This module contains tools for task operations in the Marcus system:
 - unassign_task: Manually unassign a task from an agent
 """
 
+import asyncio
+import functools
 import json
 import logging
 import os
 import threading
 import time
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple
 
 from src.core.ai_powered_task_assignment import find_optimal_task_for_agent_ai_powered
+from src.core.metrics import PhaseTimer
 from src.core.models import Priority, Task, TaskAssignment, TaskStatus
 from src.logging.agent_events import log_agent_event
 from src.logging.conversation_logger import conversation_logger, log_thinking
@@ -1515,9 +1519,11 @@ async def request_next_task(agent_id: str, state: Any) -> Any:
         # Phase timing for performance monitoring (GH-228)
         _perf_start = time.perf_counter()
         _perf_marks: Dict[str, float] = {}
+        _phase_timer = PhaseTimer("request_next_task")
 
         def _mark(name: str) -> None:
             _perf_marks[name] = (time.perf_counter() - _perf_start) * 1000
+            _phase_timer.mark(name)
 
         # Log the task request immediately
         state.log_event(
@@ -1582,6 +1588,26 @@ async def request_next_task(agent_id: str, state: Any) -> Any:
                     },
                 }
 
+        # A merge of this agent's branch that was still queued at its last
+        # completion has since conflicted: send the conflict back before
+        # handing out new work, as a synchronous conflict would have
+        queued_conflicts = await _take_queued_merge_conflicts(agent_id, state)
+        if queued_conflicts:
+            conversation_logger.log_worker_message(
+                agent_id,
+                "from_pm",
+                "Task request denied - resolve merge conflicts first",
+                {
+                    "task_ids": [c["task_id"] for c in queued_conflicts],
+                    "reason": "merge_conflict",
+                    **project_context,
+                },
+            )
+            return {
+                **queued_conflicts[-1],
+                "queued_merge_conflicts": queued_conflicts,
+            }
+
         # Find optimal task for this agent
         optimal_task = await find_optimal_task_for_agent(agent_id, state)
         _mark("task_selection")
@@ -2419,10 +2445,130 @@ def _verify_agent_has_commits(
         return None  # git unavailable or unexpected error — skip check
 
 
+def workspace_repo(state: Any) -> Optional[Path]:
+    """Main repository (``project_root``) of the workspace, if it exists."""
+    project_root = None
+    if hasattr(state, "kanban_client") and state.kanban_client:
+        try:
+            ws_state = state.kanban_client._load_workspace_state()
+            if ws_state and "project_root" in ws_state:
+                project_root = ws_state["project_root"]
+        except Exception as ws_err:
+            logger.debug(f"[worktree] No workspace state: {ws_err}")
+    if not project_root:
+        return None
+    repo = Path(project_root)
+    return repo if repo.exists() else None
+
+
+def _merge_conflict_response(result: Any, queued: bool = False) -> Dict[str, Any]:
+    """Build the agent-facing ``merge_conflict`` failure for a merge result."""
+    conflict_list = "".join(f"  - {path}\n" for path in result.conflicted_files)
+    if queued:
+        preamble = (
+            f"Task {result.task_id} was completed, but merging your branch "
+            f"({result.branch}) to main later hit conflicts:\n"
+        )
+        next_step = (
+            "Then request your next task; your branch is merged again "
+            "once it has new commits."
+        )
+    else:
+        preamble = (
+            f"Your task passed validation but merging "
+            f"your branch ({result.branch}) to main has "
+            f"conflicts:\n"
+        )
+        next_step = "Then report completion again."
+    return {
+        "success": False,
+        "error": "merge_conflict",
+        "merge_status": "conflicted",
+        "task_id": result.task_id,
+        "conflicts": result.conflict_details(),
+        "message": (
+            f"{preamble}"
+            f"{conflict_list}"
+            f"Please resolve them:\n"
+            f"  git merge main\n"
+            f"  (resolve conflicts in your editor)\n"
+            f"  git add . && git commit\n"
+            f"{next_step}"
+        ),
+    }
+
+
+# Seconds request_next_task waits for a blocked agent's branch to re-merge
+MERGE_RECHECK_TIMEOUT = 5.0
+
+# (task_id, conflicted files) already flagged on the board
+_flagged_merge_conflicts: Set[Tuple[str, FrozenSet[str]]] = set()
+
+
+async def _flag_queued_merge_conflict(result: Any, state: Any) -> None:
+    """Comment on a completed task whose queued merge conflicted.
+
+    A conflict on the same files of the same task is only flagged once,
+    however often the branch is merged again before it is resolved.
+    """
+    key = (result.task_id, frozenset(result.conflicted_files))
+    if key in _flagged_merge_conflicts:
+        return
+    _flagged_merge_conflicts.add(key)
+    try:
+        await state.kanban_client.add_comment(
+            result.task_id,
+            f"⚠️ Merge of {result.branch} into {result.target} conflicted "
+            f"after completion: {', '.join(result.conflicted_files) or 'unknown'}. "
+            f"The conflict is reported to {result.agent_id} on its next call.",
+        )
+    except Exception as e:
+        logger.warning(f"[worktree] Could not flag merge conflict: {e}")
+
+
+# Follow-up coroutines started from merge callbacks, referenced until done
+_merge_followups: Set["asyncio.Future[None]"] = set()
+
+
+def _start_merge_followup(coroutine: Any) -> None:
+    followup = asyncio.ensure_future(coroutine)
+    _merge_followups.add(followup)
+    followup.add_done_callback(_merge_followups.discard)
+
+
+async def _drain_merge_followups() -> None:
+    """Wait for follow-ups started from merge callbacks (used by tests)."""
+    while _merge_followups:
+        await asyncio.gather(*list(_merge_followups), return_exceptions=True)
+
+
+def _on_merge_done(state: Any, future: "asyncio.Future[Any]") -> None:
+    """Record what a merge brought to main once it lands."""
+    from src.core.merge_queue import MERGE_MERGED
+
+    if future.cancelled() or future.result().status != MERGE_MERGED:
+        return
+    result = future.result()
+    _flagged_merge_conflicts.difference_update(
+        {key for key in _flagged_merge_conflicts if key[0] == result.task_id}
+    )
+    _start_merge_followup(_record_local_implementation(result, state))
+
+
+def _on_detached_merge_done(state: Any, future: "asyncio.Future[Any]") -> None:
+    """Flag the board when a merge nobody is waiting for conflicts."""
+    from src.core.merge_queue import MERGE_CONFLICTED
+
+    if future.cancelled() or future.result().status != MERGE_CONFLICTED:
+        return
+    _start_merge_followup(_flag_queued_merge_conflict(future.result(), state))
+
+
 async def _merge_agent_branch_to_main(
     agent_id: str,
     task_id: str,
     state: Any,
+    wait_timeout: float = 0.0,
 ) -> Optional[Dict[str, Any]]:
     """
     Merge agent's worktree branch to main after task completion.
@@ -2430,124 +2576,160 @@ async def _merge_agent_branch_to_main(
     Convention: if branch marcus/{agent_id} exists, the agent used
     a worktree. Merge it to main so dependent tasks can see the code.
 
-    If merge conflicts, abort and return failure — the agent must
-    resolve conflicts and report completion again.
+    The merge goes through the repository's shared merge queue, so
+    concurrent completions are merged one at a time and git runs off the
+    event loop. By default the call returns ``merge_status="queued"``
+    right away; ``wait_timeout`` lets a caller wait for the outcome.
 
-    Returns None if no merge needed, success dict if merged,
-    or failure dict if conflicts.
+    A merge that is still queued when the call returns is detached: if it
+    conflicts, the task gets a board comment and the conflict is returned
+    to the agent on its next ``request_next_task`` or
+    ``report_task_progress`` call (see :func:`_take_queued_merge_conflicts`).
+    A conflict seen while waiting is returned directly — abort and return
+    failure, the agent must resolve conflicts and report completion again.
+
+    Returns None if no merge needed, success dict if merged or queued,
+    or failure dict (with the conflicted files) if conflicts.
 
     See: https://github.com/lwgray/marcus/issues/250
     """
-    import subprocess as _sp
-    from pathlib import Path
-
-    # Find the main repo (implementation/ directory)
-    # Use workspace state file to get project_root, then use
-    # git rev-parse to find the actual repo root regardless
-    # of whether we're in a worktree or the main repo.
-    project_root = None
-    if hasattr(state, "kanban_client") and state.kanban_client:
-        ws_state = state.kanban_client._load_workspace_state()
-        if ws_state and "project_root" in ws_state:
-            project_root = ws_state["project_root"]
-
-    if not project_root:
-        return None
+    from src.core.merge_queue import (
+        MERGE_CONFLICTED,
+        MERGE_MERGED,
+        MERGE_QUEUED,
+        get_merge_queue,
+    )
 
     # project_root points to implementation/ (main repo).
     # Use it directly — git commands run here.
-    repo = Path(project_root)
-    if not repo.exists():
+    repo = workspace_repo(state)
+    if repo is None:
         return None
 
-    # Verify it's a git repo (or inside one)
-    try:
-        check = _sp.run(
-            ["git", "rev-parse", "--git-dir"],
-            cwd=repo,
-            capture_output=True,
-            text=True,
+    queue = get_merge_queue(repo)
+    ticket = queue.submit(agent_id, task_id)
+    ticket.future.add_done_callback(functools.partial(_on_merge_done, state))
+    if wait_timeout > 0:
+        try:
+            await asyncio.wait_for(asyncio.shield(ticket.future), wait_timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    if not ticket.future.done():
+        logger.info(
+            f"[worktree] Merge of marcus/{agent_id} for task {task_id} "
+            f"queued ({ticket.position} ahead at submission)"
         )
-        if check.returncode != 0:
-            return None
-    except Exception:
-        return None
+        queue.detach(ticket)
+        ticket.future.add_done_callback(
+            functools.partial(_on_detached_merge_done, state)
+        )
+        return {
+            "success": True,
+            "merge_status": MERGE_QUEUED,
+            "queue_position": ticket.position,
+        }
 
-    branch = f"marcus/{agent_id}"
+    result = ticket.future.result()
+    if result.status == MERGE_MERGED:
+        return {"success": True, "merge_status": "merged"}
 
-    # Check if this agent's branch exists
-    try:
-        result = _sp.run(
-            ["git", "branch", "--list", branch],
-            cwd=repo,
-            capture_output=True,
-            text=True,
-        )
-        if not result.stdout.strip():
-            # No worktree branch — agent worked on main directly
-            return None
-    except Exception:
-        return None
+    if result.status == MERGE_CONFLICTED:
+        return _merge_conflict_response(result)
 
-    logger.info(
-        f"[worktree] Merging {branch} to main " f"after task {task_id} completion"
-    )
+    if result.detail:
+        # Don't block completion if git is unavailable
+        logger.warning(f"[worktree] Merge failed: {result.detail}")
+    return None
 
-    try:
-        # Checkout main
-        _sp.run(
-            ["git", "checkout", "main"],
-            cwd=repo,
-            check=True,
-            capture_output=True,
-        )
 
-        # Attempt merge
-        merge = _sp.run(
-            [
-                "git",
-                "merge",
-                branch,
-                "--no-ff",
-                "-m",
-                f"Merge {branch} (task {task_id} by {agent_id})",
-            ],
-            cwd=repo,
-            capture_output=True,
-            text=True,
-        )
+async def _take_queued_merge_conflicts(
+    agent_id: str, state: Any
+) -> List[Dict[str, Any]]:
+    """
+    Collect conflicts that keep the agent from getting new work.
 
-        if merge.returncode == 0:
-            logger.info(f"[worktree] Successfully merged {branch} to main")
-            return {"success": True}
-        else:
-            # Merge conflict — abort and send agent back
-            _sp.run(
-                ["git", "merge", "--abort"],
-                cwd=repo,
-                capture_output=True,
-            )
-            logger.warning(
-                f"[worktree] Merge conflict for {branch}: " f"{merge.stderr}"
+    Conflicts from merges that finished after their call returned are
+    returned once as they arrive. After that, an agent whose last merge
+    conflicted stays blocked until its branch merges: the branch is only
+    merged again once the agent has committed to it (its resolution), and
+    until then the same conflict is returned without another merge or
+    board comment. Reporting completion again also re-merges the branch.
+
+    Returns
+    -------
+    List[Dict[str, Any]]
+        One ``merge_conflict`` failure per conflicted merge, oldest first.
+    """
+    from src.core.merge_queue import MERGE_CONFLICTED, MERGE_MERGED, get_merge_queue
+
+    repo = workspace_repo(state)
+    if repo is None:
+        return []
+    queue = get_merge_queue(repo)
+    conflicts = queue.take_unreported(agent_id)
+    if conflicts:
+        return [_merge_conflict_response(result, queued=True) for result in conflicts]
+
+    last = queue.last_result(agent_id)
+    if last is None or last.status != MERGE_CONFLICTED:
+        return []
+    if not queue.is_pending(agent_id):
+        tip = await asyncio.to_thread(queue.branch_tip, agent_id)
+        if tip != last.branch_commit:
+            retry = await _merge_agent_branch_to_main(
+                agent_id, last.task_id, state, wait_timeout=MERGE_RECHECK_TIMEOUT
             )
-            return {
-                "success": False,
-                "error": "merge_conflict",
-                "message": (
-                    f"Your task passed validation but merging "
-                    f"your branch ({branch}) to main has "
-                    f"conflicts. Please resolve them:\n"
-                    f"  git merge main\n"
-                    f"  (resolve conflicts in your editor)\n"
-                    f"  git add . && git commit\n"
-                    f"Then report completion again."
-                ),
-            }
+            if retry is None or retry.get("merge_status") == MERGE_MERGED:
+                return []
+            last = queue.last_result(agent_id) or last
+            if last.status != MERGE_CONFLICTED:
+                return []
+    return [_merge_conflict_response(last, queued=True)]
 
+
+async def _record_local_implementation(result: Any, state: Any) -> None:
+    """
+    Record what a merge added to the main repo in the context.
+
+    Only symbols in files the merge commit changed (compared with main
+    before the merge) are stored as the implementation of the merge's
+    task, so neither code that was already in the repository nor another
+    agent's merge is attributed to it. Dependent tasks then see the new
+    endpoints, models, functions and tests without any GitHub calls
+    (GitHub projects use the code analyzer instead).
+
+    Parameters
+    ----------
+    result : MergeResult
+        A merged result from the repository's merge queue.
+    state : Any
+        Server state.
+    """
+    from src.core.code_index import get_code_index
+
+    if not (hasattr(state, "context") and state.context):
+        return
+    if state.provider == "github" or not (result.base_commit and result.merge_commit):
+        return
+    repo = workspace_repo(state)
+    if repo is None:
+        return
+
+    try:
+        delta = await asyncio.to_thread(
+            get_code_index(repo).commit_delta,
+            result.base_commit,
+            result.merge_commit,
+        )
+        if delta.added:
+            await state.context.add_implementation(
+                result.task_id, delta.as_implementation()
+            )
     except Exception as e:
-        logger.warning(f"[worktree] Merge failed: {e}")
-        # Don't block completion if git is unavailable
-        return None
+        logger.warning(
+            f"[code_index] Could not record {result.task_id} in index: {e}"
+        )
 
 
 def _resolve_completed_task(
@@ -3024,6 +3206,8 @@ async def report_task_progress(
         # (DONE) before returning a merge-conflict error so it is never
         # left IN_PROGRESS with no owner (Codex review P1).
         _deferred_merge_failure: dict[str, object] | None = None
+        # Merge queue outcome ("merged"/"queued") surfaced on success.
+        _merge_info: dict[str, object] = {}
 
         if status == "completed":
             update_data["status"] = TaskStatus.DONE
@@ -3119,7 +3303,9 @@ async def report_task_progress(
                 _ws_state = state.kanban_client._load_workspace_state()
             _project_root = _ws_state.get("project_root") if _ws_state else None
             if _project_root:
-                _commit_ok = _verify_agent_has_commits(agent_id, _project_root)
+                _commit_ok = await asyncio.to_thread(
+                    _verify_agent_has_commits, agent_id, _project_root
+                )
                 if _commit_ok is False:
                     logger.warning(
                         f"[commit_gate] {agent_id} reported task "
@@ -3174,6 +3360,10 @@ async def report_task_progress(
             merge_result = await _merge_agent_branch_to_main(agent_id, task_id, state)
             if merge_result and not merge_result.get("success"):
                 _deferred_merge_failure = merge_result
+            elif merge_result:
+                _merge_info = {
+                    k: v for k, v in merge_result.items() if k != "success"
+                }
 
             # Increment completed count only after merge attempt so a
             # failed merge doesn't inflate the counter (Codex review P2).
@@ -3336,6 +3526,12 @@ async def report_task_progress(
                         f"{new_lease.lease_expires.isoformat()})"
                     )
 
+        # Conflicts from this agent's earlier merges that were still
+        # queued when their report returned
+        queued_conflicts = await _take_queued_merge_conflicts(agent_id, state)
+        if queued_conflicts and _deferred_merge_failure is None:
+            _merge_info["queued_merge_conflicts"] = queued_conflicts
+
         # Log response
         conversation_logger.log_worker_message(
             agent_id,
@@ -3355,7 +3551,7 @@ async def report_task_progress(
         # All state updates (kanban DONE, lease cleared, memory recorded) have
         # completed — safe to surface the merge error to the caller.
         if _deferred_merge_failure is not None:
-            return _deferred_merge_failure
+            return {**_deferred_merge_failure, **_merge_info}
 
         # If the validation retry ceiling was hit, surface the
         # escalation details on the success response. The task has
@@ -3369,6 +3565,7 @@ async def report_task_progress(
                 "success": True,
                 "message": ("Progress updated successfully (validation escalated)"),
                 **escalation_payload,
+                **_merge_info,
             }
 
         # Stub debt check: warn when completed task's output files still
@@ -3388,6 +3585,7 @@ async def report_task_progress(
                     return {
                         "success": True,
                         "message": "Progress updated successfully",
+                        **_merge_info,
                         "stub_warnings": _stub_findings,
                         "stub_warning_message": (
                             f"Task completed but "
@@ -3416,7 +3614,11 @@ async def report_task_progress(
             )
             fire_task_completed(completed_task)
 
-        return {"success": True, "message": "Progress updated successfully"}
+        return {
+            "success": True,
+            "message": "Progress updated successfully",
+            **_merge_info,
+        }
 
     except Exception as e:
         # Atomicity guarantee for the escalation path (review of
@@ -3,13 +3,27 @@ Basic Adaptive Mode for Marcus Hybrid Approach.
 
 Implements Adaptive Mode that respects dependencies and prevents illogical
 task assignments like "Deploy to production" before development is complete.
+Blocking checks and unblocking scores are answered from an incrementally
+maintained :class:`~src.modes.adaptive.readiness_index.TaskReadinessIndex`,
+kept current from the board snapshot's change feed once :meth:`attach` is
+called and otherwise synced from the task list each call receives.
 """
 
 import logging
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from src.core.assignment_persistence import AssignmentPersistence
+from src.core.board_snapshot import (
+    BoardChange,
+    BoardSnapshot,
+    BoardSnapshotService,
+)
 from src.core.models import Priority, Task, TaskStatus
+from src.modes.adaptive.readiness_index import (
+    TaskReadinessIndex,
+    name_words,
+    words_related,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -61,6 +75,50 @@ class BasicAdaptiveMode:
                 "blocks_until_complete": r"(permissions|roles|admin)",
             },
         ]
+        self._index = TaskReadinessIndex(self.LOGICAL_DEPENDENCY_PATTERNS)
+        self._unsubscribe: Optional[Callable[[], None]] = None
+        self._bootstrapped = False
+        # True once the index holds a board delivered by the change feed
+        self._follows_board = False
+
+    def attach(self, service: BoardSnapshotService) -> None:
+        """
+        Keep the readiness index current from a board snapshot's change feed.
+
+        The current snapshot, if any, is loaded immediately and the first
+        delivery (the whole board) is synced; later deliveries are applied
+        as changes, and selections stop re-syncing the index from the task
+        lists they are given.
+        """
+        self.detach()
+        if service.snapshot is not None:
+            self._index.sync(service.snapshot.tasks)
+            self._follows_board = True
+        self._bootstrapped = False
+        self._unsubscribe = service.subscribe(self.on_board_changes)
+
+    def detach(self) -> None:
+        """Stop following the change feed set up by :meth:`attach`."""
+        if self._unsubscribe is not None:
+            self._unsubscribe()
+            self._unsubscribe = None
+        self._follows_board = False
+
+    def on_board_changes(
+        self, changes: List[BoardChange], snapshot: BoardSnapshot
+    ) -> None:
+        """Board change subscriber; see :meth:`BoardSnapshotService.subscribe`."""
+        if not self._bootstrapped:
+            self._bootstrapped = True
+            self._index.sync(snapshot.tasks)
+            self._follows_board = True
+        elif changes:
+            self._index.apply_changes(changes)
+
+    def _sync_index(self, tasks: List[Task]) -> None:
+        """Sync the index from ``tasks`` unless the change feed maintains it."""
+        if not self._follows_board:
+            self._index.sync(tasks)
 
     async def initialize(self, saved_state: Dict[str, Any]) -> None:
         """
@@ -188,8 +246,9 @@ class BasicAdaptiveMode:
         """
         unblocked_tasks: List[Task] = []
 
+        self._sync_index(tasks)
         for task in tasks:
-            if await self._is_task_unblocked(task, tasks, assigned_tasks):
+            if self._check_unblocked(task):
                 unblocked_tasks.append(task)
             else:
                 logger.debug(f"Task '{task.name}' is blocked by dependencies")
@@ -219,50 +278,43 @@ class BasicAdaptiveMode:
         bool
             True if task is unblocked and ready, False otherwise.
         """
-        # Check explicit dependencies first
-        if task.dependencies:
-            for dep_id in task.dependencies:
-                dep_task = next((t for t in all_tasks if t.id == dep_id), None)
-                if dep_task and dep_task.status != TaskStatus.DONE:
-                    logger.debug(
-                        f"Task '{task.name}' blocked by incomplete "
-                        f"dependency '{dep_task.name}'"
-                    )
-                    return False
+        self._sync_index(all_tasks)
+        return self._check_unblocked(task)
 
-        # Check logical dependency patterns
-        task_text = f"{task.name} {task.description or ''}".lower()
-
-        for pattern in self.LOGICAL_DEPENDENCY_PATTERNS:
-            blocking_pattern = pattern["pattern"]
-            blocked_pattern = pattern["blocks_until_complete"]
-
-            # If this task matches a blocked pattern
-            import re
+    def _check_unblocked(self, task: Task) -> bool:
+        """
+        Check ``task`` against the already-synced readiness index.
 
-            if re.search(blocked_pattern, task_text):
-                # Check if any blocking tasks are incomplete
-                for other_task in all_tasks:
-                    other_text = (
-                        f"{other_task.name} {other_task.description or ''}".lower()
-                    )
+        Parameters
+        ----------
+        task : Task
+            The task to check.
 
-                    if (
-                        re.search(blocking_pattern, other_text)
-                        and other_task.status != TaskStatus.DONE
-                        and other_task.id != task.id
-                    ):
-                        logger.info(
-                            f"Task '{task.name}' blocked by logical dependency: "
-                            f"'{other_task.name}' must complete first"
-                        )
-                        return False
+        Returns
+        -------
+        bool
+            True if task is unblocked and ready, False otherwise.
+        """
+        # Check explicit dependencies first
+        dep_task = next(self._index.incomplete_dependencies(task), None)
+        if dep_task is not None:
+            logger.debug(
+                f"Task '{task.name}' blocked by incomplete "
+                f"dependency '{dep_task.name}'"
+            )
+            return False
 
-        # Check for obvious illogical patterns
-        if await self._is_obviously_illogical(task, all_tasks):
+        # Check logical dependency patterns
+        other_task = self._index.logical_blocker(task)
+        if other_task is not None:
+            logger.info(
+                f"Task '{task.name}' blocked by logical dependency: "
+                f"'{other_task.name}' must complete first"
+            )
             return False
 
-        return True
+        # Check for obvious illogical patterns
+        return not self._check_illogical(task)
 
     async def _is_obviously_illogical(self, task: Task, all_tasks: List[Task]) -> bool:
         """
@@ -282,47 +334,40 @@ class BasicAdaptiveMode:
         bool
             True if assignment would be illogical, False otherwise.
         """
-        task_lower = task.name.lower()
-
-        # Deployment tasks
-        if any(
-            word in task_lower for word in ["deploy", "production", "release", "launch"]
-        ):
-            # Check if there are any incomplete implementation tasks
-            for other_task in all_tasks:
-                other_lower = other_task.name.lower()
-                if (
-                    any(
-                        word in other_lower
-                        for word in ["implement", "build", "create", "develop"]
-                    )
-                    and other_task.status != TaskStatus.DONE
-                    and other_task.id != task.id
-                ):
-                    logger.warning(
-                        f"Blocking deployment task '{task.name}' - "
-                        f"implementation task '{other_task.name}' is not complete"
-                    )
-                    return True
-
-        # Testing tasks
-        if any(word in task_lower for word in ["test", "qa", "quality"]):
-            # Check if there are any incomplete implementation tasks for
-            # the same component
-            for other_task in all_tasks:
-                other_lower = other_task.name.lower()
-                if (
-                    any(
-                        word in other_lower for word in ["implement", "build", "create"]
-                    )
-                    and other_task.status != TaskStatus.DONE
-                    and self._tasks_related(task, other_task)
-                ):
-                    logger.info(
-                        f"Blocking test task '{task.name}' - related "
-                        f"implementation '{other_task.name}' is not complete"
-                    )
-                    return True
+        self._sync_index(all_tasks)
+        return self._check_illogical(task)
+
+    def _check_illogical(self, task: Task) -> bool:
+        """
+        Check ``task`` for illogical ordering against the synced index.
+
+        Parameters
+        ----------
+        task : Task
+            The task to check.
+
+        Returns
+        -------
+        bool
+            True if assignment would be illogical, False otherwise.
+        """
+        # Deployment tasks wait for any incomplete implementation task
+        other_task = self._index.deployment_blocker(task)
+        if other_task is not None:
+            logger.warning(
+                f"Blocking deployment task '{task.name}' - "
+                f"implementation task '{other_task.name}' is not complete"
+            )
+            return True
+
+        # Testing tasks wait for incomplete implementation of the same component
+        other_task = self._index.test_blocker(task)
+        if other_task is not None:
+            logger.info(
+                f"Blocking test task '{task.name}' - related "
+                f"implementation '{other_task.name}' is not complete"
+            )
+            return True
 
         return False
 
@@ -342,36 +387,8 @@ class BasicAdaptiveMode:
         bool
             True if tasks share significant common words, False otherwise.
         """
-        # Simple heuristic: check for common words in task names
-        words1 = set(task1.name.lower().split())
-        words2 = set(task2.name.lower().split())
-
-        # Remove common words
-        common_stopwords = {
-            "the",
-            "a",
-            "an",
-            "and",
-            "or",
-            "but",
-            "in",
-            "on",
-            "at",
-            "to",
-            "for",
-            "of",
-            "with",
-            "by",
-        }
-        words1 -= common_stopwords
-        words2 -= common_stopwords
-
-        # If they share significant words, they're probably related
-        intersection = words1 & words2
-        return (
-            len(intersection) >= 1
-            and len(intersection) >= min(len(words1), len(words2)) * 0.3
-        )
+        # Simple heuristic: shared significant words in task names
+        return words_related(name_words(task1.name), name_words(task2.name))
 
     async def _calculate_task_score(
         self,
@@ -501,20 +518,18 @@ class BasicAdaptiveMode:
         float
             Normalized unblocking value between 0 and 1.
         """
-        if not task.id:
+        if not task.id or not available_tasks:
             return 0.0
 
-        # Count tasks that depend on this one
-        dependent_count = 0
-        for other_task in available_tasks:
-            if task.id in other_task.dependencies:
-                dependent_count += 1
-
-        # Normalize by total tasks
-        if available_tasks:
-            return dependent_count / len(available_tasks)
+        # Scoring inside find_optimal_task_for_agent reuses the synced index
+        if available_tasks is not self._index.source:
+            self._sync_index(available_tasks)
 
-        return 0.0
+        # Count indexed tasks that depend on this one, normalized by the
+        # indexed tasks: ``available_tasks`` itself, or the whole board
+        # when the index follows the change feed
+        dependents = self._index.dependent_count(task.id)
+        return min(1.0, dependents / max(len(self._index), 1))
 
     def _get_agent_preference_score(self, agent_id: str, task: Task) -> float:
         """
@@ -587,6 +602,10 @@ class BasicAdaptiveMode:
                 preferences[label] = 0.5
             preferences[label] = max(0, min(1, preferences[label] + weight_change))
 
+        # Release the task's dependents before the next board refresh
+        if outcome == "completed":
+            self._index.update_status(task.id, TaskStatus.DONE)
+
         logger.info(
             f"Recorded {outcome} outcome for agent {agent_id} on task '{task.name}'"
         )
@@ -618,49 +637,36 @@ class BasicAdaptiveMode:
             t for t in tasks if t.status == TaskStatus.DONE
         ]
 
+        self._sync_index(tasks)
         for task in todo_tasks:
-            if not await self._is_task_unblocked(task, tasks, {}):
+            if not self._check_unblocked(task):
                 # Find what's blocking it
                 blockers: List[Dict[str, Any]] = []
 
                 # Check explicit dependencies
-                for dep_id in task.dependencies:
-                    dep_task = next((t for t in tasks if t.id == dep_id), None)
-                    if dep_task and dep_task.status != TaskStatus.DONE:
-                        blockers.append(
-                            {
-                                "type": "explicit_dependency",
-                                "blocking_task": dep_task.name,
-                                "blocking_task_id": dep_task.id,
-                            }
-                        )
+                for dep_task in self._index.incomplete_dependencies(task):
+                    blockers.append(
+                        {
+                            "type": "explicit_dependency",
+                            "blocking_task": dep_task.name,
+                            "blocking_task_id": dep_task.id,
+                        }
+                    )
 
                 # Check logical dependencies
-                task_text = f"{task.name} {task.description or ''}".lower()
-                import re
-
-                for pattern in self.LOGICAL_DEPENDENCY_PATTERNS:
-                    if re.search(pattern["blocks_until_complete"], task_text):
-                        for other_task in tasks:
-                            other_text = (
-                                f"{other_task.name} "
-                                f"{other_task.description or ''}".lower()
-                            )
-                            if (
-                                re.search(pattern["pattern"], other_text)
-                                and other_task.status != TaskStatus.DONE
-                            ):
-                                blockers.append(
-                                    {
-                                        "type": "logical_dependency",
-                                        "blocking_task": other_task.name,
-                                        "blocking_task_id": other_task.id,
-                                        "reason": (
-                                            f"Must complete {pattern['pattern']} "
-                                            f"before {pattern['blocks_until_complete']}"
-                                        ),
-                                    }
-                                )
+                for index, other_task in self._index.pattern_blockers(task):
+                    pattern = self.LOGICAL_DEPENDENCY_PATTERNS[index]
+                    blockers.append(
+                        {
+                            "type": "logical_dependency",
+                            "blocking_task": other_task.name,
+                            "blocking_task_id": other_task.id,
+                            "reason": (
+                                f"Must complete {pattern['pattern']} "
+                                f"before {pattern['blocks_until_complete']}"
+                            ),
+                        }
+                    )
 
                 if blockers:
                     blocking_analysis["blocked_tasks"].append(
@@ -0,0 +1,410 @@
+"""
+Incremental readiness index for Adaptive Mode task selection.
+
+:class:`~src.modes.adaptive.basic_adaptive.BasicAdaptiveMode` decides
+whether a task is unblocked (explicit dependencies done, no incomplete task
+matching a logical blocking pattern, not an obviously illogical deploy or
+test) and how many tasks it unblocks. Answered by scanning the board for
+every candidate, both questions cost O(n) per task and O(n²) per
+assignment.
+
+:class:`TaskReadinessIndex` keeps the answers' ingredients up to date
+instead: a reverse-dependency (dependents) index, per-task counts of unmet
+dependencies with the resulting ready-set, and the sets of incomplete tasks
+that block each logical pattern. :meth:`TaskReadinessIndex.apply_changes`
+applies the board snapshot's change feed task by task, so a selection does
+not revisit the board at all; :meth:`TaskReadinessIndex.sync` diffs a
+whole task list for callers without a feed, reprocessing only tasks whose
+status, dependencies or text changed. Per-candidate checks are O(1) apart
+from test tasks, which consult only implementation tasks sharing a name
+word.
+"""
+
+import logging
+import re
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from src.core.board_snapshot import BoardChange
+from src.core.models import Task, TaskStatus
+
+logger = logging.getLogger(__name__)
+
+# Words ignored when deciding whether two task names are related
+STOPWORDS = frozenset(
+    {
+        "the",
+        "a",
+        "an",
+        "and",
+        "or",
+        "but",
+        "in",
+        "on",
+        "at",
+        "to",
+        "for",
+        "of",
+        "with",
+        "by",
+    }
+)
+
+# Name fragments for the "obviously illogical" deploy and test rules
+DEPLOY_WORDS = ("deploy", "production", "release", "launch")
+DEPLOY_BLOCKER_WORDS = ("implement", "build", "create", "develop")
+TEST_WORDS = ("test", "qa", "quality")
+TEST_BLOCKER_WORDS = ("implement", "build", "create")
+
+
+def name_words(name: str) -> FrozenSet[str]:
+    """Return the significant lower-cased words of a task name."""
+    return frozenset(name.lower().split()) - STOPWORDS
+
+
+def words_related(words1: FrozenSet[str], words2: FrozenSet[str]) -> bool:
+    """
+    Return whether two task names share enough words to be related.
+
+    They must share at least one word, and at least 30% of the shorter
+    name's significant words.
+    """
+    shared = len(words1 & words2)
+    return shared >= 1 and shared >= min(len(words1), len(words2)) * 0.3
+
+
+@dataclass
+class TaskFeatures:
+    """
+    Text-derived facts about a task, computed once per name/description.
+
+    Attributes
+    ----------
+    blocks : Tuple[int, ...]
+        Logical patterns this task blocks while incomplete.
+    blocked_by : Tuple[int, ...]
+        Logical patterns whose blocking tasks must finish before this one.
+    is_deploy : bool
+        Name marks a deployment task.
+    is_test : bool
+        Name marks a testing task.
+    blocks_deploys : bool
+        Name marks implementation work that must precede any deployment.
+    blocks_tests : bool
+        Name marks implementation work that must precede related tests.
+    words : FrozenSet[str]
+        Significant name words, for relatedness.
+    """
+
+    blocks: Tuple[int, ...]
+    blocked_by: Tuple[int, ...]
+    is_deploy: bool
+    is_test: bool
+    blocks_deploys: bool
+    blocks_tests: bool
+    words: FrozenSet[str]
+
+
+@dataclass
+class _Entry:
+    task: Task
+    status: TaskStatus
+    dependencies: FrozenSet[str]
+    text: Tuple[str, str]
+    features: TaskFeatures
+
+    @property
+    def incomplete(self) -> bool:
+        return self.status != TaskStatus.DONE
+
+
+class TaskReadinessIndex:
+    """
+    Incrementally maintained dependency and blocking state for a board.
+
+    Parameters
+    ----------
+    patterns : List[Dict[str, str]]
+        Logical dependency patterns: ``pattern`` matches blocking tasks and
+        ``blocks_until_complete`` the tasks they block, both searched in
+        the lower-cased ``"name description"`` text.
+    """
+
+    def __init__(self, patterns: List[Dict[str, str]]) -> None:
+        self._patterns = [
+            (re.compile(p["pattern"]), re.compile(p["blocks_until_complete"]))
+            for p in patterns
+        ]
+        self._entries: Dict[str, _Entry] = {}
+        # dependency id -> ids of indexed tasks that declare it
+        self._dependents: Dict[str, Set[str]] = {}
+        # task id -> dependencies that are indexed and not DONE
+        self._unmet: Dict[str, int] = {}
+        self._ready: Set[str] = set()
+        self._incomplete_blockers: List[Set[str]] = [set() for _ in patterns]
+        self._incomplete_deploy_blockers: Set[str] = set()
+        self._incomplete_test_blockers: Dict[str, Set[str]] = {}
+        self.source: Optional[List[Task]] = None
+
+    def __len__(self) -> int:
+        """Return the number of indexed tasks."""
+        return len(self._entries)
+
+    def __contains__(self, task_id: object) -> bool:
+        """Return whether ``task_id`` is indexed."""
+        return task_id in self._entries
+
+    @property
+    def ready(self) -> Set[str]:
+        """IDs of indexed tasks whose indexed dependencies are all DONE."""
+        return self._ready
+
+    # ------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------
+
+    def sync(self, tasks: Iterable[Task]) -> None:
+        """
+        Make the index reflect exactly ``tasks``.
+
+        Tasks that are new or whose status, dependencies, name or
+        description changed are reprocessed; missing tasks are removed.
+        When an ID appears twice the last task wins.
+
+        Parameters
+        ----------
+        tasks : Iterable[Task]
+            The current task list.
+        """
+        task_list = tasks if isinstance(tasks, list) else list(tasks)
+        latest = {task.id: task for task in task_list}
+        for task_id in [i for i in self._entries if i not in latest]:
+            self.remove(task_id)
+        for task in latest.values():
+            self.upsert(task)
+        self.source = task_list
+
+    def apply_changes(self, changes: Iterable[BoardChange]) -> None:
+        """
+        Apply board change events, touching only the tasks they name.
+
+        Parameters
+        ----------
+        changes : Iterable[BoardChange]
+            Changes from :class:`~src.core.board_snapshot.BoardSnapshotService`.
+        """
+        for change in changes:
+            if change.task is None:
+                self.remove(change.task_id)
+            else:
+                self.upsert(change.task)
+        self.source = None
+
+    def upsert(self, task: Task) -> None:
+        """Add ``task`` or apply its changes."""
+        entry = self._entries.get(task.id)
+        dependencies = frozenset(task.dependencies or ())
+        text = (task.name, task.description or "")
+        if entry is not None:
+            entry.task = task
+            if (
+                entry.status == task.status
+                and entry.dependencies == dependencies
+                and entry.text == text
+            ):
+                return
+            features = entry.features if entry.text == text else None
+            self._detach(entry)
+        else:
+            features = None
+        self._attach(
+            _Entry(
+                task,
+                task.status,
+                dependencies,
+                text,
+                features or self.features(task),
+            )
+        )
+
+    def update_status(self, task_id: str, status: TaskStatus) -> None:
+        """Record a status change for an indexed task."""
+        entry = self._entries.get(task_id)
+        if entry is None or entry.status == status:
+            return
+        self._detach(entry)
+        entry.status = status
+        self._attach(entry)
+
+    def remove(self, task_id: str) -> None:
+        """Drop ``task_id`` from the index."""
+        entry = self._entries.get(task_id)
+        if entry is not None:
+            self._detach(entry)
+
+    def _set_unmet(self, task_id: str, count: int) -> None:
+        self._unmet[task_id] = count
+        if count:
+            self._ready.discard(task_id)
+        else:
+            self._ready.add(task_id)
+
+    def _attach(self, entry: _Entry) -> None:
+        task_id = entry.task.id
+        self._entries[task_id] = entry
+        for dep_id in entry.dependencies:
+            self._dependents.setdefault(dep_id, set()).add(task_id)
+        self._set_unmet(
+            task_id,
+            sum(
+                1
+                for dep_id in entry.dependencies
+                if dep_id in self._entries and self._entries[dep_id].incomplete
+            ),
+        )
+        if not entry.incomplete:
+            return
+        for dependent in self._dependents.get(task_id, ()):
+            if dependent != task_id:
+                self._set_unmet(dependent, self._unmet[dependent] + 1)
+        features = entry.features
+        for index in features.blocks:
+            self._incomplete_blockers[index].add(task_id)
+        if features.blocks_deploys:
+            self._incomplete_deploy_blockers.add(task_id)
+        if features.blocks_tests:
+            for word in features.words:
+                holders = self._incomplete_test_blockers.setdefault(word, set())
+                holders.add(task_id)
+
+    def _detach(self, entry: _Entry) -> None:
+        task_id = entry.task.id
+        if entry.incomplete:
+            for dependent in self._dependents.get(task_id, ()):
+                if dependent != task_id:
+                    self._set_unmet(dependent, self._unmet[dependent] - 1)
+            features = entry.features
+            for index in features.blocks:
+                self._incomplete_blockers[index].discard(task_id)
+            self._incomplete_deploy_blockers.discard(task_id)
+            if features.blocks_tests:
+                for word in features.words:
+                    holders = self._incomplete_test_blockers.get(word)
+                    if holders is not None:
+                        holders.discard(task_id)
+                        if not holders:
+                            del self._incomplete_test_blockers[word]
+        for dep_id in entry.dependencies:
+            dependents = self._dependents.get(dep_id)
+            if dependents is not None:
+                dependents.discard(task_id)
+                if not dependents:
+                    del self._dependents[dep_id]
+        del self._unmet[task_id]
+        self._ready.discard(task_id)
+        del self._entries[task_id]
+
+    # ------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------
+
+    def features(self, task: Task) -> TaskFeatures:
+        """Return the text-derived features of ``task``, using the index."""
+        entry = self._entries.get(task.id)
+        if entry is not None and entry.task is task:
+            return entry.features
+        text = f"{task.name} {task.description or ''}".lower()
+        name = task.name.lower()
+        return TaskFeatures(
+            blocks=tuple(
+                i
+                for i, (blocking, _) in enumerate(self._patterns)
+                if blocking.search(text)
+            ),
+            blocked_by=tuple(
+                i
+                for i, (_, blocked) in enumerate(self._patterns)
+                if blocked.search(text)
+            ),
+            is_deploy=any(word in name for word in DEPLOY_WORDS),
+            is_test=any(word in name for word in TEST_WORDS),
+            blocks_deploys=any(word in name for word in DEPLOY_BLOCKER_WORDS),
+            blocks_tests=any(word in name for word in TEST_BLOCKER_WORDS),
+            words=name_words(task.name),
+        )
+
+    def incomplete_dependencies(self, task: Task) -> Iterator[Task]:
+        """Yield the indexed, not-DONE dependencies of ``task``."""
+        entry = self._entries.get(task.id)
+        if entry is not None and entry.task is task and not self._unmet[task.id]:
+            return
+        for dep_id in task.dependencies or ():
+            dep = self._entries.get(dep_id)
+            if dep is not None and dep.incomplete:
+                yield dep.task
+
+    def pattern_blockers(self, task: Task) -> Iterator[Tuple[int, Task]]:
+        """
+        Yield ``(pattern_index, task)`` for every incomplete pattern blocker.
+
+        Unlike :meth:`logical_blocker` this includes ``task`` itself when it
+        matches both sides of a pattern, as blocking analysis reports it.
+        """
+        for index in self.features(task).blocked_by:
+            for blocker_id in self._incomplete_blockers[index]:
+                yield index, self._entries[blocker_id].task
+
+    def logical_blocker(self, task: Task) -> Optional[Task]:
+        """Return an incomplete task blocking ``task`` by a logical pattern."""
+        for index in self.features(task).blocked_by:
+            for blocker_id in self._incomplete_blockers[index]:
+                if blocker_id != task.id:
+                    return self._entries[blocker_id].task
+        return None
+
+    def deployment_blocker(self, task: Task) -> Optional[Task]:
+        """Return incomplete implementation work blocking a deploy task."""
+        if not self.features(task).is_deploy:
+            return None
+        for blocker_id in self._incomplete_deploy_blockers:
+            if blocker_id != task.id:
+                return self._entries[blocker_id].task
+        return None
+
+    def test_blocker(self, task: Task) -> Optional[Task]:
+        """Return incomplete related implementation work blocking a test task."""
+        features = self.features(task)
+        if not features.is_test:
+            return None
+        seen: Set[str] = set()
+        for word in features.words:
+            for blocker_id in self._incomplete_test_blockers.get(word, ()):
+                if blocker_id in seen:
+                    continue
+                seen.add(blocker_id)
+                blocker = self._entries[blocker_id]
+                if words_related(features.words, blocker.features.words):
+                    return blocker.task
+        return None
+
+    def dependent_count(self, task_id: str) -> int:
+        """Return how many indexed tasks declare ``task_id`` as a dependency."""
+        return len(self._dependents.get(task_id, ()))
+
+    def describe(self) -> Dict[str, Any]:
+        """Return index sizes, for logging and diagnostics."""
+        return {
+            "tasks": len(self._entries),
+            "ready": len(self._ready),
+            "dependency_edges": sum(len(d) for d in self._dependents.values()),
+        }
@@ -0,0 +1,158 @@
+"""
+Checkpoint file for resumable batch enrichment.
+
+Enriching an imported board of hundreds of cards can be interrupted part
+way through (a crash, a deploy, a provider outage). The checkpoint records
+each finished task's enrichments, keyed by task ID together with a
+fingerprint of the task fields enrichment reads, so a rerun skips tasks
+that were already enriched and have not changed since.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from src.core.models import Task
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_VERSION = 1
+
+
+def task_fingerprint(task: Task) -> str:
+    """
+    Return a digest of the task fields that enrichment depends on.
+
+    Parameters
+    ----------
+    task : Task
+        Task about to be enriched.
+
+    Returns
+    -------
+    str
+        Hex digest; changes whenever the task's enrichment inputs change.
+    """
+    payload = json.dumps(
+        [
+            task.name,
+            task.description or "",
+            sorted(task.labels),
+            task.estimated_hours,
+            list(task.dependencies),
+            task.priority.value if task.priority else None,
+        ],
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class EnrichmentCheckpoint:
+    """
+    JSON checkpoint of completed enrichments.
+
+    Each record is ``{"fingerprint": str, "enrichments": dict,
+    "written": bool}``; ``written`` tells a resumed run whether the
+    enrichment still has to be sent to the kanban board.
+
+    Parameters
+    ----------
+    path : Union[str, Path]
+        File to read and write. Writes are atomic (temp file + rename), so
+        an interruption never leaves a truncated checkpoint behind.
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        self.path = Path(path)
+        self.records: Dict[str, Dict[str, Any]] = {}
+
+    def load(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Read the checkpoint, starting empty if it is missing or unreadable.
+
+        Returns
+        -------
+        Dict[str, Dict[str, Any]]
+            Records by task ID.
+        """
+        try:
+            document = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return self.records
+        except (OSError, ValueError) as e:
+            logger.warning(
+                f"Ignoring unreadable enrichment checkpoint {self.path}: {e}"
+            )
+            return self.records
+        if document.get("version") == CHECKPOINT_VERSION:
+            self.records = dict(document.get("tasks", {}))
+        return self.records
+
+    def restore(self, task: Task) -> Optional[Dict[str, Any]]:
+        """
+        Return the record for ``task`` if it is still current.
+
+        Records whose enrichments were already written are returned even
+        though the write changed the task's fingerprint.
+
+        Parameters
+        ----------
+        task : Task
+            Task about to be enriched.
+
+        Returns
+        -------
+        Optional[Dict[str, Any]]
+            The checkpoint record, or None when the task is new or changed.
+        """
+        record = self.records.get(task.id)
+        if record and (
+            record.get("written") or record.get("fingerprint") == task_fingerprint(task)
+        ):
+            return record
+        return None
+
+    def record(
+        self, task: Task, enrichments: Dict[str, Any], written: bool = False
+    ) -> None:
+        """Store the enrichments for ``task`` (in memory until ``save``)."""
+        self.records[task.id] = {
+            "fingerprint": task_fingerprint(task),
+            "enrichments": enrichments,
+            "written": written,
+        }
+
+    def mark_written(self, task_id: str) -> None:
+        """Note that the enrichments for ``task_id`` reached the board."""
+        if task_id in self.records:
+            self.records[task_id]["written"] = True
+
+    def save(self) -> None:
+        """Atomically write all records to ``path``."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        document = {"version": CHECKPOINT_VERSION, "tasks": self.records}
+        fd, tmp_path = tempfile.mkstemp(
+            prefix=f".{self.path.name}.", dir=str(self.path.parent)
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(document, f, default=str)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def clear(self) -> None:
+        """Delete the checkpoint file once a run has fully succeeded."""
+        self.records = {}
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
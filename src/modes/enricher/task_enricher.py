@@ -1,14 +1,22 @@
 """Task Enricher for Marcus Phase 2.
 
 Enriches existing tasks with metadata and structure to organize chaotic boards.
+Batch enrichment (:meth:`TaskEnricher.enrich_board`) runs tasks concurrently
+under the shared LLM concurrency limiter, checkpoints finished tasks so an
+interrupted run resumes, and coalesces the resulting kanban writes.
 """
 
+import asyncio
 import logging
 import re
-from dataclasses import dataclass
-from typing import Any, Dict, List
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
 
+from src.core.adaptive_concurrency import LLM_LIMITER, get_concurrency_limiter
 from src.core.models import Task
+from src.integrations.kanban_interface import KanbanInterface, fan_out_update_tasks
+from src.modes.enricher.enrichment_checkpoint import EnrichmentCheckpoint
 
 logger = logging.getLogger(__name__)
 
@@ -106,6 +114,59 @@ class EnrichedTask:
     enrichment_reasoning: str
 
 
+@dataclass
+class BatchContext:
+    """
+    Board-level context computed once and shared by every task in a batch.
+
+    Attributes
+    ----------
+    board_context : BoardContext
+        Context about the board.
+    task_types : Dict[str, str]
+        Classification of every task in the batch, by task ID.
+    task_summaries : List[Dict[str, str]]
+        ``id``, ``name`` and ``type`` of every task, for prompts that need
+        to see the rest of the board.
+    """
+
+    board_context: BoardContext
+    task_types: Dict[str, str]
+    task_summaries: List[Dict[str, str]]
+
+
+@dataclass
+class BatchEnrichmentResult:
+    """
+    Outcome of a batch enrichment run.
+
+    Attributes
+    ----------
+    enriched_tasks : List[EnrichedTask]
+        Enriched tasks, in input order.
+    restored : int
+        Tasks taken from the checkpoint instead of being enriched again.
+    failed : Dict[str, str]
+        Task ID -> analyzer error, for tasks that kept only the rule-based
+        enrichments. They are not checkpointed, so a rerun retries them.
+    written : int
+        Tasks whose enrichments were written to the kanban board.
+    write_errors : Dict[str, str]
+        Task ID -> error for kanban writes that failed.
+    """
+
+    enriched_tasks: List[EnrichedTask]
+    restored: int = 0
+    failed: Dict[str, str] = field(default_factory=dict)
+    written: int = 0
+    write_errors: Dict[str, str] = field(default_factory=dict)
+
+
+# Per-task analysis hook for batch enrichment, typically an LLM call.
+# Returns enrichment fields that override the rule-based ones.
+TaskAnalyzer = Callable[[Task, BatchContext], Awaitable[Dict[str, Any]]]
+
+
 class TaskEnricher:
     """
     Enriches existing tasks with metadata and structure.
@@ -319,10 +380,31 @@ class TaskEnricher:
         Dict[str, Any]
             Dictionary with enrichment suggestions.
         """
-        enrichments: Dict[str, Any] = {}
+        return await self._build_enrichments(
+            task, self._classify_task_type(task), board_context
+        )
 
-        # Classify task type
-        task_type = self._classify_task_type(task)
+    async def _build_enrichments(
+        self, task: Task, task_type: str, board_context: BoardContext
+    ) -> Dict[str, Any]:
+        """
+        Generate rule-based enrichments for an already classified task.
+
+        Parameters
+        ----------
+        task : Task
+            Task to enrich.
+        task_type : str
+            Classification from ``_classify_task_type``.
+        board_context : BoardContext
+            Context about the board.
+
+        Returns
+        -------
+        Dict[str, Any]
+            Dictionary with enrichment suggestions.
+        """
+        enrichments: Dict[str, Any] = {}
 
         # Generate description if missing
         if not task.description or len(task.description) < 20:
@@ -375,33 +457,215 @@ class TaskEnricher:
         List[EnrichedTask]
             List of enriched tasks.
         """
-        enriched_tasks = []
-
-        # First pass: classify all tasks to understand relationships
-        task_classifications = {}
-        for task in tasks:
-            task_classifications[task.id] = self._classify_task_type(task)
-
-        # Second pass: enrich each task
-        for task in tasks:
-            enrichments = await self.generate_enrichments(task, board_context)
-
-            enriched_task = EnrichedTask(
-                original_task=task,
-                enriched_description=enrichments.get("description", task.description),
-                suggested_labels=enrichments.get("labels", task.labels),
-                estimated_hours=enrichments.get(
-                    "estimated_hours", task.estimated_hours
-                ),
-                suggested_dependencies=enrichments.get("dependencies", []),
-                acceptance_criteria=enrichments.get("acceptance_criteria", []),
-                confidence_score=enrichments.get("confidence", 0.5),
-                enrichment_reasoning=enrichments.get("reasoning", ""),
-            )
+        result = await self.enrich_board(tasks, board_context)
+        return result.enriched_tasks
+
+    async def enrich_board(
+        self,
+        tasks: List[Task],
+        board_context: BoardContext,
+        analyzer: Optional[TaskAnalyzer] = None,
+        kanban_client: Optional[Any] = None,
+        checkpoint_path: Optional[Union[str, Path]] = None,
+        max_concurrency: int = 16,
+        checkpoint_every: int = 25,
+        write_batch_size: int = 50,
+    ) -> BatchEnrichmentResult:
+        """Enrich a whole board concurrently, resumably and with batched writes.
+
+        Tasks are classified once up front and share one
+        :class:`BatchContext`. Up to ``max_concurrency`` tasks are enriched
+        at a time; ``analyzer`` calls additionally go through the shared
+        ``"llm"`` concurrency limiter, which backs off when the provider
+        rate-limits. Finished tasks are checkpointed every
+        ``checkpoint_every`` completions, and their kanban updates are sent
+        ``write_batch_size`` at a time.
 
-            enriched_tasks.append(enriched_task)
+        Parameters
+        ----------
+        tasks : List[Task]
+            Tasks to enrich.
+        board_context : BoardContext
+            Context about the board.
+        analyzer : Optional[TaskAnalyzer]
+            Per-task analysis (e.g. an LLM call) merged over the rule-based
+            enrichments. A failing analyzer leaves the rule-based result.
+        kanban_client : Optional[Any]
+            When given, enrichments that change a task's description, labels
+            or estimate are written back through ``update_tasks_bulk`` (or
+            bounded ``update_task`` calls for clients without it).
+        checkpoint_path : Optional[Union[str, Path]]
+            Checkpoint file. Tasks recorded there are restored rather than
+            enriched again; the file is removed after a fully successful run.
+        max_concurrency : int
+            Maximum tasks being enriched at once.
+        checkpoint_every : int
+            Completed tasks between checkpoint saves.
+        write_batch_size : int
+            Pending kanban updates that trigger a write.
+
+        Returns
+        -------
+        BatchEnrichmentResult
+            Enriched tasks in input order plus restore, failure and write
+            counts.
+        """
+        result = BatchEnrichmentResult(enriched_tasks=[])
+        batch_context = self._build_batch_context(tasks, board_context)
+        checkpoint = EnrichmentCheckpoint(checkpoint_path) if checkpoint_path else None
+        if checkpoint is not None:
+            checkpoint.load()
+
+        enrichments_by_index: List[Dict[str, Any]] = [{} for _ in tasks]
+        pending_writes: List[Tuple[str, Dict[str, Any]]] = []
+        to_enrich: List[int] = []
+        for index, task in enumerate(tasks):
+            record = checkpoint.restore(task) if checkpoint is not None else None
+            if record is None:
+                to_enrich.append(index)
+                continue
+            enrichments_by_index[index] = record["enrichments"]
+            result.restored += 1
+            if kanban_client is not None and not record.get("written"):
+                self._queue_enrichment_write(
+                    task, record["enrichments"], pending_writes
+                )
+
+        limiter = get_concurrency_limiter(LLM_LIMITER)
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        flush_lock = asyncio.Lock()
+        unsaved = 0
+
+        async def _flush(final: bool = False) -> None:
+            nonlocal unsaved
+            async with flush_lock:
+                write_due = kanban_client is not None and (
+                    len(pending_writes) >= write_batch_size
+                    or (final and pending_writes)
+                )
+                if write_due:
+                    batch = pending_writes[:]
+                    pending_writes.clear()
+                    await self._write_enrichments(
+                        kanban_client, batch, checkpoint, result
+                    )
+                if checkpoint is not None and (
+                    final or write_due or unsaved >= checkpoint_every
+                ):
+                    checkpoint.save()
+                    unsaved = 0
+
+        async def _enrich(index: int) -> None:
+            nonlocal unsaved
+            task = tasks[index]
+            async with semaphore:
+                enrichments = await self._build_enrichments(
+                    task, batch_context.task_types[task.id], board_context
+                )
+                if analyzer is not None:
+                    try:
+                        enrichments.update(
+                            await limiter.run(analyzer, task, batch_context)
+                        )
+                    except Exception as e:
+                        logger.warning(f"Failed to enrich task {task.name}: {e}")
+                        result.failed[task.id] = str(e)
+                        enrichments_by_index[index] = enrichments
+                        return
+            enrichments_by_index[index] = enrichments
+            if checkpoint is not None:
+                checkpoint.record(task, enrichments)
+                unsaved += 1
+            if kanban_client is not None:
+                self._queue_enrichment_write(task, enrichments, pending_writes)
+            if len(pending_writes) >= write_batch_size or unsaved >= checkpoint_every:
+                await _flush()
+
+        await asyncio.gather(*(_enrich(index) for index in to_enrich))
+        await _flush(final=True)
+
+        if checkpoint is not None and not (result.failed or result.write_errors):
+            checkpoint.clear()
+
+        result.enriched_tasks = [
+            self._to_enriched_task(task, enrichments)
+            for task, enrichments in zip(tasks, enrichments_by_index)
+        ]
+        logger.info(
+            f"Enriched {len(tasks)} tasks ({result.restored} restored, "
+            f"{len(result.failed)} analyzer failures, {result.written} written)"
+        )
+        return result
 
-        return enriched_tasks
+    def _build_batch_context(
+        self, tasks: List[Task], board_context: BoardContext
+    ) -> BatchContext:
+        """Classify every task once and summarize the board for analyzers."""
+        task_types = {task.id: self._classify_task_type(task) for task in tasks}
+        return BatchContext(
+            board_context=board_context,
+            task_types=task_types,
+            task_summaries=[
+                {"id": task.id, "name": task.name, "type": task_types[task.id]}
+                for task in tasks
+            ],
+        )
+
+    def _to_enriched_task(
+        self, task: Task, enrichments: Dict[str, Any]
+    ) -> EnrichedTask:
+        """Build an ``EnrichedTask`` from an enrichments dictionary."""
+        return EnrichedTask(
+            original_task=task,
+            enriched_description=enrichments.get("description", task.description),
+            suggested_labels=enrichments.get("labels", task.labels),
+            estimated_hours=enrichments.get("estimated_hours", task.estimated_hours),
+            suggested_dependencies=enrichments.get("dependencies", []),
+            acceptance_criteria=enrichments.get("acceptance_criteria", []),
+            confidence_score=enrichments.get("confidence", 0.5),
+            enrichment_reasoning=enrichments.get("reasoning", ""),
+        )
+
+    def _queue_enrichment_write(
+        self,
+        task: Task,
+        enrichments: Dict[str, Any],
+        pending_writes: List[Tuple[str, Dict[str, Any]]],
+    ) -> None:
+        """Queue one merged kanban update for the fields enrichment changed."""
+        updates: Dict[str, Any] = {}
+        description = enrichments.get("description")
+        if description and description != task.description:
+            updates["description"] = description
+        labels = enrichments.get("labels")
+        if labels and set(labels) - set(task.labels):
+            updates["labels"] = labels
+        hours = enrichments.get("estimated_hours")
+        if hours and hours != task.estimated_hours:
+            updates["estimated_hours"] = hours
+        if updates:
+            pending_writes.append((task.id, updates))
+
+    async def _write_enrichments(
+        self,
+        kanban_client: Any,
+        batch: List[Tuple[str, Dict[str, Any]]],
+        checkpoint: Optional[EnrichmentCheckpoint],
+        result: BatchEnrichmentResult,
+    ) -> None:
+        """Send a batch of kanban updates and record each outcome."""
+        if isinstance(kanban_client, KanbanInterface):
+            outcomes = await kanban_client.update_tasks_bulk(batch)
+        else:
+            outcomes = await fan_out_update_tasks(kanban_client.update_task, batch)
+        for (task_id, _), outcome in zip(batch, outcomes):
+            if isinstance(outcome, BaseException):
+                logger.warning(f"Failed to write enrichments for {task_id}: {outcome}")
+                result.write_errors[task_id] = str(outcome)
+                continue
+            result.written += 1
+            if checkpoint is not None:
+                checkpoint.mark_written(task_id)
 
     def _classify_task_type(self, task: Task) -> str:
         """
@@ -7,11 +7,13 @@ to prevent workers from being stuck with reverted tasks.
 
 import asyncio
 import logging
+import time
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from src.core.assignment_persistence import AssignmentPersistence
 from src.core.assignment_reconciliation import AssignmentReconciler
+from src.core.board_snapshot import BoardChange, BoardSnapshot, BoardSnapshotService
 from src.core.models import Task, TaskStatus
 from src.integrations.kanban_interface import KanbanInterface
 
@@ -26,6 +28,7 @@ class AssignmentMonitor:
         persistence: AssignmentPersistence,
         kanban_client: KanbanInterface,
         check_interval: int = 30,  # seconds
+        board_snapshot: Optional[BoardSnapshotService] = None,
     ):
         """
         Initialize the assignment monitor.
@@ -38,13 +41,23 @@ class AssignmentMonitor:
             Kanban board interface
         check_interval : int
             How often to check for reversions (seconds)
+        board_snapshot : Optional[BoardSnapshotService]
+            Shared board snapshot. When given, the monitor subscribes to
+            its change feed and checks only assignments whose tasks
+            changed, instead of polling the board on its own timer.
         """
         self.persistence = persistence
         self.kanban_client = kanban_client
-        self.reconciler = AssignmentReconciler(persistence, kanban_client)
+        self.board_snapshot = board_snapshot
+        self.reconciler = AssignmentReconciler(
+            persistence, kanban_client, board_snapshot=board_snapshot
+        )
         self.check_interval = check_interval
         self._running = False
         self._monitor_task: Optional[asyncio.Task[None]] = None
+        self._unsubscribe: Optional[Callable[[], None]] = None
+        # Assignments (worker -> task) already checked against the snapshot
+        self._checked_assignments: Dict[str, str] = {}
 
         # Track task states to detect changes
         self._last_known_states: Dict[str, TaskStatus] = {}
@@ -59,12 +72,20 @@ class AssignmentMonitor:
             return
 
         self._running = True
+        if self.board_snapshot is not None:
+            self._unsubscribe = self.board_snapshot.subscribe(self._on_board_changes)
+            await self.board_snapshot.start()
+            logger.info("Assignment monitor started (shared board snapshot)")
+            return
         self._monitor_task = asyncio.create_task(self._monitor_loop())
         logger.info(f"Assignment monitor started (interval: {self.check_interval}s)")
 
     async def stop(self) -> None:
         """Stop the assignment monitor."""
         self._running = False
+        if self._unsubscribe is not None:
+            self._unsubscribe()
+            self._unsubscribe = None
         if self._monitor_task:
             self._monitor_task.cancel()
             try:
@@ -103,43 +124,97 @@ class AssignmentMonitor:
                 )
                 all_tasks = await self.kanban_client.get_available_tasks()
 
-            task_map = {task.id: task for task in all_tasks}
-
-            reversions_detected = []
-
-            for worker_id, assignment in list(assignments.items()):
-                task_id = assignment["task_id"]
-
-                # Check if task still exists
-                if task_id not in task_map:
-                    logger.warning(f"Task {task_id} no longer exists in kanban")
-                    await self._handle_missing_task(worker_id, task_id)
-                    continue
+            await self._process_assignments(
+                assignments, {task.id: task for task in all_tasks}
+            )
 
-                task = task_map[task_id]
+        except Exception as e:
+            logger.error(f"Error checking for reversions: {e}")
 
-                # Check for state reversion
-                if await self._detect_reversion(task, worker_id):
-                    reversions_detected.append(
-                        {
-                            "task_id": task_id,
-                            "worker_id": worker_id,
-                            "current_status": task.status,
-                            "assigned_to": task.assigned_to,
-                        }
-                    )
+    async def _on_board_changes(
+        self, changes: List[BoardChange], snapshot: BoardSnapshot
+    ) -> None:
+        """
+        Check assignments affected by the latest snapshot.
 
-                # Update last known state
-                self._last_known_states[task_id] = task.status
+        Only assignments whose task changed, or that were made since the
+        previous check, are compared against the board. Assignments saved
+        after the fetch started are left for the next snapshot, which is
+        the first one that can show their task as assigned.
+        """
+        if not self._running:
+            return
+        changed = {change.task_id for change in changes}
+        assignments = {
+            worker_id: assignment
+            for worker_id, assignment in (
+                await self.persistence.load_assignments()
+            ).items()
+            if not self._assigned_after(assignment, snapshot)
+        }
+        affected = {
+            worker_id: assignment
+            for worker_id, assignment in assignments.items()
+            if assignment["task_id"] in changed
+            or self._checked_assignments.get(worker_id) != assignment["task_id"]
+        }
+        self._checked_assignments = {
+            worker_id: assignment["task_id"]
+            for worker_id, assignment in assignments.items()
+        }
+        await self._process_assignments(affected, snapshot.tasks_by_id)
+
+    @staticmethod
+    def _assigned_after(assignment: Dict[str, Any], snapshot: BoardSnapshot) -> bool:
+        """Whether ``assignment`` was saved after ``snapshot`` was fetched."""
+        assigned_at = assignment.get("assigned_at")
+        if not assigned_at:
+            return False
+        try:
+            saved = datetime.fromisoformat(str(assigned_at))
+        except ValueError:
+            return False
+        if saved.tzinfo is None:
+            saved = saved.replace(tzinfo=timezone.utc)
+        elapsed = (datetime.now(timezone.utc) - saved).total_seconds()
+        return time.monotonic() - elapsed > snapshot.fetched_at
+
+    async def _process_assignments(
+        self, assignments: Dict[str, Dict[str, Any]], task_map: Dict[str, Task]
+    ) -> None:
+        """Detect and handle reversions for ``assignments`` against the board."""
+        reversions_detected = []
+
+        for worker_id, assignment in list(assignments.items()):
+            task_id = assignment["task_id"]
+
+            # Check if task still exists
+            if task_id not in task_map:
+                logger.warning(f"Task {task_id} no longer exists in kanban")
+                await self._handle_missing_task(worker_id, task_id)
+                continue
+
+            task = task_map[task_id]
+
+            # Check for state reversion
+            if await self._detect_reversion(task, worker_id):
+                reversions_detected.append(
+                    {
+                        "task_id": task_id,
+                        "worker_id": worker_id,
+                        "current_status": task.status,
+                        "assigned_to": task.assigned_to,
+                    }
+                )
 
-            # Handle detected reversions
-            if reversions_detected:
-                logger.warning(f"Detected {len(reversions_detected)} task reversions")
-                for reversion in reversions_detected:
-                    await self._handle_reversion(reversion)
+            # Update last known state
+            self._last_known_states[task_id] = task.status
 
-        except Exception as e:
-            logger.error(f"Error checking for reversions: {e}")
+        # Handle detected reversions
+        if reversions_detected:
+            logger.warning(f"Detected {len(reversions_detected)} task reversions")
+            for reversion in reversions_detected:
+                await self._handle_reversion(reversion)
 
     async def _detect_reversion(self, task: Task, worker_id: str) -> bool:
         """
@@ -183,6 +258,24 @@ class AssignmentMonitor:
         task_id = reversion["task_id"]
         worker_id = reversion["worker_id"]
 
+        # The board view may predate the assignment; re-read the task so a
+        # task assigned while it was being fetched is not taken away again
+        try:
+            current = await self.kanban_client.get_task_by_id(task_id)
+        except Exception as e:
+            logger.warning(
+                f"Could not re-check task {task_id} before handling reversion: {e}"
+            )
+            return
+        if current is not None and not await self._detect_reversion(
+            current, worker_id
+        ):
+            logger.info(
+                f"Task {task_id} is still assigned to {worker_id}; "
+                "ignoring stale reversion"
+            )
+            return
+
         # Track reversion count
         self._reversion_count[task_id] = self._reversion_count.get(task_id, 0) + 1
 
@@ -275,7 +368,10 @@ class AssignmentHealthChecker:
 
             # Check kanban state
             try:
-                tasks = await self.kanban_client.get_all_tasks()
+                if self.monitor.board_snapshot is not None:
+                    tasks = (await self.monitor.board_snapshot.get_snapshot()).tasks
+                else:
+                    tasks = await self.kanban_client.get_all_tasks()
             except AttributeError as e:
                 # Fallback: if get_all_tasks is not available, use available tasks only
                 logger.warning(
@@ -63,6 +63,7 @@ from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional
 
 from src.config.settings import Settings
+from src.core.board_snapshot import BoardSnapshotService
 from src.core.models import (
     BlockerReport,
     ProjectRisk,
@@ -147,9 +148,11 @@ class ProjectMonitor:
     ... )
     """
 
-    def __init__(self) -> None:
+    def __init__(self, board_snapshot: Optional[BoardSnapshotService] = None) -> None:
         self.settings = Settings()
         self.kanban_client = KanbanClient()
+        # Shared board snapshot; when set, task reads come from it
+        self.board_snapshot = board_snapshot
         self.ai_engine = AIAnalysisEngine()
 
         # Pattern learning and quality assessment
@@ -426,6 +429,8 @@ class ProjectMonitor:
         the mcp_kanban_card_manager tool to retrieve card data from each
         column, then converts the cards to standardized Task objects.
         """
+        if self.board_snapshot is not None:
+            return (await self.board_snapshot.get_snapshot()).tasks
         # Use the existing get_all_tasks method from KanbanClient
         return await self.kanban_client.get_all_tasks()
 
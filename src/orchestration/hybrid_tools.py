@@ -8,6 +8,7 @@ coordination.
 import logging
 from typing import Any, Dict, List, Optional, cast
 
+from src.core.board_snapshot import get_board_snapshot
 from src.detection.board_analyzer import BoardAnalyzer
 from src.detection.context_detector import ContextDetector, MarcusMode
 from src.modes.creator.template_library import ProjectSize
@@ -24,6 +25,12 @@ class HybridMarcusTools:
         self.board_analyzer = BoardAnalyzer()
         self.context_detector = ContextDetector(self.board_analyzer)
         self.mode_registry = ModeRegistry()
+        self.board_snapshot = get_board_snapshot(kanban_client)
+
+        # Adaptive Mode keeps its readiness index current from board changes
+        adaptive_mode = self.mode_registry.modes.get(MarcusMode.ADAPTIVE)
+        if adaptive_mode is not None:
+            adaptive_mode.attach(self.board_snapshot)
 
     async def switch_mode(
         self, mode: str, reason: Optional[str] = None, user_id: Optional[str] = None
@@ -349,8 +356,9 @@ class HybridMarcusTools:
             return {"success": False, "error": "Adaptive mode is not available"}
 
         try:
-            # Get current tasks
-            all_tasks = await self.kanban_client.get_all_tasks()
+            # Get current tasks; the refresh delivers what changed to the
+            # adaptive mode's readiness index
+            all_tasks = (await self.board_snapshot.refresh()).tasks
             available_tasks = [t for t in all_tasks if t.status.value == "TODO"]
 
             # Get currently assigned tasks
@@ -412,7 +420,7 @@ class HybridMarcusTools:
             return {"success": False, "error": "Adaptive mode is not available"}
 
         try:
-            all_tasks = await self.kanban_client.get_all_tasks()
+            all_tasks = (await self.board_snapshot.refresh()).tasks
             analysis = await adaptive_mode.get_blocking_analysis(all_tasks)
 
             return {"success": True, "analysis": analysis}
@@ -0,0 +1,186 @@
+"""Incremental scanning of (possibly truncated) JSON text.
+
+Why
+---
+When an LLM runs out of output tokens mid-document, the partial text is
+still useful: :func:`src.utils.structured_llm.safe_structured_call` can
+ask the model to continue from the cut point instead of regenerating
+everything. That needs to know *where* the document was cut — inside a
+string, which key or array element, and how many containers are still
+open — and whether the stitched result has closed the document.
+
+:class:`JsonStreamScanner` is a small state machine that consumes text
+in chunks (as it streams, or as continuations arrive) without
+re-scanning earlier input. It tracks structure only; actual parsing is
+left to :mod:`src.utils.json_parser` once the document is complete.
+
+Example
+-------
+>>> scanner = JsonStreamScanner()
+>>> scanner.feed('{"tasks": [{"name": "Build')
+>>> scanner.complete, scanner.path, scanner.location
+(False, '$.tasks[0].name', 'a string value')
+>>> scanner.feed(' API"}]}')
+>>> scanner.complete
+True
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import List, Optional
+
+_CLOSERS = {"{": "}", "[": "]"}
+_WHITESPACE = " \t\r\n"
+
+
+@dataclass
+class _Frame:
+    """One open object or array."""
+
+    opener: str
+    key: Optional[str] = None
+    index: int = 0
+    expect_key: bool = False
+
+
+class JsonStreamScanner:
+    """Track the structure of a JSON document fed in chunks.
+
+    Text before the first ``{`` or ``[`` (markdown fences, preamble) is
+    skipped. Scanning stops at the character that closes the top-level
+    value; anything after it is ignored.
+
+    Attributes
+    ----------
+    offset : int
+        Number of characters consumed so far.
+    start : Optional[int]
+        Offset of the top-level ``{`` or ``[``, once seen.
+    end : Optional[int]
+        Offset just past the closing bracket, once the document is
+        complete.
+    """
+
+    def __init__(self) -> None:
+        self.offset = 0
+        self.start: Optional[int] = None
+        self.end: Optional[int] = None
+        self._stack: List[_Frame] = []
+        self._in_string = False
+        self._escape = False
+        self._string_is_key = False
+        self._key_chars: List[str] = []
+
+    @property
+    def started(self) -> bool:
+        """Whether the top-level value has begun."""
+        return self.start is not None
+
+    @property
+    def complete(self) -> bool:
+        """Whether the top-level value has been closed."""
+        return self.end is not None
+
+    @property
+    def depth(self) -> int:
+        """Number of currently open objects and arrays."""
+        return len(self._stack)
+
+    @property
+    def in_string(self) -> bool:
+        """Whether the text so far ends inside a string."""
+        return self._in_string
+
+    @property
+    def path(self) -> str:
+        """JSONPath-style location of the cut, e.g. ``$.tasks[3].name``."""
+        parts = ["$"]
+        for frame in self._stack:
+            if frame.opener == "[":
+                parts.append(f"[{frame.index}]")
+            elif frame.key is not None:
+                parts.append(f".{frame.key}")
+        return "".join(parts)
+
+    @property
+    def location(self) -> str:
+        """Human-readable description of the incomplete structure."""
+        if not self._stack:
+            return "the document" if self.complete else "before the document"
+        if self._in_string:
+            return "an object key" if self._string_is_key else "a string value"
+        return "an object" if self._stack[-1].opener == "{" else "an array"
+
+    @property
+    def closers(self) -> str:
+        """Characters that would close every open string and container."""
+        suffix = '"' if self._in_string else ""
+        return suffix + "".join(_CLOSERS[f.opener] for f in reversed(self._stack))
+
+    def feed(self, text: str) -> None:
+        """Consume the next chunk of text.
+
+        Parameters
+        ----------
+        text : str
+            Text that directly follows everything fed so far.
+        """
+        for char in text:
+            if self.end is not None:
+                return
+            self.offset += 1
+            if self._in_string:
+                self._feed_string_char(char)
+                continue
+            if char in _WHITESPACE:
+                continue
+            if self.start is None:
+                if char in _CLOSERS:
+                    self.start = self.offset - 1
+                    self._open(char)
+                continue
+            self._feed_structure_char(char)
+
+    def _feed_string_char(self, char: str) -> None:
+        if self._escape:
+            self._escape = False
+        elif char == "\\":
+            self._escape = True
+        elif char == '"':
+            self._in_string = False
+            if self._string_is_key:
+                self._stack[-1].key = "".join(self._key_chars)
+                self._stack[-1].expect_key = False
+            return
+        if self._string_is_key:
+            self._key_chars.append(char)
+
+    def _feed_structure_char(self, char: str) -> None:
+        top = self._stack[-1]
+        if char == '"':
+            self._in_string = True
+            self._string_is_key = top.opener == "{" and top.expect_key
+            self._key_chars = []
+        elif char in _CLOSERS:
+            self._open(char)
+        elif char in "}]":
+            self._stack.pop()
+            if not self._stack:
+                self.end = self.offset
+        elif char == ",":
+            if top.opener == "{":
+                top.expect_key = True
+                top.key = None
+            else:
+                top.index += 1
+
+    def _open(self, opener: str) -> None:
+        self._stack.append(_Frame(opener, expect_key=opener == "{"))
+
+
+def scan_json(text: str) -> JsonStreamScanner:
+    """Return a scanner that has consumed ``text``."""
+    scanner = JsonStreamScanner()
+    scanner.feed(text)
+    return scanner
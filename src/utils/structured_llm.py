@@ -17,6 +17,12 @@ caller gets the same defense:
   that was scattered through the codebase).
 * Detect mid-stream truncation via a closing-brace heuristic on the
   raw text.
+* Continue a truncated document from the cut point instead of paying
+  for the same output tokens again: an incremental scan
+  (:mod:`src.utils.json_stream`) locates the incomplete structure, the
+  model is asked for just the remainder, and the pieces are stitched.
+* Fall back to re-issuing the prompt when continuation fails (no
+  progress, or a stitched document that still does not parse).
 * Auto-retry with doubled budget up to ``MAX_OUTPUT_TOKENS`` (64K —
   Claude Haiku 4.5 ceiling).  Three retries by default so a tight
   initial budget (2048) still escalates all the way to 16384 before
@@ -40,6 +46,7 @@ from typing import Any, Dict, Optional
 # Binding the function at module load (``from json_parser import ...``)
 # would freeze the reference before any patch can take effect.
 from src.utils import json_parser
+from src.utils.json_stream import JsonStreamScanner, scan_json
 
 logger = logging.getLogger(__name__)
 
@@ -57,6 +64,46 @@ MAX_OUTPUT_TOKENS = 65_536
 # projects without needing a retry round-trip.
 DEFAULT_MAX_TOKENS = 16_384
 
+# How much of the partial output a continuation prompt quotes back so
+# the model can pick up exactly where it stopped.
+CONTINUATION_TAIL_CHARS = 2_000
+
+# A shorter overlap between the partial tail and a continuation is
+# treated as coincidence (repetitive text at the seam) rather than the
+# model echoing the quoted tail.
+_MIN_OVERLAP_CHARS = 24
+
+# Rough characters-per-token ratio for the savings report.
+_CHARS_PER_TOKEN = 4
+
+_continuation_stats: Dict[str, int] = {
+    "continuations": 0,
+    "recovered": 0,
+    "fallbacks": 0,
+    "output_tokens_saved": 0,
+    "input_tokens_added": 0,
+}
+
+
+def get_continuation_stats() -> Dict[str, int]:
+    """Return process-wide continuation counters.
+
+    ``continuations`` counts continuation calls, ``recovered`` the
+    truncated documents completed by continuation, and ``fallbacks``
+    the times continuation failed and the prompt was re-issued.
+    ``output_tokens_saved`` is a lower-bound estimate of the output
+    tokens re-issues would have regenerated for recovered documents
+    (the partial output at each cut); ``input_tokens_added``
+    estimates the quoted tails sent in continuation prompts.
+    """
+    return dict(_continuation_stats)
+
+
+def reset_continuation_stats() -> None:
+    """Zero the continuation counters (used by tests)."""
+    for key in _continuation_stats:
+        _continuation_stats[key] = 0
+
 
 class _Ctx:
     """Minimal context passed to LLMAbstraction.analyze with max_tokens."""
@@ -122,6 +169,58 @@ def _deployment_ceiling() -> int:
         return DEFAULT_MAX_TOKENS
 
 
+def _continuation_prompt(
+    prompt: str, partial: str, scanner: JsonStreamScanner
+) -> str:
+    """Build a prompt asking the model to continue ``partial``.
+
+    The original prompt is kept verbatim (so prompt caching still
+    applies) and followed by the tail of the partial output and where
+    in the document it stopped.
+    """
+    tail = partial[-CONTINUATION_TAIL_CHARS:]
+    return (
+        f"{prompt}\n\n"
+        "---\n"
+        "Your previous response was cut off by the output token limit "
+        f"after {len(partial)} characters, inside {scanner.location} "
+        f"at {scanner.path}. It ended with:\n"
+        f"<partial_output_tail>\n{tail}\n</partial_output_tail>\n\n"
+        "Continue the JSON exactly from the cut point. Output ONLY the "
+        "remaining characters, starting with the character that follows "
+        "the last one above. Do not repeat earlier text, do not restart "
+        "the document, and do not add markdown fences or commentary."
+    )
+
+
+def _stitch(partial: str, fragment: str) -> str:
+    """Append a continuation ``fragment`` to ``partial``.
+
+    Handles the ways models deviate from "output only the rest":
+    leading markdown fences or blank lines, repeating the end of the
+    quoted tail, and restarting the whole document.
+    """
+    fragment = fragment.lstrip("\n")
+    if fragment.startswith("```"):
+        fragment = fragment.split("\n", 1)[1] if "\n" in fragment else ""
+    if not fragment:
+        return partial
+
+    # Restarted document: take the new attempt as a whole.
+    partial_start = scan_json(partial).start
+    fragment_start = scan_json(fragment).start
+    if partial_start is not None and fragment_start is not None:
+        head = partial[partial_start : partial_start + 32]
+        if fragment[fragment_start:].startswith(head) and len(head) > 1:
+            return fragment[fragment_start:]
+
+    longest = min(len(partial), len(fragment), CONTINUATION_TAIL_CHARS)
+    for size in range(longest, _MIN_OVERLAP_CHARS - 1, -1):
+        if partial.endswith(fragment[:size]):
+            return partial + fragment[size:]
+    return partial + fragment
+
+
 async def _analyze_as_retry(
     llm: Any, prompt: str, max_tokens: int, operation: str
 ) -> Any:
@@ -168,9 +267,13 @@ async def safe_structured_call(
     operation: str,
     initial_max_tokens: int = DEFAULT_MAX_TOKENS,
     max_retries: int = 3,
+    allow_continuation: bool = True,
 ) -> Dict[str, Any]:
     """Run an LLM call expecting structured JSON, with truncation retry.
 
+    A truncated response is first continued from its cut point; the
+    prompt is re-issued from scratch only when continuation fails.
+
     Parameters
     ----------
     llm : Any
@@ -193,7 +296,12 @@ async def safe_structured_call(
     max_retries : int, default 3
         Additional attempts after the first if the response looks
         truncated. Budget doubles each attempt, capped at the
-        per-deployment ceiling.
+        per-deployment ceiling.  Continuations count as attempts and,
+        unlike re-issues, may run at the ceiling, since they only need
+        room for the rest of the document.
+    allow_continuation : bool, default True
+        Continue truncated output instead of regenerating it.  Pass
+        False to always re-issue with a doubled budget.
 
     Returns
     -------
@@ -224,6 +332,11 @@ async def safe_structured_call(
     max_tokens = min(initial_max_tokens, ceiling)
     raw_text = ""
     last_err: Optional[Exception] = None
+    strategy = "initial"
+    can_continue = allow_continuation
+    # Output characters a re-issue would have regenerated, per
+    # continuation call; credited only if the document is recovered.
+    regenerated_chars = 0
 
     # Telemetry retry counter (Marcus #416, Kaia review 3 fix).
     # Track how many retries actually fire so we can emit ONE
@@ -254,6 +367,20 @@ async def safe_structured_call(
         except Exception:  # noqa: BLE001 - never crash the retry path
             pass
 
+    def _continuation_failed(reason: str) -> None:
+        nonlocal can_continue
+        can_continue = False
+        _continuation_stats["fallbacks"] += 1
+        logger.warning(
+            "structured_llm.continuation_failed",
+            extra={
+                "event": "structured_llm.continuation_failed",
+                "operation": operation,
+                "reason": reason,
+                "raw_chars": len(raw_text),
+            },
+        )
+
     for attempt in range(max_retries + 1):
         # Attempt 0 is the first try; 1..max_retries are retries.
         # Wrap retry attempts in the recorder's retry_attempt() context
@@ -266,14 +393,50 @@ async def safe_structured_call(
                 context=_Ctx(max_tokens),
                 operation=operation,
             )
+            raw_text = str(result) if result is not None else ""
+        elif strategy == "continuation":
+            scanner = scan_json(raw_text)
+            continuation_prompt = _continuation_prompt(prompt, raw_text, scanner)
+            _continuation_stats["continuations"] += 1
+            _continuation_stats["input_tokens_added"] += (
+                len(continuation_prompt) - len(prompt)
+            ) // _CHARS_PER_TOKEN
+            result = await _analyze_as_retry(
+                llm, continuation_prompt, max_tokens, operation
+            )
+            stitched = _stitch(raw_text, str(result) if result is not None else "")
+            stitched_scan = scan_json(stitched)
+            if len(stitched) <= len(raw_text):
+                _continuation_failed("no_progress")
+            elif stitched_scan.complete and not _parses(stitched):
+                # Stitching produced a closed but invalid document;
+                # keep the old partial so the re-issue fallback runs.
+                _continuation_failed("invalid_stitch")
+            else:
+                regenerated_chars += len(raw_text)
+                raw_text = stitched
         else:
             result = await _analyze_as_retry(llm, prompt, max_tokens, operation)
-        raw_text = str(result) if result is not None else ""
+            raw_text = str(result) if result is not None else ""
 
         try:
             parsed = json_parser.parse_ai_json_response(raw_text)
             # Successful parse — if we got here after one or more
             # retries, the retry helper recovered.  Emit final=ok.
+            if strategy == "continuation" and regenerated_chars:
+                saved = regenerated_chars // _CHARS_PER_TOKEN
+                _continuation_stats["recovered"] += 1
+                _continuation_stats["output_tokens_saved"] += saved
+                logger.info(
+                    "structured_llm.continuation_recovered",
+                    extra={
+                        "event": "structured_llm.continuation_recovered",
+                        "operation": operation,
+                        "continuations": retries_fired,
+                        "raw_chars": len(raw_text),
+                        "output_tokens_saved": saved,
+                    },
+                )
             _emit_retry_event("ok")
             return parsed
         except (ValueError, json.JSONDecodeError) as exc:
@@ -281,23 +444,31 @@ async def safe_structured_call(
             if attempt == max_retries or not _looks_truncated(raw_text):
                 _emit_retry_event("fail")
                 raise
+            scan = scan_json(raw_text)
+            continuable = can_continue and scan.started and not scan.complete
             next_budget = min(max_tokens * 2, ceiling)
-            if next_budget == max_tokens:
+            if next_budget == max_tokens and not continuable:
                 # Already at the per-deployment ceiling; doubling won't
                 # help and would just trigger an API rejection.
                 _emit_retry_event("fail")
                 raise
+            if not continuable:
+                # Output re-issued from scratch regenerates everything
+                regenerated_chars = 0
+            strategy = "continuation" if continuable else "reissue"
             logger.warning(
                 "structured_llm.retry",
                 extra={
                     "event": "structured_llm.retry",
                     "operation": operation,
                     "attempt": attempt + 1,
+                    "strategy": strategy,
                     "initial_budget": initial_max_tokens,
                     "attempted_budget": max_tokens,
                     "retry_budget": next_budget,
                     "raw_chars": len(raw_text),
                     "prompt_chars": len(prompt),
+                    "cut_path": scan.path if continuable else None,
                 },
             )
             retries_fired += 1
@@ -307,3 +478,12 @@ async def safe_structured_call(
     _emit_retry_event("fail")
     assert last_err is not None
     raise last_err
+
+
+def _parses(raw: str) -> bool:
+    """Return True if ``raw`` parses as a structured response."""
+    try:
+        json_parser.parse_ai_json_response(raw)
+    except (ValueError, json.JSONDecodeError):
+        return False
+    return True
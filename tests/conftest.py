@@ -13,7 +13,7 @@ resources for all tests in the suite.
 import os
 import sys
 from datetime import datetime, timezone
-from typing import Any, AsyncGenerator, Dict
+from typing import Any, AsyncGenerator, Dict, Generator
 
 import pytest
 
@@ -82,6 +82,21 @@ def _disable_outcome_coverage_by_default(
     monkeypatch.setenv("MARCUS_OUTCOME_COVERAGE", "false")
 
 
+@pytest.fixture(autouse=True)
+def _reset_resilience_registries() -> Generator[None, None, None]:
+    """Give each test fresh circuit breakers, bulkheads and retry budgets.
+
+    They are process-wide per dependency, so without a reset a test that
+    trips the ``ai_provider`` breaker or spends its retry budget would
+    change how later tests' mocked LLM calls are retried.
+    """
+    from src.core.resilience import reset_resilience
+
+    reset_resilience()
+    yield
+    reset_resilience()
+
+
 @pytest.fixture
 async def mcp_session() -> AsyncGenerator[ClientSession, None]:
     """
@@ -0,0 +1,81 @@
+"""
+Performance benchmark for the persistent analysis cache.
+
+``AnalysisAIEngine`` used to cache responses in a per-process dict: every
+restart re-ran identical LLM analyses, and concurrent requests for the
+same analysis each called the LLM. Responses are now cached on disk by
+content hash and identical in-flight requests share one LLM call.
+"""
+
+import asyncio
+import json
+import time
+from typing import Any
+
+import pytest
+
+from src.analysis.ai_engine import AnalysisAIEngine, AnalysisRequest, AnalysisType
+from src.analysis.storage.analysis_cache import AnalysisCache
+
+LLM_LATENCY = 0.05
+TASKS = 20
+DUPLICATES = 5
+
+
+class _SlowLLM:
+    """LLM stand-in with fixed latency."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def analyze(self, prompt: str, context: Any, operation: str) -> str:
+        self.calls += 1
+        await asyncio.sleep(LLM_LATENCY)
+        return json.dumps({"fidelity_score": 0.8, "divergences": []})
+
+
+def _request(i: int) -> AnalysisRequest:
+    return AnalysisRequest(
+        analysis_type=AnalysisType.REQUIREMENT_DIVERGENCE,
+        project_id="proj-1",
+        task_id=f"task-{i}",
+        context_data={"requirement": f"Requirement {i}", "implementation": "..."},
+        prompt_template="Compare {requirement} with {implementation}",
+    )
+
+
+async def _run(engine: AnalysisAIEngine) -> float:
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(engine.analyze(_request(i)) for i in range(TASKS) for _ in range(DUPLICATES))
+    )
+    return time.perf_counter() - start
+
+
+class TestAnalysisCachePerformance:
+    """Benchmark duplicate and post-restart analyses."""
+
+    @pytest.mark.performance
+    @pytest.mark.asyncio
+    async def test_duplicates_and_restart(self, tmp_path):
+        """Concurrent duplicates and restarted runs avoid repeat LLM calls."""
+        llm = _SlowLLM()
+        cold = await _run(AnalysisAIEngine(llm, cache=AnalysisCache(tmp_path)))
+        cold_calls = llm.calls
+
+        restarted = AnalysisAIEngine(llm, cache=AnalysisCache(tmp_path))
+        warm = await _run(restarted)
+        stats = restarted.get_cache_stats()
+
+        requests = TASKS * DUPLICATES
+        print(f"\nAnalysis cache ({requests} requests, {TASKS} distinct):")
+        print(f"  Old behaviour LLM calls per run: {requests}")
+        print(f"  Cold run: {cold_calls} LLM calls, {cold * 1000:.0f}ms")
+        warm_calls = llm.calls - cold_calls
+        print(f"  After restart: {warm_calls} LLM calls, {warm * 1000:.0f}ms")
+        print(f"  Restarted hit rate: {stats['hit_rate']:.0%}")
+
+        assert cold_calls == TASKS
+        assert warm_calls == 0
+        assert stats["disk_hits"] == TASKS
+        assert warm < cold
@@ -0,0 +1,93 @@
+"""
+Performance benchmark for indexed analysis result storage.
+
+``AnalysisResultStore`` used to keep results as JSON blobs in the generic
+``SQLitePersistence`` key/value table, so every project, task or "latest"
+lookup fetched up to 100,000 rows and decoded and filtered each one in
+Python. Results now live in a dedicated table with indexed project, task,
+type and timestamp columns, and lookups are answered in SQL.
+"""
+
+import time
+from datetime import datetime, timedelta, timezone
+from typing import List
+
+import pytest
+
+from src.analysis.storage.analysis_results import AnalysisResult, AnalysisResultStore
+from src.core.persistence import SQLitePersistence
+
+RESULT_COUNT = 200_000
+PROJECTS = 200
+TYPES = ["requirement_divergence", "decision_impact", "failure_diagnosis"]
+
+
+def _results() -> List[AnalysisResult]:
+    base = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    return [
+        AnalysisResult(
+            analysis_id=f"anl_{i}",
+            project_id=f"proj-{i % PROJECTS}",
+            task_id=f"task-{i % 5000}",
+            analysis_type=TYPES[i % len(TYPES)],
+            timestamp=base + timedelta(seconds=i),
+            version="1.0",
+            result={"fidelity_score": (i % 100) / 100, "divergences": []},
+        )
+        for i in range(RESULT_COUNT)
+    ]
+
+
+class TestAnalysisResultStorePerformance:
+    """Benchmark lookups over 200k stored analysis results."""
+
+    @pytest.mark.performance
+    @pytest.mark.asyncio
+    async def test_lookups_over_200k_results(self, tmp_path):
+        """Indexed lookups beat the key/value scan by orders of magnitude."""
+        results = _results()
+        store = AnalysisResultStore(tmp_path)
+        await store.store_results(results)
+
+        legacy = SQLitePersistence(db_path=tmp_path / "legacy.db")
+        await legacy.store_many(
+            "analysis_results", {r.analysis_id: r.to_dict() for r in results}
+        )
+
+        # Old behaviour: fetch rows, decode and filter in Python
+        start = time.perf_counter()
+        rows = await legacy.query("analysis_results", limit=100_000)
+        scanned = [
+            AnalysisResult.from_dict(row)
+            for row in rows
+            if row.get("project_id") == "proj-7" and row.get("task_id") == "task-7"
+        ]
+        scan_duration = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(20):
+            latest = await store.get_latest_result(
+                "proj-7", "task-7", "requirement_divergence"
+            )
+            task_results = await store.get_results_for_task("proj-7", "task-7")
+            page = await store.get_results_for_project("proj-7", limit=50)
+            by_type = await store.get_latest_results_by_type("proj-7", "task-7")
+        indexed_duration = (time.perf_counter() - start) / 20
+
+        print(f"\nAnalysis result lookups over {RESULT_COUNT:,} results:")
+        print(f"  Key/value scan (old behaviour, 100k cap): {scan_duration:.2f}s")
+        print(
+            f"  Indexed latest + task + page + per-type: "
+            f"{indexed_duration * 1000:.1f}ms"
+        )
+        print(f"  Speedup: {scan_duration / indexed_duration:.0f}x")
+
+        assert len(task_results) == RESULT_COUNT // 5000
+        # The old 100k cap silently dropped half of this task's results
+        assert len(scanned) < len(task_results)
+        expected = next(
+            r for r in task_results if r.analysis_type == "requirement_divergence"
+        )
+        assert latest is not None and latest.analysis_id == expected.analysis_id
+        assert len(page) == 50 and set(by_type) <= set(TYPES)
+        assert indexed_duration * 20 < scan_duration
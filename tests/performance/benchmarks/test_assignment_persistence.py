@@ -0,0 +1,70 @@
+"""
+Performance benchmarks for assignment and lease persistence.
+
+``AssignmentPersistence`` used to rewrite the whole ``assignments.json``
+document on every save, so a single lease renewal cost time proportional to
+the number of active agents. The SQLite backend stores one row per
+assignment and turns a renewal into a single-row ``UPDATE``.
+"""
+
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+from src.core.assignment_persistence import AssignmentPersistence
+
+
+async def _renewals_per_second(
+    storage_dir: Path, backend: str, agent_count: int, renewals: int = 200
+) -> float:
+    """Renewal throughput with ``agent_count`` active assignments on disk."""
+    persistence = AssignmentPersistence(storage_dir=storage_dir, backend=backend)
+    for i in range(agent_count):
+        await persistence.save_assignment(
+            f"agent-{i}", f"task-{i}", {"name": f"Task {i}", "priority": "high"}
+        )
+
+    start = time.perf_counter()
+    for n in range(renewals):
+        i = n % agent_count
+        lease = {
+            "lease_expires": datetime.now(timezone.utc).isoformat(),
+            "last_renewed": datetime.now(timezone.utc).isoformat(),
+            "renewal_count": n,
+            "progress_percentage": n % 100,
+            "update_timestamps": [],
+        }
+        await persistence.save_assignment(f"agent-{i}", f"task-{i}", {}, lease=lease)
+    duration = time.perf_counter() - start
+    await persistence.cleanup()
+    return renewals / duration
+
+
+class TestAssignmentPersistencePerformance:
+    """Benchmark JSON document rewrites vs SQLite row updates."""
+
+    @pytest.mark.performance
+    @pytest.mark.asyncio
+    async def test_renewals_per_second(self, tmp_path: Path):
+        """SQLite renewal throughput does not degrade with agent count."""
+        results = {}
+        for agent_count in (10, 100, 1000):
+            results[agent_count] = {
+                backend: await _renewals_per_second(
+                    tmp_path / f"{backend}-{agent_count}", backend, agent_count
+                )
+                for backend in ("json", "sqlite")
+            }
+
+        print("\nlease renewals/sec (active agents: json -> sqlite)")
+        for agent_count, rates in results.items():
+            print(
+                f"  {agent_count:>5}: {rates['json']:>8.0f} -> "
+                f"{rates['sqlite']:>8.0f} "
+                f"({rates['sqlite'] / rates['json']:.1f}x)"
+            )
+
+        assert results[1000]["sqlite"] > results[1000]["json"]
+        assert results[1000]["sqlite"] > results[10]["sqlite"] / 3
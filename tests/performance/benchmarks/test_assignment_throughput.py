@@ -0,0 +1,58 @@
+"""
+End-to-end assignment throughput benchmark.
+
+Runs virtual agents through ``request_next_task`` → ``report_task_progress``
+→ completion against an in-process MarcusServer backed by a SQLite board,
+using the load harness in :mod:`tests.performance.load.assignment_throughput`.
+Larger matrices (10-500 agents, 100-10,000 tasks) are run from the command
+line; this benchmark keeps a small board so it finishes quickly and checks
+that the harness produces comparable, machine-readable results.
+"""
+
+import json
+
+import pytest
+
+from tests.performance.load.assignment_throughput import (
+    LoadScenario,
+    compare_results,
+    format_result,
+    run_scenarios,
+    write_results,
+)
+
+
+class TestAssignmentThroughput:
+    """Benchmark full agent cycles through the MCP tool dispatch path."""
+
+    @pytest.mark.performance
+    @pytest.mark.asyncio
+    async def test_small_board_runs_to_completion(self, tmp_path, monkeypatch):
+        """Three agents drain a 24-task layered board."""
+        monkeypatch.setenv("MARCUS_TELEMETRY", "off")
+        scenario = LoadScenario(
+            agents=3,
+            tasks=24,
+            think_seconds=(0.0, 0.01),
+            layer_width=8,
+            max_duration_seconds=240,
+        )
+
+        (result,) = await run_scenarios([scenario], tmp_path / "runs")
+        print("\n" + format_result(result))
+
+        assert result.completed_cycles == scenario.tasks
+        assert result.tools["request_next_task"]["count"] >= scenario.tasks
+        assert result.tools["report_task_progress"]["count"] == 2 * scenario.tasks
+        assert "find_optimal_task_for_agent" in result.phases
+        assert "kanban.get_all_tasks" in result.phases
+
+        output = tmp_path / "throughput.json"
+        write_results([result], output)
+        document = json.loads(output.read_text())
+        assert document["scenarios"][scenario.name]["completed_cycles"] == 24
+        assert compare_results(document, document) == []
+
+        slower = json.loads(output.read_text())
+        slower["scenarios"][scenario.name]["cycles_per_second"] /= 2
+        assert compare_results(document, slower)
@@ -0,0 +1,108 @@
+"""
+Performance benchmark for batch task enrichment.
+
+``TaskEnricher.enrich_task_batch`` used to enrich an imported board one
+task at a time, so a board of hundreds of cards paid every per-task LLM
+round trip back to back. ``TaskEnricher.enrich_board`` overlaps those calls
+under the shared LLM concurrency limiter, classifies the board once, and
+sends kanban updates in batches. A stub analyzer with a fixed latency
+stands in for the LLM provider.
+"""
+
+import asyncio
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from src.core.adaptive_concurrency import reset_concurrency_limiters
+from src.core.models import Priority, Task, TaskStatus
+from src.modes.enricher.task_enricher import BatchContext, BoardContext, TaskEnricher
+
+STUB_LLM_LATENCY = 0.005
+NAMES = ["Setup ci", "Design schema", "Build api endpoint", "Create ui page", "Test"]
+
+
+def _board(task_count: int) -> List[Task]:
+    now = datetime.now(timezone.utc)
+    return [
+        Task(
+            id=f"t{i}",
+            name=f"{NAMES[i % len(NAMES)]} {i}",
+            description="",
+            status=TaskStatus.TODO,
+            priority=Priority.MEDIUM,
+            assigned_to=None,
+            created_at=now,
+            updated_at=now,
+            due_date=None,
+            estimated_hours=0.0,
+        )
+        for i in range(task_count)
+    ]
+
+
+async def _stub_llm(task: Task, context: BatchContext) -> Dict[str, Any]:
+    await asyncio.sleep(STUB_LLM_LATENCY)
+    return {"confidence": 0.9, "reasoning": f"stub analysis of {task.name}"}
+
+
+class _StubKanban:
+    """Kanban client recording when each update arrives."""
+
+    def __init__(self) -> None:
+        self.update_times: List[float] = []
+
+    async def update_task(
+        self, task_id: str, updates: Dict[str, Any]
+    ) -> Optional[Task]:
+        self.update_times.append(time.perf_counter())
+        return None
+
+
+class TestBatchEnrichmentPerformance:
+    """Benchmark enrichment of a 500-task imported board."""
+
+    @pytest.mark.performance
+    @pytest.mark.asyncio
+    async def test_enrich_500_tasks(self, tmp_path):
+        """Concurrent enrichment beats one-at-a-time by the concurrency factor."""
+        reset_concurrency_limiters()
+        tasks = _board(500)
+        context = BoardContext("web", [], ["api", "ui"], [], "sequential")
+
+        start = time.perf_counter()
+        sequential = await TaskEnricher().enrich_board(
+            tasks, context, analyzer=_stub_llm, max_concurrency=1
+        )
+        sequential_duration = time.perf_counter() - start
+
+        kanban = _StubKanban()
+        start = time.perf_counter()
+        concurrent = await TaskEnricher().enrich_board(
+            tasks,
+            context,
+            analyzer=_stub_llm,
+            kanban_client=kanban,
+            checkpoint_path=tmp_path / "enrichment.json",
+            max_concurrency=16,
+        )
+        concurrent_duration = time.perf_counter() - start
+        reset_concurrency_limiters()
+
+        flushes = 1 + sum(
+            1
+            for before, after in zip(kanban.update_times, kanban.update_times[1:])
+            if after - before > STUB_LLM_LATENCY / 2
+        )
+        print(f"\nBatch enrichment of {len(tasks)} tasks:")
+        print(f"  Sequential (old behaviour): {sequential_duration:.2f}s")
+        print(f"  Concurrent (16 slots): {concurrent_duration:.2f}s")
+        print(f"  Speedup: {sequential_duration / concurrent_duration:.1f}x")
+        print(f"  Kanban updates: {concurrent.written} in ~{flushes} flushes")
+
+        assert len(concurrent.enriched_tasks) == len(sequential.enriched_tasks) == 500
+        assert not concurrent.failed and concurrent.written == 500
+        assert concurrent_duration * 4 < sequential_duration
+        assert not (tmp_path / "enrichment.json").exists()
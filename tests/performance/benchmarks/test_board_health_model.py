@@ -0,0 +1,144 @@
+"""
+Performance benchmarks for board health scoring.
+
+``BoardHealthAnalyzer.analyze_board_health`` re-ran every check over the
+whole board on each call, so a dashboard polling health paid O(board) per
+poll even when nothing had changed. ``BoardHealthModel`` keeps the
+per-check state current from board change events: a poll reads the score
+in constant time, and a refresh where a few tasks changed costs work
+proportional to those tasks.
+"""
+
+import random
+import time
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from src.core.board_health_analyzer import BoardHealthAnalyzer
+from src.core.board_health_model import BoardHealthModel
+from src.core.board_snapshot import diff_tasks
+from src.core.models import Priority, Task, TaskStatus, WorkerStatus
+
+TASKS = 10_000
+POLLS = 10_000
+SKILLS = ["python", "react", "database", "devops", "design", "security"]
+
+
+def _synthetic_board(task_count: int, width: int = 50, seed: int = 5) -> List[Task]:
+    """Layers of ``width`` tasks, each depending on 0-3 tasks above it."""
+    rng = random.Random(seed)  # nosec B311
+    now = datetime.now(timezone.utc)
+    tasks: List[Task] = []
+    previous: List[str] = []
+    while len(tasks) < task_count:
+        layer = []
+        for _ in range(min(width, task_count - len(tasks))):
+            task_id = f"t{len(tasks)}"
+            status = rng.choice(list(TaskStatus))
+            updated = now - timedelta(days=rng.choice([0, 1, 10]))
+            tasks.append(
+                Task(
+                    id=task_id,
+                    name=f"Task {task_id}",
+                    description="",
+                    status=status,
+                    priority=Priority.MEDIUM,
+                    assigned_to=None,
+                    created_at=updated,
+                    updated_at=updated,
+                    due_date=None,
+                    estimated_hours=1.0,
+                    labels=[rng.choice(SKILLS)],
+                    dependencies=rng.sample(
+                        previous, min(len(previous), rng.randint(0, 3))
+                    ),
+                )
+            )
+            layer.append(task_id)
+        previous = layer
+    return tasks
+
+
+def _agents(count: int) -> Dict[str, WorkerStatus]:
+    return {
+        f"agent-{i}": WorkerStatus(
+            worker_id=f"agent-{i}",
+            name=f"agent-{i}",
+            role="Developer",
+            email=None,
+            current_tasks=[],
+            completed_tasks_count=0,
+            capacity=40,
+            skills=[SKILLS[i % 4]],
+            availability={},
+        )
+        for i in range(count)
+    }
+
+
+class TestBoardHealthModelPerformance:
+    """Health polling on a 10,000-task board."""
+
+    @pytest.mark.performance
+    @pytest.mark.asyncio
+    async def test_constant_time_score_on_large_board(self):
+        """Score reads stay flat; small change batches stay cheap."""
+        tasks = _synthetic_board(TASKS)
+        agents = _agents(20)
+        assignments = {f"agent-{i}": f"t{i}" for i in range(10)}
+        client = Mock()
+        client.get_all_tasks = AsyncMock(return_value=tasks)
+        analyzer = BoardHealthAnalyzer(client)
+
+        start = time.perf_counter()
+        expected = await analyzer.analyze_board_health(agents, assignments)
+        full_analysis = time.perf_counter() - start
+
+        model = BoardHealthModel()
+        start = time.perf_counter()
+        model.sync_tasks(tasks)
+        model.sync_agents(agents, assignments)
+        bootstrap = time.perf_counter() - start
+        assert model.health_score == expected.health_score
+
+        start = time.perf_counter()
+        for _ in range(POLLS):
+            score = model.health_score
+        per_poll = (time.perf_counter() - start) / POLLS
+        assert score == expected.health_score
+
+        # A refresh where 20 tasks changed status
+        rng = random.Random(3)  # nosec B311
+        board = {t.id: t for t in tasks}
+        changed = dict(board)
+        for task_id in rng.sample(list(board), 20):
+            changed[task_id] = replace(board[task_id], status=TaskStatus.DONE)
+        changes = diff_tasks(board, changed, version=2)
+        start = time.perf_counter()
+        model.apply_changes(changes)
+        incremental = time.perf_counter() - start
+
+        client.get_all_tasks.return_value = list(changed.values())
+        expected = await analyzer.analyze_board_health(agents, assignments)
+        assert model.health_score == expected.health_score
+
+        start = time.perf_counter()
+        report = model.report()
+        full_report = time.perf_counter() - start
+        assert len(report.issues) == len(expected.issues)
+
+        print(f"\nBoard health on {TASKS} tasks, {len(agents)} agents:")
+        print(f"  Full analysis (old poll):   {full_analysis * 1000:.1f}ms")
+        print(f"  Model bootstrap (once):     {bootstrap * 1000:.1f}ms")
+        print(f"  Score read (new poll):      {per_poll * 1e6:.1f}µs")
+        print(f"  Apply 20 status changes:    {incremental * 1000:.2f}ms")
+        print(f"  Full report from model:     {full_report * 1000:.1f}ms")
+        print(f"  Speedup per poll: {full_analysis / per_poll:.0f}x")
+
+        assert per_poll < 0.001
+        assert per_poll * 100 < full_analysis
+        assert incremental * 10 < full_analysis
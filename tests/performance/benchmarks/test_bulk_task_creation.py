@@ -0,0 +1,92 @@
+"""
+Performance benchmarks for bulk task creation.
+
+Project creation used to write every task to the board with its own
+``create_task`` call (one SQLite transaction plus a re-read) and then
+rewrite the whole ``task_metadata`` JSON file once per task. The bulk path
+inserts the batch in one transaction and persists metadata in one write.
+"""
+
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+
+from src.core.persistence import FilePersistence
+from src.integrations.providers.sqlite_kanban import SQLiteKanban
+
+
+def _tasks_data(count: int) -> List[Dict[str, Any]]:
+    return [
+        {
+            "name": f"Task {i}",
+            "description": f"Implement part {i} of the project",
+            "priority": "medium",
+            "estimated_hours": 2.0,
+            "labels": ["backend", f"feature-{i % 10}"],
+            "original_id": f"task_{i}",
+            "dependencies": [f"task_{i - 1}"] if i else [],
+        }
+        for i in range(count)
+    ]
+
+
+async def _kanban(path: Path) -> SQLiteKanban:
+    kanban = SQLiteKanban(
+        {
+            "db_path": str(path / "board.db"),
+            "project_name": "Benchmark",
+            "attachments_dir": str(path / "attachments"),
+        }
+    )
+    await kanban.connect()
+    return kanban
+
+
+class TestBulkTaskCreationPerformance:
+    """Benchmark per-task vs bulk project creation."""
+
+    @pytest.mark.performance
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("task_count", [50, 200, 500])
+    async def test_per_task_vs_bulk_creation(self, tmp_path: Path, task_count: int):
+        """
+        Bulk creation scales with task count instead of per-task overhead.
+        """
+        tasks_data = _tasks_data(task_count)
+
+        sequential_dir = tmp_path / "sequential"
+        sequential_dir.mkdir()
+        kanban = await _kanban(sequential_dir)
+        metadata = FilePersistence(storage_dir=sequential_dir / "meta")
+        start = time.perf_counter()
+        for task_data in tasks_data:
+            task = await kanban.create_task(task_data)
+            await metadata.store("task_metadata", task.id, {"name": task.name})
+        sequential_duration = time.perf_counter() - start
+        await kanban.disconnect()
+
+        bulk_dir = tmp_path / "bulk"
+        bulk_dir.mkdir()
+        kanban = await _kanban(bulk_dir)
+        metadata = FilePersistence(storage_dir=bulk_dir / "meta")
+        start = time.perf_counter()
+        created = await kanban.create_tasks_bulk(tasks_data)
+        await metadata.store_many(
+            "task_metadata", {task.id: {"name": task.name} for task in created}
+        )
+        bulk_duration = time.perf_counter() - start
+        await kanban.disconnect()
+
+        print(
+            f"\n{task_count} tasks: per-task {sequential_duration:.3f}s "
+            f"({sequential_duration / task_count * 1000:.2f}ms/task), "
+            f"bulk {bulk_duration:.3f}s "
+            f"({bulk_duration / task_count * 1000:.2f}ms/task), "
+            f"speedup {sequential_duration / bulk_duration:.1f}x"
+        )
+
+        assert len(created) == task_count
+        assert created[-1].dependencies == [created[-2].id]
+        assert bulk_duration < sequential_duration
@@ -0,0 +1,79 @@
+"""
+Performance benchmark for the local code index.
+
+``CodeAnalyzer`` used to find endpoints with remote GitHub code searches and
+one file fetch per hit on every query. ``CodeIndex`` parses the worktree
+once, then re-parses only the files ``git diff`` reports as changed, so
+queries are in-memory lookups and a commit touching one file costs one
+parse regardless of repository size.
+"""
+
+import subprocess
+import time
+from pathlib import Path
+
+import pytest
+
+from src.core.code_index import CodeIndex
+
+MODULE_COUNT = 400
+
+
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(["git", *args], cwd=repo, capture_output=True, check=True)
+
+
+def _module(i: int) -> str:
+    return (
+        f"class Item{i}(BaseModel):\n    id: int\n\n\n"
+        f"@router.get('/items{i}')\nasync def list_items{i}():\n    return []\n\n\n"
+        f"@router.post('/items{i}')\nasync def create_item{i}(item: Item{i}):\n"
+        "    return item\n\n\n"
+        + "".join(f"def helper{i}_{j}(x):\n    return x + {j}\n\n\n" for j in range(20))
+    )
+
+
+class TestCodeIndexPerformance:
+    """Benchmark building, updating and querying a 400-module repository."""
+
+    @pytest.mark.performance
+    @pytest.mark.asyncio
+    async def test_incremental_update_and_queries(self, tmp_path):
+        """One-file commits re-parse one file; queries take microseconds."""
+        _git(tmp_path, "init", "-q")
+        _git(tmp_path, "config", "user.email", "bench@example.com")
+        _git(tmp_path, "config", "user.name", "Bench")
+        (tmp_path / "app").mkdir()
+        for i in range(MODULE_COUNT):
+            (tmp_path / "app" / f"module_{i}.py").write_text(_module(i))
+        _git(tmp_path, "add", "-A")
+        _git(tmp_path, "commit", "-q", "-m", "initial")
+
+        index = CodeIndex(tmp_path)
+        start = time.perf_counter()
+        index.update()
+        build_duration = time.perf_counter() - start
+
+        (tmp_path / "app" / "module_0.py").write_text(_module(0) + _module(9999))
+        _git(tmp_path, "commit", "-q", "-am", "extend module 0")
+        start = time.perf_counter()
+        delta = index.update()
+        update_duration = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(100):
+            endpoints = index.endpoints()
+            models = index.models()
+        query_duration = (time.perf_counter() - start) / 100
+
+        print(f"\nCode index over {MODULE_COUNT} modules:")
+        print(f"  Full build: {build_duration * 1000:.0f}ms")
+        print(f"  Incremental update (1 file): {update_duration * 1000:.1f}ms")
+        print(f"  Endpoints + models query: {query_duration * 1000:.2f}ms")
+        print(f"  Endpoints: {len(endpoints)}, models: {len(models)}")
+
+        assert delta.changed_files == ["app/module_0.py"]
+        assert len(endpoints) == 2 * (MODULE_COUNT + 1)
+        assert len(models) == MODULE_COUNT + 1
+        assert update_duration * 5 < build_duration
+        assert query_duration < 0.05
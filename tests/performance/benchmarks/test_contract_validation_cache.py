@@ -0,0 +1,100 @@
+"""
+Performance benchmarks for cross-contract validation.
+
+``check_contract_cross_file_consistency`` used to regex every artifact on
+every call, and it could only compare flat field names. It now parses each
+artifact into a schema once and caches it by content hash, so re-checking
+a project after one contract was regenerated only re-parses that contract.
+"""
+
+import time
+
+import pytest
+
+from src.integrations.contract_schema import ContractSchemaCache
+from src.integrations.contract_validation import (
+    check_contract_cross_file_consistency,
+)
+
+DOMAINS = 30
+ENTITIES_PER_DOMAIN = 8
+RECHECKS = 20
+
+
+def _contract(domain: int, revision: int = 0) -> str:
+    """One domain's contract: its own entities plus a shared ``Widget``."""
+    lines = [
+        "## Widget Entity",
+        "- width (number)",
+        "- position (object)",
+        "  - x (number)",
+        "  - y (number)",
+        f"- label{domain} (string, optional)",
+    ]
+    for entity in range(ENTITIES_PER_DOMAIN):
+        lines.append(f"## Domain{domain}Entity{entity}")
+        lines.extend(
+            f"- field{field} (Optional[List[Domain{domain}Entity{entity}]])"
+            for field in range(10)
+        )
+    lines.append("```typescript")
+    lines.append(f"interface Domain{domain}Event {{")
+    lines.extend(f"  attr{field}: Record<string, number>;" for field in range(20))
+    lines.append(f"  revision{revision}: number;")
+    lines.append("}")
+    lines.append("```")
+    return "\n".join(lines) + "\n"
+
+
+def _artifacts(revisions: dict) -> dict:
+    return {
+        f"Domain {i}": {
+            "artifacts": [
+                {
+                    "filename": f"domain-{i}-interface-contracts.md",
+                    "content": _contract(i, revisions.get(i, 0)),
+                    "artifact_type": "specification",
+                }
+            ],
+            "decisions": [],
+        }
+        for i in range(DOMAINS)
+    }
+
+
+class TestContractValidationPerformance:
+    """Re-validating 30 domain contracts after one is regenerated."""
+
+    @pytest.mark.performance
+    @pytest.mark.asyncio
+    async def test_recheck_after_single_edit(self):
+        """Edits cost one parse instead of re-parsing every contract."""
+        revisions: dict = {}
+
+        start = time.perf_counter()
+        for _ in range(RECHECKS):
+            cold = check_contract_cross_file_consistency(
+                _artifacts(revisions), ContractSchemaCache()
+            )
+        per_cold = (time.perf_counter() - start) / RECHECKS
+        assert cold["pass"] and cold["files_scanned"] == DOMAINS
+
+        cache = ContractSchemaCache()
+        check_contract_cross_file_consistency(_artifacts(revisions), cache)
+        start = time.perf_counter()
+        for revision in range(1, RECHECKS + 1):
+            revisions[7] = revision
+            warm = check_contract_cross_file_consistency(_artifacts(revisions), cache)
+        per_warm = (time.perf_counter() - start) / RECHECKS
+
+        print(f"\nContract validation over {DOMAINS} interface contracts:")
+        print(f"  Full parse per check:       {per_cold * 1000:.2f}ms")
+        print(f"  Re-check after one edit:    {per_warm * 1000:.2f}ms")
+        print(f"  Cache hits / misses:        {cache.hits} / {cache.misses}")
+        print(f"  Speedup: {per_cold / per_warm:.1f}x")
+
+        # Only the edited contract is re-parsed on each re-check
+        assert cache.misses == DOMAINS + RECHECKS
+        assert cache.hits == (DOMAINS - 1) * RECHECKS
+        assert warm["pass"] is True
+        assert per_warm * 2 < per_cold
@@ -0,0 +1,98 @@
+"""
+Performance benchmarks for dependency graph diagnostics.
+
+Boards produced by large PRDs are layered and diamond-heavy: each feature
+fans out into several tasks that join again before the next phase. The
+old per-task DFS in ``find_long_chains``/``_detect_chain_blocks`` explored
+every path through those diamonds; the shared ``DependencyGraph`` engine
+visits each edge once.
+"""
+
+import random
+import time
+from datetime import datetime, timezone
+from typing import List
+from unittest.mock import Mock
+
+import pytest
+
+from src.core.board_health_analyzer import BoardHealthAnalyzer
+from src.core.models import Priority, Task, TaskStatus
+from src.core.task_diagnostics import DependencyChainAnalyzer
+
+
+def _task(task_id: str, dependencies: List[str]) -> Task:
+    now = datetime.now(timezone.utc)
+    return Task(
+        id=task_id,
+        name=f"Task {task_id}",
+        description="",
+        status=TaskStatus.TODO,
+        priority=Priority.MEDIUM,
+        assigned_to=None,
+        created_at=now,
+        updated_at=now,
+        due_date=None,
+        estimated_hours=1.0,
+        dependencies=dependencies,
+    )
+
+
+def _layered_board(task_count: int, width: int = 25, seed: int = 7) -> List[Task]:
+    """Layers of ``width`` tasks, each depending on 2-4 tasks above it."""
+    rng = random.Random(seed)  # nosec B311
+    tasks: List[Task] = []
+    previous: List[str] = []
+    while len(tasks) < task_count:
+        layer = []
+        for _ in range(min(width, task_count - len(tasks))):
+            task_id = f"t{len(tasks)}"
+            deps = rng.sample(previous, min(len(previous), rng.randint(2, 4)))
+            # Occasional redundant edge two layers up
+            if deps and rng.random() < 0.2:
+                grand = tasks[int(deps[0][1:])].dependencies
+                if grand:
+                    deps.append(grand[0])
+            tasks.append(_task(task_id, deps))
+            layer.append(task_id)
+        previous = layer
+    return tasks
+
+
+class TestDependencyGraphAnalyticsPerformance:
+    """Benchmark diagnostics on large layered boards."""
+
+    @pytest.mark.performance
+    @pytest.mark.asyncio
+    async def test_diagnostics_at_5k_tasks(self):
+        """Chain, redundancy and chain-block checks stay linear at 5k tasks."""
+        tasks = _layered_board(5000)
+        edges = sum(len(t.dependencies) for t in tasks)
+
+        start = time.perf_counter()
+        analyzer = DependencyChainAnalyzer(tasks)
+        chains = analyzer.find_long_chains(min_length=4)
+        chains_duration = time.perf_counter() - start
+
+        start = time.perf_counter()
+        redundant = analyzer.find_transitive_dependencies()
+        redundant_duration = time.perf_counter() - start
+
+        start = time.perf_counter()
+        health = BoardHealthAnalyzer(Mock())
+        chain_blocks = await health._detect_chain_blocks(tasks, {})
+        blocks_duration = time.perf_counter() - start
+
+        print(
+            f"\n5000 tasks / {edges} edges:"
+            f"\n  find_long_chains: {len(chains)} chains in {chains_duration:.3f}s"
+            f"\n  find_transitive_dependencies: {len(redundant)} redundant in "
+            f"{redundant_duration:.3f}s"
+            f"\n  _detect_chain_blocks: {len(chain_blocks)} issues in "
+            f"{blocks_duration:.3f}s"
+        )
+
+        assert max(len(c) for c in chains) == 200
+        assert redundant
+        assert chain_blocks[0].details["chain_length"] == 200
+        assert chains_duration + redundant_duration + blocks_duration < 10.0
@@ -0,0 +1,140 @@
+"""
+Load test for admission control across MCP endpoints.
+
+The human, agent and analytics endpoints share one event loop. Before
+admission control, a flood of analytics calls all ran at once and every
+agent's ``request_next_task`` queued behind them on the loop. Endpoint
+apps now admit calls through a shared priority queue: analytics is
+capped, coordination calls go first, and calls beyond the analytics
+queue are shed with a ``retry_after`` response.
+
+The load runs in-process against FastMCP apps, so it measures scheduling
+rather than HTTP overhead.
+"""
+
+import asyncio
+import statistics
+import time
+from typing import Any, Dict, List
+
+import pytest
+from mcp.server.fastmcp import FastMCP
+from mcp.types import CallToolResult
+
+from src.marcus_mcp.admission import (
+    AdmissionConfig,
+    AdmissionControlledFastMCP,
+    AdmissionController,
+    EndpointLimits,
+)
+
+ANALYTICS_CALLS = 200
+AGENT_CALLS = 40
+AGENT_INTERVAL = 0.01
+
+
+def _burn(seconds: float) -> None:
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+def _apps(controller: AdmissionController | None) -> tuple[FastMCP, FastMCP]:
+    def build(endpoint: str) -> FastMCP:
+        if controller is None:
+            return FastMCP(f"marcus-{endpoint}")
+        return AdmissionControlledFastMCP(
+            f"marcus-{endpoint}", endpoint=endpoint, admission=controller
+        )
+
+    agent, analytics = build("agent"), build("analytics")
+
+    @agent.tool()
+    async def request_next_task(agent_id: str) -> Dict[str, Any]:
+        _burn(0.001)
+        await asyncio.sleep(0.002)
+        return {"success": True, "agent_id": agent_id}
+
+    @analytics.tool()
+    async def pipeline_report(flow_id: str) -> Dict[str, Any]:
+        # Ten slices of in-loop work, as a report that scores many events
+        for _ in range(10):
+            _burn(0.001)
+            await asyncio.sleep(0)
+        return {"success": True, "flow_id": flow_id}
+
+    return agent, analytics
+
+
+async def _run_load(controller: AdmissionController | None) -> Dict[str, Any]:
+    agent, analytics = _apps(controller)
+    latencies: List[float] = []
+
+    async def agent_call(i: int) -> None:
+        await asyncio.sleep(i * AGENT_INTERVAL)
+        start = time.perf_counter()
+        await agent.call_tool("request_next_task", {"agent_id": f"agent-{i}"})
+        latencies.append(time.perf_counter() - start)
+
+    flood = [
+        analytics.call_tool("pipeline_report", {"flow_id": f"flow-{i}"})
+        for i in range(ANALYTICS_CALLS)
+    ]
+    results = await asyncio.gather(
+        *flood, *(agent_call(i) for i in range(AGENT_CALLS))
+    )
+    shed = [
+        r.structuredContent
+        for r in results
+        if isinstance(r, CallToolResult) and r.isError
+    ]
+    latencies.sort()
+    return {
+        "p50": statistics.median(latencies),
+        "p95": latencies[int(len(latencies) * 0.95) - 1],
+        "max": latencies[-1],
+        "shed": shed,
+    }
+
+
+class TestEndpointAdmissionLoad:
+    """Agent latency under an analytics flood, with and without admission."""
+
+    @pytest.mark.performance
+    @pytest.mark.asyncio
+    async def test_agent_latency_bounded_under_analytics_flood(self):
+        """Coordination calls stay fast while excess analytics is shed."""
+        baseline = await _run_load(controller=None)
+
+        controller = AdmissionController(
+            AdmissionConfig(
+                endpoints={
+                    "agent": EndpointLimits(32, 256, 30.0),
+                    "analytics": EndpointLimits(4, 16, 10.0),
+                }
+            )
+        )
+        admitted = await _run_load(controller)
+        stats = controller.get_stats()["endpoints"]
+
+        print(
+            f"\n{ANALYTICS_CALLS} analytics calls + {AGENT_CALLS} "
+            f"request_next_task calls on one loop:"
+        )
+        for label, run in (("No admission control", baseline), ("Admission", admitted)):
+            print(
+                f"  {label}: agent p50={run['p50'] * 1000:.1f}ms "
+                f"p95={run['p95'] * 1000:.1f}ms max={run['max'] * 1000:.1f}ms, "
+                f"{len(run['shed'])} analytics calls shed"
+            )
+        print(
+            f"  Analytics admitted: {stats['analytics']['admitted']}, "
+            f"peak concurrency {stats['analytics']['peak_in_flight']}"
+        )
+
+        assert baseline["shed"] == []
+        assert admitted["p95"] * 3 < baseline["p95"]
+        assert stats["analytics"]["peak_in_flight"] <= 4
+        assert len(admitted["shed"]) == stats["analytics"]["rejected"]
+        assert all(s["retry_after"] >= 1.0 for s in admitted["shed"])
+        assert stats["agent"]["rejected"] == 0
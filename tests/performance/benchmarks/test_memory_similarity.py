@@ -0,0 +1,95 @@
+"""
+Performance benchmarks for similar-outcome retrieval in Memory.
+
+``find_similar_outcomes`` runs on every assignment (completion-time and
+blockage predictions). It used to score and sort every recorded outcome;
+the inverted index scores only task-name groups sharing a word with the
+query.
+"""
+
+import random
+import time
+from datetime import datetime, timezone
+from typing import List
+from unittest.mock import Mock
+
+import pytest
+
+from src.core.memory import Memory, TaskOutcome
+from src.core.models import Task
+
+_VERBS = ["Implement", "Test", "Design", "Document", "Deploy", "Refactor"]
+_NOUNS = [f"component{i}" for i in range(400)]
+_AREAS = ["api", "ui", "database", "auth", "billing", "search", "reports"]
+
+
+def _outcomes(count: int, seed: int = 11) -> List[TaskOutcome]:
+    rng = random.Random(seed)  # nosec B311
+    now = datetime.now(timezone.utc)
+    return [
+        TaskOutcome(
+            task_id=f"task_{i}",
+            agent_id=f"agent_{i % 20}",
+            task_name=(
+                f"{rng.choice(_VERBS)} {rng.choice(_NOUNS)} {rng.choice(_AREAS)}"
+            ),
+            estimated_hours=4.0,
+            actual_hours=rng.uniform(1, 8),
+            success=rng.random() > 0.1,
+            completed_at=now,
+        )
+        for i in range(count)
+    ]
+
+
+def _linear_similar(outcomes: List[TaskOutcome], name: str, limit: int) -> list:
+    query = set(name.lower().split())
+    scored = []
+    for outcome in reversed(outcomes):
+        words = set(outcome.task_name.lower().split())
+        scored.append((len(query & words) / len(query | words), outcome))
+    scored.sort(key=lambda x: x[0], reverse=True)
+    return [outcome for _, outcome in scored[:limit]]
+
+
+class TestMemorySimilarityPerformance:
+    """Benchmark linear scan vs inverted index at 100k outcomes."""
+
+    @pytest.mark.performance
+    @pytest.mark.asyncio
+    async def test_find_similar_outcomes_100k(self):
+        """Indexed retrieval returns the same top-k far faster."""
+        memory = Memory(max_outcomes=None)
+        memory.episodic["outcomes"].extend(_outcomes(100_000))
+
+        start = time.perf_counter()
+        memory.get_agent_outcomes("agent_0")  # builds the index
+        build_duration = time.perf_counter() - start
+
+        rng = random.Random(5)  # nosec B311
+        queries = [
+            f"{rng.choice(_VERBS)} {rng.choice(_NOUNS)} {rng.choice(_AREAS)}"
+            for _ in range(20)
+        ]
+
+        start = time.perf_counter()
+        linear = [_linear_similar(memory.episodic["outcomes"], q, 10) for q in queries]
+        linear_duration = (time.perf_counter() - start) / len(queries)
+
+        start = time.perf_counter()
+        indexed = []
+        for query in queries:
+            task = Mock(spec=Task)
+            task.name = query
+            indexed.append(await memory.find_similar_outcomes(task, limit=10))
+        indexed_duration = (time.perf_counter() - start) / len(queries)
+
+        print(
+            f"\n100k outcomes: index build {build_duration:.3f}s, "
+            f"linear scan {linear_duration * 1000:.1f}ms/query, "
+            f"indexed {indexed_duration * 1000:.2f}ms/query, "
+            f"speedup {linear_duration / indexed_duration:.0f}x"
+        )
+
+        assert indexed == linear
+        assert indexed_duration < linear_duration
@@ -0,0 +1,125 @@
+"""
+Performance benchmarks for merging agent branches on task completion.
+
+``report_task_progress`` used to run git checkout/merge with blocking
+``subprocess.run`` calls inside the async handler, so every completion
+stalled the event loop for the duration of its merge and concurrent
+completions raced on the same working tree. The merge queue serializes
+merges per repository in a worker thread; the loop keeps serving other
+agents while merges run.
+"""
+
+import asyncio
+import subprocess
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+
+from src.core.merge_queue import MergeQueue
+
+
+def _git(repo: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", *args], cwd=repo, capture_output=True, text=True, check=True
+    ).stdout
+
+
+def _repo_with_agent_branches(path: Path, agent_count: int) -> List[str]:
+    """One branch per agent, each adding its own file (no conflicts)."""
+    path.mkdir()
+    _git(path, "init", "-q", "-b", "main")
+    _git(path, "config", "user.email", "bench@example.com")
+    _git(path, "config", "user.name", "Bench")
+    (path / "README.md").write_text("benchmark\n")
+    _git(path, "add", ".")
+    _git(path, "commit", "-q", "-m", "initial")
+    agents = [f"agent-{i}" for i in range(agent_count)]
+    for agent_id in agents:
+        _git(path, "checkout", "-q", "-b", f"marcus/{agent_id}", "main")
+        (path / f"{agent_id}.py").write_text(f"AGENT = {agent_id!r}\n")
+        _git(path, "add", ".")
+        _git(path, "commit", "-q", "-m", f"{agent_id} work")
+    _git(path, "checkout", "-q", "main")
+    return agents
+
+
+def _inline_merge(repo: Path, agent_id: str, task_id: str) -> Dict[str, Any]:
+    """The pre-queue merge: blocking git calls on the event loop."""
+    branch = f"marcus/{agent_id}"
+    subprocess.run(["git", "rev-parse", "--git-dir"], cwd=repo, capture_output=True)
+    subprocess.run(["git", "branch", "--list", branch], cwd=repo, capture_output=True)
+    subprocess.run(["git", "checkout", "main"], cwd=repo, capture_output=True)
+    merge = subprocess.run(
+        ["git", "merge", branch, "--no-ff", "-m", f"Merge {branch} ({task_id})"],
+        cwd=repo,
+        capture_output=True,
+    )
+    return {"success": merge.returncode == 0}
+
+
+async def _max_loop_lag(stop: asyncio.Event, interval: float = 0.005) -> float:
+    """Largest delay between scheduled heartbeats while merges run."""
+    worst = 0.0
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        worst = max(worst, time.perf_counter() - start - interval)
+    return worst
+
+
+class TestMergeQueuePerformance:
+    """Benchmark inline vs queued merges under concurrent completions."""
+
+    @pytest.mark.performance
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("agent_count", [10, 40])
+    async def test_inline_vs_queued_merges(self, tmp_path: Path, agent_count: int):
+        """
+        Queued merges keep the event loop responsive and merge every branch.
+        """
+        inline_repo = tmp_path / "inline"
+        agents = _repo_with_agent_branches(inline_repo, agent_count)
+
+        async def inline_completion(agent_id: str) -> Dict[str, Any]:
+            return _inline_merge(inline_repo, agent_id, f"task-{agent_id}")
+
+        stop = asyncio.Event()
+        heartbeat = asyncio.create_task(_max_loop_lag(stop))
+        await asyncio.sleep(0)
+        start = time.perf_counter()
+        inline_results = await asyncio.gather(*map(inline_completion, agents))
+        inline_duration = time.perf_counter() - start
+        stop.set()
+        inline_lag = await heartbeat
+
+        queued_repo = tmp_path / "queued"
+        _repo_with_agent_branches(queued_repo, agent_count)
+        queue = MergeQueue(queued_repo)
+
+        stop = asyncio.Event()
+        heartbeat = asyncio.create_task(_max_loop_lag(stop))
+        await asyncio.sleep(0)
+        start = time.perf_counter()
+        tickets = [queue.submit(agent_id, f"task-{agent_id}") for agent_id in agents]
+        submit_duration = time.perf_counter() - start
+        queued_results = await asyncio.gather(*(t.future for t in tickets))
+        queued_duration = time.perf_counter() - start
+        stop.set()
+        queued_lag = await heartbeat
+
+        merged = _git(queued_repo, "log", "--merges", "--oneline").splitlines()
+        print(
+            f"\n{agent_count} concurrent completions:"
+            f"\n  inline: {inline_duration:.3f}s total, "
+            f"max event loop stall {inline_lag * 1000:.1f}ms"
+            f"\n  queued: {queued_duration:.3f}s total, "
+            f"{submit_duration * 1000:.2f}ms to enqueue all, "
+            f"max event loop stall {queued_lag * 1000:.1f}ms"
+        )
+
+        assert all(r["success"] for r in inline_results)
+        assert all(r.status == "merged" for r in queued_results)
+        assert len(merged) == agent_count
+        assert queued_lag < inline_lag
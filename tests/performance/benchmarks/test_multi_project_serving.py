@@ -0,0 +1,125 @@
+"""
+Performance benchmarks for serving several projects from one Marcus process.
+
+With a single "current project", agents of different projects force
+``switch_project`` plus a full board reload whenever consecutive calls
+target different projects, and every assignment goes through the one
+server-wide assignment lock. Project contexts now hold their own task list
+and assignment lock, so calls are routed by project id without switching.
+"""
+
+import asyncio
+import time
+from typing import Any, Dict, List
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from src.core.project_context_manager import ProjectContextManager
+from src.core.project_registry import ProjectConfig
+
+BOARD_RELOAD_SECONDS = 0.02
+ASSIGNMENT_SECONDS = 0.002
+
+
+def _kanban_client(*_: Any) -> Mock:
+    async def get_all_tasks() -> List[str]:
+        await asyncio.sleep(BOARD_RELOAD_SECONDS)
+        return [f"task-{i}" for i in range(50)]
+
+    return Mock(
+        connect=AsyncMock(), disconnect=AsyncMock(), get_all_tasks=get_all_tasks
+    )
+
+
+def _manager(project_ids: List[str]) -> ProjectContextManager:
+    projects = {
+        pid: ProjectConfig(id=pid, name=pid, provider="sqlite", provider_config={})
+        for pid in project_ids
+    }
+    registry = Mock()
+    registry.get_project = AsyncMock(side_effect=projects.get)
+    registry.set_active_project = AsyncMock()
+    registry.list_projects = AsyncMock(return_value=list(projects.values()))
+    return ProjectContextManager(registry=registry)
+
+
+async def _switching(manager: ProjectContextManager, calls: List[str]) -> Dict:
+    """One current project: switch and reload when the project changes."""
+    lock = asyncio.Lock()
+    state: Dict[str, Any] = {"tasks": [], "reloads": 0}
+
+    async def call(project_id: str) -> None:
+        async with lock:
+            if manager.active_project_id != project_id:
+                await manager.switch_project(project_id)
+                client = await manager.get_kanban_client()
+                state["tasks"] = await client.get_all_tasks()
+                state["reloads"] += 1
+            await asyncio.sleep(ASSIGNMENT_SECONDS)
+
+    await asyncio.gather(*map(call, calls))
+    return state
+
+
+async def _scoped(manager: ProjectContextManager, calls: List[str]) -> Dict:
+    """Per-project contexts: route by project id, no switching."""
+    state = {"reloads": 0}
+
+    async def call(project_id: str) -> None:
+        async with manager.use_project(project_id) as context:
+            async with context.assignment_lock:
+                if not context.project_tasks:
+                    context.project_tasks = await context.kanban_client.get_all_tasks()
+                    state["reloads"] += 1
+                await asyncio.sleep(ASSIGNMENT_SECONDS)
+
+    await asyncio.gather(*map(call, calls))
+    return state
+
+
+class TestMultiProjectServingPerformance:
+    """Benchmark switch-based vs per-project concurrent serving."""
+
+    @pytest.mark.performance
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("project_count", [2, 8])
+    async def test_interleaved_agent_calls(self, tmp_path, monkeypatch, project_count):
+        """Interleaved calls from agents of several projects."""
+        monkeypatch.chdir(tmp_path)
+        project_ids = [f"project-{i}" for i in range(project_count)]
+        calls = [project_ids[i % project_count] for i in range(200)]
+
+        with (
+            patch("src.core.project_context_manager.get_config", return_value=Mock()),
+            patch(
+                "src.core.project_context_manager.Persistence",
+                return_value=Mock(
+                    store=AsyncMock(), retrieve=AsyncMock(return_value=None)
+                ),
+            ),
+            patch(
+                "src.core.project_context_manager.KanbanFactory.create",
+                side_effect=_kanban_client,
+            ),
+        ):
+            start = time.perf_counter()
+            switching = await _switching(_manager(project_ids), calls)
+            switching_duration = time.perf_counter() - start
+
+            start = time.perf_counter()
+            scoped = await _scoped(_manager(project_ids), calls)
+            scoped_duration = time.perf_counter() - start
+
+        print(
+            f"\n{len(calls)} calls across {project_count} projects:"
+            f"\n  switching: {switching_duration:.2f}s "
+            f"({len(calls) / switching_duration:.0f} calls/s), "
+            f"{switching['reloads']} board reloads"
+            f"\n  scoped:    {scoped_duration:.2f}s "
+            f"({len(calls) / scoped_duration:.0f} calls/s), "
+            f"{scoped['reloads']} board reloads"
+        )
+
+        assert scoped["reloads"] == project_count
+        assert scoped_duration < switching_duration
@@ -0,0 +1,175 @@
+"""
+Performance benchmarks for PRD parsing fan-out under provider rate limits.
+
+A fake LLM provider admits a fixed number of concurrent requests and answers
+everything beyond that with a 429, the way Anthropic's per-minute limits
+behave under a burst. The benchmarks compare the old unbounded
+``asyncio.gather`` fan-out with the shared adaptive (AIMD) limiter.
+"""
+
+import asyncio
+import time
+from typing import Any, List
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.ai.advanced.prd.advanced_parser import (
+    AdvancedPRDParser,
+    PRDAnalysis,
+    ProjectConstraints,
+)
+from src.core.adaptive_concurrency import (
+    AdaptiveConcurrencyConfig,
+    AdaptiveConcurrencyLimiter,
+)
+
+
+class RateLimitedProvider:
+    """Fake provider that rejects requests beyond its concurrency capacity."""
+
+    def __init__(self, capacity: int, latency: float = 0.01):
+        self.capacity = capacity
+        self.latency = latency
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.calls = 0
+        self.rejected = 0
+
+    async def analyze(self, prompt: str, context: Any = None, **kwargs: Any) -> str:
+        self.calls += 1
+        if self.in_flight >= self.capacity:
+            self.rejected += 1
+            await asyncio.sleep(0)
+            raise Exception("Claude API error: 429 - rate_limit_error")
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+            return "Generated task description"
+        finally:
+            self.in_flight -= 1
+
+
+def _limiter() -> AdaptiveConcurrencyLimiter:
+    return AdaptiveConcurrencyLimiter(
+        "benchmark-llm",
+        AdaptiveConcurrencyConfig(
+            initial_limit=16,
+            rate_limit_retries=8,
+            retry_base_delay=0.01,
+            decrease_cooldown=0.05,
+        ),
+    )
+
+
+class TestPRDParsingConcurrencyPerformance:
+    """Benchmark fan-out behaviour against a rate-limiting provider."""
+
+    @pytest.mark.performance
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("request_count,capacity", [(100, 10), (500, 20)])
+    async def test_unbounded_gather_vs_adaptive_limiter(
+        self, request_count: int, capacity: int
+    ):
+        """
+        Unbounded gather loses most requests to 429s; AIMD completes them all.
+        """
+        naive_provider = RateLimitedProvider(capacity)
+        start = time.perf_counter()
+        naive_results = await asyncio.gather(
+            *(naive_provider.analyze("prompt") for _ in range(request_count)),
+            return_exceptions=True,
+        )
+        naive_duration = time.perf_counter() - start
+        naive_ok = sum(1 for r in naive_results if not isinstance(r, Exception))
+
+        provider = RateLimitedProvider(capacity)
+        limiter = _limiter()
+        start = time.perf_counter()
+        results = await asyncio.gather(
+            *(limiter.run(provider.analyze, "prompt") for _ in range(request_count)),
+            return_exceptions=True,
+        )
+        adaptive_duration = time.perf_counter() - start
+        adaptive_ok = sum(1 for r in results if not isinstance(r, Exception))
+
+        stats = limiter.get_stats()
+        print(
+            f"\n{request_count} requests, provider capacity {capacity}:"
+            f"\n  unbounded gather: {naive_ok}/{request_count} ok, "
+            f"{naive_provider.rejected} rejected, {naive_duration:.3f}s"
+            f"\n  adaptive limiter: {adaptive_ok}/{request_count} ok, "
+            f"{provider.rejected} rejected, {adaptive_duration:.3f}s, "
+            f"final limit {stats['limit']}, {stats['decreases']} decreases"
+        )
+
+        assert adaptive_ok == request_count
+        assert naive_ok < request_count
+        assert stats["decreases"] > 0
+
+    @pytest.mark.performance
+    @pytest.mark.asyncio
+    async def test_create_detailed_tasks_with_rate_limited_provider(self):
+        """
+        Parser fan-out for a large PRD completes despite a 429-happy provider.
+        """
+        feature_count = 100
+        provider = RateLimitedProvider(capacity=8)
+
+        with patch(
+            "src.ai.advanced.prd.advanced_parser.LLMAbstraction"
+        ) as mock_llm_class, patch(
+            "src.ai.advanced.prd.advanced_parser.HybridDependencyInferer"
+        ):
+            mock_llm_class.return_value = Mock()
+            parser = AdvancedPRDParser()
+        parser.llm_client = provider
+        parser.llm_limiter = _limiter()
+        parser._task_metadata = {}
+
+        requirements: List[dict] = [
+            {
+                "id": f"feature_{i}",
+                "name": f"Feature {i}",
+                "description": f"Capability number {i}",
+            }
+            for i in range(feature_count)
+        ]
+        analysis = PRDAnalysis(
+            functional_requirements=requirements,
+            non_functional_requirements=[],
+            technical_constraints=["Python"],
+            business_objectives=["Ship it"],
+            user_personas=[],
+            success_metrics=["Works"],
+            implementation_approach="agile",
+            complexity_assessment={"level": "medium"},
+            risk_factors=[],
+            confidence=0.9,
+        )
+        constraints = ProjectConstraints(team_size=4, technology_constraints=["Python"])
+        # One epic per feature with implement + test tasks, each needing an
+        # LLM-generated description
+        hierarchy = {
+            f"epic_feature_{i}": [
+                f"task_feature_{i}_implement",
+                f"task_feature_{i}_test",
+            ]
+            for i in range(feature_count)
+        }
+
+        start = time.perf_counter()
+        tasks = await parser._create_detailed_tasks(hierarchy, analysis, constraints)
+        duration = time.perf_counter() - start
+
+        expected = feature_count * 2
+        stats = parser.llm_limiter.get_stats()
+        print(
+            f"\nGenerated {len(tasks)}/{expected} tasks in {duration:.3f}s "
+            f"({provider.calls} provider calls, {provider.rejected} rejected, "
+            f"final limit {stats['limit']})"
+        )
+
+        assert len(tasks) == expected
+        assert provider.peak_in_flight <= provider.capacity
@@ -0,0 +1,85 @@
+"""
+Performance benchmarks for retries against a degraded dependency.
+
+Each ``@with_retry`` caller used to retry on its own schedule and the
+circuit breaker let every caller through once it went half-open, so when
+the LLM provider degraded, 50 agents turned into 50 x ``max_attempts``
+calls against it. With a shared retry budget and a half-open probe limit,
+the load on the provider is bounded by the budget, not the number of
+callers.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from src.core.resilience import (
+    CircuitBreakerConfig,
+    RetryBudgetConfig,
+    RetryConfig,
+    get_retry_budget,
+    with_circuit_breaker,
+    with_retry,
+)
+
+AGENTS = 50
+RETRY = RetryConfig(max_attempts=5, base_delay=0.001, jitter=False)
+
+
+class _Provider:
+    """Dependency that fails every call and counts them."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def analyze(self) -> str:
+        self.calls += 1
+        await asyncio.sleep(0)
+        raise ConnectionError("provider overloaded")
+
+
+async def _herd(call) -> float:
+    start = time.perf_counter()
+    await asyncio.gather(*(call() for _ in range(AGENTS)), return_exceptions=True)
+    return time.perf_counter() - start
+
+
+class TestRetryHerd:
+    """50 agents retrying against a failing provider."""
+
+    @pytest.mark.performance
+    @pytest.mark.asyncio
+    async def test_shared_budget_bounds_provider_load(self):
+        """Provider calls scale with the budget instead of the agent count."""
+        unbounded = _Provider()
+
+        @with_retry(RETRY)
+        async def call_unbounded() -> str:
+            return await unbounded.analyze()
+
+        unbounded_time = await _herd(call_unbounded)
+
+        budgeted = _Provider()
+        get_retry_budget(
+            "herd_llm", RetryBudgetConfig(capacity=10, refill_per_second=1.0)
+        )
+
+        @with_retry(RETRY, dependency="herd_llm")
+        @with_circuit_breaker(
+            "herd_llm",
+            CircuitBreakerConfig(failure_threshold=5, recovery_timeout=30.0),
+        )
+        async def call_budgeted() -> str:
+            return await budgeted.analyze()
+
+        budgeted_time = await _herd(call_budgeted)
+
+        print(f"\nProvider calls from {AGENTS} agents, {RETRY.max_attempts} attempts:")
+        print(f"  Independent retries:      {unbounded.calls} ({unbounded_time:.3f}s)")
+        print(f"  Shared budget + breaker:  {budgeted.calls} ({budgeted_time:.3f}s)")
+
+        assert unbounded.calls == AGENTS * RETRY.max_attempts
+        # First attempts, plus at most the budget's burst of retries
+        assert budgeted.calls <= AGENTS + 10
+        assert budgeted.calls * 4 < unbounded.calls
@@ -0,0 +1,91 @@
+"""
+Performance benchmarks for conversation log scanning in stall snapshots.
+
+A long-lived install accumulates one ``realtime_*.jsonl`` per server start.
+The old loader parsed every line of every file before applying the
+lookback window; the streaming reader skips stale files by mtime and reads
+the current one backwards until it passes the cutoff.
+"""
+
+import json
+import os
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from src.marcus_mcp.tools.project_stall_analyzer import (
+    ConversationEvent,
+    ConversationReplayAnalyzer,
+)
+
+
+def _full_parse(log_dir: Path, lookback_hours: int) -> List[ConversationEvent]:
+    """The pre-streaming loader: parse everything, then filter."""
+    cutoff = datetime.now(timezone.utc) - timedelta(hours=lookback_hours)
+    events = []
+    for log_file in sorted(log_dir.glob("realtime_*.jsonl"), reverse=True):
+        with open(log_file) as f:
+            for line in f:
+                data = json.loads(line)
+                if datetime.fromisoformat(data["timestamp"]) >= cutoff:
+                    events.append(
+                        ConversationEvent(data["timestamp"], data["type"], data)
+                    )
+    return sorted(events, key=lambda e: e.timestamp)
+
+
+def _write_logs(log_dir: Path, file_count: int, events_per_file: int) -> None:
+    """One log per simulated day, an event every ten seconds."""
+    now = datetime.now(timezone.utc)
+    for day in range(file_count):
+        start = now - timedelta(days=file_count - 1 - day, hours=23)
+        log_file = log_dir / f"realtime_{start:%Y%m%d_%H%M%S}.jsonl"
+        with open(log_file, "w") as f:
+            for i in range(events_per_file):
+                ts = start + timedelta(seconds=10 * i)
+                f.write(
+                    json.dumps(
+                        {
+                            "timestamp": ts.isoformat(),
+                            "type": "agent_request_task",
+                            "agent_id": f"agent{i % 5}",
+                        }
+                    )
+                    + "\n"
+                )
+        last_write = min(start + timedelta(seconds=10 * events_per_file), now)
+        os.utime(log_file, (last_write.timestamp(), last_write.timestamp()))
+
+
+class TestStallLogScanningPerformance:
+    """Benchmark full-parse vs streaming log scanning."""
+
+    @pytest.mark.performance
+    @pytest.mark.parametrize("file_count", [10, 60])
+    def test_full_parse_vs_streaming(self, tmp_path: Path, file_count: int):
+        """
+        Streaming cost tracks the window, not the size of the logs directory.
+        """
+        _write_logs(tmp_path, file_count, events_per_file=8000)
+        analyzer = ConversationReplayAnalyzer(tmp_path)
+
+        start = time.perf_counter()
+        legacy = _full_parse(tmp_path, lookback_hours=2)
+        legacy_duration = time.perf_counter() - start
+
+        start = time.perf_counter()
+        window = analyzer.summarize_recent_events(lookback_hours=2)
+        streaming_duration = time.perf_counter() - start
+
+        print(
+            f"\n{file_count} log files x 8000 events, 2h window: "
+            f"full parse {legacy_duration:.3f}s, "
+            f"streaming {streaming_duration:.3f}s "
+            f"({window.event_count} events in window)"
+        )
+
+        assert window.event_count == len(legacy)
+        assert streaming_duration < legacy_duration
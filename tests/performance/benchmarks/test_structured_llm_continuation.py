@@ -0,0 +1,110 @@
+"""
+Performance benchmark for continuation of truncated structured output.
+
+``safe_structured_call`` used to discard a truncated response and re-issue
+the whole prompt with double the token budget, so a large decomposition
+paid for the same output tokens two or three times. Truncated output is
+now continued from the cut point and stitched, and the doubling re-issue
+is only a fallback.
+"""
+
+import json
+import re
+from typing import Any, List
+
+import pytest
+
+from src.utils import structured_llm
+from src.utils.structured_llm import safe_structured_call
+
+CHARS_PER_TOKEN = 4
+
+
+class _ScriptedProvider:
+    """Emits a fixed document within each call's token budget."""
+
+    def __init__(self, document: str) -> None:
+        self.document = document
+        self.output_chars = 0
+        self.input_chars = 0
+        self.budgets: List[int] = []
+
+    async def analyze(self, prompt: str, context: Any, operation: str) -> str:
+        self.budgets.append(context.max_tokens)
+        self.input_chars += len(prompt)
+        match = re.search(r"after (\d+) characters", prompt)
+        start = int(match.group(1)) if match else 0
+        output = self.document[start : start + context.max_tokens * CHARS_PER_TOKEN]
+        self.output_chars += len(output)
+        return output
+
+
+def _decomposition() -> str:
+    return json.dumps(
+        {
+            "tasks": [
+                {
+                    "name": f"Implement contract {i}",
+                    "description": f"Owns interface {i}: " + "detail " * 60,
+                    "dependencies": [f"task-{j}" for j in range(i % 5)],
+                    "acceptance_criteria": [f"criterion {i}.{k}" for k in range(6)],
+                }
+                for i in range(150)
+            ]
+        }
+    )
+
+
+class TestStructuredContinuationPerformance:
+    """Compare output tokens paid with and without continuation."""
+
+    @pytest.mark.performance
+    @pytest.mark.asyncio
+    async def test_tokens_saved_on_large_decomposition(self, monkeypatch):
+        """Continuation generates each output token once."""
+        monkeypatch.setattr(structured_llm, "_deployment_ceiling", lambda: 65_536)
+        document = _decomposition()
+        prompt = "Decompose the PRD into contract-owned tasks. " * 200
+
+        doubling = _ScriptedProvider(document)
+        await safe_structured_call(
+            llm=doubling,
+            prompt=prompt,
+            operation="bench",
+            initial_max_tokens=4096,
+            allow_continuation=False,
+        )
+
+        structured_llm.reset_continuation_stats()
+        continuing = _ScriptedProvider(document)
+        result = await safe_structured_call(
+            llm=continuing,
+            prompt=prompt,
+            operation="bench",
+            initial_max_tokens=4096,
+        )
+        stats = structured_llm.get_continuation_stats()
+
+        doubling_out = doubling.output_chars // CHARS_PER_TOKEN
+        continuing_out = continuing.output_chars // CHARS_PER_TOKEN
+        print(f"\nTruncated decomposition ({len(document):,} chars of JSON):")
+        print(
+            f"  Doubling re-issue (old behaviour): {len(doubling.budgets)} calls, "
+            f"~{doubling_out:,} output tokens"
+        )
+        print(
+            f"  Continuation: {len(continuing.budgets)} calls, "
+            f"~{continuing_out:,} output tokens"
+        )
+        print(
+            f"  Output tokens saved: ~{doubling_out - continuing_out:,} "
+            f"(reported lower bound: {stats['output_tokens_saved']:,}); "
+            f"extra input tokens for quoted tails: ~{stats['input_tokens_added']:,}"
+        )
+
+        assert len(result["tasks"]) == 150
+        assert continuing.output_chars == len(document)
+        assert doubling.output_chars > 2 * continuing.output_chars
+        # The reported figure counts only the partial output each re-issue
+        # would have regenerated, so it never overstates the savings.
+        assert 0 < stats["output_tokens_saved"] <= doubling_out - continuing_out
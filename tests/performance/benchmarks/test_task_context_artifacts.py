@@ -0,0 +1,111 @@
+"""
+Performance benchmarks for dependency artifact collection in task context.
+
+``assemble_task_context`` fetched Kanban attachments for the task, each
+dependency and every transitive ancestor one await at a time, and again on
+every call. On a deep dependency chain those sequential provider
+round-trips dominated context latency. Attachments are now fetched
+concurrently (bounded) and cached per task until its status changes or an
+artifact is logged for it.
+"""
+
+import asyncio
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List
+
+import pytest
+
+from src.core.attachment_cache import AttachmentCache
+from src.core.models import Priority, Task, TaskStatus
+from src.marcus_mcp.tools.context import assemble_task_context
+
+PROVIDER_LATENCY_SECONDS = 0.01
+CHAIN_DEPTH = 50
+
+
+class _SlowKanbanClient:
+    """Kanban client with a fixed round-trip latency per attachment call."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def get_attachments(self, card_id: str) -> Dict[str, Any]:
+        self.calls += 1
+        await asyncio.sleep(PROVIDER_LATENCY_SECONDS)
+        return {
+            "success": True,
+            "data": [{"id": f"att-{card_id}", "name": f"{card_id}.md"}],
+        }
+
+
+class _State:
+    def __init__(self, tasks: List[Task], cache: AttachmentCache) -> None:
+        self.project_tasks = tasks
+        self.task_artifacts: Dict[str, List[Dict[str, Any]]] = {}
+        self.kanban_client = _SlowKanbanClient()
+        self.context = None
+        self.attachment_cache = cache
+
+
+def _chain(depth: int) -> List[Task]:
+    now = datetime.now(timezone.utc)
+    return [
+        Task(
+            id=f"t{i}",
+            name=f"Task {i}",
+            description="",
+            status=TaskStatus.DONE if i < depth - 1 else TaskStatus.TODO,
+            priority=Priority.MEDIUM,
+            assigned_to=None,
+            created_at=now,
+            updated_at=now,
+            due_date=None,
+            estimated_hours=1.0,
+            dependencies=[f"t{i - 1}"] if i else [],
+        )
+        for i in range(depth)
+    ]
+
+
+async def _timed(state: _State, task: Task) -> float:
+    start = time.perf_counter()
+    bundle = await assemble_task_context(task.id, task, state)
+    assert len(bundle["transitive_context"]["artifacts"]) == CHAIN_DEPTH - 2
+    return time.perf_counter() - start
+
+
+class TestTaskContextArtifactPerformance:
+    """Benchmark sequential vs concurrent, cached attachment collection."""
+
+    @pytest.mark.performance
+    @pytest.mark.asyncio
+    async def test_50_deep_chain(self):
+        """Context for the leaf of a 50-deep chain."""
+        tasks = _chain(CHAIN_DEPTH)
+        leaf = tasks[-1]
+
+        # Previous behaviour: one provider call at a time, nothing reused
+        sequential = _State(tasks, AttachmentCache(ttl_seconds=0, max_concurrency=1))
+        sequential_first = await _timed(sequential, leaf)
+        sequential_repeat = await _timed(sequential, leaf)
+
+        cached = _State(tasks, AttachmentCache())
+        concurrent_first = await _timed(cached, leaf)
+        cached_repeat = await _timed(cached, leaf)
+
+        print(
+            f"\n{CHAIN_DEPTH}-deep chain, {PROVIDER_LATENCY_SECONDS * 1000:.0f}ms "
+            f"per attachment call:"
+            f"\n  sequential: first {sequential_first * 1000:.0f}ms, "
+            f"repeat {sequential_repeat * 1000:.0f}ms, "
+            f"{sequential.kanban_client.calls} provider calls"
+            f"\n  concurrent+cached: first {concurrent_first * 1000:.0f}ms, "
+            f"repeat {cached_repeat * 1000:.1f}ms, "
+            f"{cached.kanban_client.calls} provider calls"
+        )
+
+        assert cached.kanban_client.calls == CHAIN_DEPTH
+        assert sequential.kanban_client.calls == 2 * CHAIN_DEPTH
+        assert concurrent_first < sequential_first / 3
+        assert cached_repeat < sequential_repeat / 10
@@ -0,0 +1,167 @@
+"""
+Performance benchmark for redundancy analysis of a 5,000-task project.
+
+``TaskRedundancyAnalyzer.analyze_project`` used to format every task into
+one prompt, which for thousands of tasks exceeds prompt limits and pays
+for every token. A local MinHash/LSH pre-pass now finds clusters of
+similar tasks and only those are sent to the LLM, in concurrent chunks.
+"""
+
+import random
+import re
+import time
+from datetime import datetime, timezone
+from typing import Any
+
+import pytest
+
+from src.analysis.aggregator import TaskHistory
+from src.analysis.ai_engine import AnalysisResponse, AnalysisType
+from src.analysis.analyzers.task_redundancy import TaskRedundancyAnalyzer
+
+TASK_COUNT = 5000
+PLANTED_DUPLICATES = 100
+
+VERBS = ["Implement", "Add", "Create", "Refactor", "Fix", "Document", "Test"]
+SYNONYMS = {"Implement": "Build", "Add": "Introduce", "Create": "Set up"}
+AREAS = ["user", "billing", "search", "report", "auth", "cart", "audit", "export"]
+PARTS = ["api", "service", "page", "worker", "model", "cache", "job"]
+COMPONENTS = [f"{area} {part}" for area in AREAS for part in PARTS]
+FEATURES = [
+    "pagination",
+    "validation",
+    "retry logic",
+    "rate limiting",
+    "caching",
+    "error handling",
+    "logging",
+    "metrics",
+    "permissions",
+    "filtering",
+    "sorting",
+    "bulk import",
+    "webhooks",
+    "localization",
+]
+VOCABULARY = [
+    f"{stem}{i}" for stem in ["field", "table", "route", "flag"] for i in range(150)
+]
+
+
+def _history() -> tuple[list[TaskHistory], set[frozenset[str]]]:
+    rng = random.Random(42)
+    tasks = []
+    for i in range(TASK_COUNT - PLANTED_DUPLICATES):
+        name = (
+            f"{rng.choice(VERBS)} {rng.choice(FEATURES)} "
+            f"for {rng.choice(COMPONENTS)}"
+        )
+        description = " ".join(rng.sample(VOCABULARY, 10))
+        tasks.append((f"task-{i:05d}", name, description))
+
+    planted = set()
+    for n, (original_id, name, description) in enumerate(
+        rng.sample(tasks[: len(tasks) // 2], PLANTED_DUPLICATES)
+    ):
+        verb = name.split()[0]
+        words = description.split()
+        words[rng.randrange(len(words))] = rng.choice(VOCABULARY)
+        copy_id = f"dup-{n:03d}"
+        tasks.append(
+            (
+                copy_id,
+                name.replace(verb, SYNONYMS.get(verb, verb), 1),
+                " ".join(words),
+            )
+        )
+        planted.add(frozenset((original_id, copy_id)))
+
+    histories = [
+        TaskHistory(
+            task_id=task_id,
+            name=name,
+            description=description,
+            status="completed",
+            estimated_hours=2.0,
+            actual_hours=2.0,
+        )
+        for task_id, name, description in tasks
+    ]
+    return histories, planted
+
+
+class _StubEngine:
+    """Engine stand-in that confirms candidate pairs it is shown."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.prompt_chars = 0
+
+    async def analyze(self, request: Any, **kwargs: Any) -> AnalysisResponse:
+        self.calls += 1
+        summaries = request.context_data["task_summaries"]
+        self.prompt_chars += len(summaries)
+        ids = re.findall(r"Task (\S+):", summaries)
+        pairs = [
+            {
+                "task_1_id": a,
+                "task_1_name": a,
+                "task_2_id": b,
+                "task_2_name": b,
+                "overlap_score": 0.9,
+                "evidence": "same deliverable",
+                "time_wasted": 2.0,
+            }
+            for a in ids
+            for b in ids
+            if a < b and b.startswith("dup-") != a.startswith("dup-")
+        ]
+        return AnalysisResponse(
+            analysis_type=AnalysisType.TASK_REDUNDANCY,
+            raw_response="{}",
+            parsed_result={"redundancy_score": 0.5, "redundant_pairs": pairs},
+            confidence=0.9,
+            timestamp=datetime.now(timezone.utc),
+            model_used="stub",
+        )
+
+
+class TestRedundancyPrePassPerformance:
+    """Benchmark the similarity pre-pass on a synthetic 5,000-task history."""
+
+    @pytest.mark.performance
+    @pytest.mark.asyncio
+    async def test_5000_task_history(self):
+        """Candidate clusters replace one prompt holding every task."""
+        tasks, planted = _history()
+        engine = _StubEngine()
+        analyzer = TaskRedundancyAnalyzer(ai_engine=engine)  # type: ignore[arg-type]
+
+        single_prompt_chars = len(analyzer._format_task_summaries(tasks))
+
+        start = time.perf_counter()
+        result = await analyzer.analyze_project(tasks=tasks, conversations=[])
+        duration = time.perf_counter() - start
+
+        found = {
+            frozenset((p.task_1_id, p.task_2_id)) for p in result.redundant_pairs
+        }
+        recall = len(found & planted) / len(planted)
+        candidates = sum(
+            len(c["task_ids"]) for c in result.raw_data["candidate_clusters"]
+        )
+
+        print(f"\nRedundancy analysis of {len(tasks):,} tasks:")
+        print(f"  Single prompt (old behaviour): {single_prompt_chars:,} chars")
+        print(
+            f"  Pre-pass: {candidates} candidate tasks in "
+            f"{len(result.raw_data['candidate_clusters'])} clusters, "
+            f"{engine.calls} LLM calls, {engine.prompt_chars:,} chars"
+        )
+        print(f"  Pre-pass + merge time: {duration * 1000:.0f}ms")
+        print(f"  Planted duplicate recall: {recall:.0%}")
+
+        assert result.raw_data["analysis_mode"] == "candidate_clusters"
+        assert recall >= 0.9
+        assert engine.prompt_chars * 10 < single_prompt_chars
+        assert duration < 10.0
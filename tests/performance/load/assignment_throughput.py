@@ -0,0 +1,761 @@
+"""
+In-process end-to-end assignment throughput harness.
+
+Drives a real :class:`~src.marcus_mcp.server.MarcusServer` through
+``handle_tool_call`` — the same dispatch path the MCP transports use — with
+N virtual agents working a SQLite board seeded by
+:class:`~src.visualization.board_simulator.BoardSimulator`. Each agent
+repeats the Marcus cycle ``request_next_task`` → ``report_task_progress``
+(in progress) → ``report_task_progress`` (completed), pausing for a
+configurable think time between calls, until the board is done or the
+scenario's time limit is reached.
+
+The harness reports completed cycles per second and p50/p95/p99 latency per
+tool and per internal phase (board refresh, task selection and its
+dependency analysis, instruction generation, context assembly, lease
+handling and each kanban provider call). Phase timings are inclusive, so a
+kanban call made during task selection counts towards both.
+
+Results are written as JSON so runs can be compared for regressions::
+
+    python -m tests.performance.load.assignment_throughput \\
+        --agents 10,100,500 --tasks 100,1000,10000 \\
+        --output throughput.json --baseline previous.json
+
+Notes
+-----
+The server runs with AI disabled, so instruction generation uses its
+fallback path; the numbers measure Marcus's own coordination overhead, not
+LLM latency. ``retry_after_seconds`` hints are replaced by the scenario's
+``poll_seconds`` so idle agents re-poll on a benchmark timescale.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import logging
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from functools import wraps
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+# Kanban provider methods timed as ``kanban.<name>`` phases
+KANBAN_PHASES = (
+    "get_all_tasks",
+    "get_available_tasks",
+    "get_task_by_id",
+    "update_task",
+    "update_task_progress",
+    "assign_task",
+    "move_task_to_column",
+    "add_comment",
+    "get_attachments",
+)
+
+# (module, function) pairs timed as phases; patched on the module that
+# calls them so the lookup at call time picks up the wrapper
+MODULE_PHASES = (
+    ("src.marcus_mcp.tools.task", "find_optimal_task_for_agent"),
+    ("src.marcus_mcp.tools.task", "find_optimal_task_for_agent_ai_powered"),
+    ("src.marcus_mcp.tools.task", "calculate_retry_after_seconds"),
+    ("src.marcus_mcp.tools.context", "assemble_task_context"),
+)
+
+# Server attributes timed as phases: (attribute path, phase name)
+SERVER_PHASES = (
+    ("refresh_project_state", "refresh_project_state"),
+    ("ai_engine.generate_task_instructions", "generate_task_instructions"),
+    ("lease_manager.create_lease", "create_lease"),
+    ("lease_manager.renew_lease", "renew_lease"),
+    ("assignment_persistence.save_assignment", "save_assignment"),
+    ("assignment_persistence.remove_assignment", "remove_assignment"),
+)
+
+
+@dataclass
+class LoadScenario:
+    """
+    One load-test configuration.
+
+    Attributes
+    ----------
+    agents : int
+        Number of concurrent virtual agents.
+    tasks : int
+        Number of tasks seeded on the board.
+    think_seconds : tuple
+        ``(min, max)`` pause between an agent's consecutive calls, drawn
+        uniformly per pause.
+    progress_reports : int
+        In-progress reports sent per task before completion.
+    layer_width : int
+        Tasks per dependency layer; tasks depend only on the layer above.
+    dependencies_per_task : int
+        Dependencies each task below the first layer has.
+    poll_seconds : float
+        Pause before an idle agent asks for work again.
+    max_duration_seconds : Optional[float]
+        Stop after this long even if tasks remain; ``None`` waits for the
+        board to complete.
+    seed : int
+        Seed for the dependency layout and think times.
+    """
+
+    agents: int
+    tasks: int
+    think_seconds: tuple = (0.0, 0.0)
+    progress_reports: int = 1
+    layer_width: int = 25
+    dependencies_per_task: int = 2
+    poll_seconds: float = 0.05
+    max_duration_seconds: Optional[float] = 600.0
+    seed: int = 0
+
+    @property
+    def name(self) -> str:
+        """Return a stable identifier used to match runs across results."""
+        return f"{self.agents}-agents-{self.tasks}-tasks"
+
+
+@dataclass
+class ScenarioResult:
+    """
+    Measurements from running one :class:`LoadScenario`.
+
+    Attributes
+    ----------
+    scenario : Dict[str, Any]
+        The scenario's settings.
+    completed_cycles : int
+        Tasks taken from ``request_next_task`` to completion.
+    duration_seconds : float
+        Wall-clock time of the agent phase (seeding excluded).
+    cycles_per_second : float
+        ``completed_cycles / duration_seconds``.
+    calls_per_second : float
+        All timed tool calls divided by ``duration_seconds``.
+    seed_seconds : float
+        Time spent seeding the board.
+    tools : Dict[str, Dict[str, float]]
+        Latency summary per MCP tool.
+    phases : Dict[str, Dict[str, float]]
+        Latency summary per internal phase.
+    idle_polls : int
+        ``request_next_task`` replies that had no work to hand out.
+    errors : Dict[str, int]
+        Failed responses per tool, excluding idle polls.
+    """
+
+    scenario: Dict[str, Any]
+    completed_cycles: int
+    duration_seconds: float
+    cycles_per_second: float
+    calls_per_second: float
+    seed_seconds: float
+    tools: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    phases: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    idle_polls: int = 0
+    errors: Dict[str, int] = field(default_factory=dict)
+
+
+def summarize(samples: Sequence[float]) -> Dict[str, float]:
+    """
+    Summarize latency samples.
+
+    Parameters
+    ----------
+    samples : Sequence[float]
+        Durations in seconds.
+
+    Returns
+    -------
+    Dict[str, float]
+        ``count`` plus mean, p50, p95, p99 and max in milliseconds.
+    """
+    if not samples:
+        return {"count": 0}
+    ordered = sorted(samples)
+
+    def percentile(p: float) -> float:
+        index = min(len(ordered) - 1, int(round(p * (len(ordered) - 1))))
+        return ordered[index] * 1000
+
+    return {
+        "count": len(ordered),
+        "mean_ms": statistics.fmean(ordered) * 1000,
+        "p50_ms": percentile(0.50),
+        "p95_ms": percentile(0.95),
+        "p99_ms": percentile(0.99),
+        "max_ms": ordered[-1] * 1000,
+    }
+
+
+class LatencyRecorder:
+    """Collect named latency samples."""
+
+    def __init__(self) -> None:
+        self.samples: Dict[str, List[float]] = {}
+
+    def record(self, name: str, seconds: float) -> None:
+        """Add one sample for ``name``."""
+        self.samples.setdefault(name, []).append(seconds)
+
+    def wrap(self, name: str, func: Callable[..., Any]) -> Callable[..., Any]:
+        """Return a coroutine function that times each call of ``func``."""
+
+        @wraps(func)
+        async def timed(*args: Any, **kwargs: Any) -> Any:
+            start = time.perf_counter()
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                self.record(name, time.perf_counter() - start)
+
+        return timed
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Summarize every name, sorted by name."""
+        return {name: summarize(self.samples[name]) for name in sorted(self.samples)}
+
+
+def _resolve(root: Any, path: str) -> tuple:
+    """Return ``(owner, attribute)`` for a dotted path, or ``(None, "")``."""
+    *parents, attr = path.split(".")
+    owner = root
+    for part in parents:
+        owner = getattr(owner, part, None)
+        if owner is None:
+            return None, ""
+    return owner, attr
+
+
+@contextlib.contextmanager
+def instrument_phases(server: Any, recorder: LatencyRecorder) -> Iterator[None]:
+    """
+    Time internal phases of the server while the context is open.
+
+    Parameters
+    ----------
+    server : Any
+        The MarcusServer under test; its kanban client, lease manager and
+        similar collaborators must already be set.
+    recorder : LatencyRecorder
+        Receives one sample per phase call.
+    """
+    import importlib
+
+    restore: List[Callable[[], None]] = []
+
+    def patch(owner: Any, attr: str, phase: str) -> None:
+        original = getattr(owner, attr, None)
+        if original is None or not asyncio.iscoroutinefunction(original):
+            return
+        had_own = attr in getattr(owner, "__dict__", {})
+        setattr(owner, attr, recorder.wrap(phase, original))
+        if had_own:
+            restore.append(lambda: setattr(owner, attr, original))
+        else:
+            restore.append(lambda: delattr(owner, attr))
+
+    for module_name, func_name in MODULE_PHASES:
+        patch(importlib.import_module(module_name), func_name, func_name)
+    for path, phase in SERVER_PHASES:
+        owner, attr = _resolve(server, path)
+        if owner is not None:
+            patch(owner, attr, phase)
+    for method in KANBAN_PHASES:
+        patch(server.kanban_client, method, f"kanban.{method}")
+
+    try:
+        yield
+    finally:
+        for undo in reversed(restore):
+            undo()
+
+
+def generate_task_specs(
+    count: int,
+    layer_width: int = 25,
+    dependencies_per_task: int = 2,
+    seed: int = 0,
+) -> List[Dict[str, Any]]:
+    """
+    Build a layered, topologically sorted task DAG for the board simulator.
+
+    Parameters
+    ----------
+    count : int
+        Number of task specs.
+    layer_width : int
+        Tasks per layer. Only the first layer is free of dependencies.
+    dependencies_per_task : int
+        Dependencies each later task has on tasks of the previous layer.
+    seed : int
+        Seed for dependency and priority selection.
+
+    Returns
+    -------
+    List[Dict[str, Any]]
+        Specs in the format :class:`BoardSimulator` accepts.
+    """
+    rng = random.Random(seed)
+    width = max(1, layer_width)
+    priorities = ("urgent", "high", "medium", "medium", "low")
+    specs: List[Dict[str, Any]] = []
+    for index in range(count):
+        layer, _ = divmod(index, width)
+        depends_on: List[str] = []
+        if layer:
+            previous = range((layer - 1) * width, layer * width)
+            picks = rng.sample(previous, min(dependencies_per_task, width))
+            depends_on = [f"task-{i}" for i in sorted(picks)]
+        specs.append(
+            {
+                "key": f"task-{index}",
+                "name": f"Load task {index}",
+                "description": f"Synthetic task {index} in layer {layer}",
+                "priority": rng.choice(priorities),
+                "estimated_hours": 1.0,
+                "labels": ["load-test"],
+                "depends_on": depends_on,
+            }
+        )
+    return specs
+
+
+@contextlib.contextmanager
+def _marcus_config(workdir: Path) -> Iterator[None]:
+    """Point Marcus at a throwaway SQLite config, restoring the old one after."""
+    from src.config import marcus_config
+
+    config_path = workdir / "config_marcus.json"
+    config_path.write_text(
+        json.dumps(
+            {
+                "single_project_mode": True,
+                "ai": {"enabled": False},
+                "kanban": {
+                    "provider": "sqlite",
+                    "sqlite_db_path": str(workdir / "kanban.db"),
+                    "sqlite_attachments_dir": str(workdir / "attachments"),
+                },
+                "features": {
+                    "events": False,
+                    "context": False,
+                    "memory": False,
+                    "visibility": False,
+                },
+            }
+        )
+    )
+    previous_path = os.environ.get("MARCUS_CONFIG")
+    previous_config = marcus_config._config
+    os.environ["MARCUS_CONFIG"] = str(config_path)
+    marcus_config.reload_config()
+    try:
+        yield
+    finally:
+        marcus_config._config = previous_config
+        if previous_path is None:
+            os.environ.pop("MARCUS_CONFIG", None)
+        else:
+            os.environ["MARCUS_CONFIG"] = previous_path
+
+
+class ThroughputHarness:
+    """
+    Run one :class:`LoadScenario` against an in-process Marcus server.
+
+    Parameters
+    ----------
+    scenario : LoadScenario
+        What to run.
+    workdir : Path
+        Directory for the SQLite board, assignment store and config.
+    """
+
+    CLIENT_ID = "load-harness"
+
+    def __init__(self, scenario: LoadScenario, workdir: Path) -> None:
+        self.scenario = scenario
+        self.workdir = Path(workdir)
+        self.tools = LatencyRecorder()
+        self.phases = LatencyRecorder()
+        self.errors: Dict[str, int] = {}
+        self.completed = 0
+        self.idle_polls = 0
+        self._rng = random.Random(scenario.seed)
+        self._done = asyncio.Event()
+        self._server: Any = None
+
+    async def _call(self, tool: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """Invoke a tool through the MCP dispatch path and time it."""
+        from src.marcus_mcp.handlers import handle_tool_call
+
+        start = time.perf_counter()
+        response = await handle_tool_call(tool, arguments, self._server)
+        self.tools.record(tool, time.perf_counter() - start)
+        try:
+            payload = json.loads(response[0].text)
+        except (IndexError, ValueError, AttributeError):
+            payload = {"success": False, "error": "unparseable response"}
+        if not isinstance(payload, dict):
+            payload = {"success": False, "error": "unexpected response"}
+        if "retry_after_seconds" in payload:
+            self.idle_polls += 1
+        elif payload.get("success") is False or "error" in payload:
+            self.errors[tool] = self.errors.get(tool, 0) + 1
+        return payload
+
+    async def _think(self) -> None:
+        low, high = self.scenario.think_seconds
+        if high > 0:
+            await asyncio.sleep(self._rng.uniform(low, high))
+
+    async def _agent(self, agent_id: str) -> None:
+        """Work tasks until the board is done or the run is stopped."""
+        while not self._done.is_set():
+            reply = await self._call("request_next_task", {"agent_id": agent_id})
+            task = reply.get("task") if reply.get("success") else None
+            if not task:
+                await asyncio.sleep(self.scenario.poll_seconds)
+                continue
+
+            reports = self.scenario.progress_reports
+            for report in range(reports):
+                await self._think()
+                progress = int(100 * (report + 1) / (reports + 1))
+                await self._call(
+                    "report_task_progress",
+                    {
+                        "agent_id": agent_id,
+                        "task_id": task["id"],
+                        "status": "in_progress",
+                        "progress": progress,
+                        "message": f"{progress}% done",
+                    },
+                )
+            await self._think()
+            completion = await self._call(
+                "report_task_progress",
+                {
+                    "agent_id": agent_id,
+                    "task_id": task["id"],
+                    "status": "completed",
+                    "progress": 100,
+                    "message": "Task complete",
+                },
+            )
+            if completion.get("success"):
+                self.completed += 1
+                if self.completed >= self.scenario.tasks:
+                    self._done.set()
+
+    async def _start_server(self, kanban: Any) -> Any:
+        from src.core.assignment_persistence import AssignmentPersistence
+        from src.marcus_mcp.server import MarcusServer
+
+        server = MarcusServer()
+        server.kanban_client = kanban
+        server.assignment_persistence = AssignmentPersistence(
+            storage_dir=self.workdir / "assignments"
+        )
+        await server._initialize_monitoring_systems()
+        self._server = server
+        await self._call(
+            "authenticate",
+            {"client_id": self.CLIENT_ID, "client_type": "agent", "role": "agent"},
+        )
+        return server
+
+    async def _stop_server(self, server: Any) -> None:
+        if server.lease_monitor is not None:
+            await server.lease_monitor.stop()
+        if server.assignment_monitor is not None:
+            await server.assignment_monitor.stop()
+        if getattr(server, "realtime_log", None):
+            server.realtime_log.close()
+
+    async def run(self) -> ScenarioResult:
+        """
+        Seed the board, run every agent and collect measurements.
+
+        Returns
+        -------
+        ScenarioResult
+            Throughput and latency summaries for the scenario.
+        """
+        from src.integrations.providers.sqlite_kanban import SQLiteKanban
+        from src.visualization.board_simulator import BoardSimulator
+
+        scenario = self.scenario
+        self.workdir.mkdir(parents=True, exist_ok=True)
+        with _marcus_config(self.workdir):
+            kanban = SQLiteKanban(
+                {
+                    "db_path": str(self.workdir / "kanban.db"),
+                    "attachments_dir": str(self.workdir / "attachments"),
+                }
+            )
+            specs = generate_task_specs(
+                scenario.tasks,
+                scenario.layer_width,
+                scenario.dependencies_per_task,
+                scenario.seed,
+            )
+            seed_start = time.perf_counter()
+            await BoardSimulator(
+                kanban, task_specs=specs, project_name=scenario.name
+            ).seed()
+            seed_seconds = time.perf_counter() - seed_start
+
+            server = await self._start_server(kanban)
+            try:
+                agent_ids = [f"load-agent-{i}" for i in range(scenario.agents)]
+                for agent_id in agent_ids:
+                    await self._call(
+                        "register_agent",
+                        {
+                            "agent_id": agent_id,
+                            "name": agent_id,
+                            "role": "Full Stack Developer",
+                            "skills": ["python"],
+                            "project_id": kanban.project_id,
+                        },
+                    )
+
+                with instrument_phases(server, self.phases):
+                    start = time.perf_counter()
+                    agents = asyncio.gather(*(self._agent(a) for a in agent_ids))
+                    try:
+                        await asyncio.wait_for(
+                            agents, timeout=scenario.max_duration_seconds
+                        )
+                    except asyncio.TimeoutError:
+                        self._done.set()
+                    duration = time.perf_counter() - start
+            finally:
+                await self._stop_server(server)
+
+        timed_calls = sum(
+            len(samples)
+            for tool, samples in self.tools.samples.items()
+            if tool not in ("authenticate", "register_agent")
+        )
+        return ScenarioResult(
+            scenario=asdict(scenario),
+            completed_cycles=self.completed,
+            duration_seconds=duration,
+            cycles_per_second=self.completed / duration if duration else 0.0,
+            calls_per_second=timed_calls / duration if duration else 0.0,
+            seed_seconds=seed_seconds,
+            tools=self.tools.summary(),
+            phases=self.phases.summary(),
+            idle_polls=self.idle_polls,
+            errors=dict(self.errors),
+        )
+
+
+async def run_scenarios(
+    scenarios: Sequence[LoadScenario], workdir: Optional[Path] = None
+) -> List[ScenarioResult]:
+    """
+    Run scenarios one after another, each on a fresh board and server.
+
+    Parameters
+    ----------
+    scenarios : Sequence[LoadScenario]
+        Scenarios to run.
+    workdir : Optional[Path]
+        Parent directory for per-scenario state; a temporary directory is
+        used when omitted.
+
+    Returns
+    -------
+    List[ScenarioResult]
+        One result per scenario, in order.
+    """
+    results = []
+    with tempfile.TemporaryDirectory(prefix="marcus-load-") as tmp:
+        root = Path(workdir) if workdir else Path(tmp)
+        for scenario in scenarios:
+            logger.info(f"Running load scenario {scenario.name}")
+            harness = ThroughputHarness(scenario, root / scenario.name)
+            results.append(await harness.run())
+    return results
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def write_results(results: Sequence[ScenarioResult], path: Path) -> Dict[str, Any]:
+    """
+    Write results as JSON with enough metadata to compare runs.
+
+    Parameters
+    ----------
+    results : Sequence[ScenarioResult]
+        Scenario results.
+    path : Path
+        Output file.
+
+    Returns
+    -------
+    Dict[str, Any]
+        The document written.
+    """
+    document = {
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "git_commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "scenarios": {
+            LoadScenario(**r.scenario).name: asdict(r) for r in results
+        },
+    }
+    Path(path).write_text(json.dumps(document, indent=2, default=list))
+    return document
+
+
+def compare_results(
+    baseline: Dict[str, Any], current: Dict[str, Any], tolerance: float = 0.10
+) -> List[str]:
+    """
+    List regressions between two result documents.
+
+    A scenario regresses when its cycle throughput drops, or its
+    ``request_next_task``/``report_task_progress`` p95 latency rises, by
+    more than ``tolerance``. Scenarios missing from either run are ignored.
+
+    Parameters
+    ----------
+    baseline : Dict[str, Any]
+        Document from :func:`write_results` for the reference run.
+    current : Dict[str, Any]
+        Document for the run being checked.
+    tolerance : float
+        Allowed relative change, e.g. ``0.10`` for 10%.
+
+    Returns
+    -------
+    List[str]
+        Human-readable regression descriptions; empty when none.
+    """
+    regressions = []
+    for name, now in current.get("scenarios", {}).items():
+        before = baseline.get("scenarios", {}).get(name)
+        if not before:
+            continue
+        old, new = before["cycles_per_second"], now["cycles_per_second"]
+        if old and new < old * (1 - tolerance):
+            regressions.append(
+                f"{name}: throughput {old:.1f} -> {new:.1f} cycles/s "
+                f"({(new - old) / old:+.0%})"
+            )
+        for tool in ("request_next_task", "report_task_progress"):
+            old_p95 = before["tools"].get(tool, {}).get("p95_ms")
+            new_p95 = now["tools"].get(tool, {}).get("p95_ms")
+            if old_p95 and new_p95 and new_p95 > old_p95 * (1 + tolerance):
+                regressions.append(
+                    f"{name}: {tool} p95 {old_p95:.1f} -> {new_p95:.1f}ms "
+                    f"({(new_p95 - old_p95) / old_p95:+.0%})"
+                )
+    return regressions
+
+
+def format_result(result: ScenarioResult) -> str:
+    """Render a result as a short text report."""
+    scenario = LoadScenario(**result.scenario)
+    lines = [
+        f"{scenario.name}: {result.completed_cycles} cycles in "
+        f"{result.duration_seconds:.2f}s = {result.cycles_per_second:.1f} "
+        f"cycles/s ({result.calls_per_second:.1f} calls/s), "
+        f"seeded in {result.seed_seconds:.2f}s, {result.idle_polls} idle polls"
+    ]
+    for title, table in (("tool", result.tools), ("phase", result.phases)):
+        for name, stats in table.items():
+            if not stats.get("count"):
+                continue
+            lines.append(
+                f"  {title:<5} {name:<38} n={stats['count']:<6} "
+                f"p50={stats['p50_ms']:8.2f}ms p95={stats['p95_ms']:8.2f}ms "
+                f"p99={stats['p99_ms']:8.2f}ms"
+            )
+    if result.errors:
+        lines.append(f"  errors: {result.errors}")
+    return "\n".join(lines)
+
+
+def _int_list(value: str) -> List[int]:
+    return [int(v) for v in value.split(",") if v.strip()]
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Command-line entry point; returns the process exit code."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--agents", type=_int_list, default=[10, 50, 100, 500])
+    parser.add_argument("--tasks", type=_int_list, default=[100, 1000, 10000])
+    parser.add_argument("--think-min", type=float, default=0.0)
+    parser.add_argument("--think-max", type=float, default=0.0)
+    parser.add_argument("--progress-reports", type=int, default=1)
+    parser.add_argument("--max-duration", type=float, default=120.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, default=Path("throughput.json"))
+    parser.add_argument("--baseline", type=Path)
+    parser.add_argument("--tolerance", type=float, default=0.10)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING)
+    os.environ.setdefault("MARCUS_TELEMETRY", "off")
+    scenarios = [
+        LoadScenario(
+            agents=agents,
+            tasks=tasks,
+            think_seconds=(args.think_min, args.think_max),
+            progress_reports=args.progress_reports,
+            max_duration_seconds=args.max_duration,
+            seed=args.seed,
+        )
+        for tasks in args.tasks
+        for agents in args.agents
+    ]
+    results = asyncio.run(run_scenarios(scenarios))
+    for result in results:
+        print(format_result(result))
+    document = write_results(results, args.output)
+    print(f"Results written to {args.output}")
+
+    if args.baseline:
+        regressions = compare_results(
+            json.loads(args.baseline.read_text()), document, args.tolerance
+        )
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -256,6 +256,52 @@ class TestParallelTaskDescriptionGeneration:
             for record in caplog.records
         ), f"No success message logged. Logs: {[r.message for r in caplog.records]}"
 
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_rate_limits_shrink_limiter_and_tasks_still_generate(
+        self, parser, sample_analysis, sample_constraints, mock_llm_client
+    ):
+        """Test that 429s cut concurrency and rate-limited calls are retried"""
+        from src.core.adaptive_concurrency import (
+            AdaptiveConcurrencyConfig,
+            AdaptiveConcurrencyLimiter,
+        )
+
+        parser.llm_limiter = AdaptiveConcurrencyLimiter(
+            "test-llm",
+            AdaptiveConcurrencyConfig(
+                initial_limit=8, rate_limit_retries=5, retry_base_delay=0.0
+            ),
+        )
+        capacity = 2
+        in_flight = 0
+
+        async def mock_analyze_with_capacity(prompt, context, **kwargs):
+            nonlocal in_flight
+            if in_flight >= capacity:
+                raise Exception("Claude API error: 429 - rate limit exceeded")
+            in_flight += 1
+            try:
+                await asyncio.sleep(0.005)
+                return "Generated task description"
+            finally:
+                in_flight -= 1
+
+        mock_llm_client.analyze = AsyncMock(side_effect=mock_analyze_with_capacity)
+
+        task_hierarchy = await parser._generate_task_hierarchy(
+            sample_analysis, sample_constraints
+        )
+        tasks = await parser._create_detailed_tasks(
+            task_hierarchy, sample_analysis, sample_constraints
+        )
+
+        stats = parser.llm_limiter.get_stats()
+        assert len(tasks) > 0
+        if stats["rate_limited"]:
+            assert parser.llm_limiter.limit < 8
+            assert stats["retried"] > 0
+
 
 class TestParallelSubtaskDecomposition:
     """Test suite for parallel subtask decomposition in NaturalLanguageTaskCreator"""
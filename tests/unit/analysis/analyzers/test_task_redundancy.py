@@ -5,6 +5,7 @@ Tests the analyzer that detects duplicate and redundant work across tasks,
 including over-decomposition from enterprise mode and quick completions.
 """
 
+import re
 from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock
 
@@ -758,3 +759,139 @@ class TestTaskRedundancyIntegration:
         assert len(result.redundant_pairs) == 0
         assert result.over_decomposition_detected is False
         assert result.total_time_wasted == 0.0
+
+
+class TestCandidatePrePass:
+    """Large projects are analyzed through the similarity pre-pass."""
+
+    @staticmethod
+    def _tasks(count: int, duplicates: dict[int, int]) -> list[TaskHistory]:
+        """Distinct tasks, where ``duplicates`` maps copy index to original."""
+        names = [
+            f"Implement component{i} handler{i * 7} for service{i * 13}"
+            for i in range(count)
+        ]
+        for copy, original in duplicates.items():
+            names[copy] = names[original]
+        return [
+            TaskHistory(
+                task_id=f"task-{i:04d}",
+                name=name,
+                description=f"Deliver {name.lower()} with module{i * 3}",
+                status="completed",
+                estimated_hours=1.0,
+                actual_hours=1.0,
+            )
+            for i, name in enumerate(names)
+        ]
+
+    @staticmethod
+    def _engine(score: float = 0.5) -> AsyncMock:
+        """Mock engine that reports the first two tasks of each chunk."""
+        from src.analysis.ai_engine import AnalysisResponse, AnalysisType
+
+        async def analyze(request, **kwargs):
+            summaries = request.context_data["task_summaries"]
+            ids = re.findall(r"Task (task-\d+):", summaries)
+            return AnalysisResponse(
+                analysis_type=AnalysisType.TASK_REDUNDANCY,
+                raw_response=f"chunk of {len(ids)}",
+                parsed_result={
+                    "redundancy_score": score,
+                    "redundant_pairs": [
+                        {
+                            "task_1_id": ids[0],
+                            "task_1_name": "a",
+                            "task_2_id": ids[1],
+                            "task_2_name": "b",
+                            "overlap_score": 0.9,
+                            "evidence": "same deliverable",
+                            "time_wasted": 1.0,
+                        }
+                    ],
+                    "recommendations": ["Merge duplicate tasks"],
+                },
+                confidence=0.9,
+                timestamp=datetime.now(timezone.utc),
+                model_used="claude-3-sonnet",
+            )
+
+        mock = AsyncMock()
+        mock.analyze = AsyncMock(side_effect=analyze)
+        return mock
+
+    @pytest.mark.asyncio
+    @pytest.mark.unit
+    async def test_only_candidate_clusters_sent_in_chunks(self):
+        """Only similar tasks reach the LLM, in concurrent chunks."""
+        tasks = self._tasks(400, {100: 5, 200: 6, 300: 7})
+        engine = self._engine()
+        analyzer = TaskRedundancyAnalyzer(
+            ai_engine=engine, max_prompt_tasks=50, chunk_size=4
+        )
+
+        result = await analyzer.analyze_project(tasks=tasks, conversations=[])
+
+        assert engine.analyze.await_count == 2
+        prompts = [c.args[0].context_data for c in engine.analyze.await_args_list]
+        sent = {
+            task_id
+            for context in prompts
+            for task_id in re.findall(r"Task (task-\d+):", context["task_summaries"])
+        }
+        assert sent == {
+            "task-0005",
+            "task-0100",
+            "task-0006",
+            "task-0200",
+            "task-0007",
+            "task-0300",
+        }
+        assert result.raw_data["analysis_mode"] == "candidate_clusters"
+        assert len(result.raw_data["candidate_clusters"]) == 3
+        assert len(result.raw_data["task_summaries"]) == 400
+        # Chunk scores weighted by the six candidate tasks over 400
+        assert result.redundancy_score == pytest.approx(0.5 * 6 / 400)
+        assert len(result.redundant_pairs) == 2
+        assert result.recommendations == ["Merge duplicate tasks"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.unit
+    async def test_no_candidates_skips_llm(self):
+        """A project without similar tasks needs no LLM call."""
+        engine = self._engine()
+        analyzer = TaskRedundancyAnalyzer(ai_engine=engine, max_prompt_tasks=50)
+
+        result = await analyzer.analyze_project(
+            tasks=self._tasks(100, {}), conversations=[]
+        )
+
+        engine.analyze.assert_not_called()
+        assert result.redundancy_score == 0.0
+        assert result.redundant_pairs == []
+
+    @pytest.mark.asyncio
+    @pytest.mark.unit
+    async def test_failed_chunk_is_skipped(self):
+        """One failed chunk leaves the other chunks' results intact."""
+        engine = self._engine()
+        succeed = engine.analyze.side_effect
+        calls = []
+
+        async def flaky(request, **kwargs):
+            calls.append(request)
+            if len(calls) == 1:
+                raise RuntimeError("LLM timeout")
+            return await succeed(request, **kwargs)
+
+        engine.analyze.side_effect = flaky
+        analyzer = TaskRedundancyAnalyzer(
+            ai_engine=engine, max_prompt_tasks=50, chunk_size=2
+        )
+
+        result = await analyzer.analyze_project(
+            tasks=self._tasks(100, {50: 1, 60: 2}), conversations=[]
+        )
+
+        assert result.raw_data["failed_chunks"] == 1
+        assert len(result.redundant_pairs) == 1
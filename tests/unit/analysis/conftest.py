@@ -0,0 +1,11 @@
+"""
+Shared fixtures for analysis unit tests.
+"""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _isolated_analysis_cache(tmp_path, monkeypatch):
+    """Keep engines' persistent analysis cache out of the repository."""
+    monkeypatch.setenv("MARCUS_ANALYSIS_CACHE_DIR", str(tmp_path / "analysis_cache"))
@@ -175,7 +175,8 @@ class TestAnalysisAIEngine:
     @pytest.mark.asyncio
     async def test_analyze_caches_results(self, engine, mock_llm):
         """Test that identical requests use cached results."""
-        # Arrange
+        # Arrange (responses that fail to parse are not cached)
+        mock_llm.analyze.return_value = '{"fidelity_score": 0.9}'
         request = AnalysisRequest(
             analysis_type=AnalysisType.REQUIREMENT_DIVERGENCE,
             project_id="proj-1",
@@ -0,0 +1,258 @@
+"""
+Unit tests for the persistent, deduplicating analysis cache.
+
+Covers persistence across engine instances, TTL expiry, size-bounded
+eviction, single-flight deduplication and the statistics surfaced through
+``AnalysisAIEngine.get_cache_stats``. All LLM calls go to a stub.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import time
+from types import SimpleNamespace
+from typing import Any, List
+
+import pytest
+
+from src.analysis.ai_engine import AnalysisAIEngine, AnalysisRequest, AnalysisType
+from src.analysis.storage.analysis_cache import AnalysisCache
+
+pytestmark = pytest.mark.unit
+
+
+class _StubLLM:
+    """LLM stand-in that counts calls and returns canned JSON."""
+
+    def __init__(
+        self, latency: float = 0.0, fail: bool = False, reply: str = ""
+    ) -> None:
+        self.latency = latency
+        self.fail = fail
+        self.reply = reply or json.dumps({"fidelity_score": 0.9, "confidence": 0.75})
+        self.calls = 0
+
+    async def analyze(self, prompt: str, context: Any, operation: str) -> str:
+        self.calls += 1
+        await asyncio.sleep(self.latency)
+        if self.fail:
+            raise RuntimeError("LLM unavailable")
+        return self.reply
+
+
+def _request(task_id: str = "task-1") -> AnalysisRequest:
+    return AnalysisRequest(
+        analysis_type=AnalysisType.REQUIREMENT_DIVERGENCE,
+        project_id="proj-1",
+        task_id=task_id,
+        context_data={"requirement": "Build login", "implementation": "Built auth"},
+        prompt_template="Compare {requirement} with {implementation}",
+    )
+
+
+def _key(value: str) -> str:
+    return hashlib.sha256(value.encode()).hexdigest()
+
+
+class TestAnalysisCache:
+    """Storage, expiry and eviction."""
+
+    def test_entries_survive_restart(self, tmp_path):
+        """A new cache over the same directory serves earlier entries."""
+        first = AnalysisCache(cache_dir=tmp_path)
+        first.put(_key("a"), {"score": 1}, namespace="decision_impact")
+
+        second = AnalysisCache(cache_dir=tmp_path)
+
+        assert second.get(_key("a")) == {"score": 1}
+        stats = second.stats()
+        assert stats["disk_hits"] == 1
+        assert stats["by_namespace"] == {"decision_impact": 1}
+
+    def test_expired_entries_are_dropped(self, tmp_path):
+        """Entries older than the TTL are removed, including on disk."""
+        cache = AnalysisCache(cache_dir=tmp_path, ttl_seconds=60)
+        cache.put(_key("a"), {"score": 1})
+        path = next(tmp_path.glob("*.json"))
+        old = time.time() - 120
+        os.utime(path, (old, old))
+
+        reloaded = AnalysisCache(cache_dir=tmp_path, ttl_seconds=60)
+
+        assert reloaded.get(_key("a")) is None
+        assert reloaded.stats()["expired"] == 1
+        assert list(tmp_path.glob("*.json")) == []
+
+    def test_least_recently_used_entries_evicted(self, tmp_path):
+        """The entry limit evicts the least recently used entry first."""
+        cache = AnalysisCache(cache_dir=tmp_path, max_entries=2)
+        cache.put(_key("a"), {"v": "a"})
+        cache.put(_key("b"), {"v": "b"})
+        assert cache.get(_key("a")) is not None
+        cache.put(_key("c"), {"v": "c"})
+
+        assert cache.get(_key("b")) is None
+        assert cache.get(_key("a")) == {"v": "a"}
+        assert cache.stats()["evictions"] == 1
+        assert len(list(tmp_path.glob("*.json"))) == 2
+
+    def test_byte_limit_bounds_cache(self):
+        """Total serialized size stays under ``max_bytes``."""
+        cache = AnalysisCache(max_bytes=2000)
+        for i in range(20):
+            cache.put(_key(str(i)), {"blob": "x" * 200})
+
+        stats = cache.stats()
+        assert stats["bytes"] <= 2000
+        assert stats["entries"] < 20
+        assert cache.get(_key("19")) is not None
+
+    async def test_concurrent_identical_requests_share_one_computation(self):
+        """Callers joining an in-flight key wait instead of recomputing."""
+        cache = AnalysisCache()
+        calls: List[int] = []
+
+        async def compute():
+            calls.append(1)
+            await asyncio.sleep(0.02)
+            return {"score": 1}
+
+        results = await asyncio.gather(
+            *(cache.get_or_compute(_key("a"), compute) for _ in range(5))
+        )
+
+        assert len(calls) == 1
+        assert [cached for _, cached in results] == [False] + [True] * 4
+        assert cache.stats()["deduplicated"] == 4
+
+    async def test_failures_are_not_cached(self):
+        """A failed computation raises to every waiter and is retried later."""
+        cache = AnalysisCache()
+        attempts: List[int] = []
+
+        async def compute():
+            attempts.append(1)
+            await asyncio.sleep(0.01)
+            if len(attempts) == 1:
+                raise RuntimeError("boom")
+            return {"score": 1}
+
+        results = await asyncio.gather(
+            cache.get_or_compute(_key("a"), compute),
+            cache.get_or_compute(_key("a"), compute),
+            return_exceptions=True,
+        )
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+        payload, cached = await cache.get_or_compute(_key("a"), compute)
+        assert payload == {"score": 1} and not cached
+        assert len(attempts) == 2
+
+
+class TestAnalysisAIEngineCaching:
+    """Engine integration with a stub LLM."""
+
+    async def test_cached_across_engine_instances(self, tmp_path):
+        """A restarted engine answers repeated analyses without the LLM."""
+        llm = _StubLLM()
+        first = AnalysisAIEngine(llm, cache=AnalysisCache(cache_dir=tmp_path))
+        original = await first.analyze(_request())
+
+        restarted = AnalysisAIEngine(llm, cache=AnalysisCache(cache_dir=tmp_path))
+        response = await restarted.analyze(_request())
+
+        assert llm.calls == 1
+        assert response.cached and not original.cached
+        assert response.parsed_result == original.parsed_result
+        assert response.timestamp == original.timestamp
+        assert response.confidence == 0.75
+
+    async def test_concurrent_duplicate_analyses_call_llm_once(self):
+        """Identical in-flight analyses are deduplicated."""
+        llm = _StubLLM(latency=0.02)
+        engine = AnalysisAIEngine(llm, cache=AnalysisCache())
+
+        responses = await asyncio.gather(
+            *(engine.analyze(_request()) for _ in range(4)),
+            engine.analyze(_request("task-2")),
+        )
+
+        assert llm.calls == 2
+        assert sum(r.cached for r in responses) == 3
+
+    async def test_llm_errors_propagate_and_are_not_cached(self):
+        """A failing LLM call raises and leaves nothing cached."""
+        llm = _StubLLM(fail=True)
+        engine = AnalysisAIEngine(llm, cache=AnalysisCache())
+
+        with pytest.raises(RuntimeError):
+            await engine.analyze(_request())
+
+        assert engine.get_cache_stats()["total_cached"] == 0
+
+    async def test_cache_stats_report_hits_and_savings(self):
+        """``get_cache_stats`` reports hit rate and LLM calls saved."""
+        llm = _StubLLM()
+        engine = AnalysisAIEngine(llm, cache=AnalysisCache())
+
+        for _ in range(3):
+            await engine.analyze(_request())
+        await engine.analyze(_request("task-2"))
+        stats = engine.get_cache_stats()
+
+        assert stats["total_cached"] == 2
+        assert stats["by_type"] == {"requirement_divergence": 2}
+        assert (stats["hits"], stats["misses"]) == (2, 2)
+        assert stats["hit_rate"] == 0.5
+        assert stats["llm_calls_saved"] == 2
+        assert stats["estimated_tokens_saved"] > 0
+        assert engine.clear_cache() == 2
+        assert engine.get_cache_stats()["total_cached"] == 0
+
+    async def test_unparseable_responses_are_not_cached(self):
+        """A response that failed to parse is retried on the next request."""
+        llm = _StubLLM(reply="not json")
+        engine = AnalysisAIEngine(llm, cache=AnalysisCache())
+
+        first = await engine.analyze(_request())
+        second = await engine.analyze(_request())
+
+        assert "parse_error" in first.parsed_result
+        assert not second.cached and llm.calls == 2
+        assert engine.get_cache_stats()["total_cached"] == 0
+
+    def test_key_changes_with_prompt_version_and_model(self, monkeypatch):
+        """Cached analyses from another prompt version or model are not reused."""
+        monkeypatch.setattr(
+            "src.config.marcus_config.get_config",
+            lambda: SimpleNamespace(
+                ai=SimpleNamespace(model="claude-x", local_model="qwen")
+            ),
+        )
+        llm = _StubLLM()
+        llm.current_provider = "anthropic"
+        key = AnalysisAIEngine(llm, cache=AnalysisCache()).get_cache_key(_request())
+
+        llm.current_provider = "local"
+        other_model = AnalysisAIEngine(llm, cache=AnalysisCache())
+        llm.current_provider = "anthropic"
+        monkeypatch.setattr("src.analysis.ai_engine.ANALYSIS_PROMPT_VERSION", "next")
+        other_prompt = AnalysisAIEngine(llm, cache=AnalysisCache())
+
+        assert other_model.get_cache_key(_request()) != key
+        assert other_prompt.get_cache_key(_request()) != key
+
+    def test_persistent_by_default(self, tmp_path, monkeypatch):
+        """Engines persist under ``data/`` unless the environment overrides it."""
+        monkeypatch.delenv("MARCUS_ANALYSIS_CACHE_DIR", raising=False)
+        monkeypatch.setattr(
+            "src.analysis.ai_engine.DEFAULT_ANALYSIS_CACHE_DIR", tmp_path / "data"
+        )
+        assert AnalysisAIEngine(_StubLLM()).get_cache_stats()["cache_dir"] == str(
+            tmp_path / "data"
+        )
+
+        monkeypatch.setenv("MARCUS_ANALYSIS_CACHE_DIR", str(tmp_path))
+        stats = AnalysisAIEngine(_StubLLM()).get_cache_stats()
+        assert stats["persistent"] and stats["cache_dir"] == str(tmp_path)
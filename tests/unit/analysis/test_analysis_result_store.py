@@ -6,13 +6,14 @@ and retrieval of analysis outputs.
 """
 
 import tempfile
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any
 
 import pytest
 
 from src.analysis.storage.analysis_results import AnalysisResult, AnalysisResultStore
+from src.core.persistence import SQLitePersistence
 
 
 class TestAnalysisResultStore:
@@ -377,3 +378,116 @@ class TestAnalysisResultStore:
         assert retrieved is not None
         assert retrieved.task_id is None
         assert retrieved.result["functional_status"] == "PARTIAL"
+
+    @pytest.mark.asyncio
+    async def test_pagination_newest_first(self, temp_marcus_root):
+        """Test paging through project results in timestamp order."""
+        # Arrange
+        store = AnalysisResultStore(temp_marcus_root)
+        base = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        await store.store_results(
+            [
+                AnalysisResult(
+                    analysis_id=f"anl_{i:02d}",
+                    project_id="proj-1",
+                    task_id=f"task-{i % 3}",
+                    analysis_type="requirement_divergence",
+                    timestamp=base + timedelta(minutes=i),
+                    version="1.0",
+                )
+                for i in range(25)
+            ]
+        )
+
+        # Act
+        first = await store.get_results_for_project("proj-1", limit=10)
+        third = await store.get_results_for_project("proj-1", limit=10, offset=20)
+        task_page = await store.get_results_for_task("proj-1", "task-0", limit=2)
+
+        # Assert
+        assert [r.analysis_id for r in first] == [
+            f"anl_{i:02d}" for i in range(24, 14, -1)
+        ]
+        assert [r.analysis_id for r in third] == [
+            f"anl_{i:02d}" for i in range(4, -1, -1)
+        ]
+        assert [r.analysis_id for r in task_page] == ["anl_24", "anl_21"]
+        assert await store.count_results("proj-1") == 25
+        assert await store.count_results("proj-1", "task-0") == 9
+
+    @pytest.mark.asyncio
+    async def test_latest_results_by_type(self, temp_marcus_root):
+        """Test latest-per-type lookups across time zones and scopes."""
+        # Arrange
+        store = AnalysisResultStore(temp_marcus_root)
+        utc_noon = datetime(2025, 1, 1, 12, tzinfo=timezone.utc)
+        # 12:30 UTC, expressed in UTC-05:00
+        later_eastern = datetime(
+            2025, 1, 1, 7, 30, tzinfo=timezone(timedelta(hours=-5))
+        )
+        await store.store_results(
+            [
+                AnalysisResult(
+                    "a1", "proj-1", "task-1", "decision_impact", utc_noon, "1.0"
+                ),
+                AnalysisResult(
+                    "a2", "proj-1", "task-1", "decision_impact", later_eastern, "1.0"
+                ),
+                AnalysisResult(
+                    "a3", "proj-1", "task-1", "failure_diagnosis", utc_noon, "1.0"
+                ),
+                AnalysisResult(
+                    "a4", "proj-1", None, "overall_assessment", utc_noon, "1.0"
+                ),
+            ]
+        )
+
+        # Act
+        latest = await store.get_latest_results_by_type("proj-1", "task-1")
+        project_latest = await store.get_latest_result(
+            "proj-1", None, "decision_impact"
+        )
+
+        # Assert
+        assert {k: v.analysis_id for k, v in latest.items()} == {
+            "decision_impact": "a2",
+            "failure_diagnosis": "a3",
+        }
+        assert latest["decision_impact"].timestamp == later_eastern
+        # task_id=None means project-level results only
+        assert project_latest is None
+        assert (
+            await store.get_latest_results_by_type("proj-1")
+        ).keys() == {"overall_assessment"}
+
+    @pytest.mark.asyncio
+    async def test_migrates_legacy_key_value_rows(self, temp_marcus_root):
+        """Test that rows in the generic persistence table are migrated."""
+        # Arrange
+        legacy = SQLitePersistence(db_path=temp_marcus_root / "data" / "marcus.db")
+        await legacy.store(
+            "analysis_results",
+            "anl_legacy",
+            AnalysisResult(
+                analysis_id="anl_legacy",
+                project_id="proj-1",
+                task_id="task-1",
+                analysis_type="instruction_quality",
+                timestamp=datetime(2024, 6, 1, tzinfo=timezone.utc),
+                version="1.0",
+                result={"score": 0.5},
+            ).to_dict(),
+        )
+        await legacy.store("other_collection", "keep", {"x": 1})
+
+        # Act
+        store = AnalysisResultStore(temp_marcus_root)
+        migrated = await store.get_result("anl_legacy")
+
+        # Assert
+        assert migrated is not None and migrated.result == {"score": 0.5}
+        assert await legacy.retrieve("analysis_results", "anl_legacy") is None
+        assert await legacy.retrieve("other_collection", "keep") == {"x": 1}
+        # Re-opening does not duplicate or lose anything
+        reopened = AnalysisResultStore(temp_marcus_root)
+        assert await reopened.count_results("proj-1") == 1
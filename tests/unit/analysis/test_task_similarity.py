@@ -0,0 +1,96 @@
+"""
+Unit tests for the MinHash near-duplicate pre-pass used by redundancy analysis.
+"""
+
+import random
+
+import pytest
+
+from src.analysis.helpers.task_similarity import (
+    MinHasher,
+    find_candidate_clusters,
+    find_candidate_pairs,
+    jaccard,
+    shingle,
+)
+
+pytestmark = pytest.mark.unit
+
+
+def _distinct_text(rng: random.Random) -> str:
+    return " ".join(f"term{rng.randrange(100_000)}" for _ in range(12))
+
+
+class TestShingles:
+    """Text normalization."""
+
+    def test_words_and_pairs_without_stopwords(self):
+        """Stopwords are dropped, plurals folded and pairs stay in one text."""
+        shingles = shingle("Add the user endpoints", "Tests")
+
+        assert shingles == {
+            "add",
+            "user",
+            "endpoint",
+            "add user",
+            "user endpoint",
+            "test",
+        }
+
+    def test_jaccard(self):
+        """Jaccard similarity of shingle sets."""
+        assert jaccard({"a", "b"}, {"b", "c"}) == pytest.approx(1 / 3)
+        assert jaccard(set(), {"a"}) == 0.0
+
+
+class TestMinHash:
+    """Signature and LSH behaviour."""
+
+    def test_signature_agreement_estimates_similarity(self):
+        """Matching signature positions approximate Jaccard similarity."""
+        hasher = MinHasher(num_perm=256)
+        a = {f"s{i}" for i in range(100)}
+        b = {f"s{i}" for i in range(50, 150)}
+
+        agreement = (hasher.signature(a) == hasher.signature(b)).mean()
+
+        assert agreement == pytest.approx(jaccard(a, b), abs=0.1)
+
+    def test_finds_planted_duplicates_among_distinct_tasks(self):
+        """Near-duplicates are found without comparing every pair."""
+        rng = random.Random(7)
+        texts = {f"t{i}": _distinct_text(rng) for i in range(500)}
+        texts["dup-a"] = texts["t10"] + " extra"
+        texts["dup-b"] = texts["t20"]
+
+        pairs = find_candidate_pairs({k: shingle(v) for k, v in texts.items()})
+
+        found = {frozenset((p.task_1_id, p.task_2_id)) for p in pairs}
+        assert found == {frozenset(("t10", "dup-a")), frozenset(("t20", "dup-b"))}
+        assert pairs[0].similarity == 1.0
+
+    def test_large_identical_bucket_stays_one_cluster(self):
+        """Buckets above the size cap are linked through their first member."""
+        texts = {f"t{i}": "Write unit tests for module" for i in range(30)}
+
+        clusters = find_candidate_clusters(texts, max_bucket_size=5)
+
+        assert len(clusters) == 1
+        assert clusters[0].task_ids == [f"t{i}" for i in range(30)]
+        assert len(clusters[0].pairs) < 30 * 29 // 2
+
+    def test_clusters_ranked_by_strongest_pair(self):
+        """Clusters are transitive groups ordered by similarity."""
+        texts = {
+            "a1": "build login page form validation",
+            "a2": "build login page form validation",
+            "b1": "configure postgres database schema migration tooling",
+            "b2": "configure postgres database schema migration",
+            "b3": "postgres database schema migration tooling",
+            "c": "write release notes",
+        }
+
+        clusters = find_candidate_clusters(texts, threshold=0.4)
+
+        assert [c.task_ids for c in clusters] == [["a1", "a2"], ["b1", "b2", "b3"]]
+        assert clusters[0].similarity == 1.0 > clusters[1].similarity
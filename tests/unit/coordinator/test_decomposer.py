@@ -10,6 +10,12 @@ from unittest.mock import AsyncMock, Mock
 
 import pytest
 
+from src.core.adaptive_concurrency import (
+    LLM_LIMITER,
+    AdaptiveConcurrencyConfig,
+    get_concurrency_limiter,
+    reset_concurrency_limiters,
+)
 from src.core.models import Priority, Task, TaskStatus
 from src.marcus_mcp.coordinator.decomposer import (
     _adjust_subtask_dependencies,
@@ -451,6 +457,38 @@ class TestDecomposeTask:
         assert "error" in result
         assert "AI service unavailable" in result["error"]
 
+    @pytest.mark.asyncio
+    async def test_decompose_task_rate_limit_backs_off_shared_limiter(
+        self, task, mock_ai_engine, sample_decomposition
+    ):
+        """A 429 reaches the shared LLM limiter before the catch-all.
+
+        ``decompose_task`` turns every exception into a failed result,
+        so the limiter has to wrap the provider call itself to see rate
+        limits, shrink its window and retry.
+        """
+        reset_concurrency_limiters()
+        limiter = get_concurrency_limiter(
+            LLM_LIMITER,
+            AdaptiveConcurrencyConfig(initial_limit=8, retry_base_delay=0.0),
+        )
+        mock_ai_engine.generate_structured_response.side_effect = [
+            Exception("Claude API error: 429 - rate_limit_error"),
+            sample_decomposition,
+        ]
+
+        try:
+            result = await decompose_task(task, mock_ai_engine)
+            stats = limiter.get_stats()
+        finally:
+            reset_concurrency_limiters()
+
+        assert result["success"] is True
+        assert mock_ai_engine.generate_structured_response.await_count == 2
+        assert stats["rate_limited"] == 1
+        assert stats["retried"] == 1
+        assert limiter.limit == 4
+
     @pytest.mark.asyncio
     async def test_decompose_task_includes_parallelism_analysis(
         self, task, mock_ai_engine, sample_decomposition
@@ -0,0 +1,247 @@
+"""
+Unit tests for the adaptive (AIMD) concurrency limiter.
+"""
+
+import asyncio
+
+import pytest
+
+from src.core.adaptive_concurrency import (
+    AdaptiveConcurrencyConfig,
+    AdaptiveConcurrencyLimiter,
+    get_concurrency_limiter,
+    is_rate_limit_error,
+    reset_concurrency_limiters,
+)
+from src.core.error_framework import AIProviderError
+
+pytestmark = pytest.mark.unit
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestIsRateLimitError:
+    """Test suite for rate-limit detection."""
+
+    def test_detects_provider_message(self):
+        """Provider errors embed the status code in the message."""
+        assert is_rate_limit_error(Exception("Claude API error: 429 - slow down"))
+
+    def test_detects_status_code_attribute(self):
+        """Exceptions carrying a 429 status code are rate limits."""
+        exc = Exception("boom")
+        exc.status_code = 429  # type: ignore[attr-defined]
+        assert is_rate_limit_error(exc)
+
+    def test_detects_wrapped_cause(self):
+        """Rate limits wrapped in AIProviderError are still recognised."""
+        try:
+            try:
+                raise Exception("Too Many Requests")
+            except Exception as inner:
+                raise AIProviderError(
+                    provider_name="llm", operation="analyze"
+                ) from inner
+        except AIProviderError as outer:
+            assert is_rate_limit_error(outer)
+
+    def test_ignores_other_errors(self):
+        """Ordinary failures are not rate limits."""
+        assert not is_rate_limit_error(ValueError("bad json"))
+
+
+class TestAdaptiveConcurrencyLimiter:
+    """Test suite for AdaptiveConcurrencyLimiter."""
+
+    def test_success_grows_limit_additively(self):
+        """A full window of successes adds roughly one slot."""
+        limiter = AdaptiveConcurrencyLimiter(
+            "test", AdaptiveConcurrencyConfig(initial_limit=4, max_limit=10)
+        )
+        for _ in range(4):
+            limiter._take_slot()
+            limiter.release(outcome="success")
+        assert limiter.limit in (4, 5)
+        for _ in range(8):
+            limiter._take_slot()
+            limiter.release(outcome="success")
+        assert 5 <= limiter.limit <= 10
+
+    def test_limit_never_exceeds_max(self):
+        """Additive increase stops at max_limit."""
+        limiter = AdaptiveConcurrencyLimiter(
+            "test", AdaptiveConcurrencyConfig(initial_limit=2, max_limit=3)
+        )
+        for _ in range(100):
+            limiter._take_slot()
+            limiter.release(outcome="success")
+        assert limiter.limit == 3
+
+    def test_rate_limit_halves_limit_once_per_cooldown(self):
+        """A burst of 429s within the cooldown only cuts the limit once."""
+        clock = FakeClock()
+        limiter = AdaptiveConcurrencyLimiter(
+            "test",
+            AdaptiveConcurrencyConfig(initial_limit=16, decrease_cooldown=1.0),
+            clock=clock,
+        )
+        for _ in range(5):
+            limiter._take_slot()
+            limiter.release(outcome="rate_limited")
+        assert limiter.limit == 8
+
+        clock.now = 2.0
+        limiter._take_slot()
+        limiter.release(outcome="rate_limited")
+        assert limiter.limit == 4
+
+    def test_limit_never_below_min(self):
+        """Multiplicative decrease is floored at min_limit."""
+        clock = FakeClock()
+        limiter = AdaptiveConcurrencyLimiter(
+            "test",
+            AdaptiveConcurrencyConfig(initial_limit=4, min_limit=2),
+            clock=clock,
+        )
+        for step in range(10):
+            clock.now = step * 10.0
+            limiter._take_slot()
+            limiter.release(outcome="rate_limited")
+        assert limiter.limit == 2
+
+    def test_slow_calls_decrease_limit(self):
+        """Latency above the threshold is treated as congestion."""
+        limiter = AdaptiveConcurrencyLimiter(
+            "test",
+            AdaptiveConcurrencyConfig(initial_limit=8, latency_threshold=1.0),
+        )
+        limiter._take_slot()
+        limiter.release(outcome="success", latency=5.0)
+        assert limiter.limit == 4
+        assert limiter.get_stats()["slow"] == 1
+
+    def test_plain_errors_leave_limit_unchanged(self):
+        """Non rate-limit failures are neutral."""
+        limiter = AdaptiveConcurrencyLimiter(
+            "test", AdaptiveConcurrencyConfig(initial_limit=8)
+        )
+        limiter._take_slot()
+        limiter.release(outcome="error")
+        assert limiter.limit == 8
+        assert limiter.get_stats()["failed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_caps_in_flight_calls(self):
+        """No more than ``limit`` calls hold a slot at once."""
+        limiter = AdaptiveConcurrencyLimiter(
+            "test", AdaptiveConcurrencyConfig(initial_limit=3, max_limit=3)
+        )
+        in_flight = 0
+        peak = 0
+
+        async def work() -> None:
+            nonlocal in_flight, peak
+            async with limiter.slot():
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+
+        await asyncio.gather(*(work() for _ in range(20)))
+
+        assert peak == 3
+        assert limiter.in_flight == 0
+        assert limiter.get_stats()["peak_in_flight"] == 3
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_leak_slot(self):
+        """Cancelling a queued caller leaves the slot accounting intact."""
+        limiter = AdaptiveConcurrencyLimiter(
+            "test", AdaptiveConcurrencyConfig(initial_limit=1, max_limit=1)
+        )
+        await limiter.acquire()
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        limiter.release()
+        assert limiter.in_flight == 0
+        await asyncio.wait_for(limiter.acquire(), timeout=1.0)
+        assert limiter.in_flight == 1
+
+    @pytest.mark.asyncio
+    async def test_run_retries_rate_limited_calls(self):
+        """run() retries 429s behind the reduced window."""
+        limiter = AdaptiveConcurrencyLimiter(
+            "test",
+            AdaptiveConcurrencyConfig(
+                initial_limit=4, rate_limit_retries=2, retry_base_delay=0.0
+            ),
+        )
+        attempts = 0
+
+        async def flaky() -> str:
+            nonlocal attempts
+            attempts += 1
+            if attempts < 3:
+                raise Exception("API error: 429 - rate limit exceeded")
+            return "ok"
+
+        assert await limiter.run(flaky) == "ok"
+        assert attempts == 3
+        assert limiter.limit == 2
+        assert limiter.get_stats()["retried"] == 2
+
+    @pytest.mark.asyncio
+    async def test_run_gives_up_after_retry_budget(self):
+        """run() re-raises once rate-limit retries are exhausted."""
+        limiter = AdaptiveConcurrencyLimiter(
+            "test",
+            AdaptiveConcurrencyConfig(rate_limit_retries=1, retry_base_delay=0.0),
+        )
+
+        async def always_limited() -> None:
+            raise Exception("429 Too Many Requests")
+
+        with pytest.raises(Exception, match="429"):
+            await limiter.run(always_limited)
+
+    @pytest.mark.asyncio
+    async def test_run_does_not_retry_other_errors(self):
+        """Non rate-limit errors propagate on the first attempt."""
+        limiter = AdaptiveConcurrencyLimiter("test")
+        attempts = 0
+
+        async def broken() -> None:
+            nonlocal attempts
+            attempts += 1
+            raise ValueError("bad")
+
+        with pytest.raises(ValueError):
+            await limiter.run(broken)
+        assert attempts == 1
+
+
+class TestLimiterRegistry:
+    """Test suite for the shared limiter registry."""
+
+    def test_same_name_returns_same_limiter(self):
+        """Fan-outs share a limiter by dependency name."""
+        reset_concurrency_limiters()
+        try:
+            assert get_concurrency_limiter("llm") is get_concurrency_limiter("llm")
+            assert get_concurrency_limiter("llm") is not get_concurrency_limiter(
+                "planka"
+            )
+        finally:
+            reset_concurrency_limiters()
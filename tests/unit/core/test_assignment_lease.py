@@ -346,6 +346,8 @@ class TestLeaseMonitor:
         manager.active_leases = {}
         manager.load_active_leases = AsyncMock()
         manager.check_expired_leases = AsyncMock(return_value=[])
+        manager.check_due_leases = AsyncMock(return_value=[])
+        manager.next_expiry_deadline = Mock(return_value=None)
         manager.recover_expired_lease = AsyncMock(return_value=True)
         manager.get_lease_statistics = Mock(
             return_value={"total_active": 0, "expiring_soon": 0, "expired": 0}
@@ -376,7 +378,7 @@ class TestLeaseMonitor:
         # Set up expired leases
         expired_lease = Mock()
         expired_lease.task_id = "task-123"
-        mock_lease_manager.check_expired_leases.return_value = [expired_lease]
+        mock_lease_manager.check_due_leases.return_value = [expired_lease]
 
         # Mock smart recovery check to allow recovery
         mock_lease_manager.should_recover_expired_lease = AsyncMock(return_value=True)
@@ -390,8 +392,8 @@ class TestLeaseMonitor:
         # Stop monitor
         await lease_monitor.stop()
 
-        # Verify recovery was attempted
-        mock_lease_manager.check_expired_leases.assert_called()
+        # Verify recovery was attempted from the expiry schedule
+        mock_lease_manager.check_due_leases.assert_called()
         mock_lease_manager.should_recover_expired_lease.assert_called_with(
             expired_lease
         )
@@ -660,6 +662,40 @@ class TestUpdateTimestampPersistence:
         assert "update_timestamps" in existing_assignment
         assert len(existing_assignment["update_timestamps"]) == 2
 
+    @pytest.mark.asyncio
+    async def test_flush_leases_persists_in_memory_extensions(self):
+        """Test that flush_leases writes expiry times extended in memory."""
+        now = datetime.now(timezone.utc)
+        stored: dict[str, dict[str, Any]] = {
+            task_id: {"task_id": task_id, "assigned_at": now.isoformat()}
+            for task_id in ("task-1", "task-2")
+        }
+        mock_persistence = Mock()
+        mock_persistence.get_assignment = AsyncMock(
+            side_effect=lambda agent_id: stored[f"task-{agent_id[-1]}"]
+        )
+        mock_persistence.save_assignment = AsyncMock()
+
+        lease_manager = AssignmentLeaseManager(
+            kanban_client=Mock(),
+            assignment_persistence=mock_persistence,
+        )
+        for n in (1, 2):
+            lease_manager.active_leases[f"task-{n}"] = AssignmentLease(
+                task_id=f"task-{n}",
+                agent_id=f"agent-{n}",
+                assigned_at=now,
+                lease_expires=now + timedelta(hours=n),
+                last_renewed=now,
+            )
+
+        assert await lease_manager.flush_leases() == 2
+
+        assert mock_persistence.save_assignment.await_count == 2
+        assert stored["task-2"]["lease_expires"] == (
+            now + timedelta(hours=2)
+        ).isoformat()
+
 
 class TestRecoveryInfo:
     """Test suite for RecoveryInfo dataclass."""
@@ -1849,3 +1885,203 @@ class TestPhase4Timeout:
             progress=74, update_count=3, has_recent_activity=True
         )
         assert lease_s + grace_s == 360
+
+
+class TestLeaseExpirySchedule:
+    """Deadline-ordered expiry schedule and the monitor that sleeps on it."""
+
+    @staticmethod
+    def _make_manager(grace_period_minutes: float = 0.0) -> AssignmentLeaseManager:
+        kanban = Mock()
+        kanban.update_task = AsyncMock()
+        kanban.add_comment = AsyncMock()
+        kanban.get_task_by_id = AsyncMock(return_value=None)
+        persistence = Mock()
+        persistence.get_assignment = AsyncMock(return_value=None)
+        persistence.remove_assignment = AsyncMock()
+        persistence.load_assignments = AsyncMock(return_value={})
+        return AssignmentLeaseManager(
+            kanban, persistence, grace_period_minutes=grace_period_minutes
+        )
+
+    @staticmethod
+    def _lease(task_id: str, expires_in: float) -> AssignmentLease:
+        now = datetime.now(timezone.utc)
+        return AssignmentLease(
+            task_id=task_id,
+            agent_id=f"agent-{task_id}",
+            assigned_at=now,
+            lease_expires=now + timedelta(seconds=expires_in),
+            last_renewed=now,
+        )
+
+    def _add(self, manager, task_id: str, expires_in: float) -> AssignmentLease:
+        lease = self._lease(task_id, expires_in)
+        manager.active_leases[task_id] = lease
+        manager.schedule_expiry(lease)
+        return lease
+
+    @pytest.mark.asyncio
+    async def test_due_leases_come_back_in_deadline_order(self):
+        """Only leases past expiry plus grace are returned, earliest first."""
+        manager = self._make_manager()
+        self._add(manager, "later", -5)
+        self._add(manager, "earliest", -30)
+        self._add(manager, "future", 60)
+
+        due = await manager.check_due_leases()
+
+        assert [lease.task_id for lease in due] == ["earliest", "later"]
+        assert await manager.check_due_leases() == []
+        next_deadline = manager.next_expiry_deadline()
+        assert next_deadline == manager.recovery_deadline(
+            manager.active_leases["future"]
+        )
+
+    @pytest.mark.asyncio
+    async def test_grace_period_delays_deadline(self):
+        """A lease inside its grace period is not yet due."""
+        manager = self._make_manager(grace_period_minutes=1.0)
+        lease = self._add(manager, "task-1", -30)
+
+        assert await manager.check_due_leases() == []
+
+        lease.grace_period_seconds = 10.0
+        manager.schedule_expiry(lease)
+        assert await manager.check_due_leases() == [lease]
+
+    @pytest.mark.asyncio
+    async def test_renewal_supersedes_old_deadline(self):
+        """Renewing reschedules; the stale entry never fires."""
+        manager = self._make_manager()
+        lease = await manager.create_lease("task-1", "agent-1")
+        first_deadline = manager.next_expiry_deadline()
+
+        await manager.renew_lease("task-1", progress=80)
+
+        assert manager.recovery_deadline(lease) != first_deadline
+        assert manager.next_expiry_deadline() == manager.recovery_deadline(lease)
+        live = [
+            entry
+            for entry in manager._expiry_heap
+            if manager._expiry_seq.get(entry[2]) == entry[1]
+        ]
+        assert len(live) == 1
+
+    @pytest.mark.asyncio
+    async def test_extension_without_reschedule_is_not_reported(self):
+        """Leases extended behind the schedule's back are re-queued."""
+        manager = self._make_manager()
+        lease = self._add(manager, "task-1", -5)
+        lease.lease_expires = datetime.now(timezone.utc) + timedelta(minutes=5)
+
+        assert await manager.check_due_leases() == []
+        assert manager.next_expiry_deadline() == manager.recovery_deadline(lease)
+
+    @pytest.mark.asyncio
+    async def test_released_leases_are_skipped(self):
+        """Entries for leases removed from active_leases are dropped."""
+        manager = self._make_manager()
+        self._add(manager, "task-1", -5)
+        del manager.active_leases["task-1"]
+
+        assert await manager.check_due_leases() == []
+        assert manager.next_expiry_deadline() is None
+
+    def test_heap_is_compacted_after_many_renewals(self):
+        """Superseded entries don't accumulate without bound."""
+        manager = self._make_manager()
+        lease = self._add(manager, "task-1", 60)
+        for _ in range(1000):
+            manager.schedule_expiry(lease)
+
+        assert len(manager._expiry_heap) <= 2 * len(manager._expiry_seq) + 65
+
+    @pytest.mark.asyncio
+    async def test_probes_run_concurrently_with_bound(self):
+        """Merge-conflict probes for a batch overlap, up to the limit."""
+        manager = self._make_manager()
+        for i in range(10):
+            self._add(manager, f"task-{i}", -5)
+        in_flight = 0
+        peak = 0
+
+        async def slow_probe(lease):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return False
+
+        with patch.object(manager, "_try_extend_for_merge_conflict", slow_probe):
+            due = await manager.check_due_leases(max_concurrency=3)
+
+        assert len(due) == 10
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_monitor_wakes_at_deadline(self):
+        """The monitor recovers a lease right after it expires, not a poll later."""
+        manager = self._make_manager()
+        monitor = LeaseMonitor(manager, check_interval_seconds=60)
+        await monitor.start()
+        try:
+            await asyncio.sleep(0.05)  # monitor is now sleeping on the interval
+            lease = await manager.create_lease("task-1", "agent-1")
+            lease.lease_expires = datetime.now(timezone.utc) + timedelta(seconds=0.2)
+            manager.schedule_expiry(lease)
+
+            for _ in range(100):
+                if "task-1" not in manager.active_leases:
+                    break
+                await asyncio.sleep(0.02)
+            recovered_at = datetime.now(timezone.utc)
+        finally:
+            await monitor.stop()
+
+        assert "task-1" not in manager.active_leases
+        lateness = (recovered_at - lease.lease_expires).total_seconds()
+        assert lateness < 1.0
+        assert manager.expiry_wakeup is None
+
+    @pytest.mark.asyncio
+    async def test_full_scan_runs_on_its_own_period(self):
+        """Wakeups for due leases do not trigger the O(n) full scan."""
+        manager = self._make_manager()
+        manager.check_expired_leases = AsyncMock(  # type: ignore[method-assign]
+            return_value=[]
+        )
+        monitor = LeaseMonitor(
+            manager, check_interval_seconds=0.05, full_scan_interval_seconds=0.3
+        )
+        await monitor.start()
+        try:
+            for index in range(5):
+                lease = await manager.create_lease(f"task-{index}", "agent-1")
+                lease.lease_expires = datetime.now(timezone.utc)
+                manager.schedule_expiry(lease)
+                await asyncio.sleep(0.02)
+            assert not manager.active_leases
+            assert manager.check_expired_leases.await_count == 0
+
+            await asyncio.sleep(0.4)
+            assert manager.check_expired_leases.await_count >= 1
+        finally:
+            await monitor.stop()
+
+    @pytest.mark.asyncio
+    async def test_monitor_rechecks_leases_it_declines_to_recover(self):
+        """Leases kept by the smart checks are rescheduled one interval out."""
+        manager = self._make_manager()
+        monitor = LeaseMonitor(manager, check_interval_seconds=30)
+        lease = self._add(manager, "task-1", -5)
+        manager.should_recover_expired_lease = AsyncMock(  # type: ignore[method-assign]
+            return_value=False
+        )
+
+        await monitor._recover_leases(await manager.check_due_leases())
+
+        assert "task-1" in manager.active_leases
+        wait = (manager.next_expiry_deadline() - datetime.now(timezone.utc)).seconds
+        assert 25 <= wait <= 30
@@ -0,0 +1,174 @@
+"""
+Unit tests for assignment persistence backends.
+"""
+
+import json
+import sqlite3
+from unittest.mock import Mock
+
+import pytest
+
+from src.core.assignment_lease import AssignmentLeaseManager
+from src.core.assignment_persistence import AssignmentPersistence
+
+pytestmark = pytest.mark.unit
+
+
+LEASE = {
+    "lease_expires": "2026-01-01T00:05:00+00:00",
+    "renewal_count": 2,
+    "progress_percentage": 40,
+    "update_timestamps": ["2026-01-01T00:00:00+00:00"],
+}
+
+
+class TestSQLiteAssignmentPersistence:
+    """Test suite for the row-per-assignment SQLite backend."""
+
+    async def test_round_trip_across_instances(self, tmp_path):
+        """Saved assignments are visible to a fresh instance."""
+        persistence = AssignmentPersistence(storage_dir=tmp_path)
+        await persistence.save_assignment("agent-1", "task-1", {"name": "API"})
+        await persistence.save_assignment("agent-2", "task-2", {"name": "UI"})
+
+        reloaded = await AssignmentPersistence(storage_dir=tmp_path).load_assignments()
+
+        assert set(reloaded) == {"agent-1", "agent-2"}
+        assert reloaded["agent-1"]["task_id"] == "task-1"
+        assert reloaded["agent-1"]["task_data"] == {"name": "API"}
+        assert (tmp_path / "assignments.db").exists()
+        assert not (tmp_path / "assignments.json").exists()
+
+    async def test_lease_update_touches_only_lease_fields(self, tmp_path):
+        """Renewals keep assigned_at and task_data and survive a restart."""
+        persistence = AssignmentPersistence(storage_dir=tmp_path)
+        await persistence.save_assignment("agent-1", "task-1", {"name": "API"})
+        assigned_at = (await persistence.get_assignment("agent-1"))["assigned_at"]
+
+        await persistence.save_assignment("agent-1", "task-1", {}, lease=LEASE)
+
+        reloaded = await AssignmentPersistence(storage_dir=tmp_path).load_assignments()
+        assert reloaded["agent-1"]["assigned_at"] == assigned_at
+        assert reloaded["agent-1"]["task_data"] == {"name": "API"}
+        assert reloaded["agent-1"]["renewal_count"] == 2
+        assert reloaded["agent-1"]["update_timestamps"] == LEASE["update_timestamps"]
+
+    async def test_lease_update_for_reassigned_worker_is_ignored(self, tmp_path):
+        """A late renewal for a task the worker no longer holds is dropped."""
+        persistence = AssignmentPersistence(storage_dir=tmp_path)
+        await persistence.save_assignment("agent-1", "task-2", {})
+
+        await persistence.save_assignment("agent-1", "task-1", {}, lease=LEASE)
+
+        reloaded = await AssignmentPersistence(storage_dir=tmp_path).load_assignments()
+        assert "renewal_count" not in reloaded["agent-1"]
+        assert "renewal_count" not in await persistence.get_assignment("agent-1")
+
+    async def test_remove_deletes_row(self, tmp_path):
+        """Removed assignments are gone after a restart."""
+        persistence = AssignmentPersistence(storage_dir=tmp_path)
+        await persistence.save_assignment("agent-1", "task-1", {})
+        await persistence.save_assignment("agent-2", "task-2", {})
+
+        await persistence.remove_assignment("agent-1")
+
+        reloaded = await AssignmentPersistence(storage_dir=tmp_path).load_assignments()
+        assert set(reloaded) == {"agent-2"}
+
+    async def test_database_is_created_by_first_write(self, tmp_path):
+        """Constructing, loading and lease updates alone create no database."""
+        persistence = AssignmentPersistence(storage_dir=tmp_path)
+        assert await persistence.load_assignments() == {}
+        await persistence.save_assignment("agent-1", "task-1", {}, lease=LEASE)
+        await persistence.remove_assignment("agent-1")
+        assert not (tmp_path / "assignments.db").exists()
+
+        await persistence.save_assignment("agent-1", "task-1", {})
+
+        assert (tmp_path / "assignments.db").exists()
+
+    async def test_uses_wal_journal(self, tmp_path):
+        """The database is opened in WAL mode."""
+        persistence = AssignmentPersistence(storage_dir=tmp_path)
+        await persistence.save_assignment("agent-1", "task-1", {})
+
+        with sqlite3.connect(tmp_path / "assignments.db") as conn:
+            mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        assert mode == "wal"
+
+    async def test_lease_manager_renewal_round_trip(self, tmp_path):
+        """Lease state written by renewals is restored on startup."""
+        persistence = AssignmentPersistence(storage_dir=tmp_path)
+        await persistence.save_assignment("agent-1", "task-1", {"name": "API"})
+        manager = AssignmentLeaseManager(Mock(), persistence)
+        await manager.create_lease("task-1", "agent-1")
+        renewed = await manager.renew_lease("task-1", progress=60)
+
+        restarted = AssignmentLeaseManager(
+            Mock(), AssignmentPersistence(storage_dir=tmp_path)
+        )
+        await restarted.load_active_leases()
+
+        lease = restarted.active_leases["task-1"]
+        assert lease.lease_expires == renewed.lease_expires
+        assert lease.renewal_count == 1
+        assert lease.progress_percentage == 60
+
+
+class TestJSONMigration:
+    """One-time import of the legacy assignments.json document."""
+
+    async def test_json_is_imported_once(self, tmp_path):
+        """Legacy assignments (with lease fields) move into SQLite."""
+        legacy = {
+            "agent-1": {
+                "task_id": "task-1",
+                "assigned_at": "2026-01-01T00:00:00+00:00",
+                "task_data": {"name": "API"},
+                **LEASE,
+            }
+        }
+        (tmp_path / "assignments.json").write_text(json.dumps(legacy))
+
+        loaded = await AssignmentPersistence(storage_dir=tmp_path).load_assignments()
+
+        assert loaded == legacy
+        assert not (tmp_path / "assignments.json").exists()
+        assert (tmp_path / "assignments.json.migrated").exists()
+
+        # A second JSON file is not merged into a populated database
+        (tmp_path / "assignments.json").write_text(
+            json.dumps({"agent-9": {"task_id": "task-9", "task_data": {}}})
+        )
+        again = await AssignmentPersistence(storage_dir=tmp_path).load_assignments()
+        assert set(again) == {"agent-1"}
+        assert (tmp_path / "assignments.json").exists()
+
+    async def test_unreadable_json_is_left_in_place(self, tmp_path):
+        """A corrupt legacy file is not renamed, so it can be inspected."""
+        (tmp_path / "assignments.json").write_text("{not json")
+
+        loaded = await AssignmentPersistence(storage_dir=tmp_path).load_assignments()
+
+        assert loaded == {}
+        assert (tmp_path / "assignments.json").exists()
+
+
+class TestJSONAssignmentPersistence:
+    """The whole-document JSON backend is still available."""
+
+    async def test_round_trip(self, tmp_path):
+        """Assignments and lease updates land in assignments.json."""
+        persistence = AssignmentPersistence(storage_dir=tmp_path, backend="json")
+        await persistence.save_assignment("agent-1", "task-1", {"name": "API"})
+        await persistence.save_assignment("agent-1", "task-1", {}, lease=LEASE)
+
+        on_disk = json.loads((tmp_path / "assignments.json").read_text())
+        assert on_disk["agent-1"]["renewal_count"] == 2
+        assert on_disk["agent-1"]["task_data"] == {"name": "API"}
+        assert not (tmp_path / "assignments.db").exists()
+
+    def test_unknown_backend_rejected(self, tmp_path):
+        """Typos in the backend name fail loudly."""
+        with pytest.raises(ValueError):
+            AssignmentPersistence(storage_dir=tmp_path, backend="yaml")
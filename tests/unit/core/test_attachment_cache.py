@@ -0,0 +1,125 @@
+"""
+Unit tests for the cached, concurrent Kanban attachment fetcher.
+"""
+
+import asyncio
+from typing import Any, Dict, List
+
+import pytest
+
+from src.core.attachment_cache import AttachmentCache, AttachmentRequest
+
+pytestmark = pytest.mark.unit
+
+
+class _Provider:
+    """Fake get_attachments that records calls and peak concurrency."""
+
+    def __init__(self, delay: float = 0.0) -> None:
+        self.delay = delay
+        self.calls: List[str] = []
+        self.in_flight = 0
+        self.peak = 0
+        self.fail: set[str] = set()
+
+    def request(
+        self, card_id: str, signature: Any = "todo", task_id: str = ""
+    ) -> AttachmentRequest:
+        async def fetch() -> Dict[str, Any]:
+            self.calls.append(card_id)
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+            try:
+                await asyncio.sleep(self.delay)
+                if card_id in self.fail:
+                    raise ConnectionError(card_id)
+                return {"success": True, "data": [{"id": card_id}]}
+            finally:
+                self.in_flight -= 1
+
+        return AttachmentRequest(task_id or card_id, card_id, signature, fetch)
+
+
+class TestAttachmentCache:
+    """Test suite for AttachmentCache."""
+
+    async def test_batch_is_concurrent_and_bounded(self):
+        """A batch runs in parallel but never above max_concurrency."""
+        provider = _Provider(delay=0.01)
+        cache = AttachmentCache(max_concurrency=4)
+
+        results = await cache.fetch_all(
+            [provider.request(f"card-{i}") for i in range(20)]
+        )
+
+        assert [r["data"][0]["id"] for r in results] == [
+            f"card-{i}" for i in range(20)
+        ]
+        assert provider.peak == 4
+
+    async def test_duplicates_fetched_once(self):
+        """Cards requested by several dependencies are fetched once."""
+        provider = _Provider()
+        cache = AttachmentCache(ttl_seconds=0)
+
+        results = await cache.fetch_all(
+            [provider.request("shared"), provider.request("shared")]
+        )
+
+        assert provider.calls == ["shared"]
+        assert results[0] is results[1]
+
+    async def test_results_reused_until_signature_changes(self):
+        """Cached results are reused while the task's state is unchanged."""
+        provider = _Provider()
+        cache = AttachmentCache()
+
+        await cache.fetch_all([provider.request("card", "todo")])
+        await cache.fetch_all([provider.request("card", "todo")])
+        assert provider.calls == ["card"]
+        assert (cache.hits, cache.misses) == (1, 1)
+
+        await cache.fetch_all([provider.request("card", "done")])
+        assert provider.calls == ["card", "card"]
+
+    async def test_invalidate_drops_task_entries(self):
+        """Invalidating a task forces its next lookup to refetch."""
+        provider = _Provider()
+        cache = AttachmentCache()
+        await cache.fetch_all(
+            [provider.request("card-a", task_id="a"), provider.request("card-b")]
+        )
+
+        cache.invalidate("a")
+        await cache.fetch_all(
+            [provider.request("card-a", task_id="a"), provider.request("card-b")]
+        )
+
+        assert provider.calls == ["card-a", "card-b", "card-a"]
+
+    async def test_zero_ttl_does_not_reuse(self):
+        """With ttl_seconds=0 each batch fetches again."""
+        provider = _Provider()
+        cache = AttachmentCache(ttl_seconds=0)
+
+        await cache.fetch_all([provider.request("card")])
+        await cache.fetch_all([provider.request("card")])
+
+        assert provider.calls == ["card", "card"]
+
+    async def test_failures_returned_and_not_cached(self):
+        """Provider errors come back as exceptions and are retried later."""
+        provider = _Provider()
+        provider.fail.add("bad")
+        cache = AttachmentCache()
+
+        results = await cache.fetch_all(
+            [provider.request("bad"), provider.request("good")]
+        )
+        assert isinstance(results[0], ConnectionError)
+        assert results[1]["success"] is True
+
+        provider.fail.clear()
+        results = await cache.fetch_all([provider.request("bad")])
+        assert results[0]["success"] is True
+        assert provider.calls == ["bad", "good", "bad"]
@@ -0,0 +1,270 @@
+"""
+Unit tests for the incrementally maintained board health model.
+
+The model must report what BoardHealthAnalyzer reports for the same
+board, while only reprocessing what changed.
+"""
+
+import random
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Tuple
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from src.core.board_health_analyzer import (
+    BoardHealth,
+    BoardHealthAnalyzer,
+    HealthIssueType,
+    IssueSeverity,
+)
+from src.core.board_health_model import BoardHealthModel
+from src.core.board_snapshot import BoardSnapshotService, diff_tasks
+from src.core.metrics import get_metrics
+from src.core.models import Priority, Task, TaskStatus, WorkerStatus
+
+pytestmark = pytest.mark.unit
+
+NOW = datetime.now(timezone.utc)
+SKILL_LABELS = ["python", "react", "database", "devops", "design"]
+
+
+def _task(
+    task_id: str,
+    status: TaskStatus = TaskStatus.TODO,
+    dependencies: Tuple[str, ...] = (),
+    labels: Tuple[str, ...] = (),
+    age_days: float = 0,
+    **kwargs: Any,
+) -> Task:
+    updated = NOW - timedelta(days=age_days)
+    return Task(
+        id=task_id,
+        name=kwargs.pop("name", f"Task {task_id}"),
+        description="",
+        status=status,
+        priority=Priority.MEDIUM,
+        assigned_to=kwargs.pop("assigned_to", None),
+        created_at=updated,
+        updated_at=updated,
+        due_date=None,
+        estimated_hours=1.0,
+        dependencies=list(dependencies),
+        labels=list(labels),
+        **kwargs,
+    )
+
+
+def _agent(agent_id: str, *skills: str) -> WorkerStatus:
+    return WorkerStatus(
+        worker_id=agent_id,
+        name=agent_id,
+        role="Developer",
+        email=None,
+        current_tasks=[],
+        completed_tasks_count=0,
+        capacity=40,
+        skills=list(skills),
+        availability={},
+    )
+
+
+async def _analyze(
+    tasks: List[Task],
+    agents: Dict[str, WorkerStatus],
+    assignments: Dict[str, str],
+    max_tasks_per_agent: int = 3,
+) -> BoardHealth:
+    client = Mock()
+    client.get_all_tasks = AsyncMock(return_value=list(tasks))
+    analyzer = BoardHealthAnalyzer(client, max_tasks_per_agent=max_tasks_per_agent)
+    return await analyzer.analyze_board_health(agents, assignments)
+
+
+def _summary(health: BoardHealth) -> Dict[str, Any]:
+    return {
+        "score": health.health_score,
+        "metrics": health.metrics,
+        "recommendations": sorted(health.recommendations),
+        "issues": sorted(
+            (
+                issue.type.value,
+                issue.severity.value,
+                tuple(sorted(issue.affected_tasks)),
+                tuple(sorted(issue.affected_agents)),
+            )
+            for issue in health.issues
+        ),
+    }
+
+
+def _random_task(rng: random.Random, task_id: str, known: List[str]) -> Task:
+    return _task(
+        task_id,
+        status=rng.choice(list(TaskStatus)),
+        dependencies=tuple(rng.sample(known, min(len(known), rng.randint(0, 3)))),
+        labels=tuple(rng.sample(SKILL_LABELS, rng.randint(0, 2))),
+        age_days=rng.choice([0, 1, 30]),
+    )
+
+
+class TestBoardHealthModel:
+    """Incremental checks against the from-scratch analyzer."""
+
+    async def test_matches_analyzer_through_random_changes(self):
+        rng = random.Random(7)
+        ids = [f"t{i}" for i in range(40)]
+        board = {tid: _random_task(rng, tid, ids[:i]) for i, tid in enumerate(ids)}
+        agents = {"a1": _agent("a1", "python"), "a2": _agent("a2", "react")}
+        assignments = {"a1": "t0"}
+        model = BoardHealthModel()
+        model.sync_tasks(board.values())
+        model.sync_agents(agents, assignments)
+        next_id = len(ids)
+
+        for step in range(60):
+            previous = dict(board)
+            for _ in range(rng.randint(1, 4)):
+                action = rng.random()
+                if action < 0.5:
+                    tid = rng.choice(list(board))
+                    board[tid] = replace(
+                        board[tid],
+                        status=rng.choice(list(TaskStatus)),
+                        updated_at=NOW - timedelta(days=rng.choice([0, 30])),
+                    )
+                elif action < 0.7:
+                    tid = f"t{next_id}"
+                    next_id += 1
+                    board[tid] = _random_task(rng, tid, list(board))
+                elif action < 0.85 and len(board) > 5:
+                    del board[rng.choice(list(board))]
+                else:
+                    tid = rng.choice(list(board))
+                    board[tid] = replace(
+                        board[tid],
+                        dependencies=rng.sample(list(board), rng.randint(0, 3)),
+                    )
+            if step % 10 == 0:
+                agents[f"a{step}"] = _agent(f"a{step}", rng.choice(SKILL_LABELS))
+            if step % 15 == 0 and len(agents) > 2:
+                del agents[sorted(agents)[0]]
+            assignments = {
+                agent_id: rng.choice(list(board))
+                for agent_id in agents
+                if rng.random() < 0.5
+            }
+
+            model.apply_changes(diff_tasks(previous, board, step + 1))
+            model.sync_agents(agents, assignments)
+
+            expected = await _analyze(list(board.values()), agents, assignments)
+            assert _summary(model.report()) == _summary(expected), f"step {step}"
+            assert model.health_score == expected.health_score
+
+    def test_agent_with_missing_skill_clears_mismatch(self):
+        model = BoardHealthModel()
+        model.sync_tasks([_task("t1", labels=("rust",)), _task("t2", labels=("api",))])
+        model.sync_agents({"a1": _agent("a1", "python")}, {})
+
+        issue = model.report().issues[0]
+        assert issue.type == HealthIssueType.SKILL_MISMATCH
+        assert issue.affected_tasks == ["t1", "t2"]
+        assert issue.details["missing_skills"] == {"rust": ["t1"], "api": ["t2"]}
+
+        model.sync_agents({"a1": _agent("a1", "python", "rust")}, {"a1": "t9"})
+        issue = model.report().issues[0]
+        assert issue.affected_tasks == ["t2"]
+
+        model.sync_agents({"a1": _agent("a1", "rust", "api")}, {"a1": "t9"})
+        types = {i.type for i in model.report().issues}
+        assert HealthIssueType.SKILL_MISMATCH not in types
+
+    def test_bottleneck_tracks_dependents_and_completion(self):
+        model = BoardHealthModel()
+        dependents = [_task(f"d{i}", dependencies=("core",)) for i in range(6)]
+        model.sync_tasks([_task("core", name="Core"), *dependents])
+
+        issue = next(
+            i for i in model.report().issues if i.type == HealthIssueType.BOTTLENECK
+        )
+        assert issue.severity == IssueSeverity.CRITICAL
+        assert issue.details["blocked_tasks"] == [f"d{i}" for i in range(6)]
+
+        model.sync_tasks([_task("core", TaskStatus.DONE), *dependents])
+        assert all(i.type != HealthIssueType.BOTTLENECK for i in model.report().issues)
+
+    def test_stale_tasks_surface_as_time_passes(self):
+        clock = [NOW]
+        model = BoardHealthModel(stale_task_days=7, clock=lambda: clock[0])
+        model.sync_tasks(
+            [_task("t1", TaskStatus.IN_PROGRESS, assigned_to="a1", age_days=5)]
+        )
+        score = model.health_score
+        assert all(i.type != HealthIssueType.STALE_TASKS for i in model.report().issues)
+
+        clock[0] = NOW + timedelta(days=3)
+        issue = next(
+            i for i in model.report().issues if i.type == HealthIssueType.STALE_TASKS
+        )
+        assert issue.affected_agents == ["a1"]
+        assert issue.details["stale_tasks"][0]["days_stale"] == 8
+        assert model.health_score == score - 5
+
+        # Progress on the task resets its timer
+        model.sync_tasks([_task("t1", TaskStatus.IN_PROGRESS, age_days=-3)])
+        assert all(i.type != HealthIssueType.STALE_TASKS for i in model.report().issues)
+
+    def test_configure_recomputes_thresholds(self):
+        model = BoardHealthModel()
+        model.sync_tasks([_task("t1", TaskStatus.IN_PROGRESS, age_days=3)])
+        model.sync_agents({"a1": _agent("a1")}, {"a1": ["t1", "t2"]})
+        assert model.report().issues == []
+
+        model.configure(stale_task_days=2, max_tasks_per_agent=1)
+
+        types = [i.type for i in model.report().issues]
+        assert types == [
+            HealthIssueType.STALE_TASKS,
+            HealthIssueType.OVERLOADED_AGENTS,
+        ]
+
+    def test_unchanged_checks_reuse_cached_issues(self):
+        model = BoardHealthModel()
+        model.sync_tasks(
+            [_task("core"), *(_task(f"d{i}", dependencies=("core",)) for i in range(3))]
+        )
+        first = model.report().issues[0]
+
+        model.sync_tasks(
+            [
+                _task("core"),
+                *(_task(f"d{i}", dependencies=("core",)) for i in range(3)),
+                _task("extra"),
+            ]
+        )
+
+        assert model.report().issues[0] is first
+
+    async def test_follows_board_snapshot_feed(self):
+        board = Mock()
+        board.get_all_tasks = AsyncMock(
+            side_effect=[
+                [_task("t1"), _task("t2", TaskStatus.BLOCKED)],
+                [_task("t1", TaskStatus.DONE)],
+            ]
+        )
+        service = BoardSnapshotService(board)
+        model = BoardHealthModel()
+        model.attach(service)
+
+        await service.refresh()
+        assert model.metrics["tasks_by_status"] == {"todo": 1, "blocked": 1}
+
+        await service.refresh()
+        assert model.metrics["tasks_by_status"] == {"done": 1}
+        assert get_metrics().gauge("marcus_board_health_score") == model.health_score
+
+        model.detach()
+        assert service._subscriptions == []
@@ -0,0 +1,336 @@
+"""
+Unit tests for the shared board snapshot and change feed.
+
+Covers change detection, single-flight refreshes shared by several
+monitors, subscriber delivery and the assignment monitor's delta mode.
+"""
+
+import asyncio
+from dataclasses import replace
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from src.core.assignment_reconciliation import AssignmentReconciler
+from src.core.board_snapshot import (
+    TASK_CREATED,
+    TASK_DELETED,
+    TASK_REASSIGNED,
+    TASK_STATUS_CHANGED,
+    TASK_UPDATED,
+    BoardChange,
+    BoardSnapshot,
+    BoardSnapshotService,
+    diff_tasks,
+    get_board_snapshot,
+    reset_board_snapshots,
+)
+from src.core.models import Priority, Task, TaskStatus
+from src.monitoring.assignment_monitor import AssignmentMonitor
+
+pytestmark = pytest.mark.unit
+
+
+def _task(task_id: str, status: TaskStatus = TaskStatus.TODO, **kwargs: Any) -> Task:
+    now = datetime.now(timezone.utc)
+    return Task(
+        id=task_id,
+        name=kwargs.pop("name", f"Task {task_id}"),
+        description="",
+        status=status,
+        priority=Priority.MEDIUM,
+        assigned_to=kwargs.pop("assigned_to", None),
+        created_at=now,
+        updated_at=now,
+        due_date=None,
+        estimated_hours=1.0,
+        **kwargs,
+    )
+
+
+class _CountingBoard:
+    """Kanban stand-in that counts full-board fetches."""
+
+    def __init__(self, tasks: List[Task], latency: float = 0.0) -> None:
+        self.tasks = tasks
+        self.latency = latency
+        self.fetches = 0
+
+    async def get_all_tasks(self) -> List[Task]:
+        self.fetches += 1
+        await asyncio.sleep(self.latency)
+        return list(self.tasks)
+
+    async def get_task_by_id(self, task_id: str) -> Optional[Task]:
+        return next((task for task in self.tasks if task.id == task_id), None)
+
+
+class _MemoryPersistence:
+    """Assignment persistence backed by a dictionary."""
+
+    def __init__(self, assignments: Dict[str, Dict[str, Any]]) -> None:
+        self.assignments = assignments
+        self.removed: List[str] = []
+
+    async def load_assignments(self) -> Dict[str, Dict[str, Any]]:
+        return dict(self.assignments)
+
+    async def remove_assignment(self, worker_id: str) -> None:
+        self.removed.append(worker_id)
+        self.assignments.pop(worker_id, None)
+
+
+class TestDiffTasks:
+    """Typed change detection between snapshots."""
+
+    def test_change_kinds(self):
+        """Each kind of difference maps to one typed change."""
+        old = {
+            "a": _task("a"),
+            "b": _task("b", TaskStatus.IN_PROGRESS, assigned_to="w1"),
+            "c": _task("c", TaskStatus.IN_PROGRESS, assigned_to="w1"),
+            "d": _task("d"),
+            "e": _task("e"),
+        }
+        new = {
+            "a": old["a"],
+            "b": replace(old["b"], status=TaskStatus.DONE),
+            "c": replace(old["c"], assigned_to="w2"),
+            "d": replace(old["d"], name="Renamed"),
+            "f": _task("f"),
+        }
+
+        changes = diff_tasks(old, new, version=7)
+
+        assert [(c.kind, c.task_id) for c in changes] == [
+            (TASK_STATUS_CHANGED, "b"),
+            (TASK_REASSIGNED, "c"),
+            (TASK_UPDATED, "d"),
+            (TASK_CREATED, "f"),
+            (TASK_DELETED, "e"),
+        ]
+        assert changes[0].previous.status == TaskStatus.IN_PROGRESS
+        assert changes[-1].task is None
+        assert {c.version for c in changes} == {7}
+
+
+class TestBoardSnapshotService:
+    """Shared fetching and change delivery."""
+
+    async def test_monitors_share_one_fetch_per_interval(self):
+        """N concurrent readers cause one provider fetch per refresh interval."""
+        board = _CountingBoard([_task(str(i)) for i in range(50)], latency=0.01)
+        service = BoardSnapshotService(board, refresh_interval=60)
+        persistence = _MemoryPersistence({})
+        readers = [AssignmentReconciler(persistence, board, service) for _ in range(8)]
+
+        snapshots = await asyncio.gather(*(r._get_all_tasks() for r in readers))
+        assert board.fetches == 1
+        assert all(len(tasks) == 50 for tasks in snapshots)
+
+        await asyncio.gather(*(r.reconcile_assignments() for r in readers))
+        assert board.fetches == 1
+
+        service.invalidate()
+        await asyncio.gather(*(r._get_all_tasks() for r in readers))
+        assert board.fetches == 2
+
+    async def test_background_refresh_fetches_once_per_interval(self):
+        """With several subscribers the loop still fetches once per interval."""
+        board = _CountingBoard([_task("a")])
+        service = BoardSnapshotService(board, refresh_interval=0.05)
+        received: List[int] = []
+        for _ in range(5):
+            service.subscribe(lambda changes, snapshot: received.append(len(changes)))
+
+        await service.start()
+        await asyncio.sleep(0.22)
+        await service.stop()
+
+        assert 4 <= board.fetches <= 6
+        # Each subscriber bootstraps once; unchanged fetches carry no changes
+        assert received[:5] == [1] * 5
+        assert set(received[5:]) == {0}
+
+    async def test_subscribers_receive_only_deltas(self):
+        """After bootstrapping, subscribers see just the changed tasks."""
+        board = _CountingBoard([_task("a"), _task("b")])
+        service = BoardSnapshotService(board)
+        deliveries: List[List[BoardChange]] = []
+
+        async def on_changes(changes, snapshot: BoardSnapshot) -> None:
+            deliveries.append(changes)
+
+        unsubscribe = service.subscribe(on_changes)
+        first = await service.refresh()
+        board.tasks = [replace(board.tasks[0], status=TaskStatus.DONE)]
+        second = await service.refresh()
+        unchanged = await service.refresh()
+        unsubscribe()
+        board.tasks = []
+        await service.refresh()
+
+        assert [[c.kind for c in d] for d in deliveries] == [
+            [TASK_CREATED, TASK_CREATED],
+            [TASK_STATUS_CHANGED, TASK_DELETED],
+            [],
+        ]
+        assert (first.version, second.version, unchanged.version) == (1, 2, 2)
+
+    async def test_failing_subscriber_does_not_stop_others(self):
+        """A subscriber error is logged; other subscribers still run."""
+        service = BoardSnapshotService(_CountingBoard([_task("a")]))
+        seen: List[str] = []
+
+        def broken(changes, snapshot):
+            raise RuntimeError("boom")
+
+        service.subscribe(broken)
+        service.subscribe(lambda changes, snapshot: seen.append(changes[0].task_id))
+
+        await service.refresh()
+
+        assert seen == ["a"]
+
+    async def test_failed_fetch_is_shared_and_retried(self):
+        """A failed fetch raises and the next read fetches again."""
+        board = _CountingBoard([_task("a")])
+        board.get_all_tasks = AsyncMock(side_effect=[ConnectionError("down"), []])
+        service = BoardSnapshotService(board)
+
+        with pytest.raises(ConnectionError):
+            await service.get_snapshot()
+        snapshot = await service.get_snapshot()
+
+        assert snapshot.tasks == [] and board.get_all_tasks.await_count == 2
+
+    async def test_restored_snapshot_is_served_and_diffed_against(self):
+        """A board saved before a restart avoids the bootstrap download."""
+        board = _CountingBoard([_task("a"), _task("b")])
+        service = BoardSnapshotService(board, refresh_interval=60)
+
+        assert service.restore(list(board.tasks), version=7, age=5.0)
+        assert not service.restore([], version=1)
+
+        cached = await service.get_snapshot()
+        assert board.fetches == 0
+        assert cached.version == 7 and cached.age >= 5.0
+
+        # An unchanged board keeps the restored version; a change moves on
+        assert (await service.refresh()).version == 7
+        board.tasks = [replace(board.tasks[0], status=TaskStatus.DONE)]
+        assert (await service.refresh()).version == 8
+
+    def test_shared_service_per_client(self):
+        """The registry returns one service per kanban client."""
+        reset_board_snapshots()
+        try:
+            client = Mock()
+            assert get_board_snapshot(client) is get_board_snapshot(client)
+            assert get_board_snapshot(Mock()) is not get_board_snapshot(client)
+        finally:
+            reset_board_snapshots()
+
+
+class TestAssignmentMonitorDeltas:
+    """AssignmentMonitor driven by the change feed."""
+
+    async def test_reversion_detected_from_change_feed(self):
+        """Only assignments whose task changed are re-checked."""
+        board = _CountingBoard(
+            [
+                _task("t1", TaskStatus.IN_PROGRESS, assigned_to="w1"),
+                _task("t2", TaskStatus.IN_PROGRESS, assigned_to="w2"),
+            ]
+        )
+        service = BoardSnapshotService(board, refresh_interval=3600)
+        persistence = _MemoryPersistence(
+            {"w1": {"task_id": "t1"}, "w2": {"task_id": "t2"}}
+        )
+        monitor = AssignmentMonitor(persistence, board, board_snapshot=service)
+        monitor._detect_reversion = AsyncMock(  # type: ignore[method-assign]
+            wraps=monitor._detect_reversion
+        )
+
+        await monitor.start()
+        try:
+            await service.refresh()
+            assert monitor._detect_reversion.await_count == 2
+
+            board.tasks = [replace(board.tasks[0], status=TaskStatus.TODO)] + [
+                board.tasks[1]
+            ]
+            await service.refresh()
+        finally:
+            await monitor.stop()
+            await service.stop()
+
+        # Two initial checks, the changed t1, and t1 re-read before removal
+        assert monitor._detect_reversion.await_count == 4
+        assert persistence.removed == ["w1"]
+        assert board.fetches == 2
+
+    async def test_new_assignment_checked_without_board_change(self):
+        """An assignment made after the last check is verified once."""
+        board = _CountingBoard([_task("t1")])
+        service = BoardSnapshotService(board, refresh_interval=3600)
+        persistence = _MemoryPersistence({})
+        monitor = AssignmentMonitor(persistence, board, board_snapshot=service)
+
+        await monitor.start()
+        try:
+            await service.refresh()
+            persistence.assignments["w1"] = {"task_id": "t1"}
+            await service.refresh()
+        finally:
+            await monitor.stop()
+            await service.stop()
+
+        # t1 never left TODO, so the persisted assignment is a reversion
+        assert persistence.removed == ["w1"]
+
+    async def test_assignment_saved_during_fetch_is_kept(self):
+        """An assignment made while the board was being fetched survives."""
+        board = _CountingBoard([_task("t1")], latency=0.05)
+        service = BoardSnapshotService(board, refresh_interval=3600)
+        persistence = _MemoryPersistence({})
+        monitor = AssignmentMonitor(persistence, board, board_snapshot=service)
+
+        async def assign_during_fetch() -> None:
+            # Mirrors request_next_task: move the task, then save the lease
+            await asyncio.sleep(0.01)
+            board.tasks = [
+                replace(board.tasks[0], status=TaskStatus.IN_PROGRESS, assigned_to="w1")
+            ]
+            persistence.assignments["w1"] = {
+                "task_id": "t1",
+                "assigned_at": datetime.now(timezone.utc).isoformat(),
+            }
+
+        await monitor.start()
+        try:
+            await asyncio.gather(service.refresh(), assign_during_fetch())
+            assert persistence.removed == []
+            await service.refresh()
+        finally:
+            await monitor.stop()
+            await service.stop()
+
+        assert persistence.removed == []
+        assert persistence.assignments["w1"]["task_id"] == "t1"
+
+    async def test_reversion_rechecked_before_removal(self):
+        """A stale snapshot alone does not remove an assignment."""
+        board = _CountingBoard([_task("t1")])
+        persistence = _MemoryPersistence({"w1": {"task_id": "t1"}})
+        monitor = AssignmentMonitor(persistence, board)
+        stale = {"t1": board.tasks[0]}
+        board.tasks = [
+            replace(board.tasks[0], status=TaskStatus.IN_PROGRESS, assigned_to="w1")
+        ]
+
+        await monitor._process_assignments(persistence.assignments, stale)
+
+        assert persistence.removed == []
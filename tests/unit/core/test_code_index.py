@@ -0,0 +1,299 @@
+"""
+Unit tests for the local code index.
+
+Builds temporary git repositories and checks symbol extraction, incremental
+updates from ``git diff`` and the ``CodeAnalyzer`` integration.
+"""
+
+import subprocess
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from src.core.code_analyzer import CodeAnalyzer
+from src.core.code_index import (
+    SYMBOL_CLASS,
+    SYMBOL_ENDPOINT,
+    SYMBOL_MODEL,
+    CodeIndex,
+    CodeSymbol,
+    JavaScriptExtractor,
+    PythonExtractor,
+    SymbolExtractor,
+    get_code_index,
+    reset_code_indexes,
+)
+
+pytestmark = pytest.mark.unit
+
+API_SOURCE = '''
+from fastapi import APIRouter
+from pydantic import BaseModel
+
+router = APIRouter()
+
+
+class User(BaseModel):
+    name: str
+
+
+class UserService:
+    def lookup(self, name):
+        return name
+
+
+@router.get("/users")
+async def list_users():
+    return []
+
+
+@router.post("/users")
+async def create_user(user: User):
+    return user
+'''
+
+
+def _git(repo: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", *args], cwd=repo, capture_output=True, text=True, check=True
+    ).stdout
+
+
+def _commit(repo: Path, message: str) -> None:
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-q", "-m", message)
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    """Git repository with one committed FastAPI module."""
+    _git(tmp_path, "init", "-q")
+    _git(tmp_path, "config", "user.email", "test@example.com")
+    _git(tmp_path, "config", "user.name", "Test")
+    (tmp_path / "app").mkdir()
+    (tmp_path / "app" / "api.py").write_text(API_SOURCE)
+    (tmp_path / "README.md").write_text("# demo\n")
+    _commit(tmp_path, "initial")
+    return tmp_path
+
+
+class _CountingExtractor(SymbolExtractor):
+    """Python extractor that records which files it parsed."""
+
+    language = "python"
+    extensions = (".py",)
+
+    def __init__(self) -> None:
+        self.parsed: List[str] = []
+
+    def extract(self, path: str, source: str) -> List[CodeSymbol]:
+        self.parsed.append(path)
+        return PythonExtractor().extract(path, source)
+
+
+class TestExtractors:
+    """Per-language symbol extraction."""
+
+    def test_python_symbols(self):
+        """Routes, models, classes, methods and tests are recognized."""
+        source = API_SOURCE + (
+            "\n@app.route('/health', methods=['GET', 'HEAD'])\n"
+            "def health():\n    return 'ok'\n\n"
+            "def test_health():\n    assert health()\n"
+        )
+        symbols = PythonExtractor().extract("app/api.py", source)
+        by_kind = {}
+        for symbol in symbols:
+            by_kind.setdefault(symbol.kind, []).append(symbol)
+
+        assert [(s.method, s.route) for s in by_kind[SYMBOL_ENDPOINT]] == [
+            ("GET", "/users"),
+            ("POST", "/users"),
+            ("GET", "/health"),
+            ("HEAD", "/health"),
+        ]
+        assert [s.name for s in by_kind[SYMBOL_MODEL]] == ["User"]
+        assert [s.name for s in by_kind[SYMBOL_CLASS]] == ["UserService"]
+        assert "UserService.lookup" in [s.name for s in by_kind["function"]]
+        assert [s.name for s in by_kind["test"]] == ["test_health"]
+
+    def test_python_syntax_error_yields_nothing(self):
+        """A file that does not parse is skipped."""
+        assert PythonExtractor().extract("bad.py", "def broken(:\n") == []
+
+    def test_javascript_symbols(self):
+        """Express routes, functions, interfaces and tests with line numbers."""
+        source = (
+            "interface Todo { id: number }\n"
+            "router.post('/todos', createTodo);\n"
+            "export function createTodo(req, res) {}\n"
+            "const listTodos = async (req, res) => {};\n"
+            "test('creates a todo', () => {});\n"
+        )
+        symbols = JavaScriptExtractor().extract("src/todos.ts", source)
+
+        assert [(s.kind, s.name, s.line) for s in symbols] == [
+            ("model", "Todo", 1),
+            ("endpoint", "POST /todos", 2),
+            ("function", "createTodo", 3),
+            ("function", "listTodos", 4),
+            ("test", "creates a todo", 5),
+        ]
+
+
+class TestCodeIndex:
+    """Building and incrementally updating the index."""
+
+    def test_build_indexes_worktree(self, repo):
+        """The first update indexes every supported file."""
+        index = CodeIndex(repo)
+        delta = index.update()
+
+        assert delta.changed_files == ["app/api.py"]
+        assert index.commit == _git(repo, "rev-parse", "HEAD").strip()
+        assert [(e.method, e.route) for e in index.endpoints()] == [
+            ("GET", "/users"),
+            ("POST", "/users"),
+        ]
+        assert [m.name for m in index.models()] == ["User"]
+        assert index.find("create_user")[0].path == "app/api.py"
+
+    def test_update_parses_only_changed_files(self, repo):
+        """Commits are diffed; untouched files are never re-read."""
+        extractor = _CountingExtractor()
+        (repo / "app" / "other.py").write_text("def helper():\n    pass\n")
+        _commit(repo, "add helper")
+        index = CodeIndex(repo, extractors={".py": extractor})
+        index.update()
+        extractor.parsed.clear()
+
+        (repo / "app" / "orders.py").write_text(
+            "from app.api import router\n\n"
+            "@router.get('/orders')\ndef list_orders():\n    return []\n"
+        )
+        _commit(repo, "add orders")
+        delta = index.update()
+
+        assert extractor.parsed == ["app/orders.py"]
+        assert [s.name for s in delta.added if s.kind == SYMBOL_ENDPOINT] == [
+            "list_orders"
+        ]
+        assert "/orders" in [e.route for e in index.endpoints()]
+        implementation = delta.as_implementation()
+        assert implementation["files"] == ["app/orders.py"]
+        assert implementation["endpoints"][0]["route"] == "/orders"
+
+    def test_update_handles_edits_renames_and_deletes(self, repo):
+        """Removed symbols leave the index; renamed files move."""
+        index = CodeIndex(repo)
+        index.update()
+
+        _git(repo, "mv", "app/api.py", "app/routes.py")
+        source = (repo / "app" / "routes.py").read_text()
+        (repo / "app" / "routes.py").write_text(
+            source.replace('@router.post("/users")', '@router.put("/users")')
+        )
+        _commit(repo, "rename and change method")
+        delta = index.update()
+
+        assert index.files() == ["app/routes.py"]
+        assert delta.removed_files == ["app/api.py"]
+        assert [(e.method, e.path) for e in index.endpoints()] == [
+            ("GET", "app/routes.py"),
+            ("PUT", "app/routes.py"),
+        ]
+
+        (repo / "app" / "routes.py").unlink()
+        _commit(repo, "delete")
+        index.update()
+
+        assert index.files() == []
+        assert index.endpoints() == [] and index.find("User") == []
+
+    def test_uncommitted_changes_are_tracked_and_reverted(self, repo):
+        """Worktree edits are indexed and dropped again once reverted."""
+        index = CodeIndex(repo)
+        index.update()
+
+        (repo / "app" / "draft.py").write_text("class Draft(BaseModel):\n    x = 1\n")
+        index.update()
+        assert "Draft" in [m.name for m in index.models()]
+
+        (repo / "app" / "draft.py").unlink()
+        delta = index.update()
+
+        assert delta.removed_files == ["app/draft.py"]
+        assert "Draft" not in [m.name for m in index.models()]
+
+    def test_commit_delta_covers_only_the_range(self, repo):
+        """Symbols outside the compared commits are not attributed."""
+        base = _git(repo, "rev-parse", "HEAD").strip()
+        (repo / "app" / "orders.py").write_text("class Order(BaseModel):\n    x = 1\n")
+        source = (repo / "app" / "api.py").read_text()
+        (repo / "app" / "api.py").write_text(
+            source.replace("class UserService", "class Users")
+        )
+        _commit(repo, "orders")
+        index = CodeIndex(repo)
+
+        delta = index.commit_delta(base, _git(repo, "rev-parse", "HEAD").strip())
+
+        assert delta.changed_files == ["app/api.py", "app/orders.py"]
+        assert sorted(s.name for s in delta.added) == ["Order", "Users", "Users.lookup"]
+        assert sorted(s.name for s in delta.removed) == [
+            "UserService",
+            "UserService.lookup",
+        ]
+        assert not index.built
+
+    def test_non_git_directory_falls_back_to_walk(self, tmp_path):
+        """Plain directories are indexed by walking the filesystem."""
+        (tmp_path / "models.py").write_text("class Item(Base):\n    pass\n")
+        (tmp_path / "node_modules").mkdir()
+        (tmp_path / "node_modules" / "lib.js").write_text("function vendored() {}\n")
+        index = CodeIndex(tmp_path)
+        index.update()
+
+        assert index.commit is None
+        assert index.files() == ["models.py"]
+        assert index.summary()["symbols"] == {"model": 1}
+
+    def test_shared_index_per_root(self, repo):
+        """The registry returns one index per resolved repository root."""
+        reset_code_indexes()
+        try:
+            assert get_code_index(repo) is get_code_index(str(repo) + "/.")
+        finally:
+            reset_code_indexes()
+
+
+class TestCodeAnalyzerLocalIndex:
+    """CodeAnalyzer answers from the local index without MCP calls."""
+
+    async def test_implementation_details_from_index(self, repo):
+        """Endpoints and models come from the worktree, kept up to date."""
+
+        async def fail(*args, **kwargs):
+            raise AssertionError("remote lookup should not happen")
+
+        analyzer = CodeAnalyzer(mcp_caller=fail, code_index=CodeIndex(repo))
+
+        endpoints = await analyzer.get_implementation_details(
+            "owner", "repo", "endpoints"
+        )
+        assert [(e["method"], e["path"]) for e in endpoints["implementations"]] == [
+            ("GET", "/users"),
+            ("POST", "/users"),
+        ]
+
+        (repo / "app" / "schemas.py").write_text(
+            "class Order(BaseModel):\n    id: int\n"
+        )
+        models = await analyzer.get_implementation_details("owner", "repo", "models")
+        schemas = await analyzer.get_implementation_details(
+            "owner", "repo", "schemas"
+        )
+
+        assert [m["name"] for m in models["implementations"]] == ["User", "Order"]
+        assert [m["name"] for m in schemas["implementations"]] == ["Order"]
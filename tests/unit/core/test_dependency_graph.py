@@ -0,0 +1,183 @@
+"""
+Unit tests for the shared dependency graph engine.
+"""
+
+import random
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Set
+
+import pytest
+
+from src.core.dependency_graph import DependencyGraph
+from src.core.models import Priority, Task, TaskStatus
+
+pytestmark = pytest.mark.unit
+
+
+def _task(task_id: str, dependencies: Optional[List[str]] = None) -> Task:
+    now = datetime.now(timezone.utc)
+    return Task(
+        id=task_id,
+        name=f"Task {task_id}",
+        description="",
+        status=TaskStatus.TODO,
+        priority=Priority.MEDIUM,
+        assigned_to=None,
+        created_at=now,
+        updated_at=now,
+        due_date=None,
+        estimated_hours=1.0,
+        dependencies=dependencies or [],
+    )
+
+
+def _random_dag(size: int, seed: int) -> List[Task]:
+    rng = random.Random(seed)  # nosec B311
+    tasks = []
+    for i in range(size):
+        deps = [f"t{j}" for j in rng.sample(range(i), min(i, rng.randint(0, 3)))]
+        if rng.random() < 0.1:
+            deps.append(f"missing{i}")
+        tasks.append(_task(f"t{i}", deps))
+    rng.shuffle(tasks)
+    return tasks
+
+
+def _naive_longest(task_map: Dict[str, Task], task_id: str) -> List[str]:
+    """Reference exhaustive search (the pre-engine implementation)."""
+
+    def walk(node: str, visited: Set[str]) -> List[str]:
+        task = task_map.get(node)
+        if not task or not task.dependencies:
+            return [node]
+        longest = [node]
+        for dep_id in task.dependencies:
+            if dep_id not in visited:
+                path = walk(dep_id, visited | {node})
+                if len(path) + 1 > len(longest):
+                    longest = [node] + path
+        return longest
+
+    return walk(task_id, set())
+
+
+def _naive_redundant(tasks: List[Task]) -> Set[tuple]:
+    """Reference reachability walk (the pre-engine implementation)."""
+    task_map = {t.id: t for t in tasks}
+    redundant = set()
+    for task in tasks:
+        if len(task.dependencies) < 2:
+            continue
+        reachable: Set[str] = set()
+
+        def walk(dep_id: str, visited: Set[str]) -> None:
+            if dep_id in visited or dep_id not in task_map:
+                return
+            visited.add(dep_id)
+            for next_dep in task_map[dep_id].dependencies:
+                reachable.add(next_dep)
+                walk(next_dep, visited)
+
+        for dep_id in task.dependencies:
+            walk(dep_id, set())
+        for dep_id in set(task.dependencies) & reachable:
+            redundant.add((task.id, dep_id))
+    return redundant
+
+
+class TestDependencyGraph:
+    """Test suite for DependencyGraph."""
+
+    def test_indexes_tasks_then_missing_dependencies(self):
+        """Missing dependency IDs get nodes after the tasks."""
+        graph = DependencyGraph([_task("a"), _task("b", ["a", "ghost", "a"])])
+
+        assert graph.ids == ["a", "b", "ghost"]
+        assert graph.task_count == 2
+        assert graph.deps[graph.index["b"]] == [0, 2]
+
+    def test_topological_order_puts_dependencies_first(self):
+        """Every dependency precedes its dependents."""
+        tasks = _random_dag(200, seed=1)
+        graph = DependencyGraph(tasks)
+        position = {node: i for i, node in enumerate(graph.topological_order())}
+
+        assert len(position) == graph.node_count
+        for node, node_deps in enumerate(graph.deps):
+            for dep in node_deps:
+                assert position[dep] < position[node]
+        assert not graph.has_cycle
+
+    def test_cycle_is_detected(self):
+        """Nodes on a cycle cannot be ordered."""
+        graph = DependencyGraph([_task("a", ["b"]), _task("b", ["a"]), _task("c")])
+
+        assert graph.has_cycle
+        assert [graph.ids[n] for n in graph.topological_order()] == ["c"]
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_longest_chain_matches_exhaustive_search(self, seed):
+        """Memoised longest paths equal the exhaustive search on DAGs."""
+        tasks = _random_dag(40, seed)
+        task_map = {t.id: t for t in tasks}
+        graph = DependencyGraph(tasks)
+
+        for task in tasks:
+            expected = _naive_longest(task_map, task.id)
+            assert graph.longest_chain(task.id) == expected
+            assert graph.chain_length(task.id) == len(expected)
+
+    def test_longest_chain_terminates_on_cycles(self):
+        """Cyclic boards still yield finite chains."""
+        graph = DependencyGraph(
+            [
+                _task("a", ["b"]),
+                _task("b", ["c"]),
+                _task("c", ["a"]),
+                _task("d", ["a"]),
+            ]
+        )
+
+        chain = graph.longest_chain("d")
+        assert chain[0] == "d"
+        assert len(chain) == len(set(chain)) == 4
+        assert graph.longest_chain("unknown") == []
+        assert graph.chain_length("unknown") == 0
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_redundant_dependencies_match_reachability_walk(self, seed):
+        """Bitset reachability agrees with the per-task walk, cycles included."""
+        tasks = _random_dag(60, seed)
+        rng = random.Random(seed)  # nosec B311
+        for task in rng.sample(tasks, 3):
+            task.dependencies.append(rng.choice(tasks).id)
+
+        graph = DependencyGraph(tasks)
+
+        assert set(graph.redundant_dependencies()) == _naive_redundant(tasks)
+
+    def test_transitive_reduction(self):
+        """A -> B -> C makes A -> C redundant."""
+        graph = DependencyGraph(
+            [_task("c"), _task("b", ["c"]), _task("a", ["c", "b"]), _task("d", ["a"])]
+        )
+
+        assert graph.redundant_dependencies() == [("a", "c")]
+        assert graph.transitive_reduction() == {
+            "c": [],
+            "b": ["c"],
+            "a": ["b"],
+            "d": ["a"],
+        }
+
+    def test_diamond_ladder_is_fast(self):
+        """Diamond-heavy graphs no longer explode combinatorially."""
+        tasks = [_task("l0")]
+        for layer in range(1, 60, 2):
+            tasks.append(_task(f"l{layer}a", [f"l{layer - 1}"]))
+            tasks.append(_task(f"l{layer}b", [f"l{layer - 1}"]))
+            tasks.append(_task(f"l{layer + 1}", [f"l{layer}a", f"l{layer}b"]))
+
+        graph = DependencyGraph(tasks)
+
+        assert graph.chain_length("l60") == 61
@@ -528,3 +528,108 @@ class TestMemory:
 
         # Median of [1, 2, 3, 4] = (2 + 3) / 2 = 2.5
         assert median == 2.5
+
+
+def _outcome(task_id: str, name: str, agent_id: str = "agent_1") -> TaskOutcome:
+    return TaskOutcome(
+        task_id=task_id,
+        agent_id=agent_id,
+        task_name=name,
+        estimated_hours=4.0,
+        actual_hours=5.0,
+        success=True,
+        completed_at=datetime.now(timezone.utc),
+    )
+
+
+def _linear_similar(outcomes, name, limit):
+    """Reference full scan (the pre-index implementation)."""
+    query = set(name.lower().split())
+    scored = []
+    for outcome in reversed(outcomes):
+        words = set(outcome.task_name.lower().split())
+        similarity = 0.0
+        if query and words:
+            similarity = len(query & words) / len(query | words)
+        scored.append((similarity, outcome))
+    scored.sort(key=lambda x: x[0], reverse=True)
+    return [outcome for _, outcome in scored[:limit]]
+
+
+class TestOutcomeIndex:
+    """Test suite for the indexed similar-outcome retrieval"""
+
+    @pytest.mark.asyncio
+    async def test_matches_full_scan_including_ties_and_padding(self):
+        """Indexed top-k equals the linear scan, recency breaking ties"""
+        import random
+
+        rng = random.Random(3)  # nosec B311
+        words = ["build", "user", "api", "design", "ui", "test", "deploy", "db"]
+        memory = Memory()
+        for i in range(300):
+            name = " ".join(rng.sample(words, rng.randint(1, 3)))
+            memory.episodic["outcomes"].append(_outcome(f"t{i}", name))
+
+        for query in ["Build User API", "deploy", "unrelated words", ""]:
+            for limit in (1, 5, 20):
+                task = Mock(spec=Task)
+                task.name = query
+                expected = _linear_similar(memory.episodic["outcomes"], query, limit)
+                assert await memory.find_similar_outcomes(task, limit) == expected
+
+    @pytest.mark.asyncio
+    async def test_retention_bounds_outcomes_and_index(self):
+        """Only the newest max_outcomes are kept, timelined and searchable"""
+        memory = Memory(max_outcomes=3)
+        for i in range(5):
+            task = Task(
+                id=f"task_{i}",
+                name=f"Feature {i}",
+                description="Test",
+                status=TaskStatus.TODO,
+                priority=Priority.MEDIUM,
+                assigned_to=None,
+                created_at=datetime.now(timezone.utc),
+                updated_at=datetime.now(timezone.utc),
+                due_date=None,
+                estimated_hours=2.0,
+            )
+            await memory.record_task_start("agent_1", task)
+            await memory.record_task_completion(
+                "agent_1", f"task_{i}", success=True, actual_hours=2.0
+            )
+
+        assert [o.task_id for o in memory.episodic["outcomes"]] == [
+            "task_2",
+            "task_3",
+            "task_4",
+        ]
+        assert len(memory._outcome_index) == 3
+        timeline = [o for day in memory.episodic["timeline"].values() for o in day]
+        assert timeline == memory.episodic["outcomes"]
+        task = Mock(spec=Task)
+        task.name = "Feature 0"
+        similar = await memory.find_similar_outcomes(task, limit=5)
+        assert {o.task_id for o in similar} == {"task_2", "task_3", "task_4"}
+
+    def test_agent_outcomes_use_per_agent_index(self):
+        """Agent history comes from the per-agent index, oldest first"""
+        memory = Memory()
+        memory.episodic["outcomes"].extend(
+            [
+                _outcome("t1", "a", "agent_1"),
+                _outcome("t2", "b", "agent_2"),
+                _outcome("t3", "c", "agent_1"),
+            ]
+        )
+
+        assert [o.task_id for o in memory.get_agent_outcomes("agent_1")] == [
+            "t1",
+            "t3",
+        ]
+        assert memory.get_agent_outcomes("nobody") == []
+
+        # Replacing the list triggers a rebuild
+        memory.episodic["outcomes"] = [_outcome("t4", "d", "agent_1")]
+        assert [o.task_id for o in memory.get_agent_outcomes("agent_1")] == ["t4"]
@@ -0,0 +1,330 @@
+"""
+Unit tests for the per-repository agent branch merge queue.
+"""
+
+import asyncio
+import subprocess
+import threading
+from pathlib import Path
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from src.core.merge_queue import (
+    MERGE_CONFLICTED,
+    MERGE_MERGED,
+    MERGE_SKIPPED,
+    MergeQueue,
+    get_merge_queue,
+    reset_merge_queues,
+)
+from src.marcus_mcp.tools import task as task_tools
+from src.marcus_mcp.tools.task import (
+    _drain_merge_followups,
+    _merge_agent_branch_to_main,
+    _take_queued_merge_conflicts,
+)
+
+pytestmark = pytest.mark.unit
+
+
+def _git(repo: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", *args], cwd=repo, capture_output=True, text=True, check=True
+    ).stdout
+
+
+def _init_repo(path: Path) -> Path:
+    path.mkdir()
+    _git(path, "init", "-q", "-b", "main")
+    _git(path, "config", "user.email", "test@example.com")
+    _git(path, "config", "user.name", "Test")
+    (path / "shared.txt").write_text("base\n")
+    _git(path, "add", ".")
+    _git(path, "commit", "-q", "-m", "initial")
+    return path
+
+
+def _agent_commit(repo: Path, agent_id: str, filename: str, content: str) -> None:
+    branch = f"marcus/{agent_id}"
+    if _git(repo, "branch", "--list", branch).strip():
+        _git(repo, "checkout", "-q", branch)
+    else:
+        _git(repo, "checkout", "-q", "-b", branch, "main")
+    (repo / filename).write_text(content)
+    _git(repo, "add", filename)
+    _git(repo, "commit", "-q", "-m", f"{agent_id} work")
+    _git(repo, "checkout", "-q", "main")
+
+
+async def _settle(queue: MergeQueue) -> None:
+    """Wait for queued merges and the follow-ups they started."""
+    await queue.join()
+    await _drain_merge_followups()
+
+
+@pytest.fixture(autouse=True)
+def _fresh_queues():
+    reset_merge_queues()
+    task_tools._flagged_merge_conflicts.clear()
+    yield
+    reset_merge_queues()
+    task_tools._flagged_merge_conflicts.clear()
+
+
+class TestMergeQueue:
+    """Test suite for MergeQueue."""
+
+    async def test_merges_agent_branch(self, tmp_path):
+        """A branch with commits is merged with the completion message."""
+        repo = _init_repo(tmp_path / "repo")
+        _agent_commit(repo, "agent-1", "feature.txt", "feature\n")
+
+        result = await MergeQueue(repo).merge("agent-1", "task-1")
+
+        assert result.status == MERGE_MERGED
+        assert (repo / "feature.txt").exists()
+        assert result.merge_commit == _git(repo, "rev-parse", "HEAD").strip()
+        assert result.base_commit == _git(repo, "rev-parse", "HEAD^1").strip()
+        assert "Merge marcus/agent-1 (task task-1 by agent-1)" in _git(
+            repo, "log", "-1", "--format=%s"
+        )
+
+    async def test_missing_branch_is_skipped(self, tmp_path):
+        """Agents that worked on main directly need no merge."""
+        repo = _init_repo(tmp_path / "repo")
+
+        result = await MergeQueue(repo).merge("agent-1", "task-1")
+
+        assert result.status == MERGE_SKIPPED
+
+    async def test_conflict_reports_files_and_aborts(self, tmp_path):
+        """Conflicts come back as data and leave main clean."""
+        repo = _init_repo(tmp_path / "repo")
+        _agent_commit(repo, "agent-1", "shared.txt", "agent one\n")
+        _agent_commit(repo, "agent-2", "shared.txt", "agent two\n")
+        queue = MergeQueue(repo)
+
+        first = await queue.merge("agent-1", "task-1")
+        second = await queue.merge("agent-2", "task-2")
+
+        assert first.status == MERGE_MERGED
+        assert second.status == MERGE_CONFLICTED
+        assert second.conflicted_files == ["shared.txt"]
+        assert second.conflict_details()["target"] == "main"
+        assert queue.last_result("agent-2") is second
+        assert _git(repo, "status", "--porcelain") == ""
+
+    async def test_concurrent_submissions_are_serialized(self, tmp_path):
+        """Concurrent completions all land on main, in submission order."""
+        repo = _init_repo(tmp_path / "repo")
+        agents = [f"agent-{i}" for i in range(6)]
+        for agent_id in agents:
+            _agent_commit(repo, agent_id, f"{agent_id}.txt", agent_id)
+        queue = MergeQueue(repo)
+
+        tickets = [queue.submit(agent_id, f"task-{agent_id}") for agent_id in agents]
+        results = await asyncio.gather(*(t.future for t in tickets))
+
+        assert [t.position for t in tickets] == list(range(6))
+        assert all(r.status == MERGE_MERGED for r in results)
+        merges = _git(repo, "log", "--merges", "--reverse", "--format=%s")
+        assert [line.split()[1] for line in merges.splitlines()] == [
+            f"marcus/{agent_id}" for agent_id in agents
+        ]
+        assert queue.depth == 0
+
+    def test_registry_shares_queue_per_repository(self, tmp_path):
+        """Equivalent paths resolve to the same queue."""
+        assert get_merge_queue(tmp_path) is get_merge_queue(tmp_path / ".")
+        assert get_merge_queue(tmp_path) is not get_merge_queue(tmp_path / "other")
+
+
+class TestMergeAgentBranchToMain:
+    """The report_task_progress merge helper on top of the queue."""
+
+    @staticmethod
+    def _state(repo: Path) -> Mock:
+        state = Mock()
+        state.kanban_client._load_workspace_state = Mock(
+            return_value={"project_root": str(repo)}
+        )
+        return state
+
+    async def test_merged_status(self, tmp_path):
+        """A caller that waits for the merge gets merge_status='merged'."""
+        repo = _init_repo(tmp_path / "repo")
+        _agent_commit(repo, "agent-1", "feature.txt", "feature\n")
+
+        result = await _merge_agent_branch_to_main(
+            "agent-1", "task-1", self._state(repo), wait_timeout=5
+        )
+
+        assert result == {"success": True, "merge_status": "merged"}
+
+    async def test_conflict_returns_structured_failure(self, tmp_path):
+        """Conflicts keep the legacy error shape and add the file list."""
+        repo = _init_repo(tmp_path / "repo")
+        _agent_commit(repo, "agent-1", "shared.txt", "agent one\n")
+        _agent_commit(repo, "agent-2", "shared.txt", "agent two\n")
+        state = self._state(repo)
+        await _merge_agent_branch_to_main("agent-1", "task-1", state, wait_timeout=5)
+
+        result = await _merge_agent_branch_to_main(
+            "agent-2", "task-2", state, wait_timeout=5
+        )
+
+        assert result["success"] is False
+        assert result["error"] == "merge_conflict"
+        assert result["merge_status"] == "conflicted"
+        assert result["conflicts"]["files"] == ["shared.txt"]
+        assert "shared.txt" in result["message"]
+
+    async def test_returns_queued_without_waiting(self, tmp_path):
+        """By default the tool call does not wait for git."""
+        repo = _init_repo(tmp_path / "repo")
+        _agent_commit(repo, "agent-1", "feature.txt", "feature\n")
+        queue = get_merge_queue(repo)
+        release = threading.Event()
+        original = queue._merge_branch
+
+        def blocked_merge(agent_id, task_id):
+            release.wait(timeout=5)
+            return original(agent_id, task_id)
+
+        queue._merge_branch = blocked_merge  # type: ignore[method-assign]
+
+        result = await _merge_agent_branch_to_main(
+            "agent-1", "task-1", self._state(repo)
+        )
+        release.set()
+        await queue.join()
+
+        assert result == {
+            "success": True,
+            "merge_status": "queued",
+            "queue_position": 0,
+        }
+        assert queue.last_result("agent-1").status == MERGE_MERGED
+
+    async def test_queued_conflict_is_flagged_and_sent_back(self, tmp_path):
+        """A conflict after the call returned reaches the board and the agent."""
+        repo = _init_repo(tmp_path / "repo")
+        _agent_commit(repo, "agent-1", "shared.txt", "agent one\n")
+        _agent_commit(repo, "agent-2", "shared.txt", "agent two\n")
+        state = self._state(repo)
+        state.kanban_client.add_comment = AsyncMock()
+        queue = get_merge_queue(repo)
+
+        await _merge_agent_branch_to_main("agent-1", "task-1", state)
+        queued = await _merge_agent_branch_to_main("agent-2", "task-2", state)
+        await _settle(queue)
+
+        assert queued["merge_status"] == "queued"
+        task_id, comment = state.kanban_client.add_comment.await_args.args
+        assert task_id == "task-2" and "shared.txt" in comment
+
+        conflicts = await _take_queued_merge_conflicts("agent-2", state)
+        assert [c["task_id"] for c in conflicts] == ["task-2"]
+        assert conflicts[0]["error"] == "merge_conflict"
+        assert conflicts[0]["conflicts"]["files"] == ["shared.txt"]
+        assert await _take_queued_merge_conflicts("agent-1", state) == []
+
+    async def test_reported_conflict_keeps_agent_blocked(self, tmp_path):
+        """An unresolved conflict blocks the agent without re-merging."""
+        repo = _init_repo(tmp_path / "repo")
+        _agent_commit(repo, "agent-1", "shared.txt", "agent one\n")
+        _agent_commit(repo, "agent-2", "shared.txt", "agent two\n")
+        state = self._state(repo)
+        state.kanban_client.add_comment = AsyncMock()
+        queue = get_merge_queue(repo)
+        await _merge_agent_branch_to_main("agent-1", "task-1", state, wait_timeout=5)
+        await _merge_agent_branch_to_main("agent-2", "task-2", state)
+        await _settle(queue)
+        assert await _take_queued_merge_conflicts("agent-2", state)
+        submit = Mock(wraps=queue.submit)
+        queue.submit = submit  # type: ignore[method-assign]
+
+        for _ in range(3):
+            blocked = await _take_queued_merge_conflicts("agent-2", state)
+            assert [c["task_id"] for c in blocked] == ["task-2"]
+            assert blocked[0]["conflicts"]["files"] == ["shared.txt"]
+        await _settle(queue)
+
+        submit.assert_not_called()
+        assert state.kanban_client.add_comment.await_count == 1
+
+    async def test_resolution_commit_is_merged_and_unblocks(self, tmp_path):
+        """Once the agent commits a resolution, the next call merges it."""
+        repo = _init_repo(tmp_path / "repo")
+        _agent_commit(repo, "agent-1", "shared.txt", "agent one\n")
+        _agent_commit(repo, "agent-2", "shared.txt", "agent two\n")
+        state = self._state(repo)
+        state.kanban_client.add_comment = AsyncMock()
+        queue = get_merge_queue(repo)
+        await _merge_agent_branch_to_main("agent-1", "task-1", state, wait_timeout=5)
+        await _merge_agent_branch_to_main("agent-2", "task-2", state)
+        await _settle(queue)
+        assert await _take_queued_merge_conflicts("agent-2", state)
+
+        # Agent resolves on its branch
+        _git(repo, "checkout", "-q", "marcus/agent-2")
+        _git(repo, "merge", "-q", "-X", "ours", "main")
+        _git(repo, "checkout", "-q", "main")
+        assert await _take_queued_merge_conflicts("agent-2", state) == []
+        await _settle(queue)
+
+        assert queue.last_result("agent-2").status == MERGE_MERGED
+        assert (repo / "shared.txt").read_text() == "agent two\n"
+        assert await _take_queued_merge_conflicts("agent-2", state) == []
+
+    async def test_repeated_conflict_is_flagged_once(self, tmp_path):
+        """The same conflict on the same task gets one board comment."""
+        repo = _init_repo(tmp_path / "repo")
+        _agent_commit(repo, "agent-1", "shared.txt", "agent one\n")
+        _agent_commit(repo, "agent-2", "shared.txt", "agent two\n")
+        state = self._state(repo)
+        state.kanban_client.add_comment = AsyncMock()
+        queue = get_merge_queue(repo)
+        await _merge_agent_branch_to_main("agent-1", "task-1", state, wait_timeout=5)
+
+        for _ in range(2):
+            await _merge_agent_branch_to_main("agent-2", "task-2", state)
+            await _settle(queue)
+
+        assert state.kanban_client.add_comment.await_count == 1
+        assert len(await _take_queued_merge_conflicts("agent-2", state)) == 2
+
+    async def test_merge_records_only_the_merged_symbols(self, tmp_path):
+        """Code already on main and other agents' merges are not attributed."""
+        repo = _init_repo(tmp_path / "repo")
+        (repo / "existing.py").write_text("def existing():\n    pass\n")
+        _git(repo, "add", ".")
+        _git(repo, "commit", "-q", "-m", "existing code")
+        _agent_commit(repo, "agent-1", "users.py", "class User(Base):\n    pass\n")
+        _agent_commit(repo, "agent-2", "orders.py", "def place_order():\n    pass\n")
+        state = self._state(repo)
+        state.provider = "planka"
+        state.context.add_implementation = AsyncMock()
+
+        await _merge_agent_branch_to_main("agent-1", "task-1", state, wait_timeout=5)
+        await _merge_agent_branch_to_main("agent-2", "task-2", state, wait_timeout=5)
+        await _settle(get_merge_queue(repo))
+
+        recorded = {
+            call.args[0]: call.args[1]
+            for call in state.context.add_implementation.await_args_list
+        }
+        assert recorded["task-1"]["files"] == ["users.py"]
+        assert [m["name"] for m in recorded["task-1"]["models"]] == ["User"]
+        assert recorded["task-2"]["files"] == ["orders.py"]
+        assert [f["name"] for f in recorded["task-2"]["functions"]] == [
+            "place_order"
+        ]
+
+    async def test_no_project_root_skips_merge(self):
+        """Without a workspace project root there is nothing to merge."""
+        state = Mock()
+        state.kanban_client._load_workspace_state = Mock(return_value=None)
+
+        assert await _merge_agent_branch_to_main("agent-1", "task-1", state) is None
@@ -0,0 +1,238 @@
+"""
+Unit tests for the in-process metrics registry and its instrumentation.
+"""
+
+import asyncio
+from typing import Any, Dict
+
+import pytest
+from mcp.server.fastmcp import FastMCP
+from starlette.testclient import TestClient
+
+from src.core.metrics import (
+    Histogram,
+    InstrumentedLock,
+    MetricsRegistry,
+    PhaseTimer,
+    get_metrics,
+    instrument_kanban_client,
+)
+
+pytestmark = pytest.mark.unit
+
+
+class _Provider:
+    """Kanban provider stand-in with one fast and one failing method."""
+
+    async def get_all_tasks(self) -> list:
+        return ["task"]
+
+    async def update_task(self, task_id: str, data: Dict[str, Any]) -> None:
+        raise ConnectionError(task_id)
+
+    def describe(self) -> str:
+        return "sync methods are left alone"
+
+
+class TestHistogram:
+    """Bucketing and quantile estimates."""
+
+    def test_values_land_in_inclusive_buckets(self):
+        """A value equal to a bound counts towards that bucket."""
+        histogram = Histogram((0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 2.0):
+            histogram.observe(value)
+
+        assert histogram.cumulative() == [(0.1, 2), (1.0, 3), (float("inf"), 4)]
+        assert histogram.sum == pytest.approx(2.65)
+        assert histogram.quantile(0.5) == 0.1
+        assert histogram.quantile(0.99) == 1.0
+
+
+class TestMetricsRegistry:
+    """Recording and Prometheus rendering."""
+
+    def test_render_prometheus_text(self):
+        """Histograms, counters and gauges render in exposition format."""
+        registry = MetricsRegistry(buckets=(0.01, 0.1))
+        registry.observe("marcus_tool_duration_seconds", 0.05, tool="ping")
+        registry.inc("marcus_tool_calls_total", tool="ping", outcome="ok")
+        registry.add_gauge("marcus_tool_calls_in_flight", 1, tool="ping")
+
+        text = registry.render()
+
+        assert "# TYPE marcus_tool_duration_seconds histogram" in text
+        assert 'marcus_tool_duration_seconds_bucket{tool="ping",le="0.01"} 0' in text
+        assert 'marcus_tool_duration_seconds_bucket{tool="ping",le="0.1"} 1' in text
+        assert 'marcus_tool_duration_seconds_bucket{tool="ping",le="+Inf"} 1' in text
+        assert 'marcus_tool_duration_seconds_count{tool="ping"} 1' in text
+        assert 'marcus_tool_calls_total{outcome="ok",tool="ping"} 1' in text
+        assert "# TYPE marcus_tool_calls_in_flight gauge" in text
+        assert text.endswith("\n")
+
+    def test_label_values_are_escaped(self):
+        """Quotes and backslashes in label values are escaped."""
+        registry = MetricsRegistry()
+        registry.inc("custom_total", name='a "b" \\c')
+
+        assert 'custom_total{name="a \\"b\\" \\\\c"} 1' in registry.render()
+
+    def test_phase_timer_records_each_phase(self):
+        """Each mark closes one phase of the operation."""
+        registry = MetricsRegistry()
+        timer = PhaseTimer("request_next_task", registry)
+        timer.mark("state_refresh")
+        timer.mark("task_selection")
+
+        for phase in ("state_refresh", "task_selection"):
+            histogram = registry.histogram(
+                "marcus_phase_duration_seconds",
+                operation="request_next_task",
+                phase=phase,
+            )
+            assert histogram is not None and histogram.count == 1
+
+
+class TestInstrumentedLock:
+    """Lock contention accounting."""
+
+    async def test_contention_is_counted(self):
+        """Waiting acquirers are counted and their wait time recorded."""
+        registry = MetricsRegistry()
+        lock = InstrumentedLock("assignment", registry)
+        waiting = []
+
+        async def holder() -> None:
+            async with lock:
+                await asyncio.sleep(0.02)
+
+        async def waiter() -> None:
+            await asyncio.sleep(0)
+            waiting.append(registry.gauge("marcus_lock_waiters", lock="assignment"))
+            async with lock:
+                pass
+
+        async def observe_waiters() -> None:
+            await asyncio.sleep(0.01)
+            waiting.append(registry.gauge("marcus_lock_waiters", lock="assignment"))
+
+        await asyncio.gather(holder(), waiter(), observe_waiters())
+
+        assert registry.counter("marcus_lock_contended_total", lock="assignment") == 1
+        assert 1 in waiting
+        assert registry.gauge("marcus_lock_waiters", lock="assignment") == 0
+        wait = registry.histogram("marcus_lock_wait_seconds", lock="assignment")
+        hold = registry.histogram("marcus_lock_hold_seconds", lock="assignment")
+        assert wait.count == 2 and wait.sum >= 0.005
+        assert hold.count == 2
+
+    async def test_pending_waiter_after_release_is_contention(self):
+        """An acquirer queued behind a woken but not yet running waiter waits."""
+        registry = MetricsRegistry()
+        lock = InstrumentedLock("assignment", registry)
+
+        async def first() -> None:
+            async with lock:
+                pass
+
+        await lock.acquire()
+        task = asyncio.create_task(first())
+        await asyncio.sleep(0)
+        lock.release()
+        await lock.acquire()  # ``first`` was handed the lock but has not run
+        lock.release()
+        await task
+
+        assert registry.counter("marcus_lock_contended_total", lock="assignment") == 2
+
+    async def test_server_assignment_lock_is_instrumented(self):
+        """The project context's assignment lock reports contention."""
+        from src.core.project_context_manager import ProjectContext
+
+        lock = ProjectContext("project").assignment_lock
+
+        assert isinstance(lock, InstrumentedLock)
+        assert lock.name == "assignment"
+
+
+class TestKanbanInstrumentation:
+    """Provider call timing."""
+
+    async def test_calls_and_errors_are_recorded(self):
+        """Coroutine methods are timed; failures are also counted."""
+        registry = MetricsRegistry()
+        provider = instrument_kanban_client(_Provider(), registry)
+
+        assert await provider.get_all_tasks() == ["task"]
+        with pytest.raises(ConnectionError):
+            await provider.update_task("t1", {})
+
+        labels = {"provider": "_Provider"}
+        assert (
+            registry.histogram(
+                "marcus_kanban_call_duration_seconds", method="get_all_tasks", **labels
+            ).count
+            == 1
+        )
+        assert (
+            registry.counter(
+                "marcus_kanban_call_errors_total", method="update_task", **labels
+            )
+            == 1
+        )
+        assert isinstance(provider, _Provider)
+        assert provider.describe() == "sync methods are left alone"
+
+    async def test_instrumenting_twice_is_a_noop(self):
+        """Wrapping is applied once per instance."""
+        registry = MetricsRegistry()
+        provider = instrument_kanban_client(_Provider(), registry)
+        instrument_kanban_client(provider, registry)
+
+        await provider.get_all_tasks()
+
+        histogram = registry.histogram(
+            "marcus_kanban_call_duration_seconds",
+            provider="_Provider",
+            method="get_all_tasks",
+        )
+        assert histogram.count == 1
+
+
+class TestMetricsEndpoint:
+    """GET /metrics on the HTTP transport."""
+
+    def test_metrics_route_serves_registry(self):
+        """The route returns the process-wide registry as Prometheus text."""
+        from src.marcus_mcp.server import MarcusServer
+
+        get_metrics().inc("marcus_tool_calls_total", tool="ping", outcome="ok")
+        app = FastMCP("test")
+        MarcusServer._register_metrics_route(app)
+
+        response = TestClient(app.streamable_http_app()).get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert "marcus_tool_calls_total" in response.text
+
+    async def test_unregistered_tool_names_share_one_label(self):
+        """Client-supplied tool names cannot grow the label set."""
+        from src.marcus_mcp.handlers import handle_tool_call
+
+        class _State:
+            def log_event(self, *args: Any, **kwargs: Any) -> None:
+                pass
+
+        get_metrics().reset()
+        await handle_tool_call("no_such_tool_4f1c", {}, _State())
+
+        assert get_metrics().histogram(
+            "marcus_tool_duration_seconds", tool="unknown"
+        ).count == 1
+        assert (
+            get_metrics().histogram(
+                "marcus_tool_duration_seconds", tool="no_such_tool_4f1c"
+            )
+            is None
+        )
@@ -138,6 +138,29 @@ class TestFilePersistence:
         items = await file_persistence.query("concurrent")
         assert len(items) == 3
 
+    @pytest.mark.asyncio
+    async def test_store_many_and_retrieve_many(self, file_persistence):
+        """Test batch store and retrieve with a single file rewrite"""
+        await file_persistence.store("batch", "existing", {"value": 0})
+
+        with patch.object(
+            file_persistence,
+            "_get_collection_file",
+            wraps=file_persistence._get_collection_file,
+        ) as get_file:
+            await file_persistence.store_many(
+                "batch", {f"key{i}": {"value": i} for i in range(1, 4)}
+            )
+            assert get_file.call_count == 1
+
+        result = await file_persistence.retrieve_many(
+            "batch", ["existing", "key1", "key3", "missing"]
+        )
+
+        assert set(result) == {"existing", "key1", "key3"}
+        assert result["key3"]["value"] == 3
+        assert "_stored_at" in result["key1"]
+
 
 class TestSQLitePersistence:
     """Test suite for SQLite-based persistence"""
@@ -170,6 +193,21 @@ class TestSQLitePersistence:
         assert result["data"] == "value1"
         assert result["nested"]["key"] == "value"
 
+    @pytest.mark.asyncio
+    async def test_store_many_and_retrieve_many(self, sqlite_persistence):
+        """Test batch store and retrieve with SQLite"""
+        items = {f"key{i}": {"value": i} for i in range(1200)}
+        await sqlite_persistence.store_many("batch", items)
+        await sqlite_persistence.store_many("batch", {"key0": {"value": "updated"}})
+
+        keys = list(items) + ["missing"]
+        result = await sqlite_persistence.retrieve_many("batch", keys)
+
+        assert len(result) == 1200
+        assert result["key0"]["value"] == "updated"
+        assert result["key1199"]["value"] == 1199
+        assert await sqlite_persistence.retrieve_many("batch", []) == {}
+
     @pytest.mark.asyncio
     async def test_query_with_limit(self, sqlite_persistence):
         """Test querying with limit"""
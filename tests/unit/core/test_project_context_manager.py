@@ -0,0 +1,108 @@
+"""
+Unit tests for concurrent project contexts in ProjectContextManager.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from src.core.project_context_manager import ProjectContextManager
+from src.core.project_registry import ProjectConfig
+
+pytestmark = pytest.mark.unit
+
+
+def _registry(*project_ids: str) -> Mock:
+    projects = {
+        pid: ProjectConfig(
+            id=pid, name=f"Project {pid}", provider="sqlite", provider_config={}
+        )
+        for pid in project_ids
+    }
+    registry = Mock()
+    registry.get_project = AsyncMock(side_effect=projects.get)
+    registry.set_active_project = AsyncMock()
+    registry.list_projects = AsyncMock(return_value=list(projects.values()))
+    return registry
+
+
+@pytest.fixture
+def make_manager(tmp_path, monkeypatch):
+    """Build a manager whose kanban clients and persistence are stubs."""
+    monkeypatch.chdir(tmp_path)
+    patches = [
+        patch("src.core.project_context_manager.get_config", return_value=Mock()),
+        patch(
+            "src.core.project_context_manager.Persistence",
+            return_value=Mock(store=AsyncMock(), retrieve=AsyncMock(return_value=None)),
+        ),
+        patch(
+            "src.core.project_context_manager.KanbanFactory.create",
+            side_effect=lambda *_: Mock(connect=AsyncMock(), disconnect=AsyncMock()),
+        ),
+    ]
+    for p in patches:
+        p.start()
+
+    def _make(*project_ids: str, **kwargs) -> ProjectContextManager:
+        return ProjectContextManager(registry=_registry(*project_ids), **kwargs)
+
+    yield _make
+    for p in patches:
+        p.stop()
+
+
+class TestConcurrentProjectContexts:
+    """Serving several projects without switching the active one."""
+
+    async def test_get_context_does_not_switch(self, make_manager):
+        """Loading another project's context leaves the active project alone."""
+        manager = make_manager("a", "b")
+        await manager.switch_project("a")
+
+        context = await manager.get_context("b")
+
+        assert context is not None
+        assert context.project_name == "Project b"
+        assert manager.active_project_id == "a"
+        assert await manager.get_context("b") is context
+        assert context.assignment_lock is not manager.contexts["a"].assignment_lock
+
+    async def test_unknown_project(self, make_manager):
+        """Unregistered projects have no context."""
+        manager = make_manager("a")
+
+        assert await manager.get_context("missing") is None
+        async with manager.use_project("missing") as context:
+            assert context is None
+
+    async def test_lru_eviction_skips_active_and_pinned(self, make_manager):
+        """Idle projects are evicted oldest first; active/pinned ones stay."""
+        manager = make_manager("a", "b", "c", "d", max_cached_projects=2)
+        await manager.switch_project("a")
+
+        async with manager.use_project("b") as pinned:
+            await manager.get_context("c")
+            assert set(manager.contexts) == {"a", "b", "c"}
+            assert pinned.active_calls == 1
+
+        await manager.get_context("d")
+
+        assert set(manager.contexts) == {"a", "d"}
+
+    async def test_memory_cap_evicts_idle_projects(self, make_manager):
+        """Projects holding large task lists are evicted over the memory cap."""
+        manager = make_manager("a", "b", max_memory_mb=0.05)
+        await manager.switch_project("a")
+        heavy = await manager.get_context("b")
+        heavy.project_tasks = [
+            SimpleNamespace(id=f"t{i}", description="x" * 200) for i in range(500)
+        ]
+        heavy.lease_monitor = Mock(stop=AsyncMock())
+
+        assert manager.memory_usage_bytes() > 0.05 * 1024 * 1024
+        await manager.enforce_limits()
+
+        assert set(manager.contexts) == {"a"}
+        heavy.lease_monitor.stop.assert_awaited_once()
@@ -5,21 +5,51 @@ Unit tests for resilience patterns and security fixes.
 import asyncio
 import secrets
 import time
+from typing import Any
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
+from src.core.adaptive_concurrency import (
+    AdaptiveConcurrencyConfig,
+    AdaptiveConcurrencyLimiter,
+)
+from src.core.metrics import get_metrics
 from src.core.resilience import (
+    CIRCUIT_CLOSED,
+    Bulkhead,
+    BulkheadConfig,
+    BulkheadFull,
     CircuitBreaker,
     CircuitBreakerConfig,
+    CircuitOpenError,
     GracefulDegradation,
+    RetryBudget,
+    RetryBudgetConfig,
     RetryConfig,
+    get_circuit_breaker,
+    get_resilience_stats,
+    get_retry_budget,
+    with_bulkhead,
     with_circuit_breaker,
     with_fallback,
     with_retry,
 )
 
 
+class FakeClock:
+    """Monotonic clock advanced by hand."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
 class TestRetryConfigSecurity:
     """Test security improvements in retry logic"""
 
@@ -263,3 +293,367 @@ class TestWithCircuitBreaker:
         # Second call should be blocked by open circuit
         with pytest.raises(Exception, match="Circuit breaker 'test_failure' is open"):
             failing_func()
+
+
+class TestCircuitBreakerHalfOpen:
+    """Half-open probing under concurrent callers"""
+
+    def _open_breaker(self, clock, **config):
+        breaker = CircuitBreaker(
+            "llm",
+            CircuitBreakerConfig(failure_threshold=2, recovery_timeout=30.0, **config),
+            clock=clock,
+        )
+        breaker.record_failure()
+        breaker.record_failure()
+        return breaker
+
+    def test_refuses_until_recovery_timeout(self):
+        clock = FakeClock()
+        breaker = self._open_breaker(clock)
+
+        clock.advance(10)
+        assert not breaker.allow_request()
+        assert breaker.retry_after() == 20.0
+
+        clock.advance(21)
+        assert breaker.allow_request()
+        assert breaker.state == "half-open"
+
+    def test_limits_concurrent_probes(self):
+        clock = FakeClock()
+        breaker = self._open_breaker(clock, half_open_max_calls=2)
+        clock.advance(31)
+
+        admitted = [breaker.allow_request() for _ in range(50)]
+
+        assert admitted.count(True) == 2
+        assert breaker.is_open()
+        assert breaker.get_stats()["probes_in_flight"] == 2
+
+    def test_probe_success_closes_and_failure_reopens(self):
+        clock = FakeClock()
+        breaker = self._open_breaker(clock)
+        clock.advance(31)
+
+        assert breaker.allow_request()
+        breaker.record_failure()
+        assert breaker.state == "open"
+        assert not breaker.allow_request()
+
+        clock.advance(31)
+        assert breaker.allow_request()
+        breaker.record_success()
+        assert breaker.state == "closed"
+        assert all(breaker.allow_request() for _ in range(10))
+        assert breaker.get_stats()["times_opened"] == 2
+
+    def test_released_probe_frees_its_slot(self):
+        clock = FakeClock()
+        breaker = self._open_breaker(clock)
+        clock.advance(31)
+
+        assert breaker.allow_request()
+        assert not breaker.allow_request()
+        breaker.release()
+        assert breaker.allow_request()
+
+    def test_publishes_state_metrics(self):
+        clock = FakeClock()
+        breaker = self._open_breaker(clock)
+        metrics = get_metrics()
+        before = metrics.counter("marcus_circuit_rejected_total", dependency="llm")
+
+        assert not breaker.allow_request()
+
+        assert metrics.gauge("marcus_circuit_state", dependency="llm") == 2
+        assert (
+            metrics.counter("marcus_circuit_rejected_total", dependency="llm")
+            == before + 1
+        )
+        clock.advance(31)
+        breaker.allow_request()
+        assert metrics.gauge("marcus_circuit_state", dependency="llm") == 1
+
+    async def test_decorator_sends_one_probe_from_a_herd(self):
+        calls = []
+        release = asyncio.Event()
+
+        @with_circuit_breaker(
+            "herd", CircuitBreakerConfig(failure_threshold=1, recovery_timeout=0.0)
+        )
+        async def call_provider():
+            calls.append(1)
+            await release.wait()
+            return "ok"
+
+        breaker = get_circuit_breaker("herd")
+        breaker.record_failure()
+
+        tasks = [asyncio.create_task(call_provider()) for _ in range(20)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        assert len(calls) == 1
+        assert results.count("ok") == 1
+        assert all(isinstance(r, CircuitOpenError) for r in results if r != "ok")
+        assert breaker.state == "closed"
+
+    async def test_cancelled_probe_does_not_wedge_half_open(self):
+        @with_circuit_breaker(
+            "cancel", CircuitBreakerConfig(failure_threshold=1, recovery_timeout=0.0)
+        )
+        async def slow():
+            await asyncio.sleep(10)
+
+        breaker = get_circuit_breaker("cancel")
+        breaker.record_failure()
+        probe = asyncio.create_task(slow())
+        await asyncio.sleep(0)
+        probe.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await probe
+
+        assert breaker.state == "half-open"
+        assert breaker.allow_request()
+
+
+class TestBulkhead:
+    """Per-dependency concurrency cap and queue limit"""
+
+    async def test_caps_concurrency_and_hands_slots_over_in_order(self):
+        bulkhead = Bulkhead("kanban", BulkheadConfig(max_concurrent=2, max_queued=5))
+        order = []
+        gate = asyncio.Event()
+
+        async def call(i):
+            async with bulkhead.slot():
+                order.append(i)
+                await gate.wait()
+
+        tasks = [asyncio.create_task(call(i)) for i in range(5)]
+        await asyncio.sleep(0)
+        assert bulkhead.in_flight == 2
+        assert bulkhead.queued == 3
+
+        gate.set()
+        await asyncio.gather(*tasks)
+
+        assert order == [0, 1, 2, 3, 4]
+        assert bulkhead.get_stats()["peak_in_flight"] == 2
+        assert bulkhead.in_flight == 0
+
+    async def test_rejects_when_queue_is_full(self):
+        bulkhead = Bulkhead("kanban", BulkheadConfig(max_concurrent=1, max_queued=1))
+        await bulkhead.acquire()
+        waiter = asyncio.create_task(bulkhead.acquire())
+        await asyncio.sleep(0)
+
+        with pytest.raises(BulkheadFull) as excinfo:
+            await bulkhead.acquire()
+        assert excinfo.value.reason == "queue_full"
+
+        bulkhead.release()
+        await waiter
+        assert bulkhead.in_flight == 1
+        assert bulkhead.get_stats()["rejected"] == 1
+
+    async def test_rejects_after_queue_wait(self):
+        bulkhead = Bulkhead(
+            "kanban",
+            BulkheadConfig(max_concurrent=1, max_queued=5, max_queue_wait=0.01),
+        )
+        await bulkhead.acquire()
+
+        with pytest.raises(BulkheadFull) as excinfo:
+            await bulkhead.acquire()
+
+        assert excinfo.value.reason == "queue_timeout"
+        assert bulkhead.queued == 0
+
+    async def test_cancelled_waiter_leaves_queue(self):
+        bulkhead = Bulkhead("kanban", BulkheadConfig(max_concurrent=1))
+        await bulkhead.acquire()
+        waiter = asyncio.create_task(bulkhead.acquire())
+        await asyncio.sleep(0)
+
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        assert bulkhead.queued == 0
+        bulkhead.release()
+        assert bulkhead.in_flight == 0
+
+    def test_decorator_requires_coroutine(self):
+        with pytest.raises(TypeError):
+
+            @with_bulkhead("kanban")
+            def sync_call():
+                return None
+
+
+class TestRetryBudget:
+    """Token-bucket retry budget shared per dependency"""
+
+    def test_spends_and_refills_tokens(self):
+        clock = FakeClock()
+        budget = RetryBudget(
+            "llm", RetryBudgetConfig(capacity=3, refill_per_second=0.5), clock=clock
+        )
+
+        assert [budget.try_acquire() for _ in range(4)] == [True, True, True, False]
+
+        clock.advance(2)
+        assert budget.tokens == 1.0
+        assert budget.try_acquire()
+        assert not budget.try_acquire()
+
+        clock.advance(100)
+        assert budget.tokens == 3.0
+        assert budget.get_stats() == {
+            "tokens": 3.0,
+            "capacity": 3,
+            "granted": 4,
+            "denied": 2,
+        }
+
+    async def test_callers_share_one_budget(self):
+        get_retry_budget("llm", RetryBudgetConfig(capacity=4, refill_per_second=0))
+        attempts = []
+
+        @with_retry(RetryConfig(max_attempts=5, base_delay=0, jitter=False), "llm")
+        async def call_provider(caller):
+            attempts.append(caller)
+            raise ConnectionError("provider down")
+
+        results = await asyncio.gather(
+            *(call_provider(i) for i in range(10)), return_exceptions=True
+        )
+
+        # 10 first attempts plus the 4 retries the budget allowed, instead
+        # of 10 callers x 5 attempts
+        assert len(attempts) == 14
+        assert all(isinstance(r, ConnectionError) for r in results)
+        assert get_retry_budget("llm").get_stats()["denied"] == 10
+
+    def test_budget_left_alone_when_first_attempt_succeeds(self):
+        budget = get_retry_budget("llm", RetryBudgetConfig(capacity=1))
+
+        @with_retry(RetryConfig(max_attempts=3, base_delay=0), dependency="llm")
+        def call_provider():
+            return "ok"
+
+        assert call_provider() == "ok"
+        assert budget.get_stats()["granted"] == 0
+
+    def test_open_circuit_is_not_retried(self):
+        attempts = []
+
+        @with_retry(RetryConfig(max_attempts=3, base_delay=0, jitter=False))
+        def call_provider():
+            attempts.append(1)
+            raise CircuitOpenError("llm", retry_after=5.0)
+
+        with pytest.raises(CircuitOpenError):
+            call_provider()
+        assert len(attempts) == 1
+
+
+class TestResilienceStats:
+    """Monitoring view over the registries"""
+
+    def test_reports_each_dependency(self):
+        get_circuit_breaker("kanban").record_failure()
+        get_retry_budget("kanban").try_acquire()
+        get_retry_budget("llm")
+
+        stats = get_resilience_stats()
+
+        assert stats["kanban"]["circuit_breaker"]["failure_count"] == 1
+        assert stats["kanban"]["circuit_breaker"]["state"] == "closed"
+        assert stats["kanban"]["retry_budget"]["granted"] == 1
+        assert set(stats["llm"]) == {"retry_budget"}
+
+
+class TestDependencyProtection:
+    """LLM and Planka calls go through their dependency's breaker and bulkhead"""
+
+    @staticmethod
+    def _llm(error: Exception) -> Any:
+        from src.ai.providers.llm_abstraction import LLMAbstraction
+
+        provider = Mock(complete=AsyncMock(side_effect=error))
+        llm = LLMAbstraction.__new__(LLMAbstraction)
+        llm.providers = {"anthropic": provider}
+        llm.current_provider = "anthropic"
+        llm.fallback_providers = []
+        llm.provider_stats = {"anthropic": {"requests": 0, "failures": 0}}
+        llm._providers_initialized = True
+        return llm
+
+    async def test_llm_provider_failures_open_ai_provider_circuit(self):
+        from src.ai.providers.llm_abstraction import AI_PROVIDER_CIRCUIT
+
+        llm = self._llm(RuntimeError("overloaded"))
+        threshold = AI_PROVIDER_CIRCUIT.failure_threshold
+
+        for _ in range(threshold):
+            with pytest.raises(Exception, match="overloaded"):
+                await llm.analyze("prompt", None)
+        with pytest.raises(CircuitOpenError):
+            await llm.analyze("prompt", None)
+
+        assert llm.providers["anthropic"].complete.await_count == threshold
+        assert set(get_resilience_stats()["ai_provider"]) >= {
+            "circuit_breaker",
+            "bulkhead",
+        }
+
+    async def test_rate_limits_shrink_llm_limiter_without_opening_circuit(self):
+        from src.ai.providers.llm_abstraction import (
+            AI_PROVIDER_BULKHEAD,
+            AI_PROVIDER_CIRCUIT,
+        )
+
+        llm = self._llm(RuntimeError("Claude API error: 429 - rate limited"))
+        limiter = AdaptiveConcurrencyLimiter(
+            "llm",
+            AdaptiveConcurrencyConfig(decrease_cooldown=0.0, rate_limit_retries=0),
+        )
+        burst = 4 * AI_PROVIDER_CIRCUIT.failure_threshold
+
+        async def call() -> None:
+            async with limiter.slot():
+                await llm.analyze("prompt", None)
+
+        results = await asyncio.gather(
+            *(call() for _ in range(burst)), return_exceptions=True
+        )
+
+        assert all("429" in str(result) for result in results)
+        assert limiter.limit < AdaptiveConcurrencyConfig().initial_limit
+        stats = get_resilience_stats()["ai_provider"]
+        assert stats["circuit_breaker"]["state"] == CIRCUIT_CLOSED
+        assert stats["bulkhead"]["rejected"] == 0
+        assert AI_PROVIDER_BULKHEAD.max_concurrent >= (
+            AdaptiveConcurrencyConfig().max_limit
+        )
+
+    async def test_planka_failures_open_kanban_circuit(self):
+        from src.integrations.kanban_client import KanbanClient
+
+        client = KanbanClient.__new__(KanbanClient)
+        client._kanban_mcp_path = "kanban-mcp"
+        unreachable = Mock(side_effect=ConnectionError("planka down"))
+
+        with patch("src.integrations.kanban_client.stdio_client", unreachable):
+            for _ in range(CircuitBreakerConfig().failure_threshold):
+                with pytest.raises(ConnectionError):
+                    await client.get_projects()
+            with pytest.raises(CircuitOpenError):
+                await client.get_projects()
+
+        assert unreachable.call_count == CircuitBreakerConfig().failure_threshold
+        assert get_resilience_stats()["kanban"]["bulkhead"]["in_flight"] == 0
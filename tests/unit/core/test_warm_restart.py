@@ -0,0 +1,222 @@
+"""
+Unit tests for warm-restart checkpoints of in-memory server state.
+"""
+
+import json
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import Mock
+
+import pytest
+
+from src.core.board_snapshot import BoardSnapshotService
+from src.core.models import (
+    Priority,
+    RecoveryInfo,
+    Task,
+    TaskAssignment,
+    TaskStatus,
+    WorkerStatus,
+)
+from src.core.warm_restart import (
+    CHECKPOINT_VERSION,
+    ServerCheckpoint,
+    WarmStateStore,
+    capture_checkpoint,
+    restore_checkpoint,
+)
+
+pytestmark = pytest.mark.unit
+
+NOW = datetime(2026, 10, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def _task(task_id: str, **kwargs: Any) -> Task:
+    return Task(
+        id=task_id,
+        name=f"Task {task_id}",
+        description="",
+        status=kwargs.pop("status", TaskStatus.TODO),
+        priority=Priority.HIGH,
+        assigned_to=kwargs.pop("assigned_to", None),
+        created_at=NOW,
+        updated_at=NOW,
+        due_date=None,
+        estimated_hours=2.0,
+        **kwargs,
+    )
+
+
+def _recovery() -> RecoveryInfo:
+    return RecoveryInfo(
+        recovered_at=NOW,
+        recovered_from_agent="agent-old",
+        previous_progress=40,
+        time_spent_minutes=12.5,
+        recovery_reason="lease_expired",
+        instructions="Check the branch first",
+        recovery_expires_at=NOW + timedelta(hours=24),
+    )
+
+
+def _worker(agent_id: str, *tasks: Task) -> WorkerStatus:
+    return WorkerStatus(
+        worker_id=agent_id,
+        name=agent_id,
+        role="Developer",
+        email=None,
+        current_tasks=list(tasks),
+        completed_tasks_count=3,
+        capacity=40,
+        skills=["python"],
+        availability={"monday": True},
+    )
+
+
+def _assignment(task: Task, agent_id: str) -> TaskAssignment:
+    return TaskAssignment(
+        task_id=task.id,
+        task_name=task.name,
+        description=task.description,
+        instructions="Do it",
+        estimated_hours=task.estimated_hours,
+        priority=task.priority,
+        dependencies=[],
+        assigned_to=agent_id,
+        assigned_at=NOW,
+        due_date=None,
+    )
+
+
+def _state(**overrides: Any) -> SimpleNamespace:
+    values = {
+        "current_project_id": "proj-1",
+        "agent_status": {},
+        "agent_tasks": {},
+        "agent_project_map": {},
+        "project_tasks": [],
+        "board_snapshot": None,
+        "lease_manager": None,
+    }
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+def _running_state() -> SimpleNamespace:
+    task = _task("t1", status=TaskStatus.IN_PROGRESS, assigned_to="agent-1")
+    task.recovery_info = _recovery()
+    return _state(
+        agent_status={"agent-1": _worker("agent-1", task)},
+        agent_tasks={"agent-1": _assignment(task, "agent-1")},
+        agent_project_map={"agent-1": "proj-1"},
+        project_tasks=[task, _task("t2")],
+    )
+
+
+class TestServerCheckpoint:
+    """Capturing and encoding hot state."""
+
+    def test_round_trips_through_json(self):
+        checkpoint = capture_checkpoint(_running_state(), in_flight=2)
+
+        data = json.loads(json.dumps(checkpoint.to_dict()))
+        loaded = ServerCheckpoint.from_dict(data)
+
+        assert data["version"] == CHECKPOINT_VERSION
+        assert loaded.project_id == "proj-1"
+        assert loaded.in_flight == 2
+        assert loaded.agent_status == checkpoint.agent_status
+        assert loaded.agent_tasks == checkpoint.agent_tasks
+        assert loaded.project_tasks == checkpoint.project_tasks
+        assert loaded.project_tasks[0].recovery_info.previous_progress == 40
+        assert loaded.board_tasks is None
+
+    async def test_captures_board_snapshot(self):
+        service = BoardSnapshotService(Mock())
+        service.restore([_task("t1")], version=4, age=2.0)
+
+        checkpoint = capture_checkpoint(_state(board_snapshot=service))
+
+        assert checkpoint.board_version == 4
+        assert [t.id for t in checkpoint.board_tasks] == ["t1"]
+        assert checkpoint.board_age >= 2.0
+
+
+class TestRestoreCheckpoint:
+    """Merging a checkpoint into a fresh server."""
+
+    def test_restores_into_empty_state(self):
+        checkpoint = capture_checkpoint(_running_state())
+        lease_manager = Mock()
+        state = _state(lease_manager=lease_manager)
+
+        restored = restore_checkpoint(state, checkpoint)
+
+        assert restored == {"agents": 1, "assignments": 1, "tasks": 2, "board_tasks": 0}
+        assert state.agent_tasks["agent-1"].task_id == "t1"
+        assert state.agent_project_map == {"agent-1": "proj-1"}
+        lease_manager.update_task_list.assert_called_once_with(state.project_tasks)
+
+    def test_live_state_wins_and_recovery_info_carries_over(self):
+        checkpoint = capture_checkpoint(_running_state())
+        fresh = _task("t1", status=TaskStatus.IN_PROGRESS, assigned_to="agent-1")
+        registered = _worker("agent-1")
+        state = _state(agent_status={"agent-1": registered}, project_tasks=[fresh])
+
+        restored = restore_checkpoint(state, checkpoint)
+
+        assert state.agent_status["agent-1"] is registered
+        assert state.project_tasks == [fresh]
+        assert fresh.recovery_info.recovered_from_agent == "agent-old"
+        assert restored["agents"] == 0 and restored["tasks"] == 1
+
+    def test_other_project_is_ignored(self):
+        checkpoint = capture_checkpoint(_running_state())
+        state = _state(current_project_id="proj-2")
+
+        assert restore_checkpoint(state, checkpoint) == {}
+        assert state.agent_status == {}
+
+    async def test_seeds_board_snapshot(self):
+        checkpoint = capture_checkpoint(_running_state())
+        checkpoint.board_version = 9
+        checkpoint.board_tasks = [_task("t1")]
+        service = BoardSnapshotService(Mock())
+        state = _state(board_snapshot=service)
+
+        restored = restore_checkpoint(state, checkpoint)
+
+        assert restored["board_tasks"] == 1
+        assert service.snapshot.version == 9
+
+
+class TestWarmStateStore:
+    """Reading and writing the checkpoint file."""
+
+    def test_load_consumes_checkpoint(self, tmp_path):
+        store = WarmStateStore(tmp_path / "warm.json")
+        store.save(capture_checkpoint(_running_state()))
+
+        assert store.load() is not None
+        assert not store.path.exists()
+        assert store.load() is None
+
+    def test_stale_checkpoint_is_ignored(self, tmp_path):
+        store = WarmStateStore(tmp_path / "warm.json", max_age=60)
+        checkpoint = capture_checkpoint(_running_state())
+        checkpoint.created_at -= timedelta(minutes=5)
+        store.save(checkpoint)
+
+        assert store.load() is None
+
+    def test_unreadable_or_other_version_is_ignored(self, tmp_path):
+        store = WarmStateStore(tmp_path / "warm.json")
+        store.path.write_text("{not json")
+        assert store.load() is None
+
+        data = capture_checkpoint(_running_state()).to_dict()
+        data["version"] = CHECKPOINT_VERSION + 1
+        store.path.write_text(json.dumps(data))
+        assert store.load() is None
+        assert not store.path.exists()
@@ -0,0 +1,52 @@
+"""
+Unit tests for the shared worker pools used by analytics code.
+"""
+
+import threading
+
+import pytest
+
+from src.core.worker_pool import (
+    get_worker_pool,
+    run_cpu_bound,
+    shutdown_worker_pools,
+)
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture(autouse=True)
+def _fresh_pools():
+    shutdown_worker_pools(wait=True)
+    yield
+    shutdown_worker_pools(wait=True)
+
+
+class TestWorkerPool:
+    """Offloading blocking work from coroutines."""
+
+    async def test_runs_off_the_event_loop_thread(self):
+        caller = threading.get_ident()
+
+        worker = await run_cpu_bound(threading.get_ident)
+
+        assert worker != caller
+
+    async def test_forwards_arguments_and_propagates_errors(self):
+        assert await run_cpu_bound(sorted, [3, 1, 2], reverse=True) == [3, 2, 1]
+
+        with pytest.raises(ValueError):
+            await run_cpu_bound(int, "not a number")
+
+    def test_pools_are_shared_by_name(self):
+        pool = get_worker_pool("reports", max_workers=2)
+
+        assert get_worker_pool("reports") is pool
+        assert get_worker_pool() is not pool
+
+    def test_shutdown_drops_pools(self):
+        pool = get_worker_pool()
+
+        shutdown_worker_pools(wait=True)
+
+        assert get_worker_pool() is not pool
@@ -0,0 +1,291 @@
+"""
+Unit tests for bulk task creation.
+
+Covers the bounded ``create_task`` fan-out shared by remote providers,
+the single-transaction ``SQLiteKanban.create_tasks_bulk`` path, and the
+batched board write in ``NaturalLanguageTaskCreator.create_tasks_on_board``.
+"""
+
+import asyncio
+import logging
+from pathlib import Path
+from typing import Any, Dict, List
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.core.models import Priority, Task, TaskStatus
+from src.integrations.kanban_interface import fan_out_create_tasks
+from src.integrations.nlp_base import NaturalLanguageTaskCreator
+from src.integrations.providers.sqlite_kanban import SQLiteKanban
+
+pytestmark = pytest.mark.unit
+
+
+def _task(task_id: str, name: str, dependencies: List[str]) -> Task:
+    return Task(
+        id=task_id,
+        name=name,
+        description=f"{name} description",
+        status=TaskStatus.TODO,
+        priority=Priority.MEDIUM,
+        assigned_to=None,
+        created_at=None,  # type: ignore[arg-type]
+        updated_at=None,  # type: ignore[arg-type]
+        due_date=None,
+        estimated_hours=2.0,
+        dependencies=dependencies,
+        labels=["backend"],
+    )
+
+
+@pytest.fixture
+async def sqlite_kanban(tmp_path: Path) -> SQLiteKanban:
+    """Create a connected SQLiteKanban on a temporary database."""
+    kanban = SQLiteKanban(
+        {
+            "db_path": str(tmp_path / "bulk.db"),
+            "project_name": "Bulk",
+            "attachments_dir": str(tmp_path / "attachments"),
+        }
+    )
+    await kanban.connect()
+    yield kanban  # type: ignore[misc]
+    await kanban.disconnect()
+
+
+class TestFanOutCreateTasks:
+    """Test suite for the bounded create_task fan-out."""
+
+    @pytest.mark.asyncio
+    async def test_caps_concurrency_and_keeps_order(self):
+        """No more than max_concurrency creates run at once."""
+        in_flight = 0
+        peak = 0
+
+        async def create_task(data: Dict[str, Any]) -> str:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.005)
+            in_flight -= 1
+            return data["name"]
+
+        results = await fan_out_create_tasks(
+            create_task, [{"name": f"t{i}"} for i in range(20)], max_concurrency=3
+        )
+
+        assert results == [f"t{i}" for i in range(20)]
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_failures_are_returned_not_raised(self):
+        """One failing create does not abort the rest of the batch."""
+
+        async def create_task(data: Dict[str, Any]) -> str:
+            if data["name"] == "bad":
+                raise ValueError("rejected")
+            return data["name"]
+
+        results = await fan_out_create_tasks(
+            create_task, [{"name": "a"}, {"name": "bad"}, {"name": "b"}]
+        )
+
+        assert results[0] == "a"
+        assert isinstance(results[1], ValueError)
+        assert results[2] == "b"
+
+
+class TestSQLiteKanbanCreateTasksBulk:
+    """Test suite for SQLiteKanban.create_tasks_bulk."""
+
+    @pytest.mark.asyncio
+    async def test_creates_tasks_in_input_order(self, sqlite_kanban):
+        """Results line up with the input and are fully hydrated."""
+        results = await sqlite_kanban.create_tasks_bulk(
+            [
+                {"name": f"Task {i}", "labels": [f"label-{i}"], "priority": "high"}
+                for i in range(5)
+            ]
+        )
+
+        assert [t.name for t in results] == [f"Task {i}" for i in range(5)]
+        assert results[3].labels == ["label-3"]
+        assert results[3].priority == Priority.HIGH
+        assert len(await sqlite_kanban.get_all_tasks()) == 5
+
+    @pytest.mark.asyncio
+    async def test_remaps_in_batch_slug_dependencies(self, sqlite_kanban):
+        """Dependencies on another task's original_id resolve to its new ID."""
+        results = await sqlite_kanban.create_tasks_bulk(
+            [
+                {"name": "Design", "original_id": "design_api"},
+                {
+                    "name": "Build",
+                    "original_id": "build_api",
+                    "dependencies": ["design_api"],
+                },
+                {"name": "Test", "dependencies": ["design_api", "build_api"]},
+            ]
+        )
+        design, build, test = results
+
+        assert build.dependencies == [design.id]
+        assert set(test.dependencies) == {design.id, build.id}
+
+        stored = await sqlite_kanban.get_task_by_id(test.id)
+        assert set(stored.dependencies) == {design.id, build.id}
+
+    @pytest.mark.asyncio
+    async def test_drops_unknown_dependency_slugs(self, sqlite_kanban, caplog):
+        """A slug matching no task is skipped, not stored as a ghost edge."""
+        existing = await sqlite_kanban.create_task({"name": "Existing"})
+
+        with caplog.at_level(logging.WARNING):
+            (build,) = await sqlite_kanban.create_tasks_bulk(
+                [
+                    {
+                        "name": "Build",
+                        "dependencies": ["never_generated", existing.id],
+                    }
+                ]
+            )
+
+        assert build.dependencies == [existing.id]
+        stored = await sqlite_kanban.get_task_by_id(build.id)
+        assert stored.dependencies == [existing.id]
+        assert "never_generated" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_bad_row_does_not_roll_back_batch(self, sqlite_kanban):
+        """A failing row is reported in place; its neighbours are committed."""
+        original = sqlite_kanban._insert_task_row
+
+        def _insert(conn, task_id, task_data, now_iso, dependencies):
+            original(conn, task_id, task_data, now_iso, dependencies)
+            if task_data["name"] == "Broken":
+                # Fail after the row is written so the savepoint must undo it
+                raise ValueError("bad row")
+
+        with patch.object(sqlite_kanban, "_insert_task_row", side_effect=_insert):
+            results = await sqlite_kanban.create_tasks_bulk(
+                [
+                    {"name": "First"},
+                    {"name": "Broken", "labels": ["orphan"]},
+                    {"name": "Last"},
+                ]
+            )
+
+        assert results[0].name == "First"
+        assert isinstance(results[1], ValueError)
+        assert results[2].name == "Last"
+        names = {t.name for t in await sqlite_kanban.get_all_tasks()}
+        assert names == {"First", "Last"}
+
+        orphans = sqlite_kanban._with_connection(
+            lambda conn: conn.execute(
+                "SELECT COUNT(*) FROM task_labels WHERE label = 'orphan'"
+            ).fetchone()[0]
+        )
+        assert orphans == 0
+
+    @pytest.mark.asyncio
+    async def test_empty_batch(self, sqlite_kanban):
+        """An empty batch is a no-op."""
+        assert await sqlite_kanban.create_tasks_bulk([]) == []
+
+
+class _Creator(NaturalLanguageTaskCreator):
+    async def process_natural_language(self, *args: Any, **kwargs: Any) -> Any:
+        return []
+
+
+class TestCreateTasksOnBoardBulk:
+    """Test suite for the bulk path in create_tasks_on_board."""
+
+    @pytest.mark.asyncio
+    async def test_uses_provider_bulk_api_and_one_metadata_write(
+        self, sqlite_kanban
+    ):
+        """All tasks go through one bulk call and one task_metadata write."""
+        creator = _Creator(kanban_client=sqlite_kanban, ai_engine=None)
+        creator._decompose_and_add_subtasks = AsyncMock()  # type: ignore
+        creator._wire_cross_parent_dependencies = AsyncMock()  # type: ignore
+        tasks = [
+            _task("design_api", "Design API", []),
+            _task("build_api", "Build API", ["design_api"]),
+        ]
+        persistence = MagicMock()
+        persistence.store_many = AsyncMock()
+
+        with patch.object(
+            sqlite_kanban,
+            "create_tasks_bulk",
+            wraps=sqlite_kanban.create_tasks_bulk,
+        ) as bulk, patch.object(
+            sqlite_kanban, "create_task", side_effect=AssertionError
+        ), patch(
+            "src.core.persistence.SQLitePersistence", return_value=persistence
+        ):
+            created = await creator.create_tasks_on_board(tasks)
+
+        assert bulk.call_count == 1
+        assert [t.name for t in created] == ["Design API", "Build API"]
+        assert created[1].dependencies == [created[0].id]
+
+        persistence.store_many.assert_awaited_once()
+        collection, rows = persistence.store_many.await_args.args
+        assert collection == "task_metadata"
+        assert rows[created[1].id]["dependencies"] == [created[0].id]
+
+    @pytest.mark.asyncio
+    async def test_skips_remap_when_provider_bulk_insert_remapped(
+        self, sqlite_kanban
+    ):
+        """SQLite already rewrote slug dependencies; no follow-up writes."""
+        creator = _Creator(kanban_client=sqlite_kanban, ai_engine=None)
+        creator._decompose_and_add_subtasks = AsyncMock()  # type: ignore
+        creator._wire_cross_parent_dependencies = AsyncMock()  # type: ignore
+        creator._store_task_metadata = AsyncMock()  # type: ignore
+        creator._persist_remapped_dependencies = AsyncMock()  # type: ignore
+        tasks = [
+            _task("design_api", "Design API", []),
+            _task("build_api", "Build API", ["design_api"]),
+        ]
+
+        with patch.object(
+            creator, "_remap_dependencies", side_effect=AssertionError
+        ):
+            created = await creator.create_tasks_on_board(tasks)
+
+        creator._persist_remapped_dependencies.assert_not_awaited()
+        assert created[1].dependencies == [created[0].id]
+        rows = creator._store_task_metadata.await_args.args[0]
+        assert rows[created[1].id]["dependencies"] == [created[0].id]
+
+    @pytest.mark.asyncio
+    async def test_metadata_is_written_before_dependency_remap_write(
+        self, sqlite_kanban
+    ):
+        """A failing board write after the remap cannot drop task_metadata."""
+        sqlite_kanban.bulk_remaps_dependencies = False
+        creator = _Creator(kanban_client=sqlite_kanban, ai_engine=None)
+        creator._decompose_and_add_subtasks = AsyncMock()  # type: ignore
+        creator._wire_cross_parent_dependencies = AsyncMock()  # type: ignore
+        calls: List[str] = []
+        creator._store_task_metadata = AsyncMock(  # type: ignore
+            side_effect=lambda rows: calls.append("metadata")
+        )
+        creator._persist_remapped_dependencies = AsyncMock(  # type: ignore
+            side_effect=lambda created: calls.append("remap")
+        )
+        tasks = [
+            _task("design_api", "Design API", []),
+            _task("build_api", "Build API", ["design_api"]),
+        ]
+
+        created = await creator.create_tasks_on_board(tasks)
+
+        assert calls == ["metadata", "remap"]
+        rows = creator._store_task_metadata.await_args.args[0]
+        assert rows[created[1].id]["dependencies"] == [created[0].id]
@@ -0,0 +1,270 @@
+"""
+Unit tests for the interface-contract schema model.
+
+Contracts arrive as LLM-written markdown in Python or TypeScript
+vocabulary; these tests pin how annotations, entities and code blocks
+normalize, and how two parsed contracts are compared.
+"""
+
+import pytest
+
+from src.integrations.contract_schema import (
+    ContractSchemaCache,
+    SchemaComparator,
+    parse_contract_schema,
+    parse_type,
+)
+
+pytestmark = pytest.mark.unit
+
+
+class TestParseType:
+    """Annotations from either vocabulary normalize to one model."""
+
+    @pytest.mark.parametrize(
+        "python_style, typescript_style",
+        [
+            ("str", "string"),
+            ("int", "number"),
+            ("float", "integer"),
+            ("bool", "boolean"),
+            ("List[str]", "string[]"),
+            ("Sequence[Widget]", "Array<Widget>"),
+            ("Optional[int]", "number | null"),
+            ("Dict[str, Widget]", "Record<string, Widget>"),
+            ("datetime", "Date"),
+            ("Union[str, int]", "string | number"),
+        ],
+    )
+    def test_python_and_typescript_spellings_match(
+        self, python_style, typescript_style
+    ):
+        python_node = parse_type(python_style)
+        typescript_node = parse_type(typescript_style)
+
+        assert python_node.describe() == typescript_node.describe()
+
+    def test_markdown_prose_types(self):
+        assert parse_type("array of IngredientItem objects").describe() == (
+            "IngredientItem[]"
+        )
+        assert parse_type("array of strings").describe() == "string[]"
+        assert parse_type("ISO 8601 string").describe() == "string"
+        assert parse_type("map of numbers").additional.type == "number"
+
+    def test_constraints_and_qualifiers_do_not_change_type(self):
+        node = parse_type("number | null, optional, default 20, max 100")
+
+        assert node.type == "number"
+        assert node.nullable
+        assert not node.required
+
+    def test_inline_object_literal(self):
+        node = parse_type("{ x: number; y?: string; tags: string[] }")
+
+        assert node.type == "object"
+        assert node.properties["x"].type == "number"
+        assert not node.properties["y"].required
+        assert node.properties["tags"].describe() == "string[]"
+
+    @pytest.mark.parametrize("prose", ["for rendering", "see below", "e.g. a hex"])
+    def test_prose_is_not_a_type(self, prose):
+        assert parse_type(prose) is None
+
+    def test_literals_only_when_allowed(self):
+        assert parse_type("'active' | 'done'").type == "string"
+        assert parse_type("3001", literals=False) is None
+
+
+class TestParseContractSchema:
+    """Entities and fields extracted from one artifact."""
+
+    def test_heading_and_nested_bullets(self):
+        schema = parse_contract_schema(
+            "## WidgetPosition\n"
+            "- `position` (object) — grid placement\n"
+            "  - x (number)\n"
+            "  - y (number, optional)\n"
+            "- layers (array of objects)\n"
+            "  - name (string)\n"
+        )
+
+        widget = schema.definition("WidgetPosition")
+        position = widget.properties["position"]
+        assert position.properties["x"].type == "number"
+        assert not position.properties["y"].required
+        assert widget.properties["layers"].items.properties["name"].type == "string"
+        assert schema.field_count == 5
+
+    def test_dotted_names_scope_fields_to_an_entity(self):
+        schema = parse_contract_schema(
+            "### Data Entity Fields\n"
+            "- `todo.id` (string) — unique identifier\n"
+            "- `todo.owner.name` (string)\n"
+            "- completed (boolean)\n"
+        )
+
+        todo = schema.definition("todo")
+        assert todo.properties["owner"].properties["name"].type == "string"
+        assert schema.fields.properties["completed"].type == "boolean"
+
+    def test_colon_bullets_skip_values(self):
+        schema = parse_contract_schema(
+            "- `title`: string — display title\n"
+            "- API server port: `3001` (override via `PORT`)\n"
+            "- port: 3001\n"
+        )
+
+        assert list(schema.fields.properties) == ["title"]
+
+    def test_table_rows(self):
+        schema = parse_contract_schema(
+            "## `Recipe`\n"
+            "| Field | Type | Description |\n"
+            "|-------|------|-------------|\n"
+            "| `servings` | integer | portions |\n"
+            "| tags | string[] | labels |\n"
+        )
+
+        recipe = schema.definition("Recipe")
+        assert recipe.properties["servings"].type == "number"
+        assert recipe.properties["tags"].describe() == "string[]"
+
+    def test_typescript_and_python_code_blocks(self):
+        schema = parse_contract_schema(
+            "```typescript\n"
+            "export interface Widget extends Base {\n"
+            "  id: string;\n"
+            "  position: { x: number; y: number };\n"
+            "  onMove: (x: number) => void;\n"
+            "}\n"
+            "type Status = 'open' | 'closed';\n"
+            "```\n"
+            "```python\n"
+            "@dataclass\n"
+            "class Layout:\n"
+            '    """Grid layout."""\n'
+            "    widgets: List[Widget]\n"
+            "    columns: int = 12\n"
+            "\n"
+            "    def area(self) -> int:\n"
+            "        return 0\n"
+            "\n"
+            "class Color(str, Enum):\n"
+            "    RED: str = 'red'\n"
+            "```\n"
+        )
+
+        widget = schema.definition("Widget")
+        assert widget.properties["position"].properties["y"].type == "number"
+        assert widget.properties["onMove"].type == "any"
+        assert schema.definition("Status").type == "string"
+        layout = schema.definition("Layout")
+        assert set(layout.properties) == {"widgets", "columns"}
+        assert layout.properties["widgets"].describe() == "Widget[]"
+        assert schema.definition("Color") is None
+
+    def test_json_schema_export(self):
+        schema = parse_contract_schema(
+            "## Widget Entity\n- tags (Optional[List[str]], optional)\n"
+        )
+
+        exported = schema.to_json_schema()["definitions"]["Widget"]
+        assert exported["properties"]["tags"] == {
+            "anyOf": [{"type": "array", "items": {"type": "string"}}, {"type": "null"}]
+        }
+        assert "required" not in exported
+
+
+class TestSchemaComparator:
+    """Structural compatibility across two contracts."""
+
+    def _compare(self, left: str, right: str, entity: str):
+        schemas = {
+            "a.md": parse_contract_schema(left),
+            "b.md": parse_contract_schema(right),
+        }
+        comparator = SchemaComparator(schemas)
+        return [
+            str(conflict)
+            for conflict in comparator.compare(
+                entity,
+                "a.md",
+                schemas["a.md"].definition(entity),
+                "b.md",
+                schemas["b.md"].definition(entity),
+            )
+        ]
+
+    def test_reports_nested_conflict_path(self):
+        conflicts = self._compare(
+            "## Widget Entity\n- position (object)\n  - x (number)\n  - y (number)\n",
+            "```ts\ninterface Widget { position: { x: string; y: number } }\n```\n",
+            "Widget",
+        )
+
+        assert conflicts == ["Widget.position.x: number vs string"]
+
+    def test_resolves_renamed_types_structurally(self):
+        python = (
+            "```python\n"
+            "class Widget:\n    position: GridPosition\n\n"
+            "class GridPosition:\n    x: int\n    y: int\n"
+            "```\n"
+        )
+        same_shape = (
+            "```ts\n"
+            "interface Widget { position: Position }\n"
+            "interface Position { x: number; y: number }\n"
+            "```\n"
+        )
+        other_shape = same_shape.replace("y: number", "y: boolean")
+
+        assert self._compare(python, same_shape, "Widget") == []
+        assert self._compare(python, other_shape, "Widget") == [
+            "Widget.position.y: number vs boolean"
+        ]
+
+    def test_field_names_match_across_case_styles(self):
+        conflicts = self._compare(
+            "## Widget Entity\n- position_x (number)\n",
+            "## Widget Entity\n- positionX (string)\n",
+            "Widget",
+        )
+
+        assert conflicts == ["Widget.position_x: number vs string"]
+
+    def test_optional_nullable_and_subset_unions_are_compatible(self):
+        conflicts = self._compare(
+            "## Widget Entity\n- label (Optional[str])\n- size (int | str)\n"
+            "- extra (string)\n",
+            "## Widget Entity\n- label (string, optional)\n- size (number)\n",
+            "Widget",
+        )
+
+        assert conflicts == []
+
+    def test_array_element_and_self_reference(self):
+        conflicts = self._compare(
+            "```ts\ninterface Node { children: Node[]; tags: string[] }\n```\n",
+            "```ts\ninterface Node { children: Node[]; tags: number[] }\n```\n",
+            "Node",
+        )
+
+        assert conflicts == ["Node.tags[]: string vs number"]
+
+
+class TestContractSchemaCache:
+    """Parsed schemas are reused by content hash."""
+
+    def test_reparses_only_changed_content(self):
+        cache = ContractSchemaCache(max_entries=2)
+        first = cache.get("- field (string)\n")
+
+        assert cache.get("- field (string)\n") is first
+        cache.get("- field (number)\n")
+        cache.get("- other (number)\n")
+
+        assert (cache.hits, cache.misses) == (1, 3)
+        assert len(cache) == 2
+        assert cache.get("- field (string)\n") is not first
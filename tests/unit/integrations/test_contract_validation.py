@@ -19,6 +19,7 @@ win).
 
 import pytest
 
+from src.integrations.contract_schema import ContractSchemaCache
 from src.integrations.contract_validation import (
     check_contract_cross_file_consistency,
 )
@@ -473,3 +474,116 @@ class TestCheckContractCrossFileConsistency:
         assert result["pass"] is True
         # Only one file actually scanned
         assert result["files_scanned"] == 1
+
+    def test_reports_nested_path_across_python_and_typescript(self):
+        """
+        Entities are compared structurally, not as flat field names.
+
+        A Python dataclass and a TypeScript interface agree on the
+        top-level fields but disagree one level down; the contradiction
+        names the full path so the operator can find it.
+        """
+        contract_artifacts = {
+            "Python Layout": {
+                "artifacts": [
+                    _make_artifact(
+                        "python-layout-interface-contracts.md",
+                        "```python\n"
+                        "class Widget:\n"
+                        "    tags: List[str]\n"
+                        "    size: Optional[int]\n"
+                        "    position: GridPosition\n"
+                        "\n"
+                        "class GridPosition:\n"
+                        "    column: int\n"
+                        "```\n",
+                    ),
+                ],
+                "decisions": [],
+            },
+            "TS Layout": {
+                "artifacts": [
+                    _make_artifact(
+                        "ts-layout-interface-contracts.md",
+                        "```typescript\n"
+                        "interface Widget {\n"
+                        "  tags: string[];\n"
+                        "  size?: number | null;\n"
+                        "  position: { column: string };\n"
+                        "}\n"
+                        "```\n",
+                    ),
+                ],
+                "decisions": [],
+            },
+        }
+
+        result = check_contract_cross_file_consistency(contract_artifacts)
+
+        assert result["pass"] is False
+        assert result["shared_entities"] == 1
+        assert [c["path"] for c in result["contradictions"]] == [
+            "Widget.position.column"
+        ]
+        contradiction = result["contradictions"][0]
+        assert contradiction["field"] == "column"
+        # Types are reported as each contract wrote them
+        assert sorted(contradiction["types_by_file"].values()) == [
+            "int",
+            "string",
+        ]
+
+    def test_same_field_name_on_different_entities_is_not_compared(self):
+        """``Task.status`` and ``Build.status`` are separate fields."""
+        contract_artifacts = {
+            "Tasks": {
+                "artifacts": [
+                    _make_artifact(
+                        "tasks-interface-contracts.md",
+                        "## Task Entity\n- status (string)\n",
+                    ),
+                ],
+                "decisions": [],
+            },
+            "Builds": {
+                "artifacts": [
+                    _make_artifact(
+                        "builds-interface-contracts.md",
+                        "## Build Entity\n- status (number)\n",
+                    ),
+                ],
+                "decisions": [],
+            },
+        }
+
+        result = check_contract_cross_file_consistency(contract_artifacts)
+        assert result["pass"] is True
+
+    def test_recheck_reparses_only_edited_artifacts(self):
+        """Unchanged artifacts are served from the schema cache."""
+        cache = ContractSchemaCache()
+        contract_artifacts = {
+            f"Domain {i}": {
+                "artifacts": [
+                    _make_artifact(
+                        f"domain-{i}-interface-contracts.md",
+                        f"## Widget Entity\n- width (number)\n- label{i} (string)\n",
+                    ),
+                ],
+                "decisions": [],
+            }
+            for i in range(4)
+        }
+        assert check_contract_cross_file_consistency(contract_artifacts, cache)[
+            "pass"
+        ]
+        assert cache.misses == 4
+
+        contract_artifacts["Domain 2"]["artifacts"][0][
+            "content"
+        ] = "## Widget Entity\n- width (string)\n"
+        result = check_contract_cross_file_consistency(contract_artifacts, cache)
+
+        assert (cache.hits, cache.misses) == (3, 5)
+        assert result["pass"] is False
+        assert result["contradictions"][0]["path"] == "Widget.width"
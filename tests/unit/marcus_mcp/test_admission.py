@@ -0,0 +1,351 @@
+"""
+Unit tests for per-endpoint admission control in the MCP server.
+"""
+
+import asyncio
+from typing import Any, Dict
+
+import pytest
+from mcp.types import CallToolResult
+
+from src.marcus_mcp.admission import (
+    AdmissionConfig,
+    AdmissionControlledFastMCP,
+    AdmissionController,
+    AdmissionRejected,
+    EndpointLimits,
+    Priority,
+    classify_call,
+    get_admission_controller,
+    reset_admission_controller,
+)
+
+pytestmark = pytest.mark.unit
+
+
+def _controller(
+    total_slots: int = 2,
+    reserved: int = 0,
+    max_concurrent: int = 2,
+    max_queued: int = 10,
+    max_queue_wait: float = 5.0,
+) -> AdmissionController:
+    limits = {
+        name: EndpointLimits(max_concurrent, max_queued, max_queue_wait)
+        for name in ("agent", "human", "analytics")
+    }
+    return AdmissionController(
+        AdmissionConfig(
+            total_slots=total_slots,
+            reserved_coordination_slots=reserved,
+            endpoints=limits,
+        )
+    )
+
+
+async def _hold(
+    controller: AdmissionController,
+    endpoint: str,
+    tool: str,
+    release: asyncio.Event,
+    order: list,
+) -> None:
+    async with controller.admit(endpoint, tool):
+        order.append(tool)
+        await release.wait()
+
+
+async def _settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestClassifyCall:
+    """Priority of a call from its endpoint and tool."""
+
+    def test_coordination_tools_rank_first_on_any_endpoint(self):
+        assert classify_call("analytics", "request_next_task") is Priority.COORDINATION
+        assert classify_call("agent", "report_task_progress") is Priority.COORDINATION
+
+    def test_heavy_tools_are_background_on_any_endpoint(self):
+        assert classify_call("agent", "create_project") is Priority.BACKGROUND
+        assert classify_call("human", "query_project_history") is Priority.BACKGROUND
+
+    def test_other_tools_take_endpoint_default(self):
+        assert classify_call("human", "get_project_status") is Priority.INTERACTIVE
+        assert classify_call("analytics", "get_system_metrics") is Priority.BACKGROUND
+        assert classify_call("unknown", "get_project_status") is Priority.INTERACTIVE
+
+
+class TestAdmissionController:
+    """Slot accounting, priority ordering and load shedding."""
+
+    async def test_admits_immediately_under_limits(self):
+        controller = _controller()
+
+        async with controller.admit("agent", "request_next_task") as priority:
+            assert priority is Priority.COORDINATION
+            assert controller.in_flight == 1
+
+        stats = controller.get_stats()
+        assert stats["in_flight"] == 0
+        assert stats["endpoints"]["agent"]["admitted"] == 1
+
+    async def test_freed_slot_goes_to_highest_priority_waiter(self):
+        controller = _controller(total_slots=1)
+        release = asyncio.Event()
+        order: list = []
+
+        holder = asyncio.create_task(
+            _hold(controller, "analytics", "pipeline_report", release, order)
+        )
+        await _settle()
+        background = asyncio.create_task(
+            _hold(controller, "analytics", "get_system_metrics", release, order)
+        )
+        await _settle()
+        coordination = asyncio.create_task(
+            _hold(controller, "agent", "request_next_task", release, order)
+        )
+        await _settle()
+        assert controller.queued == 2
+
+        release.set()
+        await asyncio.gather(holder, background, coordination)
+
+        assert order == ["pipeline_report", "request_next_task", "get_system_metrics"]
+
+    async def test_reserved_slots_only_go_to_coordination(self):
+        controller = _controller(total_slots=3, reserved=1, max_concurrent=3)
+        release = asyncio.Event()
+        order: list = []
+
+        holders = [
+            asyncio.create_task(
+                _hold(controller, "human", f"get_project_status_{i}", release, order)
+            )
+            for i in range(3)
+        ]
+        await _settle()
+        assert controller.in_flight == 2
+        assert controller.queued == 1
+
+        async with controller.admit("agent", "request_next_task"):
+            assert controller.in_flight == 3
+
+        release.set()
+        await asyncio.gather(*holders)
+
+    async def test_endpoint_cap_does_not_block_other_endpoints(self):
+        controller = _controller(total_slots=4, max_concurrent=1)
+        release = asyncio.Event()
+        order: list = []
+
+        holder = asyncio.create_task(
+            _hold(controller, "analytics", "pipeline_report", release, order)
+        )
+        waiter = asyncio.create_task(
+            _hold(controller, "analytics", "pipeline_compare", release, order)
+        )
+        await _settle()
+        assert controller.queued == 1
+
+        async with controller.admit("agent", "request_next_task"):
+            assert order == ["pipeline_report"]
+
+        release.set()
+        await asyncio.gather(holder, waiter)
+
+    async def test_full_queue_sheds_with_retry_after(self):
+        controller = _controller(total_slots=1, max_queued=0)
+        release = asyncio.Event()
+        holder = asyncio.create_task(
+            _hold(controller, "analytics", "pipeline_report", release, [])
+        )
+        await _settle()
+
+        with pytest.raises(AdmissionRejected) as exc_info:
+            async with controller.admit("analytics", "pipeline_compare"):
+                pass
+
+        response = exc_info.value.to_response()
+        assert response["success"] is False
+        assert response["error"] == "overloaded"
+        assert response["reason"] == "queue_full"
+        assert response["tool"] == "pipeline_compare"
+        config = controller.config
+        assert config.min_retry_after <= response["retry_after"]
+        assert response["retry_after"] <= config.max_retry_after
+        assert controller.get_stats()["endpoints"]["analytics"]["rejected"] == 1
+
+        release.set()
+        await holder
+
+    async def test_queue_wait_limit_sheds_and_forgets_waiter(self):
+        controller = _controller(total_slots=1, max_queue_wait=0.05)
+        release = asyncio.Event()
+        holder = asyncio.create_task(
+            _hold(controller, "human", "create_project", release, [])
+        )
+        await _settle()
+
+        with pytest.raises(AdmissionRejected) as exc_info:
+            async with controller.admit("human", "add_feature"):
+                pass
+
+        assert exc_info.value.reason == "queue_timeout"
+        assert controller.queued == 0
+        release.set()
+        await holder
+        assert controller.in_flight == 0
+
+    async def test_cancelled_waiter_is_removed(self):
+        controller = _controller(total_slots=1)
+        release = asyncio.Event()
+        holder = asyncio.create_task(
+            _hold(controller, "human", "create_project", release, [])
+        )
+        await _settle()
+        waiter = asyncio.create_task(
+            _hold(controller, "human", "add_feature", release, [])
+        )
+        await _settle()
+
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        assert controller.queued == 0
+        release.set()
+        await holder
+        assert controller.in_flight == 0
+
+    async def test_drain_waits_for_in_flight_and_refuses_new_calls(self):
+        controller = _controller()
+        release = asyncio.Event()
+        order: list = []
+        holder = asyncio.create_task(
+            _hold(controller, "agent", "report_task_progress", release, order)
+        )
+        await _settle()
+
+        drain = asyncio.create_task(controller.drain(5.0, retry_after=7.0))
+        await _settle()
+        assert controller.draining and not drain.done()
+
+        with pytest.raises(AdmissionRejected) as exc_info:
+            async with controller.admit("agent", "request_next_task"):
+                pass
+        assert exc_info.value.reason == "draining"
+        assert exc_info.value.retry_after == 7.0
+
+        release.set()
+        assert await drain == 0
+        await holder
+        assert order == ["report_task_progress"]
+
+        controller.resume()
+        async with controller.admit("agent", "request_next_task"):
+            pass
+
+    async def test_drain_sheds_queued_calls(self):
+        controller = _controller(total_slots=1)
+        release = asyncio.Event()
+        holder = asyncio.create_task(
+            _hold(controller, "human", "create_project", release, [])
+        )
+        await _settle()
+        waiter = asyncio.create_task(
+            _hold(controller, "human", "add_feature", release, [])
+        )
+        await _settle()
+
+        drain = asyncio.create_task(controller.drain(5.0))
+        with pytest.raises(AdmissionRejected) as exc_info:
+            await waiter
+
+        assert exc_info.value.reason == "draining"
+        assert controller.queued == 0
+        release.set()
+        assert await drain == 0
+        await holder
+
+    async def test_drain_timeout_reports_calls_still_running(self):
+        controller = _controller()
+        release = asyncio.Event()
+        holder = asyncio.create_task(
+            _hold(controller, "analytics", "pipeline_report", release, [])
+        )
+        await _settle()
+
+        assert await controller.drain(0.05) == 1
+
+        release.set()
+        await holder
+        assert controller.in_flight == 0
+
+    def test_configure_endpoint_ignores_unset_values(self):
+        controller = AdmissionController()
+        default = controller.limits_for("agent")
+
+        limits = controller.configure_endpoint(
+            "agent", max_concurrent=5, max_queued=None, max_queue_wait=None
+        )
+
+        assert limits.max_concurrent == 5
+        assert limits.max_queued == default.max_queued
+        assert controller.limits_for("agent") is limits
+
+    def test_shared_controller_registry(self):
+        reset_admission_controller()
+        controller = get_admission_controller()
+
+        assert get_admission_controller() is controller
+        reset_admission_controller()
+        assert get_admission_controller() is not controller
+        reset_admission_controller()
+
+
+class TestAdmissionControlledFastMCP:
+    """Tool calls on an endpoint app pass through the controller."""
+
+    async def test_tool_call_runs_under_a_slot(self):
+        controller = _controller()
+        app = AdmissionControlledFastMCP(
+            "marcus-agent", endpoint="agent", admission=controller
+        )
+        seen: Dict[str, Any] = {}
+
+        @app.tool()
+        async def request_next_task(agent_id: str) -> Dict[str, Any]:
+            seen["in_flight"] = controller.in_flight
+            return {"success": True, "agent_id": agent_id}
+
+        await app.call_tool("request_next_task", {"agent_id": "a1"})
+
+        assert seen["in_flight"] == 1
+        assert controller.get_stats()["endpoints"]["agent"]["admitted"] == 1
+
+    async def test_overloaded_call_returns_retry_after_result(self):
+        controller = _controller(total_slots=1, max_queued=0)
+        app = AdmissionControlledFastMCP(
+            "marcus-analytics", endpoint="analytics", admission=controller
+        )
+        release = asyncio.Event()
+        holder = asyncio.create_task(
+            _hold(controller, "analytics", "pipeline_report", release, [])
+        )
+        await _settle()
+
+        @app.tool()
+        async def get_system_metrics() -> Dict[str, Any]:
+            return {"success": True}
+
+        result = await app.call_tool("get_system_metrics", {})
+
+        assert isinstance(result, CallToolResult)
+        assert result.isError
+        assert result.structuredContent["error"] == "overloaded"
+        assert result.structuredContent["retry_after"] >= 1.0
+        release.set()
+        await holder
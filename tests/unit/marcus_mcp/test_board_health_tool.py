@@ -0,0 +1,82 @@
+"""
+Unit tests for the check_board_health tool.
+"""
+
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from src.config.marcus_config import BoardHealthSettings
+from src.core.board_health_model import BoardHealthModel
+from src.core.board_snapshot import BoardSnapshotService
+from src.core.models import Priority, Task, TaskStatus
+from src.marcus_mcp.tools.board_health import check_board_health
+
+pytestmark = pytest.mark.unit
+
+
+def _task(task_id: str, **kwargs) -> Task:
+    now = datetime.now(timezone.utc)
+    return Task(
+        id=task_id,
+        name=f"Task {task_id}",
+        description="",
+        status=TaskStatus.TODO,
+        priority=Priority.MEDIUM,
+        assigned_to=None,
+        created_at=now,
+        updated_at=now,
+        due_date=None,
+        estimated_hours=1.0,
+        **kwargs,
+    )
+
+
+def _state(**overrides) -> SimpleNamespace:
+    kanban_client = Mock()
+    dependents = [_task(f"d{i}", dependencies=["core"]) for i in range(4)]
+    kanban_client.get_all_tasks = AsyncMock(return_value=[_task("core"), *dependents])
+    values = {
+        "kanban_client": kanban_client,
+        "initialize_kanban": AsyncMock(),
+        "project_registry": None,
+        "config": SimpleNamespace(board_health=BoardHealthSettings()),
+        "agent_tasks": {},
+        "agent_status": {},
+        "lease_manager": None,
+    }
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+@patch("src.marcus_mcp.tools.board_health.log_thinking", Mock())
+class TestCheckBoardHealth:
+    """Board health reporting from the shared model or a full analysis."""
+
+    async def test_reads_shared_model_kept_by_board_feed(self):
+        state = _state()
+        snapshots = BoardSnapshotService(state.kanban_client, refresh_interval=60)
+        model = BoardHealthModel()
+        model.attach(snapshots)
+        state.board_snapshot, state.board_health = snapshots, model
+
+        first = await check_board_health(state)
+        second = await check_board_health(state)
+
+        assert first["success"] and second["success"]
+        assert [i["type"] for i in second["issues"]] == ["bottleneck"]
+        assert second["health_score"] == model.health_score
+        # Both calls were served from one board fetch
+        assert state.kanban_client.get_all_tasks.await_count == 1
+
+    async def test_falls_back_to_full_analysis_with_global_settings(self):
+        settings = BoardHealthSettings(max_tasks_per_agent=5)
+        state = _state(config=SimpleNamespace(board_health=settings))
+
+        result = await check_board_health(state)
+
+        assert result["success"]
+        assert [i["type"] for i in result["issues"]] == ["bottleneck"]
+        assert state.kanban_client.get_all_tasks.await_count == 1
@@ -0,0 +1,291 @@
+"""
+Kill-and-restart test for graceful shutdown and warm restart.
+
+An in-process server receives a real SIGTERM while agents have tool
+calls in flight. The calls must finish, new calls must be refused with a
+``retry_after`` hint from the moment the signal arrives, and a second
+server started afterwards must come back with the agents, assignments
+and recovery info of the first.
+"""
+
+import asyncio
+import functools
+import json
+import os
+import signal
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List
+
+import pytest
+import uvicorn
+from mcp.types import CallToolResult
+
+import src.marcus_mcp.server as server_module
+from src.config import marcus_config
+from src.core.assignment_persistence import AssignmentPersistence
+from src.core.board_snapshot import BoardSnapshotService, reset_board_snapshots
+from src.core.models import (
+    Priority,
+    RecoveryInfo,
+    Task,
+    TaskAssignment,
+    TaskStatus,
+    WorkerStatus,
+)
+from src.core.warm_restart import WarmStateStore
+from src.marcus_mcp.admission import (
+    AdmissionControlledFastMCP,
+    get_admission_controller,
+    reset_admission_controller,
+)
+from src.marcus_mcp.server import DrainingUvicornServer, MarcusServer
+
+pytestmark = pytest.mark.unit
+
+AGENTS = 4
+
+
+@pytest.fixture
+def checkpoint_path(tmp_path, monkeypatch):
+    """Run servers against a throwaway config, home and checkpoint file."""
+    config_file = tmp_path / "config_marcus.json"
+    config_file.write_text(
+        json.dumps({"ai": {"enabled": False}, "kanban": {"provider": "sqlite"}})
+    )
+    monkeypatch.setenv("MARCUS_CONFIG", str(config_file))
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setattr(marcus_config, "_config", None)
+    monkeypatch.setattr(MarcusServer, "_setup_signal_handlers", lambda self: None)
+    path = tmp_path / "warm_restart.json"
+    monkeypatch.setattr(
+        server_module, "WarmStateStore", functools.partial(WarmStateStore, path)
+    )
+    reset_admission_controller()
+    yield path
+    reset_admission_controller()
+
+
+def _server(tmp_path) -> MarcusServer:
+    server = MarcusServer()
+    server.assignment_persistence = AssignmentPersistence(tmp_path / "assignments")
+    return server
+
+
+def _task(task_id: str, agent_id: str) -> Task:
+    now = datetime.now(timezone.utc)
+    return Task(
+        id=task_id,
+        name=f"Task {task_id}",
+        description="",
+        status=TaskStatus.IN_PROGRESS,
+        priority=Priority.MEDIUM,
+        assigned_to=agent_id,
+        created_at=now,
+        updated_at=now,
+        due_date=None,
+        estimated_hours=1.0,
+    )
+
+
+def _start_workload(server: MarcusServer) -> None:
+    """Register agents with one in-progress task each."""
+    for i in range(AGENTS):
+        agent_id = f"agent-{i}"
+        task = _task(f"task-{i}", agent_id)
+        server.project_tasks.append(task)
+        server.agent_status[agent_id] = WorkerStatus(
+            worker_id=agent_id,
+            name=agent_id,
+            role="Developer",
+            email=None,
+            current_tasks=[task],
+            completed_tasks_count=0,
+            capacity=40,
+            skills=["python"],
+            availability={},
+        )
+        server.agent_tasks[agent_id] = TaskAssignment(
+            task_id=task.id,
+            task_name=task.name,
+            description="",
+            instructions="",
+            estimated_hours=1.0,
+            priority=Priority.MEDIUM,
+            dependencies=[],
+            assigned_to=agent_id,
+            assigned_at=task.created_at,
+            due_date=None,
+        )
+    server.project_tasks[0].recovery_info = RecoveryInfo(
+        recovered_at=datetime.now(timezone.utc),
+        recovered_from_agent="agent-crashed",
+        previous_progress=60,
+        time_spent_minutes=30.0,
+        recovery_reason="lease_expired",
+        instructions="Merge the previous branch",
+    )
+
+
+def _agent_app(server: MarcusServer) -> AdmissionControlledFastMCP:
+    app = AdmissionControlledFastMCP("marcus-agent", endpoint="agent")
+
+    @app.tool()
+    async def report_task_progress(agent_id: str, progress: int) -> Dict[str, Any]:
+        await asyncio.sleep(0.1)
+        server.agent_status[agent_id].completed_tasks_count = progress
+        return {"success": True}
+
+    return app
+
+
+async def _idle_asgi_app(scope: Dict[str, Any], receive: Any, send: Any) -> None:
+    """ASGI app for a uvicorn server that only needs to be signalled."""
+
+
+async def test_kill_and_restart_mid_workload(checkpoint_path, tmp_path):
+    first = _server(tmp_path)
+    _start_workload(first)
+    app = _agent_app(first)
+    http_server = DrainingUvicornServer(
+        uvicorn.Config(
+            _idle_asgi_app,
+            host="127.0.0.1",
+            port=0,
+            lifespan="off",
+            # dictConfig would close the handlers other tests installed
+            log_config=None,
+            timeout_graceful_shutdown=5,
+        ),
+        retry_after=5.0,
+    )
+    # uvicorn re-raises the signal once it has stopped (MarcusServer's own
+    # handler then runs shutdown); record it instead of exiting pytest
+    raised_after_stop = []
+    previous = signal.signal(
+        signal.SIGTERM, lambda signum, frame: raised_after_stop.append(signum)
+    )
+    try:
+        serving = asyncio.create_task(http_server.serve())
+        while not http_server.started:
+            await asyncio.sleep(0.01)
+
+        calls = [
+            asyncio.create_task(
+                app.call_tool(
+                    "report_task_progress", {"agent_id": f"agent-{i}", "progress": 50}
+                )
+            )
+            for i in range(AGENTS)
+        ]
+        await asyncio.sleep(0.02)
+        assert get_admission_controller().in_flight == AGENTS
+
+        os.kill(os.getpid(), signal.SIGTERM)
+        for _ in range(100):
+            if get_admission_controller().draining:
+                break
+            await asyncio.sleep(0.01)
+        refused = await app.call_tool(
+            "report_task_progress", {"agent_id": "agent-0", "progress": 90}
+        )
+        await serving
+    finally:
+        signal.signal(signal.SIGTERM, previous)
+    summary = await first.shutdown(drain_timeout=5.0)
+    results = await asyncio.gather(*calls)
+
+    # In-flight calls finished; the late call was told when to come back
+    assert raised_after_stop == [signal.SIGTERM]
+    assert summary["in_flight"] == 0
+    assert all(not isinstance(r, CallToolResult) for r in results)
+    assert isinstance(refused, CallToolResult) and refused.isError
+    assert refused.structuredContent["reason"] == "draining"
+    assert refused.structuredContent["retry_after"] == 5.0
+    assert checkpoint_path.exists()
+
+    # Restart: a fresh process-wide state and a new server
+    reset_admission_controller()
+    second = _server(tmp_path)
+    start = time.perf_counter()
+    restored = await second._restore_warm_state()
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 1.0
+    assert restored["agents"] == AGENTS and restored["assignments"] == AGENTS
+    assert second.agent_tasks["agent-2"].task_id == "task-2"
+    assert second.agent_status["agent-1"].completed_tasks_count == 50
+    recovery = second.project_tasks[0].recovery_info
+    assert recovery.recovered_from_agent == "agent-crashed"
+    assert not checkpoint_path.exists()
+
+    # The restarted server takes work again
+    result = await _agent_app(second).call_tool(
+        "report_task_progress", {"agent_id": "agent-3", "progress": 75}
+    )
+    assert not isinstance(result, CallToolResult)
+    assert second.agent_status["agent-3"].completed_tasks_count == 75
+
+
+class _Board:
+    """Kanban stand-in that counts full-board fetches."""
+
+    def __init__(self, tasks: List[Task]) -> None:
+        self.tasks = tasks
+        self.fetches = 0
+
+    async def get_all_tasks(self) -> List[Task]:
+        self.fetches += 1
+        return list(self.tasks)
+
+
+async def test_restart_seeds_board_snapshot(checkpoint_path, tmp_path):
+    """The saved board seeds the new snapshot service before any fetch."""
+    first = _server(tmp_path)
+    _start_workload(first)
+    first.board_snapshot = BoardSnapshotService(_Board([]))
+    first.board_snapshot.restore(list(first.project_tasks), version=7)
+    await first.shutdown(drain_timeout=1.0)
+
+    second = _server(tmp_path)
+    board = _Board(list(first.project_tasks))
+    second.kanban_client = board
+    reset_board_snapshots()
+    try:
+        await second._initialize_monitoring_systems()
+
+        snapshot = second.board_snapshot.snapshot
+        assert snapshot is not None and snapshot.version == 7
+        assert [t.id for t in snapshot.tasks] == [f"task-{i}" for i in range(AGENTS)]
+        assert board.fetches == 0
+        assert second.agent_tasks["agent-2"].task_id == "task-2"
+        assert await second._restore_warm_state() == {}
+    finally:
+        await second.assignment_monitor.stop()
+        await second.board_snapshot.stop()
+        reset_board_snapshots()
+
+
+async def test_saved_board_waits_for_snapshot_service(checkpoint_path, tmp_path):
+    """Restored before a kanban client exists, the board is seeded later."""
+    first = _server(tmp_path)
+    _start_workload(first)
+    first.board_snapshot = BoardSnapshotService(_Board([]))
+    first.board_snapshot.restore(list(first.project_tasks), version=3)
+    await first.shutdown(drain_timeout=1.0)
+
+    second = _server(tmp_path)
+    restored = await second._restore_warm_state()
+    assert restored["agents"] == AGENTS and restored["board_tasks"] == 0
+
+    second.kanban_client = _Board([])
+    reset_board_snapshots()
+    try:
+        await second._initialize_monitoring_systems()
+
+        assert second.board_snapshot.snapshot.version == 3
+        assert second.kanban_client.fetches == 0
+    finally:
+        await second.assignment_monitor.stop()
+        await second.board_snapshot.stop()
+        reset_board_snapshots()
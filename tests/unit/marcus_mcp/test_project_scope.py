@@ -0,0 +1,185 @@
+"""
+Unit tests for project-scoped server state and tool routing.
+"""
+
+import json
+import types
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, List, Optional
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from src.config.marcus_config import TaskLeaseSettings
+from src.core.board_snapshot import reset_board_snapshots
+from src.core.project_context_manager import ProjectContext
+from src.marcus_mcp.handlers import handle_tool_call
+from src.marcus_mcp.project_scope import ProjectScopedState
+from src.marcus_mcp.server import MarcusServer
+
+pytestmark = pytest.mark.unit
+
+
+class FakeServer:
+    """Minimal stand-in for MarcusServer's per-project and shared state."""
+
+    def __init__(self) -> None:
+        self.project_tasks: List[Any] = ["active-task"]
+        self.kanban_client = "active-client"
+        self.agent_status: dict[str, Any] = {}
+        self.agent_project_map = {"agent-b": "project-b"}
+        self.is_multi_project_mode = True
+        self.contexts = {"project-b": ProjectContext("project-b")}
+        self.scoped_calls: List[Optional[str]] = []
+
+    def task_count(self) -> int:
+        return len(self.project_tasks)
+
+    def log_event(self, event_type: str, data: dict) -> None:
+        pass
+
+    @asynccontextmanager
+    async def project_scope(self, project_id: Optional[str]) -> AsyncIterator[Any]:
+        self.scoped_calls.append(project_id)
+        context = self.contexts.get(project_id or "")
+        yield ProjectScopedState(self, context) if context else self
+
+
+class TestProjectScopedState:
+    """Attribute routing on the scoped view."""
+
+    async def test_scoped_attributes_come_from_project(self):
+        """Per-project attributes resolve on the context, others on the server."""
+        server = FakeServer()
+        context = server.contexts["project-b"]
+        context.project_name = "B"
+        scoped = ProjectScopedState(server, context)
+
+        assert scoped.project_tasks == []
+        assert scoped.kanban_client is None
+        assert scoped.current_project_id == "project-b"
+        assert scoped.current_project_name == "B"
+        assert scoped.assignment_lock is context.assignment_lock
+        assert scoped.agent_status is server.agent_status
+
+    def test_writes_are_routed(self):
+        """Assignments land on the context or the server as appropriate."""
+        server = FakeServer()
+        context = server.contexts["project-b"]
+        scoped = ProjectScopedState(server, context)
+
+        scoped.project_tasks = ["b-task"]
+        scoped.agent_status = {"agent-b": "idle"}
+
+        assert context.project_tasks == ["b-task"]
+        assert server.project_tasks == ["active-task"]
+        assert server.agent_status == {"agent-b": "idle"}
+
+    def test_server_methods_run_against_the_view(self):
+        """Methods called through the view see the scoped project's state."""
+        server = FakeServer()
+        context = server.contexts["project-b"]
+        context.project_tasks = ["b1", "b2", "b3"]
+
+        assert ProjectScopedState(server, context).task_count() == 3
+        assert server.task_count() == 1
+
+
+class TestScopedMonitoringSystems:
+    """Monitoring systems initialized through a view belong to its project."""
+
+    async def test_board_services_and_lease_config_are_per_project(self):
+        """The scoped project gets its own snapshot, health and lease config."""
+        server = FakeServer()
+        server.monitor = Mock(board_snapshot=None)
+        server.board_snapshot = server.board_health = None
+        server.lease_manager = "active-leases"
+        server.code_analyzer = None
+        server.provider = "github"
+        server.config = Mock()
+        server.config.board_health.stale_task_days = 7
+        server.config.board_health.max_tasks_per_agent = 3
+        projects = {
+            "project-b": Mock(task_lease=TaskLeaseSettings(default_hours=5.0))
+        }
+        server.project_registry = Mock(
+            get_project=AsyncMock(side_effect=projects.get),
+            get_active_project=AsyncMock(
+                return_value=Mock(task_lease=TaskLeaseSettings(default_hours=1.0))
+            ),
+        )
+        context = server.contexts["project-b"]
+        context.kanban_client = Mock()
+        scoped = ProjectScopedState(server, context)
+        server._handle_lease_recovery = Mock()
+        server._initialize_code_analyzer = types.MethodType(
+            MarcusServer._initialize_code_analyzer, scoped
+        )
+        initialize = types.MethodType(
+            MarcusServer._initialize_monitoring_systems, scoped
+        )
+
+        reset_board_snapshots()
+        try:
+            with patch(
+                "src.marcus_mcp.server.AssignmentMonitor",
+                return_value=Mock(start=AsyncMock()),
+            ):
+                await initialize()
+        finally:
+            reset_board_snapshots()
+
+        assert context.board_snapshot.kanban_client is context.kanban_client
+        assert context.board_health is not None
+        assert server.board_snapshot is None and server.board_health is None
+        assert server.monitor.board_snapshot is None
+        assert context.lease_manager.default_lease_hours == 5.0
+        assert server.lease_manager == "active-leases"
+        assert context.code_analyzer is not None and server.code_analyzer is None
+
+
+class TestToolRouting:
+    """handle_tool_call routes agent tools by project."""
+
+    @staticmethod
+    async def _call(server: FakeServer, name: str, arguments: dict) -> Any:
+        seen = {}
+
+        async def fake_request_next_task(agent_id: str, state: Any) -> dict:
+            seen["state"] = state
+            return {"success": True}
+
+        with (
+            patch("src.marcus_mcp.handlers.get_client_tools", return_value=["*"]),
+            patch(
+                "src.marcus_mcp.handlers.request_next_task",
+                side_effect=fake_request_next_task,
+            ),
+            patch(
+                "src.marcus_mcp.handlers.get_audit_logger",
+                return_value=AsyncMock(),
+            ),
+        ):
+            result = await handle_tool_call(name, arguments, server)
+        assert json.loads(result[0].text)["success"] is True
+        return seen["state"]
+
+    async def test_agent_calls_use_their_project(self):
+        """An agent's calls run against its registered project's state."""
+        server = FakeServer()
+
+        state = await self._call(server, "request_next_task", {"agent_id": "agent-b"})
+
+        assert isinstance(state, ProjectScopedState)
+        assert state.current_project_id == "project-b"
+        assert server.scoped_calls == ["project-b"]
+
+    async def test_single_project_mode_is_unscoped(self):
+        """Without multi-project mode the server is used directly."""
+        server = FakeServer()
+        server.is_multi_project_mode = False
+
+        state = await self._call(server, "request_next_task", {"agent_id": "agent-b"})
+
+        assert state is server
+        assert server.scoped_calls == []
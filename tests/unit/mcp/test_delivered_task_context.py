@@ -28,6 +28,7 @@ from typing import Any, Dict, List
 
 import pytest
 
+from src.core.attachment_cache import AttachmentCache
 from src.core.models import Priority, Task, TaskStatus
 from src.marcus_mcp.tools.context import (
     ARCHITECTURAL_ARTIFACT_TYPES,
@@ -408,3 +409,81 @@ class TestAssembleTaskContext:
         assert bundle["project_contract"] == {"artifacts": [], "decisions": []}
         assert bundle["dependency_artifacts"] == []
         assert bundle["transitive_context"] == {"artifacts": [], "decisions": []}
+
+
+class _CountingKanbanClient(_MockKanbanClient):
+    """Mock Kanban client that records every get_attachments call."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.calls: List[str] = []
+
+    async def get_attachments(self, card_id: str) -> Dict[str, Any]:
+        self.calls.append(card_id)
+        return await super().get_attachments(card_id)
+
+
+class TestCachedArtifactFetching:
+    """Dependency attachments are fetched once, cached and deduplicated."""
+
+    @pytest.mark.asyncio
+    async def test_chain_attachments_fetched_once_and_cached(
+        self, state: _MockState
+    ) -> None:
+        """Each task's attachments are fetched once across repeated calls."""
+        chain = [_task("t0")] + [
+            _task(f"t{i}", dependencies=[f"t{i - 1}"]) for i in range(1, 6)
+        ]
+        state.project_tasks = chain
+        client = _CountingKanbanClient({"t0": [{"id": "a0", "name": "root.md"}]})
+        state.kanban_client = client  # type: ignore[assignment]
+        state.attachment_cache = AttachmentCache()  # type: ignore[attr-defined]
+
+        first = await assemble_task_context("t5", chain[-1], state)
+        second = await assemble_task_context("t5", chain[-1], state)
+
+        assert sorted(client.calls) == [f"t{i}" for i in range(6)]
+        assert first == second
+        assert [a["filename"] for a in first["transitive_context"]["artifacts"]] == [
+            "root.md"
+        ]
+
+    @pytest.mark.asyncio
+    async def test_status_change_refetches(self, state: _MockState) -> None:
+        """A dependency whose status changed has its attachments refetched."""
+        dep = _task("dep")
+        leaf = _task("leaf", dependencies=["dep"])
+        state.project_tasks = [dep, leaf]
+        client = _CountingKanbanClient()
+        state.kanban_client = client  # type: ignore[assignment]
+        state.attachment_cache = AttachmentCache()  # type: ignore[attr-defined]
+
+        await assemble_task_context("leaf", leaf, state)
+        dep.status = TaskStatus.DONE
+        await assemble_task_context("leaf", leaf, state)
+
+        assert client.calls.count("dep") == 2
+        assert client.calls.count("leaf") == 1
+
+    @pytest.mark.asyncio
+    async def test_shared_artifact_delivered_once(self, state: _MockState) -> None:
+        """An artifact several dependencies share appears once."""
+        shared = {
+            "filename": "api.md",
+            "location": "docs/api/api.md",
+            "artifact_type": "api",
+        }
+        root = _task("root")
+        left = _task("left", dependencies=["root"])
+        right = _task("right", dependencies=["root"])
+        leaf = _task("leaf", dependencies=["left", "right"])
+        state.project_tasks = [root, left, right, leaf]
+        for task_id in ("root", "left", "right"):
+            state.task_artifacts[task_id] = [dict(shared)]
+
+        bundle = await assemble_task_context("leaf", leaf, state)
+
+        assert [a["dependency_task_id"] for a in bundle["dependency_artifacts"]] == [
+            "left"
+        ]
+        assert bundle["transitive_context"]["artifacts"] == []
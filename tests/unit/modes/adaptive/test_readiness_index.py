@@ -0,0 +1,294 @@
+"""
+Unit tests for the Adaptive Mode readiness index.
+
+The index must give the same answers as the board scans it replaced, so
+most tests compare it against a straightforward reference implementation
+on randomly mutated boards.
+"""
+
+import random
+import re
+from datetime import datetime, timezone
+from typing import List, Optional
+
+import pytest
+
+from src.core.board_snapshot import BoardSnapshotService, diff_tasks
+from src.core.models import Priority, Task, TaskStatus
+from src.modes.adaptive.basic_adaptive import BasicAdaptiveMode
+from src.modes.adaptive.readiness_index import TaskReadinessIndex
+
+pytestmark = pytest.mark.unit
+
+VERBS = ["Setup", "Design", "Implement", "Build", "Test", "Deploy", "Review", "Write"]
+NOUNS = ["auth", "api", "frontend", "database", "login", "admin", "docs", "server"]
+STATUSES = [TaskStatus.TODO, TaskStatus.IN_PROGRESS, TaskStatus.DONE]
+
+
+def _task(
+    task_id: str,
+    name: str,
+    dependencies: Optional[List[str]] = None,
+    status: TaskStatus = TaskStatus.TODO,
+) -> Task:
+    now = datetime.now(timezone.utc)
+    return Task(
+        id=task_id,
+        name=name,
+        description="",
+        status=status,
+        priority=Priority.MEDIUM,
+        assigned_to=None,
+        created_at=now,
+        updated_at=now,
+        due_date=None,
+        estimated_hours=1.0,
+        dependencies=dependencies or [],
+    )
+
+
+def _random_board(rng: random.Random, size: int) -> List[Task]:
+    tasks = []
+    for i in range(size):
+        deps = [f"t{j}" for j in rng.sample(range(size), rng.randint(0, 2))]
+        if rng.random() < 0.1:
+            deps.append(f"missing{i}")
+        name = f"{rng.choice(VERBS)} {rng.choice(NOUNS)} {rng.choice(NOUNS)}"
+        tasks.append(_task(f"t{i}", name, deps, rng.choice(STATUSES)))
+    return tasks
+
+
+def _reference_unblocked(
+    mode: BasicAdaptiveMode, task: Task, all_tasks: List[Task]
+) -> bool:
+    """Board-scanning blocking check, as Adaptive Mode used to compute it."""
+    for dep_id in task.dependencies:
+        dep = next((t for t in all_tasks if t.id == dep_id), None)
+        if dep and dep.status != TaskStatus.DONE:
+            return False
+    text = f"{task.name} {task.description or ''}".lower()
+    for pattern in mode.LOGICAL_DEPENDENCY_PATTERNS:
+        if re.search(pattern["blocks_until_complete"], text):
+            for other in all_tasks:
+                other_text = f"{other.name} {other.description or ''}".lower()
+                if (
+                    re.search(pattern["pattern"], other_text)
+                    and other.status != TaskStatus.DONE
+                    and other.id != task.id
+                ):
+                    return False
+    name = task.name.lower()
+    if any(w in name for w in ["deploy", "production", "release", "launch"]):
+        for other in all_tasks:
+            if (
+                any(
+                    w in other.name.lower()
+                    for w in ["implement", "build", "create", "develop"]
+                )
+                and other.status != TaskStatus.DONE
+                and other.id != task.id
+            ):
+                return False
+    if any(w in name for w in ["test", "qa", "quality"]):
+        for other in all_tasks:
+            if (
+                any(w in other.name.lower() for w in ["implement", "build", "create"])
+                and other.status != TaskStatus.DONE
+                and mode._tasks_related(task, other)
+            ):
+                return False
+    return True
+
+
+class TestTaskReadinessIndex:
+    """Incremental maintenance of dependents, unmet counts and blockers."""
+
+    def test_ready_set_follows_status_changes(self):
+        """Completing a dependency moves its dependents into the ready set."""
+        index = TaskReadinessIndex([])
+        index.sync(
+            [
+                _task("a", "Write a"),
+                _task("b", "Write b", ["a"]),
+                _task("c", "Write c", ["a", "b", "ghost"]),
+            ]
+        )
+
+        assert index.ready == {"a"}
+        assert index.dependent_count("a") == 2
+        assert index.dependent_count("ghost") == 1
+
+        index.update_status("a", TaskStatus.DONE)
+        assert index.ready == {"a", "b"}
+
+        index.update_status("b", TaskStatus.DONE)
+        assert index.ready == {"a", "b", "c"}
+
+        index.update_status("a", TaskStatus.IN_PROGRESS)
+        assert index.ready == {"a"}
+
+    def test_sync_adds_and_removes_tasks(self):
+        """Tasks missing from a sync stop blocking and counting."""
+        index = TaskReadinessIndex([])
+        index.sync([_task("a", "Write a"), _task("b", "Write b", ["a"])])
+        index.sync([_task("b", "Write b", ["a"])])
+
+        assert len(index) == 1 and "a" not in index
+        assert index.ready == {"b"}
+
+        index.sync([_task("b", "Write b", ["a"]), _task("a", "Write a")])
+        assert index.ready == {"a"}
+
+    def test_apply_changes_updates_only_named_tasks(self):
+        """Board change events update, add and drop tasks individually."""
+        before = {"a": _task("a", "Write a"), "b": _task("b", "Write b", ["a"])}
+        after = {
+            "a": _task("a", "Write a", status=TaskStatus.DONE),
+            "c": _task("c", "Write c", ["b"]),
+        }
+        index = TaskReadinessIndex([])
+        index.sync(list(before.values()))
+
+        index.apply_changes(diff_tasks(before, after, 2))
+
+        assert "b" not in index
+        assert index.ready == {"a", "c"}
+
+    def test_self_dependency_blocks_until_done(self):
+        """A task depending on itself is blocked, as the board scan had it."""
+        index = TaskReadinessIndex([])
+        index.sync([_task("a", "Write a", ["a"])])
+        assert index.ready == set()
+
+        index.update_status("a", TaskStatus.DONE)
+        assert index.ready == {"a"}
+
+
+class TestAdaptiveModeEquivalence:
+    """BasicAdaptiveMode gives the same answers it did before indexing."""
+
+    @pytest.mark.parametrize("seed", range(5))
+    async def test_matches_board_scan_across_mutations(self, seed):
+        """Blocking and unblocking scores match a full scan after each change."""
+        rng = random.Random(seed)  # nosec B311
+        mode = BasicAdaptiveMode()
+        tasks = _random_board(rng, 40)
+
+        for _ in range(15):
+            expected = [t for t in tasks if _reference_unblocked(mode, t, tasks)]
+            assert await mode._filter_unblocked_tasks(tasks, {}) == expected
+            for task in rng.sample(tasks, 5):
+                assert await mode._is_task_unblocked(task, tasks, {}) == (
+                    task in expected
+                )
+                dependents = sum(1 for t in tasks if task.id in t.dependencies)
+                assert mode._calculate_unblocking_value(task, tasks) == (
+                    dependents / len(tasks)
+                )
+
+            # Mutate the board the way Kanban refreshes do
+            for task in rng.sample(tasks, 6):
+                task.status = rng.choice(STATUSES)
+            tasks = [t for t in tasks if rng.random() > 0.05]
+            tasks.append(
+                _task(
+                    f"n{rng.randint(0, 10**6)}",
+                    f"{rng.choice(VERBS)} {rng.choice(NOUNS)}",
+                    [rng.choice(tasks).id],
+                )
+            )
+
+    async def test_external_task_checked_against_board(self):
+        """A task that is not on the board is still checked against it."""
+        mode = BasicAdaptiveMode()
+        board = [_task("impl", "Implement login form")]
+        outsider = _task("dep", "Deploy login form", ["impl"])
+
+        assert not await mode._is_task_unblocked(outsider, board, {})
+        assert await mode._is_obviously_illogical(outsider, board)
+
+        board[0].status = TaskStatus.DONE
+        assert await mode._is_task_unblocked(outsider, board, {})
+
+    async def test_attached_mode_follows_change_feed(self):
+        """With a board feed, selections use the index without re-syncing."""
+
+        class _Board:
+            def __init__(self, tasks: List[Task]) -> None:
+                self.tasks = tasks
+
+            async def get_all_tasks(self) -> List[Task]:
+                return list(self.tasks)
+
+        board = _Board([_task("a", "Write a"), _task("b", "Write b", ["a"])])
+        snapshots = BoardSnapshotService(board)
+        mode = BasicAdaptiveMode()
+        mode.attach(snapshots)
+        await snapshots.refresh()
+
+        syncs = []
+        mode._index.sync = syncs.append  # type: ignore[method-assign]
+        todo = [t for t in board.tasks if t.status == TaskStatus.TODO]
+        assert [t.id for t in await mode._filter_unblocked_tasks(todo, {})] == ["a"]
+
+        board.tasks = [
+            _task("a", "Write a", status=TaskStatus.DONE),
+            _task("b", "Write b", ["a"]),
+        ]
+        await snapshots.refresh()
+        todo = [t for t in board.tasks if t.status == TaskStatus.TODO]
+        assert [t.id for t in await mode._filter_unblocked_tasks(todo, {})] == ["b"]
+        assert syncs == []
+
+        mode.detach()
+        assert not snapshots._subscriptions
+
+    async def test_unblocking_value_normalized_by_followed_board(self):
+        """With a board feed, dependents and total both come from the board."""
+
+        class _Board:
+            def __init__(self, tasks: List[Task]) -> None:
+                self.tasks = tasks
+
+            async def get_all_tasks(self) -> List[Task]:
+                return list(self.tasks)
+
+        root = _task("root", "Write root")
+        board = _Board(
+            [root] + [_task(f"d{i}", f"Write d{i}", ["root"]) for i in range(3)]
+        )
+        snapshots = BoardSnapshotService(board)
+        mode = BasicAdaptiveMode()
+        mode.attach(snapshots)
+        await snapshots.refresh()
+
+        assert mode._calculate_unblocking_value(root, [root]) == 3 / 4
+        mode.detach()
+
+    async def test_completed_outcome_releases_dependents(self):
+        """Recording a completion updates readiness before the next refresh."""
+        mode = BasicAdaptiveMode()
+        first = _task("a", "Write docs")
+        second = _task("b", "Write more docs", ["a"])
+        await mode._filter_unblocked_tasks([first, second], {})
+
+        await mode.record_assignment_outcome("agent-1", first, "completed")
+
+        assert "b" in mode._index.ready
+
+    async def test_blocking_analysis_reports_blockers(self):
+        """Blocked TODO tasks list explicit and logical blockers."""
+        mode = BasicAdaptiveMode()
+        tasks = [
+            _task("setup", "Setup repository"),
+            _task("impl", "Implement api", ["setup"]),
+            _task("docs", "Write docs"),
+        ]
+
+        analysis = await mode.get_blocking_analysis(tasks)
+
+        (blocked,) = [b for b in analysis["blocked_tasks"] if b["task_id"] == "impl"]
+        kinds = {(b["type"], b["blocking_task_id"]) for b in blocked["blocked_by"]}
+        assert ("explicit_dependency", "setup") in kinds
+        assert ("logical_dependency", "setup") in kinds
+        assert {r["task_id"] for r in analysis["ready_tasks"]} == {"setup", "docs"}
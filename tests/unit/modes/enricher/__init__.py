@@ -0,0 +1 @@
+# Unit tests for enricher mode
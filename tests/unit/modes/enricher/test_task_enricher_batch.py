@@ -0,0 +1,226 @@
+"""
+Unit tests for TaskEnricher batch enrichment.
+
+Covers concurrency bounds, analyzer fallbacks, checkpoint resume and
+coalesced kanban writes of :meth:`TaskEnricher.enrich_board`.
+"""
+
+import asyncio
+import json
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from src.core.adaptive_concurrency import reset_concurrency_limiters
+from src.core.models import Priority, Task, TaskStatus
+from src.modes.enricher.task_enricher import BatchContext, BoardContext, TaskEnricher
+
+pytestmark = pytest.mark.unit
+
+NAMES = ["Setup repo", "Design schema", "Build api server", "Create ui page", "Test"]
+
+
+def _task(index: int) -> Task:
+    now = datetime.now(timezone.utc)
+    return Task(
+        id=f"t{index}",
+        name=f"{NAMES[index % len(NAMES)]} {index}",
+        description="",
+        status=TaskStatus.TODO,
+        priority=Priority.MEDIUM,
+        assigned_to=None,
+        created_at=now,
+        updated_at=now,
+        due_date=None,
+        estimated_hours=0.0,
+    )
+
+
+@pytest.fixture(autouse=True)
+def fresh_limiters():
+    """Isolate the shared LLM limiter between tests."""
+    reset_concurrency_limiters()
+    yield
+    reset_concurrency_limiters()
+
+
+@pytest.fixture
+def board_context() -> BoardContext:
+    return BoardContext(
+        project_type="web",
+        detected_phases=["setup", "development"],
+        detected_components=["api", "ui"],
+        common_labels=[],
+        workflow_pattern="sequential",
+    )
+
+
+class _RecordingClient:
+    """Kanban client stand-in that only exposes ``update_task``."""
+
+    def __init__(self, fail_ids: Optional[set] = None) -> None:
+        self.updates: Dict[str, Dict[str, Any]] = {}
+        self.fail_ids = fail_ids or set()
+
+    async def update_task(self, task_id: str, updates: Dict[str, Any]) -> Task:
+        if task_id in self.fail_ids:
+            raise ConnectionError(task_id)
+        self.updates[task_id] = updates
+        return _task(int(task_id[1:]))
+
+
+class TestEnrichBoard:
+    """Concurrent, resumable batch enrichment."""
+
+    async def test_rule_based_results_match_per_task_enrichment(self, board_context):
+        """Without an analyzer, batch output equals per-task enrichment."""
+        enricher = TaskEnricher()
+        tasks = [_task(i) for i in range(12)]
+
+        enriched = await enricher.enrich_task_batch(tasks, board_context)
+
+        assert [e.original_task.id for e in enriched] == [t.id for t in tasks]
+        for task, result in zip(tasks, enriched):
+            expected = await enricher.generate_enrichments(task, board_context)
+            assert result.suggested_labels == expected["labels"]
+            assert result.estimated_hours == expected["estimated_hours"]
+            assert result.enriched_description == expected["description"]
+
+    async def test_analyzer_runs_concurrently_within_bound(self, board_context):
+        """Analyzer calls overlap but never exceed ``max_concurrency``."""
+        in_flight = 0
+        peak = 0
+        contexts: List[BatchContext] = []
+
+        async def analyzer(task: Task, context: BatchContext) -> Dict[str, Any]:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            contexts.append(context)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {"reasoning": f"analyzed {task.id}"}
+
+        tasks = [_task(i) for i in range(20)]
+        result = await TaskEnricher().enrich_board(
+            tasks, board_context, analyzer=analyzer, max_concurrency=4
+        )
+
+        assert 1 < peak <= 4
+        assert all(context is contexts[0] for context in contexts)
+        assert len(contexts[0].task_summaries) == 20
+        assert [e.enrichment_reasoning for e in result.enriched_tasks] == [
+            f"analyzed {t.id}" for t in tasks
+        ]
+
+    async def test_failed_analysis_keeps_rule_based_enrichment(self, board_context):
+        """A failing analyzer falls back and the task is not written."""
+
+        async def analyzer(task: Task, context: BatchContext) -> Dict[str, Any]:
+            if task.id == "t1":
+                raise ValueError("malformed response")
+            return {}
+
+        client = _RecordingClient()
+        result = await TaskEnricher().enrich_board(
+            [_task(0), _task(1)], board_context, analyzer=analyzer, kanban_client=client
+        )
+
+        assert result.failed == {"t1": "malformed response"}
+        assert result.enriched_tasks[1].suggested_labels
+        assert set(client.updates) == {"t0"}
+
+    async def test_interrupted_run_resumes_from_checkpoint(
+        self, board_context, tmp_path
+    ):
+        """Tasks finished before a failure are restored, not re-analyzed."""
+        checkpoint = tmp_path / "enrichment.json"
+        tasks = [_task(i) for i in range(10)]
+        analyzed: List[str] = []
+
+        async def flaky(task: Task, context: BatchContext) -> Dict[str, Any]:
+            if int(task.id[1:]) >= 6:
+                raise TimeoutError("provider timeout")
+            return {"confidence": 0.9}
+
+        first = await TaskEnricher().enrich_board(
+            tasks, board_context, analyzer=flaky, checkpoint_path=checkpoint
+        )
+        assert len(first.failed) == 4
+        saved = json.loads(checkpoint.read_text())["tasks"]
+        assert sorted(saved) == sorted(f"t{i}" for i in range(6))
+
+        async def counting(task: Task, context: BatchContext) -> Dict[str, Any]:
+            analyzed.append(task.id)
+            return {"confidence": 0.8}
+
+        second = await TaskEnricher().enrich_board(
+            tasks, board_context, analyzer=counting, checkpoint_path=checkpoint
+        )
+
+        assert sorted(analyzed) == ["t6", "t7", "t8", "t9"]
+        assert second.restored == 6
+        confidences = [e.confidence_score for e in second.enriched_tasks]
+        assert confidences == [0.9] * 6 + [0.8] * 4
+        assert not checkpoint.exists()
+
+    async def test_changed_task_is_enriched_again(self, board_context, tmp_path):
+        """A checkpoint record is ignored once its task has been edited."""
+        checkpoint = tmp_path / "enrichment.json"
+        task = _task(0)
+
+        async def fails_for_t1(task: Task, context: BatchContext) -> Dict[str, Any]:
+            if task.id == "t1":
+                raise TimeoutError("provider timeout")
+            return {}
+
+        await TaskEnricher().enrich_board(
+            [task, _task(1)],
+            board_context,
+            analyzer=fails_for_t1,
+            checkpoint_path=checkpoint,
+        )
+        task.name = "Renamed task"
+
+        result = await TaskEnricher().enrich_board(
+            [task], board_context, checkpoint_path=checkpoint
+        )
+
+        assert result.restored == 0
+
+    async def test_writes_are_coalesced_and_checkpointed(
+        self, board_context, tmp_path
+    ):
+        """Each task gets one merged update; failed writes keep the file."""
+        checkpoint = tmp_path / "enrichment.json"
+        client = _RecordingClient(fail_ids={"t3"})
+        tasks = [_task(i) for i in range(25)]
+
+        result = await TaskEnricher().enrich_board(
+            tasks,
+            board_context,
+            kanban_client=client,
+            checkpoint_path=checkpoint,
+            write_batch_size=10,
+        )
+
+        assert result.written == 24
+        assert result.write_errors == {"t3": "t3"}
+        assert set(client.updates["t0"]) == {
+            "description",
+            "labels",
+            "estimated_hours",
+        }
+        saved = json.loads(checkpoint.read_text())["tasks"]
+        assert not saved["t3"]["written"] and saved["t4"]["written"]
+
+        client.fail_ids.clear()
+        client.updates.clear()
+        retry = await TaskEnricher().enrich_board(
+            tasks, board_context, kanban_client=client, checkpoint_path=checkpoint
+        )
+
+        assert retry.restored == 25
+        assert set(client.updates) == {"t3"}
+        assert not checkpoint.exists()
@@ -2,6 +2,8 @@
 Unit tests for project stall analyzer.
 """
 
+import json
+import os
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
@@ -12,6 +14,7 @@ from src.core.models import Priority, Task, TaskStatus
 from src.marcus_mcp.tools.project_stall_analyzer import (
     ConversationEvent,
     ConversationReplayAnalyzer,
+    ConversationWindow,
     DependencyLockVisualizer,
     TaskCompletionAnalyzer,
     TaskCompletionEvent,
@@ -251,6 +254,96 @@ class TestConversationReplayAnalyzer:
         assert failure_pattern["count"] == 2  # Failed twice
         assert failure_pattern["severity"] == "high"
 
+    def test_iter_recent_events_stops_at_cutoff(self, tmp_path):
+        """Backwards scan yields only in-window events, newest first."""
+        now = datetime.now(timezone.utc)
+        log_file = tmp_path / "realtime_20250101_000000.jsonl"
+        with open(log_file, "w") as f:
+            # Days of history before the window, then three recent events
+            for minutes in range(5000, 100, -1):
+                ts = (now - timedelta(minutes=minutes)).isoformat()
+                f.write(json.dumps({"timestamp": ts, "type": "ping"}) + "\n")
+            for minutes in (30, 20, 10):
+                ts = (now - timedelta(minutes=minutes)).isoformat()
+                f.write(json.dumps({"timestamp": ts, "type": "recent"}) + "\n")
+
+        analyzer = ConversationReplayAnalyzer(tmp_path)
+        events = list(analyzer.iter_recent_events(lookback_hours=1))
+
+        assert [e.event_type for e in events] == ["recent"] * 3
+        assert [e.timestamp for e in events] == sorted(
+            (e.timestamp for e in events), reverse=True
+        )
+
+    def test_iter_recent_events_reads_lines_across_blocks(
+        self, tmp_path, monkeypatch
+    ):
+        """Lines split across read blocks are reassembled."""
+        monkeypatch.setattr(
+            "src.marcus_mcp.tools.project_stall_analyzer._LOG_BLOCK_SIZE", 7
+        )
+        now = datetime.now(timezone.utc)
+        log_file = tmp_path / "realtime_20250101_000000.jsonl"
+        with open(log_file, "w") as f:
+            for i in range(20):
+                ts = (now - timedelta(minutes=20 - i)).isoformat()
+                f.write(json.dumps({"timestamp": ts, "type": f"e{i}"}) + "\n")
+
+        analyzer = ConversationReplayAnalyzer(tmp_path)
+        events = analyzer.load_recent_events(lookback_hours=1)
+
+        assert [e.event_type for e in events] == [f"e{i}" for i in range(20)]
+
+    def test_skips_files_last_modified_before_window(self, tmp_path):
+        """Logs untouched since before the window are not opened."""
+        now = datetime.now(timezone.utc)
+        stale = tmp_path / "realtime_20240101_000000.jsonl"
+        stale.write_text(
+            json.dumps({"timestamp": now.isoformat(), "type": "x"}) + "\n"
+        )
+        old_mtime = (now - timedelta(days=3)).timestamp()
+        os.utime(stale, (old_mtime, old_mtime))
+
+        analyzer = ConversationReplayAnalyzer(tmp_path)
+
+        with patch("builtins.open", side_effect=AssertionError("opened")):
+            assert list(analyzer.iter_recent_events(lookback_hours=24)) == []
+
+    def test_iter_recent_events_with_process_pool(self, tmp_path):
+        """Parsing files in worker processes returns the same events."""
+        now = datetime.now(timezone.utc)
+        for index in range(3):
+            log_file = tmp_path / f"realtime_2025010{index}_000000.jsonl"
+            with open(log_file, "w") as f:
+                for minutes in (50, 40):
+                    ts = (now - timedelta(minutes=minutes + index)).isoformat()
+                    f.write(json.dumps({"timestamp": ts, "type": "e"}) + "\n")
+
+        analyzer = ConversationReplayAnalyzer(tmp_path)
+        serial = sorted(e.timestamp for e in analyzer.iter_recent_events(1))
+        pooled = sorted(
+            e.timestamp for e in analyzer.iter_recent_events(1, workers=2)
+        )
+
+        assert len(serial) == 6
+        assert pooled == serial
+
+    def test_summarize_recent_events(self, temp_log_dir):
+        """One streaming pass yields patterns, count and newest events."""
+        analyzer = ConversationReplayAnalyzer(temp_log_dir)
+
+        window = analyzer.summarize_recent_events(lookback_hours=24, keep_last=3)
+
+        assert window.event_count == 8
+        assert [e.event_type for e in window.recent_events] == [
+            "no_task_available",
+            "task_failed",
+            "task_failed",
+        ]
+        assert window.stall_patterns == analyzer.identify_stall_patterns(
+            analyzer.load_recent_events(lookback_hours=24)
+        )
+
 
 class TestDependencyLockVisualizer:
     """Test dependency lock visualization."""
@@ -341,8 +434,11 @@ class TestCaptureStallSnapshot:
                 "src.marcus_mcp.tools.project_stall_analyzer.ConversationReplayAnalyzer"
             ) as MockAnalyzer:
                 mock_analyzer = MockAnalyzer.return_value
-                mock_analyzer.load_recent_events = Mock(return_value=[])
-                mock_analyzer.identify_stall_patterns = Mock(return_value=[])
+                mock_analyzer.summarize_recent_events = Mock(
+                    return_value=ConversationWindow(
+                        recent_events=[], event_count=0, stall_patterns=[]
+                    )
+                )
 
                 result = await capture_project_stall_snapshot(
                     mock_state, include_conversation_hours=24
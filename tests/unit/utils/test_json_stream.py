@@ -0,0 +1,77 @@
+"""Unit tests for :mod:`src.utils.json_stream`.
+
+The scanner decides whether truncated LLM output can be continued and
+tells the model where it stopped, so these tests pin its view of
+incomplete structures and its chunk-by-chunk consistency.
+"""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from src.utils.json_stream import JsonStreamScanner, scan_json
+
+
+class TestJsonStreamScanner:
+    """Structure tracking over complete and truncated documents."""
+
+    def test_complete_document(self) -> None:
+        scanner = scan_json('```json\n{"a": [1, {"b": "}"}]}\n```')
+
+        assert scanner.complete
+        assert scanner.start == 8
+        assert scanner.depth == 0
+
+    @pytest.mark.parametrize(
+        "text, location, path, closers",
+        [
+            ('{"tasks": [{"name": "Bui', "a string value", "$.tasks[0].name", '"}]}'),
+            ('{"tasks": [{"name": "A"}, {"na', "an object key", "$.tasks[1]", '"}]}'),
+            ('{"tasks": [1, 2,', "an array", "$.tasks[2]", "]}"),
+            ('{"x": 1, "y": {', "an object", "$.y", "}}"),
+            ("Sure, here it is:\n", "before the document", "$", ""),
+        ],
+    )
+    def test_truncation_point(
+        self, text: str, location: str, path: str, closers: str
+    ) -> None:
+        scanner = scan_json(text)
+
+        assert not scanner.complete
+        assert scanner.location == location
+        assert scanner.path == path
+        assert scanner.closers == closers
+
+    def test_escaped_quotes_stay_inside_string(self) -> None:
+        scanner = scan_json('{"quote": "she said \\"hi\\" and {')
+
+        assert scanner.in_string
+        assert scanner.path == "$.quote"
+
+    def test_closers_complete_a_truncated_document(self) -> None:
+        text = '{"tasks": [{"name": "Build", "tags": ["api", "au'
+
+        scanner = scan_json(text)
+
+        assert json.loads(text + scanner.closers)["tasks"][0]["tags"][1] == "au"
+
+    def test_chunked_feed_matches_single_feed(self) -> None:
+        document = json.dumps(
+            {"tasks": [{"name": f"t{i}", "deps": [i, 'x"y']} for i in range(20)]}
+        )
+        whole = scan_json(document[:-7])
+        chunked = JsonStreamScanner()
+        for start in range(0, len(document) - 7, 5):
+            chunked.feed(document[start : min(start + 5, len(document) - 7)])
+
+        assert (chunked.path, chunked.closers) == (whole.path, whole.closers)
+        chunked.feed(document[-7:])
+        assert chunked.complete and chunked.end == len(document)
+
+    def test_text_after_document_is_ignored(self) -> None:
+        scanner = scan_json('{"a": 1}\n\nHope this helps! {')
+
+        assert scanner.complete
+        assert scanner.end == 8
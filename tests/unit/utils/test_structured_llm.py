@@ -16,6 +16,7 @@ helper is the resilience layer that other modules depend on.
 from __future__ import annotations
 
 import json
+import re
 from typing import Any, List
 from unittest.mock import AsyncMock
 
@@ -222,6 +223,9 @@ class TestSafeStructuredCall:
                 operation="op",
                 initial_max_tokens=MAX_OUTPUT_TOKENS,
                 max_retries=3,
+                # Doubling policy only; continuation at the ceiling is
+                # covered in TestTruncationContinuation.
+                allow_continuation=False,
             )
         # First attempt is at ceiling; doubling would not help; raise.
         assert llm.analyze.await_count == 1
@@ -285,6 +289,7 @@ class TestSafeStructuredCall:
                 operation="op",
                 initial_max_tokens=4096,
                 max_retries=3,
+                allow_continuation=False,
             )
         # First attempt at 4096 (= ceiling); doubling would exceed —
         # bail immediately, exactly one call.
@@ -349,3 +354,156 @@ class TestRetryEndToEndThroughAIAnalysisEngine:
         first_budget = mock_analyze.await_args_list[0].kwargs["context"].max_tokens
         second_budget = mock_analyze.await_args_list[1].kwargs["context"].max_tokens
         assert second_budget == first_budget * 2
+
+
+class _ScriptedProvider:
+    """Provider stub that emits one fixed document within the budget.
+
+    Each call returns at most ``max_tokens * 4`` characters.  A
+    continuation prompt resumes at the character count it quotes, so
+    the stub behaves like a model that honours "continue from the cut
+    point".  ``output_chars`` totals every character emitted.
+    """
+
+    def __init__(self, document: str, prefix: str = "") -> None:
+        self.document = document
+        self.prefix = prefix
+        self.prompts: List[str] = []
+        self.output_chars = 0
+
+    async def analyze(self, prompt: str, context: Any, operation: str) -> str:
+        self.prompts.append(prompt)
+        match = re.search(r"after (\d+) characters", prompt)
+        start = int(match.group(1)) if match else 0
+        output = self.document[start : start + context.max_tokens * 4]
+        if match and self.prefix:
+            output = self.prefix + output
+        self.output_chars += len(output)
+        return output
+
+
+def _decomposition(tasks: int) -> str:
+    return json.dumps(
+        {
+            "tasks": [
+                {
+                    "name": f"Task {i}",
+                    "description": " ".join(
+                        f"Implements clause {i}.{j} of the contract" for j in range(4)
+                    ),
+                }
+                for i in range(tasks)
+            ]
+        }
+    )
+
+
+class TestTruncationContinuation:
+    """Truncated output is continued from the cut point before re-issuing."""
+
+    @pytest.fixture(autouse=True)
+    def _reset_stats(self) -> None:
+        structured_llm.reset_continuation_stats()
+
+    @pytest.mark.asyncio
+    async def test_continuation_completes_document_without_regenerating(
+        self,
+    ) -> None:
+        document = _decomposition(40)
+        provider = _ScriptedProvider(document)
+
+        result = await safe_structured_call(
+            llm=provider, prompt="p", operation="op", initial_max_tokens=512
+        )
+
+        assert result == json.loads(document)
+        # Every character was generated exactly once.
+        assert provider.output_chars == len(document)
+        assert len(provider.prompts) == 3
+        assert "at $.tasks[" in provider.prompts[1]
+        stats = structured_llm.get_continuation_stats()
+        assert stats["continuations"] == 2
+        assert stats["recovered"] == 1
+        assert stats["fallbacks"] == 0
+        # Re-issues would have regenerated 2048 then 6144 characters.
+        assert stats["output_tokens_saved"] == (2048 + 6144) // 4
+
+    @pytest.mark.asyncio
+    async def test_doubling_strategy_regenerates_output(self) -> None:
+        """Baseline for the savings report: re-issuing pays again."""
+        document = _decomposition(40)
+        provider = _ScriptedProvider(document)
+
+        await safe_structured_call(
+            llm=provider,
+            prompt="p",
+            operation="op",
+            initial_max_tokens=512,
+            allow_continuation=False,
+        )
+
+        # 2048 and 4096 characters thrown away before the full document.
+        assert provider.output_chars == 2048 + 4096 + len(document)
+        assert structured_llm.get_continuation_stats()["continuations"] == 0
+
+    @pytest.mark.asyncio
+    async def test_repeated_tail_and_fences_are_stitched(self) -> None:
+        """Models that echo the tail or add fences still stitch cleanly."""
+        document = _decomposition(10)
+        provider = _ScriptedProvider(document, prefix="```json\n")
+        original = provider.analyze
+
+        async def echo_tail(prompt: str, context: Any, operation: str) -> str:
+            output = await original(prompt, context, operation)
+            match = re.search(r"after (\d+) characters", prompt)
+            if match:
+                cut = int(match.group(1))
+                fence, rest = output.split("\n", 1)
+                return f"{fence}\n{document[cut - 30 : cut]}{rest}"
+            return output
+
+        provider.analyze = echo_tail  # type: ignore[method-assign]
+
+        result = await safe_structured_call(
+            llm=provider, prompt="p", operation="op", initial_max_tokens=128
+        )
+
+        assert result == json.loads(document)
+
+    @pytest.mark.asyncio
+    async def test_failed_continuation_falls_back_to_reissue(self) -> None:
+        truncated = '{"items": ["a", "b'
+        llm = AsyncMock()
+        llm.analyze = AsyncMock(
+            side_effect=[truncated, '"]]]', '{"items": ["a", "b", "c"]}']
+        )
+
+        result = await safe_structured_call(
+            llm=llm, prompt="p", operation="op", initial_max_tokens=2048
+        )
+
+        assert result == {"items": ["a", "b", "c"]}
+        calls = llm.analyze.await_args_list
+        assert "partial_output_tail" in calls[1].kwargs["prompt"]
+        assert calls[2].kwargs["prompt"] == "p"
+        assert [c.kwargs["context"].max_tokens for c in calls] == [2048, 4096, 8192]
+        stats = structured_llm.get_continuation_stats()
+        assert (stats["fallbacks"], stats["recovered"]) == (1, 0)
+
+    @pytest.mark.asyncio
+    async def test_continuation_runs_at_deployment_ceiling(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Output larger than the model cap is recovered by continuing."""
+        monkeypatch.setattr(structured_llm, "_deployment_ceiling", lambda: 256)
+        document = _decomposition(20)
+        provider = _ScriptedProvider(document)
+
+        result = await safe_structured_call(
+            llm=provider, prompt="p", operation="op", initial_max_tokens=256
+        )
+
+        assert result == json.loads(document)
+        # 3,861 characters at 1,024 per call: initial + 3 continuations
+        assert len(provider.prompts) == 4
+        assert provider.output_chars == len(document)